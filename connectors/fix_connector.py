@@ -11,6 +11,9 @@ Design principles:
   - Synchronous implementation (compatible with run_in_executor caller pattern).
   - Scope: Logon (A), Logout (5), Heartbeat (0), New Order Single (D),
     Execution Report (8), Order Cancel (F).
+
+For a long-lived, pipelined FIX 4.4 session (framing, persistent sequence
+numbers, resend handling) see connectors/fix_session.py.
 """
 import logging
 import socket as _socket_module
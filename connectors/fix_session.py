@@ -0,0 +1,480 @@
+"""
+Asynchronous FIX 4.4 session engine.
+TRACE_ID: FIX-SESSION-ASYNC-2026-001
+
+Replaces the blocking request/response pattern of FIXConnector with a
+long-lived asyncio session:
+
+  - Streaming framing by BodyLength/CheckSum (connectors/fix_codec.py).
+  - Persistent inbound/outbound sequence numbers (sys_config, SSOT).
+  - Outbound journal for ResendRequest handling (admin messages gap-filled).
+  - Heartbeat / TestRequest liveness supervision.
+  - Inbound gap detection → ResendRequest; SequenceReset handling.
+  - Pipelined order submission: submit_order() returns a Future resolved by
+    the ExecutionReport correlated by ClOrdID (11), so bursts of orders are
+    written back-to-back without waiting for each round-trip.
+
+Design principles:
+  - Config from sys_data_providers (from_storage), never hardcoded.
+  - stream_factory is injectable (tests run against an in-process acceptor).
+  - DB writes for sequence numbers are coalesced and run off the event loop.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from connectors.fix_codec import (
+    FixFrame, FixStreamParser, encode_message, format_number, utc_timestamp,
+    TAG_AVG_PX, TAG_BEGIN_SEQ_NO, TAG_CL_ORD_ID, TAG_CUM_QTY,
+    TAG_END_SEQ_NO, TAG_MSG_SEQ_NUM, TAG_NEW_SEQ_NO, TAG_ORDER_ID,
+    TAG_ORDER_QTY, TAG_ORD_STATUS, TAG_ORD_TYPE, TAG_POSS_DUP_FLAG,
+    TAG_PRICE, TAG_REF_SEQ_NUM, TAG_SENDER_COMP_ID, TAG_SENDING_TIME,
+    TAG_SIDE, TAG_SYMBOL, TAG_TEXT, TAG_TIME_IN_FORCE,
+    TAG_TRANSACT_TIME, TAG_TARGET_COMP_ID, TAG_ENCRYPT_METHOD, TAG_HEARTBT_INT,
+    TAG_TEST_REQ_ID, TAG_ORIG_SENDING_TIME, TAG_GAP_FILL_FLAG, TAG_RESET_SEQ_NUM_FLAG,
+    MSGTYPE_HEARTBEAT, MSGTYPE_TEST_REQUEST, MSGTYPE_RESEND_REQUEST, MSGTYPE_REJECT,
+    MSGTYPE_SEQUENCE_RESET, MSGTYPE_LOGOUT, MSGTYPE_EXECUTION_REPORT, MSGTYPE_LOGON,
+    MSGTYPE_NEW_ORDER_SINGLE,
+)
+from connectors.fix_session_state import FixOutboundJournal, FixSequenceStore
+
+logger = logging.getLogger(__name__)
+
+# OrdStatus values that close an order's lifecycle (resolve the pending future).
+_TERMINAL_ORD_STATUS = frozenset({b"2", b"4", b"8", b"C"})
+_ORD_STATUS_FILLED = b"2"
+
+_BEGIN_STRING = b"FIX.4.4"
+
+StreamFactory = Callable[[str, int], Awaitable[Tuple[asyncio.StreamReader, asyncio.StreamWriter]]]
+
+
+class FixSessionError(Exception):
+    """Raised when the FIX session cannot be established or is not logged on."""
+
+
+class AsyncFixSession:
+    """
+    FIX 4.4 initiator session over asyncio streams.
+
+    Args:
+        storage: StorageManager (sequence persistence); None disables persistence.
+        host / port: Acceptor address.
+        sender_comp_id / target_comp_id: Session identity.
+        heartbeat_interval: HeartBtInt (108) in seconds.
+        stream_factory: Optional coroutine(host, port) -> (reader, writer).
+        reset_on_logon: Send ResetSeqNumFlag=Y and restart both sequences at 1.
+        journal_capacity: Max outbound messages retained for resend.
+    """
+
+    def __init__(
+        self,
+        storage: Any,
+        host: str,
+        port: int,
+        sender_comp_id: str,
+        target_comp_id: str,
+        heartbeat_interval: float = 30.0,
+        stream_factory: Optional[StreamFactory] = None,
+        reset_on_logon: bool = False,
+        journal_capacity: int = 10_000,
+        logon_timeout: float = 10.0,
+        logout_timeout: float = 2.0,
+    ) -> None:
+        self._host = host
+        self._port = port
+        self._sender = sender_comp_id.encode()
+        self._target = target_comp_id.encode()
+        self._heartbeat_interval = heartbeat_interval
+        self._stream_factory = stream_factory or asyncio.open_connection
+        self._reset_on_logon = reset_on_logon
+        self._logon_timeout = logon_timeout
+        self._logout_timeout = logout_timeout
+
+        self.sequences = FixSequenceStore(storage, sender_comp_id, target_comp_id)
+        self.journal = FixOutboundJournal(journal_capacity)
+        self._parser = FixStreamParser()
+
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._tasks: List[asyncio.Task] = []
+        self._logon_event = asyncio.Event()
+        self._logout_event = asyncio.Event()
+        self._logout_sent = False
+        self._logged_on = False
+        self._closing = False
+        self._resend_pending = False
+        self._resend_until = 0
+
+        self._pending: Dict[bytes, Tuple[asyncio.Future, int]] = {}
+        self._seq_to_cl_ord_id: Dict[int, bytes] = {}
+        self._last_sent = time.monotonic()
+        self._last_received = time.monotonic()
+        self._test_request_outstanding: Optional[bytes] = None
+
+        self.on_execution_report: Optional[Callable[[FixFrame], None]] = None
+        self.stats: Dict[str, int] = {
+            "sent": 0, "received": 0, "resend_requests_sent": 0,
+            "resends_served": 0, "gap_fills_sent": 0, "rejects": 0,
+        }
+
+    @classmethod
+    def from_storage(cls, storage: Any, provider_id: str = "fix_prime", **kwargs: Any) -> "AsyncFixSession":
+        """Build a session from the sys_data_providers config (same SSOT as FIXConnector)."""
+        config = storage.get_data_provider_config(provider_id)
+        return cls(
+            storage=storage,
+            host=config["host"],
+            port=int(config["port"]),
+            sender_comp_id=config["sender_comp_id"],
+            target_comp_id=config["target_comp_id"],
+            **kwargs,
+        )
+
+    # ─── Lifecycle ────────────────────────────────────────────────────────────
+
+    @property
+    def is_logged_on(self) -> bool:
+        return self._logged_on and not self._closing
+
+    async def start(self) -> None:
+        """Open the transport, send Logon and wait for the acceptor's Logon."""
+        self.sequences.load()
+        if self._reset_on_logon:
+            self.sequences.reset()
+        self._reader, self._writer = await self._stream_factory(self._host, self._port)
+        self._closing = False
+        self._logout_sent = False
+        self._logon_event.clear()
+        self._logout_event.clear()
+        self._parser = FixStreamParser()
+        self._tasks = [
+            asyncio.create_task(self._read_loop(), name="fix-session-reader"),
+            asyncio.create_task(self._liveness_loop(), name="fix-session-liveness"),
+        ]
+        logon_fields = [
+            (TAG_ENCRYPT_METHOD, b"0"),
+            (TAG_HEARTBT_INT, b"%d" % int(self._heartbeat_interval)),
+        ]
+        if self._reset_on_logon:
+            logon_fields.append((TAG_RESET_SEQ_NUM_FLAG, b"Y"))
+        self._send(MSGTYPE_LOGON, logon_fields)
+        try:
+            await asyncio.wait_for(self._logon_event.wait(), timeout=self._logon_timeout)
+        except asyncio.TimeoutError:
+            await self._teardown()
+            raise FixSessionError("Logon not acknowledged by acceptor")
+        logger.info("[FIX-SESSION] Logged on %s -> %s", self._sender.decode(), self._target.decode())
+
+    async def stop(self, reason: str = "") -> None:
+        """Send Logout (best effort), close the transport and persist sequences."""
+        if self._writer is not None and self._logged_on and not self._closing:
+            fields = [(TAG_TEXT, reason.encode())] if reason else []
+            self._logout_sent = True
+            self._send(MSGTYPE_LOGOUT, fields)
+            try:
+                await self._writer.drain()
+                # Let the acceptor confirm so both sides agree on final sequences.
+                await asyncio.wait_for(self._logout_event.wait(), timeout=self._logout_timeout)
+            except (ConnectionError, OSError, asyncio.TimeoutError):
+                pass
+        await self._teardown()
+
+    async def _teardown(self) -> None:
+        self._closing = True
+        self._logged_on = False
+        current = asyncio.current_task()
+        for task in self._tasks:
+            if task is not current:
+                task.cancel()
+        for task in self._tasks:
+            if task is not current:
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+        self._tasks = []
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+            self._writer = None
+        for cl_ord_id, (future, _seq) in self._pending.items():
+            if not future.done():
+                future.set_result({
+                    "success": False, "cl_ord_id": cl_ord_id.decode(),
+                    "error": "FIX session closed before execution report",
+                })
+        self._pending.clear()
+        self._seq_to_cl_ord_id.clear()
+        await self.sequences.flush()
+
+    # ─── Order Flow ───────────────────────────────────────────────────────────
+
+    def submit_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: float,
+        price: Optional[float] = None,
+        cl_ord_id: Optional[str] = None,
+        time_in_force: bytes = b"0",
+    ) -> asyncio.Future:
+        """
+        Send a New Order Single without waiting for the broker.
+
+        Returns:
+            Future resolved with a normalized result dict when an ExecutionReport
+            with a terminal OrdStatus (or a session Reject) arrives for ClOrdID.
+        """
+        if not self.is_logged_on:
+            raise FixSessionError("FIX session not logged on")
+        cid = (cl_ord_id or uuid.uuid4().hex[:16].upper()).encode()
+        if cid in self._pending:
+            raise ValueError(f"Duplicate ClOrdID {cid.decode()}")
+        fix_side = b"1" if side.upper() in ("BUY", "LONG") else b"2"
+        fields = [
+            (TAG_CL_ORD_ID, cid),
+            (TAG_SYMBOL, symbol.encode()),
+            (TAG_SIDE, fix_side),
+            (TAG_TRANSACT_TIME, utc_timestamp()),
+            (TAG_ORDER_QTY, format_number(quantity)),
+            (TAG_ORD_TYPE, b"1" if price is None else b"2"),
+        ]
+        if price is not None:
+            fields.append((TAG_PRICE, format_number(price)))
+        fields.append((TAG_TIME_IN_FORCE, time_in_force))
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        seq = self._send(MSGTYPE_NEW_ORDER_SINGLE, fields)
+        self._pending[cid] = (future, seq)
+        self._seq_to_cl_ord_id[seq] = cid
+        return future
+
+    async def send_order(self, symbol: str, side: str, quantity: float,
+                         price: Optional[float] = None, timeout: float = 10.0) -> Dict[str, Any]:
+        """Submit one order and await its terminal ExecutionReport."""
+        future = self.submit_order(symbol, side, quantity, price)
+        try:
+            await self.drain()
+            return await asyncio.wait_for(future, timeout=timeout)
+        except asyncio.TimeoutError:
+            return {"success": False, "error": "Execution report timeout"}
+
+    async def drain(self) -> None:
+        """Apply transport back-pressure after a burst of submissions."""
+        if self._writer is not None:
+            await self._writer.drain()
+
+    # ─── Outbound ─────────────────────────────────────────────────────────────
+
+    def _send(self, msg_type: bytes, body: List[Tuple[int, bytes]]) -> int:
+        seq = self.sequences.next_outbound
+        self.sequences.next_outbound += 1
+        self.sequences.mark_dirty()
+        self.journal.record(seq, msg_type, body)
+        self._write(msg_type, seq, body)
+        return seq
+
+    def _write(self, msg_type: bytes, seq: int, body: List[Tuple[int, bytes]],
+               poss_dup: bool = False) -> None:
+        if self._writer is None:
+            raise FixSessionError("FIX transport not open")
+        header = [
+            (TAG_SENDER_COMP_ID, self._sender),
+            (TAG_TARGET_COMP_ID, self._target),
+            (TAG_MSG_SEQ_NUM, b"%d" % seq),
+        ]
+        if poss_dup:
+            header.append((TAG_POSS_DUP_FLAG, b"Y"))
+        header.append((TAG_SENDING_TIME, utc_timestamp()))
+        if poss_dup:
+            header.append((TAG_ORIG_SENDING_TIME, utc_timestamp()))
+        self._writer.write(encode_message(_BEGIN_STRING, msg_type, header + body))
+        self._last_sent = time.monotonic()
+        self.stats["sent"] += 1
+
+    # ─── Inbound ──────────────────────────────────────────────────────────────
+
+    async def _read_loop(self) -> None:
+        assert self._reader is not None
+        try:
+            while True:
+                chunk = await self._reader.read(65536)
+                if not chunk:
+                    logger.warning("[FIX-SESSION] Transport closed by acceptor")
+                    break
+                self._last_received = time.monotonic()
+                self._test_request_outstanding = None
+                self._parser.feed(chunk)
+                for frame in self._parser.frames():
+                    self.stats["received"] += 1
+                    self._on_frame(frame)
+                    if self._closing:
+                        return
+        except (ConnectionError, OSError) as exc:
+            logger.error("[FIX-SESSION] Transport error: %s", exc)
+        if not self._closing:
+            asyncio.create_task(self._teardown())
+
+    def _on_frame(self, frame: FixFrame) -> None:
+        msg_type = frame.msg_type
+        seq = frame.seq_num
+        expected = self.sequences.next_inbound
+
+        if msg_type == MSGTYPE_LOGON and frame.get(TAG_RESET_SEQ_NUM_FLAG) == b"Y":
+            expected = self.sequences.next_inbound = seq
+
+        if msg_type == MSGTYPE_SEQUENCE_RESET and frame.get(TAG_GAP_FILL_FLAG) != b"Y":
+            self._apply_sequence_reset(frame)
+            return
+
+        if seq > expected:
+            self._resend_until = max(self._resend_until, seq)
+            if not self._resend_pending:
+                self._request_resend(expected)
+            if msg_type == MSGTYPE_LOGON:
+                self._handle_logon(frame)
+            return
+        if seq < expected:
+            if frame.get(TAG_POSS_DUP_FLAG) == b"Y":
+                return
+            logger.error("[FIX-SESSION] MsgSeqNum too low (got %d, expected %d)", seq, expected)
+            asyncio.create_task(self.stop(f"MsgSeqNum too low, expecting {expected} but received {seq}"))
+            return
+
+        self.sequences.next_inbound = seq + 1
+        self.sequences.mark_dirty()
+        if self._resend_pending and self.sequences.next_inbound > self._resend_until:
+            self._resend_pending = False
+        self._dispatch(msg_type, frame)
+
+    def _dispatch(self, msg_type: bytes, frame: FixFrame) -> None:
+        if msg_type == MSGTYPE_EXECUTION_REPORT:
+            self._handle_execution_report(frame)
+        elif msg_type == MSGTYPE_TEST_REQUEST:
+            self._send(MSGTYPE_HEARTBEAT, [(TAG_TEST_REQ_ID, frame.get(TAG_TEST_REQ_ID) or b"")])
+        elif msg_type == MSGTYPE_RESEND_REQUEST:
+            self._serve_resend(frame.get_int(TAG_BEGIN_SEQ_NO), frame.get_int(TAG_END_SEQ_NO))
+        elif msg_type == MSGTYPE_SEQUENCE_RESET:
+            self._apply_sequence_reset(frame)
+        elif msg_type == MSGTYPE_REJECT:
+            self._handle_session_reject(frame)
+        elif msg_type == MSGTYPE_LOGON:
+            self._handle_logon(frame)
+        elif msg_type == MSGTYPE_LOGOUT:
+            logger.info("[FIX-SESSION] Logout received: %s", frame.get_str(TAG_TEXT))
+            self._logout_event.set()
+            if not self._logout_sent and self._logged_on and not self._closing:
+                asyncio.create_task(self.stop())
+
+    def _handle_logon(self, frame: FixFrame) -> None:
+        self._logged_on = True
+        self._logon_event.set()
+
+    def _apply_sequence_reset(self, frame: FixFrame) -> None:
+        new_seq = frame.get_int(TAG_NEW_SEQ_NO)
+        if new_seq >= self.sequences.next_inbound:
+            self.sequences.next_inbound = new_seq
+            self.sequences.mark_dirty()
+        if self.sequences.next_inbound > self._resend_until:
+            self._resend_pending = False
+
+    def _request_resend(self, begin: int) -> None:
+        self._resend_pending = True
+        self.stats["resend_requests_sent"] += 1
+        logger.warning("[FIX-SESSION] Inbound gap detected, requesting resend from %d", begin)
+        self._send(MSGTYPE_RESEND_REQUEST, [(TAG_BEGIN_SEQ_NO, b"%d" % begin), (TAG_END_SEQ_NO, b"0")])
+
+    def _serve_resend(self, begin: int, end: int) -> None:
+        last_sent = self.sequences.next_outbound - 1
+        end = last_sent if end == 0 or end > last_sent else end
+        gap_start: Optional[int] = None
+        for seq, entry in self.journal.replay_plan(max(1, begin), end):
+            if entry is None:
+                gap_start = seq if gap_start is None else gap_start
+                continue
+            if gap_start is not None:
+                self._send_gap_fill(gap_start, seq)
+                gap_start = None
+            self._write(entry[0], seq, entry[1], poss_dup=True)
+            self.stats["resends_served"] += 1
+        if gap_start is not None:
+            self._send_gap_fill(gap_start, end + 1)
+
+    def _send_gap_fill(self, seq: int, new_seq_no: int) -> None:
+        self.stats["gap_fills_sent"] += 1
+        self._write(
+            MSGTYPE_SEQUENCE_RESET, seq,
+            [(TAG_GAP_FILL_FLAG, b"Y"), (TAG_NEW_SEQ_NO, b"%d" % new_seq_no)],
+            poss_dup=True,
+        )
+
+    def _handle_execution_report(self, frame: FixFrame) -> None:
+        if self.on_execution_report is not None:
+            try:
+                self.on_execution_report(frame)
+            except Exception as exc:
+                logger.error("[FIX-SESSION] on_execution_report callback failed: %s", exc)
+        cl_ord_id = frame.get(TAG_CL_ORD_ID)
+        ord_status = frame.get(TAG_ORD_STATUS)
+        if cl_ord_id is None or ord_status not in _TERMINAL_ORD_STATUS:
+            return
+        pending = self._pending.pop(cl_ord_id, None)
+        if pending is None:
+            return
+        future, seq = pending
+        self._seq_to_cl_ord_id.pop(seq, None)
+        if future.done():
+            return
+        result: Dict[str, Any] = {
+            "success": ord_status == _ORD_STATUS_FILLED,
+            "cl_ord_id": cl_ord_id.decode(),
+            "order_id": frame.get_str(TAG_ORDER_ID),
+            "ord_status": ord_status.decode(),
+            "avg_price": frame.get_float(TAG_AVG_PX),
+            "cum_qty": frame.get_float(TAG_CUM_QTY),
+        }
+        if ord_status != _ORD_STATUS_FILLED:
+            result["error"] = frame.get_str(TAG_TEXT) or "Order not filled by broker"
+        future.set_result(result)
+
+    def _handle_session_reject(self, frame: FixFrame) -> None:
+        self.stats["rejects"] += 1
+        ref_seq = frame.get_int(TAG_REF_SEQ_NUM)
+        cl_ord_id = self._seq_to_cl_ord_id.pop(ref_seq, None)
+        text = frame.get_str(TAG_TEXT)
+        logger.warning("[FIX-SESSION] Session Reject for seq %d: %s", ref_seq, text)
+        pending = self._pending.pop(cl_ord_id, None) if cl_ord_id else None
+        future = pending[0] if pending else None
+        if future is not None and not future.done():
+            future.set_result({
+                "success": False, "cl_ord_id": cl_ord_id.decode() if cl_ord_id else "",
+                "error": f"Session reject: {text}",
+            })
+
+    # ─── Liveness ─────────────────────────────────────────────────────────────
+
+    async def _liveness_loop(self) -> None:
+        """Heartbeat when idle, TestRequest when silent, disconnect when dead."""
+        tick = max(0.05, self._heartbeat_interval / 4)
+        while not self._closing:
+            await asyncio.sleep(tick)
+            await self.sequences.flush()
+            if not self._logged_on:
+                continue
+            now = time.monotonic()
+            silent_for = now - self._last_received
+            if self._test_request_outstanding and silent_for > 2 * self._heartbeat_interval:
+                logger.error("[FIX-SESSION] No response to TestRequest, dropping session")
+                asyncio.create_task(self._teardown())
+                return
+            if silent_for > self._heartbeat_interval * 1.2 and not self._test_request_outstanding:
+                self._test_request_outstanding = uuid.uuid4().hex[:12].encode()
+                self._send(MSGTYPE_TEST_REQUEST, [(TAG_TEST_REQ_ID, self._test_request_outstanding)])
+            elif now - self._last_sent >= self._heartbeat_interval:
+                self._send(MSGTYPE_HEARTBEAT, [])
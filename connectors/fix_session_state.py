@@ -0,0 +1,103 @@
+"""
+FIX session state — persistent sequence numbers and outbound resend journal.
+TRACE_ID: FIX-SESSION-ASYNC-2026-001
+
+Kept apart from the session engine (connectors/fix_session.py) so both pieces
+stay small and can be unit-tested without a transport.
+"""
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SEQ_CONFIG_PREFIX = "fix_session_seq"
+
+# Session-level MsgTypes: never replayed on resend, gap-filled instead.
+_ADMIN_MSG_TYPES = frozenset({b"0", b"1", b"2", b"3", b"4", b"5", b"A"})
+
+
+class FixSequenceStore:
+    """
+    Persistent MsgSeqNum pair for one (SenderCompID, TargetCompID) session.
+
+    Persisted in sys_config under a per-session key. Writes are coalesced:
+    mark_dirty() is cheap, flush() writes the latest values off the event loop.
+    """
+
+    def __init__(self, storage: Any, sender_comp_id: str, target_comp_id: str) -> None:
+        self._storage = storage
+        self._key = f"{_SEQ_CONFIG_PREFIX}:{sender_comp_id}:{target_comp_id}"
+        self.next_outbound: int = 1
+        self.next_inbound: int = 1
+        self._dirty = False
+
+    def load(self) -> None:
+        """Load persisted sequence numbers (defaults to 1/1 for a new session)."""
+        if self._storage is None:
+            return
+        try:
+            state = self._storage.get_sys_config(bypass_cache=True).get(self._key) or {}
+            self.next_outbound = max(1, int(state.get("next_outbound", 1)))
+            self.next_inbound = max(1, int(state.get("next_inbound", 1)))
+        except Exception as exc:
+            logger.warning("[FIX-SESSION] Could not load sequence numbers (%s): %s", self._key, exc)
+
+    def reset(self) -> None:
+        self.next_outbound = 1
+        self.next_inbound = 1
+        self._dirty = True
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    async def flush(self) -> None:
+        """Persist current values if they changed since the last flush."""
+        if not self._dirty or self._storage is None:
+            return
+        self._dirty = False
+        payload = {self._key: {"next_outbound": self.next_outbound, "next_inbound": self.next_inbound}}
+        try:
+            await asyncio.to_thread(self._storage.update_sys_config, payload)
+        except Exception as exc:
+            self._dirty = True
+            logger.error("[FIX-SESSION] Sequence flush failed (%s): %s", self._key, exc)
+
+
+class FixOutboundJournal:
+    """
+    Bounded journal of sent messages, keyed by MsgSeqNum, for resends.
+
+    Only application messages are replayed; admin messages and evicted
+    entries are covered by SequenceReset-GapFill as required by FIX.
+    """
+
+    def __init__(self, capacity: int = 10_000) -> None:
+        self._capacity = capacity
+        self._entries: "OrderedDict[int, Tuple[bytes, List[Tuple[int, bytes]]]]" = OrderedDict()
+
+    def record(self, seq_num: int, msg_type: bytes, body: List[Tuple[int, bytes]]) -> None:
+        self._entries[seq_num] = (msg_type, body)
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+    def replay_plan(self, begin: int, end: int) -> List[Tuple[int, Optional[Tuple[bytes, List[Tuple[int, bytes]]]]]]:
+        """
+        Return [(seq, entry|None)] for begin..end inclusive.
+
+        None marks a sequence number that must be gap-filled.
+        """
+        return [
+            (seq, self._app_entry(seq))
+            for seq in range(begin, end + 1)
+        ]
+
+    def _app_entry(self, seq: int) -> Optional[Tuple[bytes, List[Tuple[int, bytes]]]]:
+        entry = self._entries.get(seq)
+        if entry is None or entry[0] in _ADMIN_MSG_TYPES:
+            return None
+        return entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
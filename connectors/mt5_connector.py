@@ -1207,6 +1207,8 @@ class MT5Connector(BaseConnector):
                     'tp': pos.tp,  # Take profit
                     'time': pos.time,  # Open time (Unix timestamp)
                     'type': pos.type,  # Position type (0=BUY, 1=SELL)
+                    'magic': getattr(pos, 'magic', 0),
+                    'comment': getattr(pos, 'comment', ''),
                 })
             
             return position_list
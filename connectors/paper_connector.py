@@ -1,22 +1,56 @@
 import logging
-import uuid
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 from models.signal import Signal
 
 logger = logging.getLogger(__name__)
 
 from connectors.base_connector import BaseConnector
+from connectors.sim_exchange import SimulatedExchange
 
 class PaperConnector(BaseConnector):
     """
     Paper Trading Connector for Aethelgard.
     Simulates execution of signals without real broker interaction.
+
+    Orders are routed to a SimulatedExchange (SIM-EXCHANGE-2026-001): spread,
+    sampled slippage/latency, partial fills, pending orders and SL/TP are
+    simulated in-process without sleeping. The scan cycle feeds it bars through
+    on_market_data() so SL/TP and pending orders keep evaluating between
+    signals; symbols without a market feed are re-quoted at each signal's
+    entry price.
     """
     
-    def __init__(self, instrument_manager=None) -> None:
+    def __init__(self, instrument_manager=None, exchange: Optional[SimulatedExchange] = None) -> None:
         self.instrument_manager = instrument_manager
+        self.exchange = exchange or SimulatedExchange()
+        self._fed_bar_time: Dict[str, Any] = {}
         logger.info("PaperConnector initialized (DI InstrumentManager: %s)", bool(instrument_manager))
+
+    def calibrate(self, storage: Any, symbols: List[str]) -> int:
+        """Calibrate the exchange's latency/slippage model from usr_execution_logs."""
+        return self.exchange.cost_model.calibrate_from_storage(storage, symbols)
+
+    def on_market_data(self, symbol: str, df: Any) -> None:
+        """
+        Feed scanner bars into the simulated exchange.
+
+        Closed bars newer than the last feed are replayed as intrabar paths
+        (SL/TP, stops, limits); the last (possibly forming) bar's close becomes
+        the current quote. The first feed of a symbol only sets the quote.
+        """
+        if df is None or len(df) == 0:
+            return
+        last_fed = self._fed_bar_time.get(symbol)
+        if "time" in df.columns and len(df) >= 2:
+            closed = df.iloc[:-1]
+            if last_fed is not None:
+                for bar in closed[closed["time"] > last_fed].itertuples(index=False):
+                    self.exchange.on_bar(symbol, float(bar.open), float(bar.high), float(bar.low), float(bar.close))
+            self._fed_bar_time[symbol] = closed["time"].iloc[-1]
+        else:
+            self._fed_bar_time.setdefault(symbol, None)
+        self.exchange.update_mid(symbol, float(df["close"].iloc[-1]))
         
     def disconnect(self) -> bool:
         """Simulate disconnection"""
@@ -36,30 +70,46 @@ class PaperConnector(BaseConnector):
         Returns a successful result for any valid signal.
         """
         logger.info(f"Ejecutando simulación (Paper Trading): {signal.symbol} {signal.signal_type} @ {signal.entry_price}")
-        
-        # Simulate local delay
-        import time
-        time.sleep(0.5)
-        
-        ticket = str(uuid.uuid4())[:8].upper()
-        
-        return {
-            "success": True,
-            "status": "success",
-            "ticket": ticket,
-            "order_id": ticket,
-            "price": signal.entry_price,
-            "timestamp": datetime.now().isoformat(),
-            "message": f"Signal executed successfully in paper mode (Ticket: {ticket})"
-        }
+
+        # Market-fed symbols keep the scanner quote; the rest re-quote at the entry price
+        if signal.symbol not in self._fed_bar_time and signal.entry_price:
+            self.exchange.update_mid(signal.symbol, float(signal.entry_price))
+
+        side = getattr(signal.signal_type, "value", str(signal.signal_type))
+        metadata = getattr(signal, "metadata", None) or {}
+        signal_id = metadata.get("signal_id") or getattr(signal, "trace_id", None) or ""
+        result = self.exchange.submit_order(
+            symbol=signal.symbol,
+            side=side,
+            volume=float(getattr(signal, "volume", 0.0) or 0.01),
+            sl=signal.stop_loss or None,
+            tp=signal.take_profit or None,
+            comment=f"Aethelgard_{signal_id}" if signal_id else "",
+        )
+        if result.get("success"):
+            result["status"] = "success"
+        return result
 
     def get_closed_usr_positions(self, hours: int = 24) -> list[dict]:
-        """Return empty list for paper mode (no real closed positions)."""
-        return []
+        """Closed simulated positions (MT5Connector-compatible format)."""
+        return self.exchange.get_closed_usr_positions(hours)
     
     def get_open_positions(self) -> list[dict]:
-        """Return empty list for paper mode (no real open positions tracked)."""
-        return []
+        """Open simulated positions (MT5Connector-compatible format)."""
+        return self.exchange.get_open_positions()
+
+    def get_pending_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Resting simulated LIMIT/STOP orders."""
+        return self.exchange.get_pending_orders(symbol)
+
+    def cancel_order(self, order_ticket: int, reason: str = "") -> Dict[str, Any]:
+        return self.exchange.cancel_order(order_ticket, reason)
+
+    def modify_position(self, ticket: int, new_sl: float, new_tp: Optional[float] = None, reason: str = "") -> Dict[str, Any]:
+        return self.exchange.modify_position(ticket, new_sl, new_tp, reason)
+
+    def close_position(self, ticket: int, reason: str = "") -> Dict[str, Any]:
+        return self.exchange.close_position(ticket, reason)
         
     def get_positions(self) -> list[dict]:
         """Alias para get_open_positions (BaseConnector interface)"""
@@ -75,6 +125,9 @@ class PaperConnector(BaseConnector):
         
     def get_last_tick(self, symbol: str) -> Dict[str, float]:
         """Simulated tick for paper mode. Returns realistic baseline prices."""
+        tick = self.exchange.get_last_tick(symbol)
+        if tick:
+            return tick
         baselines = {
             "EURUSD": 1.1000,
             "GBPUSD": 1.2500,
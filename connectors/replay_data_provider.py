@@ -0,0 +1,366 @@
+"""
+Deterministic market replay provider (recorded or synthetic OHLC).
+TRACE_ID: SIM-REPLAY-2026-001
+
+Responsibility:
+  - Serve fetch_ohlc() / get_last_tick() exactly like a live DataProvider, but
+    from a per-symbol base-timeframe bar series (recorded DataFrame/CSV or a
+    seeded synthetic random walk) cut at a virtual clock.
+  - Resample to higher timeframes lazily (cached per symbol/timeframe).
+  - Optionally push every newly closed base bar into a SimulatedExchange so the
+    PaperConnector fills and SL/TP evaluate on the same replayed prices.
+
+Design principles:
+  - Deterministic: same data + same seed + same clock steps → same frames.
+  - Virtual clock: advanced explicitly (step mode) or at ``speed``× wall time
+    (accelerated mode). Only closed bars are ever visible.
+  - O(log n) per fetch: searchsorted on the cached bar times + tail slice.
+  - No network, no broker: registered in DataProviderManager via
+    ``register_provider_instance("replay", provider)`` and REPLAY_PROVIDER_METADATA.
+"""
+import logging
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from connectors.base_connector import BaseConnector
+from connectors.sim_exchange import SimulatedExchange, default_spec_for
+
+logger = logging.getLogger(__name__)
+
+OHLC_COLUMNS = ["time", "open", "high", "low", "close", "volume", "tick_volume"]
+
+TIMEFRAME_MINUTES: Dict[str, int] = {
+    "M1": 1, "M5": 5, "M15": 15, "M30": 30,
+    "H1": 60, "H4": 240, "D1": 1440, "W1": 10080,
+}
+
+# Metadata for DataProviderManager.provider_metadata (never seeded into sys_data_providers).
+REPLAY_PROVIDER_METADATA: Dict[str, Any] = {
+    "name": "replay",
+    "requires_auth": False,
+    "priority": 1000,
+    "free_tier": True,
+    "module": "connectors.replay_data_provider",
+    "class": "ReplayDataProvider",
+    "description": "Deterministic market replay (recorded/synthetic OHLC, virtual clock)",
+    "supports": ["stocks", "forex", "crypto", "commodities", "indices"],
+    "is_system": True,
+}
+
+_SYNTHETIC_START_PRICES = {
+    "EURUSD": 1.10, "GBPUSD": 1.27, "USDJPY": 150.0, "AUDUSD": 0.66,
+    "USDCAD": 1.36, "USDCHF": 0.88, "NZDUSD": 0.61, "XAUUSD": 2300.0,
+    "BTCUSD": 60000.0, "ETHUSD": 3000.0, "US30": 39000.0, "NAS100": 18000.0,
+}
+
+
+def timeframe_delta(timeframe: str) -> timedelta:
+    """Bar duration of a timeframe code (M1 … W1)."""
+    try:
+        return timedelta(minutes=TIMEFRAME_MINUTES[timeframe.upper()])
+    except KeyError:
+        raise ValueError(f"Unsupported timeframe: {timeframe}") from None
+
+
+class VirtualClock:
+    """
+    Replay time source.
+
+    Args:
+        start: Initial virtual time (UTC).
+        speed: None → step mode (only ``advance()`` moves time);
+               N → virtual time also runs at N× wall time.
+        wall:  Monotonic wall clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        speed: Optional[float] = None,
+        wall: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        if speed is not None and speed <= 0:
+            raise ValueError(f"speed must be > 0, got {speed}")
+        self.start = start
+        self.speed = speed
+        self._wall = wall
+        self._wall0 = wall()
+        self._offset = timedelta(0)
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime:
+        with self._lock:
+            current = self.start + self._offset
+            if self.speed is not None:
+                current += timedelta(seconds=(self._wall() - self._wall0) * self.speed)
+            return current
+
+    def advance(self, delta: timedelta) -> datetime:
+        """Move virtual time forward (both modes)."""
+        if delta < timedelta(0):
+            raise ValueError("VirtualClock cannot move backwards")
+        with self._lock:
+            self._offset += delta
+        return self.now()
+
+
+def synthetic_ohlc(
+    symbol: str,
+    bars: int,
+    start: datetime,
+    timeframe: str = "M5",
+    seed: int = 42,
+) -> pd.DataFrame:
+    """
+    Seeded random walk with alternating trend/range segments.
+
+    The seed is mixed with a CRC of the symbol (not ``hash()``, which is
+    salted per process) so every symbol gets its own reproducible path.
+    """
+    rng = np.random.default_rng([seed, zlib.crc32(symbol.upper().encode())])
+    price0 = _SYNTHETIC_START_PRICES.get(symbol.upper(), 100.0)
+    step = timeframe_delta(timeframe)
+
+    segment = 120
+    drifts = np.repeat(rng.choice([-1.0, 0.0, 0.0, 1.0], size=bars // segment + 1), segment)[:bars]
+    sigma = 0.0008
+    returns = rng.normal(drifts * sigma * 0.15, sigma, bars)
+    close = price0 * np.exp(np.cumsum(returns))
+    open_ = np.concatenate(([price0], close[:-1]))
+    wick = np.abs(rng.normal(0.0, sigma * 0.5, (2, bars))) * close
+    volume = rng.integers(50, 500, bars).astype(float)
+
+    start_ts = pd.Timestamp(start)
+    start_ts = start_ts.tz_convert("UTC") if start_ts.tzinfo else start_ts.tz_localize("UTC")
+    times = pd.date_range(start_ts, periods=bars, freq=step)
+    return pd.DataFrame({
+        "time": times,
+        "open": open_,
+        "high": np.maximum(open_, close) + wick[0],
+        "low": np.minimum(open_, close) - wick[1],
+        "close": close,
+        "volume": volume,
+        "tick_volume": volume,
+    })
+
+
+class ReplayDataProvider(BaseConnector):
+    """
+    Replays base-timeframe OHLC series against a VirtualClock.
+
+    Args:
+        data:           symbol → DataFrame with time/open/high/low/close[/volume],
+                        sorted or not, in ``base_timeframe``.
+        clock:          Shared VirtualClock (default: step mode at the first bar
+                        after ``warmup_bars``).
+        base_timeframe: Resolution of ``data``; higher timeframes are resampled.
+        exchange:       Optional SimulatedExchange fed with each newly closed bar.
+        warmup_bars:    Bars visible at the default clock start.
+    """
+
+    def __init__(
+        self,
+        data: Mapping[str, pd.DataFrame],
+        clock: Optional[VirtualClock] = None,
+        base_timeframe: str = "M5",
+        exchange: Optional[SimulatedExchange] = None,
+        warmup_bars: int = 500,
+    ) -> None:
+        self.base_timeframe = base_timeframe.upper()
+        self._base_step = timeframe_delta(self.base_timeframe)
+        self._base: Dict[str, pd.DataFrame] = {
+            symbol.upper(): self._normalize(frame) for symbol, frame in data.items()
+        }
+        if clock is None:
+            first = min((f["time"].iloc[0] for f in self._base.values() if len(f)), default=None)
+            start = (first.to_pydatetime() if first is not None else datetime.now(timezone.utc))
+            clock = VirtualClock(start + self._base_step * warmup_bars)
+        self.clock = clock
+        self.exchange = exchange
+        self._frames: Dict[Tuple[str, str], Tuple[pd.DataFrame, np.ndarray]] = {}
+        self._fed: Dict[str, int] = {}
+        self._lock = threading.RLock()
+        self.stats: Dict[str, int] = {"fetches": 0, "bars_fed": 0}
+        self._feed_exchange()
+
+    # ─── Construction ─────────────────────────────────────────────────────────
+
+    @classmethod
+    def synthetic(
+        cls,
+        symbols: Sequence[str],
+        bars: int = 2000,
+        warmup_bars: int = 500,
+        base_timeframe: str = "M5",
+        seed: int = 42,
+        start: datetime = datetime(2026, 1, 5, tzinfo=timezone.utc),
+        speed: Optional[float] = None,
+        exchange: Optional[SimulatedExchange] = None,
+    ) -> "ReplayDataProvider":
+        """Seeded synthetic bars for each symbol; the clock opens after ``warmup_bars``."""
+        data = {s: synthetic_ohlc(s, bars, start, base_timeframe, seed) for s in symbols}
+        clock = VirtualClock(start + timeframe_delta(base_timeframe) * warmup_bars, speed=speed)
+        return cls(data, clock=clock, base_timeframe=base_timeframe, exchange=exchange)
+
+    @classmethod
+    def from_csv(cls, paths: Mapping[str, str], **kwargs: Any) -> "ReplayDataProvider":
+        """Recorded bars: one CSV per symbol with a ``time`` column plus OHLC(V)."""
+        return cls({symbol: pd.read_csv(path) for symbol, path in paths.items()}, **kwargs)
+
+    # ─── Replay control ───────────────────────────────────────────────────────
+
+    def advance(self, bars: int = 1) -> datetime:
+        """Step the clock by ``bars`` base bars and feed the exchange."""
+        now = self.clock.advance(self._base_step * bars)
+        self._feed_exchange()
+        return now
+
+    def remaining_bars(self) -> int:
+        """Base bars not yet closed for the symbol with the shortest series."""
+        cutoff = self._cutoff_ns(self._base_step)
+        return min(
+            (len(f) - int(np.searchsorted(self._times(f), cutoff, side="right")) for f in self._base.values()),
+            default=0,
+        )
+
+    def symbols(self) -> List[str]:
+        return list(self._base)
+
+    # ─── DataProvider protocol ────────────────────────────────────────────────
+
+    def fetch_ohlc(self, symbol: str, timeframe: str = "M5", count: int = 500) -> Optional[pd.DataFrame]:
+        """Last ``count`` closed bars at virtual time (same columns as live providers)."""
+        cached = self._frame(symbol.upper(), timeframe.upper())
+        if cached is None:
+            return None
+        self._feed_exchange()
+        frame, times = cached
+        end = int(np.searchsorted(times, self._cutoff_ns(timeframe_delta(timeframe)), side="right"))
+        self.stats["fetches"] += 1
+        if end == 0:
+            return None
+        return frame.iloc[max(0, end - count):end].reset_index(drop=True)
+
+    def get_market_data(self, symbol: str, timeframe: str, count: int) -> Optional[pd.DataFrame]:
+        return self.fetch_ohlc(symbol, timeframe, count)
+
+    def is_symbol_supported(self, symbol: str) -> bool:
+        return symbol.upper() in self._base
+
+    def get_last_tick(self, symbol: str) -> Dict[str, float]:
+        """Exchange quote when fed, otherwise last close ± half spread."""
+        if self.exchange is not None:
+            self._feed_exchange()
+            tick = self.exchange.get_last_tick(symbol)
+            if tick:
+                return tick
+        bars = self.fetch_ohlc(symbol, self.base_timeframe, 1)
+        if bars is None:
+            return {}
+        spec = default_spec_for(symbol)
+        half = spec.spread_pips * spec.pip_size / 2.0
+        mid = float(bars["close"].iloc[-1])
+        return {"bid": mid - half, "ask": mid + half, "time": self.clock.now().timestamp()}
+
+    def is_local(self) -> bool:
+        return True
+
+    # ─── BaseConnector ────────────────────────────────────────────────────────
+
+    @property
+    def provider_id(self) -> str:
+        return "replay"
+
+    def connect(self) -> bool:
+        return True
+
+    def disconnect(self) -> bool:
+        return True
+
+    def is_available(self) -> bool:
+        return bool(self._base)
+
+    def get_latency(self) -> float:
+        return 0.0
+
+    def execute_order(self, signal: Any) -> Dict[str, Any]:
+        return {"success": False, "error": "ReplayDataProvider is data-only; route orders to PaperConnector"}
+
+    def get_positions(self) -> List[Dict[str, Any]]:
+        return []
+
+    # ─── Internals ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _normalize(frame: pd.DataFrame) -> pd.DataFrame:
+        df = frame.rename(columns={c: str(c).lower() for c in frame.columns})
+        df = df.rename(columns={"datetime": "time", "date": "time"})
+        missing = {"time", "open", "high", "low", "close"} - set(df.columns)
+        if missing:
+            raise ValueError(f"Replay data missing columns: {sorted(missing)}")
+        df = df.copy()
+        df["time"] = pd.to_datetime(df["time"], utc=True)
+        if "volume" not in df.columns:
+            df["volume"] = df["tick_volume"] if "tick_volume" in df.columns else 0.0
+        if "tick_volume" not in df.columns:
+            df["tick_volume"] = df["volume"]
+        return df.sort_values("time", kind="stable")[OHLC_COLUMNS].reset_index(drop=True)
+
+    @staticmethod
+    def _times(frame: pd.DataFrame) -> np.ndarray:
+        return frame["time"].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+
+    def _cutoff_ns(self, step: timedelta) -> int:
+        """Latest bar open time whose bar is closed at virtual now."""
+        return pd.Timestamp(self.clock.now() - step).value
+
+    def _frame(self, symbol: str, timeframe: str) -> Optional[Tuple[pd.DataFrame, np.ndarray]]:
+        key = (symbol, timeframe)
+        cached = self._frames.get(key)
+        if cached is not None:
+            return cached
+        base = self._base.get(symbol)
+        if base is None or timeframe not in TIMEFRAME_MINUTES:
+            return None
+        if timeframe == self.base_timeframe:
+            frame = base
+        elif timeframe_delta(timeframe) > self._base_step:
+            frame = (
+                base.set_index("time")
+                .resample(timeframe_delta(timeframe), label="left", closed="left")
+                .agg({"open": "first", "high": "max", "low": "min", "close": "last",
+                      "volume": "sum", "tick_volume": "sum"})
+                .dropna(subset=["open"])
+                .reset_index()[OHLC_COLUMNS]
+            )
+        else:
+            logger.debug("[REPLAY] %s finer than base %s — not served", timeframe, self.base_timeframe)
+            return None
+        with self._lock:
+            cached = self._frames.setdefault(key, (frame, self._times(frame)))
+        return cached
+
+    def _feed_exchange(self) -> None:
+        if self.exchange is None:
+            return
+        cutoff = self._cutoff_ns(self._base_step)
+        with self._lock:
+            for symbol, frame in self._base.items():
+                _, times = self._frame(symbol, self.base_timeframe)
+                end = int(np.searchsorted(times, cutoff, side="right"))
+                start = self._fed.get(symbol, max(0, end - 1))
+                for row in frame.iloc[start:end].itertuples(index=False):
+                    self.exchange.on_bar(
+                        symbol, row.open, row.high, row.low, row.close,
+                        ts=(row.time + self._base_step).timestamp(),
+                    )
+                self.stats["bars_fed"] += max(0, end - start)
+                self._fed[symbol] = max(start, end)
@@ -0,0 +1,403 @@
+"""
+Deterministic simulated exchange used behind PaperConnector.
+TRACE_ID: SIM-EXCHANGE-2026-001
+
+Responsibility:
+  - Quote model per symbol driven by replayed/live bars or ticks. Bars are
+    expanded into an intrabar path (O→L→H→C for bullish bars, O→H→L→C for
+    bearish ones) so pending orders and SL/TP trigger in a realistic order.
+  - Price-time priority matching of MARKET / LIMIT / STOP orders
+    (connectors/sim_order_book.py), with partial fills from finite depth.
+  - Latency/slippage drawn from ExecutionCostModel (calibrated from
+    usr_execution_logs) — recorded on each fill, never slept.
+  - The position / pending-order / deal history API the real connectors expose
+    (get_open_positions, get_pending_orders, get_closed_usr_positions,
+    modify_position, close_position, cancel_order).
+
+Design principles:
+  - No blocking: every call is O(log n) book work under a single lock, so
+    thousands of orders per second can be simulated from worker threads.
+  - Deterministic: a seeded cost model + identical inputs → identical fills.
+  - Virtual clock: time advances with the quotes fed in, not wall time.
+"""
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from connectors.sim_execution_model import ExecutionCostModel
+from connectors.sim_order_book import (
+    BUY, LIMIT, MARKET, SELL, STOP, Quote, SimOrder, SymbolBook, SymbolSpec,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SimPosition:
+    ticket: int
+    symbol: str
+    side: str
+    volume: float
+    price_open: float
+    time: float
+    sl: Optional[float] = None
+    tp: Optional[float] = None
+    comment: str = ""
+    magic: int = 0
+    price_current: float = 0.0
+
+
+@dataclass(frozen=True)
+class SimDeal:
+    deal_id: int
+    position_id: int
+    symbol: str
+    side: str
+    entry: str  # "IN" | "OUT"
+    volume: float
+    price: float
+    profit: float
+    time: float
+    reason: str
+    comment: str
+
+
+class SimulatedExchange:
+    """
+    In-process exchange simulator.
+
+    Args:
+        cost_model: Latency/slippage sampler (default: uncalibrated, seed 42).
+        spec_resolver: Callable(symbol) -> SymbolSpec for unknown symbols.
+        max_deal_history: Bounded deal history (oldest evicted first).
+    """
+
+    def __init__(
+        self,
+        cost_model: Optional[ExecutionCostModel] = None,
+        spec_resolver: Optional[Callable[[str], SymbolSpec]] = None,
+        max_deal_history: int = 100_000,
+    ) -> None:
+        self.cost_model = cost_model or ExecutionCostModel()
+        self._spec_resolver = spec_resolver or default_spec_for
+        self._books: Dict[str, SymbolBook] = {}
+        self._positions: Dict[int, SimPosition] = {}
+        self._positions_by_symbol: Dict[str, Dict[int, SimPosition]] = {}
+        self._deals: List[SimDeal] = []
+        self._max_deals = max_deal_history
+        self._tickets = itertools.count(1)
+        self._seq = itertools.count(1)
+        self._lock = threading.RLock()
+        self._now: float = 0.0
+        self.stats: Dict[str, int] = {"orders": 0, "fills": 0, "partial_fills": 0, "rejects": 0}
+
+    # ─── Market data ──────────────────────────────────────────────────────────
+
+    def register_symbol(self, symbol: str, spec: SymbolSpec) -> None:
+        with self._lock:
+            self._book(symbol).spec = spec
+
+    def update_quote(self, symbol: str, bid: float, ask: float, ts: Optional[float] = None) -> None:
+        """Apply a tick: trigger stops, match limits, evaluate SL/TP."""
+        with self._lock:
+            self._apply_quote(self._book(symbol), bid, ask, ts, gap=True)
+
+    def update_mid(self, symbol: str, mid: float, ts: Optional[float] = None) -> None:
+        """Apply a mid price; bid/ask are derived from the symbol's spread."""
+        with self._lock:
+            book = self._book(symbol)
+            half = book.spec.spread_pips * book.spec.pip_size / 2.0
+            self._apply_quote(book, mid - half, mid + half, ts, gap=True)
+
+    def on_bar(self, symbol: str, open_: float, high: float, low: float, close: float,
+               ts: Optional[float] = None) -> None:
+        """Replay one OHLC bar as an intrabar quote path."""
+        with self._lock:
+            book = self._book(symbol)
+            half = book.spec.spread_pips * book.spec.pip_size / 2.0
+            path = (open_, low, high, close) if close >= open_ else (open_, high, low, close)
+            for i, mid in enumerate(path):
+                self._apply_quote(book, mid - half, mid + half, ts, gap=(i == 0))
+
+    def get_last_tick(self, symbol: str) -> Dict[str, float]:
+        with self._lock:
+            book = self._books.get(symbol.upper())
+            if book is None or book.quote is None:
+                return {}
+            return {"bid": book.quote.bid, "ask": book.quote.ask, "time": book.quote.time}
+
+    def has_quote(self, symbol: str) -> bool:
+        book = self._books.get(symbol.upper())
+        return book is not None and book.quote is not None
+
+    # ─── Order entry ──────────────────────────────────────────────────────────
+
+    def submit_order(
+        self,
+        symbol: str,
+        side: str,
+        volume: float,
+        kind: str = MARKET,
+        price: Optional[float] = None,
+        sl: Optional[float] = None,
+        tp: Optional[float] = None,
+        comment: str = "",
+        magic: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Submit an order. MARKET orders fill immediately (IOC on depth);
+        LIMIT/STOP orders rest until a quote touches them.
+
+        Returns:
+            Normalized result dict compatible with connector execute_* results.
+        """
+        side = BUY if side.upper() in (BUY, "LONG") else SELL
+        kind = kind.upper()
+        with self._lock:
+            self.stats["orders"] += 1
+            book = self._book(symbol)
+            if volume <= 0 or kind not in (MARKET, LIMIT, STOP) or (kind != MARKET and price is None):
+                return self._reject("Invalid order parameters")
+            if kind == MARKET and book.quote is None:
+                return self._reject(f"No quote for {book.symbol}")
+
+            latency_ms = self.cost_model.sample_latency_ms(book.symbol)
+            order = SimOrder(
+                ticket=next(self._tickets), symbol=book.symbol, side=side, kind=kind,
+                volume=volume, price=float(price or 0.0), seq=next(self._seq),
+                time_setup=self._now, sl=sl, tp=tp, comment=comment, magic=magic,
+            )
+            if kind == STOP and book.quote is not None and self._stop_crossed(order, book.quote):
+                order.kind = MARKET
+            if order.kind == MARKET:
+                return self._execute_market(book, order, latency_ms)
+
+            if kind == LIMIT and book.quote is not None and self._limit_marketable(order, book.quote):
+                result = self._execute_market(book, order, latency_ms, limit_price=order.price)
+                if order.remaining > 1e-9:
+                    book.rest(order)
+                    result["status"] = "PARTIAL_RESTING"
+                return result
+
+            book.rest(order)
+            return {
+                "success": True, "status": "PENDING", "ticket": order.ticket,
+                "order_id": order.ticket, "price": order.price, "volume": 0.0,
+                "latency_ms": latency_ms, "timestamp": self._iso_now(),
+            }
+
+    def cancel_order(self, order_ticket: int, reason: str = "") -> Dict[str, Any]:
+        with self._lock:
+            for book in self._books.values():
+                if book.cancel(order_ticket) is not None:
+                    return {"success": True, "ticket": order_ticket}
+            return {"success": False, "error": f"Order {order_ticket} not found"}
+
+    def modify_position(self, ticket: int, new_sl: Optional[float],
+                        new_tp: Optional[float] = None, reason: str = "") -> Dict[str, Any]:
+        with self._lock:
+            position = self._positions.get(ticket)
+            if position is None:
+                return {"success": False, "error": f"Position {ticket} not found"}
+            position.sl = new_sl
+            if new_tp is not None:
+                position.tp = new_tp
+            return {"success": True}
+
+    def close_position(self, ticket: int, reason: str = "") -> Dict[str, Any]:
+        with self._lock:
+            position = self._positions.get(ticket)
+            if position is None:
+                return {"success": False, "error": "Position not found"}
+            book = self._book(position.symbol)
+            if book.quote is None:
+                return {"success": False, "error": f"No quote for {position.symbol}"}
+            slippage = self.cost_model.sample_slippage_pips(book.symbol)
+            exit_side = SELL if position.side == BUY else BUY
+            _, price = book.sweep(exit_side, position.volume, slippage)
+            deal = self._close(position, price, "MANUAL", reason)
+            return {"success": True, "ticket": ticket, "price": price, "profit": deal.profit}
+
+    # ─── Connector-compatible views ───────────────────────────────────────────
+
+    def get_open_positions(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [self._position_dict(p) for p in self._positions.values()]
+
+    def get_pending_orders(self, symbol: Optional[str] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            books = [self._books[symbol.upper()]] if symbol and symbol.upper() in self._books else (
+                [] if symbol else list(self._books.values()))
+            return [
+                {
+                    "ticket": o.ticket, "symbol": o.symbol, "type": o.type_code, "state": "PLACED",
+                    "volume": o.remaining, "price_open": o.price, "time_setup": o.time_setup,
+                    "magic": o.magic, "comment": o.comment, "sl": o.sl, "tp": o.tp,
+                }
+                for book in books for o in sorted(book.orders.values(), key=lambda o: o.seq)
+            ]
+
+    def get_deals(self, hours: Optional[float] = None) -> List[SimDeal]:
+        with self._lock:
+            if hours is None:
+                return list(self._deals)
+            cutoff = self._now - hours * 3600.0
+            return [d for d in self._deals if d.time >= cutoff]
+
+    def get_closed_usr_positions(self, hours: int = 24) -> List[Dict[str, Any]]:
+        """Closed positions in the MT5Connector.get_closed_usr_positions format."""
+        deals = self.get_deals(hours)
+        entries = {d.position_id: d for d in self._deals if d.entry == "IN"}
+        closed = []
+        for deal in deals:
+            if deal.entry != "OUT":
+                continue
+            entry = entries.get(deal.position_id)
+            closed.append({
+                "ticket": deal.position_id, "symbol": deal.symbol,
+                "entry_price": entry.price if entry else None, "exit_price": deal.price,
+                "profit": deal.profit, "volume": deal.volume,
+                "close_time": datetime.fromtimestamp(deal.time, tz=timezone.utc),
+                "exit_reason": deal.reason, "signal_id": _signal_id_from_comment(deal.comment),
+            })
+        return closed
+
+    # ─── Internals ────────────────────────────────────────────────────────────
+
+    def _book(self, symbol: str) -> SymbolBook:
+        key = symbol.upper()
+        book = self._books.get(key)
+        if book is None:
+            book = self._books[key] = SymbolBook(symbol=key, spec=self._spec_resolver(key))
+        return book
+
+    def _apply_quote(self, book: SymbolBook, bid: float, ask: float, ts: Optional[float], gap: bool) -> None:
+        if ts is not None:
+            self._now = max(self._now, float(ts))
+        elif self._now == 0.0:
+            self._now = time.time()
+        book.quote = Quote(bid=bid, ask=ask, time=self._now)
+
+        for order in book.triggered_stops(bid, ask):
+            self._execute_market(book, order, self.cost_model.sample_latency_ms(book.symbol))
+        for order, qty in book.match_limits(bid, ask):
+            self._fill(book, order, qty, order.price, slippage_pips=0.0, latency_ms=0.0)
+        self._check_exits(book, gap)
+
+    def _check_exits(self, book: SymbolBook, gap: bool) -> None:
+        quote = book.quote
+        assert quote is not None
+        for position in list(self._positions_by_symbol.get(book.symbol, {}).values()):
+            is_buy = position.side == BUY
+            exit_px = quote.bid if is_buy else quote.ask
+            position.price_current = exit_px
+            sl, tp = position.sl, position.tp
+            if sl and ((is_buy and exit_px <= sl) or (not is_buy and exit_px >= sl)):
+                slip = self.cost_model.sample_slippage_pips(book.symbol) * book.spec.pip_size
+                level = exit_px if gap else sl
+                self._close(position, level - slip if is_buy else level + slip, "STOP_LOSS", "sl")
+            elif tp and ((is_buy and exit_px >= tp) or (not is_buy and exit_px <= tp)):
+                self._close(position, exit_px if gap else tp, "TAKE_PROFIT", "tp")
+
+    def _execute_market(self, book: SymbolBook, order: SimOrder, latency_ms: float,
+                        limit_price: Optional[float] = None) -> Dict[str, Any]:
+        slippage = 0.0 if limit_price is not None else self.cost_model.sample_slippage_pips(book.symbol)
+        qty, vwap = book.sweep(order.side, order.remaining, slippage, limit_price=limit_price)
+        if qty <= 0:
+            return self._reject("No liquidity within limit")
+        ticket = self._fill(book, order, qty, vwap, slippage, latency_ms)
+        partial = order.remaining > 1e-9
+        if partial:
+            self.stats["partial_fills"] += 1
+        return {
+            "success": True, "status": "PARTIAL" if partial else "FILLED",
+            "ticket": ticket, "order_id": order.ticket, "price": vwap,
+            "volume": qty, "requested_volume": order.volume,
+            "slippage_pips": slippage, "latency_ms": latency_ms, "timestamp": self._iso_now(),
+            "message": f"Simulated fill {qty} @ {vwap:.6f} (Ticket: {ticket})",
+        }
+
+    def _fill(self, book: SymbolBook, order: SimOrder, qty: float, price: float,
+              slippage_pips: float, latency_ms: float) -> int:
+        order.filled = round(order.filled + qty, 8)
+        self.stats["fills"] += 1
+        position = SimPosition(
+            ticket=next(self._tickets), symbol=book.symbol, side=order.side, volume=qty,
+            price_open=price, time=self._now, sl=order.sl, tp=order.tp,
+            comment=order.comment, magic=order.magic, price_current=price,
+        )
+        self._positions[position.ticket] = position
+        self._positions_by_symbol.setdefault(book.symbol, {})[position.ticket] = position
+        self._record_deal(position, "IN", qty, price, 0.0, "FILL", order.comment)
+        return position.ticket
+
+    def _close(self, position: SimPosition, price: float, reason: str, comment: str) -> SimDeal:
+        spec = self._book(position.symbol).spec
+        direction = 1.0 if position.side == BUY else -1.0
+        profit = round((price - position.price_open) * direction * position.volume * spec.contract_size, 2)
+        self._positions.pop(position.ticket, None)
+        self._positions_by_symbol.get(position.symbol, {}).pop(position.ticket, None)
+        return self._record_deal(position, "OUT", position.volume, price, profit, reason,
+                                 f"{position.comment}|{comment}" if comment else position.comment)
+
+    def _record_deal(self, position: SimPosition, entry: str, volume: float, price: float,
+                     profit: float, reason: str, comment: str) -> SimDeal:
+        deal = SimDeal(
+            deal_id=next(self._tickets), position_id=position.ticket, symbol=position.symbol,
+            side=position.side, entry=entry, volume=volume, price=price, profit=profit,
+            time=self._now, reason=reason, comment=comment,
+        )
+        self._deals.append(deal)
+        if len(self._deals) > self._max_deals:
+            del self._deals[: len(self._deals) - self._max_deals]
+        return deal
+
+    def _position_dict(self, p: SimPosition) -> Dict[str, Any]:
+        spec = self._book(p.symbol).spec
+        direction = 1.0 if p.side == BUY else -1.0
+        profit = round((p.price_current - p.price_open) * direction * p.volume * spec.contract_size, 2)
+        return {
+            "ticket": p.ticket, "symbol": p.symbol, "price": p.price_open, "price_open": p.price_open,
+            "price_current": p.price_current, "current_price": p.price_current, "volume": p.volume,
+            "profit": profit, "sl": p.sl, "tp": p.tp, "time": p.time,
+            "type": 0 if p.side == BUY else 1, "magic": p.magic, "comment": p.comment,
+        }
+
+    @staticmethod
+    def _stop_crossed(order: SimOrder, quote: Quote) -> bool:
+        return quote.ask >= order.price if order.side == BUY else quote.bid <= order.price
+
+    @staticmethod
+    def _limit_marketable(order: SimOrder, quote: Quote) -> bool:
+        return quote.ask <= order.price if order.side == BUY else quote.bid >= order.price
+
+    def _reject(self, error: str) -> Dict[str, Any]:
+        self.stats["rejects"] += 1
+        return {"success": False, "status": "REJECTED", "error": error}
+
+    def _iso_now(self) -> str:
+        return datetime.fromtimestamp(self._now or time.time(), tz=timezone.utc).isoformat()
+
+
+def default_spec_for(symbol: str) -> SymbolSpec:
+    """Heuristic microstructure defaults by asset family."""
+    s = symbol.upper()
+    if "JPY" in s:
+        return SymbolSpec(pip_size=0.01)
+    if s.startswith(("XAU", "GOLD")):
+        return SymbolSpec(pip_size=0.1, spread_pips=2.5, contract_size=100.0)
+    if s.startswith(("BTC", "ETH")):
+        return SymbolSpec(pip_size=1.0, spread_pips=10.0, contract_size=1.0)
+    if any(idx in s for idx in ("US30", "US500", "NAS100", "SPX", "GER40", "DAX")):
+        return SymbolSpec(pip_size=1.0, spread_pips=1.5, contract_size=1.0)
+    return SymbolSpec()
+
+
+def _signal_id_from_comment(comment: str) -> Optional[str]:
+    if comment and "Aethelgard_" in comment:
+        return comment.split("Aethelgard_", 1)[1].split("|", 1)[0] or None
+    return None
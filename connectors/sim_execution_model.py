@@ -0,0 +1,111 @@
+"""
+Execution cost model for the simulated exchange (latency + slippage).
+TRACE_ID: SIM-EXCHANGE-2026-001
+
+Responsibility:
+  - Hold per-symbol empirical distributions of slippage (pips) and latency (ms).
+  - Calibrate them from usr_execution_logs (real broker fills = SSOT of cost).
+  - Sample deterministically (seeded RNG) so simulated runs are reproducible.
+
+Slippage sign convention matches ExecutionService._calculate_pips():
+positive pips = adverse to the trader (BUY filled higher / SELL filled lower).
+"""
+import logging
+import random
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Fallback cost profile when a symbol has no execution history yet.
+DEFAULT_SLIPPAGE_PIPS: Sequence[float] = (0.0, 0.0, 0.1, 0.2, 0.3, 0.5)
+DEFAULT_LATENCY_MS: Sequence[float] = (15.0, 25.0, 40.0, 60.0)
+MIN_CALIBRATION_SAMPLES = 20
+
+
+@dataclass
+class _SymbolCostProfile:
+    slippage_pips: List[float] = field(default_factory=lambda: list(DEFAULT_SLIPPAGE_PIPS))
+    latency_ms: List[float] = field(default_factory=lambda: list(DEFAULT_LATENCY_MS))
+    calibrated: bool = False
+
+
+class ExecutionCostModel:
+    """
+    Per-symbol latency/slippage sampler.
+
+    Args:
+        seed: RNG seed — identical seed + identical order flow → identical fills.
+        slippage_scale: Multiplier applied to sampled slippage (stress testing).
+    """
+
+    def __init__(self, seed: int = 42, slippage_scale: float = 1.0) -> None:
+        self._rng = random.Random(seed)
+        self._slippage_scale = slippage_scale
+        self._profiles: Dict[str, _SymbolCostProfile] = {}
+        self._default = _SymbolCostProfile()
+
+    def set_profile(
+        self,
+        symbol: str,
+        slippage_pips: Sequence[float],
+        latency_ms: Sequence[float],
+    ) -> None:
+        """Install an explicit cost distribution for a symbol."""
+        self._profiles[symbol.upper()] = _SymbolCostProfile(
+            slippage_pips=sorted(float(s) for s in slippage_pips) or list(DEFAULT_SLIPPAGE_PIPS),
+            latency_ms=sorted(float(v) for v in latency_ms) or list(DEFAULT_LATENCY_MS),
+            calibrated=True,
+        )
+
+    def calibrate_from_storage(self, storage: Any, symbols: Sequence[str], limit: int = 500) -> int:
+        """
+        Load empirical distributions from usr_execution_logs.
+
+        Symbols with fewer than MIN_CALIBRATION_SAMPLES records keep the default
+        profile. Returns the number of symbols calibrated.
+        """
+        calibrated = 0
+        for symbol in symbols:
+            try:
+                samples = storage.get_execution_cost_samples(symbol, limit=limit)
+            except Exception as exc:
+                logger.warning("[SIM-EXCHANGE] Cost calibration failed for %s: %s", symbol, exc)
+                continue
+            if len(samples) < MIN_CALIBRATION_SAMPLES:
+                continue
+            self.set_profile(
+                symbol,
+                [s["slippage_pips"] for s in samples],
+                [s["latency_ms"] for s in samples],
+            )
+            calibrated += 1
+        logger.info("[SIM-EXCHANGE] Cost model calibrated for %d/%d symbols", calibrated, len(symbols))
+        return calibrated
+
+    def is_calibrated(self, symbol: str) -> bool:
+        return self._profiles.get(symbol.upper(), self._default).calibrated
+
+    def sample_slippage_pips(self, symbol: str) -> float:
+        """Draw one slippage value (pips, positive = adverse)."""
+        profile = self._profiles.get(symbol.upper(), self._default)
+        return self._draw(profile.slippage_pips) * self._slippage_scale
+
+    def sample_latency_ms(self, symbol: str) -> float:
+        profile = self._profiles.get(symbol.upper(), self._default)
+        return self._draw(profile.latency_ms)
+
+    def quantile_slippage_pips(self, symbol: str, q: float) -> float:
+        """Empirical quantile of the slippage distribution (for reporting)."""
+        values = self._profiles.get(symbol.upper(), self._default).slippage_pips
+        idx = min(len(values) - 1, max(0, int(q * len(values))))
+        return values[idx]
+
+    def reseed(self, seed: Optional[int]) -> None:
+        """Reset the sampler RNG (used when replaying the same scenario twice)."""
+        self._rng = random.Random(seed)
+
+    def _draw(self, sorted_values: List[float]) -> float:
+        # Inverse-CDF sampling over the empirical distribution.
+        idx = int(self._rng.random() * len(sorted_values))
+        return sorted_values[min(idx, len(sorted_values) - 1)]
@@ -0,0 +1,216 @@
+"""
+Per-symbol order book and price-time priority matching for the simulated exchange.
+TRACE_ID: SIM-EXCHANGE-2026-001
+
+Responsibility:
+  - Model the top of book as a quote (bid/ask) plus a synthetic depth ladder.
+  - Keep resting LIMIT/STOP orders in heaps ordered by price, then arrival
+    sequence (price-time priority), with lazy deletion on cancel.
+  - Match market orders by walking the depth ladder (partial fills when the
+    ladder is exhausted) and release resting orders when a quote touches them.
+
+No I/O and no clock: the owning SimulatedExchange supplies quotes and time.
+"""
+import heapq
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+BUY = "BUY"
+SELL = "SELL"
+MARKET = "MARKET"
+LIMIT = "LIMIT"
+STOP = "STOP"
+
+# MT5-compatible order type codes (connectors expose these in order dicts).
+ORDER_TYPE_CODES: Dict[Tuple[str, str], int] = {
+    (BUY, MARKET): 0, (SELL, MARKET): 1,
+    (BUY, LIMIT): 2, (SELL, LIMIT): 3,
+    (BUY, STOP): 4, (SELL, STOP): 5,
+}
+
+
+@dataclass(frozen=True)
+class SymbolSpec:
+    """
+    Static microstructure parameters of one simulated instrument.
+
+    Attributes:
+        pip_size: Price value of one pip.
+        spread_pips: Quoted spread applied when quotes are derived from bars.
+        contract_size: Units per lot (profit = price diff × volume × contract_size).
+        depth_levels: Number of price levels available to a market order.
+        level_volume: Lots available at each level.
+        level_step_pips: Price distance between consecutive levels.
+    """
+    pip_size: float = 0.0001
+    spread_pips: float = 1.0
+    contract_size: float = 100_000.0
+    depth_levels: int = 5
+    level_volume: float = 10.0
+    level_step_pips: float = 0.5
+
+    @property
+    def depth_volume(self) -> float:
+        return self.depth_levels * self.level_volume
+
+
+@dataclass
+class SimOrder:
+    ticket: int
+    symbol: str
+    side: str
+    kind: str
+    volume: float
+    price: float
+    seq: int
+    time_setup: float
+    sl: Optional[float] = None
+    tp: Optional[float] = None
+    comment: str = ""
+    magic: int = 0
+    filled: float = 0.0
+    active: bool = True
+
+    @property
+    def remaining(self) -> float:
+        return round(self.volume - self.filled, 8)
+
+    @property
+    def type_code(self) -> int:
+        return ORDER_TYPE_CODES[(self.side, self.kind)]
+
+
+@dataclass
+class Quote:
+    bid: float
+    ask: float
+    time: float
+
+
+@dataclass
+class SymbolBook:
+    """Resting orders and the latest quote for one symbol."""
+    symbol: str
+    spec: SymbolSpec
+    quote: Optional[Quote] = None
+    orders: Dict[int, SimOrder] = field(default_factory=dict)
+    _buy_limits: List[Tuple[float, int, int]] = field(default_factory=list)   # (-price, seq, ticket)
+    _sell_limits: List[Tuple[float, int, int]] = field(default_factory=list)  # (price, seq, ticket)
+    _buy_stops: List[Tuple[float, int, int]] = field(default_factory=list)    # (trigger, seq, ticket)
+    _sell_stops: List[Tuple[float, int, int]] = field(default_factory=list)   # (-trigger, seq, ticket)
+
+    # ─── Resting orders ───────────────────────────────────────────────────────
+
+    def rest(self, order: SimOrder) -> None:
+        """Insert a LIMIT/STOP order with price-time priority."""
+        self.orders[order.ticket] = order
+        if order.kind == LIMIT:
+            if order.side == BUY:
+                heapq.heappush(self._buy_limits, (-order.price, order.seq, order.ticket))
+            else:
+                heapq.heappush(self._sell_limits, (order.price, order.seq, order.ticket))
+        else:
+            if order.side == BUY:
+                heapq.heappush(self._buy_stops, (order.price, order.seq, order.ticket))
+            else:
+                heapq.heappush(self._sell_stops, (-order.price, order.seq, order.ticket))
+
+    def cancel(self, ticket: int) -> Optional[SimOrder]:
+        """Deactivate a resting order; heap entries are dropped lazily."""
+        order = self.orders.pop(ticket, None)
+        if order is not None:
+            order.active = False
+        return order
+
+    def triggered_stops(self, bid: float, ask: float) -> List[SimOrder]:
+        """Pop every stop order whose trigger was crossed, in priority order."""
+        fired: List[SimOrder] = []
+        while self._buy_stops and self._buy_stops[0][0] <= ask:
+            order = self._pop_live(self._buy_stops)
+            if order is not None:
+                fired.append(order)
+        while self._sell_stops and -self._sell_stops[0][0] >= bid:
+            order = self._pop_live(self._sell_stops)
+            if order is not None:
+                fired.append(order)
+        fired.sort(key=lambda o: o.seq)
+        return fired
+
+    def match_limits(self, bid: float, ask: float) -> List[Tuple[SimOrder, float]]:
+        """
+        Fill resting limits touched by the quote, best price first then FIFO.
+
+        Each touch offers spec.depth_volume lots per side; orders beyond that
+        liquidity are partially filled and stay in the book.
+
+        Returns:
+            [(order, filled_volume)] in execution order.
+        """
+        fills: List[Tuple[SimOrder, float]] = []
+        fills.extend(self._match_side(self._buy_limits, lambda p: -p >= ask))
+        fills.extend(self._match_side(self._sell_limits, lambda p: p <= bid))
+        return fills
+
+    def _match_side(self, heap: List[Tuple[float, int, int]], touched) -> List[Tuple[SimOrder, float]]:
+        liquidity = self.spec.depth_volume
+        fills: List[Tuple[SimOrder, float]] = []
+        while heap and liquidity > 1e-9 and touched(heap[0][0]):
+            order = self.orders.get(heap[0][2])
+            if order is None or not order.active:
+                heapq.heappop(heap)
+                continue
+            qty = min(order.remaining, liquidity)
+            liquidity -= qty
+            fills.append((order, qty))
+            if qty >= order.remaining - 1e-9:
+                heapq.heappop(heap)
+                self.orders.pop(order.ticket, None)
+        return fills
+
+    def _pop_live(self, heap: List[Tuple[float, int, int]]) -> Optional[SimOrder]:
+        _, _, ticket = heapq.heappop(heap)
+        order = self.orders.pop(ticket, None)
+        if order is None or not order.active:
+            return None
+        return order
+
+    # ─── Market matching ──────────────────────────────────────────────────────
+
+    def sweep(self, side: str, volume: float, base_slippage_pips: float,
+              limit_price: Optional[float] = None) -> Tuple[float, float]:
+        """
+        Walk the synthetic depth ladder for a marketable order.
+
+        Args:
+            side: BUY lifts the ask ladder, SELL hits the bid ladder.
+            volume: Requested lots.
+            base_slippage_pips: Sampled adverse slippage applied to level 0.
+            limit_price: Optional worst acceptable price (marketable limits).
+
+        Returns:
+            (filled_volume, vwap_price); filled_volume may be < volume.
+        """
+        assert self.quote is not None
+        spec = self.spec
+        direction = 1.0 if side == BUY else -1.0
+        top = self.quote.ask if side == BUY else self.quote.bid
+        top += direction * base_slippage_pips * spec.pip_size
+        remaining = volume
+        notional = 0.0
+        filled = 0.0
+        for level in range(spec.depth_levels):
+            price = top + direction * level * spec.level_step_pips * spec.pip_size
+            if limit_price is not None and direction * (price - limit_price) > 1e-12:
+                break
+            qty = min(remaining, spec.level_volume)
+            notional += qty * price
+            filled += qty
+            remaining -= qty
+            if remaining <= 1e-9:
+                break
+        if filled <= 0:
+            return 0.0, 0.0
+        return round(filled, 8), notional / filled
+
+    def __len__(self) -> int:
+        return len(self.orders)
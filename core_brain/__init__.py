@@ -1,9 +1,27 @@
 """
 Core Brain - Motor principal de Aethelgard
+
+Los exports se resuelven al primer acceso (PEP 562): importar un submódulo de
+core_brain no arrastra scanner, servidor API ni tuner (PERF-STARTUP-GRAPH-2026-001).
 """
-from .regime import RegimeClassifier
-from .scanner import CPUMonitor, ScannerEngine
-from .server import create_app
-from .edge_tuner import EdgeTuner
+from importlib import import_module
+from typing import Any
+
+_LAZY_EXPORTS = {
+    'RegimeClassifier': '.regime',
+    'CPUMonitor': '.scanner',
+    'ScannerEngine': '.scanner',
+    'create_app': '.server',
+    'EdgeTuner': '.edge_tuner',
+}
 
 __all__ = ['RegimeClassifier', 'CPUMonitor', 'ScannerEngine', 'create_app', 'EdgeTuner']
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
@@ -65,6 +65,11 @@ class AlphaHunter:
         self._promotion_threshold = promotion_score_threshold
         self._sigma_ratio = mutation_sigma_ratio
 
+    @property
+    def max_shadow_population(self) -> int:
+        """Límite de instancias activas simultáneas en el pool DEMO."""
+        return self._max_population
+
     # ── Public API ────────────────────────────────────────────────────────────
 
     def mutate_parameters(
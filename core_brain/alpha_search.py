@@ -0,0 +1,294 @@
+"""
+AlphaSearchEngine — Búsqueda Poblacional Offline de Parámetros (AlphaHunter).
+=============================================================================
+Responsabilidad única: explorar poblaciones de variantes de parameter_overrides
+contra barras históricas cacheadas (ScenarioSlice) y enviar al pool SHADOW solo
+a las mejores, en lugar de incubar un mutante por ventana evolutiva.
+
+Flujo:
+  1. Población: ``AlphaHunter.mutate_parameters`` con semillas derivadas de una
+     semilla maestra (determinista).
+  2. Poda Hyperband: cada bracket ejecuta Successive Halving — todos los
+     candidatos con pocas barras; solo el top 1/eta pasa al siguiente rung con
+     eta× más barras, hasta el histórico completo.
+  3. Evaluación concurrente en un ProcessPoolExecutor: los slices viajan una
+     sola vez por worker (initializer); cada tarea solo lleva (params, barras).
+  4. Promoción: los top_k finalistas se re-validan con
+     ``ScenarioBacktester.run_scenario_backtest`` (auditoría en
+     sys_shadow_promotion_log) y pasan por ``AlphaHunter.try_promote_mutant``,
+     que aplica umbral y límite de población.
+
+Constraints de gobernanza:
+  - Pool DEMO lleno (count_active_shadow_instances) → no se ejecuta la búsqueda.
+  - Nunca se intentan promover más finalistas que plazas libres.
+  - Mismo seed + mismos slices → mismo ranking, con o sin workers.
+
+Trace_ID: cada candidato conserva el TRACE_ALPHAHUNTER_... de su mutación.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from core_brain.alpha_hunter import AlphaHunter
+from core_brain.scenario_backtester import ScenarioBacktester, ScenarioSlice
+
+logger = logging.getLogger(__name__)
+
+EvalTask = Tuple[Dict[str, Any], int]   # (parameter_overrides, barras por slice)
+
+
+@dataclass
+class SearchCandidate:
+    """Un mutante de la población con su última evaluación."""
+    index: int
+    parameter_overrides: Dict[str, Any]
+    trace_id: str
+    score: float = 0.0
+    bars: int = 0          # Presupuesto (barras por slice) de la última evaluación
+
+
+@dataclass
+class AlphaSearchReport:
+    """Resultado de una búsqueda: finalistas rankeados y resultado de promoción."""
+    strategy_id: str
+    seed: Optional[int]
+    candidates: int = 0
+    evaluations: int = 0
+    finalists: List[SearchCandidate] = field(default_factory=list)
+    promotions: List[Dict[str, Any]] = field(default_factory=list)
+    skipped_reason: Optional[str] = None
+
+
+# ── Evaluación (proceso padre o worker) ───────────────────────────────────────
+
+class _SliceEvaluator:
+    """Puntúa parámetros sobre las primeras `bars` barras de cada slice, sin storage."""
+
+    def __init__(self, slices: Sequence[ScenarioSlice], strategy_instance: Optional[Any]) -> None:
+        self._slices = list(slices)
+        self._strategy = strategy_instance
+        self._backtester = ScenarioBacktester(storage=None)
+        self._truncated: Dict[int, List[ScenarioSlice]] = {}
+
+    def __call__(self, task: EvalTask) -> float:
+        parameter_overrides, bars = task
+        sliced = self._truncated.get(bars)
+        if sliced is None:
+            sliced = self._truncated[bars] = [
+                replace(s, data=s.data.iloc[:bars]) if s.is_real_data else s
+                for s in self._slices
+            ]
+        score, _ = self._backtester.score_slices(parameter_overrides, sliced, self._strategy)
+        return score
+
+
+_worker_evaluator: Optional[_SliceEvaluator] = None
+
+
+def _init_worker(slices: Sequence[ScenarioSlice], strategy_instance: Optional[Any]) -> None:
+    global _worker_evaluator
+    _worker_evaluator = _SliceEvaluator(slices, strategy_instance)
+
+
+def _evaluate_in_worker(task: EvalTask) -> float:
+    if _worker_evaluator is None:
+        raise RuntimeError("AlphaSearch worker used before initialisation")
+    return _worker_evaluator(task)
+
+
+# ── Engine ────────────────────────────────────────────────────────────────────
+
+class AlphaSearchEngine:
+    """
+    Búsqueda Hyperband de mutantes de AlphaHunter sobre histórico cacheado.
+
+    Args:
+        hunter:          AlphaHunter inyectado (mutación, límite de población, promoción).
+        backtester:      ScenarioBacktester con storage (re-validación auditada de finalistas).
+        max_workers:     Procesos del pool (None → os.cpu_count(); 0 → en proceso).
+        eta:             Factor de reducción de Successive Halving (top 1/eta sobrevive).
+        min_bars:        Presupuesto mínimo (barras por slice) del primer rung.
+        hyperband:       False → un único bracket de Successive Halving.
+        mp_start_method: Start method del pool ('spawn' evita heredar hilos/locks).
+    """
+
+    def __init__(
+        self,
+        hunter: AlphaHunter,
+        backtester: ScenarioBacktester,
+        *,
+        max_workers: Optional[int] = None,
+        eta: int = 3,
+        min_bars: int = 50,
+        hyperband: bool = True,
+        mp_start_method: str = "spawn",
+    ) -> None:
+        if eta < 2:
+            raise ValueError(f"eta must be >= 2, got {eta}")
+        self._hunter = hunter
+        self._backtester = backtester
+        self._max_workers = max_workers
+        self._eta = eta
+        self._min_bars = max(3, min_bars)
+        self._hyperband = hyperband
+        self._mp_start_method = mp_start_method
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def search(
+        self,
+        strategy_id: str,
+        parameter_overrides: Dict[str, Any],
+        scenario_slices: Sequence[ScenarioSlice],
+        *,
+        population_size: int = 27,
+        top_k: int = 3,
+        seed: Optional[int] = None,
+        strategy_instance: Optional[Any] = None,
+    ) -> AlphaSearchReport:
+        """
+        Generar, podar y promover mutantes de ``parameter_overrides``.
+
+        Args:
+            strategy_id:         Estrategia origen.
+            parameter_overrides: Parámetros actuales (centro de la mutación).
+            scenario_slices:     Histórico cacheado; el presupuesto máximo es el slice real más corto.
+            population_size:     Candidatos del bracket más agresivo.
+            top_k:               Finalistas a re-validar y promover (acotado por plazas libres).
+            seed:                Semilla maestra (búsqueda determinista).
+            strategy_instance:   Estrategia con evaluate_on_history(); debe ser picklable si max_workers != 0.
+
+        Returns:
+            AlphaSearchReport con finalistas y el resultado de cada intento de promoción.
+        """
+        report = AlphaSearchReport(strategy_id=strategy_id, seed=seed)
+
+        free_slots = self._hunter.max_shadow_population - self._hunter.count_active_shadow_instances()
+        if free_slots <= 0:
+            report.skipped_reason = "population_limit alcanzado"
+            logger.info("[ALPHASEARCH] Skipped strategy=%s — %s", strategy_id, report.skipped_reason)
+            return report
+
+        real_lengths = [len(s.data) for s in scenario_slices if s.is_real_data]
+        max_bars = min(real_lengths) if real_lengths else 0
+        if max_bars < 3:
+            report.skipped_reason = "sin barras históricas reales"
+            logger.info("[ALPHASEARCH] Skipped strategy=%s — %s", strategy_id, report.skipped_reason)
+            return report
+
+        rng = random.Random(seed)
+        finalists: List[SearchCandidate] = []
+        with self._evaluator(scenario_slices, strategy_instance) as evaluate:
+            for n_candidates, budgets in self.plan_brackets(population_size, max_bars):
+                population = [
+                    self._spawn(strategy_id, parameter_overrides, rng, report.candidates + i)
+                    for i in range(n_candidates)
+                ]
+                report.candidates += n_candidates
+                finalists.extend(self._successive_halving(population, budgets, evaluate, report))
+
+        finalists.sort(key=lambda c: (-c.score, c.index))
+        report.finalists = finalists[:top_k]
+
+        for candidate in report.finalists[:free_slots]:
+            matrix = self._backtester.run_scenario_backtest(
+                strategy_id, candidate.parameter_overrides, list(scenario_slices), strategy_instance
+            )
+            outcome = self._hunter.try_promote_mutant(matrix, candidate.parameter_overrides)
+            report.promotions.append({**outcome, "candidate": candidate.index, "score": matrix.overall_score})
+
+        logger.info(
+            "[ALPHASEARCH] strategy=%s candidates=%d evaluations=%d best=%.4f promoted=%d",
+            strategy_id,
+            report.candidates,
+            report.evaluations,
+            report.finalists[0].score if report.finalists else 0.0,
+            sum(1 for p in report.promotions if p["promoted"]),
+        )
+        return report
+
+    def plan_brackets(self, population_size: int, max_bars: int) -> List[Tuple[int, List[int]]]:
+        """
+        Brackets Hyperband como (n_candidatos, presupuestos por rung).
+
+        El bracket más agresivo arranca ``population_size`` candidatos con
+        ~max_bars/eta^s barras; el más conservador evalúa pocos con todo el histórico.
+        Cada rung multiplica las barras por eta; el último siempre usa ``max_bars``.
+        """
+        s_max = 0
+        while max_bars / self._eta ** (s_max + 1) >= self._min_bars:
+            s_max += 1
+
+        def budgets(s: int) -> List[int]:
+            return [max(3, int(max_bars / self._eta ** (s - i))) for i in range(s + 1)]
+
+        if not self._hyperband:
+            return [(population_size, budgets(s_max))]
+        return [
+            (
+                max(1, math.ceil(population_size * (s_max + 1) / ((s + 1) * self._eta ** (s_max - s)))),
+                budgets(s),
+            )
+            for s in range(s_max, -1, -1)
+        ]
+
+    # ── Private helpers ───────────────────────────────────────────────────────
+
+    def _spawn(
+        self, strategy_id: str, parameter_overrides: Dict[str, Any], rng: random.Random, index: int
+    ) -> SearchCandidate:
+        mutant = self._hunter.mutate_parameters(
+            strategy_id, parameter_overrides, seed=rng.getrandbits(32)
+        )
+        return SearchCandidate(
+            index=index,
+            parameter_overrides=mutant["parameter_overrides"],
+            trace_id=mutant["trace_id"],
+        )
+
+    def _successive_halving(
+        self,
+        population: List[SearchCandidate],
+        budgets: List[int],
+        evaluate: Callable[[List[EvalTask]], List[float]],
+        report: AlphaSearchReport,
+    ) -> List[SearchCandidate]:
+        survivors = population
+        for rung, bars in enumerate(budgets):
+            scores = evaluate([(c.parameter_overrides, bars) for c in survivors])
+            report.evaluations += len(survivors)
+            for candidate, score in zip(survivors, scores):
+                candidate.score, candidate.bars = score, bars
+            survivors = sorted(survivors, key=lambda c: (-c.score, c.index))
+            if rung < len(budgets) - 1:
+                survivors = survivors[:max(1, len(survivors) // self._eta)]
+        return survivors
+
+    @contextmanager
+    def _evaluator(
+        self, scenario_slices: Sequence[ScenarioSlice], strategy_instance: Optional[Any]
+    ) -> Iterator[Callable[[List[EvalTask]], List[float]]]:
+        if self._max_workers == 0:
+            evaluator = _SliceEvaluator(scenario_slices, strategy_instance)
+            yield lambda tasks: [evaluator(task) for task in tasks]
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context(self._mp_start_method),
+            initializer=_init_worker,
+            initargs=(list(scenario_slices), strategy_instance),
+        ) as pool:
+            workers = self._max_workers or os.cpu_count() or 1
+            yield lambda tasks: list(pool.map(
+                _evaluate_in_worker, tasks, chunksize=max(1, len(tasks) // (workers * 4))
+            ))
@@ -2,13 +2,21 @@ import os
 from fastapi import Depends, HTTPException, WebSocket, WebSocketException, status, Request, Cookie, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from core_brain.services.auth_service import AuthService
+from core_brain.api.dependencies.auth_cache import get_auth_cache
 from models.auth import TokenPayload
 from typing import Optional
 
 security = HTTPBearer()
 
+_auth_service_instance: Optional[AuthService] = None
+
+
 def get_auth_service() -> AuthService:
-    return AuthService()
+    """Process-wide AuthService: the JWT secret is read from the DB once, not per request."""
+    global _auth_service_instance
+    if _auth_service_instance is None:
+        _auth_service_instance = AuthService()
+    return _auth_service_instance
 
 async def get_current_active_user(
     request: Request,
@@ -31,9 +39,9 @@ async def get_current_active_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # 2. Validar y decodificar JWT
+    # 2. Validar y decodificar JWT (cache de claims verificados + revocaciones)
     try:
-        token_data = auth_service.decode_token(token)
+        token_data = get_auth_cache().verify(token, auth_service)
         
         if token_data is None:
             raise HTTPException(
@@ -94,7 +102,7 @@ async def get_ws_user(
     if not token_str:
         raise WebSocketException(code=1008, reason="Not authenticated")
 
-    token_data = auth_service.decode_token(token_str)
+    token_data = get_auth_cache().verify(token_str, auth_service)
     if not token_data:
         raise WebSocketException(code=1008, reason="Invalid or expired token")
 
@@ -0,0 +1,226 @@
+"""
+AuthVerificationCache — Verified-claims cache for HTTP and WebSocket auth.
+==========================================================================
+TRACE_ID: PERF-AUTH-VERIFY-CACHE-2026-001
+
+Responsibility:
+  - Hold the claims of JWTs that already passed signature verification,
+    keyed by the token's SHA-256 (the same hash sys_session_tokens stores),
+    until the token's own ``exp``.
+  - Keep an in-memory set of revoked token hashes in sync with
+    sys_session_tokens, so a logged-out token is rejected on every path.
+  - Bounded size (LRU) and hit/miss/eviction/revocation counters.
+
+Architecture:
+  - Process-wide singleton (``get_auth_cache()``) used by
+    ``get_current_active_user`` and ``get_ws_user``.
+  - SessionManager.revoke_session / revoke_all_sessions call ``revoke()`` /
+    ``revoke_user()`` right after their DB update → immediate in this process.
+    Revocations made by other processes arrive through the throttled
+    re-read of sys_session_tokens (``sync_interval_s``). Only the first read
+    runs inline; later ones run on a background thread, so no request waits
+    on the DB.
+  - Entries remember the signing secret they were verified with; a service
+    with another secret (or a test double without one) never gets a hit.
+
+Rule: the cache can only reject earlier than the JWT check, never accept
+something the JWT check would reject — expiry is re-checked on every hit.
+"""
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from models.auth import TokenPayload
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_SYNC_INTERVAL_S = 5.0
+# Revocations with unknown expiry are kept for the longest token lifetime (refresh: 30 days)
+_MAX_TOKEN_LIFETIME_S = 31 * 86400
+
+
+def hash_token(token: str) -> str:
+    """SHA-256 hex digest of a token (sys_session_tokens.token_hash)."""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _default_storage() -> Any:
+    from core_brain.server import _get_storage
+    return _get_storage()
+
+
+def _expiry_epoch(value: Any) -> float:
+    try:
+        parsed = value if isinstance(value, datetime) else datetime.fromisoformat(str(value))
+    except (TypeError, ValueError):
+        return float("inf")  # unparseable expiry: keep the revocation
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+class AuthVerificationCache:
+    """
+    LRU of verified token claims plus the revoked-token set.
+
+    Args:
+        max_entries:       Upper bound of cached tokens (least recently used evicted).
+        sync_interval_s:   Seconds between re-reads of the revoked tokens.
+        storage_resolver:  Returns the StorageManager holding sys_session_tokens.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        sync_interval_s: float = DEFAULT_SYNC_INTERVAL_S,
+        storage_resolver: Optional[Callable[[], Any]] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.sync_interval_s = sync_interval_s
+        self._storage_resolver = storage_resolver or _default_storage
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[TokenPayload, str]]" = OrderedDict()
+        self._revoked: Dict[str, float] = {}  # token_hash → expires_at (epoch)
+        self._next_sync = 0.0
+        self._synced = False
+        self._sync_in_flight = False
+        self.metrics = {"hits": 0, "misses": 0, "evictions": 0, "expired": 0, "revoked_rejections": 0, "syncs": 0}
+
+    # ── Verification ──────────────────────────────────────────────────────────
+
+    def verify(self, token: str, auth_service: Any) -> Optional[TokenPayload]:
+        """
+        Claims of ``token`` if it is valid and not revoked, else None.
+
+        A miss falls through to ``auth_service.decode_token`` (signature + exp).
+        """
+        token_hash = hash_token(token)
+        self._sync_revocations()
+        secret = getattr(auth_service, "secret_key", None)
+        cacheable = isinstance(secret, str)
+        now = time.time()
+        with self._lock:
+            if token_hash in self._revoked:
+                self.metrics["revoked_rejections"] += 1
+                self._entries.pop(token_hash, None)
+                return None
+            entry = self._entries.get(token_hash) if cacheable else None
+            if entry is not None and entry[1] == secret:
+                if entry[0].exp > now:
+                    self._entries.move_to_end(token_hash)
+                    self.metrics["hits"] += 1
+                    return entry[0]
+                del self._entries[token_hash]
+                self.metrics["expired"] += 1
+            self.metrics["misses"] += 1
+
+        payload = auth_service.decode_token(token)
+        if payload is not None and cacheable:
+            with self._lock:
+                self._entries[token_hash] = (payload, secret)
+                self._entries.move_to_end(token_hash)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.metrics["evictions"] += 1
+        return payload
+
+    # ── Revocation ────────────────────────────────────────────────────────────
+
+    def revoke(self, token: str, expires_at: Optional[float] = None) -> None:
+        """Reject ``token`` from now on (logout)."""
+        token_hash = hash_token(token)
+        with self._lock:
+            self._entries.pop(token_hash, None)
+            self._revoked[token_hash] = expires_at if expires_at is not None else time.time() + _MAX_TOKEN_LIFETIME_S
+
+    def revoke_user(self, user_id: str) -> None:
+        """Drop every cached token of ``user_id`` and re-read the revocations now."""
+        with self._lock:
+            for token_hash in [h for h, (payload, _) in self._entries.items() if payload.sub == user_id]:
+                del self._entries[token_hash]
+        self._sync_revocations(force=True)
+
+    def _sync_revocations(self, force: bool = False) -> None:
+        """
+        Re-read sys_session_tokens when due.
+
+        ``force`` and the first read run inline; otherwise the read is handed to a
+        daemon thread (one at a time) and the caller keeps the current set.
+        """
+        now = time.monotonic()
+        if not force and now < self._next_sync:
+            return
+        self._next_sync = now + self.sync_interval_s
+        if force or not self._synced:
+            self._load_revocations()
+            return
+        with self._lock:
+            if self._sync_in_flight:
+                return
+            self._sync_in_flight = True
+        threading.Thread(target=self._load_revocations, name="auth-revocation-sync", daemon=True).start()
+
+    def _load_revocations(self) -> None:
+        try:
+            rows = self._storage_resolver().execute_query(
+                "SELECT token_hash, expires_at FROM sys_session_tokens WHERE revoked = 1 AND expires_at > ?",
+                (datetime.now(timezone.utc),),
+            )
+        except Exception as exc:
+            logger.debug("[AUTH_CACHE] Revocation sync skipped: %s", exc)
+            with self._lock:
+                self._sync_in_flight = False
+            return
+        wall = time.time()
+        revoked = {}
+        for row in rows or []:
+            expires = _expiry_epoch(row["expires_at"])
+            if expires > wall:
+                revoked[row["token_hash"]] = expires
+        with self._lock:
+            # Keep local revocations the DB write may not show yet
+            for token_hash, expires in self._revoked.items():
+                if expires > wall:
+                    revoked.setdefault(token_hash, expires)
+            self._revoked = revoked
+            for token_hash in revoked:
+                self._entries.pop(token_hash, None)
+            self._synced = True
+            self._sync_in_flight = False
+            self.metrics["syncs"] += 1
+
+    # ── Introspection ─────────────────────────────────────────────────────────
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._revoked.clear()
+            self._next_sync = 0.0
+            self._synced = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.metrics["hits"] + self.metrics["misses"]
+            return {
+                **self.metrics,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "revoked_tokens": len(self._revoked),
+                "hit_ratio": round(self.metrics["hits"] / lookups, 4) if lookups else 0.0,
+            }
+
+
+_auth_cache_instance: Optional[AuthVerificationCache] = None
+
+
+def get_auth_cache() -> AuthVerificationCache:
+    """Process-wide verification cache shared by all auth dependencies."""
+    global _auth_cache_instance
+    if _auth_cache_instance is None:
+        _auth_cache_instance = AuthVerificationCache()
+    return _auth_cache_instance
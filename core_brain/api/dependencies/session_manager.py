@@ -19,6 +19,7 @@ from typing import Optional, Dict, Any
 from fastapi import Response, HTTPException, status
 
 from data_vault.storage import StorageManager
+from core_brain.api.dependencies.auth_cache import get_auth_cache
 
 logger = logging.getLogger(__name__)
 
@@ -179,6 +180,8 @@ class SessionManager:
             )
         except Exception as e:
             logger.warning(f"Failed to revoke token: {e}")
+        if token:
+            get_auth_cache().revoke(token)
         
         # Clear cookies
         response.delete_cookie(
@@ -337,6 +340,7 @@ class SessionManager:
             )
         except Exception as e:
             logger.error(f"Failed to revoke all sessions: {e}")
+        get_auth_cache().revoke_user(user_id)
         
         # Clear cookies from current device
         response.delete_cookie(
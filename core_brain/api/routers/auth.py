@@ -22,6 +22,7 @@ from pydantic import BaseModel, EmailStr
 
 from core_brain.services.auth_service import AuthService
 from core_brain.api.dependencies.auth import get_auth_service, get_current_active_user
+from core_brain.api.dependencies.auth_cache import get_auth_cache
 from core_brain.api.dependencies.session_manager import (
     SessionManager,
     get_session_manager,
@@ -487,3 +488,15 @@ async def get_current_user(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to retrieve user"
         )
+
+
+# ============ AUTH CACHE METRICS ============
+@router.get("/cache/stats", response_model=Dict[str, Any])
+async def get_auth_cache_stats(
+    token: TokenPayload = Depends(get_current_active_user)
+) -> Dict[str, Any]:
+    """
+    Hit/miss, eviction and revocation counters of the verified-token cache
+    used by the HTTP and WebSocket auth dependencies.
+    """
+    return get_auth_cache().stats()
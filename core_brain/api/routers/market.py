@@ -13,7 +13,7 @@ from data_vault.storage import StorageManager
 from data_vault.market_db import MarketMixin
 from core_brain.api.dependencies.auth import get_current_active_user
 from core_brain.services.heatmap_service import HeatmapDataService
-from core_brain.infrastructure import get_process_gateway
+from core_brain.infrastructure import LOCAL_IPC_SUPPORTED, LocalSocketGateway, get_process_gateway
 from models.auth import TokenPayload
 from models.signal import MarketRegime
 from models.market import PredatorRadarResponse
@@ -64,13 +64,34 @@ def _get_chart_service(tenant_id: str) -> Any:
     return ChartService(storage=_get_storage(), tenant_id=tenant_id)
 
 
-def _get_heatmap_service(tenant_id: str) -> HeatmapDataService:
+# Espejo del ScanStateBroker compartido por todas las requests de este proceso API
+_scan_state_gateway: Optional[LocalSocketGateway] = None
+
+
+async def _get_scan_state_gateway() -> Optional[LocalSocketGateway]:
+    """Lazy-start the process-wide local IPC mirror (None where Unix sockets are unavailable)."""
+    global _scan_state_gateway
+    if not LOCAL_IPC_SUPPORTED:
+        return None
+    if _scan_state_gateway is None:
+        _scan_state_gateway = LocalSocketGateway()
+        await _scan_state_gateway.start()
+    return _scan_state_gateway
+
+
+def _get_heatmap_service(tenant_id: str, scan_gateway: Optional[LocalSocketGateway] = None) -> HeatmapDataService:
     """
     Lazy-load HeatmapDataService with injected dependencies.
     Follows Dependency Injection pattern from Aethelgard architecture.
+
+    Reads scan state from the local IPC mirror while it is connected to the
+    broker; otherwise from the tenant DB (sys_market_pulse).
     """
     storage = TenantDBFactory.get_storage(tenant_id)
-    gateway = get_process_gateway(storage=storage, db_type="database")
+    if scan_gateway is not None and scan_gateway.connected:
+        gateway = scan_gateway
+    else:
+        gateway = get_process_gateway(storage=storage, db_type="database")
     scanner = _get_scanner()
     return HeatmapDataService(
         process_gateway=gateway,
@@ -109,7 +130,7 @@ async def get_heatmap_data(token: TokenPayload = Depends(get_current_active_user
     """
     try:
         tenant_id = token.sub
-        service = _get_heatmap_service(tenant_id)
+        service = _get_heatmap_service(tenant_id, await _get_scan_state_gateway())
         
         # HeatmapService maneja toda la resiliencia y fallbacks internamente
         heatmap_response = await service.get_heatmap()
@@ -10,6 +10,7 @@ from fastapi import APIRouter, HTTPException, Depends
 
 from core_brain.api.dependencies.auth import get_current_active_user
 from models.auth import TokenPayload
+from data_vault.storage import StorageManager
 from data_vault.tenant_factory import TenantDBFactory
 
 logger = logging.getLogger(__name__)
@@ -289,6 +289,39 @@ async def get_exposure(token: TokenPayload = Depends(get_current_active_user)) -
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/risk/performance")
+async def get_trade_performance(
+    execution_mode: str = "LIVE",
+    strategy_id: Optional[str] = None,
+    symbol: Optional[str] = None,
+    days: Optional[float] = 30,
+    last_n: Optional[int] = None,
+    token: TokenPayload = Depends(get_current_active_user),
+) -> Dict[str, Any]:
+    """
+    Rolling-window trade statistics (win rate, profit factor, Sharpe, max drawdown,
+    per-symbol PnL) for the authenticated tenant, served from the columnar trade cache.
+    """
+    try:
+        storage = TenantDBFactory.get_storage(token.sub)
+        stats = storage.get_trade_performance(
+            execution_mode=execution_mode.upper(),
+            strategy_id=strategy_id,
+            symbol=symbol,
+            days=days,
+            last_n=last_n,
+        )
+        return {
+            "execution_mode": execution_mode.upper(),
+            "window": {"days": days, "last_n": last_n},
+            **stats,
+            "timestamp": datetime.now().isoformat(),
+        }
+    except Exception as e:
+        logger.error(f"Error in /api/risk/performance: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 # ─── HU 4.4: Safety Governor Dry-Run Validation ───────────────────────────────
 
 @router.post("/risk/validate")
@@ -16,7 +16,7 @@ from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 from data_vault.storage import StorageManager
 from data_vault.tenant_factory import TenantDBFactory
 from core_brain.services.strategy_monitor_service import StrategyMonitorService
-from core_brain.circuit_breaker import CircuitBreaker
+from core_brain.circuit_breaker import circuit_breaker_for
 from core_brain.api.dependencies.auth import get_ws_user
 from models.auth import TokenPayload
 
@@ -37,7 +37,7 @@ def _get_or_create_monitor_service(tenant_id: str) -> StrategyMonitorService:
     if tenant_id not in strategy_monitor_services:
         # RULE T1: TenantDBFactory provides isolated storage
         storage = TenantDBFactory.get_storage(tenant_id)
-        circuit_breaker = CircuitBreaker(storage=storage)
+        circuit_breaker = circuit_breaker_for(storage)
         
         monitor = StrategyMonitorService(
             storage=storage,
@@ -652,6 +652,62 @@ async def get_edge_health() -> Dict[str, Any]:
     }
 
 
+# ============ Cycle Latency Endpoints ============
+
+@router.get("/system/latency")
+async def get_cycle_latency(
+    breakdowns: bool = True,
+    token: TokenPayload = Depends(get_current_active_user),
+) -> Dict[str, Any]:
+    """
+    Per-phase latency histograms of the orchestrator cycle (p50/p90/p99/max in ms),
+    with per-symbol / per-strategy breakdowns and the last on-demand profile.
+
+    The orchestrator runs in a separate process and publishes its snapshot to
+    sys_config.cycle_latency_snapshot (see core_brain/latency_tracer.py).
+    """
+    from core_brain.latency_tracer import SNAPSHOT_CONFIG_KEY
+    try:
+        raw = _get_storage().get_sys_config(bypass_cache=True).get(SNAPSHOT_CONFIG_KEY)
+        if raw:
+            snapshot = json.loads(raw) if isinstance(raw, str) else raw
+            if not breakdowns:
+                snapshot = {k: v for k, v in snapshot.items() if k not in ("by_symbol", "by_strategy", "last_profile")}
+            return {"status": "OK", **snapshot}
+    except Exception as exc:
+        logger.warning("[LATENCY] Error reading cycle latency snapshot: %s", exc)
+
+    return {
+        "status": "UNAVAILABLE",
+        "message": "No latency snapshot published yet — the orchestrator may be starting",
+        "spans": {},
+    }
+
+
+@router.post("/system/latency/profile")
+async def request_cycle_profile(
+    sample_interval_ms: float = 5.0,
+    token: TokenPayload = Depends(get_current_active_user),
+) -> Dict[str, Any]:
+    """
+    Request a sampling profile (stack samples + span timeline) of the next
+    orchestrator cycle. The result appears under ``last_profile`` in
+    GET /system/latency once the orchestrator has picked it up.
+    """
+    from core_brain.latency_tracer import PROFILE_REQUEST_CONFIG_KEY
+    if not 1.0 <= sample_interval_ms <= 1000.0:
+        raise HTTPException(status_code=400, detail="sample_interval_ms must be between 1 and 1000")
+    request_id = datetime.now(timezone.utc).isoformat()
+    try:
+        _get_storage().update_sys_config({
+            PROFILE_REQUEST_CONFIG_KEY: {"request_id": request_id, "sample_interval_ms": sample_interval_ms}
+        })
+    except Exception as e:
+        logger.error(f"Error requesting cycle profile: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    return {"success": True, "request_id": request_id, "sample_interval_ms": sample_interval_ms}
+
+
 @router.get("/scanner/status")
 async def get_scanner_status() -> Dict[str, Any]:
     """Returns the current scanner status.
@@ -8,6 +8,11 @@ WebSocket stream for the "Glass Box" UI visualization.
 TRACE_ID: UI-EXEC-FRACTAL-v3-SYNAPSE
 RULE T1: Tenant isolation via TenantDBFactory
 RULE 4.3: All operations try/except protected with graceful degradation
+
+The payload is produced once per tick per tenant by a shared publisher
+(core_brain.api.services.synapse_publisher), not once per connected socket.
+Storage-backed sections are re-queried only when their source tables changed
+(SystemMixin.get_change_tokens, one query per tick).
 """
 
 import logging
@@ -15,16 +20,17 @@ import asyncio
 import json
 import psutil
 from collections import Counter
-from typing import Dict, Any, Set, Optional, List
+from typing import Dict, Any, Set, Optional, List, Tuple, Hashable
 from datetime import datetime, timezone
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
 
 from data_vault.storage import StorageManager
 from data_vault.tenant_factory import TenantDBFactory
 from core_brain.services.strategy_monitor_service import StrategyMonitorService
-from core_brain.circuit_breaker import CircuitBreaker
+from core_brain.circuit_breaker import CircuitBreaker, circuit_breaker_for
 from core_brain.connectivity_orchestrator import ConnectivityOrchestrator
 from core_brain.api.dependencies.auth import get_ws_user
+from core_brain.api.services.synapse_publisher import SectionCache, SynapsePublisherRegistry, TelemetryProducer
 from models.auth import TokenPayload
 
 logger = logging.getLogger(__name__)
@@ -34,6 +40,15 @@ router = APIRouter(tags=["Telemetry"])
 # Active WebSocket connections per tenant (RULE T1: isolated)
 active_synapse_connections: Dict[str, Set[WebSocket]] = {}
 
+# Tables each storage-backed section reads (keys of get_change_tokens())
+_SECTION_SOURCES: Dict[str, Tuple[str, ...]] = {
+    "strategy_array": ("sys_strategies", "sys_signal_ranking"),
+    "risk_buffer": ("sys_config",),
+    "anomalies": ("usr_signal_pipeline",),
+    "signal_funnel": ("sys_config",),
+    "cycle_latency": ("sys_config",),
+}
+
 
 async def _get_system_heartbeat(storage: StorageManager) -> Dict[str, Any]:
     """
@@ -157,16 +172,26 @@ async def _get_risk_buffer(storage: StorageManager) -> Dict[str, Any]:
         }
 
 
-async def _get_anomalies_buffer(storage: StorageManager, limit: int = 25) -> Dict[str, Any]:
+async def _get_anomalies_buffer(
+    storage: StorageManager,
+    limit: int = 25,
+    sections: Optional[SectionCache] = None,
+    token: Optional[Hashable] = None,
+) -> Dict[str, Any]:
     """
     Get latest anomalies/events: last N items + count in last 5 minutes.
     RULE 4.3: Returns empty list on failure.
     Data sourced from sys_anomalies (global) per DEVELOPMENT_GUIDELINES.
+    With ``sections``, the event rows are cached under ``token``; the
+    5-minute count is time-dependent and recomputed on every call.
     """
     try:
         # Get latest anomalies from sys_anomalies (global, accessible to all tenants)
         # This uses generic get_signal_pipeline_history as fallback for recent events
-        anomalies = storage.get_signal_pipeline_history(limit=limit) or []
+        def _load() -> List[Dict[str, Any]]:
+            return storage.get_signal_pipeline_history(limit=limit) or []
+
+        anomalies = await (sections or SectionCache()).get("anomalies", token, _load)
         
         # Transform to anomaly format
         anomaly_list = [
@@ -252,6 +277,26 @@ def _get_resilience_status_snapshot() -> Dict[str, Any]:
         return {"posture": "UNAVAILABLE", "is_healing": False, "narrative": ""}
 
 
+def _get_cycle_latency_summary(storage: StorageManager) -> Dict[str, Any]:
+    """
+    Return the compact per-span latency summary published by the orchestrator
+    (sys_config.cycle_latency_snapshot) — breakdowns stay on GET /system/latency.
+    Fail-open: empty spans when nothing was published yet.
+    """
+    try:
+        from core_brain.latency_tracer import SNAPSHOT_CONFIG_KEY
+        snapshot = (storage.get_sys_config() or {}).get(SNAPSHOT_CONFIG_KEY) or {}
+        if isinstance(snapshot, str):
+            snapshot = json.loads(snapshot)
+        return {
+            "generated_at": snapshot.get("generated_at"),
+            "spans": snapshot.get("spans", {}),
+        }
+    except Exception as exc:
+        logger.debug("[SYNAPSE_WS] cycle latency snapshot skipped: %s", exc)
+        return {"generated_at": None, "spans": {}}
+
+
 def _is_within_minutes(timestamp_str: Optional[str], minutes: int) -> bool:
     """Helper: Check if timestamp is within N minutes."""
     if not timestamp_str:
@@ -264,27 +309,78 @@ def _is_within_minutes(timestamp_str: Optional[str], minutes: int) -> bool:
         return False
 
 
-async def _consolidate_telemetry(tenant_id: str, storage: StorageManager) -> Dict[str, Any]:
+def _section_tokens(storage: StorageManager) -> Dict[str, Optional[Tuple[Any, ...]]]:
+    """
+    Change token per storage-backed section, from one get_change_tokens() read.
+    RULE 4.3: a section whose token cannot be read gets None (always reloaded).
+    """
+    try:
+        tables = storage.get_change_tokens() or {}
+    except Exception as exc:
+        logger.debug("[SYNAPSE_WS] change tokens unavailable: %s", exc)
+        tables = {}
+    tokens: Dict[str, Optional[Tuple[Any, ...]]] = {}
+    for section, sources in _SECTION_SOURCES.items():
+        values = tuple(tables.get(table) for table in sources)
+        tokens[section] = None if None in values else values
+    return tokens
+
+
+async def _consolidate_telemetry(
+    tenant_id: str,
+    storage: StorageManager,
+    circuit_breaker: Optional[CircuitBreaker] = None,
+    sections: Optional[SectionCache] = None,
+) -> Dict[str, Any]:
     """
     Consolidate all telemetry sources into unified JSON payload.
     RULE T1: All data isolated to tenant_id
+    With ``sections`` (one per tenant publisher), storage-backed sections are
+    served from the previous tick while their source tables are unchanged.
     """
-    circuit_breaker = CircuitBreaker(storage=storage)
-    
+    if circuit_breaker is None:
+        circuit_breaker = circuit_breaker_for(storage)
+    if sections is None:
+        sections, tokens = SectionCache(), {}  # one-shot: every section loads
+    else:
+        tokens = _section_tokens(storage)
+
+    async def section(name: str, load: Any) -> Any:
+        return await sections.get(name, tokens.get(name), load)
+
     return {
         "trace_id": f"SYNAPSE-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}-{tenant_id[:8]}",
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "tenant_id": tenant_id,
         "system_heartbeat": await _get_system_heartbeat(storage),
         "active_scanners": await _get_active_scanners(storage),
-        "strategy_array": await _get_strategy_array(tenant_id, storage, circuit_breaker),
-        "risk_buffer": await _get_risk_buffer(storage),
-        "anomalies": await _get_anomalies_buffer(storage),
-        "signal_funnel": await _get_signal_funnel_summary(storage),
+        "strategy_array": await section(
+            "strategy_array", lambda: _get_strategy_array(tenant_id, storage, circuit_breaker)),
+        "risk_buffer": await section("risk_buffer", lambda: _get_risk_buffer(storage)),
+        "anomalies": await _get_anomalies_buffer(
+            storage, sections=sections, token=tokens.get("anomalies")),
+        "signal_funnel": await section("signal_funnel", lambda: _get_signal_funnel_summary(storage)),
         "resilience_status": _get_resilience_status_snapshot(),
+        "cycle_latency": await section("cycle_latency", lambda: _get_cycle_latency_summary(storage)),
     }
 
 
+def _tenant_telemetry_producer(tenant_id: str) -> TelemetryProducer:
+    """Producer for one tenant's publisher: storage, CircuitBreaker and section cache resolved once."""
+    storage = TenantDBFactory.get_storage(tenant_id)
+    circuit_breaker = circuit_breaker_for(storage)
+    sections = SectionCache()
+
+    async def produce() -> Dict[str, Any]:
+        return await _consolidate_telemetry(tenant_id, storage, circuit_breaker, sections)
+
+    return produce
+
+
+# Shared per-tenant publishers: one consolidation per tick regardless of open sockets
+synapse_publishers = SynapsePublisherRegistry(_tenant_telemetry_producer)
+
+
 async def _broadcast_telemetry(tenant_id: str, payload: Dict[str, Any]) -> None:
     """
     Broadcast telemetry payload to all connected clients of a tenant.
@@ -321,7 +417,7 @@ async def websocket_synapse(
     1. Client connects (browser auto-sends HttpOnly cookie via WebSocket)
     2. get_ws_user validates token before handler body runs
     3. Server sends initial consolidated telemetry
-    4. Server emits updates every 1 second
+    4. Server emits updates every 1 second (frames shared by all tenant sockets)
     5. Server accepts client messages (ping/pong for keepalive)
 
     RULE T1: Tenant isolation enforced
@@ -341,32 +437,37 @@ async def websocket_synapse(
         active_synapse_connections[tenant_id] = set()
     active_synapse_connections[tenant_id].add(websocket)
 
-    # Get storage for this tenant (RULE T1: isolated)
-    storage = TenantDBFactory.get_storage(tenant_id)
-    is_connected = True
-
+    # Subscribe to the tenant's shared publisher (RULE T1: isolated).
+    # The first subscriber starts it; the initial frame arrives on its first tick.
     try:
-        # Send initial telemetry
-        try:
-            initial_payload = await _consolidate_telemetry(tenant_id, storage)
-            await websocket.send_json(initial_payload)
-            logger.debug(f"[SYNAPSE_WS] Sent initial telemetry to {tenant_id}")
-        except Exception as exc:
-            logger.error(f"[SYNAPSE_WS] Error sending initial telemetry: {exc}")
-            await websocket.send_json({
-                "type": "error",
-                "message": "Failed to retrieve telemetry",
-                "timestamp": datetime.now(timezone.utc).isoformat()
-            })
+        _, subscriber = synapse_publishers.subscribe(tenant_id)
+    except Exception as exc:
+        logger.error(f"[SYNAPSE_WS] Could not subscribe {tenant_id} to telemetry: {exc}")
+        active_synapse_connections[tenant_id].discard(websocket)
+        return
+
+    receive_task: Optional[asyncio.Task] = None
+    frame_task: Optional[asyncio.Task] = None
 
-        # Main loop: periodic updates + listen for client messages
-        while is_connected:
-            try:
-                # Wait 1 second or until client sends message
-                message = await asyncio.wait_for(
-                    websocket.receive_text(),
-                    timeout=1.0
-                )
+    try:
+        # Main loop: forward published frames + listen for client messages
+        while True:
+            if receive_task is None:
+                receive_task = asyncio.ensure_future(websocket.receive_text())
+            if frame_task is None:
+                frame_task = asyncio.ensure_future(subscriber.queue.get())
+
+            done, _ = await asyncio.wait(
+                {receive_task, frame_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if receive_task in done:
+                task, receive_task = receive_task, None
+                try:
+                    message = task.result()
+                except WebSocketDisconnect:
+                    logger.info(f"[SYNAPSE_WS] Client disconnected: {tenant_id}")
+                    break
                 if message.strip() in ['ping', '']:
                     await websocket.send_json({
                         "type": "pong",
@@ -374,41 +475,27 @@ async def websocket_synapse(
                     })
                     logger.debug(f"[SYNAPSE_WS] Ping/pong from {tenant_id}")
 
-            except asyncio.TimeoutError:
-                pass  # Timeout — send periodic update below
-
-            except WebSocketDisconnect:
-                is_connected = False
-                logger.info(f"[SYNAPSE_WS] Client disconnected: {tenant_id}")
-                break
-
-            # Send telemetry update (1 Hz)
-            try:
-                payload = await _consolidate_telemetry(tenant_id, storage)
-                await websocket.send_json(payload)
-                logger.debug(f"[SYNAPSE_WS] Sent telemetry update to {tenant_id}")
-
-            except WebSocketDisconnect:
-                is_connected = False
-                break
-
-            except Exception as exc:
-                # RULE 4.3: Log error but don't crash
-                logger.error(f"[SYNAPSE_WS] Error sending telemetry: {exc}")
+            if frame_task in done:
+                task, frame_task = frame_task, None
                 try:
-                    await websocket.send_json({
-                        "type": "error",
-                        "message": f"Error retrieving telemetry: {str(exc)[:100]}",
-                        "timestamp": datetime.now(timezone.utc).isoformat()
-                    })
-                except Exception:
+                    await websocket.send_text(task.result())
+                    logger.debug(f"[SYNAPSE_WS] Sent telemetry update to {tenant_id}")
+                except WebSocketDisconnect:
+                    break
+                except Exception as exc:
+                    # RULE 4.3: Log error but don't crash
+                    logger.error(f"[SYNAPSE_WS] Error sending telemetry: {exc}")
                     break
 
     except Exception as exc:
         logger.error(f"[SYNAPSE_WS] Unexpected error: {exc}", exc_info=True)
 
     finally:
+        for task in (receive_task, frame_task):
+            if task is not None and not task.done():
+                task.cancel()
         try:
+            synapse_publishers.unsubscribe(tenant_id, subscriber)
             if tenant_id in active_synapse_connections:
                 active_synapse_connections[tenant_id].discard(websocket)
                 if not active_synapse_connections[tenant_id]:
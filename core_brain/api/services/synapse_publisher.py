@@ -0,0 +1,221 @@
+"""
+Synapse Publisher - Shared per-tenant producer for the /ws/v3/synapse stream.
+
+TRACE_ID: UI-SYNAPSE-SHARED-PUBLISHER-2026-001
+
+Responsibility:
+  - One telemetry task per tenant, alive only while the tenant has at least
+    one subscriber: the consolidated payload is built once per tick.
+  - Each frame is serialized once and delivered to every subscriber through
+    a bounded, non-blocking queue (slow clients drop stale frames, never
+    stall the producer or other clients).
+  - Sections whose content did not change since the previous tick reuse
+    their already-serialized JSON fragment.
+  - SectionCache lets the producer skip a section's storage queries while
+    the section's change token (row counts, max ids, write counters) is unchanged.
+
+Design principles:
+  - Full frames on the wire: clients replace state wholesale, so unchanged
+    sections keep their previous fragment (and timestamp) instead of being omitted.
+  - Telemetry DB load is independent of the number of open dashboards.
+  - RULE T1: publishers are keyed by tenant_id, frames never cross tenants.
+  - RULE 4.3: producer errors become an error frame; the task keeps running.
+
+Extracted from routers/telemetry.py to maintain hygiene of mass (<500 lines per file).
+"""
+import asyncio
+import inspect
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+TelemetryProducer = Callable[[], Awaitable[Dict[str, Any]]]
+
+# Frames buffered per subscriber before the oldest one is dropped
+SUBSCRIBER_QUEUE_SIZE = 4
+
+# Section keys ignored when deciding whether a section changed
+_VOLATILE_KEYS = ("timestamp",)
+
+# Upper bound on how long a cached section is served without a reload
+SECTION_MAX_AGE_SECONDS = 30.0
+
+
+def _dumps(value: Any) -> str:
+    """Same compact encoding as WebSocket.send_json."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _comparable(section: Any) -> Any:
+    if isinstance(section, dict):
+        return {k: v for k, v in section.items() if k not in _VOLATILE_KEYS}
+    return section
+
+
+class SectionCache:
+    """
+    Last value of each payload section, keyed by the section's change token.
+
+    ``get`` runs the loader only when the token differs from the one the
+    cached value was loaded under, when there is no token (None: unknown,
+    always reload), or when the value is older than ``max_age`` seconds.
+    Values carrying an ``error`` key are never cached.
+    """
+
+    def __init__(self, max_age: float = SECTION_MAX_AGE_SECONDS) -> None:
+        self.max_age = max_age
+        self._entries: Dict[str, Tuple[Hashable, float, Any]] = {}
+        self.stats: Dict[str, int] = {"hits": 0, "loads": 0}
+
+    async def get(self, key: str, token: Optional[Hashable], load: Callable[[], Any]) -> Any:
+        entry = self._entries.get(key)
+        now = time.monotonic()
+        if token is not None and entry is not None and entry[0] == token and now - entry[1] < self.max_age:
+            self.stats["hits"] += 1
+            return entry[2]
+        value = load()
+        if inspect.isawaitable(value):
+            value = await value
+        self.stats["loads"] += 1
+        if token is not None and not (isinstance(value, dict) and "error" in value):
+            self._entries[key] = (token, now, value)
+        else:
+            self._entries.pop(key, None)
+        return value
+
+
+class SynapseSubscriber:
+    """One connected socket: a bounded queue of pre-serialized frames."""
+
+    __slots__ = ("queue", "dropped")
+
+    def __init__(self, maxsize: int = SUBSCRIBER_QUEUE_SIZE) -> None:
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def offer(self, frame: str) -> None:
+        """Non-blocking enqueue; a full queue loses its oldest frame."""
+        while True:
+            try:
+                self.queue.put_nowait(frame)
+                return
+            except asyncio.QueueFull:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except asyncio.QueueEmpty:
+                    pass
+
+
+class TenantTelemetryPublisher:
+    """
+    Produces the synapse payload for one tenant and fans it out.
+
+    Usage:
+        subscriber = publisher.subscribe()
+        frame = await subscriber.queue.get()
+        publisher.unsubscribe(subscriber)
+    """
+
+    def __init__(self, tenant_id: str, producer: TelemetryProducer, interval: float = 1.0) -> None:
+        self.tenant_id = tenant_id
+        self.producer = producer
+        self.interval = interval
+        self.subscribers: Set[SynapseSubscriber] = set()
+        self.latest_frame: Optional[str] = None
+        self._fragments: Dict[str, Tuple[Any, str]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self.stats: Dict[str, int] = {"ticks": 0, "errors": 0, "sections_reused": 0}
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self) -> SynapseSubscriber:
+        subscriber = SynapseSubscriber()
+        self.subscribers.add(subscriber)
+        if self.latest_frame is not None:
+            subscriber.offer(self.latest_frame)
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run(), name=f"synapse-publisher-{self.tenant_id}")
+        return subscriber
+
+    def unsubscribe(self, subscriber: SynapseSubscriber) -> None:
+        self.subscribers.discard(subscriber)
+        if not self.subscribers and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self._fragments.clear()
+            self.latest_frame = None
+
+    async def _run(self) -> None:
+        while self.subscribers:
+            started = time.monotonic()
+            await self.tick()
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    async def tick(self) -> None:
+        """Build, serialize and fan out one frame."""
+        try:
+            payload = await self.producer()
+            frame = self.encode(payload)
+            self.latest_frame = frame
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self.stats["errors"] += 1
+            logger.error(f"[SYNAPSE_WS] Error building telemetry for {self.tenant_id}: {exc}")
+            frame = _dumps({
+                "type": "error",
+                "message": f"Error retrieving telemetry: {str(exc)[:100]}",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            })
+        self.stats["ticks"] += 1
+        for subscriber in list(self.subscribers):
+            subscriber.offer(frame)
+
+    def encode(self, payload: Dict[str, Any]) -> str:
+        """Serialize payload, reusing fragments of sections unchanged since the last tick."""
+        parts = []
+        fragments: Dict[str, Tuple[Any, str]] = {}
+        for key, value in payload.items():
+            comparable = _comparable(value)
+            cached = self._fragments.get(key)
+            if cached is not None and cached[0] == comparable:
+                fragment = cached[1]
+                self.stats["sections_reused"] += 1
+            else:
+                fragment = _dumps(value)
+            fragments[key] = (comparable, fragment)
+            parts.append(f"{_dumps(key)}:{fragment}")
+        self._fragments = fragments
+        return "{" + ",".join(parts) + "}"
+
+
+class SynapsePublisherRegistry:
+    """Per-tenant publishers (RULE T1), created on first subscriber and dropped with the last."""
+
+    def __init__(self, producer_factory: Callable[[str], TelemetryProducer], interval: float = 1.0) -> None:
+        self.producer_factory = producer_factory
+        self.interval = interval
+        self.publishers: Dict[str, TenantTelemetryPublisher] = {}
+
+    def subscribe(self, tenant_id: str) -> Tuple[TenantTelemetryPublisher, SynapseSubscriber]:
+        publisher = self.publishers.get(tenant_id)
+        if publisher is None:
+            publisher = TenantTelemetryPublisher(tenant_id, self.producer_factory(tenant_id), self.interval)
+            self.publishers[tenant_id] = publisher
+        return publisher, publisher.subscribe()
+
+    def unsubscribe(self, tenant_id: str, subscriber: SynapseSubscriber) -> None:
+        publisher = self.publishers.get(tenant_id)
+        if publisher is None:
+            return
+        publisher.unsubscribe(subscriber)
+        if not publisher.subscribers:
+            del self.publishers[tenant_id]
+            logger.info(f"[SYNAPSE_WS] Publisher stopped for {tenant_id} (no subscribers)")
@@ -0,0 +1,487 @@
+"""
+Bar Aggregator - Multi-timeframe roll-up from a single base stream per symbol
+Trace_ID: PERF-BAR-ROLLUP-2026-001
+
+Higher timeframes are pure aggregations of the finest one, so instead of one
+provider history query per symbol|timeframe (M1, M5, M15, H1, H4 ...) the
+DataProviderManager fetches only the base stream (M1 bars, or ticks) per symbol
+and this engine rolls it up incrementally into every configured timeframe:
+
+- Each configured timeframe keeps a ring of closed bars plus the aggregate of
+  the closed base bars of the current bucket; the forming bar is that aggregate
+  merged with the (still revisable) forming base bar.
+- Bucket boundaries are computed in broker server time (``server_utc_offset_hours``)
+  so H4/D1 open where the broker's native bars open. The offset applies only to
+  UTC streams: MT5 ``time`` is already broker server time, so it must stay 0
+  for MT5. W1 opens on Sunday 00:00
+  like MT5. Buckets are created by data only: weekend and holiday gaps never
+  produce empty bars, and a bucket whose end has passed is sealed by time
+  (``seal()``) even if no later bar arrived (Friday close).
+- ``fold_weekend`` moves Saturday/Sunday D1 buckets into the next Monday, for
+  UTC brokers that print a short Sunday session bar.
+- Closed history of a timeframe is seeded once from broker-native bars; the
+  current bucket is rebuilt from buffered base bars, so seeding never mixes a
+  native forming bar with rolled-up data.
+- ``reconcile()`` compares closed roll-up bars against broker-native bars.
+
+Design principles:
+- Entirely in-memory, pure Python: no pandas on the ingest path.
+- Timestamps are epoch seconds internally (naive datetimes are read as-is, as
+  if UTC); output frames keep the exact ``time`` dtype of the base stream
+  (naive datetimes for MT5, epoch numbers or tz-aware datetimes otherwise), so
+  roll-ups and native bars of the same provider are interchangeable.
+- Not thread-safe by itself: callers serialize per symbol with ``lock_for()``.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+TIMEFRAME_SECONDS: Dict[str, int] = {
+    "M1": 60, "M5": 300, "M15": 900, "M30": 1800,
+    "H1": 3600, "H4": 14400, "D1": 86400, "W1": 604800,
+}
+
+OUTPUT_COLUMNS: List[str] = ["time", "open", "high", "low", "close", "volume"]
+
+_DAY = 86400
+_WEEK = 7 * _DAY
+_SUNDAY_EPOCH_OFFSET = 3 * _DAY  # 1970-01-01 was a Thursday; the first Sunday is 3 days later
+
+# Bar layout: [time, open, high, low, close, volume]
+Bar = List[float]
+
+
+def _merge(into: Bar, bar: Sequence[float]) -> None:
+    """Fold a later bar of the same bucket into an aggregate (in place)."""
+    if bar[2] > into[2]:
+        into[2] = bar[2]
+    if bar[3] < into[3]:
+        into[3] = bar[3]
+    into[4] = bar[4]
+    into[5] += bar[5]
+
+
+def _to_epoch_seconds(values: pd.Series) -> List[int]:
+    """Normalize a ``time`` column (epoch numbers or datetimes) to epoch seconds."""
+    if pd.api.types.is_numeric_dtype(values):
+        return [int(v) for v in values]
+    stamps = pd.to_datetime(values, utc=True)
+    return ((stamps - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(seconds=1)).astype("int64").tolist()
+
+
+def _volumes(frame: Any) -> List[float]:
+    """``volume`` column, else MT5/generic ``tick_volume``, else zeros."""
+    column = "volume" if "volume" in frame else "tick_volume" if "tick_volume" in frame else None
+    return frame[column].tolist() if column else [0.0] * len(frame)
+
+
+def to_output_frame(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Shape a provider ``fetch_ohlc`` frame like ``BarAggregator.frame()``: exactly
+    ``OUTPUT_COLUMNS``, ``volume`` taken from ``tick_volume`` when that is what
+    the provider reports. Native and rolled-up frames then share one column set.
+    """
+    shaped = frame[["time", "open", "high", "low", "close"]].reset_index(drop=True)
+    shaped["volume"] = [float(v) for v in _volumes(frame)]
+    return shaped
+
+
+def _from_epoch_seconds(seconds: pd.Series, dtype: Any) -> pd.Series:
+    """Inverse of ``_to_epoch_seconds``: epoch seconds back to the base stream's ``time`` dtype."""
+    if dtype is None or pd.api.types.is_numeric_dtype(dtype):
+        return seconds if dtype is None else seconds.astype(dtype)
+    stamps = pd.to_datetime(seconds, unit="s", utc=True)
+    tz = getattr(dtype, "tz", None)
+    stamps = stamps.dt.tz_convert(tz) if tz is not None else stamps.dt.tz_localize(None)
+    return stamps.astype(dtype)
+
+
+@dataclass
+class BarReconciliation:
+    """Result of comparing rolled-up closed bars with broker-native bars."""
+    symbol: str
+    timeframe: str
+    compared: int = 0
+    mismatches: List[Dict[str, Any]] = field(default_factory=list)
+    missing: List[int] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches and not self.missing
+
+
+@dataclass
+class _TimeframeBars:
+    """Roll-up state of one symbol|timeframe."""
+    closed: Deque[Tuple[float, ...]]
+    partial: Optional[Bar] = None      # closed base bars of the current bucket
+    partial_bucket: Optional[int] = None
+
+
+@dataclass
+class _SymbolBars:
+    """Base stream state of one symbol."""
+    history: Deque[Tuple[float, ...]]  # committed base bars (for seeding)
+    forming: Optional[Bar] = None      # latest base bar, still revisable
+    watermark: Optional[int] = None    # time of the last committed base bar
+    time_dtype: Any = None             # dtype of the base stream's ``time`` column
+    frames: Dict[str, _TimeframeBars] = field(default_factory=dict)
+
+
+class BarAggregator:
+    """
+    Incremental tick/M1 → multi-timeframe bar engine.
+
+    Args:
+        timeframes: Timeframes to roll up (those coarser than the base).
+        base_timeframe: Resolution of the ingested stream (ticks are bucketed into it).
+        server_utc_offset_hours: Broker server time offset of a UTC base stream; anchors
+            H4/D1/W1 buckets. Keep 0 for MT5, whose bar times are already server time.
+        fold_weekend: Fold Saturday/Sunday D1 buckets into the following Monday.
+        capacity: Closed bars kept per timeframe.
+        base_refresh_seconds: Minimum interval between base-stream fetches per symbol.
+        reconcile_interval_seconds: Interval between native-bar reconciliations per symbol|timeframe.
+        reconcile_bars: Native bars fetched for each reconciliation.
+    """
+
+    def __init__(
+        self,
+        timeframes: Iterable[str],
+        base_timeframe: str = "M1",
+        server_utc_offset_hours: float = 0.0,
+        fold_weekend: bool = False,
+        capacity: int = 1000,
+        base_refresh_seconds: float = 1.0,
+        reconcile_interval_seconds: float = 900.0,
+        reconcile_bars: int = 50,
+    ) -> None:
+        self.base_timeframe = base_timeframe.upper()
+        if self.base_timeframe not in TIMEFRAME_SECONDS:
+            raise ValueError(f"Unsupported base timeframe: {base_timeframe}")
+        self.base_step = TIMEFRAME_SECONDS[self.base_timeframe]
+
+        self.timeframes: Tuple[str, ...] = tuple(dict.fromkeys(
+            tf.upper() for tf in timeframes
+            if tf.upper() in TIMEFRAME_SECONDS and TIMEFRAME_SECONDS[tf.upper()] > self.base_step
+        ))
+        self.offset = int(server_utc_offset_hours * 3600)
+        self.fold_weekend = fold_weekend
+        self.capacity = capacity
+        self.base_refresh_seconds = base_refresh_seconds
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self.reconcile_bars = reconcile_bars
+
+        # Base bars needed to rebuild the widest current bucket when seeding
+        # (and to serve the base timeframe itself)
+        widest = max((TIMEFRAME_SECONDS[tf] for tf in self.timeframes), default=self.base_step)
+        if fold_weekend and widest == _DAY:
+            widest = 3 * _DAY
+        self.history_capacity = max(capacity, 2 * widest // self.base_step)
+
+        self._symbols: Dict[str, _SymbolBars] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    # ── Public API ────────────────────────────────────────────────────────────
+
+    def serves(self, timeframe: str) -> bool:
+        """True when ``timeframe`` is the base stream or one of its roll-ups."""
+        tf = timeframe.upper()
+        return tf == self.base_timeframe or tf in self.timeframes
+
+    def lock_for(self, symbol: str) -> threading.Lock:
+        """Per-symbol lock: concurrent timeframe requests share one base fetch."""
+        with self._locks_guard:
+            return self._locks.setdefault(symbol, threading.Lock())
+
+    def watermark(self, symbol: str) -> Optional[int]:
+        """Open time of the latest base bar seen (forming or committed)."""
+        state = self._symbols.get(symbol)
+        if state is None:
+            return None
+        return int(state.forming[0]) if state.forming else state.watermark
+
+    def is_seeded(self, symbol: str, timeframe: str) -> bool:
+        tf = timeframe.upper()
+        state = self._symbols.get(symbol)
+        if state is None:
+            return False
+        return tf == self.base_timeframe or tf in state.frames
+
+    def bucket_start(self, ts: int, timeframe: str) -> int:
+        """Open time (epoch seconds, UTC) of the ``timeframe`` bucket containing ``ts``."""
+        step = TIMEFRAME_SECONDS[timeframe]
+        local = ts + self.offset
+        if step == _WEEK:
+            start = local - (local - _SUNDAY_EPOCH_OFFSET) % _WEEK
+        else:
+            start = local - local % step
+            if step == _DAY and self.fold_weekend:
+                weekday = (start // _DAY + 3) % 7  # Monday == 0
+                if weekday >= 5:
+                    start += (7 - weekday) * _DAY
+        return start - self.offset
+
+    def reset(self, symbol: str, timeframe: Optional[str] = None) -> None:
+        """Drop a symbol's state (or one timeframe's roll-up, forcing a reseed)."""
+        if timeframe is None:
+            self._symbols.pop(symbol, None)
+            return
+        state = self._symbols.get(symbol)
+        if state is not None:
+            state.frames.pop(timeframe.upper(), None)
+
+    def continues(self, symbol: str, frame: Any) -> bool:
+        """
+        True when ``frame`` overlaps the buffered base stream (or nothing is
+        buffered yet), i.e. ``ingest_bars`` will not reset the symbol's roll-ups.
+        """
+        if frame is None or len(frame) == 0:
+            return True
+        return self._continues(symbol, _to_epoch_seconds(frame["time"].iloc[:1])[0])
+
+    def ingest_bars(self, symbol: str, frame: Any) -> int:
+        """
+        Ingest a base-timeframe OHLC frame (oldest → newest, ``time`` column).
+
+        The last bar is treated as forming (it may be revised by the next fetch).
+        A frame that does not overlap the previous one leaves a hole in the base
+        stream, so the symbol's roll-ups are dropped and reseeded.
+
+        Returns:
+            Number of base bars that were new or revised.
+        """
+        if frame is None or len(frame) == 0:
+            return 0
+        times = _to_epoch_seconds(frame["time"])
+        columns = [frame[c].tolist() for c in ("open", "high", "low", "close")]
+        volumes = _volumes(frame)
+
+        if not self._continues(symbol, times[0]):
+            logger.info("[BAR-AGG] %s base stream gap after %s — reseeding roll-ups",
+                        symbol, self.watermark(symbol))
+            self.reset(symbol)
+
+        state = self._state(symbol)
+        state.time_dtype = frame["time"].dtype
+        applied = 0
+        for i, ts in enumerate(times):
+            if self._is_committed(state, ts):
+                continue
+            self._apply_base(state, [ts, float(columns[0][i]), float(columns[1][i]),
+                                     float(columns[2][i]), float(columns[3][i]), float(volumes[i])])
+            applied += 1
+        return applied
+
+    def ingest_tick(self, symbol: str, ts: float, price: float, volume: float = 1.0) -> None:
+        """Fold one trade/quote into the forming base bar."""
+        state = self._state(symbol)
+        bar_time = int(ts) - int(ts) % self.base_step
+        forming = state.forming
+        if forming is not None and forming[0] == bar_time:
+            _merge(forming, (bar_time, price, price, price, price, volume))
+            return
+        if self._is_committed(state, bar_time):
+            return  # late tick for a committed bar
+        self._apply_base(state, [bar_time, price, price, price, price, volume])
+
+    def seed(self, symbol: str, timeframe: str, native: Any = None) -> bool:
+        """
+        Start rolling up ``timeframe`` for ``symbol``.
+
+        With broker-native bars, those before the current bucket become the
+        closed history and the current bucket is rebuilt from buffered base
+        bars; returns False (timeframe left unseeded) when the buffer does not
+        reach back to the start of that bucket. Without native bars (tick-only
+        feeds) the whole buffered base stream is rolled up as history.
+        """
+        tf = timeframe.upper()
+        state = self._symbols.get(symbol)
+        if tf not in self.timeframes or state is None or state.forming is None:
+            return False
+
+        bars = _TimeframeBars(closed=deque(maxlen=self.capacity))
+        if native is None:
+            for base in state.history:
+                self._fold_partial(bars, self.bucket_start(int(base[0]), tf), base)
+            state.frames[tf] = bars
+            return True
+        if len(native) == 0:
+            return False
+
+        current = self.bucket_start(int(state.forming[0]), tf)
+        first = state.history[0][0] if state.history else state.forming[0]
+        if self.bucket_start(int(first), tf) >= current and first != current:
+            return False
+
+        times = _to_epoch_seconds(native["time"])
+        volume = _volumes(native)
+        rows = zip(times, native["open"].tolist(), native["high"].tolist(),
+                   native["low"].tolist(), native["close"].tolist(), volume)
+        for ts, o, h, l, c, v in rows:
+            if ts < current:
+                bars.closed.append((ts, float(o), float(h), float(l), float(c), float(v)))
+        for base in state.history:
+            if self.bucket_start(int(base[0]), tf) == current:
+                self._fold_partial(bars, current, base)
+        state.frames[tf] = bars
+        return True
+
+    def seal(self, symbol: str, now: float) -> None:
+        """Close every bucket whose end is at or before ``now`` (epoch seconds, stream clock)."""
+        state = self._symbols.get(symbol)
+        if state is None or state.forming is None:
+            return
+        if state.forming[0] + self.base_step <= now:
+            self._commit_base(state)
+        for tf, bars in state.frames.items():
+            if bars.partial is not None and self._bucket_end(bars.partial_bucket, tf) <= now:
+                bars.closed.append(tuple(bars.partial))
+                bars.partial, bars.partial_bucket = None, None
+
+    def forming_bar(self, symbol: str, timeframe: str) -> Optional[Tuple[float, ...]]:
+        """Current (incomplete) bar of ``timeframe``, or None when its bucket is sealed."""
+        tf = timeframe.upper()
+        state = self._symbols.get(symbol)
+        if state is None:
+            return None
+        forming = state.forming
+        if tf == self.base_timeframe:
+            return tuple(forming) if forming else None
+        bars = state.frames.get(tf)
+        if bars is None:
+            return None
+        if forming is None:
+            return tuple(bars.partial) if bars.partial else None
+        if bars.partial is None:
+            return (self.bucket_start(int(forming[0]), tf), *forming[1:])
+        merged = list(bars.partial)
+        _merge(merged, forming)
+        return tuple(merged)
+
+    def closed_bars(self, symbol: str, timeframe: str, count: Optional[int] = None) -> List[Tuple[float, ...]]:
+        tf = timeframe.upper()
+        state = self._symbols.get(symbol)
+        if state is None:
+            return []
+        source = state.history if tf == self.base_timeframe else (
+            state.frames[tf].closed if tf in state.frames else ())
+        bars = list(source)
+        return bars[-count:] if count else bars
+
+    def frame(self, symbol: str, timeframe: str, count: int, include_forming: bool = True) -> Optional[pd.DataFrame]:
+        """Closed bars plus the forming one, shaped like a provider ``fetch_ohlc`` result."""
+        if not self.is_seeded(symbol, timeframe):
+            return None
+        bars = self.closed_bars(symbol, timeframe)
+        forming = self.forming_bar(symbol, timeframe) if include_forming else None
+        if forming is not None:
+            bars.append(forming)
+        if not bars:
+            return None
+        df = pd.DataFrame(bars[-count:], columns=OUTPUT_COLUMNS)
+        df["time"] = _from_epoch_seconds(df["time"].astype("int64"), self._symbols[symbol].time_dtype)
+        return df
+
+    def reconcile(
+        self,
+        symbol: str,
+        timeframe: str,
+        native: Any,
+        rel_tol: float = 1e-9,
+        abs_tol: float = 1e-9,
+    ) -> BarReconciliation:
+        """
+        Compare closed roll-up bars with broker-native bars of the same period.
+
+        Native bars inside the span of our closed history but absent from it are
+        reported as ``missing`` (bucket misalignment); OHLC differences beyond
+        the tolerance are reported as ``mismatches``. Volume is not compared:
+        brokers mix tick and real volume.
+        """
+        tf = timeframe.upper()
+        report = BarReconciliation(symbol=symbol, timeframe=tf)
+        ours = {int(bar[0]): bar for bar in self.closed_bars(symbol, tf)}
+        if not ours or native is None or len(native) == 0:
+            return report
+        first, last = min(ours), max(ours)
+        times = _to_epoch_seconds(native["time"])
+        rows = zip(times, native["open"].tolist(), native["high"].tolist(),
+                   native["low"].tolist(), native["close"].tolist())
+        for ts, *prices in rows:
+            if ts < first or ts > last:
+                continue
+            bar = ours.get(ts)
+            if bar is None:
+                report.missing.append(ts)
+                continue
+            report.compared += 1
+            for name, theirs, mine in zip(("open", "high", "low", "close"), prices, bar[1:5]):
+                if not math.isclose(mine, theirs, rel_tol=rel_tol, abs_tol=abs_tol):
+                    report.mismatches.append({"time": ts, "field": name, "aggregated": mine, "native": theirs})
+        return report
+
+    # ── Internals ─────────────────────────────────────────────────────────────
+
+    def _state(self, symbol: str) -> _SymbolBars:
+        state = self._symbols.get(symbol)
+        if state is None:
+            state = self._symbols[symbol] = _SymbolBars(history=deque(maxlen=self.history_capacity))
+        return state
+
+    def _continues(self, symbol: str, first_time: int) -> bool:
+        last_seen = self.watermark(symbol)
+        return last_seen is None or first_time <= last_seen
+
+    @staticmethod
+    def _is_committed(state: _SymbolBars, ts: int) -> bool:
+        """True for base bars already folded into the roll-ups (never re-applied)."""
+        if state.forming is not None:
+            return ts < state.forming[0]
+        return state.watermark is not None and ts <= state.watermark
+
+    def _bucket_end(self, start: int, timeframe: str) -> int:
+        return start + TIMEFRAME_SECONDS[timeframe]
+
+    def _apply_base(self, state: _SymbolBars, bar: Bar) -> None:
+        """Replace the forming base bar (same time) or commit it and start a new one."""
+        forming = state.forming
+        if forming is not None and bar[0] == forming[0]:
+            state.forming = bar
+            return
+        if forming is not None:
+            self._commit_base(state)
+        state.forming = bar
+        # A bar of a new bucket proves the previous bucket of every timeframe is complete
+        for tf, bars in state.frames.items():
+            if bars.partial is not None and self.bucket_start(int(bar[0]), tf) != bars.partial_bucket:
+                bars.closed.append(tuple(bars.partial))
+                bars.partial, bars.partial_bucket = None, None
+
+    def _commit_base(self, state: _SymbolBars) -> None:
+        bar = state.forming
+        state.forming = None
+        state.watermark = int(bar[0])
+        state.history.append(tuple(bar))
+        for tf, bars in state.frames.items():
+            self._fold_partial(bars, self.bucket_start(int(bar[0]), tf), bar)
+
+    @staticmethod
+    def _fold_partial(bars: _TimeframeBars, bucket: int, base: Sequence[float]) -> None:
+        if bars.partial is not None and bars.partial_bucket != bucket:
+            bars.closed.append(tuple(bars.partial))
+            bars.partial = None
+        if bars.partial is None:
+            bars.partial = [bucket, *base[1:]]
+            bars.partial_bucket = bucket
+        else:
+            _merge(bars.partial, base)
@@ -0,0 +1,347 @@
+"""
+BrokerStateMirror — One broker round-trip per interval for positions and orders.
+=================================================================================
+TRACE_ID: PERF-BROKER-MIRROR-2026-001
+
+Responsibility:
+  - Fetch open positions and pending orders of a connector in a single
+    refresh, at most once per ``refresh_interval_s``, or on the next read
+    after a trade event (``invalidate()``).
+  - Publish each refresh as an immutable, versioned ``BrokerStateSnapshot``
+    indexed by symbol, ticket, magic and comment.
+  - Diff consecutive snapshots by ticket and notify subscribers with
+    ``BrokerStateChange`` events (opened / closed / modified).
+
+Architecture:
+  - One mirror per connector, attached at bootstrap with
+    ``register_broker_mirror()``. Consumers (MultiTimeframeLimiter,
+    RiskManager, OrderExecutor, SignalDeduplicator, EdgeMonitor) read through
+    ``mirrored_open_positions()`` / ``mirrored_pending_orders()``, which fall
+    back to the connector itself when no mirror is attached — behaviour
+    without a mirror is unchanged.
+  - Components that act on the broker (execute / modify / cancel) call
+    ``invalidate_broker_mirror()`` so the next read sees the new state.
+  - With MT5 every call is serialized through the single DLL thread; the
+    mirror makes broker calls per cycle constant, whatever the number of
+    signals or positions.
+
+Rule: a failed fetch is reported as unavailable (``None`` to consumers),
+never as an empty book — consumers keep their "query failed" branches.
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL_S = 1.0
+
+# Fields that move with every quote; they change the snapshot version but do
+# not by themselves produce a "modified" event.
+_VOLATILE_FIELDS = frozenset({"profit", "price_current", "current_price", "swap"})
+
+_EMPTY: Tuple[Mapping[str, Any], ...] = ()
+
+
+def _freeze(rows: Optional[List[Dict[str, Any]]]) -> Tuple[Mapping[str, Any], ...]:
+    return tuple(MappingProxyType(dict(row)) for row in rows or () if isinstance(row, Mapping))
+
+
+def _index(rows: Tuple[Mapping[str, Any], ...], key: str) -> Mapping[Any, Tuple[Mapping[str, Any], ...]]:
+    grouped: Dict[Any, List[Mapping[str, Any]]] = {}
+    for row in rows:
+        value = row.get(key)
+        if value is not None:
+            grouped.setdefault(value, []).append(row)
+    return MappingProxyType({value: tuple(items) for value, items in grouped.items()})
+
+
+def _stable_view(row: Mapping[str, Any]) -> Dict[str, Any]:
+    return {k: v for k, v in row.items() if k not in _VOLATILE_FIELDS}
+
+
+# ── Snapshot & events ─────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class BrokerStateChange:
+    """A position or order that appeared, disappeared or changed between two snapshots."""
+    kind: str                                   # "position" | "order"
+    action: str                                 # "opened" | "closed" | "modified"
+    ticket: Any
+    symbol: Optional[str]
+    version: int
+    before: Optional[Mapping[str, Any]] = None
+    after: Optional[Mapping[str, Any]] = None
+
+
+@dataclass(frozen=True)
+class BrokerStateSnapshot:
+    """
+    Immutable broker state at ``taken_at`` (monotonic seconds).
+
+    ``positions_ok`` / ``orders_ok`` are False when the last fetch failed;
+    the matching collections are then empty and must not be read as "flat".
+    """
+    version: int
+    taken_at: float
+    positions: Tuple[Mapping[str, Any], ...] = _EMPTY
+    orders: Tuple[Mapping[str, Any], ...] = _EMPTY
+    positions_ok: bool = False
+    orders_ok: bool = False
+    _indexes: Mapping[str, Mapping[Any, Tuple[Mapping[str, Any], ...]]] = field(
+        default_factory=lambda: MappingProxyType({}), repr=False, compare=False
+    )
+
+    @classmethod
+    def build(
+        cls,
+        version: int,
+        taken_at: float,
+        positions: Optional[List[Dict[str, Any]]],
+        orders: Optional[List[Dict[str, Any]]],
+    ) -> "BrokerStateSnapshot":
+        frozen_positions = _freeze(positions)
+        frozen_orders = _freeze(orders)
+        indexes = {
+            f"{name}_by_{key}": _index(rows, key)
+            for name, rows in (("positions", frozen_positions), ("orders", frozen_orders))
+            for key in ("symbol", "ticket", "magic", "comment")
+        }
+        return cls(
+            version=version,
+            taken_at=taken_at,
+            positions=frozen_positions,
+            orders=frozen_orders,
+            positions_ok=positions is not None,
+            orders_ok=orders is not None,
+            _indexes=MappingProxyType(indexes),
+        )
+
+    def positions_for(self, symbol: str) -> Tuple[Mapping[str, Any], ...]:
+        return self._indexes.get("positions_by_symbol", {}).get(symbol, _EMPTY)
+
+    def orders_for(self, symbol: str) -> Tuple[Mapping[str, Any], ...]:
+        return self._indexes.get("orders_by_symbol", {}).get(symbol, _EMPTY)
+
+    def position(self, ticket: Any) -> Optional[Mapping[str, Any]]:
+        rows = self._indexes.get("positions_by_ticket", {}).get(ticket, _EMPTY)
+        return rows[0] if rows else None
+
+    def order(self, ticket: Any) -> Optional[Mapping[str, Any]]:
+        rows = self._indexes.get("orders_by_ticket", {}).get(ticket, _EMPTY)
+        return rows[0] if rows else None
+
+    def by_magic(self, magic: int) -> Tuple[Mapping[str, Any], ...]:
+        """Positions and orders opened with ``magic``."""
+        return (self._indexes.get("positions_by_magic", {}).get(magic, _EMPTY)
+                + self._indexes.get("orders_by_magic", {}).get(magic, _EMPTY))
+
+    def by_comment(self, comment: str) -> Tuple[Mapping[str, Any], ...]:
+        """Positions and orders whose comment equals ``comment``."""
+        return (self._indexes.get("positions_by_comment", {}).get(comment, _EMPTY)
+                + self._indexes.get("orders_by_comment", {}).get(comment, _EMPTY))
+
+
+# ── Mirror ────────────────────────────────────────────────────────────────────
+
+class BrokerStateMirror:
+    """
+    Read-through mirror of one connector's trading state.
+
+    Args:
+        connector:           Broker connector (get_open_positions / get_pending_orders).
+        refresh_interval_s:  Maximum age of positions and orders served to readers.
+        clock:               Monotonic clock (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        connector: Any,
+        refresh_interval_s: float = DEFAULT_REFRESH_INTERVAL_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.connector = connector
+        self.refresh_interval_s = refresh_interval_s
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._snapshot: Optional[BrokerStateSnapshot] = None
+        self._dirty = True
+        self._listeners: List[Callable[[BrokerStateChange], None]] = []
+        self.stats = {"refreshes": 0, "reads": 0, "invalidations": 0, "events": 0}
+
+    # ── Reads ─────────────────────────────────────────────────────────────────
+
+    def snapshot(self) -> BrokerStateSnapshot:
+        """Current snapshot, refreshed first if it is older than the interval or invalidated."""
+        with self._lock:
+            self.stats["reads"] += 1
+            snap = self._snapshot
+            if snap is None or self._dirty or self._clock() - snap.taken_at >= self.refresh_interval_s:
+                snap = self.refresh()
+            return snap
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version if self._snapshot is not None else 0
+
+    # ── Refresh ───────────────────────────────────────────────────────────────
+
+    def invalidate(self) -> None:
+        """Force a refresh on the next read — call after any trade event."""
+        with self._lock:
+            self._dirty = True
+            self.stats["invalidations"] += 1
+
+    def refresh(self) -> BrokerStateSnapshot:
+        """Fetch the broker state now and publish it as a new snapshot."""
+        with self._lock:
+            now = self._clock()
+            positions = self._fetch("get_open_positions")
+            orders = self._fetch("get_pending_orders")
+
+            previous = self._snapshot
+            version = previous.version if previous is not None else 0
+            candidate = BrokerStateSnapshot.build(version, now, positions, orders)
+            changed = previous is None or (
+                (candidate.positions, candidate.orders, candidate.positions_ok, candidate.orders_ok)
+                != (previous.positions, previous.orders, previous.positions_ok, previous.orders_ok)
+            )
+            if changed:
+                candidate = replace(candidate, version=version + 1)
+            self._snapshot = candidate
+            self._dirty = False
+            self.stats["refreshes"] += 1
+
+        if changed and previous is not None:
+            self._emit(self._diff(previous, candidate))
+        return candidate
+
+    def _fetch(self, method: str) -> Optional[List[Dict[str, Any]]]:
+        fetch = getattr(self.connector, method, None)
+        if fetch is None:
+            return None
+        try:
+            return fetch()
+        except Exception as exc:
+            logger.warning("[BROKER_MIRROR] %s failed: %s", method, exc)
+            return None
+
+    # ── Change events ─────────────────────────────────────────────────────────
+
+    def subscribe(self, listener: Callable[[BrokerStateChange], None]) -> Callable[[], None]:
+        """Register ``listener`` for change events; returns an unsubscribe callable."""
+        with self._lock:
+            self._listeners.append(listener)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                if listener in self._listeners:
+                    self._listeners.remove(listener)
+        return _unsubscribe
+
+    @staticmethod
+    def _diff(before: BrokerStateSnapshot, after: BrokerStateSnapshot) -> List[BrokerStateChange]:
+        changes: List[BrokerStateChange] = []
+        for kind, ok, old_rows, new_rows in (
+            ("position", before.positions_ok and after.positions_ok, before.positions, after.positions),
+            ("order", before.orders_ok and after.orders_ok, before.orders, after.orders),
+        ):
+            if not ok:
+                continue  # an unavailable side is not a mass open/close
+            old = {row.get("ticket"): row for row in old_rows}
+            new = {row.get("ticket"): row for row in new_rows}
+            for ticket, row in new.items():
+                if ticket not in old:
+                    changes.append(BrokerStateChange(kind, "opened", ticket, row.get("symbol"), after.version, after=row))
+                elif _stable_view(old[ticket]) != _stable_view(row):
+                    changes.append(BrokerStateChange(
+                        kind, "modified", ticket, row.get("symbol"), after.version, before=old[ticket], after=row
+                    ))
+            for ticket, row in old.items():
+                if ticket not in new:
+                    changes.append(BrokerStateChange(kind, "closed", ticket, row.get("symbol"), after.version, before=row))
+        return changes
+
+    def _emit(self, changes: List[BrokerStateChange]) -> None:
+        if not changes:
+            return
+        with self._lock:
+            listeners = list(self._listeners)
+            self.stats["events"] += len(changes)
+        for change in changes:
+            for listener in listeners:
+                try:
+                    listener(change)
+                except Exception as exc:
+                    logger.error("[BROKER_MIRROR] Listener failed on %s %s: %s", change.kind, change.action, exc)
+
+
+# ── Connector registry ────────────────────────────────────────────────────────
+
+_mirrors: Dict[int, BrokerStateMirror] = {}
+_mirrors_lock = threading.Lock()
+
+
+def register_broker_mirror(connector: Any, mirror: Optional[BrokerStateMirror] = None) -> BrokerStateMirror:
+    """Attach a mirror to ``connector`` (a new one by default) and return it."""
+    mirror = mirror or BrokerStateMirror(connector)
+    with _mirrors_lock:
+        _mirrors[id(connector)] = mirror
+    return mirror
+
+
+def unregister_broker_mirror(connector: Any) -> None:
+    with _mirrors_lock:
+        _mirrors.pop(id(connector), None)
+
+
+def get_broker_mirror(connector: Any) -> Optional[BrokerStateMirror]:
+    """Mirror attached to ``connector``, or None."""
+    if connector is None:
+        return None
+    mirror = _mirrors.get(id(connector))
+    # id() values are reused after garbage collection: confirm identity
+    return mirror if mirror is not None and mirror.connector is connector else None
+
+
+def invalidate_broker_mirror(connector: Any) -> None:
+    """Signal a trade event on ``connector`` (no-op without a mirror)."""
+    mirror = get_broker_mirror(connector)
+    if mirror is not None:
+        mirror.invalidate()
+
+
+def mirrored_open_positions(connector: Any, symbol: Optional[str] = None) -> Optional[List[Mapping[str, Any]]]:
+    """
+    Open positions of ``connector`` (optionally for one symbol), or None if unavailable.
+
+    Served from the attached mirror; without one, calls ``get_open_positions()``.
+    """
+    mirror = get_broker_mirror(connector)
+    if mirror is None:
+        positions = connector.get_open_positions()
+        if positions is None or symbol is None:
+            return positions
+        return [p for p in positions if p.get("symbol") == symbol]
+    snap = mirror.snapshot()
+    if not snap.positions_ok:
+        return None
+    return list(snap.positions_for(symbol) if symbol is not None else snap.positions)
+
+
+def mirrored_pending_orders(connector: Any, symbol: Optional[str] = None) -> Optional[List[Mapping[str, Any]]]:
+    """
+    Pending orders of ``connector`` (optionally for one symbol), or None if unavailable.
+
+    Served from the attached mirror; without one, calls ``get_pending_orders(symbol=...)``.
+    """
+    mirror = get_broker_mirror(connector)
+    if mirror is None:
+        return connector.get_pending_orders(symbol=symbol)
+    snap = mirror.snapshot()
+    if not snap.orders_ok:
+        return None
+    return list(snap.orders_for(symbol) if symbol is not None else snap.orders)
@@ -9,8 +9,17 @@ Thresholds (from MANIFESTO § 7.4 - Single Source of Truth):
 - Drawdown >= 3%
 - Consecutive Losses >= 5
 
-Operates every cycle in MainOrchestrator.run_single_cycle() via TradeClosureListener
-integration for real-time metric updates.
+Event-driven (PERF-CB-INCREMENTAL-2026-001): TradeClosureListener feeds every
+closed trade to on_trade_closed(), which updates that strategy's rolling window
+(loss streak, peak-to-trough drawdown, profit-factor window) in O(1) and
+degrades within the same trade when a threshold is crossed. Blocked/allowed
+lookups are served from an in-memory bitmap of execution modes, re-synced from
+sys_signal_ranking in one query every CB_RESYNC_INTERVAL_S so transitions made
+by other components (StrategyRanker, coherence veto, API) are picked up. The
+executor gate reads the strategy's ranking row on every signal anyway and hands
+that mode in, so order placement never acts on a stale bit. The
+per-strategy sweep (monitor_all_live_usr_strategies) remains only as a manual
+reconciliation tool.
 
 All threshold values MUST match those in strategy_ranker.py for consistency.
 
@@ -19,7 +28,11 @@ to NotificationService (Telegram, Email, etc.) for immediate user notification.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
 from datetime import datetime, timezone
 
 from data_vault.storage import StorageManager
@@ -32,6 +45,68 @@ logger = logging.getLogger(__name__)
 CB_DRAWDOWN_THRESHOLD = 3.0      # Percentage (%): Auto-degrade LIVE→QUARANTINE if DD ≥ 3%
 CB_CONSECUTIVE_LOSSES_THRESHOLD = 5  # Count: Auto-degrade LIVE→QUARANTINE if CL ≥ 5
 
+# ===== INCREMENTAL ENGINE =====
+CB_PROFIT_FACTOR_WINDOW = 50     # Closed trades in the rolling profit-factor window (completed_last_50)
+CB_DEFAULT_CAPITAL = 10000.0     # Base for drawdown % when no capital is supplied (RiskManager default)
+CB_RESYNC_INTERVAL_S = 30.0      # Max age of the execution-mode bitmap before one bulk re-read
+
+
+@dataclass
+class StrategyRiskWindow:
+    """
+    Rolling risk state of one strategy, updated once per closed trade.
+
+    Seeded from sys_signal_ranking (loss streak and stored drawdown_max), then
+    advanced by push(); gross win/loss of the profit-factor window are kept as
+    running sums so no update rescans the window.
+    """
+    consecutive_losses: int = 0
+    equity: float = 0.0
+    peak_equity: float = 0.0
+    drawdown_pct: float = 0.0          # Current peak-to-trough, % of capital
+    drawdown_max: float = 0.0          # Max of the seeded ranking value and live drawdown
+    trades: int = 0
+    gross_win: float = 0.0
+    gross_loss: float = 0.0
+    results: Deque[float] = field(default_factory=lambda: deque(maxlen=CB_PROFIT_FACTOR_WINDOW))
+
+    def push(self, pnl: float, capital: float) -> None:
+        if len(self.results) == self.results.maxlen:
+            evicted = self.results[0]
+            if evicted > 0:
+                self.gross_win -= evicted
+            elif evicted < 0:
+                self.gross_loss += evicted
+        self.results.append(pnl)
+        if pnl < 0:
+            self.gross_loss -= pnl
+            self.consecutive_losses += 1
+        else:
+            # Breakeven ends a losing streak, as in the ranking's consecutive-loss count
+            self.gross_win += pnl
+            self.consecutive_losses = 0
+        self.trades += 1
+        self.equity += pnl
+        self.peak_equity = max(self.peak_equity, self.equity)
+        self.drawdown_pct = (self.peak_equity - self.equity) / capital * 100.0 if capital > 0 else 0.0
+        self.drawdown_max = max(self.drawdown_max, self.drawdown_pct)
+
+    @property
+    def profit_factor(self) -> Optional[float]:
+        if self.gross_loss <= 0:
+            return None if self.gross_win <= 0 else float("inf")
+        return self.gross_win / self.gross_loss
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'consecutive_losses': self.consecutive_losses,
+            'drawdown_pct': round(self.drawdown_pct, 4),
+            'drawdown_max': round(self.drawdown_max, 4),
+            'profit_factor': self.profit_factor,
+            'window_trades': len(self.results),
+            'trades': self.trades,
+        }
+
 
 def _resolve_storage(storage: Optional[StorageManager]) -> StorageManager:
     """
@@ -50,11 +125,12 @@ class CircuitBreaker:
     to QUARANTINE when risk thresholds are violated.
     
     Architecture:
-    - Called by TradeClosureListener when trade closes
-    - Reads strategy metrics from usr_performance table (SSOT)
-    - Checks DD and CL thresholds
+    - Called by TradeClosureListener when trade closes (on_trade_closed)
+    - Keeps per-strategy rolling windows seeded from sys_signal_ranking (SSOT)
+    - Checks DD and CL thresholds on every closed trade
     - Degrades to QUARANTINE if violated
     - Logs all transitions with trace_ids for audit trail
+    - Answers is_strategy_blocked_for_trading() from an in-memory bitmap
     
     Non-blocking: Errors in CB should not interrupt trading cycle.
     """
@@ -62,7 +138,10 @@ class CircuitBreaker:
     def __init__(
         self,
         storage: Optional[StorageManager] = None,
-        degradation_alert_service: Optional['DegradationAlertService'] = None
+        degradation_alert_service: Optional['DegradationAlertService'] = None,
+        capital: float = CB_DEFAULT_CAPITAL,
+        resync_interval_s: float = CB_RESYNC_INTERVAL_S,
+        clock: Callable[[], float] = time.monotonic,
     ):
         """
         Initialize CircuitBreaker with dependency injection.
@@ -71,9 +150,22 @@ class CircuitBreaker:
             storage: StorageManager instance for persistence and query
             degradation_alert_service: DegradationAlertService for sending alerts
                 (Optional for backward compatibility)
+            capital: Base for drawdown % when on_trade_closed() gets no capital
+            resync_interval_s: Max age of the execution-mode bitmap
+            clock: Monotonic clock in seconds (injectable for tests)
         """
         self.storage = _resolve_storage(storage)
         self.degradation_alert_service = degradation_alert_service
+        self.capital = capital
+        self.resync_interval_s = resync_interval_s
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._slots: Dict[str, int] = {}            # strategy_id → bit position
+        self._modes: Dict[str, Optional[str]] = {}  # strategy_id → last known execution_mode
+        self._blocked_bits = 0                      # bit set ⇔ strategy not LIVE
+        self._windows: Dict[str, StrategyRiskWindow] = {}
+        self._synced_at: Optional[float] = None
+        self.stats = {'trades': 0, 'degradations': 0, 'resyncs': 0, 'lookups': 0, 'lookup_misses': 0}
         logger.info(
             f"CircuitBreaker initialized with real-time monitoring. "
             f"Thresholds: DD>={CB_DRAWDOWN_THRESHOLD}%, CL>={CB_CONSECUTIVE_LOSSES_THRESHOLD}. "
@@ -105,6 +197,7 @@ class CircuitBreaker:
                 return {'action': 'not_found', 'strategy_id': strategy_id}
             
             current_mode = ranking.get('execution_mode')
+            self._set_mode(strategy_id, current_mode)
             
             # CircuitBreaker only monitors LIVE usr_strategies
             if current_mode != 'LIVE':
@@ -140,70 +233,7 @@ class CircuitBreaker:
             # Risk threshold violated - degrade to QUARANTINE
             reason = 'drawdown_exceeded' if drawdown_violated else 'consecutive_losses_exceeded'
             
-            # Execute degradation
-            trace_id = self.storage.update_strategy_execution_mode(
-                strategy_id, 'QUARANTINE', trace_id=None
-            )
-            
-            # Log state change
-            self.storage.log_strategy_state_change(
-                strategy_id=strategy_id,
-                old_mode='LIVE',
-                new_mode='QUARANTINE',
-                trace_id=trace_id,
-                reason=reason,
-                metrics={
-                    'drawdown_max': drawdown_max,
-                    'consecutive_losses': consecutive_losses,
-                    'total_usr_trades': ranking.get('total_usr_trades'),
-                    'profit_factor': ranking.get('profit_factor')
-                }
-            )
-            
-            # Critical log for visibility
-            logger.critical(
-                f"[CB] 🔴 CIRCUIT BREAKER: {strategy_id} degraded LIVE→QUARANTINE "
-                f"({reason}: DD={drawdown_max:.2f}%, CL={consecutive_losses}) "
-                f"[Trace: {trace_id}]"
-            )
-            
-            # RULE 4.3: Try/Except on alert service integration
-            # Send degradation alert if service available
-            if self.degradation_alert_service:
-                try:
-                    # Get user_id from storage context (if available)
-                    user_id = getattr(self.storage, 'user_id', 'default')
-                    
-                    self.degradation_alert_service.handle_degradation({
-                        'strategy_id': strategy_id,
-                        'from_status': 'LIVE',
-                        'to_status': 'QUARANTINE',
-                        'reason': f"{reason}: DD={drawdown_max:.2f}%, CL={consecutive_losses}",
-                        'dd_pct': drawdown_max,
-                        'consecutive_losses': consecutive_losses,
-                        'profit_factor': ranking.get('profit_factor'),
-                        'win_rate': ranking.get('win_rate'),
-                        'user_id': user_id
-                    })
-                    logger.info(f"[CB] {trace_id}: Degradation alert sent for {strategy_id}")
-                
-                except Exception as exc:
-                    # RULE 4.3: Log error but don't crash circuit breaker
-                    logger.error(
-                        f"[CB] {trace_id}: Error sending degradation alert: {exc}",
-                        exc_info=True
-                    )
-            
-            return {
-                'action': 'degraded',
-                'from_mode': 'LIVE',
-                'to_mode': 'QUARANTINE',
-                'reason': reason,
-                'trace_id': trace_id,
-                'drawdown_max': drawdown_max,
-                'consecutive_losses': consecutive_losses,
-                'strategy_id': strategy_id
-            }
+            return self._degrade(strategy_id, reason, drawdown_max, consecutive_losses, ranking)
             
         except Exception as e:
             logger.error(
@@ -217,11 +247,89 @@ class CircuitBreaker:
                 'error': str(e)
             }
     
+    def _degrade(
+        self,
+        strategy_id: str,
+        reason: str,
+        drawdown_max: float,
+        consecutive_losses: int,
+        ranking: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Move a LIVE strategy to QUARANTINE, audit it, flip its bit and alert."""
+        # Execute degradation
+        trace_id = self.storage.update_strategy_execution_mode(
+            strategy_id, 'QUARANTINE', trace_id=None
+        )
+        
+        # Log state change
+        self.storage.log_strategy_state_change(
+            strategy_id=strategy_id,
+            old_mode='LIVE',
+            new_mode='QUARANTINE',
+            trace_id=trace_id,
+            reason=reason,
+            metrics={
+                'drawdown_max': drawdown_max,
+                'consecutive_losses': consecutive_losses,
+                'total_usr_trades': ranking.get('total_usr_trades'),
+                'profit_factor': ranking.get('profit_factor')
+            }
+        )
+        
+        self._set_mode(strategy_id, 'QUARANTINE')
+        self.stats['degradations'] += 1
+        
+        # Critical log for visibility
+        logger.critical(
+            f"[CB] 🔴 CIRCUIT BREAKER: {strategy_id} degraded LIVE→QUARANTINE "
+            f"({reason}: DD={drawdown_max:.2f}%, CL={consecutive_losses}) "
+            f"[Trace: {trace_id}]"
+        )
+        
+        # RULE 4.3: Try/Except on alert service integration
+        # Send degradation alert if service available
+        if self.degradation_alert_service:
+            try:
+                # Get user_id from storage context (if available)
+                user_id = getattr(self.storage, 'user_id', 'default')
+                
+                self.degradation_alert_service.handle_degradation({
+                    'strategy_id': strategy_id,
+                    'from_status': 'LIVE',
+                    'to_status': 'QUARANTINE',
+                    'reason': f"{reason}: DD={drawdown_max:.2f}%, CL={consecutive_losses}",
+                    'dd_pct': drawdown_max,
+                    'consecutive_losses': consecutive_losses,
+                    'profit_factor': ranking.get('profit_factor'),
+                    'win_rate': ranking.get('win_rate'),
+                    'user_id': user_id
+                })
+                logger.info(f"[CB] {trace_id}: Degradation alert sent for {strategy_id}")
+            
+            except Exception as exc:
+                # RULE 4.3: Log error but don't crash circuit breaker
+                logger.error(
+                    f"[CB] {trace_id}: Error sending degradation alert: {exc}",
+                    exc_info=True
+                )
+        
+        return {
+            'action': 'degraded',
+            'from_mode': 'LIVE',
+            'to_mode': 'QUARANTINE',
+            'reason': reason,
+            'trace_id': trace_id,
+            'drawdown_max': drawdown_max,
+            'consecutive_losses': consecutive_losses,
+            'strategy_id': strategy_id
+        }
+    
     def monitor_all_live_usr_strategies(self) -> Dict[str, Dict[str, Any]]:
         """
         Monitor all LIVE usr_strategies in batch.
         
-        Called by MainOrchestrator or TradeClosureListener for continuous monitoring.
+        Reconciliation tool only: trade closures already reach on_trade_closed(),
+        so no cycle needs to run this sweep.
         
         Returns:
             Dictionary mapping strategy_id to check result
@@ -233,7 +341,9 @@ class CircuitBreaker:
             logger.info(f"[CB] Monitoring {len(live_usr_strategies)} LIVE usr_strategies...")
             
             results = {}
-            for strategy_id in live_usr_strategies:
+            for entry in live_usr_strategies:
+                # get_strategies_by_mode() returns ranking rows; ids are accepted too
+                strategy_id = entry.get('strategy_id') if isinstance(entry, dict) else entry
                 try:
                     result = self.check_and_degrade_if_needed(strategy_id)
                     results[strategy_id] = result
@@ -254,22 +364,207 @@ class CircuitBreaker:
             logger.error(f"[CB] Error in batch monitoring: {e}", exc_info=False)
             return {}
     
-    def is_strategy_blocked_for_trading(self, strategy_id: str) -> bool:
+    # ── Event-driven evaluation ──────────────────────────────────────────────
+
+    def on_trade_closed(
+        self,
+        strategy_id: str,
+        pnl: float,
+        capital: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Advance ``strategy_id``'s rolling window by one closed trade and degrade
+        immediately if DD or CL crosses its threshold.
+
+        Args:
+            strategy_id: Strategy that owned the closed trade
+            pnl: Realized profit/loss of the trade (account currency)
+            capital: Base for drawdown % (defaults to ``self.capital``)
+
+        Returns:
+            Same action dictionary as check_and_degrade_if_needed()
+        """
+        try:
+            self._maybe_resync()
+            with self._lock:
+                self.stats['trades'] += 1
+                ranking = self._ranking_for_window(strategy_id)
+                mode = self._modes.get(strategy_id)
+                if mode != 'LIVE':
+                    # Only LIVE results feed the window; a strategy re-entering LIVE starts fresh
+                    return {
+                        'action': 'skipped',
+                        'reason': 'not_live_mode',
+                        'current_mode': mode,
+                        'strategy_id': strategy_id
+                    }
+                window = self._windows.get(strategy_id)
+                if window is None:
+                    window = self._seed_window(strategy_id, ranking or {})
+                window.push(float(pnl), capital or self.capital)
+
+                drawdown_violated = window.drawdown_max >= CB_DRAWDOWN_THRESHOLD
+                losses_violated = window.consecutive_losses >= CB_CONSECUTIVE_LOSSES_THRESHOLD
+                if not (drawdown_violated or losses_violated):
+                    return {
+                        'action': 'no_action',
+                        'current_mode': 'LIVE',
+                        'strategy_id': strategy_id,
+                        **window.as_dict()
+                    }
+
+                reason = 'drawdown_exceeded' if drawdown_violated else 'consecutive_losses_exceeded'
+                metrics = dict(ranking or {})
+                if window.profit_factor is not None:
+                    metrics['profit_factor'] = window.profit_factor
+                metrics['total_usr_trades'] = metrics.get('total_usr_trades') or window.trades
+                result = self._degrade(
+                    strategy_id, reason, window.drawdown_max, window.consecutive_losses, metrics
+                )
+                self._windows.pop(strategy_id, None)
+                return result
+        except Exception as e:
+            logger.error(f"[CB] Error evaluating closed trade for {strategy_id}: {e}", exc_info=False)
+            return {'action': 'error', 'strategy_id': strategy_id, 'error': str(e)}
+
+    def _ranking_for_window(self, strategy_id: str) -> Optional[Dict[str, Any]]:
+        # Strategies first seen on a trade close are resolved (and seeded) with one read
+        if strategy_id in self._windows and strategy_id in self._slots:
+            return None
+        ranking = self.storage.get_signal_ranking(strategy_id)
+        self._set_mode(strategy_id, ranking.get('execution_mode') if ranking else None)
+        return ranking
+
+    def _seed_window(self, strategy_id: str, ranking: Dict[str, Any]) -> StrategyRiskWindow:
+        window = StrategyRiskWindow(
+            consecutive_losses=int(ranking.get('consecutive_losses') or 0),
+            drawdown_max=float(ranking.get('drawdown_max') or 0.0),
+        )
+        self._windows[strategy_id] = window
+        return window
+
+    def risk_window(self, strategy_id: str) -> Optional[Dict[str, Any]]:
+        """Current rolling metrics of a strategy (None until its first LIVE trade/resync)."""
+        with self._lock:
+            window = self._windows.get(strategy_id)
+            return window.as_dict() if window else None
+
+    # ── Execution-mode bitmap ────────────────────────────────────────────────
+
+    def _set_mode(self, strategy_id: str, mode: Optional[str]) -> None:
+        with self._lock:
+            slot = self._slots.get(strategy_id)
+            if slot is None:
+                slot = self._slots[strategy_id] = len(self._slots)
+            previous = self._modes.get(strategy_id)
+            self._modes[strategy_id] = mode
+            if mode == 'LIVE':
+                self._blocked_bits &= ~(1 << slot)
+                if previous is not None and previous != 'LIVE':
+                    # Reset: a re-promoted strategy is judged on its new LIVE results only
+                    self._windows.pop(strategy_id, None)
+            else:
+                self._blocked_bits |= 1 << slot
+                self._windows.pop(strategy_id, None)
+
+    def resync(self) -> int:
+        """
+        Reload the bitmap with one query: LIVE rows clear their bit and seed
+        their window; every other known strategy is marked blocked.
+
+        Returns:
+            Number of LIVE strategies
+        """
+        rows = self.storage.get_strategies_by_mode('LIVE') or []
+        with self._lock:
+            live = {}
+            for row in rows:
+                if isinstance(row, dict) and row.get('strategy_id'):
+                    live[row['strategy_id']] = row
+            for strategy_id, mode in list(self._modes.items()):
+                if strategy_id not in live and mode == 'LIVE':
+                    # Left LIVE elsewhere (StrategyRanker, coherence veto): one read for its new mode
+                    ranking = self.storage.get_signal_ranking(strategy_id)
+                    self._set_mode(strategy_id, ranking.get('execution_mode') if ranking else None)
+            for strategy_id, row in live.items():
+                self._set_mode(strategy_id, 'LIVE')
+                if strategy_id not in self._windows:
+                    self._seed_window(strategy_id, row)
+            self._synced_at = self._clock()
+            self.stats['resyncs'] += 1
+            return len(live)
+
+    def _maybe_resync(self) -> None:
+        synced_at = self._synced_at
+        if synced_at is not None and self._clock() - synced_at < self.resync_interval_s:
+            return
+        try:
+            self.resync()
+        except Exception as e:
+            # Keep serving the last known bitmap; unknown strategies still hit storage
+            logger.warning(f"[CB] Bitmap resync failed: {e}")
+            self._synced_at = self._clock()
+
+    def is_strategy_blocked_for_trading(
+        self,
+        strategy_id: str,
+        execution_mode: Optional[str] = None,
+    ) -> bool:
         """
         Quick check: Is strategy blocked from sending usr_orders?
         
         Used by Executor to prevent order placement.
         
-        Returns True if in QUARANTINE or SHADOW mode.
+        Returns True if in QUARANTINE or SHADOW mode. Served from the bitmap;
+        only a strategy never seen before costs a ranking read.
+
+        Args:
+            strategy_id: Strategy to check
+            execution_mode: Mode the caller just read from sys_signal_ranking
+                (CircuitBreakerGate). It overrides the bitmap first, so a
+                transition written by another component or process applies
+                without waiting for the next resync.
         """
         try:
-            ranking = self.storage.get_signal_ranking(strategy_id)
-            if not ranking:
-                return True  # Unknown = blocked
-            
-            execution_mode = ranking.get('execution_mode')
-            # Only LIVE -> send usr_orders. SHADOW/QUARANTINE -> blocked
-            return execution_mode != 'LIVE'
+            self.stats['lookups'] += 1
+            if execution_mode is not None:
+                self._set_mode(strategy_id, execution_mode)
+            self._maybe_resync()
+            slot = self._slots.get(strategy_id)
+            if slot is None:
+                self.stats['lookup_misses'] += 1
+                ranking = self.storage.get_signal_ranking(strategy_id)
+                # Unknown = blocked; only LIVE -> send usr_orders. SHADOW/QUARANTINE -> blocked
+                self._set_mode(strategy_id, ranking.get('execution_mode') if ranking else None)
+                slot = self._slots[strategy_id]
+            return bool((self._blocked_bits >> slot) & 1)
             
         except Exception:
             return True  # Error = block (safe default)
+
+    def get_strategy_status(self, strategy_id: str) -> str:
+        """Execution mode known to the breaker (LIVE/SHADOW/QUARANTINE) or 'UNKNOWN'."""
+        self.is_strategy_blocked_for_trading(strategy_id)
+        return self._modes.get(strategy_id) or 'UNKNOWN'
+
+
+_circuit_breakers_lock = threading.Lock()
+
+
+def circuit_breaker_for(storage: StorageManager, **kwargs: Any) -> CircuitBreaker:
+    """
+    Shared CircuitBreaker of a storage (one per tenant DB).
+
+    The executor gate, TradeClosureListener and telemetry resolve the same
+    instance, so a degradation made on a trade close is what the next signal
+    and the next telemetry tick see. ``kwargs`` apply only on first creation.
+
+    The breaker lives on the storage instance itself, so it is released
+    together with its storage instead of being pinned by a module registry.
+    """
+    with _circuit_breakers_lock:
+        breaker = vars(storage).get("_circuit_breaker")
+        if breaker is None:
+            breaker = CircuitBreaker(storage=storage, **kwargs)
+            storage._circuit_breaker = breaker
+        return breaker
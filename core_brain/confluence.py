@@ -11,6 +11,7 @@ from typing import Dict, Optional
 from dataclasses import dataclass
 import pandas as pd
 
+from data_vault.storage import StorageManager
 from models.signal import Signal, SignalType, MarketRegime
 
 logger = logging.getLogger(__name__)
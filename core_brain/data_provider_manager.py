@@ -14,6 +14,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
 
+from core_brain.bar_aggregator import BarAggregator, to_output_frame
 from core_brain.symbol_coverage_policy import SymbolCoveragePolicy
 from core_brain.symbol_taxonomy_engine import SymbolTaxonomy
 from data_vault.storage import StorageManager
@@ -155,13 +156,20 @@ class DataProviderManager:
         }
     }
     
-    def __init__(self, storage: Optional[StorageManager] = None, config_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        storage: Optional[StorageManager] = None,
+        config_path: Optional[str] = None,
+        bar_aggregator: Optional[BarAggregator] = None,
+    ) -> None:
         """
         Initialize DataProviderManager
         
         Args:
             storage: StorageManager instance (DI)
             config_path: Optional path to legacy provider configuration file for migration
+            bar_aggregator: Optional BarAggregator; timeframes it serves are rolled up
+                from a single base-timeframe stream per symbol
         """
         self.config_path: Optional[Path] = Path(config_path) if config_path else None
         
@@ -186,6 +194,11 @@ class DataProviderManager:
         self._provider_selection_initialized: bool = False
         self._coverage_policy: SymbolCoveragePolicy = SymbolCoveragePolicy(storage=self.storage)
 
+        # Optional multi-timeframe roll-up from one base stream per symbol
+        self.bar_aggregator: Optional[BarAggregator] = bar_aggregator
+        self._bar_refreshed_at: Dict[str, float] = {}
+        self._bar_reconciled_at: Dict[str, float] = {}
+
         self._load_configuration()
 
     def register_provider_instance(self, name: str, instance: Any) -> None:
@@ -948,6 +961,22 @@ class DataProviderManager:
             )
             return None
 
+        # --- Bar aggregation: one base stream per symbol feeds every timeframe ---
+        if self.bar_aggregator is not None and self.bar_aggregator.serves(timeframe):
+            with self.bar_aggregator.lock_for(symbol):
+                return self._fetch_aggregated(symbol, symbol_type, timeframe, count, only_system)
+
+        return self._fetch_from_providers(symbol, symbol_type, timeframe, count, only_system)
+
+    def _fetch_from_providers(
+        self,
+        symbol: str,
+        symbol_type: str,
+        timeframe: str,
+        count: int,
+        only_system: bool,
+    ) -> Optional[Any]:
+        """Try active providers in priority order; registers coverage success/failure."""
         # Try providers in priority order with fallback
         active = self.get_active_providers()
         
@@ -992,6 +1021,87 @@ class DataProviderManager:
             )
         return None
 
+    def _fetch_aggregated(
+        self,
+        symbol: str,
+        symbol_type: str,
+        timeframe: str,
+        count: int,
+        only_system: bool,
+    ) -> Optional[Any]:
+        """
+        Serve ``timeframe`` from the BarAggregator (PERF-BAR-ROLLUP-2026-001).
+
+        The base stream is fetched at most once per ``base_refresh_seconds`` per
+        symbol, so all timeframes of one scan cycle share a single provider call.
+        A timeframe is seeded once from native bars and reconciled against them
+        every ``reconcile_interval_seconds``; on a mismatch its roll-up is dropped
+        and the native bars are served. Any gap falls back to a direct fetch; a
+        gap in the base stream itself is refilled with a full-history fetch.
+        Native and rolled-up frames share one column set (``OUTPUT_COLUMNS``).
+        Caller holds ``bar_aggregator.lock_for(symbol)``.
+        """
+        agg = self.bar_aggregator
+        tf = timeframe.upper()
+        now = time.monotonic()
+
+        last_refresh = self._bar_refreshed_at.get(symbol)
+        if last_refresh is None or now - last_refresh >= agg.base_refresh_seconds:
+            if agg.watermark(symbol) is None or last_refresh is None:
+                base_count = agg.history_capacity
+            else:
+                elapsed_bars = int((now - last_refresh) // agg.base_step) + 2
+                base_count = min(agg.history_capacity, elapsed_bars)
+            base = self._fetch_from_providers(symbol, symbol_type, agg.base_timeframe, base_count, only_system)
+            if base is not None and base_count < agg.history_capacity and not agg.continues(symbol, base):
+                # Gap since the last refresh: ingest_bars drops the roll-ups, and a
+                # short incremental window could never reseed them — pull the full history
+                base = self._fetch_from_providers(
+                    symbol, symbol_type, agg.base_timeframe, agg.history_capacity, only_system)
+            if base is None:
+                self._bar_refreshed_at.pop(symbol, None)
+                return None if tf == agg.base_timeframe else self._fetch_native(
+                    symbol, symbol_type, timeframe, count, only_system)
+            agg.ingest_bars(symbol, base)
+            self._bar_refreshed_at[symbol] = now
+
+        if not agg.is_seeded(symbol, tf):
+            native = self._fetch_native(symbol, symbol_type, timeframe, count, only_system)
+            if native is not None and agg.seed(symbol, tf, native):
+                self._bar_reconciled_at[f"{symbol}|{tf}"] = now
+            return native
+
+        key = f"{symbol}|{tf}"
+        if tf != agg.base_timeframe and now - self._bar_reconciled_at.get(key, now) >= agg.reconcile_interval_seconds:
+            self._bar_reconciled_at[key] = now
+            native = self._fetch_from_providers(symbol, symbol_type, timeframe, agg.reconcile_bars, only_system)
+            if native is not None:
+                report = agg.reconcile(symbol, tf, native)
+                if not report.ok:
+                    logger.warning(
+                        "[BAR-AGG] %s %s diverges from broker bars (%d mismatches, %d missing) — reseeding",
+                        symbol, tf, len(report.mismatches), len(report.missing),
+                    )
+                    agg.reset(symbol, tf)
+                    return to_output_frame(native)
+
+        frame = agg.frame(symbol, tf, count)
+        if frame is None:
+            return self._fetch_native(symbol, symbol_type, timeframe, count, only_system)
+        return frame
+
+    def _fetch_native(
+        self,
+        symbol: str,
+        symbol_type: str,
+        timeframe: str,
+        count: int,
+        only_system: bool,
+    ) -> Optional[Any]:
+        """Broker-native bars for an aggregated timeframe, in the roll-up frames' column set."""
+        native = self._fetch_from_providers(symbol, symbol_type, timeframe, count, only_system)
+        return to_output_frame(native) if native is not None else None
+
     def get_provider_instance(self, name: str) -> Optional[Any]:
         """
         Retorna la instancia de un proveedor específico **solo si está habilitado en BD**.
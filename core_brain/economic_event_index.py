@@ -0,0 +1,246 @@
+"""
+EconomicEventIndex — Currency-indexed interval trees over economic event windows.
+=================================================================================
+TRACE_ID: PERF-ECON-INDEX-2026-001
+
+Responsibility:
+  - Turn calendar rows into restriction windows
+    [event − pre-buffer, event + post-buffer] per impact level
+    (``IMPACT_BUFFERS_MINUTES``: HIGH 15/10, MEDIUM 5/3, LOW none).
+  - Keep one static interval tree per (currency, impact): "which windows
+    contain t" is O(log n + k) instead of a SQL ``IN (...)`` query plus a
+    Python scan per symbol.
+  - Keep per-currency sorted event times so "next events after t" is a
+    bisect.
+
+Architecture:
+  - Rebuilt wholesale (``rebuild``) when new events are persisted
+    (EconomicFetchPersist → EconomicIntegrationManager.refresh_event_index)
+    and by FundamentalGuardService when it reloads its calendar.
+  - Readers get the state published by the last rebuild; a rebuild swaps one
+    reference, so lookups never see a half-built index.
+
+Rule: the index answers from what was loaded — callers own the load window
+and fail-open behaviour when the calendar is unavailable.
+"""
+import bisect
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (pre_buffer_minutes, post_buffer_minutes) per impact level
+IMPACT_BUFFERS_MINUTES: Dict[str, Tuple[int, int]] = {
+    "HIGH": (15, 10),
+    "MEDIUM": (5, 3),
+    "LOW": (0, 0),
+}
+IMPACT_RANK = {"HIGH": 2, "MEDIUM": 1, "LOW": 0}
+RESTRICTION_BY_IMPACT = {"HIGH": "BLOCK", "MEDIUM": "CAUTION"}
+
+
+def to_epoch(value: Any) -> Optional[float]:
+    """UTC epoch seconds of a datetime or ISO string; naive values are read as UTC."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+@dataclass(frozen=True)
+class EventWindow:
+    """Restriction window of one calendar event."""
+    start: float
+    end: float
+    event_time: float
+    event_id: Any
+    event_name: str
+    country: Optional[str]
+    currency: str
+    impact: str
+
+    def as_event(self) -> Dict[str, Any]:
+        """Row shape of ``sys_economic_calendar`` used by the veto interface."""
+        return {
+            "event_id": self.event_id,
+            "event_name": self.event_name,
+            "country": self.country,
+            "currency": self.currency,
+            "impact_score": self.impact,
+            "event_time_utc": datetime.fromtimestamp(self.event_time, tz=timezone.utc).isoformat(),
+        }
+
+
+class IntervalTree:
+    """
+    Static interval tree: windows sorted by start form an implicit balanced
+    BST (midpoints), each node augmented with the max end of its subtree.
+    """
+
+    def __init__(self, windows: Iterable[EventWindow]) -> None:
+        self._windows: List[EventWindow] = sorted(windows, key=lambda w: (w.start, w.end))
+        self._max_end: List[float] = [0.0] * len(self._windows)
+        if self._windows:
+            self._augment(0, len(self._windows))
+
+    def _augment(self, lo: int, hi: int) -> float:
+        mid = (lo + hi) // 2
+        best = self._windows[mid].end
+        if lo < mid:
+            best = max(best, self._augment(lo, mid))
+        if mid + 1 < hi:
+            best = max(best, self._augment(mid + 1, hi))
+        self._max_end[mid] = best
+        return best
+
+    def stab(self, at: float) -> List[EventWindow]:
+        """Windows with ``start <= at <= end``."""
+        found: List[EventWindow] = []
+        stack = [(0, len(self._windows))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_end[mid] < at:
+                continue  # nothing in this subtree reaches ``at``
+            stack.append((lo, mid))
+            window = self._windows[mid]
+            if window.start <= at:
+                if at <= window.end:
+                    found.append(window)
+                stack.append((mid + 1, hi))  # right subtree starts later: only worth it if mid started
+        return found
+
+    def __len__(self) -> int:
+        return len(self._windows)
+
+
+class _IndexState:
+    __slots__ = ("trees", "times", "upcoming", "size")
+
+    def __init__(self) -> None:
+        self.trees: Dict[str, Dict[str, IntervalTree]] = {}
+        self.times: Dict[str, List[float]] = {}
+        self.upcoming: Dict[str, List[EventWindow]] = {}
+        self.size = 0
+
+
+class EconomicEventIndex:
+    """
+    Per-currency restriction windows and event timeline.
+
+    Args:
+        buffers: (pre, post) minutes per impact level; impacts without a
+            positive buffer restrict nothing but still appear as upcoming.
+    """
+
+    def __init__(self, buffers: Optional[Mapping[str, Tuple[int, int]]] = None) -> None:
+        self.buffers = dict(buffers or IMPACT_BUFFERS_MINUTES)
+        self._state = _IndexState()
+        self.version = 0
+        self.stats = {"rebuilds": 0, "lookups": 0, "skipped_rows": 0}
+
+    def rebuild(self, events: Iterable[Mapping[str, Any]]) -> int:
+        """
+        Replace the index with ``events`` (rows with event_id, event_name,
+        country, currency, impact_score, event_time_utc). Returns rows indexed.
+        """
+        grouped: Dict[str, Dict[str, List[EventWindow]]] = {}
+        timeline: Dict[str, List[EventWindow]] = {}
+        seen = set()
+        for row in events:
+            event_time = to_epoch(row.get("event_time_utc"))
+            currency = str(row.get("currency") or "").upper()
+            if event_time is None or not currency:
+                self.stats["skipped_rows"] += 1
+                continue
+            impact = str(row.get("impact_score") or "LOW").upper()
+            key = (row.get("event_id"), currency, event_time) if row.get("event_id") is not None else None
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            pre, post = self.buffers.get(impact, (0, 0))
+            window = EventWindow(
+                start=event_time - pre * 60,
+                end=event_time + post * 60,
+                event_time=event_time,
+                event_id=row.get("event_id"),
+                event_name=row.get("event_name") or "UNKNOWN",
+                country=row.get("country"),
+                currency=currency,
+                impact=impact,
+            )
+            timeline.setdefault(currency, []).append(window)
+            if pre > 0 or post > 0:
+                grouped.setdefault(currency, {}).setdefault(impact, []).append(window)
+
+        state = _IndexState()
+        for currency, by_impact in grouped.items():
+            state.trees[currency] = {impact: IntervalTree(ws) for impact, ws in by_impact.items()}
+        for currency, windows in timeline.items():
+            windows.sort(key=lambda w: w.event_time)
+            state.upcoming[currency] = windows
+            state.times[currency] = [w.event_time for w in windows]
+            state.size += len(windows)
+
+        self._state = state
+        self.version += 1
+        self.stats["rebuilds"] += 1
+        return state.size
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def active(self, currencies: Sequence[str], at: Any) -> List[EventWindow]:
+        """Windows containing ``at`` for any of ``currencies``, most severe / closest first."""
+        ts = at if isinstance(at, (int, float)) else to_epoch(at)
+        state = self._state
+        self.stats["lookups"] += 1
+        hits: List[EventWindow] = []
+        for currency in currencies:
+            for tree in state.trees.get(currency.upper(), {}).values():
+                hits.extend(tree.stab(ts))
+        hits.sort(key=lambda w: (-IMPACT_RANK.get(w.impact, 0), abs(w.event_time - ts)))
+        return hits
+
+    def upcoming(
+        self,
+        currencies: Sequence[str],
+        at: Any,
+        horizon_s: float = 86400.0,
+        limit: int = 10,
+    ) -> List[EventWindow]:
+        """Events at or after ``at`` (within ``horizon_s``) for ``currencies``, soonest first."""
+        ts = at if isinstance(at, (int, float)) else to_epoch(at)
+        state = self._state
+        found: List[EventWindow] = []
+        for currency in currencies:
+            key = currency.upper()
+            times = state.times.get(key)
+            if not times:
+                continue
+            start = bisect.bisect_left(times, ts)
+            stop = bisect.bisect_right(times, ts + horizon_s, lo=start)
+            found.extend(state.upcoming[key][start:min(stop, start + limit)])
+        found.sort(key=lambda w: w.event_time)
+        return found[:limit]
+
+    def restriction(self, currencies: Sequence[str], at: Any) -> Tuple[str, Optional[EventWindow]]:
+        """("BLOCK" | "CAUTION" | "NORMAL", window responsible) for ``currencies`` at ``at``."""
+        for window in self.active(currencies, at):
+            level = RESTRICTION_BY_IMPACT.get(window.impact)
+            if level:
+                return level, window
+        return "NORMAL", None
+
+    def __len__(self) -> int:
+        return self._state.size
@@ -16,7 +16,7 @@ Type Hints: 100% coverage
 import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Callable, Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass
 import uuid
 
@@ -64,12 +64,20 @@ class EconomicFetchPersist:
         self,
         gateway: EconomicDataProviderRegistry,
         sanitizer: NewsSanitizer,
-        storage: StorageManager
+        storage: StorageManager,
+        on_persisted: Optional[Callable[[int], None]] = None
     ):
-        """Initialize with dependencies (dependency injection pattern)."""
+        """
+        Initialize with dependencies (dependency injection pattern).
+
+        Args:
+            on_persisted: Called with the insert count after a cycle persists
+                new events (e.g. to rebuild the in-memory event index)
+        """
         self.gateway = gateway
         self.sanitizer = sanitizer
         self.storage = storage
+        self.on_persisted = on_persisted
         self.logger = logger
     
     async def fetch_all_providers(
@@ -268,6 +276,13 @@ class EconomicFetchPersist:
                 error_message=persist_error
             )
             
+            # Notify subscribers only when the calendar actually changed
+            if metrics.success and inserted_count > 0 and self.on_persisted is not None:
+                try:
+                    self.on_persisted(inserted_count)
+                except Exception as e:
+                    self.logger.error(f"[CYCLE] on_persisted callback failed: {str(e)}")
+            
             # Log cycle completion
             if metrics.success:
                 self.logger.info(
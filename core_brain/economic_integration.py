@@ -14,6 +14,11 @@ Integration pattern:
 - Autonomous: self-learning, self-healing
 - Agnosis preserved: MainOrchestrator only calls get_trading_status(), never knows provider sources
 
+Lookups (PERF-ECON-INDEX-2026-001): get_trading_status() reads an in-memory
+EconomicEventIndex (per-currency interval trees of impact windows) loaded in
+one query and rebuilt whenever EconomicFetchPersist persists new events, so
+the econ phase can check the whole symbol universe every cycle.
+
 Type Hints: 100% coverage
 """
 
@@ -30,6 +35,8 @@ from core_brain.economic_fetch_persist import (
 )
 from connectors.economic_data_gateway import EconomicDataProviderRegistry
 from core_brain.news_sanitizer import NewsSanitizer
+from core_brain.economic_event_index import IMPACT_BUFFERS_MINUTES, EconomicEventIndex
+from core_brain.symbol_registry import get_symbol_registry
 from data_vault.storage import StorageManager
 
 
@@ -71,6 +78,12 @@ DEFAULT_EVENT_SYMBOL_MAPPING = {
     "JAPAN_CPI": ["JPY", "USDJPY", "EURJPY"],
 }
 
+# Event index load window: past events whose post-buffer may still be open,
+# plus the upcoming horizon; reloaded after persists or once older than max age
+INDEX_LOOKBACK = timedelta(hours=1)
+INDEX_HORIZON = timedelta(days=8)
+INDEX_MAX_AGE_S = 3600.0
+
 
 class EconomicIntegrationManager:
     """
@@ -131,6 +144,11 @@ class EconomicIntegrationManager:
         # Event-to-symbol mapping (extensible from DB)
         self._event_symbol_map = DEFAULT_EVENT_SYMBOL_MAPPING.copy()
         
+        # In-memory event index (loaded lazily, rebuilt on persist)
+        self.event_index = EconomicEventIndex()
+        self._index_loaded_at: Optional[float] = None
+        self._index_covers_until: Optional[datetime] = None
+        
         self.logger = logger
     
     async def setup(self) -> bool:
@@ -147,7 +165,8 @@ class EconomicIntegrationManager:
             self.fetch_persist = EconomicFetchPersist(
                 gateway=self.gateway,
                 sanitizer=self.sanitizer,
-                storage=self.storage
+                storage=self.storage,
+                on_persisted=lambda _inserted: self.refresh_event_index()
             )
             
             # Create async job function that captures executor
@@ -285,12 +304,8 @@ class EconomicIntegrationManager:
         Returns:
             Tuple of (pre_buffer_minutes, post_buffer_minutes)
         """
-        buffers = {
-            "HIGH": (15, 10),    # 15m pre, 10m post
-            "MEDIUM": (5, 3),    # 5m pre, 3m post
-            "LOW": (0, 0),       # No buffer
-        }
-        return buffers.get(impact_level, (0, 0))
+        # HIGH: 15m pre / 10m post, MEDIUM: 5m / 3m, LOW: no buffer
+        return IMPACT_BUFFERS_MINUTES.get(impact_level, (0, 0))
     
     async def get_trading_status(
         self,
@@ -443,16 +458,76 @@ class EconomicIntegrationManager:
                 "degraded_mode": True
             }
     
+    def refresh_event_index(self, now: Optional[datetime] = None) -> int:
+        """
+        Reload the event index from sys_economic_calendar in one query.
+        
+        Called after EconomicFetchPersist persists new events, and lazily when
+        the index is missing, older than INDEX_MAX_AGE_S or no longer covers
+        the requested time. Clears the trading-status cache.
+        
+        Returns:
+            Number of events indexed
+        """
+        now = now or datetime.now(timezone.utc)
+        until = now + INDEX_HORIZON
+        conn = self.storage._get_conn()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT event_id, event_name, country, currency, impact_score, event_time_utc
+                FROM sys_economic_calendar
+                WHERE event_time_utc >= datetime(?)
+                  AND event_time_utc <= datetime(?)
+                """,
+                [(now - INDEX_LOOKBACK).isoformat(), until.isoformat()]
+            )
+            rows = cursor.fetchall()
+        finally:
+            self.storage._close_conn(conn)
+        
+        indexed = self.event_index.rebuild(
+            {
+                "event_id": row[0],
+                "event_name": row[1],
+                "country": row[2],
+                "currency": row[3],
+                "impact_score": row[4],
+                "event_time_utc": row[5],
+            }
+            for row in rows
+        )
+        self._index_loaded_at = time.time()
+        self._index_covers_until = until
+        self._trading_status_cache.clear()
+        self._cache_timestamps.clear()
+        self.logger.debug(f"[ECON-VETO] Event index rebuilt: {indexed} events (v{self.event_index.version})")
+        return indexed
+    
+    def _ensure_event_index(self, current_time: datetime) -> None:
+        loaded_at = self._index_loaded_at
+        if (
+            loaded_at is None
+            or time.time() - loaded_at > INDEX_MAX_AGE_S
+            or current_time + timedelta(hours=24) > self._index_covers_until
+        ):
+            self.refresh_event_index(current_time)
+    
     def _query_economic_calendar(self, symbol: str, current_time: datetime) -> List[Dict[str, Any]]:
         """
-        Query sys_economic_calendar for upcoming events affecting this symbol.
+        Events relevant to this symbol, served from the in-memory event index.
+        
+        Events whose impact window contains ``current_time`` come first (most
+        severe, then closest), followed by the next events of the symbol's
+        currencies within 24 hours.
         
         Args:
             symbol: Currency pair (e.g., 'EUR/USD')
             current_time: Current time (UTC)
         
         Returns:
-            List of events sorted by time_to_event (ascending)
+            List of event dicts (sys_economic_calendar row shape)
         """
         try:
             # Get affected currencies for this symbol
@@ -461,48 +536,15 @@ class EconomicIntegrationManager:
             if not currencies:
                 return []
             
-            # Query affected events
-            conn = self.storage._get_conn()
-            cursor = conn.cursor()
-            
-            # Get events in the next 24 hours
-            time_window = current_time + timedelta(hours=24)
+            self._ensure_event_index(current_time)
+            active = self.event_index.active(currencies, current_time)
+            upcoming = self.event_index.upcoming(currencies, current_time, horizon_s=24 * 3600, limit=10)
             
-            placeholders = ",".join(["?" for _ in currencies])
-            query = f"""
-                SELECT event_id, event_name, country, currency, impact_score, event_time_utc
-                FROM sys_economic_calendar
-                WHERE currency IN ({placeholders})
-                  AND event_time_utc >= datetime(?)
-                  AND event_time_utc <= datetime(?)
-                ORDER BY event_time_utc ASC
-                LIMIT 10
-            """
-            
-            cursor.execute(
-                query,
-                currencies + [current_time.isoformat(), time_window.isoformat()]
-            )
-            
-            rows = cursor.fetchall()
-            conn.close()
-            
-            if not rows:
-                return []
-            
-            # Convert to dicts
-            events = []
-            for row in rows:
-                events.append({
-                    "event_id": row[0],
-                    "event_name": row[1],
-                    "country": row[2],
-                    "currency": row[3],
-                    "impact_score": row[4],
-                    "event_time_utc": row[5],
-                })
-            
-            return events
+            active_ids = {id(window) for window in active}
+            return [
+                window.as_event()
+                for window in active + [w for w in upcoming if id(w) not in active_ids]
+            ]
         
         except Exception as e:
             self.logger.error(f"[ECON-VETO] Error querying calendar: {str(e)}")
@@ -518,17 +560,8 @@ class EconomicIntegrationManager:
         Returns:
             List of currency codes (e.g., ['EUR', 'USD'])
         """
-        # Normalize symbol
-        symbol = symbol.upper().replace("/", "").replace(" ", "")
-        
-        # Handle major pairs (4-6 chars)
-        if len(symbol) == 6:
-            return [symbol[:3], symbol[3:]]
-        elif len(symbol) == 7:
-            return [symbol[:3], symbol[3:6]]
-        
-        # Fallback
-        return []
+        # Precomputed once per symbol by the registry (6 chars, or 7 with broker suffix)
+        return list(get_symbol_registry().record(symbol).currencies)
     
     def _format_reason(self, impact_level: str, time_to_event: float, pre_buf_secs: float) -> str:
         """Format human-readable reason for trading restriction."""
@@ -8,6 +8,7 @@ import time
 import logging
 from typing import Dict, Any, List, Optional
 from data_vault.storage import StorageManager
+from core_brain.broker_state_mirror import mirrored_open_positions, mirrored_pending_orders
 
 logger = logging.getLogger(__name__)
 
@@ -167,7 +168,7 @@ class EdgeMonitor(threading.Thread):
                 logger.warning("[EDGE] TradeClosureListener not available - reconciliation skipped")
             
             # PASO 2: Obtener posiciones ABIERTAS de MT5 (ya sincronizadas)
-            mt5_usr_positions = mt5.get_open_positions()
+            mt5_usr_positions = mirrored_open_positions(mt5)
             if mt5_usr_positions is None:
                 return
                 
@@ -318,7 +319,7 @@ class EdgeMonitor(threading.Thread):
             
             # Strategy 1: Check pending orders (orders not yet executed)
             try:
-                pending_orders = mt5_connector.get_pending_orders(symbol=symbol)
+                pending_orders = mirrored_pending_orders(mt5_connector, symbol)
                 if pending_orders:
                     for order in pending_orders:
                         order_time = order.get('time_setup')
@@ -339,25 +340,23 @@ class EdgeMonitor(threading.Thread):
             
             # Strategy 2: Check open positions (orders already executed)
             try:
-                open_positions = mt5_connector.get_open_positions()
-                if open_positions:
-                    symbol_positions = [p for p in open_positions if p.get('symbol') == symbol]
-                    if symbol_positions:
-                        # For open positions, check if ANY position matches time window
-                        for position in symbol_positions:
-                            open_time = position.get('open_time')
-                            if open_time:
-                                # Handle both unix timestamp and datetime
-                                if isinstance(open_time, (int, float)):
-                                    from datetime import datetime, timezone
-                                    open_time = datetime.fromtimestamp(open_time, tz=timezone.utc)
-                                elif isinstance(open_time, str):
-                                    open_time = datetime.fromisoformat(open_time.replace('Z', '+00:00'))
-                                
-                                time_diff = abs((open_time - signal_time).total_seconds())
-                                if time_diff < tolerance_seconds:
-                                    logger.info(f"✅ Found matching open position for {symbol} (diff: {time_diff:.0f}s)")
-                                    return True
+                symbol_positions = mirrored_open_positions(mt5_connector, symbol)
+                if symbol_positions:
+                    # For open positions, check if ANY position matches time window
+                    for position in symbol_positions:
+                        open_time = position.get('open_time')
+                        if open_time:
+                            # Handle both unix timestamp and datetime
+                            if isinstance(open_time, (int, float)):
+                                from datetime import datetime, timezone
+                                open_time = datetime.fromtimestamp(open_time, tz=timezone.utc)
+                            elif isinstance(open_time, str):
+                                open_time = datetime.fromisoformat(open_time.replace('Z', '+00:00'))
+                            
+                            time_diff = abs((open_time - signal_time).total_seconds())
+                            if time_diff < tolerance_seconds:
+                                logger.info(f"✅ Found matching open position for {symbol} (diff: {time_diff:.0f}s)")
+                                return True
             except Exception as e:
                 logger.debug(f"Error checking open positions: {e}")
             
@@ -11,6 +11,9 @@ from datetime import datetime
 from pathlib import Path
 
 from models.signal import Signal, ConnectorType
+from core_brain.broker_state_mirror import invalidate_broker_mirror, mirrored_open_positions
+from core_brain.fx_conversion_graph import FxConversionGraph
+from core_brain.latency_tracer import get_latency_tracer
 from core_brain.risk_manager import RiskManager
 from core_brain.risk_calculator import RiskCalculator
 from core_brain.multi_timeframe_limiter import MultiTimeframeLimiter
@@ -53,6 +56,7 @@ class OrderExecutor:
         circuit_breaker_gate: Optional[CircuitBreakerGate] = None,
         lifecycle_manager: Optional[SignalLifecycleManager] = None,
         close_only_guard: Optional[CloseOnlyGuard] = None,
+        fx_graph: Optional[FxConversionGraph] = None,
     ):
         """
         Initialize OrderExecutor with Dependency Injection.
@@ -63,6 +67,7 @@ class OrderExecutor:
             multi_tf_limiter: MultiTimeframeLimiter (DI)
             notificator: Notificator for alerts (optional)
             connectors: Dictionary mapping ConnectorType to connector instances
+            fx_graph: Live FX conversion graph shared with RiskCalculator (optional)
         """
         self.risk_manager = risk_manager
         
@@ -75,8 +80,8 @@ class OrderExecutor:
         # Initialize CircuitBreakerGate for strategy execution authorization
         if circuit_breaker_gate is None:
             logger.debug("OrderExecutor: CircuitBreakerGate not injected, creating default")
-            from core_brain.circuit_breaker import CircuitBreaker
-            cb = CircuitBreaker(storage=self.storage)
+            from core_brain.circuit_breaker import circuit_breaker_for
+            cb = circuit_breaker_for(self.storage)
             self.circuit_breaker_gate = CircuitBreakerGate(
                 circuit_breaker=cb,
                 storage=self.storage,
@@ -112,7 +117,7 @@ class OrderExecutor:
             # Prefer MT5 for risk calculation if available
             mt5_conn = self.connectors.get(ConnectorType.METATRADER5)
             calc_connector = mt5_conn if mt5_conn else list(self.connectors.values())[0]
-            self.risk_calculator = RiskCalculator(calc_connector)
+            self.risk_calculator = RiskCalculator(calc_connector, fx_graph=fx_graph)
         
         # Initialize SignalLifecycleManager for signal state transitions
         if lifecycle_manager is None:
@@ -302,7 +307,8 @@ class OrderExecutor:
         can_trade = True
         risk_reason = "OK"
         if hasattr(self.risk_manager, "can_take_new_trade"):
-            risk_result = self.risk_manager.can_take_new_trade(signal, connector)
+            with get_latency_tracer().span("execute.risk", symbol=signal.symbol):
+                risk_result = self.risk_manager.can_take_new_trade(signal, connector)
             if isinstance(risk_result, tuple) and len(risk_result) >= 2:
                 can_trade, risk_reason = bool(risk_result[0]), str(risk_result[1])
             elif isinstance(risk_result, bool):
@@ -407,7 +413,10 @@ class OrderExecutor:
                     logger.info(f"[RACE FIX] [OK] MT5 connected successfully after {waited}s wait")
             
             # --- NUEVO FLUJO HU 5.1: ExecutionService with Protection ---
-            execution_response = await self.execution_service.execute_with_protection(signal, connector)
+            strategy_id = (getattr(signal, "metadata", None) or {}).get("strategy_id")
+            with get_latency_tracer().span("execute.broker", symbol=signal.symbol, strategy=strategy_id):
+                execution_response = await self.execution_service.execute_with_protection(signal, connector)
+            invalidate_broker_mirror(connector)
             # Store response for MainOrchestrator feedback loop (DOMINIO-10 INFRA_RESILIENCY)
             self.last_execution_response = execution_response
             
@@ -693,15 +702,12 @@ class OrderExecutor:
                 logger.warning("MT5 connector not available for reconciliation")
                 return False
             
-            # Query real MT5 positions
-            usr_positions = mt5_connector.get_open_positions()
-            if usr_positions is None:
+            # Query real MT5 positions for the symbol (broker state mirror when attached)
+            symbol_usr_positions = mirrored_open_positions(mt5_connector, symbol)
+            if symbol_usr_positions is None:
                 logger.error("Failed to query MT5 usr_positions for reconciliation")
                 return False
             
-            # Check if symbol has real position
-            symbol_usr_positions = [p for p in usr_positions if p.get('symbol') == symbol]
-            
             if symbol_usr_positions:
                 # Real position exists, don't clear
                 logger.info(f"Real position confirmed in MT5 for {symbol}, rejecting duplicate")
@@ -0,0 +1,197 @@
+"""
+FxConversionGraph — Currency conversion from live quotes, without broker round-trips.
+=====================================================================================
+TRACE_ID: PERF-FX-GRAPH-2026-001
+
+Responsibility:
+  - Currency nodes and quoted-pair edges (BASE/QUOTE) built from the
+    instrument universe (``register_symbols``).
+  - Edge rates kept fresh by the quote stream (``update_quote``): the scanner
+    feeds the last close of every scanned symbol.
+  - ``rate(from, to)`` / ``convert(amount, from, to)`` through cached
+    shortest paths (fewest hops); only the multiplication along the path is
+    done per call.
+  - Every edge carries its quote timestamp: a path with a quote older than
+    ``max_age_s`` raises ``StaleRateError``; no path raises
+    ``NoConversionPathError``.
+
+Architecture:
+  - Built once in start.py and injected (DI) into ScannerEngine (producer),
+    RiskCalculator and RiskManager → PositionSizeEngine (consumers).
+  - Consumers fall back to their previous connector lookups on any
+    ``FxConversionError``, so a cold or stale graph degrades to the old path
+    instead of blocking sizing.
+
+Rule: a rate is never extrapolated — stale or missing data is an explicit
+error, not a silent 1.0.
+"""
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE_S = 300.0
+
+# (symbol, inverted): rate(base→quote) is the pair's price, quote→base is 1/price
+_Path = Tuple[Tuple[str, bool], ...]
+
+
+class FxConversionError(Exception):
+    """Base error: the requested conversion cannot be answered from the graph."""
+
+
+class NoConversionPathError(FxConversionError):
+    """No chain of quoted pairs links the two currencies."""
+
+
+class StaleRateError(FxConversionError):
+    """A pair on the conversion path has no quote, or one older than max_age_s."""
+
+
+def split_pair(symbol: str) -> Optional[Tuple[str, str]]:
+    """(base, quote) of a 6-letter currency/metal pair (EURUSD, XAUUSD), else None."""
+    code = symbol.upper().split(".")[0].replace("/", "")  # broker suffixes: EURUSD.a, EUR/USD
+    if len(code) != 6 or not code.isalpha():
+        return None
+    return code[:3], code[3:]
+
+
+class FxConversionGraph:
+    """
+    Graph of currencies linked by quoted pairs.
+
+    Args:
+        max_age_s:  Maximum quote age accepted on a conversion path.
+        clock:      Wall clock in seconds (injectable for tests).
+    """
+
+    def __init__(self, max_age_s: float = DEFAULT_MAX_AGE_S, clock: Callable[[], float] = time.time) -> None:
+        self.max_age_s = max_age_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._pairs: Dict[str, Tuple[str, str]] = {}             # symbol → (base, quote)
+        self._adjacency: Dict[str, Dict[str, Tuple[str, bool]]] = {}  # ccy → {ccy: (symbol, inverted)}
+        self._quotes: Dict[str, Tuple[float, float]] = {}         # symbol → (price, ts)
+        self._paths: Dict[Tuple[str, str], Optional[_Path]] = {}
+        self.stats = {"conversions": 0, "path_cache_hits": 0, "stale": 0, "no_path": 0, "quotes": 0}
+
+    # ── Topology ──────────────────────────────────────────────────────────────
+
+    def register_symbols(self, symbols: Iterable[str]) -> int:
+        """Add an edge for every currency pair in ``symbols``; returns how many are new."""
+        with self._lock:
+            return sum(1 for symbol in symbols if self._add_pair(symbol))
+
+    def _add_pair(self, symbol: str) -> bool:
+        key = symbol.upper()
+        if key in self._pairs:
+            return False
+        pair = split_pair(key)
+        if pair is None:
+            return False
+        base, quote = pair
+        if base == quote:
+            return False
+        self._pairs[key] = pair
+        # Keep the first pair seen for a currency couple; a duplicate adds no path
+        self._adjacency.setdefault(base, {}).setdefault(quote, (key, False))
+        self._adjacency.setdefault(quote, {}).setdefault(base, (key, True))
+        self._paths.clear()
+        return True
+
+    @property
+    def currencies(self) -> List[str]:
+        with self._lock:
+            return sorted(self._adjacency)
+
+    # ── Quote stream ──────────────────────────────────────────────────────────
+
+    def update_quote(self, symbol: str, bid: float, ask: Optional[float] = None, ts: Optional[float] = None) -> None:
+        """Record the latest price of ``symbol`` (mid if ``ask`` is given); unknown pairs are added."""
+        price = (bid + ask) / 2.0 if ask else bid
+        if not price or price <= 0:
+            return
+        key = symbol.upper()
+        with self._lock:
+            if key not in self._pairs and not self._add_pair(key):
+                return
+            self._quotes[key] = (float(price), ts if ts is not None else self._clock())
+            self.stats["quotes"] += 1
+
+    # ── Conversion ────────────────────────────────────────────────────────────
+
+    def rate(self, from_currency: str, to_currency: str) -> float:
+        """
+        Units of ``to_currency`` per unit of ``from_currency``.
+
+        Raises:
+            NoConversionPathError: the currencies are not connected.
+            StaleRateError: a pair on the path is unquoted or older than ``max_age_s``.
+        """
+        src, dst = from_currency.upper(), to_currency.upper()
+        if src == dst:
+            return 1.0
+        now = self._clock()
+        with self._lock:
+            self.stats["conversions"] += 1
+            path = self._shortest_path(src, dst)
+            if path is None:
+                self.stats["no_path"] += 1
+                raise NoConversionPathError(f"No quoted pairs link {src} to {dst}")
+            rate = 1.0
+            for symbol, inverted in path:
+                quote = self._quotes.get(symbol)
+                if quote is None or now - quote[1] > self.max_age_s:
+                    self.stats["stale"] += 1
+                    age = "never quoted" if quote is None else f"{now - quote[1]:.0f}s old"
+                    raise StaleRateError(f"{symbol} quote unusable for {src}->{dst} ({age})")
+                rate = rate / quote[0] if inverted else rate * quote[0]
+            return rate
+
+    def convert(self, amount: float, from_currency: str, to_currency: str) -> float:
+        """``amount`` of ``from_currency`` expressed in ``to_currency``."""
+        return amount * self.rate(from_currency, to_currency)
+
+    def _shortest_path(self, src: str, dst: str) -> Optional[_Path]:
+        key = (src, dst)
+        if key in self._paths:
+            self.stats["path_cache_hits"] += 1
+            return self._paths[key]
+        path: Optional[_Path] = None
+        if src in self._adjacency and dst in self._adjacency:
+            previous: Dict[str, Tuple[str, Tuple[str, bool]]] = {}
+            queue = deque([src])
+            seen = {src}
+            while queue:
+                node = queue.popleft()
+                if node == dst:
+                    hops: List[Tuple[str, bool]] = []
+                    while node != src:
+                        node, edge = previous[node]
+                        hops.append(edge)
+                    path = tuple(reversed(hops))
+                    break
+                for neighbour, edge in self._adjacency[node].items():
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        previous[neighbour] = (node, edge)
+                        queue.append(neighbour)
+        self._paths[key] = path
+        return path
+
+    def snapshot(self) -> Dict[str, object]:
+        """Graph size, quote ages and counters (for diagnostics)."""
+        now = self._clock()
+        with self._lock:
+            ages = [now - ts for _, ts in self._quotes.values()]
+            return {
+                "currencies": len(self._adjacency),
+                "pairs": len(self._pairs),
+                "quoted_pairs": len(self._quotes),
+                "oldest_quote_s": round(max(ages), 1) if ages else None,
+                "max_age_s": self.max_age_s,
+                **self.stats,
+            }
@@ -11,10 +11,24 @@ from .process_gateway import (
     RedisGateway,
     get_process_gateway
 )
+from .local_ipc_gateway import (
+    LOCAL_IPC_SUPPORTED,
+    LocalSocketGateway,
+    ScanStateBroker,
+    run_scanner_broker,
+    serve_scan_state,
+)
+from .scanner_supervisor import ScannerProcessSupervisor
 
 __all__ = [
     "ProcessGatewayInterface",
     "DatabaseGateway", 
     "RedisGateway",
-    "get_process_gateway"
+    "get_process_gateway",
+    "LocalSocketGateway",
+    "ScanStateBroker",
+    "run_scanner_broker",
+    "serve_scan_state",
+    "LOCAL_IPC_SUPPORTED",
+    "ScannerProcessSupervisor",
 ]
@@ -0,0 +1,473 @@
+"""
+Local IPC Gateway - Unix domain sockets, sin dependencias externas
+
+Trace_ID: ARCH-IPC-LOCAL-2026-001
+
+Topología:
+    Scanner (proceso propio) ── ScanStateBroker ──UDS──► LocalSocketGateway (orquestador / API)
+
+Responsabilidades:
+1. ScanStateBroker: mantiene en memoria el último estado por symbol|timeframe y
+   lo difunde a los suscriptores (snapshot al conectar + updates incrementales).
+2. LocalSocketGateway: espejo en memoria del estado del broker; las lecturas
+   (régimen, scanner state, heatmap) no tocan la base de datos.
+3. Reconexión automática: si el proceso scanner se reinicia, el gateway vuelve
+   a conectar y recibe un snapshot completo. Mientras no hay conexión se usa
+   el gateway de fallback (DatabaseGateway) si fue inyectado.
+4. Aislamiento: el socket vive en un directorio privado del usuario (0700) y
+   se deja en 0600 tras el bind; solo se borra un fichero existente si es un
+   socket huérfano (sin broker escuchando).
+
+En producción (start.py) el broker corre en un proceso supervisado propio
+(serve_scan_state): ScannerEngine publica cada resultado con
+publish_threadsafe() y el API (proceso uvicorn) lee del espejo sin tocar
+SQLite. ScannerEngine sigue en el proceso del orquestador: MainOrchestrator es
+el único planificador de escaneos (OPTION A) y el loop de trading consume los
+DataFrames en memoria.
+
+Protocolo: frames [uint32 big-endian longitud][JSON UTF-8]
+    broker → cliente: {"op": "snapshot", "cells": {...}} | {"op": "update", "key": k, "cell": {...}}
+    cliente → broker: {"op": "publish", "symbol": s, "timeframe": tf, "data": {...}}
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import stat
+import struct
+import tempfile
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .process_gateway import ProcessGatewayInterface
+
+logger = logging.getLogger(__name__)
+
+def _default_runtime_dir() -> str:
+    """Directorio privado del usuario: $XDG_RUNTIME_DIR/aethelgard o <tmp>/aethelgard-<uid>."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "aethelgard")
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"aethelgard-{uid}")
+
+
+# El socket nunca vive directamente en el tmp compartido (world-writable)
+DEFAULT_SOCKET_PATH = os.path.join(_default_runtime_dir(), "scanner.sock")
+
+# Unix domain sockets (no disponibles en Windows: ahí se usa DatabaseGateway)
+LOCAL_IPC_SUPPORTED = hasattr(socket, "AF_UNIX")
+
+# Protección contra frames corruptos o maliciosos
+MAX_FRAME_BYTES = 8 * 1024 * 1024
+
+# Frames pendientes por suscriptor antes de forzar un re-snapshot
+SUBSCRIBER_QUEUE_SIZE = 1024
+
+_HEADER = struct.Struct(">I")
+
+
+def ensure_private_socket_dir(socket_path: str) -> None:
+    """
+    Crea (0700) el directorio del socket y rechaza uno compartido.
+
+    El directorio debe ser propio, no un symlink y sin escritura para grupo/otros:
+    así nadie más puede sustituir el socket entre el bind y el chmod.
+    """
+    directory = os.path.dirname(os.path.abspath(socket_path))
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.lstat(directory)
+    if stat.S_ISLNK(info.st_mode) or not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"IPC socket directory is not a real directory: {directory}")
+    if hasattr(os, "getuid") and info.st_uid != os.getuid():
+        raise PermissionError(f"IPC socket directory is owned by another user: {directory}")
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise PermissionError(f"IPC socket directory is writable by other users: {directory}")
+
+
+def remove_orphaned_socket(socket_path: str) -> None:
+    """
+    Borra el socket de un broker anterior solo si es un socket y nadie escucha.
+
+    Un fichero que no es socket, o un socket con un broker vivo, no se toca.
+    """
+    try:
+        info = os.lstat(socket_path)
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(info.st_mode):
+        raise FileExistsError(f"Refusing to replace non-socket file: {socket_path}")
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except (ConnectionRefusedError, FileNotFoundError):
+        pass
+    else:
+        raise OSError(f"IPC socket already served by a live broker: {socket_path}")
+    finally:
+        probe.close()
+    try:
+        os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
+
+
+def _json_default(value: Any) -> Any:
+    """numpy scalars / enums / datetimes → tipos JSON."""
+    if hasattr(value, "item"):
+        return value.item()
+    if hasattr(value, "value"):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_frame(message: Dict[str, Any]) -> bytes:
+    payload = json.dumps(message, separators=(",", ":"), default=_json_default).encode("utf-8")
+    return _HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    """Lee un frame completo. None si el par cerró la conexión limpiamente."""
+    try:
+        header = await reader.readexactly(_HEADER.size)
+    except asyncio.IncompleteReadError:
+        return None
+    (length,) = _HEADER.unpack(header)
+    if length > MAX_FRAME_BYTES:
+        raise ValueError(f"IPC frame too large: {length} bytes")
+    return json.loads(await reader.readexactly(length))
+
+
+def build_cell(symbol: str, timeframe: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Misma forma que DatabaseGateway.publish_scan_result persiste en sys_market_pulse."""
+    regime = data.get("regime", "NORMAL")
+    return {
+        "symbol": symbol,
+        "timeframe": timeframe,
+        "regime": getattr(regime, "value", regime),
+        "metrics": data.get("metrics", {}),
+        "timestamp": data.get("timestamp") or datetime.now().isoformat(),
+        "scan_time": data.get("scan_time", 0),
+        "details": data.get("details", {}),
+    }
+
+
+class ScanStateBroker:
+    """
+    Productor: vive en el proceso scanner y sirve el estado por Unix socket.
+
+    Uso:
+        broker = ScanStateBroker(path); await broker.start()
+        broker.publish("EURUSD", "M5", {"regime": "TREND", "metrics": {...}})
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, queue_size: int = SUBSCRIBER_QUEUE_SIZE) -> None:
+        self.socket_path = socket_path
+        self.queue_size = queue_size
+        self.cells: Dict[str, Dict[str, Any]] = {}
+        self._clients: Dict[asyncio.StreamWriter, asyncio.Queue] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._socket_inode: Optional[int] = None
+        self.stats: Dict[str, int] = {"published": 0, "clients": 0, "resyncs": 0}
+
+    async def start(self) -> None:
+        ensure_private_socket_dir(self.socket_path)
+        remove_orphaned_socket(self.socket_path)  # socket huérfano de un proceso anterior
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+        self._socket_inode = os.lstat(self.socket_path).st_ino
+        logger.info(f"[LocalIPC] Broker listening on {self.socket_path}")
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for writer in list(self._clients):
+            writer.close()
+        self._clients.clear()
+        self._unlink_own_socket()
+
+    def _unlink_own_socket(self) -> None:
+        """Borra el socket solo si sigue siendo el que este broker creó."""
+        inode, self._socket_inode = self._socket_inode, None
+        try:
+            info = os.lstat(self.socket_path)
+        except FileNotFoundError:
+            return
+        if inode is not None and stat.S_ISSOCK(info.st_mode) and info.st_ino == inode:
+            os.unlink(self.socket_path)
+
+    def publish(self, symbol: str, timeframe: str, data: Dict[str, Any]) -> None:
+        """Actualiza el estado y lo difunde sin bloquear (O(suscriptores))."""
+        key = f"{symbol}|{timeframe}"
+        cell = build_cell(symbol, timeframe, data)
+        self.cells[key] = cell
+        self.stats["published"] += 1
+        if not self._clients:
+            return
+        frame = encode_frame({"op": "update", "key": key, "cell": cell})
+        for queue in self._clients.values():
+            self._offer(queue, frame)
+
+    def _snapshot_frame(self) -> bytes:
+        return encode_frame({"op": "snapshot", "cells": self.cells})
+
+    def _offer(self, queue: asyncio.Queue, frame: bytes) -> None:
+        try:
+            queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            # Suscriptor lento: descartar pendientes y re-sincronizar con snapshot
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(self._snapshot_frame())
+            self.stats["resyncs"] += 1
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        queue.put_nowait(self._snapshot_frame())
+        self._clients[writer] = queue
+        self.stats["clients"] += 1
+        sender = asyncio.create_task(self._drain(queue, writer))
+        try:
+            while True:
+                message = await read_frame(reader)
+                if message is None:
+                    break
+                if message.get("op") == "publish":
+                    self.publish(message["symbol"], message["timeframe"], message.get("data") or {})
+        except (ConnectionError, ValueError, KeyError) as e:
+            logger.warning(f"[LocalIPC] Dropping subscriber: {e}")
+        finally:
+            sender.cancel()
+            self._clients.pop(writer, None)
+            writer.close()
+
+    @staticmethod
+    async def _drain(queue: asyncio.Queue, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                writer.write(await queue.get())
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+
+
+class LocalSocketGateway(ProcessGatewayInterface):
+    """
+    Consumidor: espejo en memoria del ScanStateBroker.
+
+    Ventajas frente a DatabaseGateway:
+    - ✅ Lecturas en memoria (sin round-trips a SQLite)
+    - ✅ Push: los updates llegan al publicarse, sin polling
+    - ✅ Sin dependencias externas (stdlib asyncio)
+
+    Desventajas:
+    - ❌ Solo local (mismo host)
+    - ❌ Sin persistencia: el estado vive en el proceso scanner
+    """
+
+    def __init__(
+        self,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        fallback: Optional[ProcessGatewayInterface] = None,
+        reconnect_delay: float = 0.2,
+        max_reconnect_delay: float = 5.0,
+    ) -> None:
+        self.socket_path = socket_path
+        self.fallback = fallback
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.cells: Dict[str, Dict[str, Any]] = {}
+        self._published: Dict[str, Dict[str, Any]] = {}
+        self._ready = asyncio.Event()
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats: Dict[str, int] = {"connects": 0, "updates": 0, "fallback_reads": 0}
+        logger.info("[ProcessGateway] Initialized with Local IPC backend")
+
+    # ─── Ciclo de vida ───────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="local-ipc-gateway")
+
+    async def wait_ready(self, timeout: float = 5.0) -> bool:
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def connected(self) -> bool:
+        return self._ready.is_set()
+
+    async def _run(self) -> None:
+        delay = self.reconnect_delay
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self.socket_path)
+            except OSError:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+                continue
+            delay = self.reconnect_delay
+            self._writer = writer
+            self.stats["connects"] += 1
+            # Broker reiniciado: re-publicar el último estado propio de cada celda
+            for message in self._published.values():
+                writer.write(encode_frame(message))
+            try:
+                while True:
+                    message = await read_frame(reader)
+                    if message is None:
+                        break
+                    self._apply(message)
+            except (ConnectionError, ValueError) as e:
+                logger.warning(f"[LocalIPC] Connection to broker lost: {e}")
+            finally:
+                self._writer = None
+                self._ready.clear()
+                writer.close()
+
+    def _apply(self, message: Dict[str, Any]) -> None:
+        op = message.get("op")
+        if op == "snapshot":
+            self.cells = dict(message.get("cells") or {})
+            self._ready.set()
+        elif op == "update":
+            self.cells[message["key"]] = message["cell"]
+            self.stats["updates"] += 1
+
+    def _use_fallback(self) -> bool:
+        if not self.connected and self.fallback is not None:
+            self.stats["fallback_reads"] += 1
+            return True
+        return False
+
+    # ─── ProcessGatewayInterface ─────────────────────────────────────────────
+
+    async def get_latest_regime(self, symbol: str, timeframe: str) -> Optional[Dict[str, Any]]:
+        if self._use_fallback():
+            return await self.fallback.get_latest_regime(symbol, timeframe)
+        cell = self.cells.get(f"{symbol}|{timeframe}")
+        if cell is None:
+            return None
+        return {
+            "symbol": cell["symbol"],
+            "timeframe": cell["timeframe"],
+            "regime": cell.get("regime", "NORMAL"),
+            "metrics": cell.get("metrics", {}),
+            "timestamp": cell.get("timestamp"),
+        }
+
+    async def get_scanner_state(self) -> Dict[str, Any]:
+        if self._use_fallback():
+            return await self.fallback.get_scanner_state()
+        if not self.cells:
+            return {"error": "no_data", "source": "local_ipc"}
+        cells = list(self.cells.values())
+        return {
+            "assets": sorted({c["symbol"] for c in cells}),
+            "timeframes": sorted({c["timeframe"] for c in cells}),
+            "regimes": {key: c.get("regime", "NORMAL") for key, c in self.cells.items()},
+            "scan_times": {key: c.get("scan_time", 0) for key, c in self.cells.items()},
+            "source": "local_ipc",
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    async def get_market_heatmap_state(self) -> List[Dict[str, Any]]:
+        if self._use_fallback():
+            return await self.fallback.get_market_heatmap_state()
+        return [
+            {
+                "symbol": c["symbol"],
+                "timeframe": c["timeframe"],
+                "regime": c.get("regime", "NORMAL"),
+                "metrics": c.get("metrics", {}),
+                "timestamp": c.get("timestamp"),
+                "scan_time": c.get("scan_time", 0),
+                "source": "local_ipc",
+            }
+            for c in self.cells.values()
+        ]
+
+    async def publish_scan_result(self, symbol: str, timeframe: str, data: Dict[str, Any]) -> None:
+        writer = self._writer
+        if writer is None:
+            if self.fallback is not None:
+                await self.fallback.publish_scan_result(symbol, timeframe, data)
+            else:
+                logger.warning(f"[LocalIPC] Broker unavailable, dropped scan result {symbol}|{timeframe}")
+            return
+        try:
+            writer.write(encode_frame({"op": "publish", "symbol": symbol, "timeframe": timeframe, "data": data}))
+            await writer.drain()
+        except ConnectionError as e:
+            logger.error(f"[LocalIPC] Error publishing scan result: {e}")
+
+    def publish_threadsafe(self, symbol: str, timeframe: str, data: Dict[str, Any]) -> None:
+        """
+        Publicación desde hilos de trabajo (ScannerEngine): nunca bloquea al
+        llamador; el frame se escribe en el loop del gateway.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        message = {"op": "publish", "symbol": symbol, "timeframe": timeframe, "data": data}
+        loop.call_soon_threadsafe(self._publish_now, f"{symbol}|{timeframe}", message)
+
+    def _publish_now(self, key: str, message: Dict[str, Any]) -> None:
+        self._published[key] = message
+        writer = self._writer
+        if writer is None:
+            return
+        try:
+            writer.write(encode_frame(message))
+        except (ConnectionError, RuntimeError) as e:
+            logger.debug(f"[LocalIPC] Publish deferred until reconnect: {e}")
+
+    async def health_check(self) -> bool:
+        return self.connected
+
+
+async def serve_scan_state(broker: ScanStateBroker) -> None:
+    """scan_loop de solo-broker: sirve el estado publicado hasta que el proceso termine."""
+    await asyncio.Event().wait()
+
+
+def run_scanner_broker(
+    socket_path: str,
+    scan_loop: Callable[[ScanStateBroker], Awaitable[None]],
+) -> None:
+    """
+    Entry point del proceso scanner (target de ScannerProcessSupervisor).
+
+    scan_loop recibe el broker y publica con broker.publish(...) hasta terminar.
+    Debe ser una función de módulo (picklable con el start method 'spawn').
+    """
+    async def _main() -> None:
+        broker = ScanStateBroker(socket_path)
+        await broker.start()
+        try:
+            await scan_loop(broker)
+        finally:
+            await broker.stop()
+
+    asyncio.run(_main())
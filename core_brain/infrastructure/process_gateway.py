@@ -242,21 +242,27 @@ class RedisGateway(ProcessGatewayInterface):
         raise NotImplementedError("Redis gateway not yet implemented")
 
 
-def get_process_gateway(storage: 'StorageManager', db_type: str = "database") -> ProcessGatewayInterface:
+def get_process_gateway(
+    storage: 'StorageManager',
+    db_type: str = "database",
+    socket_path: Optional[str] = None,
+) -> ProcessGatewayInterface:
     """
     Factory function para obtener la gateway apropiada.
     Patrón: Factory + Dependency Injection.
     
     Args:
         storage: StorageManager instance para acceso a datos
-        db_type: Tipo de gateway ('database' o 'redis')
+        db_type: Tipo de gateway ('database' o 'local')
+        socket_path: Unix socket del ScanStateBroker (solo 'local')
     
     Returns:
         ProcessGatewayInterface implementation
-    
-    En el futuro:
-    - Chequear si Redis disponible
-    - Fallback a Database
+
+    'local' devuelve un LocalSocketGateway con DatabaseGateway como fallback;
+    el llamador debe invocar `await gateway.start()`.
     """
-    # Por ahora, siempre usar Database
+    if db_type == "local":
+        from .local_ipc_gateway import DEFAULT_SOCKET_PATH, LocalSocketGateway
+        return LocalSocketGateway(socket_path or DEFAULT_SOCKET_PATH, fallback=DatabaseGateway(storage))
     return DatabaseGateway(storage)
@@ -0,0 +1,116 @@
+"""
+Scanner Process Supervisor - Mantiene vivo el proceso scanner independiente
+
+Trace_ID: ARCH-IPC-LOCAL-2026-001
+
+Responsabilidades:
+1. Lanzar el scanner en su propio proceso (GIL propio): escaneos intensivos en
+   CPU no degradan la latencia del API ni del loop de trading.
+2. Detectar la caída del proceso y reiniciarlo con backoff exponencial.
+3. Resetear el backoff cuando el proceso se mantuvo estable `stable_after` s.
+
+El target típico es local_ipc_gateway.run_scanner_broker; los consumidores
+(LocalSocketGateway) se reconectan solos tras cada reinicio.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ScannerProcessSupervisor:
+    """
+    Uso:
+        supervisor = ScannerProcessSupervisor(run_scanner_broker, args=(path, scan_loop))
+        supervisor.start()
+        task = asyncio.create_task(supervisor.supervise())
+        ...
+        supervisor.stop()
+    """
+
+    def __init__(
+        self,
+        target: Callable[..., Any],
+        args: Tuple[Any, ...] = (),
+        name: str = "aethelgard-scanner",
+        restart_delay: float = 1.0,
+        max_restart_delay: float = 30.0,
+        stable_after: float = 60.0,
+        poll_interval: float = 0.5,
+        start_method: str = "spawn",
+    ) -> None:
+        self.target = target
+        self.args = args
+        self.name = name
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.stable_after = stable_after
+        self.poll_interval = poll_interval
+        self._ctx = multiprocessing.get_context(start_method)
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._started_at = 0.0
+        self._next_delay = restart_delay
+        self._stopping = False
+        self.stats: Dict[str, Any] = {"starts": 0, "restarts": 0, "last_exitcode": None}
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process is not None else None
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def start(self) -> None:
+        """Lanza el proceso (no-op si ya está vivo)."""
+        if self.is_alive:
+            return
+        self._stopping = False
+        self._process = self._ctx.Process(target=self.target, args=self.args, name=self.name, daemon=True)
+        self._process.start()
+        self._started_at = time.monotonic()
+        self.stats["starts"] += 1
+        logger.info(f"[SUPERVISOR] {self.name} started (pid={self._process.pid})")
+
+    async def supervise(self) -> None:
+        """Bucle de vigilancia: reinicia el proceso cuando termina inesperadamente."""
+        while not self._stopping:
+            await asyncio.sleep(self.poll_interval)
+            if self._stopping or self.is_alive:
+                continue
+            await self._restart()
+
+    async def _restart(self) -> None:
+        exitcode = self._process.exitcode if self._process is not None else None
+        self.stats["last_exitcode"] = exitcode
+        if time.monotonic() - self._started_at >= self.stable_after:
+            self._next_delay = self.restart_delay
+        delay = self._next_delay
+        self._next_delay = min(self._next_delay * 2, self.max_restart_delay)
+        logger.error(
+            f"[SUPERVISOR] {self.name} exited (code={exitcode}) - restarting in {delay:.1f}s"
+        )
+        await asyncio.sleep(delay)
+        if self._stopping:
+            return
+        self.start()
+        self.stats["restarts"] += 1
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Detiene la vigilancia y termina el proceso (terminate → kill)."""
+        self._stopping = True
+        process = self._process
+        if process is None:
+            return
+        if process.is_alive():
+            process.terminate()
+            process.join(timeout)
+            if process.is_alive():
+                process.kill()
+                process.join(timeout)
+        self.stats["last_exitcode"] = process.exitcode
+        logger.info(f"[SUPERVISOR] {self.name} stopped (code={process.exitcode})")
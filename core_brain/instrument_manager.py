@@ -56,6 +56,8 @@ class InstrumentManager:
     - Multiplicadores de riesgo por instrumento
     - Fallback conservador para símbolos desconocidos
     """
+
+    MAX_UNCLASSIFIED = 1024  # negative-cache cap: cleared when full
     
     def __init__(
         self,
@@ -91,6 +93,7 @@ class InstrumentManager:
             logger.warning("InstrumentManager initialized without storage/config. Using safe defaults.")
             self.config = self._get_default_config()
         self.symbol_cache: Dict[str, InstrumentConfig] = {}
+        self._unclassified: set = set()  # symbols _auto_classify already failed on (bounded)
         self._build_symbol_cache()
         logger.info(
             f"InstrumentManager initialized with {len(self.symbol_cache)} pre-cached symbols (SSOT)"
@@ -194,15 +197,25 @@ class InstrumentManager:
         if normalized_symbol in self.symbol_cache:
             return self.symbol_cache[normalized_symbol]
         
+        if normalized_symbol in self._unclassified:
+            return None
+        
         # Try auto-classification
         config = self._auto_classify(normalized_symbol)
         if config:
             self.symbol_cache[normalized_symbol] = config
             return config
         
+        if len(self._unclassified) >= self.MAX_UNCLASSIFIED:
+            self._unclassified.clear()
+        self._unclassified.add(normalized_symbol)
         logger.warning(f"Symbol {symbol} not found in configuration")
         return None
     
+    def forget_unclassified(self) -> None:
+        """Retry auto-classification of every symbol it previously failed on."""
+        self._unclassified.clear()
+
     def _auto_classify(self, symbol: str) -> Optional[InstrumentConfig]:
         """
         Auto-classify symbol based on naming patterns.
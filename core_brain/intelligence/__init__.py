@@ -6,11 +6,13 @@ Consolidates all signal quality and learning logic.
 Components:
   - signal_quality_scorer: Unified signal quality authority (technical + contextual)
   - consensus_engine: Multi-strategy consensus detection and bonus calculation
+  - signal_window_index: Time-bucketed in-memory window of recent signals
   - failure_pattern_registry: Autonomous failure correlation learning
 """
 
 from .signal_quality_scorer import SignalQualityScorer, SignalQualityGrade, SignalQualityResult
 from .consensus_engine import ConsensusEngine, ConsensusAnalysis
+from .signal_window_index import IndexedSignal, SignalWindowIndex, get_signal_window_index
 from .failure_pattern_registry import FailurePatternRegistry, FailurePattern
 
 __all__ = [
@@ -19,6 +21,9 @@ __all__ = [
     "SignalQualityResult",
     "ConsensusEngine",
     "ConsensusAnalysis",
+    "SignalWindowIndex",
+    "IndexedSignal",
+    "get_signal_window_index",
     "FailurePatternRegistry",
     "FailurePattern",
 ]
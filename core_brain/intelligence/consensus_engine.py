@@ -8,7 +8,8 @@ Responsibility:
   - Differentiate between STRONG consensus (>0.75) and WEAK consensus (0.50-0.75)
 
 Architecture:
-  - Consumes: Current signal + recent_signals from time window
+  - Consumes: Current signal + recent_signals from time window, or the injected
+    SignalWindowIndex (O(matches) lookup, no per-call storage fetch or re-parsing)
   - Returns: Consensus bonus (0.0-0.2) as float ratio
   - Persists: Consensus events for learning (sys_consensus_events table)
 
@@ -24,6 +25,8 @@ from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 
+from core_brain.intelligence.signal_window_index import SignalWindowIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,13 +63,21 @@ class ConsensusEngine:
     # Bonus tiers
     BONUS_STRONG_CONSENSUS = 0.20  # +20% bonus for A+ consensus
     BONUS_WEAK_CONSENSUS = 0.10  # +10% bonus for B/C consensus
+    MIN_AGREEING_CONFIDENCE = 0.55
 
-    def __init__(self, storage_manager: Any):
+    def __init__(
+        self,
+        storage_manager: Any,
+        signal_index: Optional[SignalWindowIndex] = None,
+    ):
         """
         Args:
             storage_manager: StorageManager for persistence and consensus history
+            signal_index: Optional in-memory window of recent signals; once ready it
+                replaces the recent_signals scan
         """
         self.storage = storage_manager
+        self.signal_index = signal_index
         self.logger = logging.getLogger(self.__class__.__name__)
 
     async def compute_bonus(
@@ -84,12 +95,13 @@ class ConsensusEngine:
 
         Args:
             current_signal: Signal being assessed
-            recent_signals: List of recent signals in time window (last 5 min)
+            recent_signals: List of recent signals in time window (last 5 min).
+                Ignored when the signal index is ready.
 
         Returns:
             Bonus as float ratio (0.0-0.2)
         """
-        if not recent_signals:
+        if not self.uses_signal_index and not recent_signals:
             return 0.0  # No consensus without recent signal history
 
         try:
@@ -102,9 +114,14 @@ class ConsensusEngine:
             current_score = current_signal.get("confidence", 0.5)
 
             # Step 2: Find agreeing signals in time window
-            agreeing_signals = self._find_agreeing_signals(
-                symbol, direction, recent_signals, current_signal
-            )
+            if self.uses_signal_index:
+                agreeing_signals = self._find_agreeing_indexed(
+                    symbol, direction, current_signal
+                )
+            else:
+                agreeing_signals = self._find_agreeing_signals(
+                    symbol, direction, recent_signals, current_signal
+                )
 
             if not agreeing_signals:
                 return 0.0  # No consensus
@@ -157,6 +174,35 @@ class ConsensusEngine:
             self.logger.error(f"Error computing consensus bonus: {e}")
             return 0.0  # Safe default on error
 
+    @property
+    def uses_signal_index(self) -> bool:
+        """True once the injected signal index has been warmed and can be trusted."""
+        return self.signal_index is not None and self.signal_index.ready
+
+    def _find_agreeing_indexed(
+        self,
+        symbol: str,
+        direction: str,
+        current_signal: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """
+        Same agreement criteria as _find_agreeing_signals, answered by the index.
+
+        Scoped like the sys_signals fetch it replaces: same timeframe only, and the
+        current signal is not excluded by id (its own strategy already drops it).
+        """
+        metadata = current_signal.get("metadata") or {}
+        current_strategy = metadata.get("strategy_id", "")
+        matches = self.signal_index.query(
+            symbol,
+            direction,
+            self.CONSENSUS_WINDOW_MINUTES,
+            timeframe=current_signal.get("timeframe", "M5"),
+            exclude_strategy=current_strategy,
+            min_confidence=self.MIN_AGREEING_CONFIDENCE,
+        )
+        return [entry.as_dict() for entry in matches if entry.strategy]
+
     def _find_agreeing_signals(
         self,
         symbol: str,
@@ -185,7 +231,7 @@ class ConsensusEngine:
                 continue
 
             # Check minimum score
-            if sig.get("confidence", 0.0) < 0.55:
+            if sig.get("confidence", 0.0) < self.MIN_AGREEING_CONFIDENCE:
                 continue
 
             # Check different strategy
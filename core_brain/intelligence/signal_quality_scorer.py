@@ -112,7 +112,9 @@ class SignalQualityScorer:
 
             # Step 2: Compute consensus bonus (part of contextual score)
             consensus_bonus = 0.0
-            if self.consensus_engine and recent_signals:
+            if self.consensus_engine and (
+                recent_signals or getattr(self.consensus_engine, "uses_signal_index", False)
+            ):
                 consensus_bonus = await self.consensus_engine.compute_bonus(
                     signal, recent_signals
                 )
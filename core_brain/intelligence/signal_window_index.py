@@ -0,0 +1,280 @@
+"""
+signal_window_index.py — Time-bucketed in-memory index of recent signals (PHASE 4)
+
+Responsibility:
+  - Keep every signal created in the last HORIZON minutes in memory, keyed by
+    (symbol, direction) → (timeframe, strategy) → time-ordered series
+  - Answer "agreeing / conflicting signals in the last N minutes" by walking only
+    the matching series from the newest end (cost O(matches), not O(recent volume))
+  - Evict whole time buckets as the clock advances (no per-query re-parsing of
+    created_at, no storage round-trip per signal)
+
+Architecture:
+  - Fed on signal creation (SignalFactory) and warmed once from sys_signals at boot
+  - Consumed by ConsensusEngine and SignalSelector (injected, optional)
+  - One index per process and scope (tenant), via get_signal_window_index()
+
+Rule:
+  - NO broker/connector imports (agnostic rule #4)
+  - Storage is only read during warm-up (SSOT rule #15 — sys_signals stays the record)
+  - 100% type hints (quality rule #5)
+"""
+
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+PairKey = Tuple[str, str]    # (symbol, direction)
+SeriesKey = Tuple[str, str]  # (timeframe, strategy)
+
+
+def _ts(entry: "IndexedSignal") -> float:
+    return entry.ts
+
+
+def _as_text(value: Any) -> str:
+    if isinstance(value, Enum):
+        return str(value.value)
+    return "" if value is None else str(value)
+
+
+def _parse_created_at(value: Any) -> Optional[datetime]:
+    """Parse a sys_signals timestamp (ISO or 'YYYY-MM-DD HH:MM:SS', naive = UTC)."""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class IndexedSignal:
+    """Immutable view of one indexed signal (created_at parsed once, on insert)."""
+    signal_id: str
+    symbol: str
+    direction: str
+    timeframe: str
+    strategy: str
+    confidence: float
+    price: float
+    created_at: datetime
+    ts: float = field(repr=False)
+
+    def age_minutes(self, now_ts: float) -> float:
+        return (now_ts - self.ts) / 60.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Row shape consumers already read from get_recent_sys_signals()."""
+        return {
+            "signal_id": self.signal_id,
+            "symbol": self.symbol,
+            "signal_type": self.direction,
+            "timeframe": self.timeframe,
+            "strategy": self.strategy,
+            "confidence": self.confidence,
+            "price": self.price,
+            "created_at": self.created_at,
+            "metadata": {"strategy_id": self.strategy},
+        }
+
+
+class SignalWindowIndex:
+    """
+    Sliding window of recent signals, bucketed by `bucket_seconds`.
+
+    Queries never look further back than `horizon_minutes`; longer windows are
+    clipped to the horizon (same bound as the 120-minute sys_signals fetch the
+    trade cycle used before).
+    """
+
+    DEFAULT_HORIZON_MINUTES = 120
+    DEFAULT_BUCKET_SECONDS = 60
+    WARMUP_LIMIT = 5000
+
+    def __init__(
+        self,
+        horizon_minutes: int = DEFAULT_HORIZON_MINUTES,
+        bucket_seconds: int = DEFAULT_BUCKET_SECONDS,
+    ) -> None:
+        self.horizon_seconds = horizon_minutes * 60
+        self.bucket_seconds = bucket_seconds
+        self._pairs: Dict[PairKey, Dict[SeriesKey, List[IndexedSignal]]] = {}
+        self._buckets: Dict[int, Set[Tuple[PairKey, SeriesKey]]] = {}
+        self._bucket_heap: List[int] = []
+        self._ids: Set[str] = set()
+        self._lock = threading.Lock()
+        self.ready = False
+        self.stats: Dict[str, int] = {"recorded": 0, "evicted": 0, "duplicates": 0}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    # ─── Feeding ─────────────────────────────────────────────────────────────
+
+    def record(
+        self,
+        signal_id: str,
+        symbol: str,
+        direction: Any,
+        timeframe: Optional[str],
+        strategy: Optional[str],
+        confidence: Optional[float] = None,
+        price: Optional[float] = None,
+        created_at: Any = None,
+    ) -> Optional[IndexedSignal]:
+        """Insert one signal. Returns None when it is a duplicate or already expired."""
+        created = _parse_created_at(created_at) or datetime.now(timezone.utc)
+        entry = IndexedSignal(
+            signal_id=str(signal_id),
+            symbol=symbol,
+            direction=_as_text(direction),
+            timeframe=timeframe or "",
+            strategy=strategy or "",
+            confidence=float(confidence if confidence is not None else 0.5),
+            price=float(price or 0.0),
+            created_at=created,
+            ts=created.timestamp(),
+        )
+        now_ts = time.time()
+        with self._lock:
+            self._evict(now_ts)
+            if entry.signal_id in self._ids:
+                self.stats["duplicates"] += 1
+                return None
+            if entry.ts < now_ts - self.horizon_seconds:
+                return None
+            pair = (entry.symbol, entry.direction)
+            key = (entry.timeframe, entry.strategy)
+            series = self._pairs.setdefault(pair, {}).setdefault(key, [])
+            if series and series[-1].ts > entry.ts:
+                series.insert(bisect_left(series, entry.ts, key=_ts), entry)
+            else:
+                series.append(entry)
+            bucket = int(entry.ts // self.bucket_seconds)
+            if bucket not in self._buckets:
+                self._buckets[bucket] = set()
+                heapq.heappush(self._bucket_heap, bucket)
+            self._buckets[bucket].add((pair, key))
+            self._ids.add(entry.signal_id)
+            self.stats["recorded"] += 1
+        return entry
+
+    def record_signal(self, signal: Any, signal_id: Optional[str] = None) -> Optional[IndexedSignal]:
+        """Insert a Signal model or a sys_signals row dict."""
+        get = signal.get if isinstance(signal, dict) else (lambda k, d=None: getattr(signal, k, d))
+        metadata = get("metadata")
+        if not isinstance(metadata, dict):
+            metadata = {}
+        signal_id = (
+            signal_id or get("id") or get("signal_id")
+            or metadata.get("signal_id") or get("trace_id")
+        )
+        if not signal_id:
+            return None
+        return self.record(
+            signal_id=signal_id,
+            symbol=get("symbol", ""),
+            direction=get("signal_type"),
+            timeframe=get("timeframe"),
+            strategy=get("strategy_id") or metadata.get("strategy_id") or get("strategy"),
+            confidence=get("confidence"),
+            price=get("entry_price") or get("price"),
+            created_at=get("created_at"),
+        )
+
+    def warm_from_storage(self, storage: Any) -> int:
+        """Load the current horizon from sys_signals once, then mark the index ready."""
+        rows = storage.get_recent_sys_signals(
+            minutes=self.horizon_seconds // 60, limit=self.WARMUP_LIMIT
+        ) or []
+        loaded = sum(1 for row in rows if self.record_signal(row) is not None)
+        self.ready = True
+        logger.info(f"[SIGNAL_INDEX] Warmed with {loaded} signals ({self.horizon_seconds // 60} min horizon)")
+        return loaded
+
+    # ─── Queries ─────────────────────────────────────────────────────────────
+
+    def query(
+        self,
+        symbol: str,
+        direction: Any,
+        minutes: float,
+        timeframe: Optional[str] = None,
+        exclude_timeframe: Optional[str] = None,
+        exclude_strategy: Optional[str] = None,
+        min_confidence: Optional[float] = None,
+        exclude_ids: Iterable[str] = (),
+        now_ts: Optional[float] = None,
+    ) -> List[IndexedSignal]:
+        """Signals for (symbol, direction) created in the last `minutes`, newest series first."""
+        now_ts = time.time() if now_ts is None else now_ts
+        since = now_ts - min(minutes * 60, self.horizon_seconds)
+        excluded = {i for i in exclude_ids if i}
+        matches: List[IndexedSignal] = []
+        with self._lock:
+            self._evict(now_ts)
+            for (tf, strategy), series in self._pairs.get((symbol, _as_text(direction)), {}).items():
+                if timeframe is not None and tf != timeframe:
+                    continue
+                if exclude_timeframe is not None and tf == exclude_timeframe:
+                    continue
+                if exclude_strategy is not None and strategy == exclude_strategy:
+                    continue
+                for entry in reversed(series):
+                    if entry.ts < since:
+                        break
+                    if entry.signal_id in excluded:
+                        continue
+                    if min_confidence is not None and entry.confidence < min_confidence:
+                        continue
+                    matches.append(entry)
+        return matches
+
+    # ─── Eviction ────────────────────────────────────────────────────────────
+
+    def _evict(self, now_ts: float) -> None:
+        cutoff_bucket = int((now_ts - self.horizon_seconds) // self.bucket_seconds)
+        while self._bucket_heap and self._bucket_heap[0] < cutoff_bucket:
+            bucket = heapq.heappop(self._bucket_heap)
+            boundary = (bucket + 1) * self.bucket_seconds
+            for pair, key in self._buckets.pop(bucket, ()):
+                series_by_key = self._pairs.get(pair)
+                series = series_by_key.get(key) if series_by_key else None
+                if not series:
+                    continue
+                cut = bisect_left(series, boundary, key=_ts)
+                for entry in series[:cut]:
+                    self._ids.discard(entry.signal_id)
+                self.stats["evicted"] += cut
+                del series[:cut]
+                if not series:
+                    del series_by_key[key]
+                    if not series_by_key:
+                        del self._pairs[pair]
+
+
+# ─── Process-wide registry ───────────────────────────────────────────────────
+
+_indexes: Dict[str, SignalWindowIndex] = {}
+_registry_lock = threading.Lock()
+
+
+def get_signal_window_index(scope: Optional[str] = None) -> SignalWindowIndex:
+    """Return the process-wide index for `scope` (tenant id, or 'default')."""
+    scope = scope or "default"
+    with _registry_lock:
+        index = _indexes.get(scope)
+        if index is None:
+            index = _indexes[scope] = SignalWindowIndex()
+        return index
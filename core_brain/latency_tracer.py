@@ -0,0 +1,391 @@
+"""
+LatencyTracer — In-process span tracing for the orchestrator cycle.
+====================================================================
+TRACE_ID: PERF-CYCLE-TRACING-2026-001
+
+Responsibility:
+  - ``span()`` context managers / ``traced()`` decorators around hot paths
+    (provider fetch, indicator math, strategy evaluation, dedup queries,
+    risk checks, broker calls, position monitoring).
+  - One HDR-style (log-linear, ~1.6% relative error) latency histogram per
+    span, plus per-symbol and per-strategy breakdowns.
+  - On-demand sampling profile of a single cycle: a daemon thread samples the
+    cycle thread's stack every few ms (folded stacks, flamegraph-compatible)
+    and the cycle's span timeline is captured alongside.
+
+Architecture:
+  - Process-wide singleton (``get_latency_tracer()``), like the notifier.
+  - The API runs in a separate process, so the snapshot is published to
+    ``sys_config.cycle_latency_snapshot`` (throttled) and profile requests
+    arrive through ``sys_config.cycle_profile_request`` — the same channel the
+    OEM health snapshot uses.
+
+Rule: cost when enabled is two perf_counter() calls plus a locked dict update
+per span; when disabled ``span()`` returns a shared no-op context.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_CONFIG_KEY = "cycle_latency_snapshot"
+PROFILE_REQUEST_CONFIG_KEY = "cycle_profile_request"
+TRACING_ENABLED_CONFIG_KEY = "cycle_tracing_enabled"
+
+_SUB_BUCKET_BITS = 7
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS            # 128 linear buckets (µs) before going log
+_HALF_SUB_BUCKETS = _SUB_BUCKETS >> 1
+_MAX_DIMENSION_VALUES = 256                     # per span and dimension (symbol/strategy)
+_MAX_PROFILE_SPANS = 5_000
+_MAX_PROFILE_STACK_DEPTH = 64
+
+
+class LatencyHistogram:
+    """
+    HDR-style histogram over microseconds.
+
+    Values below 128µs get exact buckets; above, every power-of-two range is
+    split in 64 sub-buckets, so any recorded value is reported within ~1.6%.
+    Buckets are sparse (dict), so idle spans cost almost nothing.
+    """
+
+    __slots__ = ("counts", "count", "total_us", "min_us", "max_us")
+
+    def __init__(self) -> None:
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    @staticmethod
+    def bucket_index(value_us: int) -> int:
+        if value_us < _SUB_BUCKETS:
+            return value_us
+        shift = value_us.bit_length() - _SUB_BUCKET_BITS
+        return _SUB_BUCKETS + (shift - 1) * _HALF_SUB_BUCKETS + (value_us >> shift) - _HALF_SUB_BUCKETS
+
+    @staticmethod
+    def bucket_upper_bound(index: int) -> int:
+        if index < _SUB_BUCKETS:
+            return index
+        offset = index - _SUB_BUCKETS
+        shift = offset // _HALF_SUB_BUCKETS + 1
+        mantissa = offset % _HALF_SUB_BUCKETS + _HALF_SUB_BUCKETS
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, value_us: int) -> None:
+        value_us = max(0, value_us)
+        index = self.bucket_index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        if self.count == 0 or value_us < self.min_us:
+            self.min_us = value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+        self.count += 1
+        self.total_us += value_us
+
+    def percentile(self, q: float) -> int:
+        """Highest equivalent value (µs) below which ``q`` percent of samples fall."""
+        if self.count == 0:
+            return 0
+        rank = max(1, int(round(q / 100.0 * self.count)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.bucket_upper_bound(index), self.max_us)
+        return self.max_us
+
+    def summary(self) -> Dict[str, float]:
+        to_ms = 1e-3
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_us / self.count * to_ms, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50) * to_ms, 3),
+            "p90_ms": round(self.percentile(90) * to_ms, 3),
+            "p99_ms": round(self.percentile(99) * to_ms, 3),
+            "max_ms": round(self.max_us * to_ms, 3),
+        }
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_symbol", "_strategy", "_t0")
+
+    def __init__(self, tracer: "LatencyTracer", name: str, symbol: Optional[str], strategy: Optional[str]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._symbol = symbol
+        self._strategy = strategy
+
+    def __enter__(self) -> "_Span":
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._tracer._record(self._name, self._t0, time.perf_counter(), self._symbol, self._strategy)
+
+
+class _StackSampler(threading.Thread):
+    """Samples one thread's Python stack at a fixed interval (folded-stack counts)."""
+
+    def __init__(self, target_thread_id: int, interval_s: float) -> None:
+        super().__init__(name="cycle-profile-sampler", daemon=True)
+        self._target = target_thread_id
+        self._interval = interval_s
+        self._stop_event = threading.Event()
+        self.stacks: Counter = Counter()
+        self.samples = 0
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is None:
+                continue
+            names: List[str] = []
+            while frame is not None and len(names) < _MAX_PROFILE_STACK_DEPTH:
+                code = frame.f_code
+                names.append(f"{code.co_filename.rsplit('/', 1)[-1]}:{code.co_name}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+            self.samples += 1
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join(timeout=1.0)
+
+
+class LatencyTracer:
+    """
+    Span registry with HDR histograms and on-demand single-cycle profiles.
+
+    Args:
+        enabled:            False → ``span()`` is a no-op.
+        publish_interval_s: Minimum seconds between snapshot writes in ``sync()``.
+    """
+
+    def __init__(self, enabled: bool = True, publish_interval_s: float = 10.0) -> None:
+        self.enabled = enabled
+        self.publish_interval_s = publish_interval_s
+        self._lock = threading.Lock()
+        self._spans: Dict[str, LatencyHistogram] = {}
+        self._by_symbol: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._by_strategy: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._started_at = datetime.now(timezone.utc)
+        self._last_publish = 0.0
+        self._last_request_id: Optional[str] = None
+        self._synced_once = False
+        self._profile_request: Optional[Dict[str, Any]] = None
+        self._profile_timeline: Optional[List[Tuple[str, float, float, Optional[str], Optional[str]]]] = None
+        self._profile_t0 = 0.0
+        self.last_profile: Optional[Dict[str, Any]] = None
+
+    # ── Instrumentation API ───────────────────────────────────────────────────
+
+    def span(self, name: str, symbol: Optional[str] = None, strategy: Optional[str] = None) -> Any:
+        """Context manager timing the enclosed block under ``name``."""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return _Span(self, name, symbol, strategy)
+
+    def traced(self, name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Decorator form of ``span()`` for sync and async callables."""
+        def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+            if asyncio.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                    with self.span(name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self.span(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorate
+
+    def record(self, name: str, seconds: float, symbol: Optional[str] = None, strategy: Optional[str] = None) -> None:
+        """Record an externally measured duration."""
+        if self.enabled:
+            end = time.perf_counter()
+            self._record(name, end - seconds, end, symbol, strategy)
+
+    @contextmanager
+    def cycle(self) -> Iterator[None]:
+        """
+        Wrap one orchestrator cycle: records the ``cycle`` span and, when a
+        profile was requested, samples this cycle's stack and span timeline.
+        """
+        request = self._profile_request if self.enabled else None
+        sampler: Optional[_StackSampler] = None
+        if request is not None:
+            self._profile_request = None
+            sampler = _StackSampler(threading.get_ident(), float(request.get("sample_interval_ms", 5)) / 1000.0)
+            with self._lock:
+                self._profile_timeline = []
+                self._profile_t0 = time.perf_counter()
+            sampler.start()
+        try:
+            with self.span("cycle"):
+                yield
+        finally:
+            if sampler is not None:
+                sampler.stop()
+                self._finish_profile(request, sampler)
+
+    # ── Profiles ──────────────────────────────────────────────────────────────
+
+    def request_profile(self, sample_interval_ms: float = 5.0, request_id: Optional[str] = None) -> None:
+        """Profile the next cycle (stack samples + span timeline)."""
+        self._profile_request = {
+            "request_id": request_id or datetime.now(timezone.utc).isoformat(),
+            "sample_interval_ms": max(1.0, float(sample_interval_ms)),
+        }
+
+    def _finish_profile(self, request: Dict[str, Any], sampler: _StackSampler) -> None:
+        with self._lock:
+            timeline, self._profile_timeline = self._profile_timeline or [], None
+            t0 = self._profile_t0
+        self.last_profile = {
+            "request_id": request.get("request_id"),
+            "captured_at": datetime.now(timezone.utc).isoformat(),
+            "sample_interval_ms": request.get("sample_interval_ms"),
+            "samples": sampler.samples,
+            "stacks": dict(sampler.stacks.most_common(200)),
+            "timeline": [
+                {
+                    "span": name,
+                    "start_ms": round((start - t0) * 1e3, 3),
+                    "duration_ms": round((end - start) * 1e3, 3),
+                    "symbol": symbol,
+                    "strategy": strategy,
+                }
+                for name, start, end, symbol, strategy in sorted(timeline, key=lambda item: item[1])
+            ],
+        }
+
+    # ── Snapshot / publication ────────────────────────────────────────────────
+
+    def snapshot(self, breakdowns: bool = True) -> Dict[str, Any]:
+        with self._lock:
+            payload: Dict[str, Any] = {
+                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "since": self._started_at.isoformat(),
+                "enabled": self.enabled,
+                "spans": {name: hist.summary() for name, hist in sorted(self._spans.items())},
+            }
+            if breakdowns:
+                payload["by_symbol"] = self._dimension_summary(self._by_symbol)
+                payload["by_strategy"] = self._dimension_summary(self._by_strategy)
+        if breakdowns and self.last_profile is not None:
+            payload["last_profile"] = self.last_profile
+        return payload
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+            self._by_symbol.clear()
+            self._by_strategy.clear()
+            self._started_at = datetime.now(timezone.utc)
+
+    def sync(self, storage: Any, force: bool = False) -> bool:
+        """
+        Throttled exchange with the API process through ``sys_config``:
+        publish the snapshot, pick up profile requests and the enabled flag.
+
+        Returns:
+            True when a snapshot was written.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_publish < self.publish_interval_s:
+            return False
+        self._last_publish = now
+        try:
+            config = storage.get_sys_config(bypass_cache=True) or {}
+            enabled = config.get(TRACING_ENABLED_CONFIG_KEY)
+            if enabled is not None:
+                self.enabled = bool(enabled)
+            request = config.get(PROFILE_REQUEST_CONFIG_KEY)
+            if isinstance(request, dict) and request.get("request_id") != self._last_request_id:
+                self._last_request_id = request.get("request_id")
+                if self._synced_once:  # a request left over from a previous run is not replayed
+                    self.request_profile(request.get("sample_interval_ms", 5.0), self._last_request_id)
+            self._synced_once = True
+            storage.update_sys_config({SNAPSHOT_CONFIG_KEY: self.snapshot()})
+            return True
+        except Exception as exc:
+            logger.debug("[LATENCY] Could not sync latency snapshot: %s", exc)
+            return False
+
+    # ── Internals ─────────────────────────────────────────────────────────────
+
+    def _record(self, name: str, start: float, end: float, symbol: Optional[str], strategy: Optional[str]) -> None:
+        value_us = int((end - start) * 1_000_000)
+        with self._lock:
+            hist = self._spans.get(name)
+            if hist is None:
+                hist = self._spans[name] = LatencyHistogram()
+            hist.record(value_us)
+            if symbol is not None:
+                self._dimension(self._by_symbol, name, symbol).record(value_us)
+            if strategy is not None:
+                self._dimension(self._by_strategy, name, strategy).record(value_us)
+            timeline = self._profile_timeline
+            if timeline is not None and len(timeline) < _MAX_PROFILE_SPANS:
+                timeline.append((name, start, end, symbol, strategy))
+
+    @staticmethod
+    def _dimension(table: Dict[str, Dict[str, LatencyHistogram]], name: str, key: str) -> LatencyHistogram:
+        per_span = table.get(name)
+        if per_span is None:
+            per_span = table[name] = {}
+        hist = per_span.get(key)
+        if hist is None:
+            if len(per_span) >= _MAX_DIMENSION_VALUES:
+                key = "_other"
+                hist = per_span.get(key)
+            if hist is None:
+                hist = per_span[key] = LatencyHistogram()
+        return hist
+
+    @staticmethod
+    def _dimension_summary(table: Dict[str, Dict[str, LatencyHistogram]]) -> Dict[str, Dict[str, Any]]:
+        return {
+            name: {key: hist.summary() for key, hist in sorted(per_span.items())}
+            for name, per_span in sorted(table.items())
+        }
+
+
+_tracer_instance: Optional[LatencyTracer] = None
+
+
+def get_latency_tracer() -> LatencyTracer:
+    """Process-wide tracer shared by the orchestrator, scanner, factory and executor."""
+    global _tracer_instance
+    if _tracer_instance is None:
+        _tracer_instance = LatencyTracer()
+    return _tracer_instance
@@ -13,7 +13,7 @@ import psutil
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 # Add project root to path
 BASE_DIR = Path(__file__).parent.parent
@@ -23,11 +23,13 @@ from data_vault.storage import StorageManager
 from models.signal import MarketRegime
 from core_brain.regime import RegimeClassifier
 from core_brain.dedup_learner import DedupLearner
+from core_brain.latency_tracer import get_latency_tracer
 from core_brain.signal_expiration_manager import SignalExpirationManager
 from core_brain.api.routers.shadow_ws import broadcast_shadow_update
 from core_brain.services.integrity_guard import IntegrityGuard
 from core_brain.services.anomaly_sentinel import AnomalySentinel
 from core_brain.services.coherence_service import CoherenceService
+from core_brain.services.coherence_batch_engine import CoherenceBatchEngine
 from core_brain.services.signal_review_manager import SignalReviewManager
 from core_brain.resilience_manager import ResilienceManager
 from core_brain.orchestrators import _background_tasks as background_tasks
@@ -174,10 +176,15 @@ class MainOrchestrator:
         strategy_gatekeeper: Optional[Any] = None,
         tenant_id: Optional[str] = None,
         user_id: Optional[str] = None,
+        defer_optional_services: bool = False,
+        on_first_scan: Optional[Callable[[], Any]] = None,
     ):
         from core_brain.server import set_resilience_manager
 
         self.thought_callback = thought_callback
+        # PERF-STARTUP-GRAPH-2026-001: economic veto and backtest services are attached
+        # by the startup graph (attach_*). The veto is attached before run(); backtest after.
+        self._on_first_scan = on_first_scan
         effective_user_id = user_id or tenant_id
         self.user_id = effective_user_id
         self.available_sensors: Dict[str, Any] = {}
@@ -208,13 +215,17 @@ class MainOrchestrator:
         self._init_broker_discovery()
         self._init_orchestration_services(ui_mapping_service, heartbeat_monitor, conflict_resolver)
         self._init_market_analysis_services()
-        self._init_economic_integration()
+        if defer_optional_services:
+            init_methods.init_deferred_placeholders(self)
+        else:
+            self._init_economic_integration()
 
         self.dedup_learner = DedupLearner(storage_manager=self.storage)
         self._last_dedup_learning = datetime.now(timezone.utc)
 
         self._init_shadow_manager()
-        self._init_backtest_orchestrator()
+        if not defer_optional_services:
+            self._init_backtest_orchestrator()
         self._init_phase4_intelligence_services(
             signal_quality_scorer,
             consensus_engine,
@@ -226,6 +237,7 @@ class MainOrchestrator:
         self.integrity_guard = IntegrityGuard(storage=self.storage)
         self.anomaly_sentinel = AnomalySentinel(storage=self.storage)
         self.coherence_service = CoherenceService(storage=self.storage)
+        self.coherence_batch_engine = CoherenceBatchEngine(self.storage, self.coherence_service)
         self.resilience_manager = ResilienceManager(storage=self.storage)
         try:
             set_resilience_manager(self.resilience_manager)
@@ -327,6 +339,16 @@ class MainOrchestrator:
     def _init_backtest_orchestrator(self) -> None:
         init_methods.init_backtest_orchestrator(self)
 
+    def attach_economic_integration(self) -> Optional[Any]:
+        """Graph counterpart of _init_economic_integration (keeps current veto state); attach before run()."""
+        self.economic_integration = init_methods.build_economic_integration(self.storage)
+        return self.economic_integration
+
+    def attach_backtest_orchestrator(self) -> Optional[Any]:
+        """Deferred counterpart of _init_backtest_orchestrator."""
+        self._init_backtest_orchestrator()
+        return self.backtest_orchestrator
+
     async def initialize_shadow_pool(
         self,
         strategy_engines: Dict[str, Any],
@@ -426,18 +448,31 @@ class MainOrchestrator:
         scan_methods.persist_scan_telemetry(self, scan_results_with_data)
 
     async def run_single_cycle(self) -> None:
+        tracer = get_latency_tracer()
         try:
-            if not await cycle_scan.run_pre_phase(self):
-                return
-            scan_bundle = await cycle_scan.run_scan_phase(self)
-            if scan_bundle is None:
-                return
-            if not await cycle_exec.run_econ_phase(self, scan_bundle):
-                return
-            signals = await cycle_exec.run_signal_filter(self, scan_bundle)
-            if signals is None:
-                return
-            await cycle_trade.run_execute_phase(self, signals, scan_bundle)
+            with tracer.cycle():
+                with tracer.span("phase.pre"):
+                    proceed = await cycle_scan.run_pre_phase(self)
+                if not proceed:
+                    return
+                with tracer.span("phase.scan"):
+                    scan_bundle = await cycle_scan.run_scan_phase(self)
+                on_first_scan = getattr(self, "_on_first_scan", None)
+                if on_first_scan is not None:
+                    self._on_first_scan = None
+                    on_first_scan()
+                if scan_bundle is None:
+                    return
+                with tracer.span("phase.econ"):
+                    proceed = await cycle_exec.run_econ_phase(self, scan_bundle)
+                if not proceed:
+                    return
+                with tracer.span("phase.signal_filter"):
+                    signals = await cycle_exec.run_signal_filter(self, scan_bundle)
+                if signals is None:
+                    return
+                with tracer.span("phase.execute"):
+                    await cycle_trade.run_execute_phase(self, signals, scan_bundle)
         except Exception as e:
             logger.error(f"Error in cycle execution: {e}", exc_info=True)
             # ETI-ERROR-TRACKER-001: Persist error to sys_audit_logs
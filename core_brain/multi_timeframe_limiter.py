@@ -17,6 +17,7 @@ from typing import Dict, Tuple, List, Any, Optional
 import logging
 
 from models.signal import Signal
+from core_brain.broker_state_mirror import mirrored_open_positions
 
 logger = logging.getLogger(__name__)
 
@@ -115,18 +116,12 @@ class MultiTimeframeLimiter:
                 )
                 return self._get_open_usr_positions_from_db_only(symbol)
             
-            # Get actual open positions from MT5
-            mt5_usr_positions = self.connector.get_open_positions()
+            # Actual open positions from MT5 (broker state mirror when attached)
+            open_for_symbol = mirrored_open_positions(self.connector, symbol)
             
-            if mt5_usr_positions is None:
+            if open_for_symbol is None:
                 logger.warning(f"Failed to query MT5 usr_positions for {symbol}")
                 return self._get_open_usr_positions_from_db_only(symbol)
-
-            # Filter by symbol
-            open_for_symbol = [
-                pos for pos in mt5_usr_positions 
-                if pos.get('symbol') == symbol
-            ]
             
             logger.info(
                 f"[MultiTimeframeLimiter] {symbol}: {len(open_for_symbol)} usr_positions "
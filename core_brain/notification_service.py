@@ -3,6 +3,10 @@ Notification Service - Sistema de notificaciones contextuales EDGE
 
 Este servicio genera notificaciones inteligentes basadas en el contexto del usuario
 y su nivel de autonomía configurado.
+
+Con un OutboundDispatcher (PERF-OUTBOUND-DISPATCH-2026-001) la persistencia sale
+del hilo que notifica: las notificaciones se encolan y el worker las guarda por
+lotes, con reintentos y dead-letter.
 """
 
 import logging
@@ -37,13 +41,26 @@ class NotificationService:
     el perfil y configuración de autonomía del usuario.
     """
     
-    def __init__(self, storage_manager: Any) -> None:
+    PERSIST_CHANNEL = "notifications_db"
+
+    def __init__(self, storage_manager: Any, dispatcher: Optional[Any] = None) -> None:
         """
         Args:
             storage_manager: Instancia de StorageManager para acceder a preferencias
+            dispatcher: OutboundDispatcher opcional; si se indica, la persistencia
+                es asíncrona (si no, se guarda en línea como siempre)
         """
         self.storage = storage_manager
+        self.dispatcher = dispatcher
+        if dispatcher is not None:
+            dispatcher.register_channel(self.PERSIST_CHANNEL, self._persist_batch, batch_window_s=0.5, max_batch=50)
         logger.info("NotificationService initialized")
+
+    def _persist_batch(self, notifications: List[Dict[str, Any]]) -> None:
+        """Guarda un lote encolado; si algo falla lanza excepción y el dispatcher reintenta el lote (INSERT OR REPLACE es idempotente)."""
+        failed = [n for n in notifications if not self.storage.save_notification(n)]
+        if failed:
+            raise RuntimeError(f"{len(failed)}/{len(notifications)} notificaciones sin persistir")
     
     def create_notification(
         self,
@@ -78,7 +95,8 @@ class NotificationService:
         if notification:
             # Persistir en base de datos
             notification['user_id'] = user_id
-            self.storage.save_notification(notification)
+            if self.dispatcher is None or not self.dispatcher.submit(self.PERSIST_CHANNEL, notification):
+                self.storage.save_notification(notification)
             logger.info(f"Notification created and persisted: {category.value} - {notification['title']}")
         
         return notification
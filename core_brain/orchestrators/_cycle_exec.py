@@ -13,6 +13,7 @@ from typing import TYPE_CHECKING, Any, List, Optional
 if TYPE_CHECKING:
     from core_brain.main_orchestrator import MainOrchestrator
 
+from core_brain.latency_tracer import get_latency_tracer
 from core_brain.orchestrators._types import ScanBundle
 
 logger = logging.getLogger(__name__)
@@ -160,11 +161,13 @@ async def run_signal_filter(
     orch.stats.usr_signals_generated += len(usr_signals)
 
     # Risk validation
+    tracer = get_latency_tracer()
     validated: List[Any] = []
     for signal in usr_signals:
         is_valid = True
         if hasattr(orch.risk_manager, "validate_signal"):
-            is_valid = bool(orch.risk_manager.validate_signal(signal))
+            with tracer.span("filter.risk", symbol=signal.symbol):
+                is_valid = bool(orch.risk_manager.validate_signal(signal))
         if is_valid:
             validated.append(signal)
         else:
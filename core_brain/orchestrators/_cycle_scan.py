@@ -15,6 +15,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
+from core_brain.latency_tracer import get_latency_tracer
 from core_brain.orchestrators._types import PriceSnapshot, ScanBundle
 from core_brain.services.ui_mapping_service import _normalize_structure_confidence
 from core_brain.orchestrators._background_tasks import (
@@ -37,6 +38,12 @@ logger = logging.getLogger(__name__)
 # Reuse the canonical normalizer as single SSOT for runtime confidence contract.
 _normalize_ui_structure_confidence = _normalize_structure_confidence
 
+# Timeframe widths used to pick the finest scanned frame fed to simulated exchanges.
+_FEED_TIMEFRAME_SECONDS: Dict[str, int] = {
+    "M1": 60, "M5": 300, "M15": 900, "M30": 1800,
+    "H1": 3600, "H4": 14400, "D1": 86400, "W1": 604800,
+}
+
 
 class CpuPressureState(Enum):
     NORMAL = "NORMAL"
@@ -265,6 +272,32 @@ def _handle_consecutive_backpressure(orch: Any, backpressure: Dict[str, Any]) ->
                 logger.debug("[SCAN_BACKPRESSURE] Could not reset consecutive counter: %s", exc)
 
 
+def _feed_simulated_exchanges(price_snapshots: Dict[str, PriceSnapshot]) -> None:
+    """Push the finest scanned timeframe per symbol into connectors with a market feed."""
+    from core_brain.connectivity_orchestrator import ConnectivityOrchestrator
+
+    feeds = [
+        conn for conn in ConnectivityOrchestrator().connectors.values()
+        if callable(getattr(conn, "on_market_data", None))
+    ]
+    if not feeds:
+        return
+    finest: Dict[str, PriceSnapshot] = {}
+    for snapshot in price_snapshots.values():
+        if snapshot.df is None or len(snapshot.df) == 0:
+            continue
+        current = finest.get(snapshot.symbol)
+        rank = _FEED_TIMEFRAME_SECONDS.get(snapshot.timeframe, float("inf"))
+        if current is None or rank < _FEED_TIMEFRAME_SECONDS.get(current.timeframe, float("inf")):
+            finest[snapshot.symbol] = snapshot
+    for conn in feeds:
+        for symbol, snapshot in finest.items():
+            try:
+                conn.on_market_data(symbol, snapshot.df)
+            except Exception as exc:
+                logger.debug("[SIM-EXCHANGE] Market feed failed for %s: %s", symbol, exc)
+
+
 def _persist_scan_funnel_kpi(orch: Any, payload: Dict[str, Any]) -> None:
     """Persist scanner funnel KPIs for operational observability."""
     try:
@@ -440,13 +473,14 @@ async def run_pre_phase(orch: Any) -> bool:
             )
             for account_id, exec_connector in exec_connectors.items():
                 try:
-                    position_stats = await asyncio.wait_for(
-                        asyncio.to_thread(
-                            orch.position_manager.monitor_usr_positions,
-                            connector=exec_connector,
-                        ),
-                        timeout=position_timeout_s,
-                    )
+                    with get_latency_tracer().span("positions.monitor"):
+                        position_stats = await asyncio.wait_for(
+                            asyncio.to_thread(
+                                orch.position_manager.monitor_usr_positions,
+                                connector=exec_connector,
+                            ),
+                            timeout=position_timeout_s,
+                        )
                     total_monitored += position_stats.get("monitored", 0)
                     combined_actions.extend(position_stats.get("actions", []))
                 except asyncio.TimeoutError:
@@ -717,10 +751,18 @@ async def run_scan_phase(orch: Any) -> Optional[ScanBundle]:
         },
     )
 
-    # Feed AnomalySentinel (EDGE-IGNITION-PHASE-2)
+    # Feed AnomalySentinel (EDGE-IGNITION-PHASE-2): one stream per symbol|timeframe,
+    # bars already seen in previous cycles are dropped by the stream watermark
     for snapshot in price_snapshots.values():
         if snapshot.df is not None and len(snapshot.df) >= 2:
-            orch.anomaly_sentinel.push_ticks(snapshot.df.tail(10).to_dict("records"))
+            orch.anomaly_sentinel.push_ticks(
+                snapshot.df.tail(10).to_dict("records"),
+                symbol=snapshot.symbol,
+                timeframe=snapshot.timeframe,
+            )
+
+    # Feed paper/simulated exchanges (SIM-EXCHANGE-2026-001) so SL/TP keep evaluating
+    _feed_simulated_exchanges(price_snapshots)
 
     # Extract regimes + update orchestrator state
     scan_results: Dict[str, Any] = {
@@ -751,7 +793,7 @@ async def run_scan_phase(orch: Any) -> Optional[ScanBundle]:
             for key, snapshot in price_snapshots.items():
                 if snapshot.df is not None and len(snapshot.df) > 0:
                     result = orch.market_structure_analyzer.detect_market_structure(
-                        snapshot.symbol, snapshot.df
+                        snapshot.symbol, snapshot.df, timeframe=snapshot.timeframe
                     )
                     if result:
                         normalized_confidence = _normalize_ui_structure_confidence(
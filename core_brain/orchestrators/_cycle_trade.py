@@ -99,12 +99,16 @@ async def run_execute_phase(
         try:
             logger.info(f"Executing signal: {signal.symbol} {signal.signal_type}")
 
-            # PHASE 1: Deduplication check
-            recent_signals = orch.storage.get_recent_sys_signals(
-                symbol=signal.symbol,
-                timeframe=getattr(signal, "timeframe", "M5"),
-                minutes=120,
-            )
+            # PHASE 1: Deduplication check (the signal index answers in memory once warm)
+            signal_index = getattr(orch, "signal_index", None)
+            if signal_index is not None and signal_index.ready:
+                recent_signals = []
+            else:
+                # Every timeframe of the symbol, like the index: cross-TF rows feed category D
+                recent_signals = orch.storage.get_recent_sys_signals(
+                    symbol=signal.symbol,
+                    minutes=120,
+                )
             recent_signals_dicts: List[dict] = []
             for s in (recent_signals or []):
                 if isinstance(s, dict):
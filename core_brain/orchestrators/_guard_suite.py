@@ -7,10 +7,11 @@ Pattern: module-level functions receive `orch: MainOrchestrator` via DI.
 Gates:
   - PHASE-1 IntegrityGuard  (_write_integrity_veto)
   - PHASE-2 AnomalySentinel (_write_anomaly_lockdown)
-  - PHASE-3 CoherenceService (_run_coherence_gate, _write_coherence_veto)
+  - PHASE-3 CoherenceBatchEngine (_run_coherence_gate, _write_coherence_veto)
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import sqlite3
 import uuid
@@ -24,22 +25,19 @@ logger = logging.getLogger(__name__)
 
 
 async def run_coherence_gate(orch: "MainOrchestrator") -> None:
-    """EDGE-IGNITION-PHASE-3: Coherence Gate — model vs reality drift."""
+    """
+    EDGE-IGNITION-PHASE-3: Coherence Gate — model vs reality drift.
+
+    The whole LIVE roster is evaluated in one batched, vectorized pass
+    (CoherenceBatchEngine) off the event loop; only vetoes are persisted here.
+    """
     try:
-        live_strategies = orch.storage.get_strategies_by_mode("LIVE")
+        live_strategies = await asyncio.to_thread(orch.storage.get_strategies_by_mode, "LIVE")
         if not live_strategies:
             return
 
-        for strategy in live_strategies:
-            strategy_id = strategy.get("strategy_id")
-            if not strategy_id:
-                continue
-
-            symbol = strategy_id.split("_")[0] if "_" in strategy_id else None
-            veto = orch.coherence_service.check_coherence_veto(
-                strategy_id=strategy_id,
-                symbol=symbol,
-            )
+        vetoes = await asyncio.to_thread(orch.coherence_batch_engine.evaluate, live_strategies)
+        for strategy_id, veto in vetoes.items():
             if veto:
                 trace_id = f"COH-VETO-{uuid.uuid4().hex[:8].upper()}"
                 await write_coherence_veto(orch, strategy_id=strategy_id, trace_id=trace_id)
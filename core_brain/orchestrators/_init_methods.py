@@ -53,11 +53,27 @@ def init_core_dependencies(
     )
     logger.info("[FEEDBACK] ExecutionFeedbackCollector initialized (DOMINIO-10 Auto-Healing)")
 
-    orch.signal_selector = SignalSelector(storage_manager=orch.storage)
+    orch.signal_index = init_signal_window_index(orch, effective_user_id)
+    orch.signal_selector = SignalSelector(
+        storage_manager=orch.storage, signal_index=orch.signal_index
+    )
     orch.cooldown_manager = CooldownManager(storage_manager=orch.storage)
     logger.info("[DEDUP] Signal Selector & Cooldown Manager initialized (HU 3.3/4.7)")
 
 
+def init_signal_window_index(orch: "MainOrchestrator", scope: Optional[str]) -> Optional[Any]:
+    """Attach the process-wide recent-signal index for this tenant, warmed once from sys_signals."""
+    from core_brain.intelligence.signal_window_index import get_signal_window_index
+
+    index = get_signal_window_index(scope)
+    if not index.ready:
+        try:
+            index.warm_from_storage(orch.storage)
+        except Exception as e:
+            logger.warning(f"[SIGNAL_INDEX] Warm-up failed, dedup/consensus keep the storage path: {e}")
+    return index
+
+
 def load_dynamic_usr_strategies(orch: "MainOrchestrator") -> None:
     """Load all usr_strategies dynamically from DB (MANIFESTO II.3-II.4)."""
     try:
@@ -98,6 +114,7 @@ def load_dynamic_usr_strategies(orch: "MainOrchestrator") -> None:
             execution_feedback_collector=orch.execution_feedback_collector,
             signal_validator=signal_validator,
             shadow_penalty_injector=shadow_penalty_injector,
+            signal_index=getattr(orch, "signal_index", None),
         )
         logger.info(
             f"[STRATEGIES] Dynamic loading complete: "
@@ -220,6 +237,7 @@ def init_ancillary_services(
     from core_brain.trade_closure_listener import TradeClosureListener
     from core_brain.edge_tuner import EdgeTuner
     from core_brain.threshold_optimizer import ThresholdOptimizer
+    from core_brain.circuit_breaker import circuit_breaker_for
 
     orch.expiration_manager = expiration or SignalExpirationManager(storage=orch.storage)
     orch.coherence_monitor = coherence or CoherenceMonitor(storage=orch.storage)
@@ -230,6 +248,7 @@ def init_ancillary_services(
             risk_manager=orch.risk_manager,
             edge_tuner=EdgeTuner(storage=orch.storage),
             threshold_optimizer=ThresholdOptimizer(storage=orch.storage),
+            circuit_breaker=circuit_breaker_for(orch.storage),
         )
     else:
         orch.trade_closure_listener = listener
@@ -361,22 +380,44 @@ def init_economic_integration(orch: "MainOrchestrator") -> None:
     orch._econ_caution_symbols = set()
     orch._prev_econ_caution_symbols = set()
 
+    orch.economic_integration = build_economic_integration(orch.storage)
+
+
+def build_economic_integration(storage: Any) -> Optional[Any]:
+    """Create the economic integration manager; None (fail-open) if it cannot be built."""
     try:
         from core_brain.economic_integration import create_economic_integration
         from connectors.economic_data_gateway import EconomicDataProviderRegistry
         from core_brain.news_sanitizer import NewsSanitizer
 
         logger.info("[ECON-INTEGRATION] Initializing Economic Calendar Veto Interface...")
-        orch.economic_integration = create_economic_integration(
+        integration = create_economic_integration(
             gateway=EconomicDataProviderRegistry(),
             sanitizer=NewsSanitizer(),
-            storage=orch.storage,
+            storage=storage,
             scheduler_config=None,
         )
         logger.info("[ECON-INTEGRATION] Economic integration ready for use")
+        return integration
     except Exception as e:
         logger.warning(f"[ECON-INTEGRATION] Could not initialize: {e}")
-        orch.economic_integration = None
+        return None
+
+
+def init_deferred_placeholders(orch: "MainOrchestrator") -> None:
+    """
+    Placeholder state until the startup graph attaches each service (PERF-STARTUP-GRAPH-2026-001).
+
+    The economic veto is attached on the critical path, before run(); the
+    backtest services are attached while the loop runs.
+    """
+    orch._econ_veto_symbols = set()
+    orch._econ_caution_symbols = set()
+    orch._prev_econ_caution_symbols = set()
+    orch.economic_integration = None
+    orch.backtest_orchestrator = None
+    orch._last_backtest_run = None
+    orch.operational_mode_manager = None
 
 
 async def sync_economic_caution_state(
@@ -446,7 +487,8 @@ def init_phase4_intelligence_services(
             storage_manager=orch.storage
         )
         orch.consensus_engine = consensus_engine or ConsensusEngine(
-            storage_manager=orch.storage
+            storage_manager=orch.storage,
+            signal_index=getattr(orch, "signal_index", None),
         )
         orch.failure_pattern_registry = failure_pattern_registry or FailurePatternRegistry(
             storage_manager=orch.storage
@@ -16,6 +16,8 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Optional
 
+from core_brain.latency_tracer import get_latency_tracer
+
 logger = logging.getLogger(__name__)
 
 
@@ -258,6 +260,7 @@ async def run_main_loop(orch: Any) -> None:
             await run_coherence_gate(orch)
 
             await orch.run_single_cycle()
+            get_latency_tracer().sync(orch.storage)
 
             sleep_interval = orch._get_sleep_interval()
             logger.debug(
@@ -317,6 +320,7 @@ async def main() -> None:
     from core_brain.executor import OrderExecutor
     from core_brain.notificator import get_notifier
     from core_brain.trade_closure_listener import TradeClosureListener
+    from core_brain.circuit_breaker import circuit_breaker_for
     from core_brain.edge_tuner import EdgeTuner
     from core_brain.threshold_optimizer import ThresholdOptimizer
     from core_brain.execution_feedback import ExecutionFeedbackCollector
@@ -408,6 +412,7 @@ async def main() -> None:
         threshold_optimizer=threshold_optimizer,
         max_retries=3,
         retry_backoff=0.5,
+        circuit_breaker=circuit_breaker_for(storage),
     )
     logger.info("[OK] TradeClosureListener initialized | ThresholdOptimizer HU 7.1 enabled")
 
@@ -22,6 +22,7 @@ from utils.market_ops import normalize_price, calculate_pip_size
 from core_brain.instrument_manager import InstrumentManager
 from core_brain.notificator import get_notifier
 from core_brain.close_only_guard import CloseOnlyGuard
+from core_brain.position_monitor_context import PositionMonitorContext
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +77,10 @@ class PositionManager:
         
         # Track modification failures for alerts
         self._modification_failures = {} # ticket -> count
+
+        # Per-cycle snapshot (metadata + per-symbol market data), set only
+        # while monitor_usr_positions runs
+        self._cycle_ctx: Optional[PositionMonitorContext] = None
         
         # Initialize notifier
         self.notifier = get_notifier()
@@ -137,7 +142,39 @@ class PositionManager:
             return {"monitored": 0, "actions": []}
         
         actions = []
+
+        # One metadata query for every open ticket; market data once per symbol
+        self._cycle_ctx = PositionMonitorContext.build(
+            self.storage, effective_connector, [p.get('ticket') for p in open_usr_positions]
+        )
+        try:
+            self._monitor_cycle(open_usr_positions, effective_connector, actions)
+        finally:
+            ctx, self._cycle_ctx = self._cycle_ctx, None
+            self._flush_cycle_context(ctx)
+
+        summary = {
+            'total_usr_positions': len(open_usr_positions),
+            'monitored': len(open_usr_positions),
+            'actions': actions,
+            'timestamp': datetime.now(timezone.utc).isoformat()
+        }
+        
+        logger.info(
+            f"Position monitoring completed - "
+            f"{len(open_usr_positions)} usr_positions, "
+            f"{len(actions)} actions taken"
+        )
         
+        return summary
+    
+    def _monitor_cycle(
+        self,
+        open_usr_positions: List[Dict[str, Any]],
+        effective_connector: Any,
+        actions: List[Dict[str, Any]],
+    ) -> None:
+        """Apply every monitoring rule to each open position (inside a cycle context)."""
         for position in open_usr_positions:
             ticket = position.get('ticket')
             symbol = position.get('symbol')
@@ -174,7 +211,7 @@ class PositionManager:
                     continue
 
                 # 3. Check for breakeven opportunity (FASE 3)
-                metadata = self.storage.get_position_metadata(ticket)
+                metadata = self._get_metadata(ticket)
                 if metadata:
                     should_move, reason = self._should_move_to_breakeven(position, metadata)
                     logger.debug(
@@ -188,7 +225,7 @@ class PositionManager:
 
                             # Ensure price is normalized before sending to broker
                             im = self._get_instrument_manager()
-                            symbol_info = effective_connector.get_symbol_info(symbol)
+                            symbol_info = self._get_symbol_info(symbol, effective_connector)
                             breakeven_price = normalize_price(breakeven_price, symbol_info, symbol, im)
 
                             logger.info(
@@ -228,7 +265,7 @@ class PositionManager:
 
                             # Ensure price is normalized before sending to broker
                             im = self._get_instrument_manager()
-                            symbol_info = effective_connector.get_symbol_info(symbol)
+                            symbol_info = self._get_symbol_info(symbol, effective_connector)
                             trailing_sl = normalize_price(trailing_sl, symbol_info, symbol, im)
 
                             logger.info(
@@ -276,22 +313,64 @@ class PositionManager:
                     exc_info=True
                 )
                 continue
-        
-        summary = {
-            'total_usr_positions': len(open_usr_positions),
-            'monitored': len(open_usr_positions),
-            'actions': actions,
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }
-        
-        logger.info(
-            f"Position monitoring completed - "
-            f"{len(open_usr_positions)} usr_positions, "
-            f"{len(actions)} actions taken"
-        )
-        
-        return summary
-    
+
+    def _flush_cycle_context(self, ctx: Optional[PositionMonitorContext]) -> None:
+        """Persist staged metadata mutations of the cycle as one batched write."""
+        if ctx is None or not ctx.pending:
+            return
+        tickets = list(ctx.pending)
+        try:
+            ok = ctx.flush(self.storage)
+        except Exception as e:
+            logger.error(f"Error flushing position metadata batch: {e}", exc_info=True)
+            ok = False
+        if not ok:
+            # Orphans whose metadata was not persisted must be re-synced next cycle
+            self._synced_orphans.difference_update(tickets)
+            logger.error(f"Failed to persist metadata batch for {len(tickets)} usr_positions")
+
+    def _get_metadata(self, ticket: int) -> Optional[Any]:
+        """Position metadata: cycle snapshot when monitoring, storage otherwise."""
+        if self._cycle_ctx is not None:
+            return self._cycle_ctx.metadata(ticket)
+        return self.storage.get_position_metadata(ticket)
+
+    def _stage_metadata(self, ticket: int, updates: Dict[str, Any]) -> bool:
+        """Metadata mutation: deferred to the end-of-cycle batch when monitoring."""
+        if self._cycle_ctx is not None:
+            self._cycle_ctx.stage(ticket, updates)
+            return True
+        return self.storage.update_position_metadata(ticket, updates)
+
+    def _persist_metadata(self, ticket: int, updates: Dict[str, Any]) -> bool:
+        """Metadata mutation written now (write-ahead), mirrored into the cycle snapshot."""
+        if not self.storage.update_position_metadata(ticket, updates):
+            return False
+        if self._cycle_ctx is not None:
+            self._cycle_ctx.apply_persisted(ticket, updates)
+        return True
+
+    def _ctx_serving(self, connector: Optional[Any]) -> Optional[PositionMonitorContext]:
+        """Cycle snapshot, unless the caller asks for another connector than the cycle's."""
+        ctx = self._cycle_ctx
+        if ctx is None or ctx.connector is None:
+            return None
+        if connector is not None and connector is not ctx.connector:
+            return None
+        return ctx
+
+    def _get_symbol_info(self, symbol: str, connector: Optional[Any]) -> Any:
+        ctx = self._ctx_serving(connector)
+        if ctx is not None:
+            return ctx.symbol_info(symbol)
+        return connector.get_symbol_info(symbol) if connector else None
+
+    def _get_current_price(self, symbol: str, connector: Any) -> Any:
+        ctx = self._ctx_serving(connector)
+        if ctx is not None:
+            return ctx.current_price(symbol)
+        return connector.get_current_price(symbol)
+
     def _sync_orphan_position(self, position: Dict[str, Any], connector: Optional[Any] = None) -> None:
         """
         Auto-sync metadata for usr_positions without it (orphan usr_positions).
@@ -310,7 +389,7 @@ class PositionManager:
         ticket = position.get('ticket')
         
         # Skip if already has metadata
-        if self.storage.get_position_metadata(ticket):
+        if self._get_metadata(ticket):
             return
         
         # Skip if already synced this session (avoid repeated work)
@@ -338,7 +417,7 @@ class PositionManager:
             # Usar utilidades globales agnósticas
             _conn = connector or self.connector
             im = self._get_instrument_manager()
-            symbol_info = _conn.get_symbol_info(symbol) if _conn else None
+            symbol_info = self._get_symbol_info(symbol, _conn)
             pip_size = calculate_pip_size(symbol_info, symbol, im)
             
             # Calculate risk in pips/points
@@ -398,7 +477,7 @@ class PositionManager:
         }
         
         # Save to database
-        success = self.storage.update_position_metadata(ticket, metadata)
+        success = self._stage_metadata(ticket, metadata)
         
         if success:
             # Mark as synced to avoid repeating this process
@@ -418,6 +497,7 @@ class PositionManager:
         
         RegimeClassifier may not have enough data or may fail to classify
         when scanner is disabled. This method provides safe fallback.
+        Classified once per symbol per monitoring cycle.
         
         Args:
             symbol: Symbol to classify
@@ -425,6 +505,12 @@ class PositionManager:
         Returns:
             MarketRegime: Classified regime or NEUTRAL if classification fails
         """
+        if self._cycle_ctx is not None:
+            return self._cycle_ctx.memo(symbol, "regime", lambda: self._classify_regime_with_fallback(symbol))
+        return self._classify_regime_with_fallback(symbol)
+
+    def _classify_regime_with_fallback(self, symbol: str) -> 'MarketRegime':
+        """Uncached body of _get_current_regime_with_fallback."""
         from models.signal import MarketRegime
         
         try:
@@ -523,7 +609,7 @@ class PositionManager:
         ticket = position.get('ticket')
         
         # Get position metadata from database
-        metadata = self.storage.get_position_metadata(ticket)
+        metadata = self._get_metadata(ticket)
         if not metadata:
             # Log only once per position to avoid spam
             if ticket not in self._synced_orphans:
@@ -580,7 +666,7 @@ class PositionManager:
         symbol = position.get('symbol')
         
         # Get position metadata
-        metadata = self.storage.get_position_metadata(ticket)
+        metadata = self._get_metadata(ticket)
         if not metadata:
             # Log only once per position to avoid spam
             if ticket not in self._synced_orphans:
@@ -641,7 +727,7 @@ class PositionManager:
         symbol = position.get('symbol')
         
         # Get position metadata
-        metadata = self.storage.get_position_metadata(ticket)
+        metadata = self._get_metadata(ticket)
         if not metadata:
             logger.debug(
                 f"No metadata for position {ticket} - Assuming no regime change"
@@ -693,7 +779,7 @@ class PositionManager:
             return False
         
         # Get position metadata
-        metadata = self.storage.get_position_metadata(ticket)
+        metadata = self._get_metadata(ticket)
         if not metadata:
             logger.warning(
                 f"No metadata for position {ticket} - Cannot adjust"
@@ -789,7 +875,7 @@ class PositionManager:
                 )
                 
                 # Update metadata
-                self.storage.update_position_metadata(ticket, {
+                self._stage_metadata(ticket, {
                     'emergency_close': True,
                     'emergency_reason': reason,
                     'closed_at': datetime.now(timezone.utc).isoformat()
@@ -833,7 +919,7 @@ class PositionManager:
                 )
                 
                 # Update metadata
-                self.storage.update_position_metadata(ticket, {
+                self._stage_metadata(ticket, {
                     'stale_exit': True,
                     'closed_at': datetime.now(timezone.utc).isoformat()
                 })
@@ -882,7 +968,7 @@ class PositionManager:
             return False
         
         # 2. Persist metadata BEFORE modification (idempotence)
-        old_metadata = self.storage.get_position_metadata(ticket)
+        old_metadata = self._get_metadata(ticket)
         
         new_metadata = {
             'last_modification_timestamp': datetime.now(timezone.utc).isoformat(),
@@ -892,8 +978,8 @@ class PositionManager:
             'new_tp': new_tp
         }
         
-        # Update metadata
-        if not self.storage.update_position_metadata(ticket, new_metadata):
+        # Write-ahead audit: persisted before the broker call, even mid-cycle
+        if not self._persist_metadata(ticket, new_metadata):
             logger.error(
                 f"Failed to update metadata for position {ticket} - Aborting modification"
             )
@@ -1009,7 +1095,7 @@ class PositionManager:
         if not _conn:
             logger.warning(f"No connector available to validate freeze level for {symbol} — skipping")
             return True  # Permissive fallback: do not block modification if no connector
-        symbol_info = _conn.get_symbol_info(symbol)
+        symbol_info = self._get_symbol_info(symbol, _conn)
         if not symbol_info:
             logger.error(
                 f"Could not get symbol info for {symbol} - Cannot validate freeze level"
@@ -1030,7 +1116,7 @@ class PositionManager:
         safe_freeze_level = freeze_level * 1.1
         
         # Get current price
-        current_price = _conn.get_current_price(symbol)
+        current_price = self._get_current_price(symbol, _conn)
         if not current_price or current_price <= 0:
             logger.error(
                 f"Could not get current price for {symbol}"
@@ -1143,12 +1229,21 @@ class PositionManager:
         """
         Get current ATR for symbol.
         
+        Resolved once per symbol per monitoring cycle.
+        
         Args:
             symbol: Symbol name
             
         Returns:
             float: ATR value or None if not available
         """
+        ctx = self._ctx_serving(connector)
+        if ctx is not None:
+            return ctx.memo(symbol, "atr", lambda: self._resolve_current_atr(symbol, connector))
+        return self._resolve_current_atr(symbol, connector)
+
+    def _resolve_current_atr(self, symbol: str, connector: Optional[Any] = None) -> Optional[float]:
+        """Uncached body of get_current_atr."""
         # Try to get ATR from regime classifier (if scanner is running)
         try:
             if hasattr(self.regime_classifier, 'get_regime_data'):
@@ -1172,7 +1267,7 @@ class PositionManager:
             if not _conn:
                 logger.warning(f"No connector available to estimate ATR for {symbol}")
                 return None
-            symbol_info = _conn.get_symbol_info(symbol)
+            symbol_info = self._get_symbol_info(symbol, _conn)
             if symbol_info:
                 # Use current price to estimate conservative ATR
                 price = self._info_get(symbol_info, 'ask', 0)
@@ -1272,7 +1367,7 @@ class PositionManager:
             spread_cost = 0.0
             if breakeven_config.get('include_spread', True):
                 _conn = connector or self.connector
-                symbol_info = _conn.get_symbol_info(symbol) if _conn else None
+                symbol_info = self._get_symbol_info(symbol, _conn)
                 if symbol_info:
                     ask = float(self._info_get(symbol_info, 'ask', 0))
                     bid = float(self._info_get(symbol_info, 'bid', 0))
@@ -1302,7 +1397,7 @@ class PositionManager:
             # Where pip_size depends on digits (0.0001 for 5 digits, 0.01 for 2-3 digits, etc.)
             # Reuse _conn resolved earlier (connector param → self.connector fallback)
             _conn = connector or self.connector
-            symbol_info = _conn.get_symbol_info(symbol) if _conn else None
+            symbol_info = self._get_symbol_info(symbol, _conn)
             if not symbol_info:
                 logger.warning(f"Cannot calculate breakeven: no symbol_info for {symbol}")
                 return None
@@ -1412,7 +1507,7 @@ class PositionManager:
                 return False, f"Position in loss (${current_profit_usd:.2f}) - breakeven only applies to winning usr_trades"
             
             # Get minimum distance - DYNAMIC based on ATR
-            symbol_info = self.connector.get_symbol_info(symbol)
+            symbol_info = self._get_symbol_info(symbol, self.connector)
             pip_size = 0.0001  # Default
             if symbol_info:
                 digits = self._info_get(symbol_info, 'digits', 5)
@@ -1601,7 +1696,7 @@ class PositionManager:
             # 1. Check minimum profit requirement (FASE 4B: Dynamic with ATR)
             # Get pip size from connector (fallback to self.connector)
             _conn = self.connector
-            symbol_info = _conn.get_symbol_info(symbol) if _conn else None
+            symbol_info = self._get_symbol_info(symbol, _conn)
             pip_size = 0.0001  # Default
             if symbol_info:
                 # SymbolInfo is a namedtuple, not a dict - use attribute access
@@ -0,0 +1,136 @@
+"""
+Position Monitor Context - Per-cycle snapshot for PositionManager.monitor_usr_positions
+TRACE_ID: POSITION-MONITOR-CONTEXT-2026-001
+
+Responsibility:
+  - Bulk-load sys_position_metadata for every open ticket in one query.
+  - Resolve per-symbol market data (symbol_info, price, ATR, regime) at most
+    once per cycle, shared by every position and rule on that symbol.
+  - Hand rules read-only metadata views and stage their mutations, flushed as
+    a single batched write when the cycle ends. Write-ahead audits (SL/TP
+    modifications) are persisted immediately and only mirrored here.
+
+Design principles:
+  - Cost scales with distinct symbols, not positions × rules.
+  - Reads see staged mutations (read-your-writes inside the cycle).
+  - Lives only for one cycle: nothing here is cached across cycles.
+"""
+import logging
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+def load_metadata_bulk(storage: Any, tickets: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Metadata for all tickets in one storage call.
+
+    Falls back to per-ticket reads when the storage backend has no bulk reader
+    (or returns something that is not a mapping).
+    """
+    tickets = [t for t in dict.fromkeys(tickets) if t is not None]
+    if not tickets:
+        return {}
+    loader = getattr(storage, "get_position_metadata_bulk", None)
+    if callable(loader):
+        bulk = loader(tickets)
+        if isinstance(bulk, dict):
+            return bulk
+    loaded: Dict[int, Dict[str, Any]] = {}
+    for ticket in tickets:
+        metadata = storage.get_position_metadata(ticket)
+        if isinstance(metadata, dict):
+            loaded[ticket] = metadata
+    return loaded
+
+
+class PositionMonitorContext:
+    """
+    Immutable-view snapshot of one monitoring cycle.
+
+    Usage (PositionManager):
+        ctx = PositionMonitorContext.build(storage, connector, tickets)
+        meta = ctx.metadata(ticket)            # MappingProxyType or None
+        ctx.stage(ticket, {"stale_exit": True})
+        atr = ctx.memo(symbol, "atr", loader)
+        ctx.flush(storage)
+    """
+
+    def __init__(self, metadata: Dict[int, Dict[str, Any]], connector: Optional[Any] = None) -> None:
+        self.connector = connector
+        self._metadata = metadata
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._views: Dict[int, Mapping[str, Any]] = {}
+        self._symbol_memo: Dict[Tuple[str, str], Any] = {}
+        self.stats: Dict[str, int] = {"symbol_fetches": 0, "memo_hits": 0, "staged": 0}
+
+    @classmethod
+    def build(cls, storage: Any, connector: Optional[Any], tickets: Iterable[int]) -> "PositionMonitorContext":
+        return cls(load_metadata_bulk(storage, tickets), connector)
+
+    # ─── Metadata ────────────────────────────────────────────────────────────
+
+    def metadata(self, ticket: int) -> Optional[Mapping[str, Any]]:
+        """Read-only metadata for ticket (stored row + staged updates), or None."""
+        view = self._views.get(ticket)
+        if view is not None:
+            return view
+        base = self._metadata.get(ticket)
+        pending = self._pending.get(ticket)
+        if base is None and pending is None:
+            return None
+        view = MappingProxyType({**(base or {}), **(pending or {})})
+        self._views[ticket] = view
+        return view
+
+    def stage(self, ticket: int, updates: Dict[str, Any]) -> None:
+        """Queue a metadata merge for the end-of-cycle flush."""
+        self._pending.setdefault(ticket, {}).update(updates)
+        self._views.pop(ticket, None)
+        self.stats["staged"] += 1
+
+    def apply_persisted(self, ticket: int, updates: Dict[str, Any]) -> None:
+        """Reflect a merge the caller already wrote to storage (nothing to flush)."""
+        self._metadata[ticket] = {**self._metadata.get(ticket, {}), **updates}
+        self._views.pop(ticket, None)
+
+    @property
+    def pending(self) -> Dict[int, Dict[str, Any]]:
+        return self._pending
+
+    def flush(self, storage: Any) -> bool:
+        """Write every staged update in one batch. Returns False if the batch failed."""
+        if not self._pending:
+            return True
+        updates, self._pending = self._pending, {}
+        self._views.clear()
+        writer = getattr(storage, "update_position_metadata_bulk", None)
+        if callable(writer):
+            written = writer(updates)
+            return not isinstance(written, int) or written == len(updates)
+        return all(storage.update_position_metadata(t, u) for t, u in updates.items())
+
+    # ─── Per-symbol market data ──────────────────────────────────────────────
+
+    def memo(self, symbol: str, field: str, loader: Callable[[], Any]) -> Any:
+        """Resolve (symbol, field) once per cycle. Exceptions are not cached."""
+        key = (symbol, field)
+        value = self._symbol_memo.get(key, _MISSING)
+        if value is not _MISSING:
+            self.stats["memo_hits"] += 1
+            return value
+        value = loader()
+        self._symbol_memo[key] = value
+        self.stats["symbol_fetches"] += 1
+        return value
+
+    def symbol_info(self, symbol: str) -> Any:
+        conn = self.connector
+        return self.memo(symbol, "symbol_info", lambda: conn.get_symbol_info(symbol) if conn else None)
+
+    def current_price(self, symbol: str) -> Any:
+        conn = self.connector
+        return self.memo(symbol, "price", lambda: conn.get_current_price(symbol) if conn else None)
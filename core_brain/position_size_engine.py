@@ -10,7 +10,9 @@ from typing import Any, Optional
 from data_vault.storage import StorageManager
 from models.signal import Signal, MarketRegime
 
+from core_brain.fx_conversion_graph import FxConversionError, FxConversionGraph
 from core_brain.position_size_monitor import PositionSizeMonitor, CalculationStatus
+from core_brain.symbol_registry import get_symbol_registry
 from core_brain.instrument_manager import InstrumentManager
 from utils.market_ops import calculate_pip_size, normalize_volume
 
@@ -112,14 +114,19 @@ class PositionSizeEngine:
         instrument_manager: InstrumentManager,
         monitor: PositionSizeMonitor,
         risk_per_trade: float = 0.005,
+        fx_graph: Optional[FxConversionGraph] = None,
     ):
         self.storage = storage
         self.instrument_manager = instrument_manager
         self.monitor = monitor
         self.risk_per_trade = risk_per_trade
+        self.fx_graph = fx_graph
 
-    def _pip_size(self, symbol: str, connector: Any) -> float:
-        info = _get_symbol_info(connector, symbol)
+    def _pip_size(self, symbol: str, connector: Any, symbol_info: Optional[Any] = None) -> float:
+        info = symbol_info if symbol_info is not None else _get_symbol_info(connector, symbol)
+        record = get_symbol_registry().observe_spec(symbol, info)
+        if record.digits is not None:
+            return record.pip_size
         return calculate_pip_size(info, symbol, self.instrument_manager)
 
     def _point_value(
@@ -138,6 +145,11 @@ class PositionSizeEngine:
             if symbol.startswith(account_currency):
                 return (contract_size * pip_size) / entry_price
             quote_currency = symbol[-3:]
+            if self.fx_graph is not None:
+                try:
+                    return (contract_size * pip_size) * self.fx_graph.rate(quote_currency, account_currency)
+                except FxConversionError as e:
+                    logger.debug("FX graph cannot convert %s: %s", quote_currency, e)
             conv_symbol = f"USD{quote_currency}"
             conv_price = 0.0
             if hasattr(connector, "get_current_price"):
@@ -211,7 +223,7 @@ class PositionSizeEngine:
                 )
                 return 0.0
 
-            pip_size = self._pip_size(signal.symbol, connector)
+            pip_size = self._pip_size(signal.symbol, connector, symbol_info)
             point_value = self._point_value(
                 symbol_info, pip_size, signal.entry_price, signal.symbol, connector
             )
@@ -2,7 +2,7 @@
 Clasificador de Régimen de Mercado Optimizado
 Analiza volatilidad y tendencia para determinar el modo de operación.
 """
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict
 from datetime import datetime
 import logging
 import pandas as pd
@@ -15,11 +15,15 @@ Handles:
 Architecture:
 - Agnostic: Works with any connector that provides get_symbol_info() and get_current_price()
 - Dependency Injection: Connector passed in __init__
+- Conversion rates come from the injected FxConversionGraph when it has fresh
+  quotes; the connector is only queried as a fallback
 - SSOT: Single Source of Truth for risk calculation
 """
 import logging
 from typing import Any, Optional
 
+from core_brain.fx_conversion_graph import FxConversionError, FxConversionGraph
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,7 +36,7 @@ class RiskCalculator:
         Risk (USD) = Risk (Quote Currency) × Conversion Rate to USD
     """
     
-    def __init__(self, connector: Any) -> None:
+    def __init__(self, connector: Any, fx_graph: Optional[FxConversionGraph] = None) -> None:
         """
         Initialize RiskCalculator with broker connector.
 
@@ -40,8 +44,11 @@ class RiskCalculator:
             connector: Broker connector with methods:
                 - get_symbol_info(symbol) -> SymbolInfo with trade_contract_size
                 - get_current_price(symbol) -> float (bid price)
+            fx_graph: Live conversion graph (optional). Answers conversions
+                without broker calls while its quotes are fresh.
         """
         self.connector = connector
+        self.fx_graph = fx_graph
         
     def calculate_initial_risk_usd(
         self,
@@ -140,6 +147,9 @@ class RiskCalculator:
         if symbol.startswith('USD'):
             # Example: USDJPY, risk in JPY
             # Need to divide by current USD/JPY rate
+            graph_rate = self._graph_rate(symbol[3:6])
+            if graph_rate is not None:
+                return risk_quote_currency * graph_rate
             current_rate = self.connector.get_current_price(symbol)
             if not current_rate or current_rate == 0:
                 logger.warning(f"[RiskCalc] Failed to get current price for {symbol}, cannot convert")
@@ -193,6 +203,10 @@ class RiskCalculator:
             CHF: USDCHF = 0.88 => rate = 1/0.88 = 1.136 (divide)
             JPY: USDJPY = 149.5 => rate = 1/149.5 = 0.0067 (divide)
         """
+        graph_rate = self._graph_rate(quote_currency)
+        if graph_rate is not None:
+            return graph_rate
+
         # Try direct pair: QUOTE+USD (e.g., GBPUSD)
         direct_pair = f"{quote_currency}USD"
         direct_rate = self.connector.get_current_price(direct_pair)
@@ -213,3 +227,13 @@ class RiskCalculator:
         
         logger.warning(f"[RiskCalc] No conversion pair found for {quote_currency} to USD")
         return None
+
+    def _graph_rate(self, currency: str) -> Optional[float]:
+        """USD per unit of ``currency`` from the FX graph, or None to fall back to the connector."""
+        if self.fx_graph is None:
+            return None
+        try:
+            return self.fx_graph.rate(currency, "USD")
+        except FxConversionError as e:
+            logger.debug(f"[RiskCalc] FX graph cannot convert {currency}: {e}")
+            return None
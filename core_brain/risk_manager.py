@@ -12,6 +12,8 @@ from typing import Any, Dict, Optional
 from data_vault.storage import StorageManager
 from models.signal import Signal, MarketRegime
 
+from core_brain.broker_state_mirror import invalidate_broker_mirror, mirrored_open_positions
+from core_brain.fx_conversion_graph import FxConversionGraph
 from core_brain.position_size_monitor import PositionSizeMonitor
 from core_brain.risk_policy_enforcer import RiskPolicyEnforcer
 from core_brain.position_size_engine import PositionSizeEngine
@@ -64,6 +66,7 @@ class RiskManager:
         config_path: Optional[str] = None,
         risk_settings_path: Optional[str] = None,
         connectors: Optional[Dict[str, Any]] = None,  # MISIÓN A: Inyección de conectores
+        fx_graph: Optional[FxConversionGraph] = None,
     ):
         self.storage = _resolve_storage(storage)
         self.capital = initial_capital
@@ -140,6 +143,7 @@ class RiskManager:
             instrument_manager=self.instrument_manager,
             monitor=self.monitor,
             risk_per_trade=self.risk_per_trade,
+            fx_graph=fx_graph,
         )
         logger.info(
             "RiskManager initialized: Capital=$%.2f, Risk=%.2f%%, Lockdown=%s",
@@ -386,6 +390,7 @@ class RiskManager:
                 
                 try:
                     # Verificar si el conector tiene el método get_pending_usr_orders
+                    # (el espejo del broker no amplía qué órdenes se cancelan)
                     if not hasattr(connector, 'get_pending_usr_orders'):
                         logger.debug(f"Connector {connector_type} does not support get_pending_usr_orders")
                         continue
@@ -422,6 +427,7 @@ class RiskManager:
                         except Exception as e:
                             failed_count += 1
                             logger.error(f"[ANOMALY_SENTINEL] Error cancelling order {order_ticket}: {e}")
+                    invalidate_broker_mirror(connector)
                 
                 except Exception as e:
                     logger.error(f"[ANOMALY_SENTINEL] Error processing connector {connector_type}: {e}")
@@ -496,17 +502,13 @@ class RiskManager:
                         logger.debug(f"Connector {connector_type} does not support get_open_positions")
                         continue
                     
-                    # Obtener posiciones abiertas
-                    usr_positions = connector.get_open_positions()
+                    # Obtener posiciones abiertas (filtradas por símbolo si es necesario)
+                    usr_positions = mirrored_open_positions(connector, symbol or None)
                     
                     if usr_positions is None or not usr_positions:
                         logger.info(f"No open usr_positions found on {connector_type} for {symbol or 'ALL'}")
                         continue
                     
-                    # Filtrar por símbolo si es necesario
-                    if symbol:
-                        usr_positions = [p for p in usr_positions if p.get('symbol') == symbol]
-                    
                     # Ajustar cada posición
                     for position in usr_positions:
                         ticket = position.get('ticket')
@@ -549,6 +551,7 @@ class RiskManager:
                         except Exception as e:
                             failed_count += 1
                             logger.error(f"[ANOMALY_SENTINEL] Error modifying position {ticket}: {e}")
+                    invalidate_broker_mirror(connector)
                 
                 except Exception as e:
                     logger.error(f"[ANOMALY_SENTINEL] Error processing connector {connector_type}: {e}")
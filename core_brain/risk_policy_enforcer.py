@@ -19,6 +19,7 @@ from core_brain.services.liquidity_service import LiquidityService
 from core_brain.services.confluence_service import ConfluenceService
 from core_brain.services.sentiment_service import SentimentService
 from core_brain.services.coherence_service import CoherenceService
+from core_brain.symbol_registry import get_symbol_registry
 from utils.market_ops import calculate_pip_size
 
 logger = logging.getLogger(__name__)
@@ -103,10 +104,19 @@ class RiskPolicyEnforcer:
         self.instrument_manager = instrument_manager
 
     def _get_pip_size(self, symbol: str, connector: Any) -> float:
-        """Pip size for symbol via connector and optional instrument_manager."""
+        """
+        Pip size for symbol. Served from the symbol registry once a broker spec
+        has been observed; otherwise via connector and optional instrument_manager.
+        """
+        record = get_symbol_registry().record(symbol)
+        if record.digits is not None:
+            return record.pip_size
         symbol_info = None
         if hasattr(connector, "get_symbol_info"):
             symbol_info = connector.get_symbol_info(symbol)
+        record = get_symbol_registry().observe_spec(symbol, symbol_info)
+        if record.digits is not None:
+            return record.pip_size
         return calculate_pip_size(symbol_info, symbol, self.instrument_manager)
 
     def validate(
@@ -17,13 +17,15 @@ import json
 import math
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from models.signal import MarketRegime
 from core_brain.regime import RegimeClassifier
 from core_brain.data_provider_manager import DataProvider
+from core_brain.fx_conversion_graph import FxConversionGraph
+from core_brain.latency_tracer import get_latency_tracer
 
 logger = logging.getLogger(__name__)
 
@@ -76,8 +78,10 @@ class ScannerEngine:
         regime_config_path: Optional[str] = None,
         scan_mode: str = "STANDARD",
         storage: Optional[Any] = None,
+        fx_graph: Optional[FxConversionGraph] = None,
     ):
         self.assets = list(assets) if assets else []
+        self.fx_graph = fx_graph  # FxConversionGraph fed with the last close of each scan
         self.provider = data_provider
         self.config_path = config_path
         self.storage = storage
@@ -171,6 +175,8 @@ class ScannerEngine:
         self._data_risk_last_notif: Dict[str, float] = {}
         self._lock = threading.Lock()
         self._running = False
+        # Cross-process push of scan results (LocalSocketGateway.publish_threadsafe), wired by start.py
+        self.state_publisher: Optional[Callable[[str, str, Dict[str, Any]], None]] = None
         
         # OPTION A: Cache for LATEST scan results (accessed by MainOrchestrator)
         # MainOrchestrator orchestrates when to scan, ScannerEngine just caches results
@@ -234,11 +240,12 @@ class ScannerEngine:
 
         try:
             # Obtener datos del proveedor (usando protocolo DataProvider: fetch_ohlc)
-            df = self.provider.fetch_ohlc(
-                symbol,
-                timeframe=timeframe,
-                count=self.mt5_bars_count
-            )
+            with get_latency_tracer().span("scan.fetch", symbol=symbol):
+                df = self.provider.fetch_ohlc(
+                    symbol,
+                    timeframe=timeframe,
+                    count=self.mt5_bars_count
+                )
             if df is None or df.empty:
                 logger.warning("No se pudieron obtener datos para %s [%s]", symbol, timeframe)
                 self._handle_scan_failure(key)
@@ -252,9 +259,10 @@ class ScannerEngine:
                 if instance:
                     provider_id = getattr(instance, "name", provider_id)
 
-            classifier.load_ohlc(df)
-            regime = classifier.classify()
-            metrics = classifier.get_metrics()
+            with get_latency_tracer().span("scan.classify", symbol=symbol):
+                classifier.load_ohlc(df)
+                regime = classifier.classify()
+                metrics = classifier.get_metrics()
 
             # Fail-fast: avoid classifying flow with invalid ADX metrics.
             if not self._is_valid_adx(metrics):
@@ -447,6 +455,12 @@ class ScannerEngine:
             self.last_scan_time[key] = now
             self.last_dataframes[key] = df
             self.last_providers[key] = provider_id
+
+        if self.fx_graph is not None and "close" in getattr(df, "columns", ()):
+            try:
+                self.fx_graph.update_quote(symbol, float(df["close"].iloc[-1]))
+            except (IndexError, TypeError, ValueError) as e:
+                logger.debug("[FX] Quote not recorded for %s: %s", symbol, e)
         
         # Persistence for cross-process (Heatmap) - write to GLOBAL sys_market_pulse
         if self.storage:
@@ -462,6 +476,17 @@ class ScannerEngine:
             except Exception as e:
                 logger.error(f"Error persisting market state for {key}: {e}")
 
+        if self.state_publisher is not None:
+            try:
+                self.state_publisher(symbol, timeframe, {
+                    "regime": regime.value,
+                    "metrics": metrics,
+                    "timestamp": datetime.now().isoformat(),
+                    "scan_time": time.time(),
+                })
+            except Exception as e:
+                logger.debug("[SCANNER] State publish failed for %s: %s", key, e)
+
         logger.info(
             "Scanner %s [%s] -> %s (ADX=%.2f)",
             symbol, timeframe, regime.value, metrics.get("adx", 0) or 0,
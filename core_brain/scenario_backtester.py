@@ -27,7 +27,7 @@ import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 
@@ -158,10 +158,11 @@ class ScenarioBacktester:
 
     _DEFAULT_MIN_REGIME_SCORE = 0.75  # Safe fallback if sys_config is unavailable
 
-    def __init__(self, storage: StorageManager) -> None:
+    def __init__(self, storage: Optional[StorageManager]) -> None:
         """
         Args:
-            storage: StorageManager for audit persistence (SSOT).
+            storage: StorageManager for audit persistence (SSOT). None only for
+                     offline scoring via score_slices() (default gate, no audit).
         """
         self.storage         = storage
         self.MIN_REGIME_SCORE = self._load_promotion_gate()
@@ -209,12 +210,9 @@ class ScenarioBacktester:
             f"_{strategy_id[:8].upper()}"
         )
 
-        regime_results: List[RegimeResult] = []
-        for scenario in scenario_slices:
-            result = self._evaluate_slice(scenario, parameter_overrides, strategy_instance)
-            regime_results.append(result)
-
-        overall_score = float(self._compute_overall_score(regime_results))
+        overall_score, regime_results = self.score_slices(
+            parameter_overrides, scenario_slices, strategy_instance
+        )
         passes = bool(overall_score >= self.MIN_REGIME_SCORE)
 
         matrix = AptitudeMatrix(
@@ -241,6 +239,27 @@ class ScenarioBacktester:
 
         return matrix
 
+    def score_slices(
+        self,
+        parameter_overrides: Dict[str, Any],
+        scenario_slices: List[ScenarioSlice],
+        strategy_instance: Optional[Any] = None,
+    ) -> Tuple[float, List[RegimeResult]]:
+        """
+        Score a parameter set on the given slices without persisting anything.
+
+        Pure with respect to storage, so it can run in worker processes
+        (AlphaSearchEngine) on truncated slices.
+
+        Returns:
+            (overall_score, per-slice RegimeResult list).
+        """
+        regime_results = [
+            self._evaluate_slice(scenario, parameter_overrides, strategy_instance)
+            for scenario in scenario_slices
+        ]
+        return float(self._compute_overall_score(regime_results)), regime_results
+
     # ── Slice Evaluation ──────────────────────────────────────────────────────
 
     def _evaluate_slice(
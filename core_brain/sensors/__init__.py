@@ -8,6 +8,7 @@ Available Sensors:
 - SessionLiquiditySensor: London session High/Low detection
 - FibonacciExtender: Fibonacci extension projections (S-0005 SESS_EXT_0001)
 - MarketStructureAnalyzer: HH/HL/LH/LL & Breaker Block detection (S-0006 STRUC_SHIFT_0001)
+- CandlePatternSuite: Vectorized candle-pattern masks over NumPy OHLC arrays
 """
 
 from .imbalance_detector import ImbalanceDetector
@@ -20,6 +21,7 @@ from .elephant_candle_detector import ElephantCandleDetector
 from .liquidity_sweep_detector import LiquiditySweepDetector
 from .session_state_detector import SessionStateDetector
 from .reasoning_event_builder import ReasoningEventBuilder
+from .pattern_sensor_suite import CandlePatternSuite, OHLCArrays
 
 __all__ = [
     "ImbalanceDetector",
@@ -33,5 +35,7 @@ __all__ = [
     "ReasoningEventBuilder",
     "initialize_fibonacci_extender",
     "MarketStructureAnalyzer",
+    "CandlePatternSuite",
+    "OHLCArrays",
 ]
 
@@ -20,6 +20,8 @@ import numpy as np
 from typing import Dict, List, Optional, Any, Literal
 from datetime import datetime
 
+from core_brain.sensors.pattern_sensor_suite import CandlePatternSuite
+
 logger = logging.getLogger(__name__)
 
 
@@ -268,6 +270,15 @@ class CandlestickPatternDetector:
             return False
     
     
+    def pattern_suite(self) -> CandlePatternSuite:
+        """Suite vectorizada con los umbrales actuales del detector."""
+        return CandlePatternSuite(
+            rejection_tail_threshold=self.rejection_tail_threshold,
+            hammer_body_max_pct=self.hammer_body_max_pct,
+            min_tail_pips=self.min_tail_pips,
+        )
+    
+    
     def scan_for_rejections(
         self,
         df: pd.DataFrame
@@ -275,27 +286,17 @@ class CandlestickPatternDetector:
         """
         Escanea un DataFrame buscando velas con Rejection Tails.
         
+        Una sola pasada vectorizada sobre arrays OHLC (CandlePatternSuite),
+        equivalente a detect_rejection_tail() vela a vela.
+        
         Args:
             df: DataFrame con columnas OHLC
             
         Returns:
             Lista de índices donde se detectaron rejection tails
         """
-        rejection_indices = []
-        
         try:
-            for idx in range(len(df)):
-                row = df.iloc[idx]
-                candle = {
-                    'open': row['open'],
-                    'high': row['high'],
-                    'low': row['low'],
-                    'close': row['close'],
-                    'volume': row.get('volume', 0)
-                }
-                
-                if self.detect_rejection_tail(candle):
-                    rejection_indices.append(idx)
+            rejection_indices = self.pattern_suite().scan(df).indices('rejection')
             
             logger.debug(
                 f"[{self.trace_id}] Found {len(rejection_indices)} rejection tails "
@@ -330,7 +331,8 @@ class CandlestickPatternDetector:
             Dict con descripción de patrón si existe, None si no hay
         """
         try:
-            rejections = self.scan_for_rejections(df)
+            scan = self.pattern_suite().scan(df)
+            rejections = scan.indices('rejection')
             
             if len(rejections) < min_length:
                 return None
@@ -344,15 +346,7 @@ class CandlestickPatternDetector:
             }
             
             # Si hay hammer al final
-            last_row = df.iloc[-1]
-            last_candle = {
-                'open': last_row['open'],
-                'high': last_row['high'],
-                'low': last_row['low'],
-                'close': last_row['close'],
-            }
-            
-            if self.detect_hammer(last_candle):
+            if scan.flags_at(-1)['hammer']:
                 pattern_description['final_pattern'] = 'hammer'
                 pattern_description['bullish_confirmation'] = True
             
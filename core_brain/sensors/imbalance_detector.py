@@ -19,6 +19,9 @@ from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
+from core_brain.sensors.pattern_sensor_suite import OHLCArrays, fvg_masks
 from data_vault.storage import StorageManager
 from models.signal import Signal, SignalType
 
@@ -78,6 +81,9 @@ class ImbalanceDetector:
         Un FVG bullish ocurre cuando: Low[n+2] > High[n] (gap arriba)
         Un FVG bearish ocurre cuando: High[n+2] < Low[n] (gap abajo)
         
+        Los gaps de toda la ventana se calculan en una pasada vectorizada
+        sobre arrays OHLC (pattern_sensor_suite.fvg_masks).
+        
         Args:
             ohlcv_data: Lista de velas OHLCV
             pip_size: Tamaño del pip para cálculos (ej. 0.0001 para Forex)
@@ -101,40 +107,27 @@ class ImbalanceDetector:
         if not ohlcv_data or len(ohlcv_data) < 3:
             return fvgs
         
-        # Iterar buscando patrón de 3 velas
-        for i in range(len(ohlcv_data) - 2):
-            candle1 = ohlcv_data[i]
-            candle3 = ohlcv_data[i + 2]
-            
-            high1 = candle1.get("high", 0)
-            low1 = candle1.get("low", 0)
-            high3 = candle3.get("high", 0)
-            low3 = candle3.get("low", 0)
-            
-            # Bullish FVG: Low[3] > High[1]
-            bullish_gap = low3 - high1
-            if bullish_gap >= min_size_price:
-                fvgs.append({
-                    "type": "bullish_fvg",
-                    "top": low3,
-                    "bottom": high1,
-                    "size_pips": bullish_gap / pip_size if pip_size > 0 else 0,
-                    "index": i + 1,
-                    "timeframe": timeframe
-                })
-                continue
-            
-            # Bearish FVG: High[3] < Low[1]
-            bearish_gap = low1 - high3
-            if bearish_gap >= min_size_price:
-                fvgs.append({
-                    "type": "bearish_fvg",
-                    "top": low1,
-                    "bottom": high3,
-                    "size_pips": bearish_gap / pip_size if pip_size > 0 else 0,
-                    "index": i + 1,
-                    "timeframe": timeframe
-                })
+        # Patrón de 3 velas: máscaras indexadas en la vela central (expansión)
+        ohlc = OHLCArrays.from_candles(ohlcv_data)
+        gaps = fvg_masks(ohlc, min_size_price)
+        
+        for idx in np.flatnonzero(gaps["bullish"] | gaps["bearish"]).tolist():
+            if gaps["bullish"][idx]:
+                # Bullish FVG: Low[3] > High[1]
+                gap, top, bottom = gaps["bullish_gap"][idx], ohlc.low[idx + 1], ohlc.high[idx - 1]
+                fvg_type = "bullish_fvg"
+            else:
+                # Bearish FVG: High[3] < Low[1]
+                gap, top, bottom = gaps["bearish_gap"][idx], ohlc.low[idx - 1], ohlc.high[idx + 1]
+                fvg_type = "bearish_fvg"
+            fvgs.append({
+                "type": fvg_type,
+                "top": float(top),
+                "bottom": float(bottom),
+                "size_pips": float(gap / pip_size) if pip_size > 0 else 0,
+                "index": idx,
+                "timeframe": timeframe
+            })
         
         logger.debug(f"[{self.trace_id}] FVGs detectados: {len(fvgs)} en {timeframe}")
         return fvgs
@@ -11,11 +11,12 @@ Responsabilidades:
 3. Mapear Breaker Block (zona de quiebre de estructura)
 4. Validar y detectar Break of Structure (BOS)
 5. Calcular zonas de pullback para entrada confluencia
-6. Caching de resultados para optimización
+6. Caching de resultados por (symbol, timeframe, última vela)
 
 Arquitectura Agnóstica: Ningún import de broker
 Inyección de Dependencias: storage en constructor
-Algoritmo: ZigZag institucional con pivot detection
+Algoritmo: ZigZag institucional con pivot detection (vectorizado, ver
+swing_pivot_engine.py — SENSOR-SWING-PIVOT-2026-001)
 
 TRACE_ID: SENSOR-MARKET-STRUCT-001
 """
@@ -28,10 +29,23 @@ from typing import Dict, List, Optional, Any, Literal, Tuple
 from datetime import datetime
 
 from core_brain.symbol_taxonomy_engine import SymbolTaxonomy
+from core_brain.sensors.swing_pivot_engine import SwingPivotEngine, run_mask
 
 logger = logging.getLogger(__name__)
 
 
+def _skipna_max(values: np.ndarray) -> float:
+    """max() con semántica pandas (ignora NaN; NaN si no hay valores)."""
+    valid = values[~np.isnan(values)]
+    return valid.max() if valid.size else np.nan
+
+
+def _skipna_min(values: np.ndarray) -> float:
+    """min() con semántica pandas (ignora NaN; NaN si no hay valores)."""
+    valid = values[~np.isnan(values)]
+    return valid.min() if valid.size else np.nan
+
+
 class MarketStructureAnalyzer:
     """
     Analizador de estructura de mercado con detección de pivots y quiebres.
@@ -58,8 +72,11 @@ class MarketStructureAnalyzer:
         self.storage = storage
         self.trace_id = trace_id or "SENSOR-MARKET-STRUCT-001"
         
-        # Cache de estructuras detectadas
-        self._structure_cache: Dict[str, Dict[str, Any]] = {}
+        # Cache de estructuras detectadas: (symbol, timeframe) -> (sello última vela, resultado)
+        self._structure_cache: Dict[Tuple[str, Optional[str]], Tuple[Any, Dict[str, Any]]] = {}
+        
+        # Motor de pivots vectorizado con actualización incremental
+        self._pivot_engine = SwingPivotEngine()
         
         # Parámetros dinámicos desde BD
         self._load_config()
@@ -118,21 +135,7 @@ class MarketStructureAnalyzer:
         if len(candles) < 3:
             return []
         
-        higher_highs = []
-        highs = candles['high'].values
-        
-        for i in range(1, len(highs)):
-            # HH: high actual > high anterior
-            if highs[i] > highs[i-1]:
-                # Validar que no sea solo por ruido (comparar con 2 velas atrás si existe)
-                if i >= 2:
-                    # Debe ser más alto que ambas anteriores
-                    if highs[i] > highs[i-1] and highs[i-1] > highs[i-2]:
-                        higher_highs.append(i)
-                else:
-                    higher_highs.append(i)
-        
-        return higher_highs
+        return np.flatnonzero(run_mask(candles['high'].to_numpy(), rising=True)).tolist()
     
     
     def detect_higher_lows(self, candles: pd.DataFrame) -> List[int]:
@@ -150,20 +153,7 @@ class MarketStructureAnalyzer:
         if len(candles) < 3:
             return []
         
-        higher_lows = []
-        lows = candles['low'].values
-        
-        for i in range(1, len(lows)):
-            # HL: low actual > low anterior
-            if lows[i] > lows[i-1]:
-                # Validar estructura (low actual > low anterior > low hace 2 velas)
-                if i >= 2:
-                    if lows[i] > lows[i-1] and lows[i-1] > lows[i-2]:
-                        higher_lows.append(i)
-                else:
-                    higher_lows.append(i)
-        
-        return higher_lows
+        return np.flatnonzero(run_mask(candles['low'].to_numpy(), rising=True)).tolist()
     
     
     def detect_lower_highs(self, candles: pd.DataFrame) -> List[int]:
@@ -175,17 +165,7 @@ class MarketStructureAnalyzer:
         if len(candles) < 3:
             return []
         
-        lower_highs = []
-        highs = candles['high'].values
-        
-        for i in range(1, len(highs)):
-            if highs[i] < highs[i-1]:
-                if i >= 2 and highs[i] < highs[i-1] and highs[i-1] < highs[i-2]:
-                    lower_highs.append(i)
-                elif i < 2:
-                    lower_highs.append(i)
-        
-        return lower_highs
+        return np.flatnonzero(run_mask(candles['high'].to_numpy(), rising=False)).tolist()
     
     
     def detect_lower_lows(self, candles: pd.DataFrame) -> List[int]:
@@ -197,22 +177,17 @@ class MarketStructureAnalyzer:
         if len(candles) < 3:
             return []
         
-        lower_lows = []
-        lows = candles['low'].values
-        
-        for i in range(1, len(lows)):
-            if lows[i] < lows[i-1]:
-                if i >= 2 and lows[i] < lows[i-1] and lows[i-1] < lows[i-2]:
-                    lower_lows.append(i)
-                elif i < 2:
-                    lower_lows.append(i)
-        
-        return lower_lows
+        return np.flatnonzero(run_mask(candles['low'].to_numpy(), rising=False)).tolist()
     
     
     # ============= DETECCIÓN DE ESTRUCTURA =============
     
-    def detect_market_structure(self, symbol: str, candles: pd.DataFrame) -> Dict[str, Any]:
+    def detect_market_structure(
+        self,
+        symbol: str,
+        candles: pd.DataFrame,
+        timeframe: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Detecta estructura de mercado (tendencia alcista o bajista).
         
@@ -226,11 +201,12 @@ class MarketStructureAnalyzer:
         2. Detección de pivots
         3. Clasificación via método separado (SoC)
         4. Scoring profesional de confianza
-        5. Caching
+        5. Caching por (symbol, timeframe, última vela) con actualización incremental
         
         Args:
             symbol: Ticker del activo (ej. 'EUR/USD' o 'BTC/USD'). Utilizado para Polimorfismo OHLC vs OHLCV.
             candles: DataFrame con OHLC
+            timeframe: Timeframe de las velas (clave de cache; opcional)
             
         Returns:
             Dict con estructura, validez, niveles de confianza y pivots.
@@ -240,19 +216,23 @@ class MarketStructureAnalyzer:
         if self._validate_input_candles(symbol, candles) is False:
             return self._create_insufficient_result(0, "Por validar antes de procesar detectores pivots")
         
-        # PASO 2: Buscar en cache
-        cache_key = f"struct_{hash(candles.iloc[-1, :].to_string())}"
-        if cache_key in self._structure_cache:
-            return self._structure_cache[cache_key]
+        # PASO 2: Buscar en cache (sello de la última vela, sin serializar filas)
+        cache_key = (symbol, timeframe)
+        prev_stamp, last_stamp = self._bar_stamps(candles)
+        cached = self._structure_cache.get(cache_key)
+        if cached is not None and last_stamp is not None and cached[0] == last_stamp:
+            return cached[1]
         
-        # PASO 3: Usar últimas N velas y detectar pivots
+        # PASO 3: Usar últimas N velas y detectar pivots (vectorizado / incremental)
         lookback = min(len(candles), self.structure_lookback_candles)
-        recent_candles = candles.iloc[-lookback:].reset_index(drop=True)
-        
-        hh = self.detect_higher_highs(recent_candles)
-        hl = self.detect_higher_lows(recent_candles)
-        lh = self.detect_lower_highs(recent_candles)
-        ll = self.detect_lower_lows(recent_candles)
+        pivots = self._pivot_engine.update(
+            cache_key,
+            candles['high'].to_numpy()[-lookback:],
+            candles['low'].to_numpy()[-lookback:],
+            prev_stamp,
+            last_stamp,
+        )
+        hh, hl, lh, ll = pivots.hh, pivots.hl, pivots.lh, pivots.ll
         
         # PASO 4: Clasificar estructura (método separado para DRY + SoC)
         structure_type, validation_level, is_valid = self._classify_structure_strength(
@@ -290,7 +270,8 @@ class MarketStructureAnalyzer:
         }
         
         # Cachear resultado
-        self._structure_cache[cache_key] = result
+        if last_stamp is not None:
+            self._structure_cache[cache_key] = (last_stamp, result)
         
         logger.debug(
             f"[{self.trace_id}] Structure detected: {structure_type} "
@@ -301,6 +282,33 @@ class MarketStructureAnalyzer:
         return result
     
     
+    @staticmethod
+    def _bar_stamps(candles: pd.DataFrame) -> Tuple[Any, Any]:
+        """
+        Sellos (penúltima, última) vela para cache e actualización incremental.
+        
+        Sello = (timestamp, high, low): la vela en formación cambia high/low sin
+        cambiar su timestamp, y la estructura solo depende de high/low.
+        Sin columna/índice temporal se usa la posición de la vela.
+        """
+        times: Any = None
+        for col in ('time', 'timestamp', 'datetime'):
+            if col in candles.columns:
+                times = candles[col].to_numpy()
+                break
+        if times is None and isinstance(candles.index, pd.DatetimeIndex):
+            times = candles.index.to_numpy()
+        highs = candles['high'].to_numpy()
+        lows = candles['low'].to_numpy()
+        n = len(candles)
+        
+        def stamp(i: int) -> Any:
+            when = times[i] if times is not None else ('pos', n + i)
+            return (when, float(highs[i]), float(lows[i]))
+        
+        return (stamp(-2) if n >= 2 else None), stamp(-1)
+    
+    
     def _validate_input_candles(self, symbol: str, candles: pd.DataFrame) -> bool:
         """
         Valida que el DataFrame de velas sea válido de acuerdo al tipo de activo.
@@ -611,7 +619,8 @@ class MarketStructureAnalyzer:
             }
         
         lookback = min(len(candles), self.structure_lookback_candles)
-        recent_candles = candles.iloc[-lookback:].reset_index(drop=True)
+        highs = candles['high'].to_numpy(dtype=float)[-lookback:]
+        lows = candles['low'].to_numpy(dtype=float)[-lookback:]
         
         breaker_high = None
         breaker_low = None
@@ -623,21 +632,21 @@ class MarketStructureAnalyzer:
                 
                 # Zona alrededor del HL anterior
                 if hl_idx > 0:
-                    breaker_high = recent_candles.iloc[hl_idx:hl_idx+1]['high'].max()
-                    breaker_low = recent_candles.iloc[max(0, hl_idx-2):hl_idx+1]['low'].min()
+                    breaker_high = _skipna_max(highs[hl_idx:hl_idx+1])
+                    breaker_low = _skipna_min(lows[max(0, hl_idx-2):hl_idx+1])
         
         elif structure['type'] == 'DOWNTREND':
             # En DOWNTREND, Breaker Block es la zona donde ocurrió el último LH
             if structure['last_lh_idx'] is not None:
                 lh_idx = structure['last_lh_idx']
                 
-                breaker_low = recent_candles.iloc[lh_idx:lh_idx+1]['low'].min()
-                breaker_high = recent_candles.iloc[max(0, lh_idx-2):lh_idx+1]['high'].max()
+                breaker_low = _skipna_min(lows[lh_idx:lh_idx+1])
+                breaker_high = _skipna_max(highs[max(0, lh_idx-2):lh_idx+1])
         
         # Si no hay breaker detectado, usar últimos pivots
         if breaker_high is None or breaker_low is None:
-            breaker_high = recent_candles['high'].iloc[-5:].max()
-            breaker_low = recent_candles['low'].iloc[-5:].min()
+            breaker_high = _skipna_max(highs[-5:])
+            breaker_low = _skipna_min(lows[-5:])
         
         # Aplicar buffer
         buffer = self.breaker_buffer_pips / 10000
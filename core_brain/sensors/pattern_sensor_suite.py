@@ -0,0 +1,299 @@
+"""
+Pattern Sensor Suite - Patrones de vela vectorizados sobre arrays OHLC NumPy
+============================================================================
+
+Responsabilidades:
+1. Convertir una sola vez el DataFrame (o la lista de velas) a arrays OHLCV
+   contiguos (OHLCArrays)
+2. Calcular en una pasada vectorizada cuerpo, mechas, rango, proporciones y
+   z-scores de toda la ventana (CandleFeatures)
+3. Producir las máscaras de patrón con la misma semántica que los detectores
+   escalares: Rejection Tail / Hammer (CandlestickPatternDetector),
+   Pin Bar / Engulfing (LiquiditySweepDetector), Elephant Candle
+   (ElephantCandleDetector) y FVG (ImbalanceDetector)
+4. Exponer flags por vela (PatternScan.flags_at / indices)
+
+Los detectores conservan sus métodos por vela como API pública; sus rutas de
+escaneo (scan_for_rejections, detect_fvg) delegan aquí.
+
+Arquitectura Agnóstica: Ningún import de broker
+
+TRACE_ID: PERF-PATTERN-ARRAYS-2026-001
+"""
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+_PIPS_PER_PRICE = 10000          # Conversión precio → pips usada por ElephantCandleDetector
+_PIN_BAR_MAX_BODY_RATIO = 0.25   # LiquiditySweepDetector.detect_pin_bar
+_PIN_BAR_MIN_WICK_RATIO = 0.50
+_HAMMER_MAX_UPPER_RATIO = 0.1    # CandlestickPatternDetector.detect_hammer
+_ENGULF_MIN_PREV_BODY = 1e-10
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """numerator / denominator con 0 donde el denominador es 0 o NaN."""
+    out = np.zeros_like(numerator, dtype=np.float64)
+    np.divide(numerator, denominator, out=out, where=(denominator != 0) & ~np.isnan(denominator))
+    return out
+
+
+def _zscore(values: np.ndarray) -> np.ndarray:
+    """Z-score de cada vela frente a la ventana completa (desviación muestral)."""
+    valid = values[~np.isnan(values)]
+    if valid.size < 2:
+        return np.zeros_like(values)
+    std = valid.std(ddof=1)
+    if std == 0:
+        return np.zeros_like(values)
+    return (values - valid.mean()) / std
+
+
+@dataclass(frozen=True)
+class OHLCArrays:
+    """Velas OHLCV como arrays float64 contiguos (una fila por vela)."""
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.close.shape[0])
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "OHLCArrays":
+        """Arrays desde un DataFrame con columnas open/high/low/close[/volume]."""
+        def column(name: str) -> np.ndarray:
+            if name not in df.columns:
+                return np.zeros(len(df), dtype=np.float64)
+            return np.ascontiguousarray(df[name].to_numpy(dtype=np.float64, na_value=np.nan))
+
+        return cls(column("open"), column("high"), column("low"), column("close"), column("volume"))
+
+    @classmethod
+    def from_candles(cls, candles: Sequence[Mapping[str, Any]]) -> "OHLCArrays":
+        """Arrays desde una lista de dicts OHLCV; las claves ausentes valen 0."""
+        def column(name: str) -> np.ndarray:
+            return np.fromiter(
+                (c.get(name, 0) or 0 for c in candles), dtype=np.float64, count=len(candles)
+            )
+
+        return cls(column("open"), column("high"), column("low"), column("close"), column("volume"))
+
+    def candle(self, index: int) -> Dict[str, float]:
+        """Vela ``index`` (admite negativos) como dict, para las APIs por vela."""
+        return {
+            "open": float(self.open[index]),
+            "high": float(self.high[index]),
+            "low": float(self.low[index]),
+            "close": float(self.close[index]),
+            "volume": float(self.volume[index]),
+        }
+
+
+@dataclass(frozen=True)
+class CandleFeatures:
+    """Geometría de cada vela de la ventana, calculada en una pasada."""
+    body: np.ndarray
+    upper_tail: np.ndarray
+    lower_tail: np.ndarray
+    range: np.ndarray
+    body_ratio: np.ndarray
+    upper_ratio: np.ndarray
+    lower_ratio: np.ndarray
+    body_zscore: np.ndarray
+    range_zscore: np.ndarray
+    bullish: np.ndarray
+    bearish: np.ndarray
+
+    @classmethod
+    def compute(cls, ohlc: OHLCArrays) -> "CandleFeatures":
+        with np.errstate(invalid="ignore"):
+            body_top = np.maximum(ohlc.open, ohlc.close)
+            body_bottom = np.minimum(ohlc.open, ohlc.close)
+            body = np.abs(ohlc.close - ohlc.open)
+            upper_tail = ohlc.high - body_top
+            lower_tail = body_bottom - ohlc.low
+            candle_range = ohlc.high - ohlc.low
+            return cls(
+                body=body,
+                upper_tail=upper_tail,
+                lower_tail=lower_tail,
+                range=candle_range,
+                body_ratio=_ratio(body, candle_range),
+                upper_ratio=_ratio(upper_tail, candle_range),
+                lower_ratio=_ratio(lower_tail, candle_range),
+                body_zscore=_zscore(body),
+                range_zscore=_zscore(candle_range),
+                bullish=ohlc.close > ohlc.open,
+                bearish=ohlc.close < ohlc.open,
+            )
+
+
+# ── Máscaras de patrón (misma semántica que los detectores escalares) ─────────
+
+def rejection_mask(f: CandleFeatures, threshold: float = 0.5) -> np.ndarray:
+    """Rejection Tail: alguna mecha >= ``threshold`` del rango."""
+    return (f.range != 0) & ((f.lower_ratio >= threshold) | (f.upper_ratio >= threshold))
+
+
+def hammer_mask(
+    f: CandleFeatures,
+    body_max_pct: float = 0.3,
+    tail_threshold: float = 0.5,
+    min_range: float = 5,
+) -> np.ndarray:
+    """Hammer: cuerpo pequeño, mecha inferior larga, superior corta, cierre alcista."""
+    return (
+        (f.range != 0)
+        & (f.range >= min_range)
+        & (f.body_ratio <= body_max_pct)
+        & (f.lower_ratio >= tail_threshold)
+        & (f.upper_ratio < _HAMMER_MAX_UPPER_RATIO)
+        & f.bullish
+    )
+
+
+def pin_bar_masks(ohlc: OHLCArrays, f: CandleFeatures) -> Dict[str, np.ndarray]:
+    """Pin Bar alcista (mecha inferior dominante) / bajista (superior) y su strength."""
+    positive = (ohlc.open > 0) & (ohlc.high > 0) & (ohlc.low > 0) & (ohlc.close > 0)
+    small_body = positive & (f.range != 0) & (f.body != 0) & (f.body_ratio <= _PIN_BAR_MAX_BODY_RATIO)
+    bullish = small_body & (f.lower_ratio > f.upper_ratio) & (f.lower_ratio >= _PIN_BAR_MIN_WICK_RATIO)
+    bearish = small_body & (f.upper_ratio > f.lower_ratio) & (f.upper_ratio >= _PIN_BAR_MIN_WICK_RATIO)
+    strength = np.where(bullish, np.minimum(1.0, f.lower_ratio),
+                        np.where(bearish, np.minimum(1.0, f.upper_ratio), 0.0))
+    return {"bullish": bullish, "bearish": bearish, "strength": strength}
+
+
+def engulfing_masks(ohlc: OHLCArrays, f: CandleFeatures) -> Dict[str, np.ndarray]:
+    """Engulfing de la vela i sobre la i-1 (la primera vela nunca es engulfing)."""
+    n = len(ohlc)
+    bullish = np.zeros(n, dtype=bool)
+    bearish = np.zeros(n, dtype=bool)
+    strength = np.zeros(n, dtype=np.float64)
+    if n >= 2:
+        prev_body, curr_body = f.body[:-1], f.body[1:]
+        prev_open, curr_open = ohlc.open[:-1], ohlc.open[1:]
+        prev_close, curr_close = ohlc.close[:-1], ohlc.close[1:]
+        larger = curr_body > prev_body
+        bullish[1:] = larger & (curr_open < prev_open) & (curr_close > prev_close)
+        bearish[1:] = larger & (curr_open > prev_open) & (curr_close < prev_close)
+        ratio = curr_body / np.maximum(prev_body, _ENGULF_MIN_PREV_BODY)
+        strength[1:] = np.where(bullish[1:] | bearish[1:], np.minimum(1.0, ratio * 0.5 + 0.5), 0.0)
+    return {"bullish": bullish, "bearish": bearish, "strength": strength}
+
+
+def elephant_mask(f: CandleFeatures, min_body_pips: float = 50, min_body_ratio: float = 0.6) -> np.ndarray:
+    """Elephant Candle: cuerpo >= ``min_body_pips`` y >= ``min_body_ratio`` del rango."""
+    # En pips, como ElephantCandleDetector, para que los empates redondeen igual
+    body_pips = f.body * _PIPS_PER_PRICE
+    range_pips = f.range * _PIPS_PER_PRICE
+    return (range_pips != 0) & (body_pips >= min_body_pips) & (_ratio(body_pips, range_pips) >= min_body_ratio)
+
+
+def fvg_masks(ohlc: OHLCArrays, min_size_price: float) -> Dict[str, np.ndarray]:
+    """
+    Fair Value Gaps indexados en la vela de expansión (la central del trío).
+
+    Bullish: Low[i+1] - High[i-1] >= min; Bearish (solo si no es bullish):
+    Low[i-1] - High[i+1] >= min.
+    """
+    n = len(ohlc)
+    bullish = np.zeros(n, dtype=bool)
+    bearish = np.zeros(n, dtype=bool)
+    bullish_gap = np.zeros(n, dtype=np.float64)
+    bearish_gap = np.zeros(n, dtype=np.float64)
+    if n >= 3:
+        bullish_gap[1:-1] = ohlc.low[2:] - ohlc.high[:-2]
+        bearish_gap[1:-1] = ohlc.low[:-2] - ohlc.high[2:]
+        bullish[1:-1] = bullish_gap[1:-1] >= min_size_price
+        bearish[1:-1] = ~bullish[1:-1] & (bearish_gap[1:-1] >= min_size_price)
+    return {"bullish": bullish, "bearish": bearish, "bullish_gap": bullish_gap, "bearish_gap": bearish_gap}
+
+
+@dataclass(frozen=True)
+class PatternScan:
+    """Resultado de un escaneo: features y un flag booleano por patrón y vela."""
+    ohlc: OHLCArrays
+    features: CandleFeatures
+    masks: Dict[str, np.ndarray]
+
+    def indices(self, pattern: str) -> List[int]:
+        """Índices de las velas donde ``pattern`` está activo."""
+        return np.flatnonzero(self.masks[pattern]).tolist()
+
+    def flags_at(self, index: int) -> Dict[str, bool]:
+        """Flags de todos los patrones para la vela ``index`` (admite negativos)."""
+        return {name: bool(mask[index]) for name, mask in self.masks.items()}
+
+
+class CandlePatternSuite:
+    """
+    Escáner vectorizado de patrones de vela.
+
+    Los umbrales por defecto son los de los detectores escalares; los
+    detectores pasan los suyos (cargados de storage) al construir la suite.
+    """
+
+    def __init__(
+        self,
+        rejection_tail_threshold: float = 0.5,
+        hammer_body_max_pct: float = 0.3,
+        min_tail_pips: float = 5,
+        elephant_min_body_pips: float = 50,
+        elephant_min_body_ratio: float = 0.6,
+        fvg_min_size_price: Optional[float] = None,
+    ):
+        self.rejection_tail_threshold = rejection_tail_threshold
+        self.hammer_body_max_pct = hammer_body_max_pct
+        self.min_tail_pips = min_tail_pips
+        self.elephant_min_body_pips = elephant_min_body_pips
+        self.elephant_min_body_ratio = elephant_min_body_ratio
+        self.fvg_min_size_price = fvg_min_size_price
+
+    def scan(self, data: Any) -> PatternScan:
+        """
+        Calcula features y máscaras de toda la ventana en una pasada.
+
+        Args:
+            data: OHLCArrays, DataFrame OHLC o lista de dicts OHLCV
+
+        Returns:
+            PatternScan con máscaras: rejection, hammer, pin_bar_bullish,
+            pin_bar_bearish, engulfing_bullish, engulfing_bearish, elephant
+            y (si hay ``fvg_min_size_price``) fvg_bullish / fvg_bearish
+        """
+        ohlc = self._as_arrays(data)
+        features = CandleFeatures.compute(ohlc)
+        pin = pin_bar_masks(ohlc, features)
+        engulf = engulfing_masks(ohlc, features)
+        masks: Dict[str, np.ndarray] = {
+            "rejection": rejection_mask(features, self.rejection_tail_threshold),
+            "hammer": hammer_mask(
+                features, self.hammer_body_max_pct, self.rejection_tail_threshold, self.min_tail_pips
+            ),
+            "pin_bar_bullish": pin["bullish"],
+            "pin_bar_bearish": pin["bearish"],
+            "engulfing_bullish": engulf["bullish"],
+            "engulfing_bearish": engulf["bearish"],
+            "elephant": elephant_mask(features, self.elephant_min_body_pips, self.elephant_min_body_ratio),
+        }
+        if self.fvg_min_size_price is not None:
+            fvg = fvg_masks(ohlc, self.fvg_min_size_price)
+            masks["fvg_bullish"] = fvg["bullish"]
+            masks["fvg_bearish"] = fvg["bearish"]
+        return PatternScan(ohlc=ohlc, features=features, masks=masks)
+
+    @staticmethod
+    def _as_arrays(data: Any) -> OHLCArrays:
+        if isinstance(data, OHLCArrays):
+            return data
+        if isinstance(data, pd.DataFrame):
+            return OHLCArrays.from_frame(data)
+        return OHLCArrays.from_candles(data)
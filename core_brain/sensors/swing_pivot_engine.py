@@ -0,0 +1,147 @@
+"""
+Swing Pivot Engine - Vectorized HH/HL/LH/LL detection for MarketStructureAnalyzer
+
+TRACE_ID: SENSOR-SWING-PIVOT-2026-001
+
+Responsabilidades:
+1. Detectar pivots con comparaciones NumPy sobre ventanas deslizantes de 3 velas
+   (misma regla que los detectores originales del analizador).
+2. Mantener estado por (symbol, timeframe) para actualizar en O(1) cuando se
+   añade una sola vela a la ventana de lookback.
+
+Regla de pivot (ventana de lookback re-indexada desde 0):
+- i >= 2: v[i] > v[i-1] > v[i-2]  (HH/HL)  |  v[i] < v[i-1] < v[i-2]  (LH/LL)
+- i == 1: v[1] > v[0]               (HH/HL)  |  v[1] < v[0]               (LH/LL)
+- Ventanas de menos de 3 velas no producen pivots.
+
+Sin I/O ni dependencias de broker: el analizador entrega arrays y sellos de vela.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+# Orden fijo de las máscaras: (serie, dirección ascendente)
+PIVOT_KINDS: Tuple[Tuple[str, str, bool], ...] = (
+    ("hh", "high", True),
+    ("hl", "low", True),
+    ("lh", "high", False),
+    ("ll", "low", False),
+)
+
+
+def run_mask(values: np.ndarray, rising: bool) -> np.ndarray:
+    """
+    Máscara booleana de pivots para una serie (regla de 3 velas del analizador).
+
+    Args:
+        values: Serie de highs o lows (ventana de lookback)
+        rising: True para HH/HL, False para LH/LL
+
+    Returns:
+        np.ndarray[bool] del mismo largo que values
+    """
+    n = len(values)
+    mask = np.zeros(n, dtype=bool)
+    if n < 2:
+        return mask
+    step = values[1:] > values[:-1] if rising else values[1:] < values[:-1]
+    mask[1] = step[0]
+    if n > 2:
+        mask[2:] = step[1:] & step[:-1]
+    return mask
+
+
+def _tail_bit(values: np.ndarray, i: int, rising: bool) -> bool:
+    """Valor de la máscara en la posición i usando solo v[i-2:i+1]."""
+    if i <= 0:
+        return False
+    if rising:
+        step = values[i] > values[i - 1]
+        return bool(step and (i == 1 or values[i - 1] > values[i - 2]))
+    step = values[i] < values[i - 1]
+    return bool(step and (i == 1 or values[i - 1] < values[i - 2]))
+
+
+@dataclass
+class PivotSet:
+    """Índices de pivots dentro de la ventana de lookback."""
+    hh: List[int] = field(default_factory=list)
+    hl: List[int] = field(default_factory=list)
+    lh: List[int] = field(default_factory=list)
+    ll: List[int] = field(default_factory=list)
+
+
+@dataclass
+class _SwingState:
+    last_stamp: Any
+    size: int
+    masks: Dict[str, np.ndarray]
+
+
+class SwingPivotEngine:
+    """
+    Motor de pivots vectorizado con actualización incremental por clave.
+
+    Uso:
+        pivots = engine.update(("EURUSD", "M5"), highs, lows, prev_stamp, last_stamp)
+    """
+
+    def __init__(self, max_keys: int = 4096) -> None:
+        self.max_keys = max_keys
+        self._states: Dict[Hashable, _SwingState] = {}
+        self.stats: Dict[str, int] = {"full": 0, "incremental": 0}
+
+    def update(
+        self,
+        key: Optional[Hashable],
+        highs: np.ndarray,
+        lows: np.ndarray,
+        prev_stamp: Any = None,
+        last_stamp: Any = None,
+    ) -> PivotSet:
+        """
+        Calcula los pivots de la ventana (highs/lows ya recortados al lookback).
+
+        Si la ventana anterior de la misma clave terminaba en prev_stamp, solo se
+        evalúa la vela nueva y se desplazan las máscaras; si no, recálculo completo.
+        """
+        size = len(highs)
+        series = {"high": highs, "low": lows}
+        state = self._states.get(key) if key is not None else None
+
+        if (
+            state is not None
+            and last_stamp is not None
+            and prev_stamp is not None
+            and state.last_stamp == prev_stamp
+            and size in (state.size, state.size + 1)
+            and size >= 2
+        ):
+            masks = {}
+            for name, col, rising in PIVOT_KINDS:
+                old = state.masks[name]
+                new = np.empty(size, dtype=bool)
+                if size == state.size:
+                    new[:-1] = old[1:]
+                else:
+                    new[:-1] = old
+                values = series[col]
+                new[0] = False
+                new[1] = _tail_bit(values, 1, rising)
+                new[-1] = _tail_bit(values, size - 1, rising)
+                masks[name] = new
+            self.stats["incremental"] += 1
+        else:
+            masks = {name: run_mask(series[col], rising) for name, col, rising in PIVOT_KINDS}
+            self.stats["full"] += 1
+
+        if key is not None and last_stamp is not None:
+            if key not in self._states and len(self._states) >= self.max_keys:
+                self._states.pop(next(iter(self._states)))
+            self._states[key] = _SwingState(last_stamp=last_stamp, size=size, masks=masks)
+
+        if size < 3:
+            return PivotSet()
+        return PivotSet(**{name: np.flatnonzero(masks[name]).tolist() for name, _, _ in PIVOT_KINDS})
@@ -8,6 +8,12 @@ Detecta anomalías de mercado en tiempo real usando solo la biblioteca estándar
 Responsibilities:
   - Flash_Crash_Detector: Z-Score de velocidad de precio (últimos 5-10 ticks)
   - Spread_Anomaly: spread actual > 300% del promedio histórico → WARNING
+  - Buffers de ticks por stream: los ticks con ``symbol`` van a su propio
+    buffer ``symbol|timeframe``; nunca se mezclan precios de instrumentos
+  - Streams por symbol|timeframe: velas alimentadas con ``symbol``/``timeframe``
+    pasan por StreamingAnomalyEngine (watermark, O(1) por vela) y cada
+    anomalía nueva escala el protocolo una única vez; un FLASH_CRASH de vela
+    solo da LOCKDOWN en temporalidades intradía (hasta H1)
   - get_defense_protocol(): retorna NONE, WARNING o LOCKDOWN
 
 Design constraints:
@@ -27,7 +33,10 @@ from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from core_brain.services.anomaly_models import AnomalyType
+from core_brain.services.anomaly_stream import StreamingAnomalyEngine, stream_key
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +45,11 @@ _DEFAULT_ZSCORE_THRESHOLD = 3.5        # Flash Crash: |Z| > 3.5
 _DEFAULT_SPREAD_RATIO_THRESHOLD = 3.0  # Spread > 300 % del promedio histórico
 _DEFAULT_TICK_WINDOW = 10              # Ventana máxima de ticks en memoria
 _MIN_TICKS_FOR_ZSCORE = 5             # Mínimo de ticks para calcular Z-Score válido
+_WARNING_ZSCORE_FACTOR = 0.7           # |Z| >= threshold × 0.7 → WARNING
+_DEFAULT_FLASH_CRASH_THRESHOLD = -2.0  # Caída % de una vela → LOCKDOWN (streams intradía)
+# Una caída de -2 % es ruido normal en una vela H4/D1 (cripto, índices): en esas
+# temporalidades el FLASH_CRASH del stream solo escala a WARNING
+_LOCKDOWN_CRASH_TIMEFRAMES = frozenset({"", "M1", "M5", "M15", "M30", "H1"})
 
 
 class DefenseProtocol(str, Enum):
@@ -64,8 +78,9 @@ class AnomalySentinel:
 
     Uso típico en el loop del orquestador::
 
-        # Alimentar con datos del ciclo anterior
-        sentinel.push_ticks(df.tail(10).to_dict("records"))
+        # Alimentar con datos del ciclo anterior (stream por symbol|timeframe:
+        # las velas ya vistas se descartan por watermark)
+        sentinel.push_ticks(df.tail(10).to_dict("records"), symbol="EURUSD", timeframe="M5")
 
         # Gate antes del siguiente ciclo
         protocol = sentinel.get_defense_protocol()
@@ -109,8 +124,17 @@ class AnomalySentinel:
         )
 
         self._tick_window = tick_window
+        # Emite desde el umbral de WARNING; LOCKDOWN se decide en get_defense_protocol
+        self.stream_engine = StreamingAnomalyEngine(
+            zscore_threshold=self.zscore_threshold * _WARNING_ZSCORE_FACTOR,
+            flash_crash_threshold=float(
+                params.get("flash_crash_threshold", _DEFAULT_FLASH_CRASH_THRESHOLD)
+            ),
+        )
         self._prices: deque = deque(maxlen=tick_window)
         self._spreads: deque = deque(maxlen=tick_window)
+        # Buffers (precios, spreads) por stream symbol|timeframe
+        self._stream_ticks: Dict[str, Tuple[deque, deque]] = {}
         self.last_trace_id: str = ""
         self._last_protocol: DefenseProtocol = DefenseProtocol.NONE
         # ETI: Event emission support
@@ -137,21 +161,46 @@ class AnomalySentinel:
             price: Precio de cierre o último precio disponible.
             spread: Spread actual del instrumento (en pips o puntos).
         """
+        self._append_tick(self._prices, self._spreads, price, spread)
+
+    @staticmethod
+    def _append_tick(prices: deque, spreads: deque, price: float, spread: float) -> None:
         if price > 0:
-            self._prices.append(float(price))
+            prices.append(float(price))
         if spread >= 0:
-            self._spreads.append(float(spread))
+            spreads.append(float(spread))
 
-    def push_ticks(self, ticks: Sequence[Dict[str, Any]]) -> None:
+    def push_ticks(
+        self,
+        ticks: Sequence[Dict[str, Any]],
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+    ) -> None:
         """
         Añade en batch una secuencia de ticks desde una lista de dicts.
 
         Claves aceptadas para precio: ``close``, ``price``, ``bid``.
         Clave aceptada para spread:   ``spread``.
 
+        Precio y spread alimentan siempre un buffer de ticks (Flash_Crash_Detector
+        y Spread_Anomaly): el global sin ``symbol``, o el del stream
+        ``symbol|timeframe`` con él. Con ``symbol`` las velas alimentan además el
+        motor incremental: solo las posteriores al watermark (o la del watermark
+        si se revisó) se evalúan, por lo que re-enviar la cola del DataFrame en
+        cada ciclo no duplica anomalías.
+
         Args:
             ticks: Lista de dicts con datos de mercado (p.ej. df.to_dict("records")).
+            symbol: Instrumento del stream (opcional).
+            timeframe: Temporalidad del stream (opcional).
         """
+        prices, spreads = self._prices, self._spreads
+        if symbol is not None:
+            self.stream_engine.ingest(symbol, timeframe or "", ticks)
+            key = stream_key(symbol, timeframe or "")
+            if key not in self._stream_ticks:
+                self._stream_ticks[key] = (deque(maxlen=self._tick_window), deque(maxlen=self._tick_window))
+            prices, spreads = self._stream_ticks[key]
         for tick in ticks:
             price = (
                 tick.get("close")
@@ -160,7 +209,12 @@ class AnomalySentinel:
                 or 0.0
             )
             spread = tick.get("spread", 0.0)
-            self.push_tick(float(price), float(spread))
+            self._append_tick(prices, spreads, float(price), float(spread))
+
+    def _tick_buffers(self) -> Iterator[Tuple[deque, deque]]:
+        """Buffer global (push_tick) y uno por stream: cada uno se evalúa por separado."""
+        yield self._prices, self._spreads
+        yield from self._stream_ticks.values()
 
     def register_listener(self, callback: Callable[["VolatilityEvent"], None]) -> None:
         """
@@ -213,10 +267,14 @@ class AnomalySentinel:
         return protocol
 
     def _resolve_protocol(self, trace_id: str) -> DefenseProtocol:
-        """Determina el protocolo resultante combinando crash y spread."""
+        """Determina el protocolo resultante combinando crash, streams y spread."""
         crash = self._detect_flash_crash(trace_id)
-        if crash == DefenseProtocol.LOCKDOWN:
+        # Los streams se drenan siempre: una anomalía no queda pendiente para otro ciclo
+        streamed = self._detect_stream_anomalies(trace_id)
+        if crash == DefenseProtocol.LOCKDOWN or streamed == DefenseProtocol.LOCKDOWN:
             return DefenseProtocol.LOCKDOWN
+        if streamed == DefenseProtocol.WARNING:
+            crash = DefenseProtocol.WARNING
         spread = self._detect_spread_anomaly(trace_id)
         if spread != DefenseProtocol.NONE:
             return spread
@@ -232,37 +290,16 @@ class AnomalySentinel:
         históricos (todos menos el último) y evalúa el último retorno
         contra esa distribución de referencia.
         Esto evita que el propio crash contamine la distribución base.
+        Cada buffer (global y por stream) se evalúa por separado y decide el
+        mayor |Z|.
 
         Regla: |Z| >= zscore_threshold → LOCKDOWN
                |Z| >= zscore_threshold * 0.7 → WARNING
         """
-        if len(self._prices) < _MIN_TICKS_FOR_ZSCORE:
+        scores = [score for prices, _ in self._tick_buffers() if (score := self._tick_z_score(prices))]
+        if not scores:
             return DefenseProtocol.NONE
-
-        prices = list(self._prices)
-        returns = [
-            (prices[i] - prices[i - 1]) / prices[i - 1]
-            for i in range(1, len(prices))
-            if prices[i - 1] != 0
-        ]
-
-        # Necesitamos al menos 2 retornos de referencia + 1 a evaluar
-        if len(returns) < 3:
-            return DefenseProtocol.NONE
-
-        reference_returns = returns[:-1]  # Distribución histórica (sin el último)
-        last_return = returns[-1]         # Retorno a evaluar
-
-        try:
-            mean_ret = statistics.mean(reference_returns)
-            stdev_ret = statistics.stdev(reference_returns)
-        except statistics.StatisticsError:
-            return DefenseProtocol.NONE
-
-        if stdev_ret == 0:
-            return DefenseProtocol.NONE
-
-        z_score = (last_return - mean_ret) / stdev_ret
+        z_score, last_return = max(scores, key=lambda score: abs(score[0]))
 
         if abs(z_score) >= self.zscore_threshold:
             self._last_z_score = z_score
@@ -277,7 +314,7 @@ class AnomalySentinel:
             )
             return DefenseProtocol.LOCKDOWN
 
-        if abs(z_score) >= self.zscore_threshold * 0.7:
+        if abs(z_score) >= self.zscore_threshold * _WARNING_ZSCORE_FACTOR:
             self._last_z_score = z_score
             logger.warning(
                 "[ANOMALY_SENTINEL] Elevated volatility. Z-Score=%.2f. Trace_ID: %s",
@@ -288,28 +325,89 @@ class AnomalySentinel:
 
         return DefenseProtocol.NONE
 
-    def _detect_spread_anomaly(self, trace_id: str) -> DefenseProtocol:
-        """
-        Spread_Anomaly: spread actual vs. promedio histórico de la ventana.
+    @staticmethod
+    def _tick_z_score(prices: deque) -> Optional[Tuple[float, float]]:
+        """(Z-Score, retorno) del último tick de un buffer; None sin datos suficientes."""
+        if len(prices) < _MIN_TICKS_FOR_ZSCORE:
+            return None
 
-        Regla: current_spread / avg_spread >= spread_ratio_threshold → WARNING
-        """
-        if len(self._spreads) < 2:
-            return DefenseProtocol.NONE
+        values = list(prices)
+        returns = [
+            (values[i] - values[i - 1]) / values[i - 1]
+            for i in range(1, len(values))
+            if values[i - 1] != 0
+        ]
+
+        # Necesitamos al menos 2 retornos de referencia + 1 a evaluar
+        if len(returns) < 3:
+            return None
 
-        spreads = list(self._spreads)
-        historical = spreads[:-1]
-        current_spread = spreads[-1]
+        reference_returns = returns[:-1]  # Distribución histórica (sin el último)
+        last_return = returns[-1]         # Retorno a evaluar
 
         try:
-            avg_spread = statistics.mean(historical)
+            mean_ret = statistics.mean(reference_returns)
+            stdev_ret = statistics.stdev(reference_returns)
         except statistics.StatisticsError:
-            return DefenseProtocol.NONE
+            return None
 
-        if avg_spread <= 0:
+        if stdev_ret == 0:
+            return None
+
+        return (last_return - mean_ret) / stdev_ret, last_return
+
+    def _detect_stream_anomalies(self, trace_id: str) -> DefenseProtocol:
+        """
+        Anomalías emitidas por los streams desde la última evaluación.
+
+        Cada anomalía se drena una sola vez, así una vela anómala escala el
+        protocolo en un único ciclo en lugar de repetirse mientras siga en la
+        cola del DataFrame.
+
+        Regla: FLASH_CRASH intradía o |Z| >= zscore_threshold → LOCKDOWN
+               FLASH_CRASH en H4/D1/W1 o |Z| >= zscore_threshold * 0.7 → WARNING
+        """
+        anomalies = self.stream_engine.drain()
+        if not anomalies:
             return DefenseProtocol.NONE
 
-        ratio = current_spread / avg_spread
+        crashes = [
+            a for a in anomalies
+            if a["anomaly_type"] == AnomalyType.FLASH_CRASH.value
+            and a["details"].get("timeframe", "") in _LOCKDOWN_CRASH_TIMEFRAMES
+        ]
+        worst = max(anomalies, key=lambda a: a["z_score"])
+        if worst["z_score"] > 0:
+            self._last_z_score = worst["z_score"]
+
+        if crashes or worst["z_score"] >= self.zscore_threshold:
+            source = crashes[0] if crashes else worst
+            logger.critical(
+                "[ANOMALY_SENTINEL] Stream anomaly %s on %s (Z=%.2f, drop=%.2f%%). "
+                "Source: %s. Trace_ID: %s",
+                source["anomaly_type"], source["symbol"], source["z_score"],
+                source["drop_percentage"], source["trace_id"], trace_id,
+            )
+            return DefenseProtocol.LOCKDOWN
+
+        logger.warning(
+            "[ANOMALY_SENTINEL] Elevated stream volatility on %s. Z-Score=%.2f. Trace_ID: %s",
+            worst["symbol"], worst["z_score"], trace_id,
+        )
+        return DefenseProtocol.WARNING
+
+    def _detect_spread_anomaly(self, trace_id: str) -> DefenseProtocol:
+        """
+        Spread_Anomaly: spread actual vs. promedio histórico de la ventana.
+
+        Cada buffer (global y por stream) se compara con su propio promedio.
+
+        Regla: current_spread / avg_spread >= spread_ratio_threshold → WARNING
+        """
+        ratios = [ratio for _, spreads in self._tick_buffers() if (ratio := self._spread_ratio(spreads))]
+        if not ratios:
+            return DefenseProtocol.NONE
+        ratio, current_spread, avg_spread = max(ratios)
 
         if ratio >= self.spread_ratio_threshold:
             self._last_spread_ratio = ratio
@@ -326,3 +424,20 @@ class AnomalySentinel:
             return DefenseProtocol.WARNING
 
         return DefenseProtocol.NONE
+
+    @staticmethod
+    def _spread_ratio(spreads: deque) -> Optional[Tuple[float, float, float]]:
+        """(ratio, spread actual, promedio histórico) de un buffer; None sin referencia."""
+        if len(spreads) < 2:
+            return None
+
+        values = list(spreads)
+        try:
+            avg_spread = statistics.mean(values[:-1])
+        except statistics.StatisticsError:
+            return None
+
+        if avg_spread <= 0:
+            return None
+
+        return values[-1] / avg_spread, values[-1], avg_spread
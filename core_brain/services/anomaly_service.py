@@ -26,6 +26,7 @@ from core_brain.services.anomaly_detectors import (
     detect_flash_crashes as detect_crashes,
 )
 from core_brain.services.anomaly_models import AnomalyEvent, AnomalyType
+from core_brain.services.anomaly_stream import StreamingAnomalyEngine
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +71,15 @@ class AnomalyService:
         self.anomaly_persistence_candles = params.get("anomaly_persistence_candles", 3)
         self.volume_spike_percentile = params.get("volume_spike_percentile", 90)
         
+        # Motor incremental: watermark por symbol|timeframe (PERF-ANOMALY-STREAM-2026-001).
+        # Re-escanear el mismo DataFrame no vuelve a emitir (ni persistir) anomalías ya vistas.
+        self.stream_engine = StreamingAnomalyEngine(
+            zscore_threshold=self.volatility_zscore_threshold,
+            flash_crash_threshold=self.flash_crash_threshold,
+            volume_percentile=self.volume_spike_percentile,
+            volume_lookback=self.anomaly_lookback_period,
+        )
+        
         # Estado de salud
         self._anomaly_history: Dict[str, List[AnomalyEvent]] = {}
         self._health_status: Dict[str, Dict[str, Any]] = {}
@@ -93,6 +103,7 @@ class AnomalyService:
         """
         Detecta picos de volatilidad anómala usando Z-Score.
         Regla: Si Z-Score > 3.0, es una anomalía estadística (3-sigma).
+        Solo se evalúan las velas posteriores al watermark del stream.
         """
         try:
             # Llamar a detector importado
@@ -101,6 +112,7 @@ class AnomalyService:
                 df=df,
                 timeframe=timeframe,
                 volatility_zscore_threshold=self.volatility_zscore_threshold,
+                engine=self.stream_engine,
             )
             
             # Convertir dicts a AnomalyEvent
@@ -148,6 +160,7 @@ class AnomalyService:
                 timeframe=timeframe,
                 flash_crash_threshold=self.flash_crash_threshold,
                 volume_percentile=self.volume_spike_percentile,
+                engine=self.stream_engine,
             )
             
             # Convertir dicts a AnomalyEvent
@@ -376,6 +389,8 @@ class AnomalyService:
         """
         Ejecuta un scan completo de anomalías en múltiples timeframes.
         Coordina detección multi-escalar y activación de defensas si es necesario.
+        Solo persiste y emite anomalías nuevas: las velas ya vistas en scans
+        previos quedan detrás del watermark del motor incremental.
         
         Args:
             symbol: Instrumento
@@ -0,0 +1,448 @@
+"""
+StreamingAnomalyEngine — Detección incremental y con watermark de anomalías
+===========================================================================
+TRACE_ID: PERF-ANOMALY-STREAM-2026-001
+
+Responsibility:
+  - Mantener, por stream ``symbol|timeframe``, estadísticas de log-retornos en
+    ventana móvil (sumas acumuladas) y actualizarlas en O(1) por vela o tick.
+  - Evaluar cada barra nueva contra la ventana que la incluye (mismo criterio
+    que el detector batch histórico): EXTREME_VOLATILITY cuando |Z| supera el
+    umbral y FLASH_CRASH cuando la vela cae más que ``flash_crash_threshold`` %.
+  - Watermark por stream (marca temporal de la última barra procesada): las
+    barras anteriores se ignoran, así cada anomalía se emite exactamente una vez
+    aunque el mismo DataFrame se re-escanee en cada ciclo.
+  - La barra del watermark puede seguir formándose: si llega de nuevo con otro
+    OHLCV se deshace su aporte (retorno, volumen, último cierre) y se re-evalúa,
+    sin volver a emitir un tipo de anomalía ya emitido para esa barra.
+
+Architecture:
+  - Solo biblioteca estándar (math / collections): lo consumen tanto
+    AnomalySentinel (gate síncrono del loop) como anomaly_detectors (pandas).
+  - ``ingest()`` procesa barras y deja las anomalías en un outbox por stream y
+    tipo; ``drain()`` las entrega una sola vez. Así los detectores de
+    volatilidad y de flash crash comparten una única pasada por barra.
+  - El formato de cada anomalía es el dict histórico de anomaly_detectors.
+
+Rule: una barra sin marca temporal no puede deduplicarse — se procesa como
+nueva. Los feeds que re-envían historia deben incluir ``timestamp``/``time``.
+"""
+import logging
+import math
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from core_brain.services.anomaly_models import AnomalyType
+
+logger = logging.getLogger(__name__)
+
+TIMESTAMP_KEYS: Tuple[str, ...] = ("timestamp", "time", "datetime")
+_SIGNATURE_KEYS: Tuple[str, ...] = ("open", "high", "low", "close", "price", "volume", "tick_volume")
+
+_DEFAULT_RETURN_WINDOW = 30     # Ventana móvil de retornos (mismo valor que el detector batch)
+_DEFAULT_MIN_RETURNS = 10       # Retornos mínimos antes de evaluar Z-Score
+_DEFAULT_VOLUME_LOOKBACK = 50   # Ventana de volúmenes para el percentil del spike
+_OUTBOX_LIMIT = 256             # Anomalías pendientes de drain por stream y tipo
+
+
+def stream_key(symbol: str, timeframe: str) -> str:
+    return f"{symbol}|{timeframe}"
+
+
+def _to_float(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) else number
+
+
+def _watermark_value(raw: Any) -> Any:
+    """Normaliza la marca temporal a un valor comparable (epoch para fechas)."""
+    if raw is None:
+        return None
+    if hasattr(raw, "timestamp"):
+        try:
+            return float(raw.timestamp())
+        except (TypeError, ValueError, OverflowError, OSError):
+            return None
+    number = _to_float(raw)
+    return number if number is not None else str(raw)
+
+
+def bar_timestamp(bar: Mapping[str, Any]) -> Any:
+    for key in TIMESTAMP_KEYS:
+        value = bar.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _percentile(values: List[float], percentile: float) -> float:
+    """Percentil con interpolación lineal (mismo criterio que numpy.percentile)."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * percentile / 100.0
+    low = math.floor(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def _bar_signature(bar: Mapping[str, Any]) -> Tuple[Optional[float], ...]:
+    return tuple(_to_float(bar.get(key)) for key in _SIGNATURE_KEYS)
+
+
+@dataclass
+class _BarUndo:
+    """Aporte de la barra del watermark al estado, para re-evaluarla si se revisa."""
+    signature: Tuple[Optional[float], ...]
+    prev_close: Optional[float]
+    prev_z_score: Optional[float]
+    pushed_return: bool = False
+    evicted_return: Optional[float] = None
+    pushed_volume: bool = False
+    evicted_volume: Optional[float] = None
+    emitted: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class _StreamState:
+    """Estado incremental de un stream ``symbol|timeframe``."""
+    returns: Deque[float]
+    volumes: Deque[float]
+    return_sum: float = 0.0
+    return_sumsq: float = 0.0
+    updates_since_resync: int = 0
+    last_close: Optional[float] = None
+    watermark: Any = None
+    last_z_score: Optional[float] = None
+    bars_seen: int = 0
+    last_bar: Optional[_BarUndo] = None
+    outbox: Dict[str, Deque[Dict[str, Any]]] = field(default_factory=dict)
+
+    def push_return(self, value: float) -> Optional[float]:
+        """Añade un retorno; devuelve el que salió de la ventana (si la ventana estaba llena)."""
+        evicted = None
+        if len(self.returns) == self.returns.maxlen:
+            evicted = self.returns[0]
+            self.return_sum -= evicted
+            self.return_sumsq -= evicted * evicted
+        self.returns.append(value)
+        self.return_sum += value
+        self.return_sumsq += value * value
+        # Re-sincroniza las sumas una vez por ventana para acotar el error de redondeo
+        self.updates_since_resync += 1
+        if self.updates_since_resync >= (self.returns.maxlen or 1):
+            self.return_sum = math.fsum(self.returns)
+            self.return_sumsq = math.fsum(r * r for r in self.returns)
+            self.updates_since_resync = 0
+        return evicted
+
+    def pop_return(self, evicted: Optional[float]) -> None:
+        """Deshace el último push_return, devolviendo a la ventana el retorno expulsado."""
+        value = self.returns.pop()
+        self.return_sum -= value
+        self.return_sumsq -= value * value
+        if evicted is not None:
+            self.returns.appendleft(evicted)
+            self.return_sum += evicted
+            self.return_sumsq += evicted * evicted
+
+    def return_stats(self) -> Tuple[float, float]:
+        n = len(self.returns)
+        mean = self.return_sum / n
+        variance = max(0.0, (self.return_sumsq - n * mean * mean) / (n - 1))
+        return mean, math.sqrt(variance)
+
+
+class StreamingAnomalyEngine:
+    """
+    Motor de detección de anomalías incremental por ``symbol|timeframe``.
+
+    Args:
+        zscore_threshold: |Z| a partir del cual se emite EXTREME_VOLATILITY.
+        flash_crash_threshold: Caída % open→close de una vela para FLASH_CRASH.
+        volume_percentile: Percentil de volumen (ventana previa) para el spike.
+        return_window: Tamaño de la ventana móvil de log-retornos.
+        min_returns: Retornos mínimos en la ventana antes de evaluar Z.
+        volume_lookback: Tamaño de la ventana de volúmenes.
+    """
+
+    def __init__(
+        self,
+        zscore_threshold: float = 3.0,
+        flash_crash_threshold: float = -2.0,
+        volume_percentile: float = 90,
+        return_window: int = _DEFAULT_RETURN_WINDOW,
+        min_returns: int = _DEFAULT_MIN_RETURNS,
+        volume_lookback: int = _DEFAULT_VOLUME_LOOKBACK,
+    ) -> None:
+        self.zscore_threshold = float(zscore_threshold)
+        self.flash_crash_threshold = float(flash_crash_threshold)
+        self.volume_percentile = float(volume_percentile)
+        self._return_window = max(2, int(return_window))
+        self._min_returns = max(2, int(min_returns))
+        self._volume_lookback = max(1, int(volume_lookback))
+        self._streams: Dict[str, _StreamState] = {}
+
+    # ── Ingesta ───────────────────────────────────────────────────────────────
+
+    def is_seen(self, symbol: str, timeframe: str, raw_timestamp: Any) -> bool:
+        """
+        True si la barra es anterior al watermark.
+
+        La barra del propio watermark no cuenta como vista: puede seguir
+        formándose y ``ingest`` decide si cambió.
+        """
+        state = self._streams.get(stream_key(symbol, timeframe))
+        if state is None or state.watermark is None:
+            return False
+        stamp = _watermark_value(raw_timestamp)
+        try:
+            return stamp is not None and stamp < state.watermark
+        except TypeError:
+            return False
+
+    def ingest(self, symbol: str, timeframe: str, bars: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Procesa las barras posteriores al watermark del stream.
+
+        Returns:
+            Las anomalías nuevas (también quedan en el outbox para ``drain``).
+        """
+        state = self._state(symbol, timeframe)
+        emitted: List[Dict[str, Any]] = []
+        for bar in bars:
+            emitted.extend(self._update(symbol, timeframe, state, bar))
+        return emitted
+
+    def update(self, symbol: str, timeframe: str, bar: Mapping[str, Any]) -> List[Dict[str, Any]]:
+        """Procesa una única barra o tick (O(1))."""
+        return self._update(symbol, timeframe, self._state(symbol, timeframe), bar)
+
+    def drain(
+        self,
+        symbol: Optional[str] = None,
+        timeframe: Optional[str] = None,
+        anomaly_type: Optional[AnomalyType] = None,
+    ) -> List[Dict[str, Any]]:
+        """Entrega (y retira) las anomalías pendientes; sin filtros drena todos los streams."""
+        keys = [stream_key(symbol, timeframe)] if symbol is not None else list(self._streams)
+        types = [anomaly_type.value] if anomaly_type is not None else None
+        drained: List[Dict[str, Any]] = []
+        for key in keys:
+            state = self._streams.get(key)
+            if state is None:
+                continue
+            for kind in types or list(state.outbox):
+                box = state.outbox.get(kind)
+                while box:
+                    drained.append(box.popleft())
+        return drained
+
+    # ── Introspección ─────────────────────────────────────────────────────────
+
+    def watermark(self, symbol: str, timeframe: str) -> Any:
+        state = self._streams.get(stream_key(symbol, timeframe))
+        return state.watermark if state else None
+
+    def last_z_score(self, symbol: str, timeframe: str) -> Optional[float]:
+        state = self._streams.get(stream_key(symbol, timeframe))
+        return state.last_z_score if state else None
+
+    @property
+    def streams(self) -> List[str]:
+        return list(self._streams)
+
+    def reset(self, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> None:
+        if symbol is None:
+            self._streams.clear()
+        else:
+            self._streams.pop(stream_key(symbol, timeframe or ""), None)
+
+    # ── Internos ──────────────────────────────────────────────────────────────
+
+    def _state(self, symbol: str, timeframe: str) -> _StreamState:
+        key = stream_key(symbol, timeframe)
+        state = self._streams.get(key)
+        if state is None:
+            state = _StreamState(
+                returns=deque(maxlen=self._return_window),
+                volumes=deque(maxlen=self._volume_lookback),
+            )
+            self._streams[key] = state
+        return state
+
+    def _update(
+        self, symbol: str, timeframe: str, state: _StreamState, bar: Mapping[str, Any]
+    ) -> List[Dict[str, Any]]:
+        raw_ts = bar_timestamp(bar)
+        stamp = _watermark_value(raw_ts)
+        signature = _bar_signature(bar)
+        revised: Optional[_BarUndo] = None
+        if stamp is not None and state.watermark is not None:
+            try:
+                if stamp < state.watermark:
+                    return []
+                if stamp == state.watermark:
+                    if state.last_bar is None or state.last_bar.signature == signature:
+                        return []
+                    revised = state.last_bar  # vela en formación revisada
+            except TypeError:
+                pass  # tipos de marca temporal incompatibles: tratar como nueva
+
+        close = _to_float(bar.get("close", bar.get("price")))
+        if close is None or close <= 0:
+            return []
+        if revised is not None:
+            self._rollback(state, revised)
+        undo = _BarUndo(signature, state.last_close, state.last_z_score)
+        if revised is not None:
+            undo.emitted = revised.emitted
+        if stamp is not None:
+            state.watermark = stamp
+        state.last_bar = undo if stamp is not None else None
+        state.bars_seen += 1
+        timestamp = raw_ts if isinstance(raw_ts, datetime) else datetime.now()
+
+        anomalies: List[Dict[str, Any]] = []
+        volatility = self._check_volatility(symbol, timeframe, state, close, timestamp, undo)
+        if volatility is not None:
+            anomalies.append(volatility)
+        crash = self._check_flash_crash(symbol, timeframe, state, bar, close, timestamp)
+        if crash is not None:
+            anomalies.append(crash)
+
+        volume = _to_float(bar.get("volume", bar.get("tick_volume")))
+        if volume is not None:
+            full = len(state.volumes) == state.volumes.maxlen
+            undo.evicted_volume = state.volumes[0] if full else None
+            undo.pushed_volume = True
+            state.volumes.append(volume)
+        state.last_close = close
+
+        # Una barra revisada no repite el tipo de anomalía que ya emitió
+        anomalies = [a for a in anomalies if a["anomaly_type"] not in undo.emitted]
+        undo.emitted.update(a["anomaly_type"] for a in anomalies)
+        for anomaly in anomalies:
+            box = state.outbox.setdefault(anomaly["anomaly_type"], deque(maxlen=_OUTBOX_LIMIT))
+            box.append(anomaly)
+        return anomalies
+
+    @staticmethod
+    def _rollback(state: _StreamState, undo: _BarUndo) -> None:
+        """Deshace el aporte de la barra del watermark antes de re-evaluarla."""
+        if undo.pushed_volume:
+            state.volumes.pop()
+            if undo.evicted_volume is not None:
+                state.volumes.appendleft(undo.evicted_volume)
+        if undo.pushed_return:
+            state.pop_return(undo.evicted_return)
+        state.last_close = undo.prev_close
+        state.last_z_score = undo.prev_z_score
+        state.bars_seen -= 1
+
+    def _check_volatility(
+        self,
+        symbol: str,
+        timeframe: str,
+        state: _StreamState,
+        close: float,
+        timestamp: datetime,
+        undo: _BarUndo,
+    ) -> Optional[Dict[str, Any]]:
+        if state.last_close is None:
+            return None
+        log_return = math.log(close / state.last_close)
+        undo.evicted_return = state.push_return(log_return)
+        undo.pushed_return = True
+        anomaly = None
+        if len(state.returns) >= self._min_returns:
+            mean, std = state.return_stats()
+            if std > 0:
+                z_score = (log_return - mean) / std
+                state.last_z_score = z_score
+                if abs(z_score) > self.zscore_threshold:
+                    anomaly = self._anomaly(
+                        symbol, AnomalyType.EXTREME_VOLATILITY, timestamp,
+                        z_score=abs(z_score),
+                        confidence=min(1.0, abs(z_score) / 5.0),
+                        details={
+                            "timeframe": timeframe,
+                            "return_magnitude": log_return,
+                            "rolling_std": std,
+                            "window": len(state.returns),
+                            "detection_method": "z_score_streaming",
+                        },
+                    )
+                    logger.warning(
+                        "[ANOMALY_DETECTED] EXTREME_VOLATILITY: %s Z=%.2f on %s @ %s. Trace_ID: %s",
+                        symbol, abs(z_score), timeframe, timestamp, anomaly["trace_id"],
+                    )
+        return anomaly
+
+    def _check_flash_crash(
+        self,
+        symbol: str,
+        timeframe: str,
+        state: _StreamState,
+        bar: Mapping[str, Any],
+        close: float,
+        timestamp: datetime,
+    ) -> Optional[Dict[str, Any]]:
+        open_ = _to_float(bar.get("open"))
+        if open_ is None or open_ <= 0:
+            return None
+        drop_pct = (close - open_) / open_ * 100
+        if drop_pct >= self.flash_crash_threshold:
+            return None
+
+        volume = _to_float(bar.get("volume", bar.get("tick_volume"))) or 0.0
+        # Percentil sobre la ventana previa: solo se ordena cuando hay un crash
+        reference = list(state.volumes) or [volume]
+        volume_threshold = _percentile(reference, self.volume_percentile)
+        volume_spike = volume > volume_threshold
+        anomaly = self._anomaly(
+            symbol, AnomalyType.FLASH_CRASH, timestamp,
+            confidence=min(1.0, abs(drop_pct) / 5.0),
+            drop_percentage=drop_pct,
+            volume_spike_detected=volume_spike,
+            details={
+                "timeframe": timeframe,
+                "open": open_,
+                "close": close,
+                "volume": volume,
+                "volume_threshold": volume_threshold,
+                "detection_method": "single_candle_drop_streaming",
+            },
+        )
+        logger.warning(
+            "[ANOMALY_DETECTED] FLASH_CRASH: %s drop=%.2f%% on %s @ %s. Vol_spike: %s. Trace_ID: %s",
+            symbol, drop_pct, timeframe, timestamp, volume_spike, anomaly["trace_id"],
+        )
+        return anomaly
+
+    @staticmethod
+    def _anomaly(
+        symbol: str,
+        anomaly_type: AnomalyType,
+        timestamp: datetime,
+        confidence: float,
+        details: Dict[str, Any],
+        z_score: float = 0.0,
+        drop_percentage: float = 0.0,
+        volume_spike_detected: bool = False,
+    ) -> Dict[str, Any]:
+        return {
+            "symbol": symbol,
+            "anomaly_type": anomaly_type.value,
+            "timestamp": timestamp,
+            "z_score": float(z_score),
+            "confidence": float(confidence),
+            "drop_percentage": float(drop_percentage),
+            "volume_spike_detected": bool(volume_spike_detected),
+            "trace_id": f"AN-{uuid.uuid4().hex[:8].upper()}",
+            "details": details,
+        }
@@ -134,7 +134,10 @@ class CircuitBreakerGate:
             # ──── LIVE MODE: Full Authorization ────────────────────────────
             if execution_mode == 'LIVE':
                 # Query CircuitBreaker: is strategy blocked (DD or CL violated)?
-                is_blocked = self.circuit_breaker.is_strategy_blocked_for_trading(strategy_id)
+                # The fresh mode keeps the breaker's bitmap in step with sys_signal_ranking
+                is_blocked = self.circuit_breaker.is_strategy_blocked_for_trading(
+                    strategy_id, execution_mode=execution_mode
+                )
                 
                 if is_blocked:
                     reason = f"Strategy {strategy_id} not in LIVE execution mode (risk thresholds violated)"
@@ -0,0 +1,303 @@
+"""
+CoherenceBatchEngine - Snapshot-based coherence gate for the whole LIVE roster.
+TRACE_ID: COHERENCE-BATCH-GATE-2026-001
+
+Responsibility:
+  - Reproduce CoherenceService.check_coherence_veto for every LIVE strategy in
+    one pass per cycle, with identical decisions.
+  - Read execution logs incrementally (one bulk query, id watermark) into
+    rolling per-symbol accumulators: count, Σslippage, Σslippage², Σlatency.
+  - Read rankings and best shadow profit factors in one bulk query.
+  - Compute Sharpe, latency coherence, score and PF drift for all strategies
+    as numpy vectors.
+
+Design principles:
+  - Strategies sharing a symbol share one accumulator: cost scales with new
+    executions and distinct symbols, not with the size of the LIVE roster.
+  - Synchronous and I/O-bound by design: callers run evaluate() through
+    asyncio.to_thread so the event loop is never blocked.
+  - Thresholds come from the injected CoherenceService (SSOT: sys_config).
+"""
+import logging
+import math
+import uuid
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from statistics import mean
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core_brain.services.coherence_service import CoherenceService
+from utils.time_utils import to_utc
+
+logger = logging.getLogger(__name__)
+
+# Constants mirrored from CoherenceService (detect_drift / check_coherence_veto)
+THEORETICAL_SHARPE = 0.5
+THEORETICAL_LATENCY_MS = 5.0
+DEFAULT_THEORETICAL_PF = 1.5
+PF_DRIFT_THRESHOLD = 0.30
+PF_VETO_SCORE_CEILING = 0.70
+
+# Relative variance under which a window counts as constant (stdev == 0)
+_ZERO_VARIANCE_REL_TOL = 1e-12
+# Rebuild running sums from the window after this many evictions (float drift)
+_RESYNC_EVERY = 1024
+
+
+def symbol_for_strategy(strategy_id: str) -> Optional[str]:
+    """Symbol convention of the coherence gate: prefix before the first '_'."""
+    return strategy_id.split("_")[0] if "_" in strategy_id else None
+
+
+class RollingExecutionWindow:
+    """Time-windowed running sums of slippage and latency for one symbol."""
+
+    __slots__ = ("rows", "count", "sum_slip", "sum_slip_sq", "sum_latency",
+                 "nonzero_slip", "_evictions")
+
+    def __init__(self) -> None:
+        self.rows: Deque[Tuple[str, float, float]] = deque()
+        self.count = 0
+        self.sum_slip = 0.0
+        self.sum_slip_sq = 0.0
+        self.sum_latency = 0.0
+        self.nonzero_slip = 0
+        self._evictions = 0
+
+    def add(self, timestamp: str, slippage: float, latency: float) -> None:
+        self.rows.append((timestamp, slippage, latency))
+        self.count += 1
+        self.sum_slip += slippage
+        self.sum_slip_sq += slippage * slippage
+        self.sum_latency += latency
+        if slippage != 0.0:
+            self.nonzero_slip += 1
+
+    def evict_before(self, threshold: str) -> int:
+        """Drop rows older than threshold (same string comparison as SQLite)."""
+        evicted = 0
+        while self.rows and self.rows[0][0] < threshold:
+            _, slippage, latency = self.rows.popleft()
+            self.count -= 1
+            self.sum_slip -= slippage
+            self.sum_slip_sq -= slippage * slippage
+            self.sum_latency -= latency
+            if slippage != 0.0:
+                self.nonzero_slip -= 1
+            evicted += 1
+        if evicted:
+            self._evictions += evicted
+            if self._evictions >= _RESYNC_EVERY or not self.rows:
+                self._resync()
+        return evicted
+
+    def recovery_trend(self) -> bool:
+        """Same rule as CoherenceService._check_recovery_trend (last 3 vs previous 3)."""
+        if self.count < 6:
+            return False
+        tail = [row[1] for row in list(self.rows)[-6:]]
+        return mean(tail[3:]) < mean(tail[:3]) * 0.9
+
+    def _resync(self) -> None:
+        slips = [row[1] for row in self.rows]
+        self.count = len(slips)
+        self.sum_slip = math.fsum(slips)
+        self.sum_slip_sq = math.fsum(s * s for s in slips)
+        self.sum_latency = math.fsum(row[2] for row in self.rows)
+        self.nonzero_slip = sum(1 for s in slips if s != 0.0)
+        self._evictions = 0
+
+
+class CoherenceBatchEngine:
+    """
+    Evaluates the coherence veto of many strategies per cycle.
+
+    Usage (orchestrator):
+        vetoes = await asyncio.to_thread(engine.evaluate, live_strategies)
+    """
+
+    def __init__(
+        self,
+        storage: Any,
+        coherence_service: CoherenceService,
+        window_minutes: int = 60,
+        veto_threshold: float = 0.60,
+    ) -> None:
+        self.storage = storage
+        self.coherence_service = coherence_service
+        self.window_minutes = window_minutes
+        self.veto_threshold = veto_threshold
+        self._windows: Dict[str, RollingExecutionWindow] = {}
+        self._last_id = 0
+        self.stats: Dict[str, int] = {"cycles": 0, "rows_ingested": 0, "rebuilds": 0}
+
+    # ─── Public API ──────────────────────────────────────────────────────────
+
+    def evaluate(self, live_strategies: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """
+        Compute the coherence veto of every strategy in the roster.
+
+        Returns:
+            {strategy_id: veto}. Fail-open ({}) on error, like check_coherence_veto.
+        """
+        try:
+            strategy_ids = list(dict.fromkeys(
+                s.get("strategy_id") for s in live_strategies if s.get("strategy_id")
+            ))
+            if not strategy_ids:
+                return {}
+            symbols = [symbol_for_strategy(sid) for sid in strategy_ids]
+            self._refresh_windows({s for s in symbols if s})
+            snapshot = self.storage.get_coherence_snapshot(strategy_ids)
+            self.stats["cycles"] += 1
+            return self._vector_pass(strategy_ids, symbols, snapshot)
+        except Exception as e:
+            logger.error("[COHERENCE_BATCH] Error evaluating roster: %s", e, exc_info=True)
+            return {}
+
+    # ─── Rolling accumulators ────────────────────────────────────────────────
+
+    def _refresh_windows(self, symbols: set) -> None:
+        if not symbols.issubset(self._windows):
+            # New symbol in the roster: its history predates the watermark.
+            self._windows = {s: RollingExecutionWindow() for s in symbols}
+            self._last_id = 0
+            self.stats["rebuilds"] += 1
+        elif len(self._windows) != len(symbols):
+            self._windows = {s: w for s, w in self._windows.items() if s in symbols}
+
+        rows = self.storage.get_execution_logs_for_symbols_since(
+            symbols=sorted(symbols),
+            since_id=self._last_id,
+            window_minutes=self.window_minutes,
+            user_id=self.coherence_service.user_id,
+            status_filter="SUCCESS",
+        )
+        for row in rows:
+            self._windows[row["symbol"]].add(
+                str(row["timestamp"]),
+                float(row.get("slippage_pips") or 0.0),
+                float(row.get("latency_ms") or 0.0),
+            )
+            self._last_id = max(self._last_id, int(row["id"]))
+        self.stats["rows_ingested"] += len(rows)
+
+        threshold = to_utc(datetime.now(timezone.utc) - timedelta(minutes=self.window_minutes))
+        for window in self._windows.values():
+            window.evict_before(threshold)
+
+    # ─── Vectorized decision pass ────────────────────────────────────────────
+
+    def _vector_pass(
+        self,
+        strategy_ids: List[str],
+        symbols: List[Optional[str]],
+        snapshot: Dict[str, Dict[str, Any]],
+    ) -> Dict[str, bool]:
+        svc = self.coherence_service
+        size = len(strategy_ids)
+        n = np.zeros(size)
+        s1 = np.zeros(size)
+        s2 = np.zeros(size)
+        lat = np.zeros(size)
+        nonzero = np.zeros(size)
+        real_pf = np.zeros(size)
+        shadow_pf = np.zeros(size)
+        pf_known = np.ones(size, dtype=bool)
+
+        for i, (sid, sym) in enumerate(zip(strategy_ids, symbols)):
+            window = self._windows.get(sym) if sym else None
+            if window is not None:
+                n[i], s1[i], s2[i] = window.count, window.sum_slip, window.sum_slip_sq
+                lat[i], nonzero[i] = window.sum_latency, window.nonzero_slip
+            row = snapshot.get(sid) or {}
+            if row.get("has_ranking"):
+                if row.get("profit_factor") is None:
+                    pf_known[i] = False  # float(None) → ERROR path, never drifting
+                else:
+                    real_pf[i] = float(row["profit_factor"])
+            shadow_pf[i] = float(row.get("shadow_profit_factor") or 0.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            safe_n = np.maximum(n, 1.0)
+            mean_slip = s1 / safe_n
+            var = np.where(n > 1, (s2 - s1 * mean_slip) / np.maximum(n - 1, 1.0), 0.0)
+            zero_var = var <= _ZERO_VARIANCE_REL_TOL * np.maximum(1.0, mean_slip * mean_slip)
+            std = np.sqrt(np.maximum(var, 0.0))
+
+            sharpe = np.where(
+                n < 2, 0.0,
+                np.where(nonzero == 0, THEORETICAL_SHARPE,
+                         np.where(zero_var,
+                                  np.maximum(0.0, THEORETICAL_SHARPE - mean_slip / 10.0),
+                                  np.clip(-mean_slip / np.where(zero_var, 1.0, std) + THEORETICAL_SHARPE,
+                                          0.0, 2.0))))
+
+            real_latency = lat / safe_n
+            latency_coherence = np.where(
+                real_latency > 0,
+                np.clip(THEORETICAL_LATENCY_MS / np.where(real_latency > 0, real_latency, 1.0), 0.0, 1.0),
+                1.0,
+            )
+            perf_coherence = np.minimum(1.0, sharpe / THEORETICAL_SHARPE)
+            score = np.clip(perf_coherence * 0.7 + latency_coherence * 0.3, 0.0, 1.0)
+            degradation = np.clip((THEORETICAL_SHARPE - sharpe) / THEORETICAL_SHARPE, 0.0, 1.0)
+
+            theoretical_pf = np.where(shadow_pf > 0, shadow_pf, DEFAULT_THEORETICAL_PF)
+            pf_drift = np.abs(theoretical_pf - real_pf) / theoretical_pf
+
+        has_symbol = np.array([sym is not None for sym in symbols])
+        evaluated = has_symbol & (n > 0) & (n >= svc.min_usr_executions_for_analysis)
+        effective = np.where(evaluated, score, 1.0)
+        pf_drifting = pf_known & (pf_drift > PF_DRIFT_THRESHOLD)
+        veto = (effective < self.veto_threshold) | (pf_drifting & (effective < PF_VETO_SCORE_CEILING))
+
+        self._register_events(strategy_ids, symbols, evaluated, score, degradation, sharpe,
+                              real_latency, n)
+
+        decisions: Dict[str, bool] = {}
+        for i, sid in enumerate(strategy_ids):
+            decisions[sid] = bool(veto[i])
+            if veto[i]:
+                logger.warning(
+                    "[COHERENCE_VETO] %s: score=%.2f (threshold=%s), pf_drift=%.1f%% → VETO activado",
+                    sid, effective[i], self.veto_threshold, pf_drift[i] * 100,
+                )
+        return decisions
+
+    def _register_events(
+        self,
+        strategy_ids: List[str],
+        symbols: List[Optional[str]],
+        evaluated: np.ndarray,
+        score: np.ndarray,
+        degradation: np.ndarray,
+        sharpe: np.ndarray,
+        real_latency: np.ndarray,
+        n: np.ndarray,
+    ) -> None:
+        """Audit trail parity with detect_drift: one event per evaluated strategy, one write."""
+        svc = self.coherence_service
+        events: List[Dict[str, Any]] = []
+        for i in np.flatnonzero(evaluated):
+            status, _ = svc._assess_coherence_status(float(score[i]), float(degradation[i]))
+            sym = symbols[i]
+            events.append({
+                "symbol": sym,
+                "strategy_id": strategy_ids[i],
+                "status": status,
+                "coherence_score": float(score[i]),
+                "performance_degradation": float(degradation[i]),
+                "trace_id": f"COH-{uuid.uuid4().hex[:8].upper()}",
+                "details": {
+                    "theoretical_sharpe": THEORETICAL_SHARPE,
+                    "real_sharpe": float(sharpe[i]),
+                    "usr_executions_analyzed": int(n[i]),
+                    "recovery_trend": self._windows[sym].recovery_trend(),
+                    "real_latency_ms": float(real_latency[i]),
+                },
+            })
+        if events:
+            self.storage.register_coherence_events(events)
@@ -21,12 +21,19 @@ Filtros:
   - Ventana: -30 min before, +30 min after event time
   - Acción: Solo estrategias ANT_FRAG permitidas + min_threshold += 0.15
   - Log: "🟠 VOLATILITY FILTER: PMI release - restricciones activas"
+
+Consultas (PERF-ECON-INDEX-2026-001): las ventanas se indexan en un
+EconomicEventIndex (árbol de intervalos) al recargar el calendario; cada
+consulta por símbolo es O(log n) y el calendario se recarga como máximo cada
+CALENDAR_REFRESH_SECONDS en lugar de en cada is_market_safe().
 """
 
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
+from core_brain.economic_event_index import EconomicEventIndex
 from data_vault.storage import StorageManager
 
 logger = logging.getLogger(__name__)
@@ -66,6 +73,10 @@ class FundamentalGuardService:
     LOCKDOWN_WINDOW_MINUTES = 15  # ±15 min desde evento
     VOLATILITY_WINDOW_MINUTES = 30  # ±30 min desde evento
 
+    # El escudo aplica a todos los símbolos: una sola clave de "divisa" en el índice
+    _ALL_SYMBOLS = ("*",)
+    CALENDAR_REFRESH_SECONDS = 60.0
+
     def __init__(self, storage: StorageManager):
         """
         Inicializa FundamentalGuardService con inyección de dependencias.
@@ -76,6 +87,11 @@ class FundamentalGuardService:
         self.storage = storage
         self.calendar_cache: List[Dict] = []
         self.last_calendar_update: Optional[datetime] = None
+        self._last_refresh_monotonic: Optional[float] = None
+        self.event_index = EconomicEventIndex(buffers={
+            "HIGH": (self.LOCKDOWN_WINDOW_MINUTES, self.LOCKDOWN_WINDOW_MINUTES),
+            "MEDIUM": (self.VOLATILITY_WINDOW_MINUTES, self.VOLATILITY_WINDOW_MINUTES),
+        })
 
         # Cargar calendario económico inicial
         self._refresh_calendar()
@@ -99,6 +115,35 @@ class FundamentalGuardService:
         except Exception as e:
             logger.error(f"[FundamentalGuard] Failed to refresh calendar: {e}")
             self.calendar_cache = []
+        self._last_refresh_monotonic = time.monotonic()
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Indexa solo los eventos que el escudo reconoce (lista de alto / medio impacto)."""
+        rows = []
+        for position, event in enumerate(self.calendar_cache):
+            impact = str(event.get("impact", "")).upper()
+            name = str(event.get("event", "")).upper()
+            if impact == "HIGH" and not self._is_high_impact_event(name):
+                continue
+            if impact == "MEDIUM" and not self._is_medium_impact_event(name):
+                continue
+            if impact not in ("HIGH", "MEDIUM"):
+                continue
+            rows.append({
+                "event_id": position,  # posición en calendar_cache
+                "event_name": name,
+                "currency": self._ALL_SYMBOLS[0],
+                "impact_score": impact,
+                "event_time_utc": event.get("time_utc"),
+            })
+        self.event_index.rebuild(rows)
+
+    def _active_windows(self, current_time: datetime, impact_level: str) -> List:
+        return [
+            window for window in self.event_index.active(self._ALL_SYMBOLS, current_time)
+            if window.impact == impact_level
+        ]
 
     def is_lockdown_period(
         self,
@@ -120,42 +165,14 @@ class FundamentalGuardService:
         if not current_time:
             current_time = datetime.now()
 
-        # Buscar eventos de alto impacto en la ventana
-        for event in self.calendar_cache:
-            event_impact = event.get("impact", "").upper()
-            event_name = event.get("event", "").upper()
-
-            # Solo eventos HIGH detectan LOCKDOWN
-            if event_impact != "HIGH":
-                continue
-
-            # Verificar si es un evento conocido de alto impacto
-            if not self._is_high_impact_event(event_name):
-                continue
-
-            # Obtener hora del evento
-            try:
-                event_time = event.get("time_utc")
-                if isinstance(event_time, str):
-                    event_time = datetime.fromisoformat(event_time)
-                elif not isinstance(event_time, datetime):
-                    continue
-
-                # Calcular ventanas
-                before_window = event_time - timedelta(minutes=self.LOCKDOWN_WINDOW_MINUTES)
-                after_window = event_time + timedelta(minutes=self.LOCKDOWN_WINDOW_MINUTES)
-
-                # Verificar si current_time está dentro de ventana
-                if before_window <= current_time <= after_window:
-                    logger.warning(
-                        f"🔴 LOCKDOWN FUNDAMENTAL: {event_name} release ±{self.LOCKDOWN_WINDOW_MINUTES}min "
-                        f"(Current: {current_time.isoformat()}, Event: {event_time.isoformat()})"
-                    )
-                    return True
-
-            except Exception as e:
-                logger.debug(f"[FundamentalGuard] Error processing event {event}: {e}")
-                continue
+        windows = self._active_windows(current_time, "HIGH")
+        if windows:
+            window = windows[0]
+            logger.warning(
+                f"🔴 LOCKDOWN FUNDAMENTAL: {window.event_name} release ±{self.LOCKDOWN_WINDOW_MINUTES}min "
+                f"(Current: {current_time.isoformat()}, Event: {self.calendar_cache[window.event_id].get('time_utc')})"
+            )
+            return True
 
         return False
 
@@ -179,42 +196,14 @@ class FundamentalGuardService:
         if not current_time:
             current_time = datetime.now()
 
-        # Buscar eventos de impacto medio en la ventana
-        for event in self.calendar_cache:
-            event_impact = event.get("impact", "").upper()
-            event_name = event.get("event", "").upper()
-
-            # Solo eventos MEDIUM detectan VOLATILITY
-            if event_impact != "MEDIUM":
-                continue
-
-            # Verificar si es un evento conocido de impacto medio
-            if not self._is_medium_impact_event(event_name):
-                continue
-
-            # Obtener hora del evento
-            try:
-                event_time = event.get("time_utc")
-                if isinstance(event_time, str):
-                    event_time = datetime.fromisoformat(event_time)
-                elif not isinstance(event_time, datetime):
-                    continue
-
-                # Calcular ventanas
-                before_window = event_time - timedelta(minutes=self.VOLATILITY_WINDOW_MINUTES)
-                after_window = event_time + timedelta(minutes=self.VOLATILITY_WINDOW_MINUTES)
-
-                # Verificar si current_time está dentro de ventana
-                if before_window <= current_time <= after_window:
-                    logger.info(
-                        f"🟠 VOLATILITY FILTER: {event_name} release ±{self.VOLATILITY_WINDOW_MINUTES}min "
-                        f"(Current: {current_time.isoformat()}, Event: {event_time.isoformat()})"
-                    )
-                    return True
-
-            except Exception as e:
-                logger.debug(f"[FundamentalGuard] Error processing event {event}: {e}")
-                continue
+        windows = self._active_windows(current_time, "MEDIUM")
+        if windows:
+            window = windows[0]
+            logger.info(
+                f"🟠 VOLATILITY FILTER: {window.event_name} release ±{self.VOLATILITY_WINDOW_MINUTES}min "
+                f"(Current: {current_time.isoformat()}, Event: {self.calendar_cache[window.event_id].get('time_utc')})"
+            )
+            return True
 
         return False
 
@@ -241,9 +230,11 @@ class FundamentalGuardService:
         if not current_time:
             current_time = datetime.now()
 
-        # Refrescar calendario cada vez (mantener SSOT)
+        # Refrescar calendario (SSOT) como máximo cada CALENDAR_REFRESH_SECONDS
         try:
-            self._refresh_calendar()
+            last = self._last_refresh_monotonic
+            if last is None or time.monotonic() - last >= self.CALENDAR_REFRESH_SECONDS:
+                self._refresh_calendar()
         except Exception as e:
             logger.warning(f"[FundamentalGuard] Failed to refresh calendar: {e}")
             # Fallback a cache existente
@@ -296,35 +287,9 @@ class FundamentalGuardService:
         Returns:
             Dict con detalles del evento
         """
-        for event in self.calendar_cache:
-            event_impact = event.get("impact", "").upper()
-            event_name = event.get("event", "").upper()
-
-            if event_impact != impact_level:
-                continue
-
-            try:
-                event_time = event.get("time_utc")
-                if isinstance(event_time, str):
-                    event_time = datetime.fromisoformat(event_time)
-                elif not isinstance(event_time, datetime):
-                    continue
-
-                # Determinar ventana según impacto
-                window_minutes = (
-                    self.LOCKDOWN_WINDOW_MINUTES
-                    if impact_level == "HIGH"
-                    else self.VOLATILITY_WINDOW_MINUTES
-                )
-
-                before_window = event_time - timedelta(minutes=window_minutes)
-                after_window = event_time + timedelta(minutes=window_minutes)
-
-                if before_window <= current_time <= after_window:
-                    return event
-
-            except Exception:
-                continue
+        windows = self._active_windows(current_time, impact_level)
+        if windows:
+            return self.calendar_cache[windows[0].event_id]
 
         # Retornar evento vacío si no hay coincidencia
         return {"event": "Unknown"}
@@ -0,0 +1,347 @@
+"""
+StrategyRankingEngine - Vectorized batch evaluation for StrategyRanker.
+TRACE_ID: RANKER-BATCH-VECTOR-2026-001
+
+Responsibility:
+  - Reproduce StrategyRanker.evaluate_and_rank for every strategy in one pass,
+    with identical actions, reasons and result payloads.
+  - Read all rankings (sys_signal_ranking) and all regime weights
+    (sys_regime_configs) in one query each.
+  - Compute promotion / degradation / recovery masks and normalized weighted
+    scores as numpy columns.
+  - Persist every transition of the cycle in a single transaction.
+
+Design principles:
+  - Thresholds come from the StrategyRanker class (single definition).
+  - Rows the vector path cannot represent exactly (NULL / non-numeric metrics,
+    unknown execution modes) are delegated to StrategyRanker.evaluate_and_rank,
+    so edge-case behaviour stays that of the per-strategy path.
+  - weighted_score is computed in float64 instead of Decimal; it matches the
+    per-strategy value to float precision.
+"""
+import logging
+import math
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from core_brain.strategy_ranker import StrategyRanker
+
+logger = logging.getLogger(__name__)
+
+MODES = ("SHADOW", "LIVE", "QUARANTINE")
+DEFAULT_WEIGHTED_REGIME = "TREND"
+# Column order of the normalized metric matrix (names match sys_regime_configs.metric_name)
+SCORE_METRICS = ("win_rate", "profit_factor", "sharpe_ratio", "drawdown_max")
+_NUMERIC_FIELDS = (
+    "profit_factor", "win_rate", "completed_last_50",
+    "drawdown_max", "consecutive_losses", "sharpe_ratio",
+)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
+
+
+def _vectorizable(ranking: Dict[str, Any]) -> bool:
+    """True when the vector path reproduces the per-strategy result exactly."""
+    if ranking.get("execution_mode") not in MODES:
+        return False
+    return all(_is_number(ranking.get(field, 0.0)) for field in _NUMERIC_FIELDS)
+
+
+def _weighted_regime(ranking: Dict[str, Any]) -> str:
+    return str(
+        ranking.get("current_regime") or ranking.get("market_regime") or DEFAULT_WEIGHTED_REGIME
+    ).upper()
+
+
+def _new_trace_id() -> str:
+    return f"RANK-{uuid.uuid4().hex[:8].upper()}"
+
+
+class StrategyRankingEngine:
+    """
+    Uso:
+        engine = StrategyRankingEngine(ranker)
+        results = engine.evaluate()                 # every SHADOW/LIVE/QUARANTINE strategy
+        results = engine.evaluate(["BRK_OPEN_0001"])  # explicit subset
+    """
+
+    def __init__(self, ranker: "StrategyRanker") -> None:
+        self.ranker = ranker
+        self.storage = ranker.storage
+
+    # ─── Entry point ─────────────────────────────────────────────────────────
+
+    def evaluate(self, strategy_ids: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Evaluate strategies and apply their transitions.
+
+        Args:
+            strategy_ids: Strategies to evaluate (input order kept). None = all
+                strategies in SHADOW, LIVE and QUARANTINE, in that order.
+
+        Returns:
+            Dictionary mapping strategy_id to evaluation result (same shape as
+            StrategyRanker.evaluate_and_rank).
+        """
+        rows = {row["strategy_id"]: row for row in self.storage.get_all_signal_rankings()}
+        if strategy_ids is None:
+            ids = [sid for mode in MODES for sid, row in rows.items() if row.get("execution_mode") == mode]
+        else:
+            ids = list(dict.fromkeys(strategy_ids))
+
+        results: Dict[str, Dict[str, Any]] = {}
+        batch: List[Dict[str, Any]] = []
+        for sid in ids:
+            ranking = rows.get(sid)
+            if ranking is None:
+                logger.warning(f"Strategy {sid} not found in ranking table")
+                results[sid] = {"action": "not_found", "strategy_id": sid}
+            elif _vectorizable(ranking):
+                results[sid] = {}  # placeholder keeps input order
+                batch.append(ranking)
+            else:
+                results[sid] = self._evaluate_single(sid)
+
+        if batch:
+            results.update(self._evaluate_batch(batch))
+        return results
+
+    def _evaluate_single(self, strategy_id: str) -> Dict[str, Any]:
+        try:
+            return self.ranker.evaluate_and_rank(strategy_id)
+        except Exception as e:
+            logger.error(f"Error evaluating strategy {strategy_id}: {e}")
+            return {"action": "error", "error": str(e)}
+
+    # ─── Vector pass ─────────────────────────────────────────────────────────
+
+    def _evaluate_batch(self, rankings: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        r = self.ranker
+        col = lambda name: np.array([row.get(name, 0.0) for row in rankings], dtype=float)
+        pf, wr, dd, sharpe = col("profit_factor"), col("win_rate"), col("drawdown_max"), col("sharpe_ratio")
+        completed = np.array([row.get("completed_last_50", 0) for row in rankings], dtype=float)
+        losses = np.array([row.get("consecutive_losses", 0) for row in rankings], dtype=float)
+        modes = np.array([row["execution_mode"] for row in rankings])
+
+        shadow, live, quarantine = modes == "SHADOW", modes == "LIVE", modes == "QUARANTINE"
+        meets_pf = pf > r.PROFIT_FACTOR_THRESHOLD
+        meets_wr = wr > r.WIN_RATE_THRESHOLD
+        meets_count = completed >= r.MIN_TRADES_FOR_PROMOTION
+        dd_exceeded = dd >= r.DRAWDOWN_THRESHOLD
+        cl_exceeded = losses >= r.CONSECUTIVE_LOSSES_THRESHOLD
+
+        promote = shadow & meets_count & meets_pf & meets_wr
+        degrade = live & (dd_exceeded | cl_exceeded)
+        recover = quarantine & ~dd_exceeded & ~cl_exceeded & meets_count
+
+        scores = self._weighted_scores(rankings, wr, pf, sharpe, dd)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        transitions: List[Dict[str, Any]] = []
+        for i, ranking in enumerate(rankings):
+            sid = ranking["strategy_id"]
+            if shadow[i]:
+                result = self._shadow_result(ranking, bool(meets_count[i]), bool(promote[i]),
+                                             bool(meets_pf[i]), bool(meets_wr[i]), transitions)
+            elif live[i]:
+                result = self._live_result(ranking, bool(degrade[i]), bool(dd_exceeded[i]), transitions)
+            else:
+                result = self._quarantine_result(ranking, bool(recover[i]), bool(dd_exceeded[i]),
+                                                 bool(cl_exceeded[i]), bool(meets_count[i]), transitions)
+            regime, score = scores[i]
+            result["weighted_score"] = score
+            result["weighted_regime"] = regime
+            results[sid] = result
+
+        self._persist(transitions, results)
+        return results
+
+    def _weighted_scores(
+        self,
+        rankings: List[Dict[str, Any]],
+        wr: np.ndarray,
+        pf: np.ndarray,
+        sharpe: np.ndarray,
+        dd: np.ndarray,
+    ) -> List[Tuple[str, float]]:
+        """(regime, score) per row — same normalization as StrategyRanker._normalize_metrics."""
+        normalized = np.column_stack([
+            np.clip(wr, 0.0, 1.0),
+            np.minimum(pf / 3.0, 1.0),
+            np.minimum(sharpe / 5.0, 1.0),
+            np.maximum(1.0 - dd / 100.0, 0.0),
+        ])
+        regimes = [_weighted_regime(row) for row in rankings]
+        all_weights = self.storage.get_all_sys_regime_configs() or {}
+        scores = np.zeros(len(rankings))
+        for regime in set(regimes):
+            weights = all_weights.get(regime)
+            if not weights:
+                logger.warning(f"No regime weights found for regime: {regime}")
+                continue
+            try:
+                vector = np.array([float(weights.get(m, 0.0)) for m in SCORE_METRICS])
+            except (TypeError, ValueError) as e:
+                logger.error(f"Invalid regime weights for {regime}: {e}")
+                continue
+            rows = np.array([reg == regime for reg in regimes])
+            scores[rows] = np.clip(normalized[rows] @ vector, 0.0, 1.0)
+        return [(regime, float(score)) for regime, score in zip(regimes, scores)]
+
+    # ─── Result payloads (mirror StrategyRanker._evaluate_*) ────────────────
+
+    def _shadow_result(
+        self, ranking: Dict[str, Any], meets_count: bool, promote: bool,
+        meets_pf: bool, meets_wr: bool, transitions: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        r = self.ranker
+        profit_factor = ranking.get("profit_factor", 0.0)
+        win_rate = ranking.get("win_rate", 0.0)
+        completed = ranking.get("completed_last_50", 0)
+        if not meets_count:
+            return {
+                "action": "insufficient_usr_trades",
+                "current_mode": "SHADOW",
+                "profit_factor": profit_factor,
+                "win_rate": win_rate,
+                "completed_usr_trades": completed,
+                "min_required": r.MIN_TRADES_FOR_PROMOTION,
+            }
+        if promote:
+            trace_id = self._stage(transitions, ranking, "SHADOW", "LIVE", "promotion_criteria_met", {
+                "profit_factor": ranking.get("profit_factor"),
+                "win_rate": ranking.get("win_rate"),
+                "total_usr_trades": ranking.get("total_usr_trades"),
+                "completed_last_50": ranking.get("completed_last_50"),
+            })
+            return {
+                "action": "promoted",
+                "from_mode": "SHADOW",
+                "to_mode": "LIVE",
+                "reason": "optimal_metrics",
+                "trace_id": trace_id,
+                "profit_factor": profit_factor,
+                "win_rate": win_rate,
+                "completed_usr_trades": completed,
+            }
+        missing_criteria = []
+        if not meets_pf:
+            missing_criteria.append(f"PF {profit_factor:.2f} < {r.PROFIT_FACTOR_THRESHOLD}")
+        if not meets_wr:
+            missing_criteria.append(f"WR {win_rate:.1%} < {r.WIN_RATE_THRESHOLD:.0%}")
+        return {
+            "action": "no_change",
+            "current_mode": "SHADOW",
+            "reason": "insufficient_metrics",
+            "missing_criteria": missing_criteria,
+            "profit_factor": profit_factor,
+            "win_rate": win_rate,
+        }
+
+    def _live_result(
+        self, ranking: Dict[str, Any], degrade: bool, dd_exceeded: bool,
+        transitions: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        drawdown_max = ranking.get("drawdown_max", 0.0)
+        consecutive_losses = ranking.get("consecutive_losses", 0)
+        if not degrade:
+            return {
+                "action": "no_change",
+                "current_mode": "LIVE",
+                "drawdown_max": drawdown_max,
+                "consecutive_losses": consecutive_losses,
+            }
+        reason = "drawdown_exceeded" if dd_exceeded else "consecutive_losses_exceeded"
+        trace_id = self._stage(transitions, ranking, "LIVE", "SHADOW", f"REHABILITATION: {reason}", {
+            "drawdown_max": drawdown_max,
+            "consecutive_losses": consecutive_losses,
+            "total_usr_trades": ranking.get("total_usr_trades"),
+            "rehabilitation_mode": True,
+        })
+        return {
+            "action": "rehabilitated",
+            "from_mode": "LIVE",
+            "to_mode": "SHADOW",
+            "reason": f"rehabilitation_{reason}",
+            "trace_id": trace_id,
+            "drawdown_max": drawdown_max,
+            "consecutive_losses": consecutive_losses,
+        }
+
+    def _quarantine_result(
+        self, ranking: Dict[str, Any], recover: bool, dd_exceeded: bool, cl_exceeded: bool,
+        meets_count: bool, transitions: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        r = self.ranker
+        drawdown_max = ranking.get("drawdown_max", 0.0)
+        consecutive_losses = ranking.get("consecutive_losses", 0)
+        completed = ranking.get("completed_last_50", 0)
+        if recover:
+            trace_id = self._stage(transitions, ranking, "QUARANTINE", "SHADOW", "risk_recovery_confirmed", {
+                "drawdown_max": ranking.get("drawdown_max"),
+                "consecutive_losses": ranking.get("consecutive_losses"),
+                "profit_factor": ranking.get("profit_factor"),
+            })
+            return {
+                "action": "recovered",
+                "from_mode": "QUARANTINE",
+                "to_mode": "SHADOW",
+                "reason": "risk_metrics_normalized",
+                "trace_id": trace_id,
+                "drawdown_max": drawdown_max,
+                "consecutive_losses": consecutive_losses,
+            }
+        failing_checks = []
+        if dd_exceeded:
+            failing_checks.append(f"DD {drawdown_max:.2f}% >= {r.DRAWDOWN_THRESHOLD}%")
+        if cl_exceeded:
+            failing_checks.append(f"CL {consecutive_losses} >= {r.CONSECUTIVE_LOSSES_THRESHOLD}")
+        if not meets_count:
+            failing_checks.append(f"Trades {completed} < {r.MIN_TRADES_FOR_PROMOTION}")
+        return {
+            "action": "no_change",
+            "current_mode": "QUARANTINE",
+            "failing_checks": failing_checks,
+            "drawdown_max": drawdown_max,
+            "consecutive_losses": consecutive_losses,
+        }
+
+    # ─── Persistence ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _stage(
+        transitions: List[Dict[str, Any]], ranking: Dict[str, Any], old_mode: str,
+        new_mode: str, reason: str, metrics: Dict[str, Any],
+    ) -> str:
+        trace_id = _new_trace_id()
+        transitions.append({
+            "strategy_id": ranking["strategy_id"],
+            "old_mode": old_mode,
+            "new_mode": new_mode,
+            "trace_id": trace_id,
+            "reason": reason,
+            "metrics": metrics,
+        })
+        return trace_id
+
+    def _persist(self, transitions: List[Dict[str, Any]], results: Dict[str, Dict[str, Any]]) -> None:
+        """One transaction for the whole cycle; if it fails no transition is reported."""
+        if not transitions:
+            return
+        try:
+            self.storage.apply_strategy_transitions(transitions)
+        except Exception as e:
+            logger.error(f"[RANKER] Could not persist {len(transitions)} transitions: {e}")
+            for t in transitions:
+                results[t["strategy_id"]] = {"action": "error", "error": str(e)}
+            return
+        for t in transitions:
+            logger.critical(
+                f"[TRACE_ID: {t['trace_id']}] Strategy {t['strategy_id']} "
+                f"{t['old_mode']} -> {t['new_mode']} ({t['reason']})"
+            )
@@ -544,21 +544,22 @@ class ShadowManager:
             f"DD<={validator.PILAR2_MAX_DD:.0%}"
         )
 
-        # 3. Evaluate each instance
+        # 3. Load every instance's 3 Pilares accumulators in one batched read.
+        # ETI-02/GAP-02: sys_trades[execution_mode='SHADOW'] holds both real DEMO
+        # executions and the synthetic trades written by ShadowPenaltyInjector, so
+        # one sys_shadow_metric_state row (rebuilt lazily) covers both sources.
+        try:
+            metric_states = self.storage.get_metric_states(
+                [instance.instance_id for instance in instances]
+            )
+        except Exception as e:
+            self.logger.error(f"[SHADOW] Failed to load metric states: {e}")
+            return result
+
+        # 4. Evaluate each instance
         for instance in instances:
             try:
-                # ETI-02/GAP-02: Fuente de métricas con fallback a shadow sintético.
-                # Primaria: sys_trades (ejecución real DEMO con execution_mode='SHADOW').
-                # Fallback: calculate_instance_metrics_from_shadow_history() que lee
-                # los trades sintéticos escritos por ShadowPenaltyInjector cuando
-                # la instancia aún no tiene ejecución real pero sí señales simuladas.
-                metrics = self.storage.calculate_instance_metrics_from_sys_trades(
-                    instance.instance_id
-                )
-                if metrics.total_trades_executed == 0:
-                    metrics = self.storage.calculate_instance_metrics_from_shadow_history(
-                        instance.instance_id
-                    )
+                metrics = metric_states[instance.instance_id].to_metrics()
                 instance.metrics = metrics
                 trace_id = self.generate_trace_id(instance.instance_id, "HEALTH")
 
@@ -722,7 +723,7 @@ class ShadowManager:
         Returns 0.0 when no trades are available (avoids false signal).
 
         Args:
-            metrics: Fresh ShadowMetrics from calculate_instance_metrics_from_sys_trades().
+            metrics: Fresh ShadowMetrics from the instance's sys_shadow_metric_state.
 
         Returns:
             Normalized shadow score in [0.0, 1.0].
@@ -758,11 +759,17 @@ class ShadowManager:
             self.logger.error(f"[SHADOW] recalculate_all_shadow_scores: failed to load instances: {e}")
             return summary
 
+        try:
+            metric_states = self.storage.get_metric_states(
+                [instance.instance_id for instance in instances]
+            )
+        except Exception as e:
+            self.logger.error(f"[SHADOW] recalculate_all_shadow_scores: failed to load metric states: {e}")
+            return summary
+
         for instance in instances:
             try:
-                metrics = self.storage.calculate_instance_metrics_from_sys_trades(
-                    instance.instance_id
-                )
+                metrics = metric_states[instance.instance_id].to_metrics()
                 if metrics.total_trades_executed == 0:
                     summary["skipped"] += 1
                     self.logger.debug(
@@ -13,6 +13,7 @@ from typing import Optional
 from models.signal import Signal, ConnectorType
 from models.symbol_utils import normalize_symbol
 from data_vault.storage import StorageManager
+from core_brain.broker_state_mirror import mirrored_open_positions
 
 logger = logging.getLogger(__name__)
 
@@ -147,7 +148,7 @@ class SignalDeduplicator:
         open_signal_id = matching_op.get('id')
         
         # Obtener posiciones reales de MT5
-        real_usr_positions = self.mt5_connector.get_open_positions()
+        real_usr_positions = mirrored_open_positions(self.mt5_connector)
         if real_usr_positions is None:
             logger.warning("Failed to get MT5 usr_positions for reconciliation")
             return True
@@ -26,6 +26,7 @@ from core_brain.notification_service import NotificationService, NotificationCat
 from core_brain.notificator import get_notifier, NotificationEngine
 from core_brain.module_manager import MembershipLevel
 from core_brain.confluence import MultiTimeframeConfluenceAnalyzer
+from core_brain.latency_tracer import get_latency_tracer
 from core_brain.strategies.trifecta_logic import TrifectaAnalyzer
 from core_brain.tech_utils import TechnicalAnalyzer
 from core_brain.services.fundamental_guard import FundamentalGuardService
@@ -72,6 +73,7 @@ class SignalFactory:
         signal_validator: Optional[StrategySignalValidator] = None,
         shadow_penalty_injector: Optional[ShadowPenaltyInjector] = None,
         gatekeeper: Optional[Any] = None,
+        signal_index: Optional[Any] = None,
     ):
         """
         Inicializa la SignalFactory con inyección de dependencias estricta.
@@ -87,6 +89,8 @@ class SignalFactory:
             execution_feedback_collector: Opcional ExecutionFeedbackCollector para autonomous learning (DOMINIO-10).
             signal_validator: Opcional StrategySignalValidator (4 Pilares). Si None, se omite validación.
             shadow_penalty_injector: Opcional ShadowPenaltyInjector. Si None, se omite simulación SHADOW.
+            signal_index: Opcional SignalWindowIndex; cada señal persistida se indexa en memoria
+                para dedup/consenso sin releer sys_signals.
         """
         self.storage_manager = storage_manager
         self.notifier: Optional[NotificationEngine] = get_notifier()
@@ -94,6 +98,7 @@ class SignalFactory:
         self.mt5_connector = mt5_connector
         self.execution_feedback_collector = execution_feedback_collector  # For signal suppression
         self.instrument_manager = instrument_manager  # SSOT for enabled symbols (HU 3.9)
+        self.signal_index = signal_index  # Recent-signal window (dedup/consensus hot path)
         
         # Inyectar FundamentalGuardService o crear uno si no está disponible
         if fundamental_guard is None:
@@ -189,6 +194,7 @@ class SignalFactory:
             Lista de señales generadas (puede estar vacía).
         """
         generated_usr_signals = []
+        tracer = get_latency_tracer()
         
         for strategy_id, engine in self.strategy_engines.items():
             try:
@@ -203,7 +209,8 @@ class SignalFactory:
                 # Chequear primero por execute_from_registry (específico de JSON_SCHEMA)
                 if hasattr(engine, 'execute_from_registry') and callable(getattr(engine, 'execute_from_registry', None)):
                     # JSON_SCHEMA strategy: use UniversalStrategyEngine.execute_from_registry()
-                    result = await engine.execute_from_registry(strategy_id, symbol, df, regime)
+                    with tracer.span("signal.strategy", symbol=symbol, strategy=strategy_id):
+                        result = await engine.execute_from_registry(strategy_id, symbol, df, regime)
                     if result is None and funnel_reasons is not None:
                         funnel_reasons["no_signal_generated"] += 1
                     signal = StrategySignalConverter.convert_from_universal_engine(
@@ -211,7 +218,8 @@ class SignalFactory:
                     )
                 elif hasattr(engine, 'analyze') and callable(getattr(engine, 'analyze', None)):
                     # PYTHON_CLASS strategy: directly call analyze()
-                    raw_signal = await engine.analyze(symbol, df, regime)
+                    with tracer.span("signal.strategy", symbol=symbol, strategy=strategy_id):
+                        raw_signal = await engine.analyze(symbol, df, regime)
                     # Logging: Motivo si no hay señal (debug-only)
                     if raw_signal is None:
                         rejection_reason = getattr(engine, "last_rejection_reason", None) or "no_signal_generated"
@@ -243,7 +251,9 @@ class SignalFactory:
                         signal.provider_source = provider_source
                     
                     # Validar que no sea duplicado antes de procesar
-                    if self.signal_deduplicator.is_duplicate(signal):
+                    with tracer.span("signal.dedup", symbol=symbol, strategy=strategy_id):
+                        is_duplicate = self.signal_deduplicator.is_duplicate(signal)
+                    if is_duplicate:
                         logger.info(
                             f"[{symbol}] Señal {signal.signal_type} descartada: "
                             f"ya existe posición abierta o señal reciente"
@@ -382,6 +392,8 @@ class SignalFactory:
             
             # CLAVE: Asignar ID al objeto Signal para que Executor lo use (evita duplicados)
             signal.metadata['signal_id'] = signal_id
+            if self.signal_index is not None:
+                self.signal_index.record_signal(signal, signal_id=signal_id)
             
             logger.info(
                 f"SEÑAL GENERADA [ID: {signal_id}] -> {signal.symbol} "
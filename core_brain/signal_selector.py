@@ -7,6 +7,12 @@ Responsibility:
   - Apply scoring formula (multiplicative: historical × current × context)
   - Enforce category-based rules (A=Repetition, B=Consensus, C=Post-Fail, D=Multi-TF)
 
+Hot path:
+  - With an injected SignalWindowIndex (ready), the duplicate lookup is answered in
+    memory in O(matches): no sys_signals fetch, no created_at parsing
+  - Index entries and sys_signals rows go through the same classification
+    (_scan_recent_signals), so both sources yield the same A/B/D categories
+
 Rule: 
   - NO broker/connector imports (agnosis rule #4)
   - ALL persistence via StorageManager (SSOT rule #15)
@@ -19,6 +25,8 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
+from core_brain.intelligence.signal_window_index import SignalWindowIndex
+
 
 def _as_utc(dt: datetime) -> datetime:
     """Return dt as UTC-aware. Naive datetimes are assumed to be UTC."""
@@ -33,6 +41,25 @@ from enum import Enum
 logger = logging.getLogger(__name__)
 
 
+def _own_ids(signal: Dict) -> set:
+    """Ids under which the signal being assessed may already sit in sys_signals."""
+    metadata = signal.get("metadata") or {}
+    ids = (signal.get("signal_id"), signal.get("id"), metadata.get("signal_id"))
+    return {i for i in ids if i}
+
+
+def _strategy_of(signal: Dict) -> Optional[str]:
+    """Strategy of a signal or sys_signals row (rows only carry it in metadata.strategy_id)."""
+    metadata = signal.get("metadata") or {}
+    return signal.get("strategy_id") or metadata.get("strategy_id") or signal.get("strategy")
+
+
+def _direction_of(signal: Dict) -> str:
+    """BUY/SELL as text, whether signal_type is a SignalType or a sys_signals string."""
+    value = signal.get("signal_type")
+    return str(getattr(value, "value", value) or "")
+
+
 class DuplicateCategory(Enum):
     """Categorization of signal duplicate scenarios."""
     A_REPETITION = "A_REPETITION"          # Same strategy, same setup, failure retry
@@ -74,13 +101,21 @@ class SignalSelector:
       - ⏳ PHASE 3: Aggressive consensus (operate multiple aligned strategies)
     """
 
-    def __init__(self, storage_manager):
+    def __init__(self, storage_manager, signal_index: Optional[SignalWindowIndex] = None):
         """
         Args:
             storage_manager: StorageManager instance (SSOT for all persistence)
+            signal_index: Optional in-memory window of recent signals; once ready it
+                replaces the recent_signals fetch and scan
         """
         self.storage = storage_manager
+        self.signal_index = signal_index
         self.logger = logging.getLogger(self.__class__.__name__)
+
+    @property
+    def uses_signal_index(self) -> bool:
+        """True once the injected signal index has been warmed and can be trusted."""
+        return self.signal_index is not None and self.signal_index.ready
         
     async def should_operate_signal(
         self,
@@ -109,16 +144,16 @@ class SignalSelector:
             )
             return SignalSelectorResult.REJECT_COOLDOWN, cooldown_check
         
-        # Step 2: Fetch recent signals from storage if not provided
-        if not recent_signals:
+        # Step 2: Fetch recent signals from storage if not provided (index answers in memory).
+        # All timeframes of the symbol: other TFs are what category D compares against.
+        if not recent_signals and not self.uses_signal_index:
             symbol = signal.get("symbol", "")
-            timeframe = signal.get("timeframe", "M5")
             try:
                 fn = self.storage.get_recent_sys_signals
                 if inspect.iscoroutinefunction(fn):
-                    recent_signals = await fn(symbol=symbol, timeframe=timeframe) or []
+                    recent_signals = await fn(symbol=symbol) or []
                 else:
-                    result = fn(symbol=symbol, timeframe=timeframe)
+                    result = fn(symbol=symbol)
                     if asyncio.iscoroutine(result):
                         result = await result
                     recent_signals = result or []
@@ -207,41 +242,23 @@ class SignalSelector:
         symbol = signal.get("symbol")
         signal_type = signal.get("signal_type")  # BUY/SELL
         timeframe = signal.get("timeframe")
-        strategy = signal.get("strategy")
+        strategy = _strategy_of(signal)
         confidence = signal.get("confidence", 0.5)
         
-        if not recent_signals:
+        if not recent_signals and not self.uses_signal_index:
             return DuplicateCategory.DIFFERENT, {"matching_signals": []}
         
         # Get dynamic dedup window for this (symbol, TF, strategy)
         window_minutes = await self._get_dedup_window(
             symbol, timeframe, strategy, market_context
         )
-        window_expires = datetime.now(timezone.utc) - timedelta(minutes=window_minutes)
-        
-        matching = []
-        for recent in recent_signals:
-            # Time check
-            recent_time = recent.get("created_at")
-            if isinstance(recent_time, str):
-                recent_time = datetime.fromisoformat(recent_time)
-            recent_time = _as_utc(recent_time)
 
-            if recent_time is None or recent_time < window_expires:
-                continue  # Outside window or no timestamp
-
-            # Symbol + type + timeframe match = potential duplicate
-            if (recent.get("symbol") == symbol and
-                recent.get("signal_type") == signal_type and
-                recent.get("timeframe") == timeframe):
-
-                matching.append({
-                    "signal_id": recent.get("signal_id"),
-                    "strategy": recent.get("strategy"),
-                    "confidence": recent.get("confidence", 0.5),
-                    "created_at": recent_time,
-                    "age_minutes": (datetime.now(timezone.utc) - recent_time).total_seconds() / 60
-                })
+        if self.uses_signal_index:
+            matching, cross_tf_matching = self._indexed_matches(signal, window_minutes)
+        else:
+            matching, cross_tf_matching = self._scan_recent_signals(
+                signal, recent_signals, window_minutes
+            )
         
         details = {
             "window_minutes": window_minutes,
@@ -252,18 +269,6 @@ class SignalSelector:
         # Categorize
         if not matching:
             # Check for cross-timeframe duplicates (CATEGORY D)
-            cross_tf_matching = []
-            for recent in recent_signals:
-                recent_time = recent.get("created_at")
-                if isinstance(recent_time, str):
-                    recent_time = datetime.fromisoformat(recent_time)
-                recent_time = _as_utc(recent_time)
-                if recent_time is None or recent_time < window_expires:
-                    continue
-                if (recent.get("symbol") == symbol and
-                        recent.get("signal_type") == signal_type and
-                        recent.get("timeframe") != timeframe):
-                    cross_tf_matching.append(recent)
             if cross_tf_matching:
                 details["cross_tf_matching"] = cross_tf_matching
                 return DuplicateCategory.D_MULTI_TIMEFRAME, details
@@ -285,6 +290,75 @@ class SignalSelector:
         
         return DuplicateCategory.DIFFERENT, details
 
+    def _scan_recent_signals(
+        self,
+        signal: Dict,
+        recent_signals: List[Dict],
+        window_minutes: int
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Split recent signals into same-TF matches and cross-TF matches.
+
+        Used for sys_signals rows and, with IndexedSignal.as_dict() rows, for the
+        index path, so both sources are classified by exactly the same rules.
+        """
+        symbol = signal.get("symbol")
+        signal_type = _direction_of(signal)
+        timeframe = signal.get("timeframe")
+        window_expires = datetime.now(timezone.utc) - timedelta(minutes=window_minutes)
+        own_ids = _own_ids(signal)
+
+        matching = []
+        in_window = []
+        for recent in recent_signals or []:
+            # The current signal is already persisted: it is not its own duplicate
+            if own_ids.intersection((recent.get("id"), recent.get("signal_id"))):
+                continue
+
+            # Time check
+            recent_time = recent.get("created_at")
+            if isinstance(recent_time, str):
+                recent_time = datetime.fromisoformat(recent_time)
+            recent_time = _as_utc(recent_time)
+
+            if recent_time is None or recent_time < window_expires:
+                continue  # Outside window or no timestamp
+            if recent.get("symbol") != symbol or _direction_of(recent) != signal_type:
+                continue
+            in_window.append(recent)
+
+            # Symbol + type + timeframe match = potential duplicate
+            if recent.get("timeframe") == timeframe:
+                matching.append({
+                    "signal_id": recent.get("signal_id") or recent.get("id"),
+                    "strategy": _strategy_of(recent),
+                    "confidence": recent.get("confidence", 0.5),
+                    "created_at": recent_time,
+                    "age_minutes": (datetime.now(timezone.utc) - recent_time).total_seconds() / 60
+                })
+
+        cross_tf_matching = [r for r in in_window if r.get("timeframe") != timeframe]
+        return matching, cross_tf_matching
+
+    def _indexed_matches(
+        self,
+        signal: Dict,
+        window_minutes: int
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Same-TF and cross-TF matches from the signal index.
+
+        The index walks only the (symbol, direction) series inside the window;
+        the entries are then classified by _scan_recent_signals, like sys_signals rows.
+        """
+        entries = self.signal_index.query(
+            signal.get("symbol"),
+            _direction_of(signal),
+            window_minutes,
+            exclude_ids=_own_ids(signal),
+        )
+        return self._scan_recent_signals(signal, [entry.as_dict() for entry in entries], window_minutes)
+
     async def _apply_dedup_rules(
         self,
         signal: Dict,
@@ -0,0 +1,250 @@
+"""
+StartupGraph — Declarative, staged and concurrent service bring-up.
+===================================================================
+TRACE_ID: PERF-STARTUP-GRAPH-2026-001
+
+Responsibility:
+  - Declare services as nodes with explicit dependencies and a stage:
+    CRITICAL (needed before the first scan: storage → connectors → scanner →
+    executor → orchestrator) or DEFERRED (tuners, monitors, backtest and
+    economic services, brought up once the trading loop is running).
+  - Construct every node whose dependencies are resolved concurrently:
+    blocking factories run in worker threads, loop-bound factories (those
+    that create tasks or asyncio primitives) run on the event loop.
+  - Record a startup timeline (start/end per node plus milestones such as
+    ``first_scan``) so time-to-first-scan can be tracked.
+
+Architecture:
+  - start.py declares the graph; each factory receives its resolved
+    dependencies as keyword arguments (DI) and imports its module on first
+    use, so nothing heavy is imported at launcher load time.
+  - A failing CRITICAL node aborts startup (StartupError). A failing DEFERRED
+    node is logged and its dependents are skipped — the engine keeps running.
+
+Rule: the graph orders and times construction only; start/stop of the
+services it builds stays with the caller.
+"""
+import asyncio
+import inspect
+import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StartupStage(str, Enum):
+    CRITICAL = "critical"
+    DEFERRED = "deferred"
+
+
+class StartupError(RuntimeError):
+    """A CRITICAL service could not be constructed."""
+
+
+@dataclass(frozen=True)
+class ServiceSpec:
+    """One node of the startup graph."""
+    name: str
+    factory: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    stage: StartupStage = StartupStage.CRITICAL
+    in_thread: bool = True
+
+
+@dataclass
+class TimelineEntry:
+    """Construction interval of a node (seconds since the graph was created)."""
+    name: str
+    stage: str
+    started_s: float
+    finished_s: float
+    ok: bool
+    error: str = ""
+
+    @property
+    def duration_s(self) -> float:
+        return self.finished_s - self.started_s
+
+
+class StartupGraph:
+    """
+    Dependency graph of startup services.
+
+    Args:
+        clock: Monotonic clock (injectable for tests).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._t0 = clock()
+        self._specs: Dict[str, ServiceSpec] = {}
+        self._resolved: Dict[str, Any] = {}
+        self._failed: Dict[str, str] = {}
+        self._timeline: List[TimelineEntry] = []
+        self._milestones: Dict[str, float] = {}
+        self._deferred_task: Optional["asyncio.Task[Dict[str, Any]]"] = None
+
+    # ── Declaration ───────────────────────────────────────────────────────────
+
+    def add(
+        self,
+        name: str,
+        factory: Callable[..., Any],
+        deps: Sequence[str] = (),
+        stage: StartupStage = StartupStage.CRITICAL,
+        in_thread: bool = True,
+    ) -> None:
+        """
+        Declare ``name``. ``factory(**{dep: value})`` builds it; coroutine
+        functions are awaited on the loop, other factories run in a worker
+        thread unless ``in_thread`` is False.
+        """
+        if name in self._specs or name in self._resolved:
+            raise ValueError(f"Startup service '{name}' declared twice")
+        self._specs[name] = ServiceSpec(name, factory, tuple(deps), StartupStage(stage), in_thread)
+
+    def provide(self, name: str, value: Any) -> None:
+        """Register an already-built value (e.g. storage created before the graph)."""
+        self._resolved[name] = value
+
+    # ── Execution ─────────────────────────────────────────────────────────────
+
+    async def start(self, stage: StartupStage = StartupStage.CRITICAL) -> Dict[str, Any]:
+        """Construct every node of ``stage``; returns the values resolved so far."""
+        pending = {n: s for n, s in self._specs.items() if s.stage == stage and n not in self._resolved}
+        self._validate(pending, stage)
+        running: Dict["asyncio.Task[Any]", ServiceSpec] = {}
+
+        while pending or running:
+            for name in list(pending):
+                spec = pending[name]
+                if any(dep in self._failed for dep in spec.deps):
+                    del pending[name]
+                    self._fail(spec, "dependency failed", self._clock())
+                elif all(dep in self._resolved for dep in spec.deps):
+                    del pending[name]
+                    running[asyncio.ensure_future(self._build(spec))] = spec
+            if not running:
+                # Only reachable when a dependency from another stage was never built
+                for spec in pending.values():
+                    self._fail(spec, "dependency not built", self._clock())
+                    logger.warning("[STARTUP] %s skipped: dependency not built", spec.name)
+                break
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                spec = running.pop(task)
+                if task.exception() is not None and stage == StartupStage.CRITICAL:
+                    if running:
+                        await asyncio.wait(running)
+                    raise StartupError(f"{spec.name}: {task.exception()}") from task.exception()
+
+        return dict(self._resolved)
+
+    def start_deferred(self) -> "asyncio.Task[Dict[str, Any]]":
+        """Schedule the DEFERRED stage in the background (never raises into the caller)."""
+        self._deferred_task = asyncio.ensure_future(self.start(StartupStage.DEFERRED))
+        self._deferred_task.add_done_callback(self._on_deferred_done)
+        return self._deferred_task
+
+    def _on_deferred_done(self, task: "asyncio.Task[Dict[str, Any]]") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("[STARTUP] Deferred stage aborted: %s", task.exception())
+        self.log_timeline(StartupStage.DEFERRED)
+
+    async def _build(self, spec: ServiceSpec) -> Any:
+        kwargs = {dep: self._resolved[dep] for dep in spec.deps}
+        started = self._clock()
+        try:
+            if inspect.iscoroutinefunction(spec.factory):
+                value = await spec.factory(**kwargs)
+            elif spec.in_thread:
+                value = await asyncio.to_thread(spec.factory, **kwargs)
+            else:
+                value = spec.factory(**kwargs)
+        except Exception as exc:
+            self._fail(spec, f"{type(exc).__name__}: {exc}", started)
+            log = logger.error if spec.stage == StartupStage.CRITICAL else logger.warning
+            log("[STARTUP] %s failed (%s): %s", spec.name, spec.stage.value, exc, exc_info=True)
+            raise
+        self._resolved[spec.name] = value
+        self._timeline.append(TimelineEntry(
+            spec.name, spec.stage.value, started - self._t0, self._clock() - self._t0, True,
+        ))
+        return value
+
+    def _fail(self, spec: ServiceSpec, error: str, started: float) -> None:
+        self._failed[spec.name] = error
+        self._timeline.append(TimelineEntry(
+            spec.name, spec.stage.value, started - self._t0, self._clock() - self._t0, False, error,
+        ))
+
+    def _validate(self, pending: Dict[str, ServiceSpec], stage: StartupStage) -> None:
+        """Every dependency must be resolved, in this stage, or (for DEFERRED) critical; no cycles."""
+        for spec in pending.values():
+            for dep in spec.deps:
+                if dep in self._resolved or dep in pending:
+                    continue
+                dep_spec = self._specs.get(dep)
+                if dep_spec is None:
+                    raise ValueError(f"Startup service '{spec.name}' depends on undeclared '{dep}'")
+                if stage == StartupStage.CRITICAL and dep_spec.stage == StartupStage.DEFERRED:
+                    raise ValueError(f"Critical service '{spec.name}' cannot depend on deferred '{dep}'")
+
+        state: Dict[str, int] = {}
+
+        def visit(name: str, path: Tuple[str, ...]) -> None:
+            if state.get(name) == 2 or name not in pending:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Startup dependency cycle: {' -> '.join(path + (name,))}")
+            state[name] = 1
+            for dep in pending[name].deps:
+                visit(dep, path + (name,))
+            state[name] = 2
+
+        for name in pending:
+            visit(name, ())
+
+    # ── Access & timeline ─────────────────────────────────────────────────────
+
+    def __getitem__(self, name: str) -> Any:
+        return self._resolved[name]
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self._resolved.get(name, default)
+
+    @property
+    def failed(self) -> Dict[str, str]:
+        return dict(self._failed)
+
+    def mark(self, milestone: str) -> float:
+        """Record ``milestone`` once (e.g. ``first_scan``); returns seconds since graph creation."""
+        if milestone not in self._milestones:
+            self._milestones[milestone] = self._clock() - self._t0
+            logger.info("[STARTUP] milestone %s at %.3fs", milestone, self._milestones[milestone])
+        return self._milestones[milestone]
+
+    @property
+    def milestones(self) -> Dict[str, float]:
+        return dict(self._milestones)
+
+    def timeline(self, stage: Optional[StartupStage] = None) -> List[TimelineEntry]:
+        entries = [e for e in self._timeline if stage is None or e.stage == StartupStage(stage).value]
+        return sorted(entries, key=lambda e: (e.started_s, e.finished_s))
+
+    def format_timeline(self, stage: Optional[StartupStage] = None) -> str:
+        lines = [
+            f"  {e.started_s:8.3f}s → {e.finished_s:8.3f}s  ({e.duration_s * 1000:8.1f} ms)  "
+            f"[{e.stage}] {e.name}{'' if e.ok else '  FAILED: ' + e.error}"
+            for e in self.timeline(stage)
+        ]
+        lines.extend(f"  {at:8.3f}s  milestone: {name}" for name, at in self._milestones.items())
+        return "\n".join(lines)
+
+    def log_timeline(self, stage: Optional[StartupStage] = None) -> None:
+        label = StartupStage(stage).value if stage is not None else "all"
+        logger.info("[STARTUP] Timeline (%s):\n%s", label, self.format_timeline(stage))
@@ -27,6 +27,7 @@ from models.trade_result import TradeResult
 from core_brain.strategies.base_strategy import BaseStrategy
 from core_brain.sensors.session_liquidity_sensor import SessionLiquiditySensor
 from core_brain.sensors.liquidity_sweep_detector import LiquiditySweepDetector
+from core_brain.sensors.pattern_sensor_suite import OHLCArrays
 from core_brain.services.fundamental_guard import FundamentalGuardService
 from data_vault.storage import StorageManager
 
@@ -252,16 +253,13 @@ class LiquiditySweep0001Strategy(BaseStrategy):
                 return None
             
             # Step 5: Vela actual y previas
-            current_candle = {
-                'open': float(df.iloc[-1]['open']),
-                'high': float(df.iloc[-1]['high']),
-                'low': float(df.iloc[-1]['low']),
-                'close': float(df.iloc[-1]['close']),
-            }
+            ohlc = OHLCArrays.from_frame(df.iloc[-2:])
+            current_candle = ohlc.candle(-1)
+            current_candle.pop('volume')
             
             # Rango previo (vela anterior)
-            prev_high = float(df.iloc[-2]['high'])
-            prev_low = float(df.iloc[-2]['low'])
+            prev_high = float(ohlc.high[-2])
+            prev_low = float(ohlc.low[-2])
             
             # Step 6: Detectar breakout falso + reversal
             # Chequear ambas direcciones
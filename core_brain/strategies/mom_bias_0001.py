@@ -31,6 +31,7 @@ from data_vault.storage import StorageManager
 from core_brain.strategies.base_strategy import BaseStrategy
 from core_brain.sensors.elephant_candle_detector import ElephantCandleDetector
 from core_brain.sensors.moving_average_sensor import MovingAverageSensor
+from core_brain.sensors.pattern_sensor_suite import OHLCArrays
 
 logger = logging.getLogger(__name__)
 
@@ -228,28 +229,17 @@ class MomentumBias0001Strategy(BaseStrategy):
                 self._reject("sma_unavailable")
                 return None
             
-            # Step 3: Obtener vela actual y previas
-            current_candle = {
-                'open': float(df.iloc[-1]['open']),
-                'high': float(df.iloc[-1]['high']),
-                'low': float(df.iloc[-1]['low']),
-                'close': float(df.iloc[-1]['close']),
-                'volume': float(df.iloc[-1].get('volume', 0)),
-                'timestamp': df.index[-1].isoformat() if hasattr(df.index[-1], 'isoformat') else str(df.index[-1]),
-            }
+            # Step 3: Obtener vela actual y previas (arrays OHLC de la cola, sin iloc por fila)
+            ohlc = OHLCArrays.from_frame(df.iloc[-6:])
+            current_candle = ohlc.candle(-1)
+            current_candle['timestamp'] = (
+                df.index[-1].isoformat() if hasattr(df.index[-1], 'isoformat') else str(df.index[-1])
+            )
             
             # Velas previas para contexto
             previous_candles = []
             if len(df) >= 6:
-                for i in range(1, min(6, len(df))):
-                    prev = {
-                        'open': float(df.iloc[-(i+1)]['open']),
-                        'high': float(df.iloc[-(i+1)]['high']),
-                        'low': float(df.iloc[-(i+1)]['low']),
-                        'close': float(df.iloc[-(i+1)]['close']),
-                        'volume': float(df.iloc[-(i+1)].get('volume', 0)),
-                    }
-                    previous_candles.append(prev)
+                previous_candles = [ohlc.candle(-(i + 1)) for i in range(1, 6)]
             
             # Step 4: Validar ignición (bullish o bearish)
             ignition_result = self.elephant_candle_detector.validate_ignition(
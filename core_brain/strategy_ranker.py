@@ -9,6 +9,7 @@ from typing import Optional, Dict, Any
 from datetime import datetime, timezone
 from decimal import Decimal
 
+from core_brain.services.strategy_ranking_engine import StrategyRankingEngine
 from data_vault.storage import StorageManager
 
 logger = logging.getLogger(__name__)
@@ -70,6 +71,7 @@ class StrategyRanker:
             storage: StorageManager instance for persistence
         """
         self.storage = _resolve_storage(storage)
+        self.batch_engine = StrategyRankingEngine(self)
         logger.info("StrategyRanker initialized with SHADOW->LIVE->QUARANTINE evolution engine")
     
     def evaluate_and_rank(self, strategy_id: str) -> Dict[str, Any]:
@@ -504,21 +506,17 @@ class StrategyRanker:
         """
         Evaluate multiple usr_strategies in batch.
         
+        One read of all rankings and regime weights, one vectorized decision pass
+        and one transaction for the resulting transitions (StrategyRankingEngine).
+        Decisions are identical to calling evaluate_and_rank per strategy.
+        
         Args:
             strategy_ids: List of strategy identifiers
             
         Returns:
             Dictionary mapping strategy_id to evaluation result
         """
-        results = {}
-        for strategy_id in strategy_ids:
-            try:
-                results[strategy_id] = self.evaluate_and_rank(strategy_id)
-            except Exception as e:
-                logger.error(f"Error evaluating strategy {strategy_id}: {e}")
-                results[strategy_id] = {'action': 'error', 'error': str(e)}
-        
-        return results
+        return self.batch_engine.evaluate(strategy_ids)
     
     def get_live_usr_strategies(self) -> list:
         """Get all usr_strategies currently in LIVE mode."""
@@ -550,25 +548,17 @@ class StrategyRanker:
             }
         """
         try:
-            # Get all usr_strategies by mode
-            shadow_usr_strategies = self.get_shadow_usr_strategies()
-            live_usr_strategies = self.get_live_usr_strategies()
-            quarantine_usr_strategies = self.get_quarantine_usr_strategies()
-            
-            # Aggregate all usr_strategies and extract ONLY strategy_ids (batch_evaluate expects strings, not dicts)
-            all_strategies = shadow_usr_strategies + live_usr_strategies + quarantine_usr_strategies
-            all_strategy_ids = [s['strategy_id'] if isinstance(s, dict) else s for s in all_strategies]
+            # Single read + vectorized pass over SHADOW, LIVE and QUARANTINE
+            results = self.batch_engine.evaluate()
             
+            modes = [r.get('current_mode') or r.get('from_mode') for r in results.values()]
             logger.info(
-                f"[RANKER] Evaluating all usr_strategies: "
-                f"SHADOW={len(shadow_usr_strategies)}, LIVE={len(live_usr_strategies)}, QUARANTINE={len(quarantine_usr_strategies)}"
+                f"[RANKER] Evaluated all usr_strategies: "
+                f"SHADOW={modes.count('SHADOW')}, LIVE={modes.count('LIVE')}, QUARANTINE={modes.count('QUARANTINE')}"
             )
             
-            # Batch evaluate
-            results = self.batch_evaluate(all_strategy_ids)
-            
             # Log summary
-            transitions_count = sum(1 for r in results.values() if r.get('action') in ['promoted', 'degraded', 'recovered'])
+            transitions_count = sum(1 for r in results.values() if r.get('action') in ['promoted', 'degraded', 'rehabilitated', 'recovered'])
             logger.info(
                 f"[RANKER] Evaluation complete: {len(results)} usr_strategies evaluated, "
                 f"{transitions_count} transitions detected"
@@ -0,0 +1,264 @@
+"""
+SymbolRegistry — Interned symbols with precomputed instrument metadata.
+=======================================================================
+TRACE_ID: PERF-SYMBOL-REGISTRY-2026-001
+
+Responsibility:
+  - Intern every symbol once: broker/provider alias (``EURUSD=X``,
+    ``eur/usd``, ``EURUSD.a``) → canonical symbol → small integer id.
+  - Build, once per symbol, an immutable ``SymbolRecord`` holding what hot
+    paths used to recompute per signal: taxonomy and asset class,
+    base/quote currencies, pip size and broker spec (digits, point,
+    contract size, volume limits), instrument config (enabled, min score,
+    risk multiplier, spread limit) and volume availability.
+  - Refresh path: ``observe_spec()`` compares the broker spec a caller
+    already holds with the recorded fingerprint and rebuilds the record only
+    when it changed; ``refresh()`` drops records after an instrument config
+    change.
+
+Architecture:
+  - Process-wide singleton (``get_symbol_registry()``), like the latency
+    tracer. start.py binds the InstrumentManager once; without one the
+    config fields stay at their "unknown instrument" defaults.
+  - Records are frozen: readers share them without locking and a refresh
+    publishes a new record (``spec_version`` + 1) instead of mutating.
+
+Rule: a record only caches pure functions of the symbol, the bound
+instrument config and the last observed broker spec — never live prices.
+"""
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from core_brain.symbol_taxonomy_engine import SymbolTaxonomy
+from utils.market_ops import calculate_pip_size, classify_asset_type
+
+logger = logging.getLogger(__name__)
+
+_SPEC_FIELDS = ("digits", "point", "trade_contract_size", "volume_min", "volume_max", "volume_step")
+# Broker account-type suffix on a currency pair: EURUSD.a, EURUSD.pro, EURUSD-ECN, EURUSD_i
+_BROKER_SUFFIX = re.compile(r"^([A-Z]{6})[._-][A-Z0-9]{1,4}$")
+
+
+def canonical_symbol(symbol: str) -> str:
+    """
+    Provider-agnostic form: upper case, no Yahoo ``=X`` suffix, no separators,
+    no broker suffix on a currency pair (``EURUSD.a`` → ``EURUSD``).
+
+    Only six-letter pairs lose their suffix; other names (``BRK.B``) are kept.
+    """
+    canonical = (symbol or "").upper().replace("=X", "").replace("/", "").replace(" ", "")
+    match = _BROKER_SUFFIX.match(canonical)
+    return match.group(1) if match else canonical
+
+
+def _currencies(canonical: str) -> Tuple[str, ...]:
+    # Same rule EconomicIntegrationManager has always applied: 6 chars, or 7 with a broker suffix
+    if len(canonical) in (6, 7):
+        return canonical[:3], canonical[3:6]
+    return ()
+
+
+def _spec_fingerprint(symbol_info: Any) -> Optional[Tuple[Any, ...]]:
+    # A spec without integer digits (missing, or a test double) is never recorded
+    if symbol_info is None or not isinstance(getattr(symbol_info, "digits", None), int):
+        return None
+    return tuple(getattr(symbol_info, name, None) for name in _SPEC_FIELDS)
+
+
+@dataclass(frozen=True)
+class SymbolRecord:
+    """Immutable metadata of one interned symbol."""
+    id: int
+    symbol: str
+    asset_type: str                   # SymbolTaxonomy: forex / crypto / indices / commodities / stocks
+    asset_class: str                  # market_ops: forex / metal / crypto / index
+    currencies: Tuple[str, ...]
+    has_volume: bool
+    pip_size: float
+    category: str = "UNKNOWN"
+    subcategory: str = "UNKNOWN"
+    enabled: bool = False
+    min_score: Optional[float] = None
+    risk_multiplier: Optional[float] = None
+    max_spread: Optional[float] = None
+    digits: Optional[int] = None
+    point: Optional[float] = None
+    contract_size: Optional[float] = None
+    volume_min: Optional[float] = None
+    volume_max: Optional[float] = None
+    volume_step: Optional[float] = None
+    spec_version: int = 0
+
+    @property
+    def base_currency(self) -> Optional[str]:
+        return self.currencies[0] if self.currencies else None
+
+    @property
+    def quote_currency(self) -> Optional[str]:
+        return self.currencies[1] if self.currencies else None
+
+
+class SymbolRegistry:
+    """
+    Alias → canonical → id interning plus one ``SymbolRecord`` per id.
+
+    Args:
+        instrument_manager: Source of instrument config (optional; see ``bind``).
+    """
+
+    def __init__(self, instrument_manager: Any = None) -> None:
+        self._lock = threading.RLock()
+        self._instrument_manager = instrument_manager
+        self._alias_to_id: Dict[str, int] = {}
+        self._canonical_to_id: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._records: List[Optional[SymbolRecord]] = []
+        self._specs: List[Optional[Tuple[Any, ...]]] = []
+        self._spec_infos: List[Any] = []
+        self.stats = {"records_built": 0, "spec_refreshes": 0, "alias_hits": 0}
+
+    def bind(self, instrument_manager: Any) -> None:
+        """Use ``instrument_manager`` for config fields; existing records are rebuilt lazily."""
+        with self._lock:
+            self._instrument_manager = instrument_manager
+            self.refresh()
+
+    # ── Interning ─────────────────────────────────────────────────────────────
+
+    def intern(self, symbol: str) -> int:
+        """Integer id of ``symbol`` (any alias of it); assigned on first sight."""
+        symbol_id = self._alias_to_id.get(symbol)
+        if symbol_id is not None:
+            self.stats["alias_hits"] += 1
+            return symbol_id
+        canonical = canonical_symbol(symbol)
+        with self._lock:
+            symbol_id = self._canonical_to_id.get(canonical)
+            if symbol_id is None:
+                symbol_id = len(self._symbols)
+                self._canonical_to_id[canonical] = symbol_id
+                self._symbols.append(canonical)
+                self._records.append(None)
+                self._specs.append(None)
+                self._spec_infos.append(None)
+            self._alias_to_id[symbol] = symbol_id
+            return symbol_id
+
+    def register_alias(self, alias: str, canonical: str) -> int:
+        """Map a broker-specific name ``canonical_symbol`` cannot resolve (``GER40.cash``) onto a canonical symbol."""
+        symbol_id = self.intern(canonical)
+        with self._lock:
+            self._alias_to_id[alias] = symbol_id
+        return symbol_id
+
+    def symbol(self, symbol_id: int) -> str:
+        return self._symbols[symbol_id]
+
+    # ── Records ───────────────────────────────────────────────────────────────
+
+    def record(self, symbol: Union[str, int]) -> SymbolRecord:
+        """Metadata record of a symbol (alias, canonical or id), built on first use."""
+        symbol_id = symbol if isinstance(symbol, int) else self.intern(symbol)
+        record = self._records[symbol_id]
+        if record is None:
+            with self._lock:
+                record = self._records[symbol_id]
+                if record is None:
+                    record = self._build(symbol_id, spec_version=0)
+        return record
+
+    def observe_spec(self, symbol: Union[str, int], symbol_info: Any) -> SymbolRecord:
+        """
+        Record for ``symbol`` consistent with the broker spec ``symbol_info``.
+
+        Rebuilds (``spec_version`` + 1) only when digits, point, contract size
+        or volume limits differ from the last observed spec.
+        """
+        symbol_id = symbol if isinstance(symbol, int) else self.intern(symbol)
+        fingerprint = _spec_fingerprint(symbol_info)
+        record = self.record(symbol_id)
+        if fingerprint is None or fingerprint == self._specs[symbol_id]:
+            return record
+        with self._lock:
+            if fingerprint != self._specs[symbol_id]:
+                self._specs[symbol_id] = fingerprint
+                self._spec_infos[symbol_id] = symbol_info
+                record = self._build(symbol_id, spec_version=record.spec_version + 1)
+                self.stats["spec_refreshes"] += 1
+            return self._records[symbol_id]
+
+    def refresh(self, symbol: Optional[Union[str, int]] = None) -> None:
+        """
+        Drop the record of ``symbol`` (all when None); it is rebuilt on next use.
+
+        A full refresh also lets the bound InstrumentManager retry symbols it
+        failed to classify under the previous config.
+        """
+        with self._lock:
+            if symbol is None:
+                self._records = [None] * len(self._records)
+                forget = getattr(self._instrument_manager, "forget_unclassified", None)
+                if callable(forget):
+                    forget()
+                return
+            symbol_id = symbol if isinstance(symbol, int) else self.intern(symbol)
+            self._records[symbol_id] = None
+
+    def _build(self, symbol_id: int, spec_version: int) -> SymbolRecord:
+        canonical = self._symbols[symbol_id]
+        info = self._spec_infos[symbol_id]
+        spec = dict(zip(_SPEC_FIELDS, self._specs[symbol_id] or (None,) * len(_SPEC_FIELDS)))
+        fields: Dict[str, Any] = {}
+        im = self._instrument_manager
+        if im is not None:
+            try:
+                config = im.get_config(canonical)
+            except Exception as e:
+                logger.debug("[SYMBOLS] Instrument config unavailable for %s: %s", canonical, e)
+                config = None
+            if config is not None:
+                fields = {
+                    "category": config.category,
+                    "subcategory": config.subcategory,
+                    "enabled": bool(config.enabled and config.active),
+                    "min_score": config.min_score,
+                    "risk_multiplier": config.risk_multiplier,
+                    "max_spread": config.max_spread,
+                }
+        record = SymbolRecord(
+            id=symbol_id,
+            symbol=canonical,
+            asset_type=SymbolTaxonomy.get_symbol_type(canonical),
+            asset_class=classify_asset_type(canonical),
+            currencies=_currencies(canonical),
+            has_volume=not SymbolTaxonomy.is_index_without_volume(canonical),
+            pip_size=calculate_pip_size(info, canonical, im),
+            digits=spec["digits"],
+            point=spec["point"],
+            contract_size=spec["trade_contract_size"],
+            volume_min=spec["volume_min"],
+            volume_max=spec["volume_max"],
+            volume_step=spec["volume_step"],
+            spec_version=spec_version,
+            **fields,
+        )
+        self._records[symbol_id] = record
+        self.stats["records_built"] += 1
+        return record
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+
+_symbol_registry_instance: Optional[SymbolRegistry] = None
+
+
+def get_symbol_registry() -> SymbolRegistry:
+    """Process-wide symbol registry."""
+    global _symbol_registry_instance
+    if _symbol_registry_instance is None:
+        _symbol_registry_instance = SymbolRegistry()
+    return _symbol_registry_instance
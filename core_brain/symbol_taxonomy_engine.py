@@ -7,6 +7,7 @@ All classification logic is pure (no side effects, deterministic).
 All symbol sets are immutable and defined at module load time.
 """
 
+from functools import lru_cache
 from typing import Optional, Set
 
 
@@ -120,6 +121,10 @@ class SymbolTaxonomy:
         Returns:
             Asset type name; defaults to "stocks" for unknown symbols
         """
+        return _classify(symbol)
+
+    @staticmethod
+    def _classify_uncached(symbol: str) -> str:
         # Normalize: uppercase, remove separators
         clean_symbol = symbol.upper().replace("/", "").replace("-", "").replace("_", "")
         
@@ -189,5 +194,8 @@ class SymbolTaxonomy:
         return clean_symbol in SymbolTaxonomy.INDICES_WITHOUT_VOLUME
 
 
+# Classification is pure: memoize it so hot paths pay the substring scans once per symbol
+_classify = lru_cache(maxsize=4096)(SymbolTaxonomy._classify_uncached)
+
 # Validate invariants at module load time
 SymbolTaxonomy._validate_invariants()
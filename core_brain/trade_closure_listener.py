@@ -21,6 +21,7 @@ from data_vault.storage import StorageManager
 from core_brain.risk_manager import RiskManager
 from core_brain.edge_tuner import EdgeTuner
 from core_brain.threshold_optimizer import ThresholdOptimizer
+from core_brain.circuit_breaker import CircuitBreaker
 from models.broker_event import BrokerTradeClosedEvent, BrokerEvent, BrokerEventType
 from models.execution_mode import ExecutionMode, Provider, AccountType, BROKER_KEYWORDS_TO_PROVIDER, BROKER_KEYWORDS_TO_ACCOUNT_TYPE
 
@@ -35,6 +36,7 @@ class TradeClosureListener:
     1. Process trade closed events from any broker
     2. Persist usr_trades to DB (with retry on lock)
     3. Update RiskManager state (lockdown, consecutive losses)
+       and feed the strategy's CircuitBreaker window (degrade within one trade)
     4. Trigger parameter tuning when needed
     5. Maintain detailed audit trail
     
@@ -52,7 +54,8 @@ class TradeClosureListener:
         edge_tuner: EdgeTuner,
         threshold_optimizer: Optional[ThresholdOptimizer] = None,
         max_retries: int = 3,
-        retry_backoff: float = 0.5
+        retry_backoff: float = 0.5,
+        circuit_breaker: Optional[CircuitBreaker] = None
     ):
         """
         Initialize TradeClosureListener with dependency injection.
@@ -64,6 +67,7 @@ class TradeClosureListener:
             threshold_optimizer: ThresholdOptimizer for adaptive confidence thresholds
             max_retries: How many times to retry on DB lock
             retry_backoff: Seconds to wait between retries
+            circuit_breaker: CircuitBreaker fed with every closed trade (optional)
         """
         self.storage = storage
         self.risk_manager = risk_manager
@@ -71,6 +75,7 @@ class TradeClosureListener:
         self.threshold_optimizer = threshold_optimizer
         self.max_retries = max_retries
         self.retry_backoff = retry_backoff
+        self.circuit_breaker = circuit_breaker
         
         # Metrics for monitoring
         self.usr_trades_processed = 0
@@ -171,6 +176,10 @@ class TradeClosureListener:
         
         self.risk_manager.record_trade_result(is_win=is_win, pnl=pnl)
         
+        # === STEP 2.5: Incremental CircuitBreaker (PERF-CB-INCREMENTAL-2026-001) ===
+        if self.circuit_breaker is not None:
+            self._feed_circuit_breaker(trade_event)
+        
         # === STEP 3: Check for lockdown activation ===
         if self.risk_manager.is_locked():
             logger.error(
@@ -296,25 +305,11 @@ class TradeClosureListener:
         Returns:
             Tuple (execution_mode: str, instance_id: Optional[str])
         """
-        import json as _json
-
         if not signal_id:
             return ExecutionMode.LIVE.value, None
 
         try:
-            signal = self.storage.get_signal_by_id(signal_id)
-            if not signal:
-                return ExecutionMode.LIVE.value, None
-
-            # Extract strategy_id from signal metadata
-            metadata = signal.get('metadata')
-            if isinstance(metadata, str):
-                try:
-                    metadata = _json.loads(metadata)
-                except (ValueError, TypeError):
-                    metadata = {}
-
-            strategy_id = metadata.get('strategy_id') if isinstance(metadata, dict) else None
+            strategy_id = self._resolve_strategy_id(signal_id)
             if not strategy_id:
                 return ExecutionMode.LIVE.value, None
 
@@ -346,6 +341,43 @@ class TradeClosureListener:
             logger.warning(f"Error resolving shadow context for signal {signal_id}: {e}")
             return ExecutionMode.LIVE.value, None
 
+    def _resolve_strategy_id(self, signal_id: Optional[str]) -> Optional[str]:
+        """strategy_id stored in the metadata of ``signal_id`` (None if unlinked)."""
+        import json as _json
+
+        if not signal_id:
+            return None
+        signal = self.storage.get_signal_by_id(signal_id)
+        if not signal:
+            return None
+        metadata = signal.get('metadata')
+        if isinstance(metadata, str):
+            try:
+                metadata = _json.loads(metadata)
+            except (ValueError, TypeError):
+                metadata = {}
+        return metadata.get('strategy_id') if isinstance(metadata, dict) else None
+
+    def _feed_circuit_breaker(self, trade: BrokerTradeClosedEvent) -> None:
+        """Advance the owning strategy's CircuitBreaker window (non-blocking)."""
+        try:
+            strategy_id = self._resolve_strategy_id(trade.signal_id)
+            if not strategy_id:
+                return
+            capital = getattr(self.risk_manager, 'capital', None)
+            result = self.circuit_breaker.on_trade_closed(
+                strategy_id,
+                trade.profit_loss,
+                capital=capital if isinstance(capital, (int, float)) else None,
+            )
+            if result.get('action') == 'degraded':
+                logger.warning(
+                    f"[TRADE_CLOSED] Strategy {strategy_id} quarantined on ticket {trade.ticket}: "
+                    f"{result.get('reason')}"
+                )
+        except Exception as e:
+            logger.error(f"[CB] Could not feed closed trade {trade.ticket}: {e}")
+
     def _lookup_shadow_instance_id(self, strategy_id: str) -> Optional[str]:
         """Query sys_shadow_instances for the most recent active instance of a strategy.
 
@@ -363,28 +363,9 @@ class AnomaliesMixin(BaseRepository):
         conn = self._get_conn()
         try:
             cursor = conn.cursor()
-            
-            details_json = json.dumps(details or {})
-            reason = (
-                f"Coherence={coherence_score*100:.1f}%, Degradation={performance_degradation*100:.1f}%"
-            )
-            
-            cursor.execute("""
-                INSERT INTO usr_coherence_events
-                (signal_id, symbol, timeframe, strategy, stage, status, incoherence_type, reason, details, connector_type, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                trace_id,
-                symbol,
-                "multi",  # Multi-timeframe detection
-                strategy_id or "SYSTEM",
-                "DRIFT" if status == "INCOHERENT" else "MONITORING",
-                status,
-                f"SHA_DEGRADATION_{int(performance_degradation*100)}PCT" if status == "INCOHERENT" else None,
-                reason,
-                details_json,
-                "AGGREGATED",
-                datetime.now().isoformat(),
+            cursor.execute(_COHERENCE_EVENT_INSERT, _coherence_event_row(
+                symbol, strategy_id, status, coherence_score,
+                performance_degradation, trace_id, details,
             ))
             
             conn.commit()
@@ -399,3 +380,68 @@ class AnomaliesMixin(BaseRepository):
             return False
         finally:
             self._close_conn(conn)
+
+    def register_coherence_events(self, events: List[Dict[str, Any]]) -> int:
+        """
+        Register many coherence events in one transaction.
+
+        Each event carries the keyword arguments of register_coherence_event.
+        Used by CoherenceBatchEngine so a gate cycle costs one write.
+
+        Returns:
+            Number of events registered (0 on failure).
+        """
+        if not events:
+            return 0
+        conn = self._get_conn()
+        try:
+            rows = [
+                _coherence_event_row(
+                    e["symbol"], e.get("strategy_id"), e["status"], e["coherence_score"],
+                    e["performance_degradation"], e["trace_id"], e.get("details"),
+                )
+                for e in events
+            ]
+            conn.executemany(_COHERENCE_EVENT_INSERT, rows)
+            conn.commit()
+            return len(rows)
+        except Exception as e:
+            logger.error(f"[COHERENCE_DB] Error registering coherence events batch: {e}")
+            return 0
+        finally:
+            self._close_conn(conn)
+
+
+_COHERENCE_EVENT_INSERT = """
+    INSERT INTO usr_coherence_events
+    (signal_id, symbol, timeframe, strategy, stage, status, incoherence_type, reason, details, connector_type, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _coherence_event_row(
+    symbol: str,
+    strategy_id: Optional[str],
+    status: str,
+    coherence_score: float,
+    performance_degradation: float,
+    trace_id: str,
+    details: Optional[Dict[str, Any]],
+) -> tuple:
+    """Build the usr_coherence_events row for one coherence event."""
+    reason = (
+        f"Coherence={coherence_score*100:.1f}%, Degradation={performance_degradation*100:.1f}%"
+    )
+    return (
+        trace_id,
+        symbol,
+        "multi",  # Multi-timeframe detection
+        strategy_id or "SYSTEM",
+        "DRIFT" if status == "INCOHERENT" else "MONITORING",
+        status,
+        f"SHA_DEGRADATION_{int(performance_degradation*100)}PCT" if status == "INCOHERENT" else None,
+        reason,
+        json.dumps(details or {}),
+        "AGGREGATED",
+        datetime.now().isoformat(),
+    )
@@ -163,6 +163,50 @@ class ExecutionMixin(BaseRepository):
         finally:
             self._close_conn(conn)
 
+    def get_execution_logs_for_symbols_since(
+        self,
+        symbols: List[str],
+        since_id: int = 0,
+        window_minutes: int = 60,
+        user_id: Optional[str] = None,
+        status_filter: str = "SUCCESS",
+    ) -> List[Dict[str, Any]]:
+        """
+        Bulk, incremental variant of get_execution_shadow_logs_by_symbol_and_window.
+
+        Returns the rows of every requested symbol with id > since_id inside the
+        window, in one query. Used by CoherenceBatchEngine to feed its rolling
+        accumulators once per cycle instead of once per strategy.
+
+        Returns:
+            List of dicts with: id, symbol, slippage_pips, latency_ms, timestamp
+            (ordered by id).
+        """
+        if not symbols:
+            return []
+        conn: sqlite3.Connection = self._get_conn()
+        try:
+            cursor: sqlite3.Cursor = conn.cursor()
+            time_threshold: str = to_utc(datetime.now(timezone.utc) - timedelta(minutes=window_minutes))
+            placeholders = ",".join("?" for _ in symbols)
+            query = f"""
+                SELECT id, symbol, slippage_pips, latency_ms, timestamp
+                FROM usr_execution_logs
+                WHERE symbol IN ({placeholders})
+                    AND status = ?
+                    AND timestamp >= ?
+                    AND id > ?
+            """
+            params: List[Any] = [*symbols, status_filter, time_threshold, int(since_id)]
+            if user_id:
+                query += " AND user_id = ?"
+                params.append(user_id)
+            query += " ORDER BY id ASC"
+            cursor.execute(query, params)
+            return [dict(row) for row in cursor.fetchall()]
+        finally:
+            self._close_conn(conn)
+
     def get_slippage_p90(self, symbol: str, min_records: int = 50) -> Optional[Decimal]:
         """
         Return the 90th-percentile absolute slippage (pips) for a symbol.
@@ -189,6 +233,31 @@ class ExecutionMixin(BaseRepository):
         finally:
             self._close_conn(conn)
 
+    def get_execution_cost_samples(self, symbol: str, limit: int = 500) -> List[Dict[str, float]]:
+        """
+        Return the most recent successful (slippage_pips, latency_ms) pairs for a symbol.
+
+        Feeds the SimulatedExchange cost model calibration (SIM-EXCHANGE-2026-001).
+        """
+        conn: sqlite3.Connection = self._get_conn()
+        try:
+            cursor: sqlite3.Cursor = conn.cursor()
+            cursor.execute(
+                "SELECT slippage_pips, latency_ms FROM usr_execution_logs "
+                "WHERE symbol = ? AND status = 'SUCCESS' "
+                "ORDER BY timestamp DESC LIMIT ?",
+                (symbol, limit),
+            )
+            return [
+                {"slippage_pips": float(row[0]), "latency_ms": float(row[1])}
+                for row in cursor.fetchall()
+            ]
+        except Exception as exc:
+            logger.debug("[ExecutionMixin] get_execution_cost_samples failed for %s: %s", symbol, exc)
+            return []
+        finally:
+            self._close_conn(conn)
+
     # ── Cooldown Tracker (sys_cooldown_tracker) ───────────────────────────────
 
     async def get_active_cooldown(self, signal_id: str) -> Optional[Dict[str, Any]]:
@@ -12,6 +12,7 @@ Rules:
 """
 import logging
 import sqlite3
+from typing import Tuple
 
 from .schema_seeds import (
     _seed_sys_regime_configs,
@@ -21,6 +22,9 @@ from .schema_seeds import (
 
 logger = logging.getLogger(__name__)
 
+# Tables whose writes bump a version in sys_change_tokens (see initialize_schema §21)
+CHANGE_TOKEN_TABLES: Tuple[str, ...] = ("sys_config", "sys_strategies", "sys_signal_ranking")
+
 def initialize_schema(conn: sqlite3.Connection) -> None:
     """
     Create all database tables and indexes if they don't exist.
@@ -579,6 +583,20 @@ def initialize_schema(conn: sqlite3.Connection) -> None:
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_usr_notifications_user_id ON usr_notifications (user_id)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_usr_notifications_read ON usr_notifications (read)")
 
+    # ── 10.1. Notification Dead Letters (PERF-OUTBOUND-DISPATCH-2026-001) ────
+    # Alerts/notifications the outbound dispatcher gave up on after retries.
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS sys_notification_dead_letters (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            channel TEXT NOT NULL,
+            payload TEXT,
+            error TEXT,
+            attempts INTEGER DEFAULT 0,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_sys_notification_dead_letters_channel ON sys_notification_dead_letters (channel)")
+
     # ── 11. Connector Control ────────────────────────────────────────────────
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS usr_connector_settings (
@@ -914,6 +932,56 @@ def initialize_schema(conn: sqlite3.Connection) -> None:
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_sys_shadow_promotion_log_promotion_status ON sys_shadow_promotion_log (promotion_status)")
     cursor.execute("CREATE INDEX IF NOT EXISTS idx_sys_shadow_promotion_log_created_at ON sys_shadow_promotion_log (created_at DESC)")
 
+    # Running 3 Pilares accumulators per SHADOW instance (derived cache of sys_trades).
+    # Writers: TradesMixin.save_sys_trade (incremental), ShadowStorageManager.rebuild_metric_state
+    # Readers: ShadowStorageManager.get_metric_states → ShadowManager evaluation
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS sys_shadow_metric_state (
+            instance_id TEXT PRIMARY KEY,
+            trade_count INTEGER NOT NULL DEFAULT 0,
+            win_count INTEGER NOT NULL DEFAULT 0,
+            loss_count INTEGER NOT NULL DEFAULT 0,
+            gross_profit REAL NOT NULL DEFAULT 0.0,
+            gross_loss REAL NOT NULL DEFAULT 0.0,
+            equity REAL NOT NULL DEFAULT 0.0,
+            equity_mean REAL NOT NULL DEFAULT 0.0,
+            equity_m2 REAL NOT NULL DEFAULT 0.0,
+            peak_equity REAL NOT NULL DEFAULT 0.0,
+            max_drawdown REAL NOT NULL DEFAULT 0.0,
+            loss_streak INTEGER NOT NULL DEFAULT 0,
+            max_loss_streak INTEGER NOT NULL DEFAULT 0,
+            last_close_time TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+    # Any SHADOW write to sys_trades drops the instance's state; save_sys_trade re-writes
+    # it incrementally in the same transaction, every other writer forces a lazy rebuild.
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_sys_trades_shadow_state_insert
+        AFTER INSERT ON sys_trades
+        WHEN NEW.execution_mode = 'SHADOW' AND NEW.instance_id IS NOT NULL
+        BEGIN
+            DELETE FROM sys_shadow_metric_state WHERE instance_id = NEW.instance_id;
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_sys_trades_shadow_state_update
+        AFTER UPDATE ON sys_trades
+        WHEN OLD.execution_mode = 'SHADOW' OR NEW.execution_mode = 'SHADOW'
+        BEGIN
+            DELETE FROM sys_shadow_metric_state
+            WHERE instance_id IN (OLD.instance_id, NEW.instance_id);
+        END
+    """)
+    cursor.execute("""
+        CREATE TRIGGER IF NOT EXISTS trg_sys_trades_shadow_state_delete
+        AFTER DELETE ON sys_trades
+        WHEN OLD.execution_mode = 'SHADOW'
+        BEGIN
+            DELETE FROM sys_shadow_metric_state WHERE instance_id = OLD.instance_id;
+        END
+    """)
+
     # ── 20. Connector Health Monitoring (HU 5.1) ─────────────────────────────
     # Append-only event log for active broker/feed connection health monitoring.
     # Writers: ConnectionHealthMonitor (core_brain/connection_health_monitor.py)
@@ -957,6 +1025,29 @@ def initialize_schema(conn: sqlite3.Connection) -> None:
     # Seed usr_notification_settings
     _seed_usr_notification_settings(cursor)
 
+    # ── 21. Change Tokens (UI-SYNAPSE change detection) ──────────────────────
+    # One version counter per table, bumped by triggers on every write, so pollers
+    # can skip re-reading tables that did not change since their last read.
+    # Writers: triggers only · Readers: SystemMixin.get_change_tokens → synapse publisher
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS sys_change_tokens (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    for table in CHANGE_TOKEN_TABLES:
+        cursor.execute(
+            "INSERT OR IGNORE INTO sys_change_tokens (table_name, version) VALUES (?, 0)", (table,)
+        )
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_change_token_{event.lower()}
+                AFTER {event} ON {table}
+                BEGIN
+                    UPDATE sys_change_tokens SET version = version + 1 WHERE table_name = '{table}';
+                END
+            """)
+
     # ── HU 7.17 — EDGE Evaluation Framework: Per-pair coverage tracking ────────
     # TRACE_ID: EDGE-BKT-717-COVERAGE-TABLE-2026-03-24
     cursor.execute("""
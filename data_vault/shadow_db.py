@@ -15,14 +15,16 @@ import json
 import logging
 import sqlite3
 import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple, Callable, Any
+from typing import Dict, List, Optional, Tuple, Callable, Any, ContextManager, Iterator
 from uuid import uuid4
 
 from models.shadow import (
     ShadowInstance,
     ShadowStatus,
     ShadowMetrics,
+    ShadowMetricState,
     ShadowPerformanceHistory,
     ShadowPromotionLog,
     HealthStatus,
@@ -31,6 +33,56 @@ from models.shadow import (
 
 logger: logging.Logger = logging.getLogger(__name__)
 
+# Bound for "IN (...)" lists, below SQLite's historical 999 host-parameter limit
+_SQLITE_IN_CHUNK = 500
+
+_METRIC_STATE_COLUMNS: Tuple[str, ...] = tuple(ShadowMetricState.__dataclass_fields__)
+
+
+# ─── sys_shadow_metric_state helpers (shared with TradesMixin.save_sys_trade) ───
+
+def load_metric_state(cursor: sqlite3.Cursor, instance_id: str) -> Optional[ShadowMetricState]:
+    """Persisted accumulators for one instance, or None when missing/invalidated."""
+    cursor.execute(
+        "SELECT * FROM sys_shadow_metric_state WHERE instance_id = ?", (instance_id,)
+    )
+    row = cursor.fetchone()
+    return ShadowMetricState.from_db_dict(dict(row)) if row else None
+
+
+def save_metric_state(cursor: sqlite3.Cursor, state: ShadowMetricState) -> None:
+    """Upsert accumulators (caller owns the transaction)."""
+    data = state.to_db_dict()
+    cursor.execute(
+        f"""
+        INSERT OR REPLACE INTO sys_shadow_metric_state
+        ({", ".join(_METRIC_STATE_COLUMNS)}, updated_at)
+        VALUES ({", ".join("?" for _ in _METRIC_STATE_COLUMNS)}, ?)
+        """,
+        (*(data[c] for c in _METRIC_STATE_COLUMNS), datetime.now(timezone.utc).isoformat()),
+    )
+
+
+@contextmanager
+def immediate_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Cursor]:
+    """
+    Read-modify-write on sys_shadow_metric_state under SQLite's RESERVED lock.
+
+    BEGIN IMMEDIATE is taken before the first read, so no other writer can
+    commit between the read and the upsert.  Joins a transaction the caller
+    already has open.
+    """
+    owns_transaction = not conn.in_transaction
+    if owns_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn.cursor()
+        conn.commit()
+    except Exception:
+        if owns_transaction:
+            conn.rollback()
+        raise
+
 
 class ShadowStorageManager:
     """
@@ -56,6 +108,11 @@ class ShadowStorageManager:
         else:
             self._conn_provider = lambda: storage_conn
             self._static_conn = storage_conn
+        # StorageManager.transaction() serialises BEGIN IMMEDIATE on the shared pooled connection
+        transaction = getattr(storage_conn, "transaction", None)
+        self._transaction_provider: Optional[Callable[[], ContextManager[sqlite3.Connection]]] = (
+            transaction if self._static_conn is None and callable(transaction) else None
+        )
 
         conn = self.conn
         conn.row_factory = sqlite3.Row
@@ -116,6 +173,18 @@ class ShadowStorageManager:
         )
         raise last_exc if last_exc else RuntimeError("DB locked after retries")
 
+    @contextmanager
+    def _immediate_transaction(self) -> Iterator[sqlite3.Cursor]:
+        """immediate_transaction() on this manager's connection, serialised by the
+        storage provider's own transaction() when it has one."""
+        if self._transaction_provider is None:
+            with immediate_transaction(self.conn) as cursor:
+                yield cursor
+            return
+        with self._transaction_provider() as conn:
+            conn.row_factory = sqlite3.Row
+            yield conn.cursor()
+
     # ────────────────────────────────────────────────────────────────────────
     # sys_shadow_instances CRUD
     # ────────────────────────────────────────────────────────────────────────
@@ -468,75 +537,79 @@ class ShadowStorageManager:
         return [ShadowInstance.from_db_dict(dict(row)) for row in rows]
 
     def calculate_instance_metrics_from_sys_trades(self, instance_id: str) -> ShadowMetrics:
-        """Calculate 3 Pilares metrics for a SHADOW instance by reading sys_trades.
+        """Calculate 3 Pilares metrics for a SHADOW instance from sys_trades.
 
         This is the LIVE feedback loop: real DEMO trades → metrics → Darwinian selection.
         Called by ShadowManager.evaluate_all_instances() weekly.
 
+        Reads the instance's running accumulators (sys_shadow_metric_state, O(1));
+        they are rebuilt from sys_trades only when missing or invalidated.
+
         Args:
             instance_id: The SHADOW instance to evaluate.
         Returns:
             ShadowMetrics populated from sys_trades data.
         """
-        import statistics as _stats
+        return self.get_metric_states([instance_id])[instance_id].to_metrics()
 
-        cursor: sqlite3.Cursor = self.conn.cursor()
-        cursor.execute(
-            """
-            SELECT profit, close_time FROM sys_trades
-            WHERE instance_id = ? AND execution_mode = 'SHADOW'
-            ORDER BY close_time ASC
-            """,
-            (instance_id,),
-        )
-        rows: List[Any] = cursor.fetchall()
-
-        if not rows:
-            return ShadowMetrics()
-
-        profits: List[Any] = [r["profit"] for r in rows if r["profit"] is not None]
-        if not profits:
-            return ShadowMetrics()
+    def get_metric_states(self, instance_ids: List[str]) -> Dict[str, ShadowMetricState]:
+        """
+        Running accumulators for many instances in one read.
 
-        total: int = len(profits)
-        wins: List[Any] = [p for p in profits if p > 0]
-        losses: List[Any] = [abs(p) for p in profits if p < 0]
+        Instances without persisted state (never evaluated, or invalidated by a
+        direct/out-of-order write to sys_trades) are rebuilt from history.
+        """
+        ids: List[str] = list(dict.fromkeys(instance_ids))
+        states: Dict[str, ShadowMetricState] = {}
+        cursor: sqlite3.Cursor = self.conn.cursor()
+        for start in range(0, len(ids), _SQLITE_IN_CHUNK):
+            chunk = ids[start:start + _SQLITE_IN_CHUNK]
+            cursor.execute(
+                f"SELECT * FROM sys_shadow_metric_state "
+                f"WHERE instance_id IN ({','.join('?' for _ in chunk)})",
+                chunk,
+            )
+            for row in cursor.fetchall():
+                state = ShadowMetricState.from_db_dict(dict(row))
+                states[state.instance_id] = state
+        for instance_id in ids:
+            if instance_id not in states:
+                states[instance_id] = self.rebuild_metric_state(instance_id)
+        return states
+
+    def rebuild_metric_state(self, instance_id: str) -> ShadowMetricState:
+        """
+        Fold the instance's full SHADOW history in close_time order and persist it.
 
-        win_rate: float = len(wins) / total if total > 0 else 0.0
-        profit_factor: float = (
-            sum(wins) / sum(losses) if losses else (1.5 if wins else 0.0)
-        )
+        The history read and the upsert run in one BEGIN IMMEDIATE transaction:
+        a save_sys_trade() committing in between would otherwise be overwritten
+        by a state that never saw its trade.
 
-        # Equity curve CV (consistency metric)
-        cumulative = []
-        running = 0.0
-        for p in profits:
-            running += p
-            cumulative.append(running)
-        mean_equity = _stats.mean(cumulative) if cumulative else 0.0
-        equity_cv = (
-            (_stats.stdev(cumulative) / abs(mean_equity))
-            if len(cumulative) > 1 and mean_equity != 0
-            else 0.0
-        )
+        Args:
+            instance_id: The SHADOW instance to rebuild.
+        Returns:
+            The rebuilt ShadowMetricState.
+        """
+        def _do_rebuild() -> ShadowMetricState:
+            with self._immediate_transaction() as cursor:
+                cursor.execute(
+                    """
+                    SELECT profit, close_time FROM sys_trades
+                    WHERE instance_id = ? AND execution_mode = 'SHADOW'
+                    ORDER BY close_time ASC
+                    """,
+                    (instance_id,),
+                )
+                state = ShadowMetricState(instance_id=instance_id)
+                for row in cursor.fetchall():
+                    if row["profit"] is not None:
+                        close_time = row["close_time"]
+                        state.add(row["profit"], None if close_time is None else str(close_time))
+                save_metric_state(cursor, state)
+            return state
 
-        # Consecutive losses
-        max_consec = 0
-        current_consec = 0
-        for p in profits:
-            if p < 0:
-                current_consec += 1
-                max_consec = max(max_consec, current_consec)
-            else:
-                current_consec = 0
-
-        return ShadowMetrics(
-            total_trades_executed=total,
-            win_rate=win_rate,
-            profit_factor=profit_factor,
-            equity_curve_cv=equity_cv,
-            consecutive_losses_max=max_consec,
-        )
+        # FIX-SHADOW-CONTENTION-001: Retry si DB está locked
+        return self._execute_with_retry(_do_rebuild)
 
     def calculate_instance_metrics_from_shadow_history(
         self, instance_id: str
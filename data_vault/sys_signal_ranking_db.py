@@ -64,6 +64,45 @@ class StrategyRankingMixin(BaseRepository):
         finally:
             self._close_conn(conn)
 
+    def get_coherence_snapshot(self, strategy_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Ranking + best shadow profit factor for many strategies in one query.
+
+        Used by CoherenceBatchEngine so the coherence gate reads the whole LIVE
+        roster at once instead of one ranking / shadow lookup per strategy.
+
+        Returns:
+            {strategy_id: {execution_mode, completed_last_50, profit_factor,
+            shadow_profit_factor}}. Strategies without a ranking row get
+            None for the ranking fields.
+        """
+        if not strategy_ids:
+            return {}
+        conn: sqlite3.Connection = self._get_conn()
+        try:
+            cursor: sqlite3.Cursor = conn.cursor()
+            values = ",".join("(?)" for _ in strategy_ids)
+            cursor.execute(f"""
+                WITH roster(strategy_id) AS (VALUES {values})
+                SELECT r.strategy_id,
+                       sr.execution_mode,
+                       sr.completed_last_50,
+                       sr.profit_factor,
+                       sh.shadow_profit_factor,
+                       sr.strategy_id IS NOT NULL AS has_ranking
+                FROM roster r
+                LEFT JOIN sys_signal_ranking sr ON sr.strategy_id = r.strategy_id
+                LEFT JOIN (
+                    SELECT strategy_id, MAX(profit_factor) AS shadow_profit_factor
+                    FROM sys_shadow_instances
+                    WHERE status NOT IN ('DEAD', 'PROMOTED_TO_REAL')
+                    GROUP BY strategy_id
+                ) sh ON sh.strategy_id = r.strategy_id
+            """, list(strategy_ids))
+            return {row["strategy_id"]: dict(row) for row in cursor.fetchall()}
+        finally:
+            self._close_conn(conn)
+
     def get_strategy_lifecycle_mode(self, strategy_id: str) -> str:
         """
         SSOT reader: consulta sys_strategies.mode para el routing operativo de la factory.
@@ -228,6 +267,57 @@ class StrategyRankingMixin(BaseRepository):
         finally:
             self._close_conn(conn)
 
+    def apply_strategy_transitions(self, transitions: List[Dict[str, Any]]) -> None:
+        """
+        Persist many execution-mode transitions in one transaction.
+
+        Each transition: {strategy_id, old_mode, new_mode, trace_id, reason, metrics}.
+        Equivalent to update_strategy_execution_mode + log_strategy_state_change per
+        strategy, but all-or-nothing: on error nothing is applied and it re-raises.
+        """
+        if not transitions:
+            return
+        now = datetime.now(timezone.utc)
+        now_iso = now.isoformat()
+        conn: sqlite3.Connection = self._get_conn()
+        try:
+            cursor: sqlite3.Cursor = conn.cursor()
+            cursor.executemany("""
+                UPDATE sys_signal_ranking
+                SET execution_mode = ?, trace_id = ?, last_update_utc = ?
+                WHERE strategy_id = ?
+            """, [(t['new_mode'], t['trace_id'], now, t['strategy_id']) for t in transitions])
+            cursor.executemany("""
+                INSERT INTO usr_edge_learning (
+                    timestamp, detection, action_taken, learning, details
+                ) VALUES (?, ?, ?, ?, ?)
+            """, [
+                (
+                    now_iso,
+                    "strategy_mode_change",
+                    f"{t['old_mode']} -> {t['new_mode']}",
+                    t['reason'],
+                    str({
+                        'timestamp': now_iso,
+                        'strategy_id': t['strategy_id'],
+                        'old_mode': t['old_mode'],
+                        'new_mode': t['new_mode'],
+                        'trace_id': t['trace_id'],
+                        'reason': t['reason'],
+                        'metrics': t['metrics'],
+                    }),
+                )
+                for t in transitions
+            ])
+            conn.commit()
+            logger.info(f"Strategy transitions applied: {len(transitions)} in one transaction")
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error applying strategy transitions: {e}")
+            raise
+        finally:
+            self._close_conn(conn)
+
     def get_strategies_by_mode(self, mode: str) -> List[Dict[str, Any]]:
         """Get all strategies with a specific execution mode."""
         conn: sqlite3.Connection = self._get_conn()
@@ -31,6 +31,7 @@ class SystemMixin(BaseRepository):
         sys_signal_ranking    — live ranking scores per strategy.
         sys_market_pulses     — latest market regime snapshot per symbol|tf.
         sys_signals           — generated signal log (legacy name retained for compat).
+        sys_change_tokens     — per-table write counters bumped by triggers (change detection).
 
     ACTIVE (secondary — auditoría de auto-calibración):
         usr_tuning_adjustments — historial de ajustes autónomos generados por EdgeTuner.
@@ -126,6 +127,26 @@ class SystemMixin(BaseRepository):
             # _close_conn() is now a no-op for shared connections
             self._close_conn(conn)
 
+    def get_change_tokens(self) -> Dict[str, int]:
+        """
+        Cheap change tokens for pollers, in one query.
+
+        Tables listed in sys_change_tokens report their trigger-maintained write
+        counter; usr_signal_pipeline is append-only and reports MAX(id).
+        A token that differs from the previous read means the table changed.
+        """
+        conn = self._get_conn()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT table_name, version FROM sys_change_tokens
+                UNION ALL
+                SELECT 'usr_signal_pipeline', IFNULL(MAX(id), 0) FROM usr_signal_pipeline
+            """)
+            return {row[0]: row[1] for row in cursor.fetchall()}
+        finally:
+            self._close_conn(conn)
+
     def get_active_timeframes(self) -> List[str]:
         """Get list of active timeframes from system state"""
         state = self.get_sys_config()
@@ -648,6 +669,22 @@ class SystemMixin(BaseRepository):
             logger.error(f"Error saving notification: {e}")
             return False
 
+    def save_notification_dead_letter(self, channel: str, payload: Any, error: str, attempts: int) -> bool:
+        """
+        Registra un envío que el OutboundDispatcher abandonó tras agotar reintentos.
+        """
+        try:
+            body = payload if isinstance(payload, dict) else getattr(payload, "__dict__", payload)
+            with self.transaction() as conn:
+                conn.execute(
+                    "INSERT INTO sys_notification_dead_letters (channel, payload, error, attempts) VALUES (?, ?, ?, ?)",
+                    (channel, json.dumps(body, default=str), error, int(attempts)),
+                )
+            return True
+        except Exception as e:
+            logger.error(f"Error saving notification dead letter: {e}")
+            return False
+
     def get_user_notifications(self, user_id: str = 'default', unread_only: bool = False, limit: int = 50) -> List[Dict[str, Any]]:
         """
         Recupera notificaciones de un usuario desde la base de datos.
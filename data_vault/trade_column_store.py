@@ -0,0 +1,393 @@
+"""
+TradeColumnStore — In-memory columnar cache of usr_trades / sys_trades.
+=======================================================================
+TRACE_ID: PERF-TRADE-COLUMNS-2026-001
+
+Responsibility:
+  - Hold trade history as NumPy columns (rowid, created_at, close_time,
+    profit, symbol/instance codes) partitioned by (execution_mode, strategy).
+  - Answer performance statistics — win rate, profit factor, Sharpe,
+    drawdown, per-symbol PnL — over rolling windows (last N days, last N
+    trades) with vectorized reductions instead of SQL aggregates.
+
+Architecture:
+  - One store per StorageManager (TradesMixin.trade_columns), loaded lazily
+    on first query, then kept consistent incrementally:
+      * ``conn.total_changes`` + ``PRAGMA data_version`` form a free change
+        token; while it is unchanged no table is touched at all.
+      * On change, ``MAX(rowid)`` (O(log n)) finds appended rows, which are
+        loaded as a delta. Writers (save_trade_result / save_sys_trade) sync
+        right after their commit, so their row is appended immediately.
+      * A ``COUNT(*)`` reconciliation runs when another connection committed
+        or every ``reconcile_interval_s``; any mismatch reloads the table.
+  - Per-mode merged views (time-ordered) are cached until a partition of
+    that mode changes, so repeated API polls cost only the window reduction.
+
+Rule: the DB stays the source of truth — the store never writes, and any
+inconsistency it can observe triggers a reload, never a guess.
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TRADE_TABLES = ("usr_trades", "sys_trades")
+
+# Per-table: column holding the strategy partition key (usr_trades has none)
+_STRATEGY_COLUMN = {"usr_trades": None, "sys_trades": "strategy_id"}
+_INSTANCE_COLUMN = {"usr_trades": None, "sys_trades": "instance_id"}
+
+_INITIAL_CAPACITY = 64
+
+
+def _to_epoch(value: Any) -> float:
+    """DB timestamp (TEXT 'YYYY-MM-DD HH:MM:SS', ISO-8601 or datetime) → UTC epoch seconds; NaN if absent."""
+    if value is None:
+        return np.nan
+    if isinstance(value, datetime):
+        parsed = value
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+        except ValueError:
+            return np.nan
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value) if value is not None else np.nan
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class _Partition:
+    """Growable columns for one (execution_mode, strategy) partition."""
+
+    __slots__ = ("size", "rowid", "created", "closed", "profit", "symbol", "instance", "rows")
+
+    def __init__(self) -> None:
+        self.size = 0
+        self.rowid = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+        self.created = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self.closed = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self.profit = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self.symbol = np.empty(_INITIAL_CAPACITY, dtype=np.int32)
+        self.instance = np.empty(_INITIAL_CAPACITY, dtype=np.int32)
+        self.rows: List[Dict[str, Any]] = []
+
+    def append(self, rowid: int, created: float, closed: float, profit: float,
+               symbol: int, instance: int, row: Dict[str, Any]) -> None:
+        if self.size == len(self.rowid):
+            capacity = len(self.rowid) * 2
+            for name in ("rowid", "created", "closed", "profit", "symbol", "instance"):
+                column = getattr(self, name)
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[: self.size] = column[: self.size]
+                setattr(self, name, grown)
+        i = self.size
+        self.rowid[i] = rowid
+        self.created[i] = created
+        self.closed[i] = closed
+        self.profit[i] = profit
+        self.symbol[i] = symbol
+        self.instance[i] = instance
+        self.rows.append(row)
+        self.size = i + 1
+
+
+class _ModeView:
+    """Concatenation of every partition of one mode, oldest → newest by created_at."""
+
+    __slots__ = ("rowid", "created", "closed", "profit", "symbol", "instance", "strategy", "rows")
+
+    def __init__(self, partitions: Sequence[Tuple[int, _Partition]]) -> None:
+        parts = [(code, p) for code, p in partitions if p.size]
+        def cat(name: str, dtype: Any) -> np.ndarray:
+            if not parts:
+                return np.empty(0, dtype=dtype)
+            return np.concatenate([getattr(p, name)[: p.size] for _, p in parts])
+
+        rowid = cat("rowid", np.int64)
+        created = cat("created", np.float64)
+        strategy = (
+            np.concatenate([np.full(p.size, code, dtype=np.int32) for code, p in parts])
+            if parts else np.empty(0, dtype=np.int32)
+        )
+        rows = [row for _, p in parts for row in p.rows]
+        # Reversed, this is SQLite's "ORDER BY created_at DESC" (NULLs last, ties in
+        # rowid order), so the newest-N windows pick exactly the rows SQL would.
+        order = np.lexsort((-rowid, np.where(np.isnan(created), -np.inf, created)))
+        self.rowid = rowid[order]
+        self.created = created[order]
+        self.closed = cat("closed", np.float64)[order]
+        self.profit = cat("profit", np.float64)[order]
+        self.symbol = cat("symbol", np.int32)[order]
+        self.instance = cat("instance", np.int32)[order]
+        self.strategy = strategy[order]
+        self.rows = [rows[i] for i in order]
+
+
+class _TableState:
+    __slots__ = ("loaded", "high_rowid", "count", "token", "reconciled_at", "partitions", "views")
+
+    def __init__(self) -> None:
+        self.loaded = False
+        self.high_rowid = 0
+        self.count = 0
+        self.token: Optional[Tuple[int, int, int]] = None
+        self.reconciled_at = 0.0
+        self.partitions: Dict[Tuple[str, int], _Partition] = {}
+        self.views: Dict[str, _ModeView] = {}
+
+
+def window_metrics(profit: np.ndarray) -> Dict[str, Any]:
+    """
+    Trade statistics over a chronologically ordered profit column (NaN = open / unknown PnL).
+
+    win_rate counts wins over decided trades (profit != 0), matching the LIVE
+    SQL aggregate; Sharpe is per-trade (mean / sample std, not annualised);
+    max_drawdown is the largest peak-to-trough drop of the cumulative PnL.
+    """
+    pnl = profit[~np.isnan(profit)]
+    wins = pnl > 0
+    losses = pnl < 0
+    n_wins = int(np.count_nonzero(wins))
+    n_losses = int(np.count_nonzero(losses))
+    gross_profit = float(pnl[wins].sum())
+    gross_loss = float(-pnl[losses].sum())
+    equity = np.cumsum(pnl)
+    drawdown = np.maximum.accumulate(np.concatenate(([0.0], equity)))[1:] - equity if len(pnl) else pnl
+    std = float(pnl.std(ddof=1)) if len(pnl) > 1 else 0.0
+    return {
+        "trades": int(len(pnl)),
+        "wins": n_wins,
+        "losses": n_losses,
+        "win_rate": n_wins / (n_wins + n_losses) if n_wins + n_losses else 0.0,
+        "total_profit": float(pnl.sum()),
+        "gross_profit": gross_profit,
+        "gross_loss": gross_loss,
+        "profit_factor": gross_profit / gross_loss if gross_loss > 0 else 0.0,
+        "avg_profit": float(pnl.mean()) if len(pnl) else 0.0,
+        "sharpe": float(pnl.mean()) / std if std > 0 else 0.0,
+        "max_drawdown": float(drawdown.max()) if len(pnl) else 0.0,
+    }
+
+
+class TradeColumnStore:
+    """
+    Columnar, incrementally synced copy of the trade tables of one database.
+
+    Args:
+        reconcile_interval_s: Max seconds between COUNT(*) reconciliations
+                              when only this connection has written.
+    """
+
+    def __init__(self, reconcile_interval_s: float = 60.0) -> None:
+        self.reconcile_interval_s = reconcile_interval_s
+        self._lock = threading.RLock()
+        self._tables: Dict[str, _TableState] = {name: _TableState() for name in TRADE_TABLES}
+        self._codes: Dict[Optional[str], int] = {None: 0}
+        self._names: List[Optional[str]] = [None]
+        self.stats = {"full_loads": 0, "delta_rows": 0}
+
+    # ── Consistency ───────────────────────────────────────────────────────────
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        """Drop cached columns (one table or all); the next query reloads."""
+        with self._lock:
+            for name in ([table] if table else TRADE_TABLES):
+                self._tables[name] = _TableState()
+
+    def sync(self, conn: sqlite3.Connection, table: str) -> None:
+        """Bring ``table`` up to date with the DB (no-op while the change token is unchanged)."""
+        with self._lock:
+            state = self._tables[table]
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            token = (id(conn), conn.total_changes, data_version)
+            if state.loaded and token == state.token:
+                return
+            if not state.loaded:
+                self._full_load(conn, table)
+            else:
+                now = time.monotonic()
+                foreign_commit = state.token is None or token[0] != state.token[0] or token[2] != state.token[2]
+                reconcile = foreign_commit or now - state.reconciled_at >= self.reconcile_interval_s
+                if reconcile:
+                    high, count = conn.execute(f"SELECT COALESCE(MAX(rowid), 0), COUNT(*) FROM {table}").fetchone()
+                else:
+                    high, count = conn.execute(f"SELECT COALESCE(MAX(rowid), 0) FROM {table}").fetchone()[0], None
+                if high < state.high_rowid or (count is not None and count < state.count):
+                    self._full_load(conn, table)
+                elif high > state.high_rowid:
+                    added = self._load_rows(conn, table, state.high_rowid)
+                    if count is not None and state.count != count:
+                        self._full_load(conn, table)  # rows changed below the high-water mark
+                    else:
+                        self.stats["delta_rows"] += added
+                elif count is not None and count != state.count:
+                    self._full_load(conn, table)
+                if reconcile:
+                    state = self._tables[table]
+                    state.reconciled_at = now
+            self._tables[table].token = token
+
+    def _full_load(self, conn: sqlite3.Connection, table: str) -> None:
+        state = self._tables[table] = _TableState()
+        self._load_rows(conn, table, 0)
+        state.loaded = True
+        state.reconciled_at = time.monotonic()
+        self.stats["full_loads"] += 1
+
+    def _load_rows(self, conn: sqlite3.Connection, table: str, after_rowid: int) -> int:
+        state = self._tables[table]
+        cursor = conn.execute(f"SELECT rowid AS _rowid, * FROM {table} WHERE rowid > ? ORDER BY rowid", (after_rowid,))
+        strategy_col = _STRATEGY_COLUMN[table]
+        instance_col = _INSTANCE_COLUMN[table]
+        added = 0
+        touched = set()
+        for record in cursor.fetchall():
+            row = dict(record)
+            rowid = row.pop("_rowid")
+            mode = row.get("execution_mode")
+            key = (mode, self._code(row.get(strategy_col) if strategy_col else None))
+            partition = state.partitions.get(key)
+            if partition is None:
+                partition = state.partitions[key] = _Partition()
+            partition.append(
+                rowid,
+                _to_epoch(row.get("created_at")),
+                _to_epoch(row.get("close_time")),
+                _to_float(row.get("profit")),
+                self._code(row.get("symbol")),
+                self._code(row.get(instance_col) if instance_col else None),
+                row,
+            )
+            touched.add(mode)
+            state.high_rowid = max(state.high_rowid, rowid)
+            added += 1
+        state.count += added
+        for mode in touched:
+            state.views.pop(mode, None)
+        return added
+
+    def _code(self, value: Optional[str]) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._names)
+            self._names.append(value)
+        return code
+
+    # ── Queries ───────────────────────────────────────────────────────────────
+
+    def _view(self, conn: sqlite3.Connection, table: str, execution_mode: str) -> _ModeView:
+        self.sync(conn, table)
+        state = self._tables[table]
+        view = state.views.get(execution_mode)
+        if view is None:
+            view = state.views[execution_mode] = _ModeView(
+                [(code, p) for (mode, code), p in state.partitions.items() if mode == execution_mode]
+            )
+        return view
+
+    def _select(
+        self,
+        view: _ModeView,
+        strategy_id: Optional[str],
+        instance_id: Optional[str],
+        symbol: Optional[str],
+        days: Optional[float],
+        since: Optional[datetime],
+        last_n: Optional[int],
+        require_profit: bool = False,
+    ) -> np.ndarray:
+        """Indices (oldest → newest) of the rows matching every given filter."""
+        mask = np.ones(len(view.rowid), dtype=bool)
+        for value, column in ((strategy_id, view.strategy), (instance_id, view.instance), (symbol, view.symbol)):
+            if value is not None:
+                code = self._codes.get(value)
+                if code is None:
+                    return np.empty(0, dtype=np.int64)
+                mask &= column == code
+        if days is not None:
+            mask &= view.created >= time.time() - days * 86400.0
+        if since is not None:
+            mask &= view.closed >= _to_epoch(since)
+        if require_profit:
+            mask &= ~np.isnan(view.profit)
+        idx = np.flatnonzero(mask)
+        if last_n is not None:
+            idx = idx[max(len(idx) - last_n, 0):]
+        return idx
+
+    def performance(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        execution_mode: str,
+        strategy_id: Optional[str] = None,
+        instance_id: Optional[str] = None,
+        symbol: Optional[str] = None,
+        days: Optional[float] = None,
+        last_n: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Window statistics (see ``window_metrics``) plus ``pnl_by_symbol``.
+
+        ``days`` filters on created_at (like the SQL aggregates); ``last_n``
+        keeps the newest N matching trades.
+        """
+        with self._lock:
+            view = self._view(conn, table, execution_mode)
+            idx = self._select(view, strategy_id, instance_id, symbol, days, None, last_n)
+            profit = view.profit[idx]
+            metrics = window_metrics(profit)
+            metrics["pnl_by_symbol"] = self._pnl_by_symbol(view.symbol[idx], profit)
+            return metrics
+
+    def count(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        execution_mode: str,
+        instance_id: Optional[str] = None,
+        since: Optional[datetime] = None,
+    ) -> int:
+        """Number of trades, optionally of one instance and closed at/after ``since``."""
+        with self._lock:
+            view = self._view(conn, table, execution_mode)
+            return int(len(self._select(view, None, instance_id, None, None, since, None)))
+
+    def recent_rows(
+        self,
+        conn: sqlite3.Connection,
+        table: str,
+        execution_mode: str,
+        limit: int,
+        require_profit: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Newest ``limit`` rows (newest first) as row dicts."""
+        with self._lock:
+            view = self._view(conn, table, execution_mode)
+            idx = self._select(view, None, None, None, None, None, limit, require_profit)
+            return [dict(view.rows[i]) for i in idx[::-1]]
+
+    def _pnl_by_symbol(self, symbol_codes: np.ndarray, profit: np.ndarray) -> Dict[Optional[str], float]:
+        known = ~np.isnan(profit)
+        codes = symbol_codes[known]
+        if not len(codes):
+            return {}
+        totals = np.bincount(codes, weights=profit[known], minlength=int(codes.max()) + 1)
+        present = np.unique(codes)
+        ranked = present[np.argsort(-totals[present], kind="stable")]
+        return {self._names[code]: float(totals[code]) for code in ranked}
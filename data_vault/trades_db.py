@@ -1,13 +1,54 @@
+import json
 import uuid
 import logging
 import sqlite3
 from typing import Dict, List, Optional, Any
 from datetime import date
 from .base_repo import BaseRepository
+from .shadow_db import immediate_transaction, load_metric_state, save_metric_state
+from .trade_column_store import TradeColumnStore
 from models.execution_mode import ExecutionMode, Provider, AccountType
 
 logger = logging.getLogger(__name__)
 
+# get_sys_trades() default page: SHADOW/BACKTEST aggregates cover the newest N trades
+_SYS_TRADES_DEFAULT_LIMIT = 1000
+
+# Bound for "IN (...)" lists, below SQLite's historical 999 host-parameter limit
+_SQLITE_IN_CHUNK = 500
+
+_POSITION_METADATA_COLUMNS = (
+    "ticket", "symbol", "entry_price", "entry_time", "direction", "sl", "tp", "volume",
+    "initial_risk_usd", "entry_regime", "timeframe", "strategy",
+)
+
+_POSITION_METADATA_REPLACE = """
+    REPLACE INTO sys_position_metadata
+    (ticket, symbol, entry_price, entry_time, direction, sl, tp, volume,
+     initial_risk_usd, entry_regime, timeframe, strategy, data)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _decode_position_metadata(row: Any) -> Dict[str, Any]:
+    """sys_position_metadata row → dict, with the JSON `data` column decoded."""
+    metadata = dict(row)
+    if metadata.get("data"):
+        try:
+            metadata["data"] = json.loads(metadata["data"])
+        except (ValueError, TypeError):
+            pass
+    return metadata
+
+
+def _position_metadata_row(ticket: int, merged: Dict[str, Any]) -> tuple:
+    """Merged metadata → REPLACE parameters; non-column keys go to the `data` JSON."""
+    return (
+        ticket,
+        *(merged.get(col) for col in _POSITION_METADATA_COLUMNS[1:]),
+        json.dumps({k: v for k, v in merged.items() if k not in _POSITION_METADATA_COLUMNS}) or None,
+    )
+
 class TradesMixin(BaseRepository):
     """Mixin for Trade-related database operations.
 
@@ -16,8 +57,30 @@ class TradesMixin(BaseRepository):
       to maintain backward compatibility and avoid contaminating metrics with paper usr_trades.
     - StrategyRanker must explicitly call get_usr_trades(execution_mode='SHADOW') to analyze SHADOW usr_trades.
     - save_trade_result() accepts execution_mode, provider, account_type for full audit trail.
+    - Performance aggregates (win rate, profit, per-symbol PnL, get_trade_performance) are
+      served from an in-memory columnar copy of the trade tables (TradeColumnStore),
+      synced incrementally with the DB instead of re-aggregating in SQL on every poll.
     """
 
+    @property
+    def trade_columns(self) -> TradeColumnStore:
+        """Columnar trade cache of this database (created on first use)."""
+        store = self.__dict__.get("_trade_column_store")
+        if store is None:
+            store = self.__dict__["_trade_column_store"] = TradeColumnStore()
+        return store
+
+    def _sync_trade_columns(self, conn: sqlite3.Connection, table: str) -> None:
+        """Append a just-committed trade to the columnar cache, if one is in use."""
+        store = self.__dict__.get("_trade_column_store")
+        if store is None:
+            return
+        try:
+            store.sync(conn, table)
+        except Exception as exc:
+            logger.debug("[TRADES] Column cache sync deferred for %s: %s", table, exc)
+            store.invalidate(table)
+
     def save_trade_result(self, trade_data: Dict[str, Any]) -> None:
         """Save trade result to the appropriate table based on execution_mode.
 
@@ -63,6 +126,7 @@ class TradesMixin(BaseRepository):
                 trade_data.get('account_type', AccountType.default())
             ))
             conn.commit()
+            self._sync_trade_columns(conn, "usr_trades")
         finally:
             self._close_conn(conn)
     
@@ -161,107 +225,92 @@ class TradesMixin(BaseRepository):
             limit: Number of recent usr_trades to retrieve
             execution_mode: Optional filter ('LIVE', 'SHADOW'). If None, defaults to 'LIVE'.
         """
-        conn = self._get_conn()
-        try:
-            cursor = conn.cursor()
-            if execution_mode is None:
-                execution_mode = ExecutionMode.LIVE.value
-            cursor.execute("""
-                SELECT * FROM usr_trades 
-                WHERE profit IS NOT NULL
-                AND execution_mode = ?
-                ORDER BY created_at DESC 
-                LIMIT ?
-            """, (execution_mode, limit))
-            rows = cursor.fetchall()
-            usr_trades = []
-            for row in rows:
-                profit = row[5]
-                if profit is not None:
-                    trade = {
-                        'id': row[0],
-                        'signal_id': row[1],
-                        'symbol': row[2],
-                        'entry_price': row[3],
-                        'exit_price': row[4],
-                        'profit_loss': profit, 
-                        'profit': profit,       
-                        'exit_reason': row[6],
-                        'close_time': row[7],
-                        'created_at': row[8],
-                        'is_win': profit > 0,
-                        'pips': abs(profit) * 100  
-                    }
-                    usr_trades.append(trade)
-            return usr_trades
-        finally:
-            self._close_conn(conn)
+        if execution_mode is None:
+            execution_mode = ExecutionMode.LIVE.value
+        rows = self.trade_columns.recent_rows(
+            self._get_conn(), "usr_trades", execution_mode, limit, require_profit=True
+        )
+        usr_trades = []
+        for row in rows:
+            profit = row['profit']
+            usr_trades.append({
+                'id': row['id'],
+                'signal_id': row['signal_id'],
+                'symbol': row['symbol'],
+                'entry_price': row['entry_price'],
+                'exit_price': row['exit_price'],
+                'profit_loss': profit,
+                'profit': profit,
+                'exit_reason': row['exit_reason'],
+                'close_time': row['close_time'],
+                'created_at': row['created_at'],
+                'is_win': profit > 0,
+                'pips': abs(profit) * 100
+            })
+        return usr_trades
+
+    def get_trade_performance(
+        self,
+        execution_mode: Optional[str] = None,
+        strategy_id: Optional[str] = None,
+        instance_id: Optional[str] = None,
+        symbol: Optional[str] = None,
+        days: Optional[float] = None,
+        last_n: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Rolling-window performance statistics from the columnar trade cache.
+
+        Routing (SPRINT 22): LIVE reads usr_trades, SHADOW/BACKTEST read sys_trades
+        (strategy_id / instance_id filters only apply there).
+
+        Args:
+            execution_mode: 'LIVE' (default), 'SHADOW' or 'BACKTEST'.
+            strategy_id: Optional strategy filter.
+            instance_id: Optional shadow instance filter.
+            symbol: Optional symbol filter.
+            days: Optional lookback on created_at.
+            last_n: Optional window of the newest N trades.
+
+        Returns:
+            Dict with trades, wins, losses, win_rate, total_profit, gross_profit,
+            gross_loss, profit_factor, avg_profit, sharpe, max_drawdown, pnl_by_symbol.
+        """
+        if execution_mode is None:
+            execution_mode = ExecutionMode.LIVE.value
+        table = "sys_trades" if execution_mode in (ExecutionMode.SHADOW.value, 'BACKTEST') else "usr_trades"
+        return self.trade_columns.performance(
+            self._get_conn(), table, execution_mode,
+            strategy_id=strategy_id, instance_id=instance_id, symbol=symbol, days=days, last_n=last_n,
+        )
 
     def get_total_profit(self, days: int = 30, execution_mode: Optional[str] = None) -> float:
         """Get total profit for the last N days, optionally filtered by execution_mode (default: LIVE).
 
-        Routing (SPRINT 22): SHADOW/BACKTEST queries transparently read from sys_trades.
+        Routing (SPRINT 22): SHADOW/BACKTEST queries transparently read from sys_trades
+        (newest get_sys_trades() page, no day window).
 
         Args:
             days: Number of days lookback (default: 30)
             execution_mode: Optional filter ('LIVE', 'SHADOW'). If None, defaults to 'LIVE'.
         """
-        if execution_mode is None:
-            execution_mode = ExecutionMode.LIVE.value
-        # SHADOW/BACKTEST trades live in sys_trades (Capa 0), not usr_trades
         if execution_mode in (ExecutionMode.SHADOW.value, 'BACKTEST'):
-            trades = self.get_sys_trades(execution_mode=execution_mode)
-            return float(sum(t['profit'] or 0.0 for t in trades if t.get('profit') is not None))
-        conn = self._get_conn()
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT COALESCE(SUM(profit), 0)
-                FROM usr_trades
-                WHERE created_at >= datetime('now', '-{} days', 'utc')
-                AND execution_mode = ?
-            """.format(days), (execution_mode,))
-            result = cursor.fetchone()[0]
-            return float(result) if result else 0.0
-        finally:
-            self._close_conn(conn)
+            return self.get_trade_performance(execution_mode, last_n=_SYS_TRADES_DEFAULT_LIMIT)['total_profit']
+        return self.get_trade_performance(execution_mode, days=days)['total_profit']
 
     def get_win_rate(self, days: int = 30, execution_mode: Optional[str] = None) -> float:
         """Get win rate for the last N days, optionally filtered by execution_mode (default: LIVE).
 
-        Routing (SPRINT 22): SHADOW/BACKTEST queries transparently read from sys_trades.
+        Routing (SPRINT 22): SHADOW/BACKTEST queries transparently read from sys_trades
+        (newest get_sys_trades() page, no day window; break-even trades count as non-wins).
 
         Args:
             days: Number of days lookback (default: 30)
             execution_mode: Optional filter ('LIVE', 'SHADOW'). If None, defaults to 'LIVE'.
         """
-        if execution_mode is None:
-            execution_mode = ExecutionMode.LIVE.value
-        # SHADOW/BACKTEST trades live in sys_trades (Capa 0), not usr_trades
         if execution_mode in (ExecutionMode.SHADOW.value, 'BACKTEST'):
-            trades = self.get_sys_trades(execution_mode=execution_mode)
-            profits = [t['profit'] for t in trades if t.get('profit') is not None]
-            total = len(profits)
-            wins = sum(1 for p in profits if p > 0)
-            return wins / total if total > 0 else 0.0
-        conn = self._get_conn()
-        try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT
-                    COUNT(CASE WHEN profit > 0 THEN 1 END) as wins,
-                    COUNT(CASE WHEN profit < 0 THEN 1 END) as losses
-                FROM usr_trades
-                WHERE created_at >= datetime('now', '-{} days', 'utc')
-                AND execution_mode = ?
-            """.format(days), (execution_mode,))
-            row = cursor.fetchone()
-            wins = row[0] if row[0] else 0
-            losses = row[1] if row[1] else 0
-            total_usr_trades = wins + losses
-            return (wins / total_usr_trades) if total_usr_trades > 0 else 0.0
-        finally:
-            self._close_conn(conn)
+            stats = self.get_trade_performance(execution_mode, last_n=_SYS_TRADES_DEFAULT_LIMIT)
+            return stats['wins'] / stats['trades'] if stats['trades'] > 0 else 0.0
+        return self.get_trade_performance(execution_mode, days=days)['win_rate']
 
     def get_profit_by_symbol(self, days: int = 30, execution_mode: Optional[str] = None) -> Dict[str, float]:
         """Get total profit grouped by symbol for the last N days, optionally filtered by execution_mode (default: LIVE).
@@ -270,23 +319,11 @@ class TradesMixin(BaseRepository):
             days: Number of days lookback (default: 30)
             execution_mode: Optional filter ('LIVE', 'SHADOW'). If None, defaults to 'LIVE'.
         """
-        conn = self._get_conn()
-        try:
-            cursor = conn.cursor()
-            if execution_mode is None:
-                execution_mode = ExecutionMode.LIVE.value
-            cursor.execute("""
-                SELECT symbol, SUM(profit) as total_profit
-                FROM usr_trades 
-                WHERE created_at >= datetime('now', '-{} days', 'utc')
-                AND execution_mode = ?
-                GROUP BY symbol
-                ORDER BY total_profit DESC
-            """.format(days), (execution_mode,))
-            rows = cursor.fetchall()
-            return {row[0]: float(row[1]) for row in rows}
-        finally:
-            self._close_conn(conn)
+        if execution_mode is None:
+            execution_mode = ExecutionMode.LIVE.value
+        return self.trade_columns.performance(
+            self._get_conn(), "usr_trades", execution_mode, days=days
+        )['pnl_by_symbol']
 
     def get_all_usr_trades(self, limit: int = 1000, execution_mode: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get all trade results with optional limit, optionally filtered by execution_mode (default: LIVE).
@@ -331,36 +368,50 @@ class TradesMixin(BaseRepository):
                 "LIVE trades must use save_trade_result() → usr_trades, not save_sys_trade()"
             )
         trade_id = trade_data.get('id') or str(uuid.uuid4())
+        instance_id = trade_data.get('instance_id')
+        profit = trade_data.get('profit') or trade_data.get('profit_loss')
         conn = self._get_conn()
         try:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO sys_trades (
-                    id, signal_id, instance_id, account_id, symbol, direction,
-                    entry_price, exit_price, profit, exit_reason,
-                    open_time, close_time, execution_mode, strategy_id, order_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    trade_id,
-                    trade_data.get('signal_id'),
-                    trade_data.get('instance_id'),
-                    trade_data.get('account_id'),
-                    trade_data.get('symbol'),
-                    trade_data.get('direction'),
-                    trade_data.get('entry_price'),
-                    trade_data.get('exit_price'),
-                    trade_data.get('profit') or trade_data.get('profit_loss'),
-                    trade_data.get('exit_reason'),
-                    trade_data.get('open_time'),
-                    trade_data.get('close_time'),
-                    mode,
-                    trade_data.get('strategy_id'),
-                    trade_data.get('order_id'),
-                ),
-            )
-            conn.commit()
+            # State read, INSERT and re-fold commit together: a concurrent
+            # rebuild_metric_state() cannot interleave with them.
+            with immediate_transaction(conn) as cursor:
+                # Running 3 Pilares accumulators: read before the INSERT trigger drops them
+                metric_state = (
+                    load_metric_state(cursor, instance_id)
+                    if mode == ExecutionMode.SHADOW.value and instance_id else None
+                )
+                cursor.execute(
+                    """
+                    INSERT INTO sys_trades (
+                        id, signal_id, instance_id, account_id, symbol, direction,
+                        entry_price, exit_price, profit, exit_reason,
+                        open_time, close_time, execution_mode, strategy_id, order_id
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (
+                        trade_id,
+                        trade_data.get('signal_id'),
+                        instance_id,
+                        trade_data.get('account_id'),
+                        trade_data.get('symbol'),
+                        trade_data.get('direction'),
+                        trade_data.get('entry_price'),
+                        trade_data.get('exit_price'),
+                        profit,
+                        trade_data.get('exit_reason'),
+                        trade_data.get('open_time'),
+                        trade_data.get('close_time'),
+                        mode,
+                        trade_data.get('strategy_id'),
+                        trade_data.get('order_id'),
+                    ),
+                )
+                close_time = trade_data.get('close_time')
+                if metric_state is not None and metric_state.accepts(close_time):
+                    if profit is not None:
+                        metric_state.add(profit, close_time)
+                    save_metric_state(cursor, metric_state)
+            self._sync_trade_columns(conn, "sys_trades")
         finally:
             self._close_conn(conn)
 
@@ -525,14 +576,28 @@ class TradesMixin(BaseRepository):
             row = cursor.fetchone()
             if not row:
                 return None
-            metadata = dict(row)
-            if metadata.get("data"):
-                try:
-                    import json as _json
-                    metadata["data"] = _json.loads(metadata["data"])
-                except (ValueError, TypeError):
-                    pass
-            return metadata
+            return _decode_position_metadata(row)
+        finally:
+            self._close_conn(conn)
+
+    def get_position_metadata_bulk(self, tickets: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get metadata for many tickets in one query. Missing tickets are absent from the result.
+
+        Same row decoding as get_position_metadata(); used by the per-cycle
+        position monitoring snapshot. Trace_ID: POSITION-MONITOR-CONTEXT-2026-001
+        """
+        unique = list(dict.fromkeys(t for t in tickets if t is not None))
+        if not unique:
+            return {}
+        conn = self._get_conn()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name='sys_position_metadata'"
+            )
+            if not cursor.fetchone():
+                return {}
+            return self._select_position_metadata(cursor, unique)
         finally:
             self._close_conn(conn)
 
@@ -541,30 +606,13 @@ class TradesMixin(BaseRepository):
 
         Writes to sys_position_metadata (canonical). Trace_ID: ETI-SRE-CANONICAL-PERSISTENCE-2026-04-14
         """
-        import json as _json
-
         conn = self._get_conn()
         try:
             cursor = conn.cursor()
             existing = self.get_position_metadata(ticket)
             merged = {**(existing or {}), **metadata, "ticket": ticket}
 
-            cursor.execute("""
-                REPLACE INTO sys_position_metadata
-                (ticket, symbol, entry_price, entry_time, direction, sl, tp, volume,
-                 initial_risk_usd, entry_regime, timeframe, strategy, data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                ticket,
-                merged.get("symbol"), merged.get("entry_price"), merged.get("entry_time"),
-                merged.get("direction"), merged.get("sl"), merged.get("tp"), merged.get("volume"),
-                merged.get("initial_risk_usd"), merged.get("entry_regime"),
-                merged.get("timeframe"), merged.get("strategy"),
-                _json.dumps({k: v for k, v in merged.items() if k not in {
-                    "ticket", "symbol", "entry_price", "entry_time", "direction",
-                    "sl", "tp", "volume", "initial_risk_usd", "entry_regime", "timeframe", "strategy"
-                }}) or None,
-            ))
+            cursor.execute(_POSITION_METADATA_REPLACE, _position_metadata_row(ticket, merged))
             conn.commit()
             return True
         except Exception as exc:
@@ -573,6 +621,48 @@ class TradesMixin(BaseRepository):
         finally:
             self._close_conn(conn)
 
+    def update_position_metadata_bulk(self, updates: Dict[int, Dict[str, Any]]) -> int:
+        """Merge and save metadata for many tickets in a single transaction.
+
+        Each entry merges with the stored row exactly like update_position_metadata().
+        All-or-nothing: returns the number of rows written, or 0 on failure.
+        Trace_ID: POSITION-MONITOR-CONTEXT-2026-001
+        """
+        if not updates:
+            return 0
+        conn = self._get_conn()
+        try:
+            cursor = conn.cursor()
+            existing = self._select_position_metadata(cursor, list(updates))
+            rows = [
+                _position_metadata_row(ticket, {**existing.get(ticket, {}), **metadata, "ticket": ticket})
+                for ticket, metadata in updates.items()
+            ]
+            cursor.executemany(_POSITION_METADATA_REPLACE, rows)
+            conn.commit()
+            return len(rows)
+        except Exception as exc:
+            conn.rollback()
+            logger.error("Failed to save position metadata batch (%d tickets): %s",
+                         len(updates), exc, exc_info=True)
+            return 0
+        finally:
+            self._close_conn(conn)
+
+    @staticmethod
+    def _select_position_metadata(cursor: Any, tickets: List[int]) -> Dict[int, Dict[str, Any]]:
+        result: Dict[int, Dict[str, Any]] = {}
+        for start in range(0, len(tickets), _SQLITE_IN_CHUNK):
+            chunk = tickets[start:start + _SQLITE_IN_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT * FROM sys_position_metadata WHERE ticket IN ({placeholders})", chunk
+            )
+            for row in cursor.fetchall():
+                metadata = _decode_position_metadata(row)
+                result[metadata["ticket"]] = metadata
+        return result
+
     def rollback_position_modification(self, ticket: int) -> bool:
         """No-op: metadata is preserved even if MT5 modification fails."""
         logger.debug("[ROLLBACK] Position %s — metadata preserved (no-op)", ticket)
@@ -77,6 +77,95 @@ class ShadowMetrics:
         return cls(**{k: v for k, v in data.items() if hasattr(cls, k)})
 
 
+@dataclass
+class ShadowMetricState:
+    """
+    Running accumulators behind ShadowMetrics for one instance (sys_shadow_metric_state).
+
+    Folded one closed trade at a time, in close_time order, so the 3 Pilares read
+    O(1) state instead of re-scanning sys_trades on every evaluation.
+    Equity dispersion uses Welford's online mean/variance over the cumulative curve.
+    """
+    instance_id: str = ""
+    trade_count: int = 0
+    win_count: int = 0
+    loss_count: int = 0
+    gross_profit: float = 0.0
+    gross_loss: float = 0.0                 # Absolute sum of losing trades
+    equity: float = 0.0                     # Cumulative PnL
+    equity_mean: float = 0.0                # Welford running mean of equity
+    equity_m2: float = 0.0                  # Welford sum of squared deviations
+    peak_equity: float = 0.0
+    max_drawdown: float = 0.0               # Absolute, from running peak
+    loss_streak: int = 0
+    max_loss_streak: int = 0
+    last_close_time: Optional[str] = None
+
+    def accepts(self, close_time: Any) -> bool:
+        """True when a trade closing at `close_time` can be appended without re-sorting."""
+        if close_time is None:
+            return self.last_close_time is None
+        if not isinstance(close_time, str):
+            return False
+        return self.last_close_time is None or close_time >= self.last_close_time
+
+    def add(self, profit: float, close_time: Optional[str] = None) -> None:
+        """Fold one closed trade into the accumulators."""
+        self.trade_count += 1
+        if profit > 0:
+            self.win_count += 1
+            self.gross_profit += profit
+        elif profit < 0:
+            self.loss_count += 1
+            self.gross_loss += abs(profit)
+
+        self.equity += profit
+        delta = self.equity - self.equity_mean
+        self.equity_mean += delta / self.trade_count
+        self.equity_m2 += delta * (self.equity - self.equity_mean)
+
+        self.peak_equity = max(self.peak_equity, self.equity)
+        self.max_drawdown = max(self.max_drawdown, self.peak_equity - self.equity)
+
+        self.loss_streak = self.loss_streak + 1 if profit < 0 else 0
+        self.max_loss_streak = max(self.max_loss_streak, self.loss_streak)
+
+        if close_time is not None:
+            self.last_close_time = close_time
+
+    def to_metrics(self) -> ShadowMetrics:
+        """
+        Same formulas as the full sys_trades scan.
+
+        max_drawdown_pct stays unset: trades carry no account-equity base to express
+        the absolute drawdown as a percentage, and Pilar 2 must not change verdicts.
+        """
+        if self.trade_count == 0:
+            return ShadowMetrics()
+        profit_factor = (
+            self.gross_profit / self.gross_loss if self.loss_count
+            else (1.5 if self.win_count else 0.0)
+        )
+        equity_cv = 0.0
+        if self.trade_count > 1 and self.equity_mean != 0:
+            stdev = (self.equity_m2 / (self.trade_count - 1)) ** 0.5
+            equity_cv = stdev / abs(self.equity_mean)
+        return ShadowMetrics(
+            total_trades_executed=self.trade_count,
+            win_rate=self.win_count / self.trade_count,
+            profit_factor=profit_factor,
+            equity_curve_cv=equity_cv,
+            consecutive_losses_max=self.max_loss_streak,
+        )
+
+    def to_db_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_db_dict(cls, data: Dict[str, Any]) -> "ShadowMetricState":
+        return cls(**{k: data[k] for k in cls.__dataclass_fields__ if k in data})
+
+
 def _parse_parameter_overrides(raw: str) -> Dict[str, Any]:
     """
     Safely deserialize parameter_overrides from DB storage.
@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+End-to-end cycle benchmark: MainOrchestrator.run_single_cycle() driven by the
+deterministic ReplayDataProvider against a temporary SQLite DB and the
+PaperConnector (SimulatedExchange). No network, no broker, no API server.
+
+The stack is wired as in start.py (StorageManager → DataProviderManager →
+ScannerEngine → OrderExecutor → PositionManager → MainOrchestrator → sensors →
+StrategyEngineFactory → SignalFactory); only the data provider and the
+execution venue are swapped for the replay/paper pair. Each cycle advances
+the virtual clock by ``--bars-per-cycle`` base bars.
+
+Reports:
+  - latency p50/p95/p99 per cycle phase (pre, scan, econ, signal_filter, execute)
+  - hot paths: ScannerEngine.execute_scan, SignalFactory.generate_signal,
+    PositionManager.monitor_usr_positions
+  - cycles/sec, DB write statements per cycle
+  - allocations (tracemalloc peak / net retained per cycle) in a separate pass,
+    so tracing overhead never pollutes the latency numbers
+
+Same arguments + same seed → same replayed market; the JSON output records
+the git commit so runs from different commits can be diffed directly.
+
+Usage:
+    python scripts/benchmark_cycle.py [--cycles 50] [--warmup 3]
+        [--symbols EURUSD,GBPUSD,USDJPY] [--seed 42] [--alloc-cycles 5]
+        [--json results.json]
+
+TRACE_ID: PERF-BENCH-CYCLE-2026-001
+"""
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+os.environ.setdefault("PYTEST_CURRENT_TEST", "benchmark_cycle")  # core_brain: skip API app bootstrap
+
+from data_vault.storage import StorageManager  # noqa: E402
+from connectors.paper_connector import PaperConnector  # noqa: E402
+from connectors.replay_data_provider import REPLAY_PROVIDER_METADATA, ReplayDataProvider  # noqa: E402
+from connectors.sim_exchange import SimulatedExchange  # noqa: E402
+from core_brain.connectivity_orchestrator import ConnectivityOrchestrator  # noqa: E402
+from core_brain.coherence_monitor import CoherenceMonitor  # noqa: E402
+from core_brain.confluence import MultiTimeframeConfluenceAnalyzer  # noqa: E402
+from core_brain.data_provider_manager import DataProviderManager, ProviderConfig  # noqa: E402
+from core_brain.edge_tuner import EdgeTuner  # noqa: E402
+from core_brain.executor import OrderExecutor  # noqa: E402
+from core_brain.instrument_manager import InstrumentManager  # noqa: E402
+from core_brain.main_orchestrator import MainOrchestrator  # noqa: E402
+from core_brain.multi_timeframe_limiter import MultiTimeframeLimiter  # noqa: E402
+from core_brain.orchestrators import _cycle_exec, _cycle_scan, _cycle_trade  # noqa: E402
+from core_brain.position_manager import PositionManager  # noqa: E402
+from core_brain.position_size_monitor import PositionSizeMonitor  # noqa: E402
+from core_brain.regime import RegimeClassifier  # noqa: E402
+from core_brain.risk_manager import RiskManager  # noqa: E402
+from core_brain.scanner import ScannerEngine  # noqa: E402
+from core_brain.services.strategy_engine_factory import StrategyEngineFactory  # noqa: E402
+from core_brain.signal_expiration_manager import SignalExpirationManager  # noqa: E402
+from core_brain.signal_factory import SignalFactory  # noqa: E402
+from core_brain.strategies.trifecta_logic import TrifectaAnalyzer  # noqa: E402
+from core_brain.strategy_gatekeeper import StrategyGatekeeper  # noqa: E402
+from core_brain.trade_closure_listener import TradeClosureListener  # noqa: E402
+from models.signal import ConnectorType  # noqa: E402
+
+PHASES: List[Tuple[Any, str, str]] = [
+    (_cycle_scan, "run_pre_phase", "phase.pre"),
+    (_cycle_scan, "run_scan_phase", "phase.scan"),
+    (_cycle_exec, "run_econ_phase", "phase.econ"),
+    (_cycle_exec, "run_signal_filter", "phase.signal_filter"),
+    (_cycle_trade, "run_execute_phase", "phase.execute"),
+]
+HOT_PATHS: List[Tuple[Any, str, str]] = [
+    (ScannerEngine, "execute_scan", "hot.ScannerEngine.execute_scan"),
+    (SignalFactory, "generate_signal", "hot.SignalFactory.generate_signal"),
+    (PositionManager, "monitor_usr_positions", "hot.PositionManager.monitor_usr_positions"),
+]
+_WRITE_VERBS = ("INSERT", "UPDATE", "DELETE", "REPLACE")
+
+
+# ── Instrumentation ───────────────────────────────────────────────────────────
+
+class Probe:
+    """Wraps functions in place and records wall-time samples per label."""
+
+    def __init__(self) -> None:
+        self.samples: Dict[str, List[float]] = {}
+        self._restore: List[Tuple[Any, str, Any]] = []
+        self.recording = False
+
+    def wrap(self, owner: Any, attr: str, label: str) -> None:
+        original = owner.__dict__[attr]
+        samples = self.samples.setdefault(label, [])
+
+        if asyncio.iscoroutinefunction(original):
+            @functools.wraps(original)
+            async def timed(*args: Any, **kwargs: Any) -> Any:
+                t0 = time.perf_counter()
+                try:
+                    return await original(*args, **kwargs)
+                finally:
+                    if self.recording:
+                        samples.append(time.perf_counter() - t0)
+        else:
+            @functools.wraps(original)
+            def timed(*args: Any, **kwargs: Any) -> Any:
+                t0 = time.perf_counter()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    if self.recording:
+                        samples.append(time.perf_counter() - t0)
+
+        setattr(owner, attr, timed)
+        self._restore.append((owner, attr, original))
+
+    def restore(self) -> None:
+        for owner, attr, original in reversed(self._restore):
+            setattr(owner, attr, original)
+        self._restore.clear()
+
+
+class WriteCounter:
+    """Counts write statements on the shared SQLite connection (sqlite3 trace callback)."""
+
+    def __init__(self, storage: StorageManager) -> None:
+        self.writes = 0
+        self._conn = storage._get_conn()
+        self._conn.set_trace_callback(self._on_statement)
+
+    def _on_statement(self, sql: str) -> None:
+        if sql.lstrip()[:7].upper().startswith(_WRITE_VERBS):
+            self.writes += 1
+
+    def close(self) -> None:
+        self._conn.set_trace_callback(None)
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    pct = lambda p: ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1e3
+    return {
+        "n": len(ordered),
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99),
+        "mean_ms": statistics.fmean(ordered) * 1e3,
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent.parent,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+# ── Stack wiring (mirrors start.py) ───────────────────────────────────────────
+
+def install_replay_provider(manager: DataProviderManager, provider: ReplayDataProvider) -> None:
+    """Make the replay provider the only active data source of ``manager`` (in memory only)."""
+    manager.provider_metadata["replay"] = dict(REPLAY_PROVIDER_METADATA)
+    manager.providers = {
+        "replay": ProviderConfig(name="replay", enabled=True, priority=REPLAY_PROVIDER_METADATA["priority"],
+                                 is_system=True),
+    }
+    manager.provider_instances.clear()
+    manager.register_provider_instance("replay", provider)
+    manager._selected_provider = provider
+    manager._selected_provider_name = "replay"
+    manager._provider_selection_initialized = True
+
+
+def _seed_config(storage: StorageManager) -> None:
+    """
+    Same risk/backtest defaults start.py seeds on a fresh DB. The CPU guardrail
+    is disabled: the benchmark saturates the host on purpose, and a vetoed scan
+    would make runs incomparable.
+    """
+    storage.update_sys_config({
+        "risk_settings": {"max_consecutive_losses": 3, "max_account_risk_pct": 5.0, "max_r_per_trade": 2.0},
+        "dynamic_params": {"risk_per_trade": 0.005, "max_consecutive_losses": 3, "pilar3_min_trades": 5,
+                           "adx": None, "cpu_throttle_threshold": 101, "cpu_veto_threshold": 101},
+        "backtest_config": {"cooldown_hours": 1, "min_trades_per_cluster": 15, "bars_per_window": 120,
+                            "bars_fetch_initial": 500, "promotion_min_score": 0.75},
+    })
+
+
+def build_stack(db_path: str, symbols: List[str], seed: int, bars: int) -> Dict[str, Any]:
+    storage = StorageManager(db_path=db_path)
+    _seed_config(storage)
+    dynamic_params = storage.get_dynamic_params()
+    global_config = storage.get_sys_config().get("global_config") or {}
+
+    exchange = SimulatedExchange()
+    replay = ReplayDataProvider.synthetic(symbols, bars=bars, seed=seed, exchange=exchange)
+    instrument_manager = InstrumentManager(storage=storage)
+    paper = PaperConnector(instrument_manager=instrument_manager, exchange=exchange)
+    paper.is_connected = True
+
+    connectivity = ConnectivityOrchestrator()
+    connectivity.storage = storage
+    connectivity.connectors = {paper.provider_id: paper}
+    connectivity.supports_info = {paper.provider_id: {"data": False, "exec": True}}
+
+    provider_manager = DataProviderManager(storage=storage)
+    install_replay_provider(provider_manager, replay)
+
+    risk_manager = RiskManager(
+        storage=storage, initial_capital=10_000.0, instrument_manager=instrument_manager,
+        monitor=PositionSizeMonitor(max_consecutive_failures=3, circuit_breaker_timeout=300),
+    )
+    scanner = ScannerEngine(
+        assets=symbols, data_provider=provider_manager, config_data=global_config,
+        scan_mode="STANDARD", storage=storage,
+    )
+    executor = OrderExecutor(
+        risk_manager=risk_manager,
+        storage=storage,
+        multi_tf_limiter=MultiTimeframeLimiter(storage=storage, config=dynamic_params, connector=paper),
+        connectors={ConnectorType.PAPER: paper},
+    )
+    regime_classifier = RegimeClassifier(storage=storage)
+    position_manager = PositionManager(
+        storage=storage, connector=paper, regime_classifier=regime_classifier,
+        config=dynamic_params.get("position_management", {}),
+    )
+    gatekeeper = StrategyGatekeeper(storage=storage)
+    orch = MainOrchestrator(
+        scanner=scanner,
+        signal_factory=None,
+        risk_manager=risk_manager,
+        executor=executor,
+        storage=storage,
+        position_manager=position_manager,
+        trade_closure_listener=TradeClosureListener(
+            storage=storage, risk_manager=risk_manager, edge_tuner=EdgeTuner(storage=storage)
+        ),
+        coherence_monitor=CoherenceMonitor(storage=storage),
+        expiration_manager=SignalExpirationManager(storage=storage),
+        regime_classifier=regime_classifier,
+        strategy_gatekeeper=gatekeeper,
+    )
+    if orch.backtest_orchestrator is not None:
+        install_replay_provider(orch.backtest_orchestrator.dpm, replay)
+    sensors = orch.initialize_sensors()
+    engines = StrategyEngineFactory(
+        storage=storage, config=dynamic_params, available_sensors=sensors, user_id=storage.user_id,
+    ).instantiate_all_sys_strategies()
+    gatekeeper.sync_from_strategy_specs(storage.get_all_sys_strategies())
+    orch.set_signal_factory(SignalFactory(
+        storage_manager=storage,
+        strategy_engines=engines,
+        confluence_analyzer=MultiTimeframeConfluenceAnalyzer(storage=storage),
+        trifecta_analyzer=TrifectaAnalyzer(storage=storage, config_data=global_config, auto_enable_tfs=True),
+        instrument_manager=instrument_manager,
+    ))
+    return {"storage": storage, "replay": replay, "orch": orch, "engines": engines}
+
+
+# ── Benchmark ─────────────────────────────────────────────────────────────────
+
+async def _run_cycles(orch: MainOrchestrator, replay: ReplayDataProvider, n: int, bars_per_cycle: int,
+                      on_cycle: Callable[[float], None]) -> None:
+    for _ in range(n):
+        replay.advance(bars_per_cycle)
+        orch.scanner.last_scan_time.clear()  # every replayed bar rescans every symbol/timeframe
+        t0 = time.perf_counter()
+        await orch.run_single_cycle()
+        on_cycle(time.perf_counter() - t0)
+
+
+async def run_benchmark(args: argparse.Namespace, db_path: str) -> Dict[str, Any]:
+    symbols = [s.strip().upper() for s in args.symbols.split(",") if s.strip()]
+    total_cycles = args.warmup + args.cycles + args.alloc_cycles
+    bars = 600 + total_cycles * args.bars_per_cycle
+    stack = build_stack(db_path, symbols, args.seed, bars)
+    orch, replay, storage = stack["orch"], stack["replay"], stack["storage"]
+
+    probe = Probe()
+    for owner, attr, label in PHASES + HOT_PATHS:
+        probe.wrap(owner, attr, label)
+    writes = WriteCounter(storage)
+    cycle_times: List[float] = []
+    try:
+        await _run_cycles(orch, replay, args.warmup, args.bars_per_cycle, lambda _: None)
+
+        probe.recording = True
+        writes.writes = 0
+        await _run_cycles(orch, replay, args.cycles, args.bars_per_cycle, cycle_times.append)
+        probe.recording = False
+        db_writes = writes.writes
+
+        alloc_peaks, alloc_net = [], []
+        if args.alloc_cycles:
+            tracemalloc.start()
+
+            def _alloc_sample(_: float) -> None:
+                current, peak = tracemalloc.get_traced_memory()
+                alloc_peaks.append(peak)
+                alloc_net.append(current)
+                tracemalloc.reset_peak()
+
+            baseline = tracemalloc.get_traced_memory()[0]
+            await _run_cycles(orch, replay, args.alloc_cycles, args.bars_per_cycle, _alloc_sample)
+            tracemalloc.stop()
+            alloc_net = [b - a for a, b in zip([baseline] + alloc_net[:-1], alloc_net)]
+    finally:
+        writes.close()
+        probe.restore()
+
+    measured = sum(cycle_times)
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "cycles": args.cycles, "warmup": args.warmup, "symbols": symbols, "seed": args.seed,
+            "bars_per_cycle": args.bars_per_cycle, "alloc_cycles": args.alloc_cycles,
+            "strategies": len(stack["engines"]),
+        },
+        "cycles_per_sec": args.cycles / measured if measured else 0.0,
+        "cycle": _percentiles(cycle_times) if cycle_times else {},
+        "timings": {label: _percentiles(s) for label, s in probe.samples.items() if s},
+        "db_writes_per_cycle": db_writes / args.cycles if args.cycles else 0.0,
+        "alloc_peak_kib": statistics.fmean(alloc_peaks) / 1024 if alloc_peaks else None,
+        "alloc_net_kib_per_cycle": statistics.fmean(alloc_net) / 1024 if alloc_net else None,
+        "replay": dict(replay.stats),
+        "orchestrator": {"errors": orch.stats.errors_count, "signals_processed": orch.stats.usr_signals_processed},
+    }
+
+
+def _print_report(result: Dict[str, Any]) -> None:
+    params = result["params"]
+    print(f"MainOrchestrator cycle benchmark @ {result['commit']} (python {result['python']})")
+    print(f"  symbols={','.join(params['symbols'])} strategies={params['strategies']} "
+          f"cycles={params['cycles']} seed={params['seed']}")
+    rows = [("cycle", result["cycle"])] + sorted(result["timings"].items())
+    for label, t in rows:
+        if not t:
+            continue
+        print(f"  {label:<44} n={t['n']:<5} p50={t['p50_ms']:9.2f}ms  p95={t['p95_ms']:9.2f}ms  "
+              f"p99={t['p99_ms']:9.2f}ms  mean={t['mean_ms']:9.2f}ms")
+    print(f"  throughput                                   {result['cycles_per_sec']:.2f} cycles/s")
+    print(f"  db writes                                    {result['db_writes_per_cycle']:.1f} statements/cycle")
+    if result["alloc_peak_kib"] is not None:
+        print(f"  allocations (tracemalloc)                    peak={result['alloc_peak_kib']:,.0f} KiB  "
+              f"net={result['alloc_net_kib_per_cycle']:+,.1f} KiB/cycle")
+    print(f"  orchestrator errors                          {result['orchestrator']['errors']}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cycles", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--alloc-cycles", type=int, default=5)
+    parser.add_argument("--symbols", default="EURUSD,GBPUSD,USDJPY")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--bars-per-cycle", type=int, default=1)
+    parser.add_argument("--json", help="Write the full result as JSON to this path")
+    parser.add_argument("--log-level", default="ERROR")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=getattr(logging, args.log_level.upper(), logging.ERROR))
+    with tempfile.TemporaryDirectory(prefix="aethelgard_bench_") as tmp:
+        result = asyncio.run(run_benchmark(args, os.path.join(tmp, "bench.db")))
+
+    _print_report(result)
+    if args.json:
+        Path(args.json).write_text(json.dumps(result, indent=2, sort_keys=True))
+        print(f"  JSON written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark: LocalSocketGateway (Unix socket, scanner in its own process) vs the
+SQLite path used today for cross-process scanner state (sys_market_pulse).
+
+Measures, per backend:
+  - publish → visible to the reader (round-trip latency)
+  - full heatmap read latency
+  - publish throughput
+
+Usage:
+    python scripts/benchmark_process_gateway.py [--iterations 2000] [--cells 50]
+
+TRACE_ID: ARCH-IPC-LOCAL-2026-001
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core_brain.infrastructure import (  # noqa: E402
+    LocalSocketGateway,
+    ScannerProcessSupervisor,
+    ScanStateBroker,
+    run_scanner_broker,
+)
+from data_vault.storage import StorageManager  # noqa: E402
+
+
+async def _idle(broker: ScanStateBroker) -> None:
+    await asyncio.Event().wait()
+
+
+def _summary(name: str, samples: List[float]) -> str:
+    ordered = sorted(samples)
+    pct = lambda p: ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1e6
+    return (f"  {name:<28} p50={pct(0.50):9.1f}µs  p95={pct(0.95):9.1f}µs  "
+            f"p99={pct(0.99):9.1f}µs  mean={statistics.fmean(ordered) * 1e6:9.1f}µs")
+
+
+def _state(i: int, cells: int) -> Dict:
+    return {"symbol": f"SYM{i % cells}", "timeframe": "M5", "regime": "TREND",
+            "metrics": {"adx": 25.0 + i % 10}, "timestamp": f"2026-01-01T00:00:{i % 60:02d}"}
+
+
+def bench_database(iterations: int, cells: int, db_path: str) -> None:
+    storage = StorageManager(db_path=db_path)
+    for i in range(cells):
+        storage.log_sys_market_pulse(_state(i, cells))
+
+    publish, read = [], []
+    for i in range(iterations):
+        state = _state(i, cells)
+        t0 = time.perf_counter()
+        storage.log_sys_market_pulse(state)
+        publish.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        storage.get_latest_heatmap_state()
+        read.append(time.perf_counter() - t0)
+
+    print("DATABASE (sys_market_pulse)")
+    print(_summary("publish (write)", publish))
+    print(_summary("heatmap read", read))
+    print(f"  throughput                   {iterations / sum(publish):,.0f} publishes/s")
+
+
+async def bench_local_ipc(iterations: int, cells: int, socket_path: str) -> None:
+    supervisor = ScannerProcessSupervisor(run_scanner_broker, args=(socket_path, _idle))
+    supervisor.start()
+    gateway = LocalSocketGateway(socket_path)
+    await gateway.start()
+    try:
+        if not await gateway.wait_ready(timeout=30):
+            raise RuntimeError("broker process did not come up")
+        for i in range(cells):
+            await gateway.publish_scan_result(f"SYM{i}", "M5", _state(i, cells))
+
+        round_trip, read = [], []
+        for i in range(iterations):
+            state = _state(i, cells)
+            state["scan_time"] = i + 1
+            key = f"{state['symbol']}|M5"
+            t0 = time.perf_counter()
+            await gateway.publish_scan_result(state["symbol"], "M5", state)
+            while gateway.cells.get(key, {}).get("scan_time") != i + 1:
+                await asyncio.sleep(0)
+            round_trip.append(time.perf_counter() - t0)
+
+            t0 = time.perf_counter()
+            await gateway.get_market_heatmap_state()
+            read.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        for i in range(iterations):
+            await gateway.publish_scan_result(f"SYM{i % cells}", "M5", {"regime": "RANGE", "scan_time": -i})
+        last = f"SYM{(iterations - 1) % cells}|M5"
+        while gateway.cells.get(last, {}).get("scan_time") != -(iterations - 1):
+            await asyncio.sleep(0)
+        elapsed = time.perf_counter() - t0
+
+        print("LOCAL IPC (Unix socket, scanner process)")
+        print(_summary("publish → mirrored", round_trip))
+        print(_summary("heatmap read", read))
+        print(f"  throughput                   {iterations / elapsed:,.0f} publishes/s")
+    finally:
+        await gateway.close()
+        supervisor.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--cells", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"iterations={args.iterations} cells={args.cells}\n")
+        bench_database(args.iterations, args.cells, os.path.join(tmp, "bench.db"))
+        print()
+        asyncio.run(bench_local_ipc(args.iterations, args.cells, os.path.join(tmp, "bench.sock")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-signal symbol metadata — string work on every call (legacy)
+vs interned SymbolRegistry records.
+
+Measures, per signal, the metadata a signal needs before sizing: taxonomy,
+asset class, instrument category, base/quote currencies and pip size (which
+the legacy path resolves through connector.get_symbol_info()).
+
+Usage:
+    python scripts/benchmark_symbol_registry.py [--signals 20000] [--broker-latency-us 50]
+
+TRACE_ID: PERF-SYMBOL-REGISTRY-2026-001
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core_brain.instrument_manager import InstrumentManager  # noqa: E402
+from core_brain.symbol_registry import SymbolRegistry  # noqa: E402
+from core_brain.symbol_taxonomy_engine import SymbolTaxonomy  # noqa: E402
+from data_vault.default_instruments import DEFAULT_INSTRUMENTS_CONFIG  # noqa: E402
+from utils.market_ops import calculate_pip_size, classify_asset_type  # noqa: E402
+
+SYMBOLS = [
+    "EURUSD", "GBPUSD", "USDJPY", "AUDUSD", "USDCAD", "EURGBP", "EURJPY", "GBPJPY",
+    "XAUUSD", "XAGUSD", "BTCUSD", "ETHUSD", "US30", "NAS100", "SPX500", "GER40",
+    "EURUSD=X", "GBPUSD=X", "USDJPY=X", "eur/usd",
+]
+
+
+class _Broker:
+    """Stands in for a connector; each spec lookup costs a fixed round-trip."""
+
+    def __init__(self, latency_s: float) -> None:
+        self.latency_s = latency_s
+
+    def get_symbol_info(self, symbol: str) -> SimpleNamespace:
+        deadline = time.perf_counter() + self.latency_s
+        while time.perf_counter() < deadline:
+            pass
+        jpy = "JPY" in symbol.upper()
+        return SimpleNamespace(digits=3 if jpy else 5, point=0.001 if jpy else 0.00001,
+                               trade_contract_size=100000, volume_min=0.01, volume_max=100.0, volume_step=0.01)
+
+
+def _legacy(symbol: str, im: InstrumentManager, broker: _Broker) -> tuple:
+    clean = symbol.upper().replace("=X", "").replace("/", "")
+    currencies = [clean[:3], clean[3:6]] if len(clean) in (6, 7) else []
+    return (
+        SymbolTaxonomy._classify_uncached(clean),
+        classify_asset_type(clean),
+        im._auto_classify(clean),
+        currencies,
+        calculate_pip_size(broker.get_symbol_info(clean), clean, im),
+    )
+
+
+def _summary(name: str, samples: List[float]) -> str:
+    ordered = sorted(samples)
+    pct = lambda p: ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1e6
+    return (f"  {name:<24} p50={pct(0.50):9.2f}µs  p95={pct(0.95):9.2f}µs  "
+            f"p99={pct(0.99):9.2f}µs  mean={statistics.fmean(ordered) * 1e6:9.2f}µs")
+
+
+def _run(signals: int, fn: Callable[[str], object]) -> List[float]:
+    samples = []
+    for i in range(signals):
+        symbol = SYMBOLS[i % len(SYMBOLS)]
+        t0 = time.perf_counter()
+        fn(symbol)
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--signals", type=int, default=20000)
+    parser.add_argument("--broker-latency-us", type=float, default=50.0)
+    args = parser.parse_args()
+
+    im = InstrumentManager(config=dict(DEFAULT_INSTRUMENTS_CONFIG))
+    broker = _Broker(args.broker_latency_us / 1e6)
+    registry = SymbolRegistry(instrument_manager=im)
+    for symbol in SYMBOLS:  # spec observed once (startup / first sizing)
+        registry.observe_spec(symbol, broker.get_symbol_info(symbol))
+
+    legacy = _run(args.signals, lambda s: _legacy(s, im, broker))
+    interned = _run(args.signals, registry.record)
+
+    print(f"PER-SIGNAL METADATA ({args.signals} signals, {len(SYMBOLS)} symbols, "
+          f"broker spec lookup {args.broker_latency_us:.0f}µs)")
+    print(_summary("legacy (strings + spec)", legacy))
+    print(_summary("registry record", interned))
+    print(f"  speed-up                 {statistics.fmean(legacy) / statistics.fmean(interned):,.0f}x  "
+          f"(records built: {registry.stats['records_built']})")
+
+
+if __name__ == "__main__":
+    main()
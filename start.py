@@ -29,33 +29,21 @@ import threading
 import time
 from pathlib import Path
 from datetime import datetime
+from typing import TYPE_CHECKING
 import webbrowser
 
 from utils.logging_utils import setup_logging
 
-from core_brain.main_orchestrator import MainOrchestrator
-from core_brain.scanner import ScannerEngine
-from core_brain.signal_factory import SignalFactory
-from core_brain.risk_manager import RiskManager
-from core_brain.executor import OrderExecutor
-from core_brain.monitor import ClosingMonitor
-from core_brain.edge_tuner import EdgeTuner
-from core_brain.edge_monitor import EdgeMonitor
-from core_brain.services.strategy_engine_factory import StrategyEngineFactory
-from data_vault.storage import StorageManager
-from data_vault.backup_manager import DatabaseBackupManager
+# PERF-STARTUP-GRAPH-2026-001: the engine's modules are imported lazily by the
+# startup graph factories (see _declare_startup_services), not at launcher load.
+from core_brain.startup_graph import StartupGraph, StartupStage
 from models.signal import ConnectorType
 
-# Core Brain Imports
-from core_brain.data_provider_manager import DataProviderManager
-from core_brain.notificator import get_notifier
-from core_brain.multi_timeframe_limiter import MultiTimeframeLimiter
-from core_brain.coherence_monitor import CoherenceMonitor
-from core_brain.strategy_gatekeeper import StrategyGatekeeper
-from core_brain.signal_expiration_manager import SignalExpirationManager
-from core_brain.regime import RegimeClassifier
-from core_brain.trade_closure_listener import TradeClosureListener
-from core_brain.position_manager import PositionManager
+if TYPE_CHECKING:
+    from core_brain.edge_tuner import EdgeTuner
+    from core_brain.signal_factory import SignalFactory
+    from data_vault.storage import StorageManager
+
 
 def _rotate_stale_log(log_path: str = "logs/main.log") -> None:
     """
@@ -308,6 +296,35 @@ def _connect_registered_connectors(connectors: dict[ConnectorType, object]) -> d
     return bootstrap_status
 
 
+def _attach_broker_mirrors(connectors: list[object]) -> int:
+    """Attach one BrokerStateMirror per distinct broker connector (positions/orders)."""
+    from core_brain.broker_state_mirror import get_broker_mirror, register_broker_mirror
+
+    attached = 0
+    for connector in connectors:
+        if not connector or get_broker_mirror(connector) is not None:
+            continue
+        if not callable(getattr(connector, "get_open_positions", None)):
+            continue
+        register_broker_mirror(connector)
+        attached += 1
+    return attached
+
+
+def _calibrate_paper_exchanges(connectors: list[object], storage: object, symbols: list[str]) -> int:
+    """Calibrate every simulated exchange's cost model from usr_execution_logs."""
+    calibrated = 0
+    for connector in connectors:
+        calibrate = getattr(connector, "calibrate", None)
+        if not connector or not callable(calibrate):
+            continue
+        try:
+            calibrated += calibrate(storage, symbols)
+        except Exception as exc:
+            logger.warning("[SIM-EXCHANGE] Cost model calibration failed: %s", exc)
+    return calibrated
+
+
 def _bind_signal_factory_reconciliation_connector(
     signal_factory: object,
     active_provider: dict[str, object] | None,
@@ -398,146 +415,205 @@ def launch_server() -> None:
     except Exception as e:
         logger.error(f"[ERROR] Error al iniciar servidor API: {e}")
 
-async def main() -> None:
+async def _run_edge_tuner_loop(edge_tuner: "EdgeTuner", signal_factory: "SignalFactory") -> None:
     """
-    Lanzador unificado de Aethelgard.
-    Inicializa motor de trading + dashboard.
+    Tarea asíncrona que ejecuta el EDGE Tuner cada hora.
+    Ajusta parámetros basándose en resultados de trades.
     """
-    logger.info("=" * 70)
-    logger.info("[START] AETHELGARD TRADING SYSTEM - UNIFIED LAUNCHER")
-    logger.info("=" * 70)
+    tuner_logger = logging.getLogger(__name__)
 
-    # Crear directorios necesarios
-    Path("logs").mkdir(exist_ok=True)
-    Path("data_vault").mkdir(exist_ok=True)
+    while True:
+        try:
+            # Esperar 1 hora
+            await asyncio.sleep(3600)  # 3600 segundos = 1 hora
+
+            tuner_logger.info("[EDGE] Ejecutando ajuste EDGE de parámetros...")
+            adjustment = edge_tuner.adjust_parameters()
+
+            if adjustment and not adjustment.get("skipped_reason"):
+                tuner_logger.info(f"[OK] Ajuste EDGE completado: {adjustment.get('trigger')}")
+                # En el nuevo SignalFactory (DI), los parámetros se cargan vía StorageManager
+                # pero si la estrategia es inyectada, puede que necesitemos avisar.
+                # El factory tiene su propio _load_parameters.
+                signal_factory._load_parameters()
+                tuner_logger.info("[INFO] Parámetros recargados en SignalFactory")
+            else:
+                reason = adjustment.get("skipped_reason") if adjustment else "unknown"
+                tuner_logger.info(f"[INFO] Sin ajustes: {reason}")
 
-    # P9 — Singleton guard: abortar si ya hay una instancia corriendo
-    if not _acquire_singleton_lock():
-        logger.error("[ABORT] Ya existe una instancia activa. Terminar la instancia anterior primero.")
-        return
+        except Exception as e:
+            tuner_logger.error(f"[ERROR] Error en EDGE Tuner: {e}", exc_info=True)
+            # Continuar ejecutándose a pesar del error
+            await asyncio.sleep(60)  # Esperar 1 minuto antes de reintentar
 
-    try:
-        # 1. Storage Manager (SSOT - Regla 14)
+
+def _declare_startup_services(graph: StartupGraph) -> list[asyncio.Task]:
+    """
+    Declara los servicios del launcher como grafo de dependencias (PERF-STARTUP-GRAPH-2026-001).
+
+    CRITICAL: storage → config/instrumentos → conectores → scanner → executor →
+    orchestrator → SignalFactory; nodos independientes se construyen en paralelo.
+    También CRITICAL: el veto del calendario económico (el loop no ejecuta sin
+    él) y la expiración de SHADOW obsoletas previa al bootstrap del pool.
+    DEFERRED: API, backups, OEM, salud, monitores, tuner, bootstrap del SHADOW
+    pool y backtest — arrancan con el loop principal ya corriendo, es decir,
+    en concurrencia con los primeros ciclos de orchestrator.run().
+    Cada factory importa su módulo al usarse (nada pesado al cargar start.py).
+
+    Returns:
+        Lista (se completa durante el arranque diferido) de tareas asyncio de fondo.
+    """
+    critical, deferred = StartupStage.CRITICAL, StartupStage.DEFERRED
+    background_tasks: list[asyncio.Task] = []
+
+    # ── 1. Storage & configuración (SSOT - Regla 14) ─────────────────────────
+    def build_storage():
         logger.info("[INIT] Inicializando Storage Manager...")
-        storage = StorageManager()
+        from data_vault.storage import StorageManager
+        return StorageManager()
 
-        # 1.1 DB Backup Manager (periodic, configurable via dynamic_params.database_backup)
+    def build_backup_manager(storage):
+        # DB Backup Manager (periodic, configurable via dynamic_params.database_backup)
+        from data_vault.backup_manager import DatabaseBackupManager
         backup_manager = DatabaseBackupManager(storage=storage, poll_seconds=30)
         backup_manager.start()
-        
-        # 1.5. Configuración SSOT (Regla 14)
+        return backup_manager
+
+    def build_config(storage):
         # Cargar configuraciones directamente desde DB (sin auto-bootstrap JSON en runtime)
+        _seed_risk_config(storage)
+        _seed_backtest_config(storage)
+        _ensure_exec_capable_account(storage)
         system_state = storage.get_sys_config()
-        global_config = system_state.get("global_config") or {}
-        dynamic_params = storage.get_dynamic_params()
-
-        # === FUNCIONES AUXILIARES EDGE ===
-        async def run_edge_tuner_loop(edge_tuner: EdgeTuner, signal_factory: SignalFactory) -> None:
-            """
-            Tarea asíncrona que ejecuta el EDGE Tuner cada hora.
-            Ajusta parámetros basándose en resultados de trades.
-            """
-            tuner_logger = logging.getLogger(__name__)
-            
-            while True:
-                try:
-                    # Esperar 1 hora
-                    await asyncio.sleep(3600)  # 3600 segundos = 1 hora
-                    
-                    tuner_logger.info("[EDGE] Ejecutando ajuste EDGE de parámetros...")
-                    adjustment = edge_tuner.adjust_parameters()
-                    
-                    if adjustment and not adjustment.get("skipped_reason"):
-                        tuner_logger.info(f"[OK] Ajuste EDGE completado: {adjustment.get('trigger')}")
-                        # En el nuevo SignalFactory (DI), los parámetros se cargan vía StorageManager
-                        # pero si la estrategia es inyectada, puede que necesitemos avisar.
-                        # El factory tiene su propio _load_parameters.
-                        signal_factory._load_parameters()
-                        tuner_logger.info("[INFO] Parámetros recargados en SignalFactory")
-                    else:
-                        reason = adjustment.get("skipped_reason") if adjustment else "unknown"
-                        tuner_logger.info(f"[INFO] Sin ajustes: {reason}")
-                        
-                except Exception as e:
-                    tuner_logger.error(f"[ERROR] Error en EDGE Tuner: {e}", exc_info=True)
-                    # Continuar ejecutándose a pesar del error
-                    await asyncio.sleep(60)  # Esperar 1 minuto antes de reintentar
-
-        # 2. Notification Service (Internal persistency)
+        return {
+            "global_config": system_state.get("global_config") or {},
+            "dynamic_params": storage.get_dynamic_params(),
+            "initial_capital": _read_initial_capital(storage),
+        }
+
+    graph.add("storage", build_storage)
+    graph.add("backup_manager", build_backup_manager, deps=["storage"], stage=deferred)
+    graph.add("config", build_config, deps=["storage"])
+
+    # ── 2. Notification Service (Internal persistency) ───────────────────────
+    def build_outbound_dispatcher(storage):
+        from utils.outbound_dispatcher import OutboundDispatcher
+        outbound_dispatcher = OutboundDispatcher(dead_letter=storage.save_notification_dead_letter)
+        outbound_dispatcher.start()
+        return outbound_dispatcher
+
+    def build_notification_service(storage, outbound_dispatcher):
         logger.info("[INIT] Inicializando Notification Service...")
         from core_brain.notification_service import NotificationService
-        notification_service = NotificationService(storage)
+        return NotificationService(storage, dispatcher=outbound_dispatcher)
 
-        # 3. Risk Manager (Regla 1 - DI)
-        logger.info("[INIT]  Inicializando Risk Manager...")
-        from core_brain.position_size_monitor import PositionSizeMonitor
-        risk_monitor = PositionSizeMonitor(
-            max_consecutive_failures=3,
-            circuit_breaker_timeout=300
-        )
-        
+    graph.add("outbound_dispatcher", build_outbound_dispatcher, deps=["storage"])
+    graph.add("notification_service", build_notification_service, deps=["storage", "outbound_dispatcher"])
+
+    # ── 3. Instrumentos, símbolos y Risk Manager (Regla 1 - DI) ──────────────
+    def build_instrument_manager(storage):
         from core_brain.instrument_manager import InstrumentManager
-        instrument_manager = InstrumentManager(storage=storage)
-        
+        return InstrumentManager(storage=storage)
+
+    def build_symbols(instrument_manager):
         # === SÍMBOLOS A MONITOREAR - LEER DE BD (SSOT) ===
         # Obtener TODOS los símbolos habilitados sin filtrado por mercado
         # (Agnóstico - respeta lo que esté activo en la BD, sin discriminar FOREX vs CRYPTO vs METALS)
-        enabled_symbols = instrument_manager.get_enabled_symbols(market=None)
-        if enabled_symbols:
-            symbols = enabled_symbols
-            enabled_by_market = {}
-            for sym in symbols:
-                cfg = instrument_manager.get_config(sym)
-                if cfg:
-                    market = cfg.category
-                    if market not in enabled_by_market:
-                        enabled_by_market[market] = []
-                    enabled_by_market[market].append(sym)
-            logger.info(f"   Símbolos configurados (desde DB): {len(symbols)} instrumentos habilitados")
-            for market, syms in sorted(enabled_by_market.items()):
-                logger.info(f"      - {market}: {len(syms)} ({', '.join(sorted(syms)[:5])}{'...' if len(syms) > 5 else ''})")
-        else:
+        symbols = instrument_manager.get_enabled_symbols(market=None)
+        if not symbols:
             # Si no hay NADA habilitado en la BD, abortar con mensaje claro
             logger.critical("[CRITICAL] No hay símbolos habilitados en la BD. Configura al menos un instrumento en Settings.")
             raise RuntimeError("No enabled symbols found in database. Cannot start trading.")
-        
-        _seed_risk_config(storage)
-        _seed_backtest_config(storage)
-        _ensure_exec_capable_account(storage)
-        initial_capital = _read_initial_capital(storage)
+        enabled_by_market: dict[str, list[str]] = {}
+        for sym in symbols:
+            cfg = instrument_manager.get_config(sym)
+            if cfg:
+                enabled_by_market.setdefault(cfg.category, []).append(sym)
+        logger.info(f"   Símbolos configurados (desde DB): {len(symbols)} instrumentos habilitados")
+        for market, syms in sorted(enabled_by_market.items()):
+            logger.info(f"      - {market}: {len(syms)} ({', '.join(sorted(syms)[:5])}{'...' if len(syms) > 5 else ''})")
+        return symbols
+
+    def build_symbol_registry(instrument_manager, symbols):
+        # Registro de símbolos: metadata precalculada una vez por símbolo
+        from core_brain.symbol_registry import get_symbol_registry
+        symbol_registry = get_symbol_registry()
+        symbol_registry.bind(instrument_manager)
+        for sym in symbols:
+            symbol_registry.record(sym)
+        return symbol_registry
+
+    def build_fx_graph(symbols):
+        # Grafo de conversión FX: nodos = divisas, aristas = pares del universo habilitado
+        from core_brain.fx_conversion_graph import FxConversionGraph
+        fx_graph = FxConversionGraph()
+        fx_graph.register_symbols(symbols)
+        return fx_graph
+
+    def build_risk_manager(storage, config, instrument_manager, fx_graph):
+        logger.info("[INIT]  Inicializando Risk Manager...")
+        from core_brain.position_size_monitor import PositionSizeMonitor
+        from core_brain.risk_manager import RiskManager
+        risk_monitor = PositionSizeMonitor(
+            max_consecutive_failures=3,
+            circuit_breaker_timeout=300
+        )
         risk_manager = RiskManager(
             storage=storage,
-            initial_capital=initial_capital,
+            initial_capital=config["initial_capital"],
             instrument_manager=instrument_manager,
-            monitor=risk_monitor
+            monitor=risk_monitor,
+            fx_graph=fx_graph,
         )
         logger.info(f"   Capital: ${risk_manager.capital:,.2f}")
         logger.info(f"   Riesgo por trade (SST): {risk_manager.risk_per_trade:.1%}")
-        
-        # 3. Connectors & Data Provider (Unificación de Conexión)
-        # ----------------------------------------------------------------
-        
-        # A) Inicializar Data Provider Manager (SSOT providers from DB)
+        return risk_manager
+
+    graph.add("instrument_manager", build_instrument_manager, deps=["storage"])
+    graph.add("symbols", build_symbols, deps=["instrument_manager"])
+    graph.add("symbol_registry", build_symbol_registry, deps=["instrument_manager", "symbols"])
+    graph.add("fx_graph", build_fx_graph, deps=["symbols"])
+    graph.add("risk_manager", build_risk_manager, deps=["storage", "config", "instrument_manager", "fx_graph"])
+
+    # ── 4. Connectors & Data Provider (Unificación de Conexión) ──────────────
+    def build_provider_manager(storage, config):
+        # A) Data Provider Manager (SSOT providers from DB)
         logger.info("[INIT] Inicializando Data Provider Manager (DI)...")
-        provider_manager = DataProviderManager(storage=storage)
+        from core_brain.data_provider_manager import DataProviderManager
+
+        # Roll-up multi-timeframe desde un único stream base por símbolo (opt-in, SSOT)
+        scanner_cfg = config["global_config"].get("scanner", config["global_config"])
+        agg_cfg = scanner_cfg.get("bar_aggregation") or {}
+        bar_aggregator = None
+        if agg_cfg.get("enabled", False):
+            from core_brain.bar_aggregator import BarAggregator
+            bar_aggregator = BarAggregator(
+                timeframes=[tf["timeframe"] for tf in scanner_cfg.get("timeframes", []) if tf.get("enabled", True)],
+                base_timeframe=agg_cfg.get("base_timeframe", "M1"),
+                server_utc_offset_hours=float(agg_cfg.get("server_utc_offset_hours", 0.0)),
+                fold_weekend=bool(agg_cfg.get("fold_weekend", False)),
+            )
+            logger.info("   Bar aggregation: %s → %s", bar_aggregator.base_timeframe, list(bar_aggregator.timeframes))
+        return DataProviderManager(storage=storage, bar_aggregator=bar_aggregator)
 
-        # B) Inicializar ConnectivityOrchestrator y Connectors Dinámicos (SSOT)
+    def build_connectivity(storage, provider_manager):
+        # B) ConnectivityOrchestrator y Connectors Dinámicos (SSOT)
         logger.info("[INIT] Inicializando ConnectivityOrchestrator y conectores desde BD...")
         from core_brain.connectivity_orchestrator import ConnectivityOrchestrator
-        orchestrator = ConnectivityOrchestrator()
-        orchestrator.set_storage(storage)
+        connectivity = ConnectivityOrchestrator()
+        connectivity.set_storage(storage)
 
         # C) Inyección de Dependencia: Registrar conectores por proveedor activo de DB
         for provider_info in provider_manager.get_active_providers():
             provider_name = str(provider_info.get("name", "")).strip().lower()
             if not provider_name:
                 continue
-            connector = orchestrator.get_connector(provider_name)
+            connector = connectivity.get_connector(provider_name)
             if connector:
                 provider_manager.register_provider_instance(provider_name, connector)
-        
+
         # Fallback: Registrar conectores preexistentes por provider_id (compatibilidad)
-        for connector in orchestrator.connectors.values():
+        for connector in connectivity.connectors.values():
             if not connector:
                 continue
             provider_id = str(getattr(connector, "provider_id", "")).lower()
@@ -545,118 +621,168 @@ async def main() -> None:
                 continue
             provider_manager.register_provider_instance(provider_id, connector)
         logger.info("[DI] Conectores registrados en DataProviderManager desde DB")
+        return connectivity
+
+    def build_connectors(storage, symbols, connectivity, provider_manager):
+        # Construir diccionario de conectores activos sin suposición nominal de broker
+        active_connectors = _build_active_connectors(connectivity)
+        connector_bootstrap = _connect_registered_connectors(active_connectors)
+        connected_count = sum(1 for status in connector_bootstrap.values() if status)
+        logger.info("[CONNECT] Bootstrap conectores: %d/%d conectados", connected_count, len(active_connectors))
+        active_provider = provider_manager.get_connected_active_provider()
+        mirrored = _attach_broker_mirrors(
+            [*active_connectors.values(), active_provider["instance"] if active_provider else None]
+        )
+        logger.info("[CONNECT] Broker state mirrors adjuntos: %d", mirrored)
+        calibrated = _calibrate_paper_exchanges(list(active_connectors.values()), storage, symbols)
+        logger.info("[CONNECT] Exchange simulado calibrado para %d símbolos", calibrated)
+        return active_connectors
 
-        # D) Inicializar Scanner Engine (usando el provider_manager configurado)
+    def build_active_provider(provider_manager, connectors):
+        active_provider = provider_manager.get_connected_active_provider()
+        if active_provider:
+            logger.info("[PROVIDER] Proveedor de datos activo (DB): %s", active_provider["name"])
+        else:
+            logger.warning("[PROVIDER] No hay proveedor activo conectado desde DB")
+        return active_provider
+
+    def build_scanner(storage, config, symbols, provider_manager, fx_graph):
+        # D) Scanner Engine (usando el provider_manager configurado)
         logger.info("[INIT] Inicializando Scanner Engine...")
-        scanner = ScannerEngine(
+        from core_brain.scanner import ScannerEngine
+        return ScannerEngine(
             assets=symbols,
             data_provider=provider_manager,
-            config_data=global_config, # Inyectar desde DB (SSOT)
+            config_data=config["global_config"],  # Inyectar desde DB (SSOT)
             scan_mode="STANDARD",
-            storage=storage
+            storage=storage,
+            fx_graph=fx_graph,
         )
-        
-        # 5. Signal Factory - FASE DI (Regla 1)
-        logger.info("[INIT] Inicializando Signal Factory (DI)...")
+
+    graph.add("provider_manager", build_provider_manager, deps=["storage", "config"])
+    graph.add("connectivity", build_connectivity, deps=["storage", "provider_manager"])
+    graph.add("connectors", build_connectors, deps=["storage", "symbols", "connectivity", "provider_manager"])
+    graph.add("active_provider", build_active_provider, deps=["provider_manager", "connectors"])
+    graph.add("scanner", build_scanner, deps=["storage", "config", "symbols", "provider_manager", "fx_graph"])
+
+    # ── 5. Analizadores de Signal Factory (DI) ───────────────────────────────
+    def build_confluence_analyzer(storage, config):
         from core_brain.confluence import MultiTimeframeConfluenceAnalyzer
-        from core_brain.strategies.trifecta_logic import TrifectaAnalyzer
-        
-        confluence_config = dynamic_params.get("confluence", {})
-        confluence_analyzer = MultiTimeframeConfluenceAnalyzer(
+        confluence_config = config["dynamic_params"].get("confluence", {})
+        return MultiTimeframeConfluenceAnalyzer(
             storage=storage,
             enabled=confluence_config.get("enabled", True)
         )
-        
-        trifecta_analyzer = TrifectaAnalyzer(
+
+    def build_trifecta_analyzer(storage, config):
+        from core_brain.strategies.trifecta_logic import TrifectaAnalyzer
+        return TrifectaAnalyzer(
             storage=storage,
-            config_data=global_config, # Inyectar desde DB (SSOT)
+            config_data=config["global_config"],  # Inyectar desde DB (SSOT)
             auto_enable_tfs=True
         )
-        
-        # NOTE: SignalFactory will be created AFTER sensors are initialized in MainOrchestrator
-        # See OPTION 4 implementation: Sensors first, then factory creation
-        signal_factory = None  # Will be set later
-        
-        # 6. Order Executor - FASE DI (Regla 1)
 
-        logger.info("[INIT] Inicializando Order Executor (DI)...")
-        
-        active_provider = provider_manager.get_connected_active_provider()
-        multi_tf_limiter = MultiTimeframeLimiter(
+    graph.add("confluence_analyzer", build_confluence_analyzer, deps=["storage", "config"])
+    graph.add("trifecta_analyzer", build_trifecta_analyzer, deps=["storage", "config"])
+
+    # ── 6. Order Executor (DI) ───────────────────────────────────────────────
+    def build_multi_tf_limiter(storage, config, active_provider):
+        from core_brain.multi_timeframe_limiter import MultiTimeframeLimiter
+        return MultiTimeframeLimiter(
             storage=storage,
-            config=dynamic_params,
+            config=config["dynamic_params"],
             connector=active_provider["instance"] if active_provider else None
         )
-        
-        # Construir diccionario de conectores activos sin suposición nominal de broker
-        active_connectors = _build_active_connectors(orchestrator)
-        connector_bootstrap = _connect_registered_connectors(active_connectors)
-        connected_count = sum(1 for status in connector_bootstrap.values() if status)
-        logger.info("[CONNECT] Bootstrap conectores: %d/%d conectados", connected_count, len(active_connectors))
 
-        active_provider = provider_manager.get_connected_active_provider()
-        if active_provider:
-            logger.info("[PROVIDER] Proveedor de datos activo (DB): %s", active_provider["name"])
-        else:
-            logger.warning("[PROVIDER] No hay proveedor activo conectado desde DB")
-            
-        order_executor = OrderExecutor(
+    def build_executor(storage, risk_manager, multi_tf_limiter, notification_service, connectors, fx_graph):
+        logger.info("[INIT] Inicializando Order Executor (DI)...")
+        from core_brain.executor import OrderExecutor
+        from core_brain.notificator import get_notifier
+        return OrderExecutor(
             risk_manager=risk_manager,
             storage=storage,
             multi_tf_limiter=multi_tf_limiter,
             notificator=get_notifier(),
             notification_service=notification_service,
-            connectors=active_connectors
+            connectors=connectors,
+            fx_graph=fx_graph,
         )
-        
-        # 7. Coherence Monitor (DI)
-        logger.info("[INIT] Inicializando Coherence Monitor...")
-        coherence_monitor = CoherenceMonitor(storage=storage)
-        
-        # 7.1 Signal Expiration Manager (DI)
-        logger.info("[INIT] Inicializando Signal Expiration Manager...")
-        expiration_manager = SignalExpirationManager(storage=storage)
-        
-        # 7.2 Regime Classifier (DI)
-        logger.info("[INIT] Inicializando Regime Classifier...")
-        regime_classifier = RegimeClassifier(storage=storage)
-        
-        # 7.3 Edge Tuner (DI)
-        logger.info("[INIT] Inicializando Edge Tuner...")
-        edge_tuner = EdgeTuner(storage=storage) 
-        
-        # 7.4 Trade Closure Listener (DI)
-        logger.info("[INIT] Inicializando Trade Closure Listener...")
-        trade_closure_listener = TradeClosureListener(
+
+    graph.add("multi_tf_limiter", build_multi_tf_limiter, deps=["storage", "config", "active_provider"])
+    graph.add("executor", build_executor, deps=[
+        "storage", "risk_manager", "multi_tf_limiter", "notification_service", "connectors", "fx_graph",
+    ])
+
+    # ── 7. Servicios auxiliares del orquestador (DI) ─────────────────────────
+    def build_coherence_monitor(storage):
+        from core_brain.coherence_monitor import CoherenceMonitor
+        return CoherenceMonitor(storage=storage)
+
+    def build_expiration_manager(storage):
+        from core_brain.signal_expiration_manager import SignalExpirationManager
+        return SignalExpirationManager(storage=storage)
+
+    def build_regime_classifier(storage):
+        from core_brain.regime import RegimeClassifier
+        return RegimeClassifier(storage=storage)
+
+    def build_edge_tuner(storage):
+        from core_brain.edge_tuner import EdgeTuner
+        return EdgeTuner(storage=storage)
+
+    def build_strategy_gatekeeper(storage):
+        from core_brain.strategy_gatekeeper import StrategyGatekeeper
+        return StrategyGatekeeper(storage=storage)
+
+    def build_trade_closure_listener(storage, risk_manager, edge_tuner):
+        from core_brain.circuit_breaker import circuit_breaker_for
+        from core_brain.trade_closure_listener import TradeClosureListener
+        # Same CircuitBreaker the executor gate reads: degradation lands within one trade
+        return TradeClosureListener(
             storage=storage,
             risk_manager=risk_manager,
-            edge_tuner=edge_tuner
+            edge_tuner=edge_tuner,
+            circuit_breaker=circuit_breaker_for(storage)
         )
-        
-        # 7.5 Position Manager (DI)
-        logger.info("[INIT] Inicializando Position Manager...")
-        best_exec_connector = provider_manager.get_best_provider()
-        position_manager = PositionManager(
+
+    def build_position_manager(storage, config, provider_manager, regime_classifier, connectors):
+        from core_brain.position_manager import PositionManager
+        return PositionManager(
             storage=storage,
-            connector=best_exec_connector,
+            connector=provider_manager.get_best_provider(),
             regime_classifier=regime_classifier,
-            config=dynamic_params.get("position_management", {})
+            config=config["dynamic_params"].get("position_management", {})
         )
-        
-        # 8. Main Orchestrator (Unified DI) - OPTION 4 Implementation
-        # Explicit sensor initialization BEFORE SignalFactory creation
-        logger.info("[INIT] Inicializando Main Orchestrator (DI/SSOT)...")
+
+    def build_thought_callback():
         from core_brain.server import broadcast_thought
-        
-        # STEP 1: Create MainOrchestrator WITHOUT signal_factory (signal_factory=None)
-        # This ensures __init__ doesn't try to load strategies yet
-        # Use agnóstico connectors dict instead of hardcoded mt5_connector
-        strategy_gatekeeper = StrategyGatekeeper(storage=storage)
-        orchestrator = MainOrchestrator(
+        return broadcast_thought
+
+    graph.add("coherence_monitor", build_coherence_monitor, deps=["storage"])
+    graph.add("expiration_manager", build_expiration_manager, deps=["storage"])
+    graph.add("regime_classifier", build_regime_classifier, deps=["storage"])
+    graph.add("edge_tuner", build_edge_tuner, deps=["storage"])
+    graph.add("strategy_gatekeeper", build_strategy_gatekeeper, deps=["storage"])
+    graph.add("trade_closure_listener", build_trade_closure_listener, deps=["storage", "risk_manager", "edge_tuner"])
+    graph.add("position_manager", build_position_manager, deps=[
+        "storage", "config", "provider_manager", "regime_classifier", "connectors",
+    ])
+    graph.add("thought_callback", build_thought_callback)
+
+    # ── 8. Main Orchestrator (Unified DI) - OPTION 4 Implementation ──────────
+    def build_orchestrator(
+        storage, scanner, risk_manager, executor, position_manager, trade_closure_listener,
+        coherence_monitor, expiration_manager, regime_classifier, strategy_gatekeeper, thought_callback,
+    ):
+        # STEP 1: MainOrchestrator WITHOUT signal_factory (se inyecta tras los sensores).
+        # Economic veto se adjunta en CRITICAL (nodo economic_integration); backtest en DEFERRED.
+        logger.info("[INIT] Inicializando Main Orchestrator (DI/SSOT)...")
+        from core_brain.main_orchestrator import MainOrchestrator
+        return MainOrchestrator(
             scanner=scanner,
             signal_factory=None,  # OPTION 4: Defer factory injection
             risk_manager=risk_manager,
-            executor=order_executor,
+            executor=executor,
             storage=storage,
             position_manager=position_manager,
             trade_closure_listener=trade_closure_listener,
@@ -664,25 +790,28 @@ async def main() -> None:
             expiration_manager=expiration_manager,
             regime_classifier=regime_classifier,
             strategy_gatekeeper=strategy_gatekeeper,
-            thought_callback=broadcast_thought
+            thought_callback=thought_callback,
+            defer_optional_services=True,
+            on_first_scan=lambda: graph.mark("first_scan"),
         )
-        
+
+    def build_sensors(orchestrator):
         # STEP 2: Initialize sensors explicitly (BEFORE SignalFactory creation)
         logger.info("[INIT] Inicializando sensores (fase de DI explícita)...")
         available_sensors = orchestrator.initialize_sensors()
         logger.info(f"[INIT] ✓ Sensores inicializados: {list(available_sensors.keys())}")
-        
-        # STEP 3: Create SignalFactory WITH populated sensors
+        return available_sensors
+
+    def build_strategy_engines(storage, config, sensors, strategy_gatekeeper):
+        # STEP 3: Load strategies with sensors now available
         logger.info("[INIT] Creando SignalFactory con sensores disponibles...")
         from core_brain.services.strategy_engine_factory import StrategyEngineFactory
-        
         try:
-            # Load strategies with sensors now available
             # Pasar user_id desde storage (SSOT) para multi-tenancy (Dominio 01, 08)
             strategy_factory = StrategyEngineFactory(
                 storage=storage,
-                config=dynamic_params,
-                available_sensors=available_sensors,  # NOW POPULATED!
+                config=config["dynamic_params"],
+                available_sensors=sensors,  # NOW POPULATED!
                 user_id=storage.user_id  # Multi-user context for strategy initialization
             )
             active_engines = strategy_factory.instantiate_all_sys_strategies()
@@ -690,40 +819,69 @@ async def main() -> None:
             strategy_specs = storage.get_all_sys_strategies()
             strategy_gatekeeper.sync_from_strategy_specs(strategy_specs)
             logger.info(f"[INIT] ✓ {len(active_engines)} estrategias cargadas (con sensores listos)")
+            return active_engines
         except Exception as e:
             logger.warning(f"[INIT] Error cargando estrategias: {e}. SignalFactory operará con Dict vacío")
-            active_engines = {}
-        
+            return {}
+
+    def build_signal_factory(
+        storage, orchestrator, strategy_engines, confluence_analyzer, trifecta_analyzer,
+        notification_service, instrument_manager,
+    ):
+        from core_brain.signal_factory import SignalFactory
         signal_factory = SignalFactory(
             storage_manager=storage,
-            strategy_engines=active_engines,
+            strategy_engines=strategy_engines,
             confluence_analyzer=confluence_analyzer,
             trifecta_analyzer=trifecta_analyzer,
             notification_service=notification_service,
             instrument_manager=instrument_manager,
         )
-        
         # STEP 4: Inject SignalFactory into orchestrator (explicit DI)
         logger.info("[INIT] Inyectando SignalFactory en Orchestrator...")
         orchestrator.set_signal_factory(signal_factory)
         logger.info("[INIT] ✓ Orquestador listo con SignalFactory")
-        
-        # STEP 4.5: Pre-bootstrap stale cleanup + SHADOW pool bootstrap.
-        _expire_stale_shadow_instances_before_pool_bootstrap(storage)
+        return signal_factory
 
-        # Bootstrap SHADOW pool (auto-create instances for Darwinian selection)
+    def bind_reconciliation(signal_factory, active_provider):
+        _bind_signal_factory_reconciliation_connector(signal_factory, active_provider)
+        return True
+
+    graph.add("orchestrator", build_orchestrator, deps=[
+        "storage", "scanner", "risk_manager", "executor", "position_manager", "trade_closure_listener",
+        "coherence_monitor", "expiration_manager", "regime_classifier", "strategy_gatekeeper",
+        "thought_callback",
+    ])
+    graph.add("sensors", build_sensors, deps=["orchestrator"])
+    graph.add("strategy_engines", build_strategy_engines, deps=["storage", "config", "sensors", "strategy_gatekeeper"])
+    graph.add("signal_factory", build_signal_factory, deps=[
+        "storage", "orchestrator", "strategy_engines", "confluence_analyzer", "trifecta_analyzer",
+        "notification_service", "instrument_manager",
+    ])
+    graph.add("reconciliation", bind_reconciliation, deps=["signal_factory", "active_provider"])
+    # Veto económico en la ruta crítica: run_econ_phase es fail-open sin integración
+    graph.add("economic_integration", lambda orchestrator: orchestrator.attach_economic_integration(),
+              deps=["orchestrator"])
+    # La expiración de SHADOW obsoletas termina antes del primer ciclo, como antes del grafo
+    graph.add("shadow_expiry", _expire_stale_shadow_instances_before_pool_bootstrap, deps=["storage"])
+
+    # ── 9. Etapa DEFERRED (el loop principal ya está corriendo) ──────────────
+    async def build_shadow_pool(orchestrator, strategy_engines, shadow_expiry):
+        # SHADOW pool bootstrap (Darwinian selection); stale cleanup ya hecho en CRITICAL
         logger.info("[INIT] Inicializando SHADOW pool (instancias automáticas)...")
-        if active_engines:
-            shadow_stats = await orchestrator.initialize_shadow_pool(
-                strategy_engines=active_engines,
-                account_id="DEMO_MT5_001",
-                variations_per_strategy=2
-            )
-            logger.info(f"[INIT] ✓ SHADOW pool: {shadow_stats['created']} instancias, {shadow_stats['skipped']} skipped")
-        else:
+        if not strategy_engines:
             logger.warning("[INIT] ⚠️  No strategies loaded, skipping SHADOW pool initialization")
-        
-        # 8.6 Operational Edge Monitor (auto-auditoría de invariantes de negocio)
+            return None
+        shadow_stats = await orchestrator.initialize_shadow_pool(
+            strategy_engines=strategy_engines,
+            account_id="DEMO_MT5_001",
+            variations_per_strategy=2
+        )
+        logger.info(f"[INIT] ✓ SHADOW pool: {shadow_stats['created']} instancias, {shadow_stats['skipped']} skipped")
+        return shadow_stats
+
+    def build_oem(storage, outbound_dispatcher, orchestrator):
+        # Operational Edge Monitor (auto-auditoría de invariantes de negocio)
         logger.info("[INIT] Inicializando Operational Edge Monitor (auto-auditoría)...")
 
         # Escribir heartbeat del orchestrator ANTES de iniciar OEM.
@@ -735,96 +893,171 @@ async def main() -> None:
         logger.info("[INIT] Heartbeats iniciales escritos (orchestrator + executor) — previene falso FAIL en OEM")
 
         from core_brain.operational_edge_monitor import OperationalEdgeMonitor
+        from core_brain.server import set_oem_instance
         from data_vault.shadow_db import create_shadow_manager
+        from utils.alerting import AlertingService
 
-        _shadow_storage_for_oem = None
+        shadow_storage_for_oem = None
         try:
-            _shadow_storage_for_oem = create_shadow_manager(storage)
+            shadow_storage_for_oem = create_shadow_manager(storage)
             logger.info("[OEM] shadow_storage inyectado correctamente")
-        except Exception as _exc:
-            logger.warning("[OEM] Error creando shadow_storage: %s — check shadow_sync omitido", _exc)
+        except Exception as exc:
+            logger.warning("[OEM] Error creando shadow_storage: %s — check shadow_sync omitido", exc)
 
         oem = OperationalEdgeMonitor(
             storage=storage,
-            shadow_storage=_shadow_storage_for_oem,
+            shadow_storage=shadow_storage_for_oem,
+            alerting_service=AlertingService.from_env(dispatcher=outbound_dispatcher),
             interval_seconds=300,
         )
         oem.start()
-
-        from core_brain.server import set_oem_instance
         set_oem_instance(oem)
         logger.info("[OK] Operational Edge Monitor activo (11 checks de negocio, cada 5 min)")
+        return oem
 
-        # 9. Autonomous Health Service (EDGE Autonomy)
+    def build_health_service(storage):
+        # Autonomous Health Service (EDGE Autonomy)
         logger.info("[INIT] Inicializando Servicio de Salud Autónomo...")
         from core_brain.health_service import AutonomousHealthService
         health_service = AutonomousHealthService(storage=storage)
-        health_task = asyncio.create_task(health_service.start())
+        background_tasks.append(asyncio.create_task(health_service.start()))
         logger.info("[OK] Salud Autónoma activa")
-        
-        _bind_signal_factory_reconciliation_connector(signal_factory, active_provider)
-        
-        logger.info("")
-        logger.info("=" * 70)
-        logger.info("[OK] SISTEMA COMPLETO INICIADO")
-        logger.info("=" * 70)
-        logger.info("")
-        
-        # Iniciar Servidor API en hilo separado
-        server_thread = threading.Thread(target=launch_server,daemon=True)
-        server_thread.start()
-        
-        # OPTION A (11-Mar-2026): Scanner is pure executor, no autonomous thread
-        # MainOrchestrator calls scanner.execute_scan() when it decides timing
-        # REMOVED: scanner_thread = threading.Thread(target=scanner.run, daemon=True)
-        logger.info("[INFO] Scanner initialized as pure executor (OPTION A - MainOrchestrator orchestrates)")
-        
-        # Iniciar Closing Monitor en tarea asíncrona
+        return health_service
+
+    def build_closing_monitor(storage, connectors):
         logger.info("[INFO] Inicializando Closing Monitor...")
+        from core_brain.monitor import ClosingMonitor
         closing_monitor = ClosingMonitor(
             storage=storage,
-            connectors=active_connectors,
+            connectors=connectors,
             interval_seconds=60
         )
-        monitor_task = asyncio.create_task(closing_monitor.start())
+        background_tasks.append(asyncio.create_task(closing_monitor.start()))
         logger.info("[OK] Closing Monitor activo (Feedback Loop)")
-        
-        # Iniciar EDGE Monitor (inject connectors dict — conector-agnóstico, HU 10.5)
+        return closing_monitor
+
+    def build_edge_monitor(storage, connectors, trade_closure_listener):
+        # EDGE Monitor (inject connectors dict — conector-agnóstico, HU 10.5)
         logger.info("[INFO] Iniciando EDGE Monitor...")
+        from core_brain.edge_monitor import EdgeMonitor
         edge_monitor = EdgeMonitor(
             storage=storage,
-            connectors=active_connectors,
+            connectors=connectors,
             trade_listener=trade_closure_listener
         )
         edge_monitor.start()
         logger.info("[OK] EDGE Monitor activo (Observabilidad + Reconciliación Automática)")
-        
+        return edge_monitor
+
+    async def build_scan_state_ipc(scanner):
+        # Estado de escaneo por Unix socket (ARCH-IPC-LOCAL-2026-001): broker en proceso
+        # supervisado; el API lo lee sin round-trips a SQLite (DatabaseGateway como fallback)
+        from core_brain.infrastructure import (
+            LOCAL_IPC_SUPPORTED, LocalSocketGateway, ScannerProcessSupervisor,
+            run_scanner_broker, serve_scan_state,
+        )
+        from core_brain.infrastructure.local_ipc_gateway import DEFAULT_SOCKET_PATH
+        if not LOCAL_IPC_SUPPORTED:
+            logger.info("[IPC] Unix sockets no disponibles — el API lee scan state de la BD")
+            return None
+        supervisor = ScannerProcessSupervisor(
+            run_scanner_broker, args=(DEFAULT_SOCKET_PATH, serve_scan_state), name="aethelgard-scan-state",
+        )
+        supervisor.start()
+        background_tasks.append(asyncio.create_task(supervisor.supervise()))
+        publisher = LocalSocketGateway(DEFAULT_SOCKET_PATH)
+        await publisher.start()
+        scanner.state_publisher = publisher.publish_threadsafe
+        logger.info("[OK] Scan state broker activo (pid=%s, %s)", supervisor.pid, DEFAULT_SOCKET_PATH)
+        return supervisor
+
+    def build_edge_tuner_loop(edge_tuner, signal_factory):
+        task = asyncio.create_task(_run_edge_tuner_loop(edge_tuner, signal_factory))
+        background_tasks.append(task)
+        logger.info("[AUTO] EDGE Tuner: ajustes automáticos cada 1 hora")
+        return task
+
+    graph.add("api_server", launch_server, stage=deferred)
+    graph.add("shadow_pool", build_shadow_pool, stage=deferred,
+              deps=["orchestrator", "strategy_engines", "shadow_expiry"])
+    graph.add("backtest_orchestrator", lambda orchestrator: orchestrator.attach_backtest_orchestrator(),
+              stage=deferred, deps=["orchestrator"])
+    graph.add("oem", build_oem, stage=deferred, deps=["storage", "outbound_dispatcher", "orchestrator"])
+    graph.add("health_service", build_health_service, stage=deferred, in_thread=False, deps=["storage"])
+    graph.add("closing_monitor", build_closing_monitor, stage=deferred, in_thread=False, deps=["storage", "connectors"])
+    graph.add("edge_monitor", build_edge_monitor, stage=deferred,
+              deps=["storage", "connectors", "trade_closure_listener"])
+    graph.add("edge_tuner_loop", build_edge_tuner_loop, stage=deferred, in_thread=False,
+              deps=["edge_tuner", "signal_factory"])
+    graph.add("scan_state_ipc", build_scan_state_ipc, stage=deferred, in_thread=False, deps=["scanner"])
+
+    return background_tasks
+
+
+async def main() -> None:
+    """
+    Lanzador unificado de Aethelgard.
+    Inicializa motor de trading + dashboard.
+    """
+    logger.info("=" * 70)
+    logger.info("[START] AETHELGARD TRADING SYSTEM - UNIFIED LAUNCHER")
+    logger.info("=" * 70)
+
+    # Crear directorios necesarios
+    Path("logs").mkdir(exist_ok=True)
+    Path("data_vault").mkdir(exist_ok=True)
+
+    # P9 — Singleton guard: abortar si ya hay una instancia corriendo
+    if not _acquire_singleton_lock():
+        logger.error("[ABORT] Ya existe una instancia activa. Terminar la instancia anterior primero.")
+        return
+
+    graph = StartupGraph()
+    background_tasks = _declare_startup_services(graph)
+    try:
+        # Ruta crítica: todo lo necesario para el primer scan, en paralelo donde se pueda
+        await graph.start(StartupStage.CRITICAL)
+        graph.mark("critical_path_ready")
+        graph.log_timeline(StartupStage.CRITICAL)
+
         logger.info("")
-        logger.info("   -> [PRINCIPAL] Command Center Next-Gen: http://localhost:8000")
+        logger.info("=" * 70)
+        logger.info("[OK] SISTEMA COMPLETO INICIADO")
+        logger.info("=" * 70)
         logger.info("")
+
+        # OPTION A (11-Mar-2026): Scanner is pure executor, no autonomous thread
+        # MainOrchestrator calls scanner.execute_scan() when it decides timing
+        logger.info("[INFO] Scanner initialized as pure executor (OPTION A - MainOrchestrator orchestrates)")
+        logger.info("   -> [PRINCIPAL] Command Center Next-Gen: http://localhost:8000")
         logger.info("[STOP] Presiona Ctrl+C para detener todo el ecosistema")
-        
-        # Crear tarea asíncrona del EDGE Tuner
-        tuner_task = asyncio.create_task(run_edge_tuner_loop(edge_tuner, signal_factory))
-        logger.info("[AUTO] EDGE Tuner: ajustes automáticos cada 1 hora")
-        
+
+        # Servicios no críticos (API, monitores, tuner, backtest...) con el loop ya corriendo
+        graph.start_deferred()
+
         # Ejecutar loop principal
-        await orchestrator.run()
-        
+        await graph["orchestrator"].run()
+
     except KeyboardInterrupt:
         logger.info("\n[STOP]  Deteniendo sistema...")
-        scanner.stop()
-        if 'closing_monitor' in locals():
-            await closing_monitor.stop()
-        if 'backup_manager' in locals():
-            backup_manager.stop()
+        if graph.get("scanner") is not None:
+            graph["scanner"].stop()
+        if graph.get("closing_monitor") is not None:
+            await graph["closing_monitor"].stop()
         # Cleanup
     except Exception as e:
         logger.error(f"[FATAL] Error crítico: {e}", exc_info=True)
+        graph.log_timeline()
         raise
     finally:
-        if 'backup_manager' in locals():
-            backup_manager.stop()
+        for task in background_tasks:
+            task.cancel()
+        if graph.get("backup_manager") is not None:
+            graph["backup_manager"].stop()
+        if graph.get("outbound_dispatcher") is not None:
+            graph["outbound_dispatcher"].stop()
+        if graph.get("scan_state_ipc") is not None:
+            graph["scan_state_ipc"].stop()
         if server_process and server_process.poll() is None:
             server_process.terminate()
         _release_singleton_lock()
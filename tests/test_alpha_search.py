@@ -0,0 +1,102 @@
+"""
+Tests for the offline population search behind AlphaHunter.
+
+These tests exercise:
+  - Hyperband bracket / successive-halving budget planning
+  - Determinism under a seed, in process and on a process pool
+  - Pruning: only survivors are re-evaluated with more bars
+  - Promotion bounded by count_active_shadow_instances capacity
+"""
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from core_brain.alpha_hunter import AlphaHunter
+from core_brain.alpha_search import AlphaSearchEngine
+from core_brain.scenario_backtester import ScenarioBacktester, ScenarioSlice, StressCluster
+
+BASE_OVERRIDES = {"confidence_threshold": 0.1, "risk_reward": 1.5, "mode": "breakout"}
+
+
+def _slices(bars: int = 450, seed: int = 3):
+    rng = np.random.default_rng(seed)
+    slices = []
+    for cluster in StressCluster.ALL:
+        close = 1.1 + np.cumsum(rng.normal(0.0, 0.001, bars))
+        data = pd.DataFrame({
+            "open": close, "high": close + 0.0005, "low": close - 0.0005,
+            "close": close, "volume": 1.0,
+        })
+        slices.append(ScenarioSlice(cluster, cluster, "EURUSD", "H1", data, "2025-01-01", "2025-03-01"))
+    return slices
+
+
+def _engine(storage, max_population: int = 20, **kwargs) -> AlphaSearchEngine:
+    hunter = AlphaHunter(
+        storage._get_conn(), "DEMO_001",
+        max_shadow_population=max_population, promotion_score_threshold=0.0,
+    )
+    kwargs.setdefault("max_workers", 0)
+    return AlphaSearchEngine(hunter, ScenarioBacktester(storage), **kwargs)
+
+
+def _ranking(report):
+    return [(c.index, c.score, c.parameter_overrides) for c in report.finalists]
+
+
+def test_plan_brackets_scales_budgets_by_eta(storage):
+    engine = _engine(storage, eta=3, min_bars=50)
+
+    assert engine.plan_brackets(27, 450) == [
+        (27, [50, 150, 450]),
+        (14, [150, 450]),
+        (9, [450]),
+    ]
+    assert _engine(storage, hyperband=False).plan_brackets(27, 450) == [(27, [50, 150, 450])]
+    assert engine.plan_brackets(9, 40) == [(9, [40])]
+
+
+def test_search_is_deterministic_with_and_without_workers(storage):
+    slices = _slices()
+    inline = _engine(storage).search("STRAT_A", BASE_OVERRIDES, slices, population_size=9, seed=42)
+    pooled = _engine(storage, max_workers=2).search(
+        "STRAT_A", BASE_OVERRIDES, slices, population_size=9, seed=42
+    )
+    other = _engine(storage).search("STRAT_A", BASE_OVERRIDES, slices, population_size=9, seed=7)
+
+    assert _ranking(pooled) == _ranking(inline)
+    assert _ranking(other) != _ranking(inline)
+    assert all(c.parameter_overrides["mode"] == "breakout" for c in inline.finalists)
+
+
+def test_successive_halving_only_gives_more_bars_to_survivors(storage):
+    engine = _engine(storage, hyperband=False, eta=3, min_bars=50)
+    seen_bars = []
+    original = ScenarioBacktester.score_slices
+
+    def spy(self, overrides, slices, strategy_instance=None):
+        seen_bars.append(len(slices[0].data))
+        return original(self, overrides, slices, strategy_instance)
+
+    with patch.object(ScenarioBacktester, "score_slices", spy):
+        report = engine.search("STRAT_B", BASE_OVERRIDES, _slices(), population_size=27, top_k=1, seed=1)
+
+    evaluated = seen_bars[:-1]  # last call: audited re-validation of the winner
+    assert {bars: evaluated.count(bars) for bars in set(evaluated)} == {50: 27, 150: 9, 450: 3}
+    assert report.evaluations == 39 and seen_bars[-1] == 450
+    assert [c.bars for c in report.finalists] == [450]
+
+
+def test_promotions_respect_population_capacity(storage):
+    engine = _engine(storage, max_population=2)
+    report = engine.search("STRAT_C", BASE_OVERRIDES, _slices(), population_size=9, top_k=3, seed=5)
+
+    assert len(report.finalists) == 3
+    assert [p["promoted"] for p in report.promotions] == [True, True]
+    assert storage._get_conn().execute("SELECT COUNT(*) FROM sys_shadow_instances").fetchone()[0] == 2
+
+    with patch.object(ScenarioBacktester, "score_slices") as score:
+        full = engine.search("STRAT_C", BASE_OVERRIDES, _slices(), population_size=9, seed=5)
+    score.assert_not_called()
+    assert full.skipped_reason and full.evaluations == 0 and full.promotions == []
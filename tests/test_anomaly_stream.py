@@ -0,0 +1,199 @@
+"""
+Tests for streaming, watermarked anomaly detection (PERF-ANOMALY-STREAM-2026-001).
+
+These tests exercise:
+  - Rolling statistics updated in O(1) stay equal to a full recomputation
+  - Each anomaly emitted exactly once across re-scans of the same DataFrame
+  - A forming bar re-evaluated when its OHLCV is revised at the watermark
+  - AnomalyService scans no longer persisting duplicate anomaly rows
+  - AnomalySentinel streams per symbol|timeframe feeding get_defense_protocol,
+    alongside its tick buffers; candle crashes lock down only intraday
+"""
+import math
+import statistics
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core_brain.services.anomaly_detectors import detect_volatility_anomalies
+from core_brain.services.anomaly_models import AnomalyType
+from core_brain.services.anomaly_sentinel import AnomalySentinel, DefenseProtocol
+from core_brain.services.anomaly_service import AnomalyService
+from core_brain.services.anomaly_stream import StreamingAnomalyEngine
+
+
+def _frame(periods=80, start="2026-01-01", seed=7, base=1.05):
+    rng = np.random.default_rng(seed)
+    closes = base + np.cumsum(rng.normal(0, 0.0003, periods))
+    return pd.DataFrame({
+        "timestamp": pd.date_range(start=start, periods=periods, freq="15min"),
+        "open": closes,
+        "high": closes + 0.0002,
+        "low": closes - 0.0002,
+        "close": closes,
+        "volume": rng.integers(100_000, 200_000, periods),
+    })
+
+
+def _with_crash(df):
+    """Append one bar that opens at the last close and drops 3% on a volume spike."""
+    last = df.iloc[-1]
+    crash = {
+        "timestamp": last["timestamp"] + pd.Timedelta(minutes=15),
+        "open": last["close"], "high": last["close"],
+        "low": last["close"] * 0.97, "close": last["close"] * 0.97,
+        "volume": 2_000_000,
+    }
+    return pd.concat([df, pd.DataFrame([crash])], ignore_index=True)
+
+
+def test_rolling_stats_match_full_recomputation():
+    engine = StreamingAnomalyEngine(return_window=30)
+    closes = _frame(periods=500)["close"].tolist()
+    for close in closes:
+        engine.update("EURUSD", "M15", {"close": close})
+
+    state = engine._streams["EURUSD|M15"]
+    window = [math.log(b / a) for a, b in zip(closes, closes[1:])][-30:]
+    mean, std = state.return_stats()
+    assert list(state.returns) == pytest.approx(window)
+    assert mean == pytest.approx(statistics.mean(window))
+    assert std == pytest.approx(statistics.stdev(window))
+
+
+def test_each_anomaly_is_emitted_once_across_rescans():
+    engine = StreamingAnomalyEngine()
+    df = _with_crash(_frame())
+
+    first = detect_volatility_anomalies("EURUSD", df, "M15", engine=engine)
+    assert len(first) == 1 and first[0]["z_score"] > 3.0
+    assert engine.watermark("EURUSD", "M15") == df["timestamp"].iloc[-1].timestamp()
+
+    # Same frame (and its tail) again: nothing new behind the watermark
+    assert detect_volatility_anomalies("EURUSD", df, "M15", engine=engine) == []
+    assert engine.ingest("EURUSD", "M15", df.tail(10).to_dict("records")) == []
+
+    # Another timeframe is an independent stream
+    assert len(detect_volatility_anomalies("EURUSD", df, "H1", engine=engine)) == 1
+
+
+def _flat_m15(periods=20):
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2026-01-01", periods=periods, freq="15min"),
+        "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1000.0,
+    })
+
+
+def test_forming_bar_is_reevaluated_when_revised():
+    engine = StreamingAnomalyEngine()
+    df = _flat_m15()
+    assert engine.ingest("EURUSD", "M15", df.to_dict("records")) == []
+
+    # The open candle closes 5% lower than its first snapshot
+    revised = df.copy()
+    revised.loc[revised.index[-1], ["low", "close"]] = 0.95
+    emitted = engine.ingest("EURUSD", "M15", revised.to_dict("records"))
+    assert {a["anomaly_type"] for a in emitted} == {
+        AnomalyType.EXTREME_VOLATILITY.value, AnomalyType.FLASH_CRASH.value,
+    }
+
+    # The revision replaced the bar's contribution instead of stacking on it
+    fresh = StreamingAnomalyEngine()
+    fresh.ingest("EURUSD", "M15", revised.to_dict("records"))
+    state, expected = engine._streams["EURUSD|M15"], fresh._streams["EURUSD|M15"]
+    assert list(state.returns) == pytest.approx(list(expected.returns))
+    assert list(state.volumes) == list(expected.volumes)
+    assert state.last_close == expected.last_close == 0.95
+    assert state.bars_seen == expected.bars_seen == len(df)
+
+    # Unchanged re-scans, and further revisions of the same crash, emit nothing
+    assert engine.ingest("EURUSD", "M15", revised.to_dict("records")) == []
+    revised.loc[revised.index[-1], ["low", "close"]] = 0.94
+    assert engine.ingest("EURUSD", "M15", revised.tail(5).to_dict("records")) == []
+
+
+@pytest.mark.asyncio
+async def test_service_scans_catch_a_crash_on_the_forming_bar():
+    storage = MagicMock()
+    storage.get_dynamic_params.return_value = {}
+    storage.persist_anomaly_event = AsyncMock()
+    service = AnomalyService(storage=storage, risk_manager=None, socket_service=MagicMock(broadcast=AsyncMock()))
+    df = _flat_m15()
+    assert (await service.execute_full_anomaly_scan("EURUSD", {"M15": df}))["total_anomalies"] == 0
+
+    revised = df.copy()
+    revised.loc[revised.index[-1], ["low", "close"]] = 0.95
+    assert (await service.execute_full_anomaly_scan("EURUSD", {"M15": revised}))["total_anomalies"] == 2
+    assert (await service.execute_full_anomaly_scan("EURUSD", {"M15": revised}))["total_anomalies"] == 0
+    assert storage.persist_anomaly_event.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_repeated_scans_do_not_persist_duplicate_rows():
+    storage = MagicMock()
+    storage.get_dynamic_params.return_value = {}
+    storage.persist_anomaly_event = AsyncMock()
+    service = AnomalyService(storage=storage, risk_manager=None, socket_service=MagicMock(broadcast=AsyncMock()))
+    data = {"M15": _with_crash(_frame())}
+
+    first = await service.execute_full_anomaly_scan("EURUSD", data)
+    assert first["total_anomalies"] == 2  # extreme volatility + flash crash on the same bar
+    types = {c.kwargs["anomaly_type"] for c in storage.persist_anomaly_event.call_args_list}
+    assert types == {AnomalyType.EXTREME_VOLATILITY.value, AnomalyType.FLASH_CRASH.value}
+
+    second = await service.execute_full_anomaly_scan("EURUSD", data)
+    assert second["total_anomalies"] == 0
+    assert storage.persist_anomaly_event.await_count == 2
+
+
+def test_sentinel_streams_escalate_once_and_do_not_mix_symbols():
+    sentinel = AnomalySentinel()
+    eurusd = _frame()
+    usdjpy = _frame(base=150.0, seed=11)
+
+    # Feed exactly like the scan cycle: the last 10 bars of every snapshot, every cycle
+    for end in range(30, len(eurusd) + 1, 5):
+        sentinel.push_ticks(eurusd.iloc[:end].tail(10).to_dict("records"), symbol="EURUSD", timeframe="M15")
+        sentinel.push_ticks(usdjpy.iloc[:end].tail(10).to_dict("records"), symbol="USDJPY", timeframe="M15")
+        assert sentinel.get_defense_protocol() == DefenseProtocol.NONE
+
+    crashed = _with_crash(eurusd)
+    for _ in range(3):
+        sentinel.push_ticks(crashed.tail(10).to_dict("records"), symbol="EURUSD", timeframe="M15")
+    assert sentinel.get_defense_protocol() == DefenseProtocol.LOCKDOWN
+    assert sentinel._detect_stream_anomalies("re-check") == DefenseProtocol.NONE  # drained once
+
+
+def test_sentinel_keeps_tick_buffers_and_limits_crash_lockdown_to_intraday():
+    sentinel = AnomalySentinel()
+    ticks = [{"close": 1.10, "spread": 1.0}] * 9 + [{"close": 1.10, "spread": 25.0}]
+    sentinel.push_ticks(ticks, symbol="EURUSD", timeframe="M5")
+    assert sentinel.get_defense_protocol() == DefenseProtocol.WARNING  # spread spike still seen
+    assert sentinel._last_spread_ratio == pytest.approx(25.0)
+
+    # A -3% day is within normal D1 crypto noise (~2%/day): no global lockdown
+    rng = np.random.default_rng(3)
+    closes = 60_000 * np.exp(np.cumsum(rng.normal(0, 0.02, 80)))
+    daily = pd.DataFrame({
+        "timestamp": pd.date_range("2025-06-01", periods=80, freq="1D"),
+        "open": closes, "high": closes, "low": closes, "close": closes, "volume": 1000.0,
+    })
+    sentinel.stream_engine.ingest("BTCUSD", "D1", _with_crash(daily).to_dict("records"))
+    assert sentinel._detect_stream_anomalies("d1") == DefenseProtocol.WARNING
+
+    sentinel.stream_engine.ingest("BTCUSD", "M15", _with_crash(_frame()).to_dict("records"))
+    assert sentinel._detect_stream_anomalies("m15") == DefenseProtocol.LOCKDOWN
+
+
+def test_sentinel_tick_buffers_stay_per_stream():
+    sentinel = AnomalySentinel()
+    for cycle in range(3):
+        sentinel.push_ticks([{"time": cycle * 5 + i, "close": 1.10, "spread": 1.0} for i in range(10)],
+                            symbol="EURUSD", timeframe="M5")
+        # USDJPY's normal spread is 20x EURUSD's: mixed into one buffer it would read as a spike
+        sentinel.push_ticks([{"time": cycle, "close": 150.0, "spread": 20.0}], symbol="USDJPY", timeframe="M5")
+        assert sentinel.get_defense_protocol() == DefenseProtocol.NONE
+    assert len(sentinel._prices) == 0
+    assert set(sentinel._stream_ticks) == {"EURUSD|M5", "USDJPY|M5"}
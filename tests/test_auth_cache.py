@@ -0,0 +1,143 @@
+"""
+Tests for the verified-token cache behind the auth dependencies (PERF-AUTH-VERIFY-CACHE-2026-001).
+
+These tests exercise:
+  - Hits skip JWT decoding; expiry is re-checked on every hit
+  - Entries are bound to the signing secret; test doubles are never cached
+  - Logout (revoke) and DB-side revocations reject the token immediately
+  - Periodic revocation re-reads run off the request thread and skip expired rows
+  - LRU bound and metrics
+"""
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+from fastapi import Response
+
+from core_brain.api.dependencies import auth_cache
+from core_brain.api.dependencies.auth_cache import AuthVerificationCache, hash_token
+from core_brain.api.dependencies.session_manager import SessionManager
+from core_brain.services.auth_service import AuthService
+
+
+class _Repo:
+    def __init__(self, secret: str) -> None:
+        self.secret = secret
+
+    def get_jwt_secret(self) -> str:
+        return self.secret
+
+
+def _service(secret: str = "unit-test-signing-secret-0123456789") -> AuthService:
+    return AuthService(auth_repo=_Repo(secret))
+
+
+def _cache(storage, **kwargs) -> AuthVerificationCache:
+    return AuthVerificationCache(storage_resolver=lambda: storage, **kwargs)
+
+
+def test_second_verification_is_a_hit_without_decoding(storage):
+    service = _service()
+    cache = _cache(storage)
+    token = service.create_access_token(subject="user-1", role="trader")
+
+    first = cache.verify(token, service)
+    decode = service.decode_token
+    service.decode_token = MagicMock(side_effect=AssertionError("decoded on a hit"))
+    assert cache.verify(token, service) == first
+    service.decode_token = decode
+    assert first.sub == "user-1"
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    other = _service("another-unit-test-signing-secret-0123")
+    assert cache.verify(token, other) is None  # not valid under another secret
+    assert cache.verify("not-a-jwt", service) is None
+
+
+def test_expired_entries_are_not_served(storage):
+    service = _service()
+    cache = _cache(storage)
+    token = service.create_access_token(subject="user-1", expires_delta=timedelta(seconds=1))
+    assert cache.verify(token, service) is not None
+
+    time.sleep(1.1)
+    assert cache.verify(token, service) is None
+    assert cache.stats()["expired"] == 1
+
+
+def test_test_doubles_are_never_cached(storage):
+    cache = _cache(storage)
+    double = MagicMock()
+    double.decode_token.return_value = "claims"
+
+    assert cache.verify("tok", double) == "claims"
+    assert cache.verify("tok", double) == "claims"
+    assert double.decode_token.call_count == 2
+    assert cache.stats()["size"] == 0
+
+
+def test_logout_revokes_immediately_and_db_revocations_are_synced(storage, monkeypatch):
+    service = _service()
+    cache = _cache(storage, sync_interval_s=3600)
+    monkeypatch.setattr(auth_cache, "_auth_cache_instance", cache)
+    logged_out = service.create_access_token(subject="user-1")
+    remote = service.create_access_token(subject="user-2")
+    assert cache.verify(logged_out, service) and cache.verify(remote, service)
+
+    SessionManager(storage).revoke_session(Response(), token=logged_out, user_id="user-1")
+    assert cache.verify(logged_out, service) is None
+
+    # Revocation written by another process: visible on the next sync
+    expires = datetime.now(timezone.utc) + timedelta(minutes=15)
+    storage.execute_query(
+        "INSERT INTO sys_session_tokens (token_hash, user_id, token_type, expires_at, revoked) "
+        "VALUES (?, 'user-2', 'access', ?, 1)",
+        (hash_token(remote), expires),
+    )
+    assert cache.verify(remote, service) is not None  # throttled, still cached
+    cache.revoke_user("user-2")
+    assert cache.verify(remote, service) is None
+    assert cache.stats()["revoked_rejections"] == 2
+
+
+def test_periodic_sync_runs_off_the_request_thread_and_skips_expired_rows(storage):
+    service = _service()
+    reads = []
+
+    def resolver():
+        reads.append(threading.current_thread().name)
+        return storage
+
+    cache = AuthVerificationCache(storage_resolver=resolver, sync_interval_s=0.0)
+    token = service.create_access_token(subject="user-1")
+    assert cache.verify(token, service) is not None
+    assert reads == [threading.current_thread().name]  # first read is inline
+
+    now = datetime.now(timezone.utc)
+    storage.execute_query(
+        "INSERT INTO sys_session_tokens (token_hash, user_id, token_type, expires_at, revoked) "
+        "VALUES (?, 'user-1', 'access', ?, 1), ('stale', 'user-1', 'access', ?, 1)",
+        (hash_token(token), now + timedelta(minutes=15), now - timedelta(days=1)),
+    )
+    assert cache.verify(token, service) is not None  # request keeps the current set
+    deadline = time.time() + 5
+    while cache.stats()["syncs"] < 2 and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert reads[1] == "auth-revocation-sync"
+    assert cache.stats()["revoked_tokens"] == 1
+    assert cache.verify(token, service) is None
+
+
+def test_cache_is_bounded_lru(storage):
+    service = _service()
+    cache = _cache(storage, max_entries=2)
+    tokens = [service.create_access_token(subject=f"user-{i}") for i in range(3)]
+    for token in tokens:
+        cache.verify(token, service)
+
+    stats = cache.stats()
+    assert stats["size"] == 2 and stats["evictions"] == 1
+    cache.verify(tokens[2], service)
+    assert cache.stats()["hits"] == 1
@@ -0,0 +1,219 @@
+"""
+Tests for the multi-timeframe bar roll-up engine (PERF-BAR-ROLLUP-2026-001).
+
+These tests exercise:
+  - Incremental roll-up of overlapping M1 fetches (revised forming bar, weekend
+    gap, broker server offset) matching a pandas resample of the final series
+  - Session and weekend bucket rules (W1 on Sunday, folded Sunday D1, sealing)
+  - Tick ingestion into base bars
+  - Output ``time`` keeping the base stream's dtype (MT5 naive, epoch, UTC)
+  - DataProviderManager collapsing every timeframe into one base fetch per
+    symbol, plus reconciliation against broker-native bars
+  - Base-stream gaps refilled with a full-history fetch, and native and
+    rolled-up frames served with one column set
+"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import core_brain.data_provider_manager as dpm
+from connectors.replay_data_provider import ReplayDataProvider
+from core_brain.bar_aggregator import OUTPUT_COLUMNS, BarAggregator
+from core_brain.data_provider_manager import DataProviderManager
+
+PRICES = ["open", "high", "low", "close"]
+
+
+def _m1(start, periods, seed):
+    rng = np.random.default_rng(seed)
+    close = 1.10 + np.cumsum(rng.normal(0, 0.0002, periods))
+    open_ = np.concatenate([[1.10], close[:-1]])
+    return pd.DataFrame({
+        "time": pd.date_range(start, periods=periods, freq="1min", tz="UTC"),
+        "open": open_,
+        "high": np.maximum(open_, close) + 0.0001,
+        "low": np.minimum(open_, close) - 0.0001,
+        "close": close,
+        "volume": rng.integers(1, 50, periods).astype(float),
+    })
+
+
+def _resample(m1, rule, offset):
+    return (
+        m1.set_index("time")
+        .resample(rule, offset=offset, label="left", closed="left")
+        .agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+        .dropna(subset=["open"])
+        .reset_index()
+    )
+
+
+def test_incremental_rollup_matches_resample_across_weekend_gap():
+    # Friday evening, weekend gap, Sunday open — broker on GMT+2
+    m1 = pd.concat([_m1("2026-01-09 20:00", 180, seed=1), _m1("2026-01-11 22:00", 240, seed=2)],
+                   ignore_index=True)
+    agg = BarAggregator(["M15", "H4", "D1"], server_utc_offset_hours=2)
+
+    # Overlapping fetches; the last bar of each fetch is still forming and revised later
+    for end in range(40, len(m1) + 1, 37):
+        chunk = m1.iloc[max(0, end - 45):end].copy()
+        chunk.loc[chunk.index[-1], "close"] += 0.01
+        agg.ingest_bars("EURUSD", chunk)
+        if end == 40:
+            assert all(agg.seed("EURUSD", tf) for tf in agg.timeframes)  # no broker history
+    agg.ingest_bars("EURUSD", m1.iloc[-60:])
+
+    for tf, rule in (("M15", "15min"), ("H4", "4h"), ("D1", "24h")):
+        expected = _resample(m1, rule, offset="-2h")
+        got = agg.frame("EURUSD", tf, 1000)
+        assert got["time"].tolist() == expected["time"].tolist(), tf
+        np.testing.assert_allclose(got[PRICES + ["volume"]].to_numpy(), expected[PRICES + ["volume"]].to_numpy())
+        assert agg.forming_bar("EURUSD", tf)[0] == expected["time"].iloc[-1].timestamp()
+
+    # Re-ingesting history behind the watermark changes nothing
+    before = agg.frame("EURUSD", "H4", 1000)
+    assert agg.ingest_bars("EURUSD", m1.iloc[-10:]) == 1  # only the forming bar is revised
+    pd.testing.assert_frame_equal(agg.frame("EURUSD", "H4", 1000), before)
+
+
+def test_session_and_weekend_bucket_rules():
+    utc = BarAggregator(["D1", "W1"], fold_weekend=True)
+    sunday_open = int(datetime(2026, 1, 11, 22, tzinfo=timezone.utc).timestamp())
+    monday = int(datetime(2026, 1, 12, tzinfo=timezone.utc).timestamp())
+    assert utc.bucket_start(sunday_open, "D1") == monday  # short Sunday session folds into Monday
+    assert utc.bucket_start(sunday_open, "W1") == monday - 86400  # weeks open on Sunday (MT5)
+
+    broker = BarAggregator(["H4", "D1"], server_utc_offset_hours=3)
+    assert broker.bucket_start(sunday_open, "D1") == sunday_open - 3600  # 21:00 UTC == server midnight
+    assert broker.bucket_start(sunday_open, "H4") == sunday_open - 3600
+
+    # Friday's last hour is sealed by time, without waiting for Sunday's first bar
+    agg = BarAggregator(["H1"])
+    friday = int(datetime(2026, 1, 9, 21, tzinfo=timezone.utc).timestamp())
+    for minute in range(60):
+        agg.ingest_tick("EURUSD", friday + minute * 60 + 5, 1.10 + minute * 1e-4)
+        agg.ingest_tick("EURUSD", friday + minute * 60 + 30, 1.10 + minute * 1e-4 - 5e-5, volume=2.0)
+    assert agg.seed("EURUSD", "H1")
+    assert agg.closed_bars("EURUSD", "H1") == []
+    assert agg.forming_bar("EURUSD", "H1")[:5] == pytest.approx((friday, 1.10, 1.1059, 1.09995, 1.10585))
+
+    agg.seal("EURUSD", friday + 3600)
+    assert agg.forming_bar("EURUSD", "H1") is None
+    (bar,) = agg.closed_bars("EURUSD", "H1")
+    assert bar[0] == friday and bar[5] == 180.0
+
+
+def test_output_time_keeps_the_base_stream_dtype():
+    utc = _m1("2026-01-12 08:00", 120, seed=3)
+    naive = utc.assign(time=utc["time"].dt.tz_localize(None))  # MT5: server time, no tz
+    epoch = utc.assign(time=(utc["time"] - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(seconds=1))
+
+    for base in (naive, epoch, utc):
+        agg = BarAggregator(["M15"])
+        agg.ingest_bars("EURUSD", base)
+        assert agg.seed("EURUSD", "M15")
+        got = agg.frame("EURUSD", "M15", 100)["time"]
+        assert got.dtype == base["time"].dtype
+        assert got.iloc[0] == base["time"].iloc[0] and got.iloc[-1] == base["time"].iloc[-15]
+
+
+def test_manager_serves_all_timeframes_from_one_base_fetch():
+    storage = MagicMock()
+    storage.get_dynamic_params.return_value = {}
+    storage.get_sys_data_providers.return_value = []
+    provider = ReplayDataProvider.synthetic(["EURUSD"], bars=3000, warmup_bars=700, base_timeframe="M1")
+    spy = MagicMock(wraps=provider)
+    spy.is_symbol_supported.side_effect = provider.is_symbol_supported
+
+    agg = BarAggregator(["M5", "M15", "H1"], reconcile_interval_seconds=3600, reconcile_bars=20)
+    manager = DataProviderManager(storage=storage, bar_aggregator=agg)
+    clock = [0.0]
+    timeframes = ["M1", "M5", "M15", "H1"]
+
+    with patch.object(dpm, "time", SimpleNamespace(monotonic=lambda: clock[0], time=lambda: clock[0])), \
+         patch.object(manager, "get_active_providers", return_value=[{"name": "replay", "supports": []}]), \
+         patch.object(manager, "_get_provider_instance", return_value=spy):
+        seeded = {tf: manager.fetch_ohlc("EURUSD", tf, 100) for tf in timeframes}
+        # first cycle: one base fetch + one native seed per roll-up
+        assert [c.args[1] for c in spy.fetch_ohlc.call_args_list] == timeframes
+
+        for _ in range(3):
+            spy.fetch_ohlc.reset_mock()
+            provider.advance(17)
+            clock[0] += 17 * 60
+            frames = {tf: manager.fetch_ohlc("EURUSD", tf, 100) for tf in timeframes}
+            assert [c.args[1] for c in spy.fetch_ohlc.call_args_list] == ["M1"]
+
+        m1 = provider.fetch_ohlc("EURUSD", "M1", 10_000)
+        for tf, rule in (("M5", "5min"), ("M15", "15min"), ("H1", "1h")):
+            assert frames[tf]["time"].dtype == seeded[tf]["time"].dtype  # native seed and roll-up alike
+            expected = _resample(m1, rule, offset=None).tail(100)
+            assert frames[tf]["time"].tolist() == expected["time"].tolist(), tf
+            np.testing.assert_allclose(frames[tf][PRICES].to_numpy(), expected[PRICES].to_numpy())
+
+        # Closed roll-ups agree with broker-native bars
+        report = agg.reconcile("EURUSD", "H1", provider.fetch_ohlc("EURUSD", "H1", 20))
+        assert report.ok and report.compared > 0
+
+        # A diverging broker series is detected on the next reconciliation and reseeded
+        native = provider.fetch_ohlc("EURUSD", "M15", 20).copy()
+        native.loc[5, "high"] += 0.01
+        assert agg.reconcile("EURUSD", "M15", native).mismatches[0]["field"] == "high"
+        spy.fetch_ohlc.side_effect = lambda s, tf, n: native if tf == "M15" else provider.fetch_ohlc(s, tf, n)
+        clock[0] += 3600
+        served = manager.fetch_ohlc("EURUSD", "M15", 20)
+        pd.testing.assert_frame_equal(served, native[OUTPUT_COLUMNS].astype({"volume": float}))
+        assert not agg.is_seeded("EURUSD", "M15") and agg.is_seeded("EURUSD", "H1")
+
+
+def test_manager_refills_a_base_gap_and_keeps_one_column_set():
+    storage = MagicMock()
+    storage.get_dynamic_params.return_value = {}
+    storage.get_sys_data_providers.return_value = []
+    provider = ReplayDataProvider.synthetic(["EURUSD"], bars=3000, warmup_bars=700, base_timeframe="M1")
+
+    def fetch(symbol, tf, n):
+        frame = provider.fetch_ohlc(symbol, tf, n)
+        # Native broker bars in a provider's own layout: tick volume only, extra columns
+        return frame if tf == "M1" else frame.drop(columns=["volume"]).assign(spread=2)
+
+    spy = MagicMock(fetch_ohlc=MagicMock(side_effect=fetch))
+    spy.is_symbol_supported.side_effect = provider.is_symbol_supported
+    agg = BarAggregator(["M15", "H1"], reconcile_interval_seconds=10**9)
+    manager = DataProviderManager(storage=storage, bar_aggregator=agg)
+    clock = [0.0]
+    timeframes = ["M1", "M15", "H1"]
+
+    with patch.object(dpm, "time", SimpleNamespace(monotonic=lambda: clock[0], time=lambda: clock[0])), \
+         patch.object(manager, "get_active_providers", return_value=[{"name": "replay", "supports": []}]), \
+         patch.object(manager, "_get_provider_instance", return_value=spy):
+        seeded = {tf: manager.fetch_ohlc("EURUSD", tf, 100) for tf in timeframes}
+        clock[0] += 60
+        rolled = {tf: manager.fetch_ohlc("EURUSD", tf, 100) for tf in timeframes}
+        for tf in timeframes:
+            assert list(seeded[tf].columns) == list(rolled[tf].columns) == OUTPUT_COLUMNS, tf
+
+        # The feed jumped 300 bars during a 1-minute refresh window: the short
+        # incremental fetch does not overlap, so the full history is pulled at
+        # once and bridges the hole without dropping the roll-ups
+        spy.fetch_ohlc.reset_mock()
+        provider.advance(300)
+        clock[0] += 60
+        frames = {tf: manager.fetch_ohlc("EURUSD", tf, 100) for tf in timeframes}
+        calls = [c.args[1:] for c in spy.fetch_ohlc.call_args_list]
+        assert calls == [("M1", 3), ("M1", agg.history_capacity)]
+
+        spy.fetch_ohlc.reset_mock()
+        provider.advance(2)
+        clock[0] += 120
+        frames = {tf: manager.fetch_ohlc("EURUSD", tf, 100) for tf in timeframes}
+        assert [c.args[1] for c in spy.fetch_ohlc.call_args_list] == ["M1"]
+
+    m1 = provider.fetch_ohlc("EURUSD", "M1", 10_000)
+    expected = _resample(m1, "15min", offset=None).tail(100)
+    assert frames["M15"]["time"].tolist() == expected["time"].tolist()
+    np.testing.assert_allclose(frames["M15"][PRICES].to_numpy(), expected[PRICES].to_numpy())
@@ -0,0 +1,149 @@
+"""
+Tests for the per-connector broker state mirror (PERF-BROKER-MIRROR-2026-001).
+
+These tests exercise:
+  - One broker round-trip per interval, whatever the number of readers
+  - Immutable, versioned snapshots indexed by symbol, ticket, magic and comment
+  - Change events on open / modify / close, and invalidation on trade events
+  - Consumers read through the mirror and keep their behaviour without one
+  - Attaching a mirror does not widen which broker orders the lockdown cancels
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+from core_brain import broker_state_mirror as bsm
+from core_brain.broker_state_mirror import (
+    BrokerStateMirror,
+    mirrored_open_positions,
+    mirrored_pending_orders,
+    register_broker_mirror,
+    unregister_broker_mirror,
+)
+from core_brain.multi_timeframe_limiter import MultiTimeframeLimiter
+from core_brain.risk_manager import RiskManager
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Broker:
+    def __init__(self) -> None:
+        self.is_connected = True
+        self.positions = [
+            {"ticket": 1, "symbol": "EURUSD", "sl": 1.09, "profit": 3.0, "magic": 234000, "comment": "AETH-a"},
+            {"ticket": 2, "symbol": "GBPUSD", "sl": 1.25, "profit": -1.0, "magic": 234000, "comment": "AETH-b"},
+        ]
+        self.orders = [{"ticket": 10, "symbol": "EURUSD", "price_open": 1.08, "magic": 99, "comment": "manual"}]
+        self.calls = {"positions": 0, "orders": 0}
+
+    def get_open_positions(self):
+        self.calls["positions"] += 1
+        return None if self.positions is None else [dict(p) for p in self.positions]
+
+    def get_pending_orders(self, symbol=None):
+        self.calls["orders"] += 1
+        return [dict(o) for o in self.orders if symbol is None or o["symbol"] == symbol]
+
+
+@pytest.fixture
+def broker():
+    connector = _Broker()
+    yield connector
+    unregister_broker_mirror(connector)
+
+
+def test_reads_within_the_interval_share_one_round_trip(broker):
+    clock = _Clock()
+    mirror = register_broker_mirror(broker, BrokerStateMirror(broker, refresh_interval_s=1.0, clock=clock))
+
+    for symbol in ("EURUSD", "GBPUSD", "USDJPY") * 10:
+        mirrored_open_positions(broker, symbol)
+        mirrored_pending_orders(broker, symbol)
+    assert broker.calls == {"positions": 1, "orders": 1}
+
+    clock.now += 1.0
+    assert [p["ticket"] for p in mirrored_open_positions(broker, "EURUSD")] == [1]
+    assert broker.calls == {"positions": 2, "orders": 2}
+    assert mirror.stats["refreshes"] == 2
+
+
+def test_snapshot_is_immutable_and_indexed(broker):
+    snap = BrokerStateMirror(broker, clock=_Clock()).snapshot()
+
+    assert snap.version == 1 and snap.positions_ok and snap.orders_ok
+    assert snap.position(2)["symbol"] == "GBPUSD" and snap.order(10)["price_open"] == 1.08
+    assert [r["ticket"] for r in snap.by_magic(234000)] == [1, 2]
+    assert [r["ticket"] for r in snap.by_comment("manual")] == [10]
+    assert snap.orders_for("GBPUSD") == ()
+    with pytest.raises(TypeError):
+        snap.positions[0]["sl"] = 0.0
+    broker.positions[0]["sl"] = 0.0
+    assert snap.position(1)["sl"] == 1.09  # broker-side lists are copied
+
+
+def test_changes_bump_the_version_and_emit_events(broker):
+    clock = _Clock()
+    mirror = BrokerStateMirror(broker, clock=clock)
+    events = []
+    unsubscribe = mirror.subscribe(events.append)
+    first = mirror.snapshot()
+
+    assert mirror.refresh().version == first.version  # nothing changed
+    broker.positions[0]["profit"] = 9.0  # quote move: new version, no event
+    assert mirror.refresh().version == first.version + 1 and events == []
+
+    broker.positions[0]["sl"] = 1.095
+    del broker.positions[1]
+    broker.positions.append({"ticket": 3, "symbol": "AUDUSD", "sl": 0.6})
+    mirror.invalidate()
+    snap = mirror.snapshot()
+
+    assert {(e.kind, e.action, e.ticket) for e in events} == {
+        ("position", "modified", 1), ("position", "closed", 2), ("position", "opened", 3),
+    }
+    assert all(e.version == snap.version for e in events)
+    unsubscribe()
+    broker.positions.clear()
+    mirror.refresh()
+    assert len(events) == 3
+
+
+def test_failed_fetch_is_unavailable_not_flat(broker):
+    mirror = register_broker_mirror(broker, BrokerStateMirror(broker, clock=_Clock()))
+    events = []
+    mirror.subscribe(events.append)
+    mirror.snapshot()
+
+    broker.positions = None
+    mirror.invalidate()
+    assert mirrored_open_positions(broker) is None
+    assert mirrored_pending_orders(broker, "EURUSD")[0]["ticket"] == 10
+    assert events == []  # an outage is not a mass close
+
+
+def test_limiter_reads_through_the_mirror_and_falls_back_without_it(broker):
+    limiter = MultiTimeframeLimiter(storage=MagicMock(), config={}, connector=broker)
+    assert [p["ticket"] for p in limiter._get_open_usr_positions_by_symbol("EURUSD")] == [1]
+    assert broker.calls["positions"] == 1  # no mirror: direct call
+
+    register_broker_mirror(broker, BrokerStateMirror(broker, clock=_Clock()))
+    for _ in range(5):
+        limiter._get_open_usr_positions_by_symbol("GBPUSD")
+    assert broker.calls["positions"] == 2
+    assert bsm.get_broker_mirror(MagicMock()) is None
+
+
+async def test_mirror_does_not_widen_lockdown_order_cancellation(broker):
+    register_broker_mirror(broker, BrokerStateMirror(broker, clock=_Clock()))
+    broker.cancel_order = MagicMock(return_value={"success": True})
+    rm = RiskManager(storage=MagicMock(), connectors={"MT5": broker})
+
+    result = await rm.cancel_pending_usr_orders(symbol="EURUSD", reason="Flash Crash")
+    assert result["cancelled"] == 0
+    broker.cancel_order.assert_not_called()  # mirrored orders (get_pending_orders) stay untouched
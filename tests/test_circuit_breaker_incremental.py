@@ -0,0 +1,181 @@
+"""
+Tests for the event-driven CircuitBreaker (PERF-CB-INCREMENTAL-2026-001).
+
+These tests exercise:
+  - Rolling loss streak / drawdown / profit-factor windows advanced per closed trade
+  - Degradation within the trade that crosses a threshold (no sweep needed)
+  - Blocked/allowed lookups served from the in-memory bitmap, with bulk resync
+  - The executor gate's fresh ranking read overriding a stale bit
+  - TradeClosureListener feeding closed trades to the breaker
+  - One shared breaker per storage, released together with it
+"""
+import gc
+import weakref
+from collections import deque
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core_brain.circuit_breaker import (
+    CB_CONSECUTIVE_LOSSES_THRESHOLD,
+    CircuitBreaker,
+    StrategyRiskWindow,
+    circuit_breaker_for,
+)
+from core_brain.services.circuit_breaker_gate import CircuitBreakerGate
+from core_brain.trade_closure_listener import TradeClosureListener
+from data_vault.storage import StorageManager
+from models.broker_event import BrokerEvent, BrokerTradeClosedEvent, TradeResult
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def storage():
+    rankings = {
+        "S_LIVE": {"strategy_id": "S_LIVE", "execution_mode": "LIVE", "drawdown_max": 0.5,
+                   "consecutive_losses": 2, "profit_factor": 1.4, "total_usr_trades": 40},
+        "S_SHADOW": {"strategy_id": "S_SHADOW", "execution_mode": "SHADOW"},
+    }
+    mock = MagicMock(spec=StorageManager)
+    mock.rankings = rankings
+    mock.get_signal_ranking.side_effect = lambda sid: rankings.get(sid)
+    mock.get_strategies_by_mode.side_effect = lambda mode: [
+        r for r in rankings.values() if r["execution_mode"] == mode
+    ]
+
+    def update_mode(sid, mode, trace_id=None):
+        rankings[sid]["execution_mode"] = mode
+        return "CB-TRACE"
+
+    mock.update_strategy_execution_mode.side_effect = update_mode
+    return mock
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def breaker(storage, clock):
+    return CircuitBreaker(storage=storage, capital=10000.0, clock=clock)
+
+
+def test_window_tracks_streak_drawdown_and_profit_factor():
+    window = StrategyRiskWindow()
+    for pnl in (200.0, -50.0, -100.0, 300.0, -150.0):
+        window.push(pnl, capital=10000.0)
+
+    assert window.consecutive_losses == 1
+    assert window.drawdown_pct == pytest.approx(1.5)   # peak 350 → 200
+    assert window.drawdown_max == pytest.approx(1.5)
+    assert window.profit_factor == pytest.approx(500.0 / 300.0)
+
+    small = StrategyRiskWindow(results=deque(maxlen=2))
+    for pnl in (-10.0, 30.0, 20.0):
+        small.push(pnl, capital=1000.0)
+    assert (small.gross_win, small.gross_loss) == (50.0, 0.0)  # evicted loss leaves the window
+
+    breakeven = StrategyRiskWindow()
+    for pnl in (-10.0, -10.0, 0.0):
+        breakeven.push(pnl, capital=1000.0)
+    assert breakeven.consecutive_losses == 0 and breakeven.gross_loss == 20.0
+
+
+def test_degrades_on_the_trade_that_crosses_the_streak(breaker, storage):
+    # Seeded streak of 2: the third loss in a row (5 total) trips immediately
+    results = [breaker.on_trade_closed("S_LIVE", -10.0) for _ in range(CB_CONSECUTIVE_LOSSES_THRESHOLD - 2)]
+
+    assert [r["action"] for r in results] == ["no_action", "no_action", "degraded"]
+    assert results[-1]["reason"] == "consecutive_losses_exceeded"
+    storage.update_strategy_execution_mode.assert_called_once_with("S_LIVE", "QUARANTINE", trace_id=None)
+    storage.get_strategies_by_mode.assert_called_once()  # one bulk seed, no per-trade sweep
+    assert breaker.is_strategy_blocked_for_trading("S_LIVE") is True
+    assert breaker.get_strategy_status("S_LIVE") == "QUARANTINE"
+    assert breaker.on_trade_closed("S_LIVE", -10.0)["action"] == "skipped"
+
+
+def test_drawdown_trips_and_wins_reset_the_streak(breaker):
+    assert breaker.on_trade_closed("S_LIVE", 100.0)["consecutive_losses"] == 0
+    assert breaker.on_trade_closed("S_LIVE", -200.0)["action"] == "no_action"
+
+    result = breaker.on_trade_closed("S_LIVE", -200.0)  # 4% below the +100 peak
+    assert result["action"] == "degraded" and result["reason"] == "drawdown_exceeded"
+    assert result["drawdown_max"] == pytest.approx(4.0)
+
+
+def test_lookups_come_from_the_bitmap_and_resync_in_bulk(breaker, storage, clock):
+    assert breaker.is_strategy_blocked_for_trading("S_LIVE") is False
+    assert breaker.is_strategy_blocked_for_trading("S_SHADOW") is True
+    assert breaker.is_strategy_blocked_for_trading("S_MISSING") is True
+    for _ in range(100):
+        breaker.is_strategy_blocked_for_trading("S_LIVE")
+    assert storage.get_signal_ranking.call_count == 2  # only the two strategies never seen
+
+    # Promotion made elsewhere becomes visible on the next resync
+    storage.rankings["S_SHADOW"]["execution_mode"] = "LIVE"
+    assert breaker.is_strategy_blocked_for_trading("S_SHADOW") is True
+    clock.now += breaker.resync_interval_s
+    assert breaker.is_strategy_blocked_for_trading("S_SHADOW") is False
+    assert breaker.stats["resyncs"] == 2
+
+
+def test_gate_mode_read_overrides_a_stale_bit(breaker, storage):
+    gate = CircuitBreakerGate(circuit_breaker=breaker, storage=storage, dynamic_params={})
+    assert gate.check_strategy_authorization("S_LIVE", "EURUSD", "SIG-1") == (True, None)
+
+    # Quarantined elsewhere (another process): rejected on the very next signal
+    storage.rankings["S_LIVE"]["execution_mode"] = "QUARANTINE"
+    assert gate.check_strategy_authorization("S_LIVE", "EURUSD", "SIG-2")[0] is False
+    assert breaker.is_strategy_blocked_for_trading("S_LIVE", execution_mode="QUARANTINE") is True
+
+    # Re-promoted before the next resync: the stale blocked bit does not reject it
+    storage.rankings["S_LIVE"]["execution_mode"] = "LIVE"
+    assert gate.check_strategy_authorization("S_LIVE", "EURUSD", "SIG-3") == (True, None)
+    assert breaker.stats["resyncs"] == 1
+
+
+@pytest.mark.asyncio
+async def test_listener_feeds_closed_trades_to_the_shared_breaker(storage):
+    storage.trade_exists.return_value = False
+    storage.get_signal_by_id.return_value = {"metadata": '{"strategy_id": "S_LIVE"}'}
+    breaker = circuit_breaker_for(storage)
+    assert circuit_breaker_for(storage) is breaker
+    risk_manager = MagicMock(capital=10000.0, consecutive_losses=0)
+    risk_manager.is_locked.return_value = False
+    listener = TradeClosureListener(storage=storage, risk_manager=risk_manager,
+                                    edge_tuner=MagicMock(), circuit_breaker=breaker)
+    listener._process_edge_feedback = AsyncMock()
+    listener._trigger_tuner = AsyncMock()
+    listener._lookup_shadow_instance_id = MagicMock(return_value=None)
+
+    now = datetime.now(timezone.utc)
+    for ticket in range(3):
+        trade = BrokerTradeClosedEvent(
+            ticket=str(ticket), symbol="EURUSD", entry_price=1.1, exit_price=1.09,
+            entry_time=now, exit_time=now, pips=-10.0, profit_loss=-25.0, result=TradeResult.LOSS,
+            exit_reason="stop_loss", broker_id="MT5", signal_id="SIG-1",
+        )
+        assert await listener.handle_trade_closed_event(BrokerEvent.from_trade_closed(trade)) is True
+
+    assert breaker.get_strategy_status("S_LIVE") == "QUARANTINE"
+    storage.log_strategy_state_change.assert_called_once()
+
+
+def test_shared_breaker_is_per_storage_and_released_with_it(storage):
+    other = MagicMock(spec=StorageManager)
+    assert circuit_breaker_for(storage) is circuit_breaker_for(storage)
+    assert circuit_breaker_for(other) is not circuit_breaker_for(storage)
+
+    released = weakref.ref(circuit_breaker_for(other))
+    del other
+    gc.collect()
+    assert released() is None
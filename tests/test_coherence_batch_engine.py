@@ -0,0 +1,160 @@
+"""
+Tests for CoherenceBatchEngine (batched coherence gate over the LIVE roster).
+TRACE_ID: COHERENCE-BATCH-GATE-2026-001
+
+These tests exercise:
+  - Decision parity with CoherenceService.check_coherence_veto per strategy
+  - Incremental ingestion (id watermark) and window eviction
+  - One audit write per cycle and the async orchestrator gate
+"""
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from core_brain.orchestrators._guard_suite import run_coherence_gate
+from core_brain.services.coherence_batch_engine import CoherenceBatchEngine
+from core_brain.services.coherence_service import CoherenceService
+
+
+def _log(storage, symbol: str, slippage: float, latency: float = 20.0) -> None:
+    storage.log_execution_shadow(
+        signal_id=f"sig-{uuid.uuid4().hex[:8]}", symbol=symbol,
+        theoretical_price=Decimal("1.1"), real_price=Decimal("1.1"),
+        slippage_pips=Decimal(str(slippage)), latency_ms=latency, status="SUCCESS",
+        user_id=getattr(storage, "user_id", None) or "default", trace_id=f"t-{uuid.uuid4().hex[:8]}",
+    )
+
+
+def _ranking(storage, strategy_id: str, profit_factor: float, mode: str = "LIVE", trades: int = 40) -> None:
+    storage.save_signal_ranking(strategy_id, {
+        "profit_factor": profit_factor, "win_rate": 0.5, "drawdown_max": 1.0,
+        "sharpe_ratio": 1.0, "consecutive_losses": 0, "execution_mode": mode,
+        "completed_last_50": trades,
+    })
+
+
+def _shadow(storage, strategy_id: str, profit_factor: float, status: str = "INCUBATING") -> None:
+    now = datetime.now(timezone.utc).isoformat()
+    conn = storage._get_conn()
+    conn.execute(
+        """
+        INSERT INTO sys_shadow_instances
+            (instance_id, strategy_id, account_id, account_type, status, profit_factor,
+             parameter_overrides, birth_timestamp, created_at, updated_at)
+        VALUES (?, ?, 'DEMO_1', 'DEMO', ?, ?, '{}', ?, ?, ?)
+        """,
+        (str(uuid.uuid4()), strategy_id, status, profit_factor, now, now, now),
+    )
+    conn.commit()
+
+
+@pytest.fixture
+def service(storage) -> CoherenceService:
+    return CoherenceService(storage=storage)
+
+
+@pytest.fixture
+def engine(storage, service) -> CoherenceBatchEngine:
+    return CoherenceBatchEngine(storage, service)
+
+
+@pytest.fixture
+def roster(storage):
+    # EURUSD: clean fills → coherent. GBPUSD: heavy noisy slippage → incoherent.
+    for i in range(8):
+        _log(storage, "EURUSD", 0.0, latency=4.0)
+        _log(storage, "GBPUSD", 3.0 + (i % 3), latency=250.0)
+    for _ in range(3):
+        _log(storage, "USDJPY", 1.0)                      # below min executions
+    for _ in range(6):
+        _log(storage, "AUDUSD", 0.4, latency=50.0)       # constant slippage (stdev == 0)
+    _ranking(storage, "EURUSD_TREND", 1.6)
+    _ranking(storage, "EURUSD_DRIFT", 0.5)               # PF drift but score high → no veto
+    _ranking(storage, "GBPUSD_BREAKOUT", 1.5)
+    _ranking(storage, "USDJPY_MEANREV", 0.2)
+    _ranking(storage, "AUDUSD_CARRY", 1.2)
+    _shadow(storage, "AUDUSD_CARRY", 2.5)                # PF drift with score < 0.70 → veto
+    _shadow(storage, "AUDUSD_CARRY", 9.0, status="DEAD")  # terminal instances ignored
+    return [{"strategy_id": sid} for sid in (
+        "EURUSD_TREND", "EURUSD_DRIFT", "GBPUSD_BREAKOUT", "USDJPY_MEANREV",
+        "AUDUSD_CARRY", "NOSYMBOL", "CADCHF_UNRANKED",
+    )]
+
+
+class TestDecisionParity:
+
+    def test_matches_per_strategy_veto(self, engine, service, roster):
+        batch = engine.evaluate(roster)
+        for entry in roster:
+            sid = entry["strategy_id"]
+            symbol = sid.split("_")[0] if "_" in sid else None
+            assert batch[sid] == service.check_coherence_veto(sid, symbol=symbol), sid
+        assert batch["GBPUSD_BREAKOUT"] is True
+        assert batch["AUDUSD_CARRY"] is True
+        assert batch["EURUSD_TREND"] is False and batch["EURUSD_DRIFT"] is False
+
+    def test_fail_open_on_storage_error(self, service):
+        broken = SimpleNamespace(get_coherence_snapshot=lambda ids: 1 / 0,
+                                 get_execution_logs_for_symbols_since=lambda **kw: [])
+        assert CoherenceBatchEngine(broken, service).evaluate([{"strategy_id": "EURUSD_X"}]) == {}
+
+
+class TestRollingWindows:
+
+    def test_only_new_rows_are_ingested(self, engine, storage, roster):
+        engine.evaluate(roster)
+        first = engine.stats["rows_ingested"]
+        engine.evaluate(roster)
+        assert engine.stats["rows_ingested"] == first
+        _log(storage, "GBPUSD", 4.0)
+        engine.evaluate(roster)
+        assert engine.stats["rows_ingested"] == first + 1
+        assert engine._windows["GBPUSD"].count == 9
+
+    def test_rows_leaving_the_window_are_evicted(self, engine, storage):
+        for _ in range(6):
+            _log(storage, "EURUSD", 1.0)
+        engine.evaluate([{"strategy_id": "EURUSD_TREND"}])
+        assert engine._windows["EURUSD"].count == 6
+        old = (datetime.now(timezone.utc) - timedelta(hours=2)).strftime("%Y-%m-%d %H:%M:%S")
+        window = engine._windows["EURUSD"]
+        window.rows[0] = (old,) + window.rows[0][1:]
+        window.rows[1] = (old,) + window.rows[1][1:]
+        engine.evaluate([{"strategy_id": "EURUSD_TREND"}])
+        assert window.count == 4
+        assert window.sum_slip == pytest.approx(4.0)
+
+    def test_new_symbol_triggers_rebuild(self, engine, roster):
+        engine.evaluate(roster[:1])
+        engine.evaluate(roster)
+        assert engine.stats["rebuilds"] == 2
+        assert engine._windows["GBPUSD"].count == 8
+
+
+class TestAuditAndGate:
+
+    def test_events_registered_in_one_batch(self, engine, storage, roster, monkeypatch):
+        calls = []
+        monkeypatch.setattr(storage, "register_coherence_event",
+                            lambda **kw: pytest.fail("per-strategy write"))
+        original = storage.register_coherence_events
+        monkeypatch.setattr(storage, "register_coherence_events",
+                            lambda events: calls.append(len(events)) or original(events))
+        engine.evaluate(roster)
+        # EURUSD ×2, GBPUSD, AUDUSD have enough executions.
+        assert calls == [4]
+
+    async def test_gate_quarantines_vetoed_strategies(self, storage, engine, roster, monkeypatch):
+        monkeypatch.setattr(storage, "get_strategies_by_mode", lambda mode: roster)
+        vetoed = []
+
+        async def _fake_write(orch, strategy_id, trace_id):
+            vetoed.append(strategy_id)
+
+        monkeypatch.setattr("core_brain.orchestrators._guard_suite.write_coherence_veto", _fake_write)
+        orch = SimpleNamespace(storage=storage, coherence_batch_engine=engine)
+        await run_coherence_gate(orch)
+        assert "GBPUSD_BREAKOUT" in vetoed and "EURUSD_TREND" not in vetoed
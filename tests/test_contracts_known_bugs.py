@@ -37,7 +37,7 @@ class TestContractsKnownBugs:
             account_type="DEMO",
         )
         storage.list_active_instances.return_value = [instance]
-        storage.calculate_instance_metrics_from_sys_trades.return_value = ShadowMetrics(
+        metrics = ShadowMetrics(
             profit_factor=1.8,
             win_rate=0.65,
             max_drawdown_pct=0.08,
@@ -45,6 +45,9 @@ class TestContractsKnownBugs:
             equity_curve_cv=0.25,
             total_trades_executed=8,
         )
+        storage.get_metric_states.return_value = {
+            "inst-001": MagicMock(to_metrics=MagicMock(return_value=metrics)),
+        }
         storage.record_performance_snapshot.return_value = None
         storage.update_shadow_instance.return_value = None
         storage.log_promotion_decision.return_value = None
@@ -0,0 +1,106 @@
+"""
+Tests for the currency-indexed economic event index (PERF-ECON-INDEX-2026-001).
+
+These tests exercise:
+  - Interval-tree stabbing against a brute-force scan of the same windows
+  - Restriction level and responsible event per currency, incl. post-event buffers
+  - Upcoming events by bisect, scoped to the symbol's currencies
+  - Rebuild triggers: EconomicFetchPersist persists, FundamentalGuard reloads
+"""
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core_brain.economic_event_index import EconomicEventIndex, EventWindow, IntervalTree
+from core_brain.economic_fetch_persist import EconomicFetchPersist
+from core_brain.services.fundamental_guard import FundamentalGuardService
+
+T0 = datetime(2026, 3, 2, 14, 30, tzinfo=timezone.utc)
+
+
+def _row(event_id, currency, impact, minutes, name="CPI"):
+    return {"event_id": event_id, "event_name": name, "country": currency, "currency": currency,
+            "impact_score": impact, "event_time_utc": (T0 + timedelta(minutes=minutes)).isoformat()}
+
+
+@pytest.fixture
+def index():
+    idx = EconomicEventIndex()
+    idx.rebuild([
+        _row("nfp", "USD", "HIGH", 0, "NFP"),
+        _row("pmi", "EUR", "MEDIUM", 2, "PMI"),
+        _row("ecb", "EUR", "HIGH", 240, "ECB"),
+        _row("low", "JPY", "LOW", 0, "Tankan"),
+        _row("nfp", "USD", "HIGH", 0, "NFP"),  # duplicate row from a second provider
+    ])
+    return idx
+
+
+def test_interval_tree_matches_brute_force():
+    rng = random.Random(7)
+    windows = []
+    for i in range(500):
+        start = rng.uniform(0, 10_000)
+        windows.append(EventWindow(start, start + rng.uniform(0, 300), start, i, "E", None, "USD", "HIGH"))
+    tree = IntervalTree(windows)
+
+    for at in [rng.uniform(-100, 10_400) for _ in range(300)]:
+        expected = {w.event_id for w in windows if w.start <= at <= w.end}
+        assert {w.event_id for w in tree.stab(at)} == expected
+
+
+def test_restriction_and_reason_per_currency(index):
+    assert len(index) == 4
+
+    level, window = index.restriction(["EUR", "USD"], T0 + timedelta(minutes=1))
+    assert (level, window.event_name) == ("BLOCK", "NFP")  # HIGH outranks the MEDIUM PMI window
+
+    assert index.restriction(["EUR", "GBP"], T0 + timedelta(minutes=1))[0] == "CAUTION"
+    assert index.restriction(["USD"], T0 + timedelta(minutes=9))[0] == "BLOCK"   # post-buffer 10m
+    assert index.restriction(["USD"], T0 + timedelta(minutes=11))[0] == "NORMAL"
+    assert index.restriction(["USD"], T0 - timedelta(minutes=16))[0] == "NORMAL"  # pre-buffer 15m
+    assert index.restriction(["JPY"], T0) == ("NORMAL", None)  # LOW has no window
+
+
+def test_upcoming_is_scoped_and_ordered(index):
+    upcoming = index.upcoming(["EUR"], T0, horizon_s=24 * 3600)
+    assert [w.event_id for w in upcoming] == ["pmi", "ecb"]
+    assert index.upcoming(["EUR"], T0, horizon_s=3600) == upcoming[:1]
+    assert upcoming[0].as_event()["impact_score"] == "MEDIUM"
+    assert index.upcoming(["CHF"], T0) == []
+
+
+@pytest.mark.asyncio
+async def test_fetch_persist_notifies_only_when_rows_were_inserted():
+    storage = MagicMock()
+    storage.insert_economic_calendar_batch.side_effect = [2, 0]
+    gateway = MagicMock()
+    adapter = MagicMock(provider_name="stub")
+    adapter.fetch_events = AsyncMock(return_value=[{"event_name": "CPI"}])
+    gateway.get_all_adapters.return_value = [adapter]
+    on_persisted = MagicMock()
+    persist = EconomicFetchPersist(gateway=gateway, sanitizer=MagicMock(), storage=storage,
+                                   on_persisted=on_persisted)
+    persist.sanitize_batch = MagicMock(return_value=([{"event_name": "CPI"}], 1, 0, {}))
+
+    await persist.execute_cycle()
+    await persist.execute_cycle()
+    on_persisted.assert_called_once_with(2)
+
+
+def test_fundamental_guard_serves_windows_from_the_index():
+    storage = MagicMock()
+    storage.get_economic_calendar.return_value = [
+        {"event": "CPI", "impact": "HIGH", "time_utc": datetime(2026, 3, 2, 14, 30)},
+        {"event": "PMI", "impact": "MEDIUM", "time_utc": "2026-03-02T18:00:00"},
+        {"event": "Speech", "impact": "HIGH", "time_utc": datetime(2026, 3, 2, 20, 0)},
+    ]
+    guard = FundamentalGuardService(storage=storage)
+
+    assert guard.is_market_safe("EURUSD", datetime(2026, 3, 2, 14, 40)) == (False, "FUNDAMENTAL_LOCKDOWN: CPI release")
+    assert guard.is_market_safe("EURUSD", datetime(2026, 3, 2, 17, 45))[1].startswith("VOLATILITY_FILTER: PMI")
+    assert guard.is_market_safe("EURUSD", datetime(2026, 3, 2, 20, 0)) == (True, "")  # not a listed event
+    assert guard.is_lockdown_period("EURUSD", datetime(2026, 3, 2, 14, 40, tzinfo=timezone.utc))
+    assert storage.get_economic_calendar.call_count == 1  # reloaded at most every 60s
@@ -0,0 +1,383 @@
+"""
+Tests for the asynchronous FIX 4.4 session engine.
+TRACE_ID: FIX-SESSION-ASYNC-2026-001
+
+These tests exercise:
+  - Streaming framer: partial reads, pipelined frames, checksum resync
+  - Logon against an in-process FIX acceptor stand-in (real TCP on loopback)
+  - Pipelined order bursts correlated by ClOrdID (out-of-order reports)
+  - TestRequest → Heartbeat(TestReqID)
+  - Inbound gap → ResendRequest; outbound ResendRequest → replay + GapFill
+  - Sequence numbers persisted in sys_config across sessions
+  - Burst throughput / latency benchmark
+"""
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from connectors.fix_codec import FixFrame, FixStreamParser, encode_message
+from connectors.fix_session import AsyncFixSession, FixSessionError
+from connectors.fix_session_state import FixOutboundJournal
+
+
+# ─── In-process FIX acceptor stand-in ─────────────────────────────────────────
+
+class FixAcceptorStandIn:
+    """
+    Minimal FIX 4.4 acceptor on 127.0.0.1 for session tests.
+
+    Behaviour knobs:
+        reject_symbols: symbols answered with OrdStatus=8.
+        reverse_batches: answer buffered orders in reverse order (out-of-order ERs).
+        skip_outbound_seq: drop one outbound seq on the wire (forces a gap).
+    """
+
+    def __init__(self, reject_symbols: Tuple[str, ...] = (), reverse_batches: bool = False,
+                 skip_outbound_seq: Optional[int] = None) -> None:
+        self.reject_symbols = set(reject_symbols)
+        self.reverse_batches = reverse_batches
+        self.skip_outbound_seq = skip_outbound_seq
+        self.received: List[FixFrame] = []
+        self.sent: Dict[int, Tuple[bytes, List[Tuple[int, bytes]]]] = {}
+        self._seq = 1
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._server: Optional[asyncio.base_events.Server] = None
+        self.port = 0
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def of_type(self, msg_type: bytes) -> List[FixFrame]:
+        return [f for f in self.received if f.msg_type == msg_type]
+
+    def send(self, msg_type: bytes, body: List[Tuple[int, bytes]], seq: Optional[int] = None,
+             poss_dup: bool = False) -> None:
+        if seq is None:
+            seq = self._seq
+            self._seq += 1
+            self.sent[seq] = (msg_type, body)
+        header = [(49, b"BROKER"), (56, b"AETHELGARD"), (34, b"%d" % seq)]
+        if poss_dup:
+            header.append((43, b"Y"))
+        header.append((52, b"20260101-00:00:00.000"))
+        if seq == self.skip_outbound_seq and not poss_dup:
+            return
+        assert self._writer is not None
+        self._writer.write(encode_message(b"FIX.4.4", msg_type, header + body))
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writer = writer
+        parser = FixStreamParser()
+        while True:
+            chunk = await reader.read(65536)
+            if not chunk:
+                return
+            parser.feed(chunk)
+            orders: List[FixFrame] = []
+            for frame in parser.frames():
+                self.received.append(frame)
+                if frame.msg_type == b"A":
+                    self.send(b"A", [(98, b"0"), (108, b"30")])
+                elif frame.msg_type == b"D":
+                    orders.append(frame)
+                elif frame.msg_type == b"1":
+                    self.send(b"0", [(112, frame.get(112) or b"")])
+                elif frame.msg_type == b"2":
+                    self._resend(frame.get_int(7), frame.get_int(16))
+                elif frame.msg_type == b"5":
+                    self.send(b"5", [])
+            for order in reversed(orders) if self.reverse_batches else orders:
+                self._execution_report(order)
+            await writer.drain()
+
+    def _execution_report(self, order: FixFrame) -> None:
+        rejected = order.get_str(55) in self.reject_symbols
+        self.send(b"8", [
+            (11, order.get(11) or b""), (17, b"EX%d" % self._seq), (37, b"OR%d" % self._seq),
+            (39, b"8" if rejected else b"2"), (150, b"8" if rejected else b"F"),
+            (55, order.get(55) or b""), (54, order.get(54) or b""),
+            (14, b"0" if rejected else order.get(38) or b"0"), (6, b"1.10000"),
+        ])
+
+    def _resend(self, begin: int, end: int) -> None:
+        end = self._seq - 1 if end == 0 else end
+        for seq in range(begin, end + 1):
+            msg_type, body = self.sent[seq]
+            self.send(msg_type, body, seq=seq, poss_dup=True)
+
+
+class _SysConfigStorage:
+    """sys_config stand-in exposing the two calls FixSequenceStore uses."""
+
+    def __init__(self) -> None:
+        self.state: Dict[str, dict] = {}
+
+    def get_sys_config(self, bypass_cache: bool = False) -> Dict[str, dict]:
+        return dict(self.state)
+
+    def update_sys_config(self, new_state: Dict[str, dict]) -> None:
+        self.state.update(new_state)
+
+
+async def _session(acceptor: FixAcceptorStandIn, storage=None, **kwargs) -> AsyncFixSession:
+    session = AsyncFixSession(
+        storage=storage, host="127.0.0.1", port=acceptor.port,
+        sender_comp_id="AETHELGARD", target_comp_id="BROKER",
+        logon_timeout=2.0, **kwargs,
+    )
+    await session.start()
+    return session
+
+
+@pytest.fixture
+async def acceptor():
+    server = FixAcceptorStandIn()
+    await server.start()
+    yield server
+    await server.close()
+
+
+# ─── Codec ────────────────────────────────────────────────────────────────────
+
+class TestFixStreamParser:
+
+    def _frame(self, seq: int = 1) -> bytes:
+        return encode_message(b"FIX.4.4", b"0", [(49, b"A"), (56, b"B"), (34, b"%d" % seq)])
+
+    def test_encode_computes_body_length_and_checksum(self):
+        raw = self._frame()
+        parser = FixStreamParser()
+        parser.feed(raw)
+        frame = parser.next_frame()
+        assert frame is not None
+        assert frame.raw == raw
+        assert frame.msg_type == b"0"
+        assert frame.get(49) == b"A"
+
+    def test_partial_reads_byte_by_byte(self):
+        raw = self._frame(7)
+        parser = FixStreamParser()
+        frames = []
+        for i in range(len(raw)):
+            parser.feed(raw[i:i + 1])
+            frames.extend(parser.frames())
+        assert len(frames) == 1
+        assert frames[0].seq_num == 7
+
+    def test_pipelined_frames_in_single_read(self):
+        parser = FixStreamParser()
+        parser.feed(b"".join(self._frame(i) for i in range(1, 51)))
+        assert [f.seq_num for f in parser.frames()] == list(range(1, 51))
+        assert parser.buffered() == 0
+
+    def test_corrupted_checksum_dropped_and_resynchronized(self):
+        bad = bytearray(self._frame(1))
+        bad[-4:-1] = b"000" if bad[-4:-1] != b"000" else b"001"
+        parser = FixStreamParser()
+        parser.feed(b"garbage" + bytes(bad) + self._frame(2))
+        frames = list(parser.frames())
+        assert [f.seq_num for f in frames] == [2]
+        assert parser.frames_rejected >= 1
+
+    def test_repeating_group_nth_occurrence(self):
+        parser = FixStreamParser()
+        parser.feed(encode_message(b"FIX.4.4", b"8", [(448, b"P1"), (448, b"P2")]))
+        frame = parser.next_frame()
+        assert frame.get(448) == b"P1"
+        assert frame.get(448, 2) == b"P2"
+        assert frame.get(448, 3) is None
+
+
+class TestFixOutboundJournal:
+
+    def test_admin_messages_and_evicted_entries_are_gap_filled(self):
+        journal = FixOutboundJournal(capacity=3)
+        journal.record(1, b"A", [])
+        journal.record(2, b"D", [(11, b"X")])
+        journal.record(3, b"0", [])
+        journal.record(4, b"D", [(11, b"Y")])
+        plan = dict(journal.replay_plan(1, 4))
+        assert plan[1] is None  # evicted
+        assert plan[2] == (b"D", [(11, b"X")])
+        assert plan[3] is None  # admin
+        assert len(journal) == 3
+
+
+# ─── Session ──────────────────────────────────────────────────────────────────
+
+class TestAsyncFixSession:
+
+    async def test_logon_handshake(self, acceptor):
+        session = await _session(acceptor)
+        assert session.is_logged_on
+        logon = acceptor.of_type(b"A")[0]
+        assert logon.raw.startswith(b"8=FIX.4.4\x01")
+        assert logon.get(49) == b"AETHELGARD"
+        await session.stop()
+        assert acceptor.of_type(b"5")
+
+    async def test_logon_timeout_raises(self):
+        async def _silent_server(reader, writer):
+            await reader.read(65536)
+
+        server = await asyncio.start_server(_silent_server, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        session = AsyncFixSession(None, "127.0.0.1", port, "AETHELGARD", "BROKER", logon_timeout=0.2)
+        with pytest.raises(FixSessionError):
+            await session.start()
+        server.close()
+        await server.wait_closed()
+
+    async def test_submit_requires_logon(self):
+        session = AsyncFixSession(None, "127.0.0.1", 1, "AETHELGARD", "BROKER")
+        with pytest.raises(FixSessionError):
+            session.submit_order("EURUSD", "BUY", 1000)
+
+    async def test_send_order_fill_and_reject(self):
+        server = FixAcceptorStandIn(reject_symbols=("GBPUSD",))
+        await server.start()
+        session = await _session(server)
+        filled = await session.send_order("EURUSD", "BUY", 1000, price=1.1)
+        rejected = await session.send_order("GBPUSD", "SELL", 1000)
+        assert filled["success"] is True
+        assert filled["avg_price"] == pytest.approx(1.1)
+        assert rejected["success"] is False
+        assert rejected["ord_status"] == "8"
+        await session.stop()
+        await server.close()
+
+    async def test_pipelined_burst_correlates_out_of_order_reports(self):
+        server = FixAcceptorStandIn(reverse_batches=True)
+        await server.start()
+        session = await _session(server)
+        cl_ord_ids = [f"ORD{i:05d}" for i in range(200)]
+        futures = [
+            session.submit_order("EURUSD", "BUY", i + 1, cl_ord_id=cid)
+            for i, cid in enumerate(cl_ord_ids)
+        ]
+        await session.drain()
+        results = await asyncio.wait_for(asyncio.gather(*futures), timeout=5.0)
+        assert [r["cl_ord_id"] for r in results] == cl_ord_ids
+        assert [r["cum_qty"] for r in results] == [float(i + 1) for i in range(200)]
+        await session.stop()
+        await server.close()
+
+    async def test_test_request_answered_with_heartbeat(self, acceptor):
+        session = await _session(acceptor)
+        acceptor.send(b"1", [(112, b"PING42")])
+        await acceptor._writer.drain()
+        for _ in range(50):
+            if any(f.get(112) == b"PING42" for f in acceptor.of_type(b"0")):
+                break
+            await asyncio.sleep(0.01)
+        assert any(f.get(112) == b"PING42" for f in acceptor.of_type(b"0"))
+        await session.stop()
+
+    async def test_inbound_gap_triggers_resend_request(self):
+        # Seq 1 = Logon ACK, seq 2 = first ExecutionReport — dropped on the wire.
+        server = FixAcceptorStandIn(skip_outbound_seq=2)
+        await server.start()
+        session = await _session(server)
+        first = session.submit_order("EURUSD", "BUY", 1000, cl_ord_id="GAP1")
+        await session.drain()
+        await asyncio.sleep(0.05)
+        second = await session.send_order("EURUSD", "BUY", 2000)
+        result = await asyncio.wait_for(first, timeout=2.0)
+        assert result["success"] is True and second["success"] is True
+        resend = server.of_type(b"2")
+        assert resend and resend[0].get_int(7) == 2
+        assert session.stats["resend_requests_sent"] == 1
+        assert session.sequences.next_inbound == server._seq
+        await session.stop()
+        await server.close()
+
+    async def test_outbound_resend_replays_orders_and_gap_fills_admin(self, acceptor):
+        session = await _session(acceptor)
+        await session.send_order("EURUSD", "BUY", 1000, price=1.1)
+        acceptor.send(b"2", [(7, b"1"), (16, b"0")])
+        await acceptor._writer.drain()
+        for _ in range(50):
+            if acceptor.of_type(b"4"):
+                break
+            await asyncio.sleep(0.01)
+        replays = [f for f in acceptor.received if f.get(43) == b"Y"]
+        gap_fill = [f for f in replays if f.msg_type == b"4"]
+        replayed_orders = [f for f in replays if f.msg_type == b"D"]
+        assert gap_fill and gap_fill[0].seq_num == 1 and gap_fill[0].get_int(36) == 2
+        assert len(replayed_orders) == 1 and replayed_orders[0].seq_num == 2
+        assert session.stats["resends_served"] == 1
+        await session.stop()
+
+    async def test_sequence_numbers_persist_across_sessions(self, acceptor):
+        storage = _SysConfigStorage()
+        session = await _session(acceptor, storage=storage)
+        await session.send_order("EURUSD", "BUY", 1000)
+        await session.stop()
+        persisted = storage.state["fix_session_seq:AETHELGARD:BROKER"]
+        assert persisted["next_outbound"] == 4  # Logon, D, Logout
+        assert persisted["next_inbound"] == 4   # Logon, 8, Logout
+
+        resumed = AsyncFixSession(storage, "127.0.0.1", acceptor.port, "AETHELGARD", "BROKER")
+        resumed.sequences.load()
+        assert resumed.sequences.next_outbound == 4
+
+    async def test_from_storage_reads_provider_config(self):
+        class _ProviderStorage(_SysConfigStorage):
+            def get_data_provider_config(self, provider_id):
+                assert provider_id == "fix_prime"
+                return {"host": "fix.broker.com", "port": "9876",
+                        "sender_comp_id": "ME", "target_comp_id": "PB"}
+
+        session = AsyncFixSession.from_storage(_ProviderStorage())
+        assert session._port == 9876
+        assert session.sequences._key == "fix_session_seq:ME:PB"
+
+
+# ─── Benchmark ────────────────────────────────────────────────────────────────
+
+class TestFixSessionBurstBenchmark:
+    """Throughput/latency of pipelined bursts against the loopback acceptor."""
+
+    async def test_burst_throughput_and_latency(self, acceptor):
+        session = await _session(acceptor)
+        burst = 1000
+        submitted: Dict[str, float] = {}
+        latencies: List[float] = []
+
+        def _on_report(frame: FixFrame) -> None:
+            sent_at = submitted.get(frame.get_str(11))
+            if sent_at is not None:
+                latencies.append((time.perf_counter() - sent_at) * 1000.0)
+
+        session.on_execution_report = _on_report
+        started = time.perf_counter()
+        futures = []
+        for i in range(burst):
+            cid = f"B{i:06d}"
+            submitted[cid] = time.perf_counter()
+            futures.append(session.submit_order("EURUSD", "BUY", 1000, price=1.1, cl_ord_id=cid))
+        await session.drain()
+        results = await asyncio.wait_for(asyncio.gather(*futures), timeout=20.0)
+        elapsed = time.perf_counter() - started
+
+        latencies.sort()
+        throughput = burst / elapsed
+        p50 = latencies[len(latencies) // 2]
+        p99 = latencies[int(len(latencies) * 0.99) - 1]
+        print(f"\n[FIX-BENCH] {burst} orders in {elapsed * 1000:.1f} ms "
+              f"→ {throughput:.0f} orders/s | p50={p50:.2f} ms p99={p99:.2f} ms")
+
+        assert all(r["success"] for r in results)
+        assert len(latencies) == burst
+        assert throughput > 200
+        await session.stop()
@@ -0,0 +1,106 @@
+"""
+Tests for the live FX conversion graph (PERF-FX-GRAPH-2026-001).
+
+These tests exercise:
+  - Direct, inverse and multi-hop conversions through cached shortest paths
+  - Staleness bounds and explicit errors (no path / stale or missing quote)
+  - RiskCalculator and PositionSizeEngine size cross pairs without broker calls
+  - Fallback to the connector when the graph cannot answer
+"""
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from conftest import MockSymbolInfo
+from core_brain.fx_conversion_graph import (
+    FxConversionGraph,
+    NoConversionPathError,
+    StaleRateError,
+    split_pair,
+)
+from core_brain.position_size_engine import PositionSizeEngine
+from core_brain.risk_calculator import RiskCalculator
+from core_brain.scanner import ScannerEngine
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def graph(clock):
+    fx = FxConversionGraph(max_age_s=60.0, clock=clock)
+    fx.register_symbols(["EURUSD", "GBPUSD", "USDJPY", "USDCHF", "EURGBP", "AUDNZD", "US30"])
+    for symbol, price in {"EURUSD": 1.08, "GBPUSD": 1.26, "USDJPY": 150.0, "USDCHF": 0.88, "EURGBP": 0.857}.items():
+        fx.update_quote(symbol, price)
+    return fx
+
+
+def test_direct_inverse_and_multi_hop_rates(graph):
+    assert graph.rate("GBP", "USD") == pytest.approx(1.26)
+    assert graph.rate("JPY", "USD") == pytest.approx(1 / 150.0)
+    assert graph.rate("CHF", "JPY") == pytest.approx(150.0 / 0.88)  # CHF→USD→JPY
+    assert graph.convert(10_000, "JPY", "jpy") == 10_000
+    assert split_pair("US30") is None and split_pair("eurusd.a") == ("EUR", "USD")
+
+    graph.rate("CHF", "JPY")
+    assert graph.stats["path_cache_hits"] >= 1
+    assert graph.snapshot()["pairs"] == 6
+
+
+def test_stale_missing_and_unlinked_rates_raise(graph, clock):
+    with pytest.raises(NoConversionPathError):
+        graph.rate("AUD", "USD")  # AUDNZD only links AUD to NZD
+    with pytest.raises(StaleRateError, match="never quoted"):
+        graph.rate("NZD", "AUD")
+
+    clock.now += 61
+    with pytest.raises(StaleRateError, match="GBPUSD"):
+        graph.rate("GBP", "USD")
+    graph.update_quote("GBPUSD", 1.2700, 1.2702)
+    assert graph.rate("GBP", "USD") == pytest.approx(1.2701)
+    assert graph.stats["stale"] == 2 and graph.stats["no_path"] == 1
+
+
+def test_basket_of_cross_pairs_costs_no_broker_calls(graph):
+    connector = Mock()
+    connector.get_symbol_info.return_value = MockSymbolInfo(100000)
+    calculator = RiskCalculator(connector, fx_graph=graph)
+    engine = PositionSizeEngine(storage=Mock(), instrument_manager=Mock(), monitor=Mock(), fx_graph=graph)
+
+    risks = [calculator.calculate_initial_risk_usd(s, 1.0, 0.99, 0.1) for s in ("EURGBP", "EURCHF", "USDJPY")]
+    point_values = [engine._point_value(MockSymbolInfo(100000), 0.0001, 0.95, s, connector) for s in ("EURGBP", "EURCHF")]
+
+    assert risks[0] == pytest.approx(100.0 * 1.26)
+    assert risks[1] == pytest.approx(100.0 / 0.88)
+    assert risks[2] == pytest.approx(100.0 / 150.0)
+    assert point_values == [pytest.approx(10.0 * 1.26), pytest.approx(10.0 / 0.88)]
+    connector.get_current_price.assert_not_called()
+
+
+def test_connector_fallback_when_graph_is_stale(graph, clock):
+    clock.now += 120
+    connector = Mock()
+    connector.get_current_price.side_effect = lambda s: {"GBPUSD": 1.25}.get(s)
+
+    assert RiskCalculator(connector, fx_graph=graph)._find_conversion_rate("GBP") == 1.25
+    connector.get_current_price.assert_called_once_with("GBPUSD")
+
+
+def test_scanner_feeds_last_close_into_the_graph(clock):
+    fx = FxConversionGraph(clock=clock)
+    scanner = ScannerEngine(assets=[], data_provider=Mock(), config_data={}, fx_graph=fx)
+    df = pd.DataFrame({"close": [1.2500, 1.2510]})
+
+    scanner._process_scan_result(("GBPUSD", "M5", Mock(value="TREND"), {}, df, "test"))
+    assert fx.rate("USD", "GBP") == pytest.approx(1 / 1.2510)
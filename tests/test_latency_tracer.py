@@ -0,0 +1,114 @@
+"""
+Tests for in-process cycle latency tracing (PERF-CYCLE-TRACING-2026-001).
+
+These tests exercise:
+  - HDR histogram percentile accuracy (~1.6% relative error)
+  - Span recording with per-symbol / per-strategy breakdowns
+  - Disabled tracer is a no-op
+  - On-demand single-cycle profile (stack samples + span timeline)
+  - Publication to / profile requests from sys_config
+"""
+import asyncio
+import time
+
+import pytest
+
+from core_brain.latency_tracer import (
+    PROFILE_REQUEST_CONFIG_KEY,
+    SNAPSHOT_CONFIG_KEY,
+    TRACING_ENABLED_CONFIG_KEY,
+    LatencyHistogram,
+    LatencyTracer,
+)
+
+
+def test_histogram_percentiles_are_within_relative_error():
+    hist = LatencyHistogram()
+    for value in range(1, 100_001):
+        hist.record(value)
+
+    for q, exact in ((50, 50_000), (90, 90_000), (99, 99_000)):
+        assert hist.percentile(q) == pytest.approx(exact, rel=0.016)
+    assert hist.percentile(100) == 100_000
+    summary = hist.summary()
+    assert summary["count"] == 100_000
+    assert summary["max_ms"] == pytest.approx(100.0)
+    assert len(hist.counts) < 1_000  # sparse log-linear buckets, not one per value
+
+
+def test_spans_record_overall_and_per_dimension_breakdowns():
+    tracer = LatencyTracer()
+    with tracer.span("signal.strategy", symbol="EURUSD", strategy="S1"):
+        pass
+    with tracer.span("signal.strategy", symbol="GBPUSD", strategy="S1"):
+        pass
+    tracer.record("execute.broker", 0.25, symbol="EURUSD")
+
+    @tracer.traced("scan.fetch")
+    async def fetch():
+        return 42
+
+    assert asyncio.run(fetch()) == 42
+
+    snapshot = tracer.snapshot()
+    assert snapshot["spans"]["signal.strategy"]["count"] == 2
+    assert snapshot["spans"]["scan.fetch"]["count"] == 1
+    assert snapshot["spans"]["execute.broker"]["p99_ms"] == pytest.approx(250.0, rel=0.016)
+    assert set(snapshot["by_symbol"]["signal.strategy"]) == {"EURUSD", "GBPUSD"}
+    assert snapshot["by_strategy"]["signal.strategy"]["S1"]["count"] == 2
+    assert "by_symbol" not in tracer.snapshot(breakdowns=False)
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = LatencyTracer(enabled=False)
+    with tracer.cycle():
+        with tracer.span("phase.scan"):
+            pass
+    tracer.record("phase.execute", 0.1)
+    assert tracer.snapshot()["spans"] == {}
+
+
+def test_profile_captures_a_single_cycle_timeline_and_stacks():
+    tracer = LatencyTracer()
+    tracer.request_profile(sample_interval_ms=1, request_id="req-1")
+
+    def busy_wait(seconds):
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            pass
+
+    with tracer.cycle():
+        with tracer.span("phase.scan", symbol="EURUSD"):
+            busy_wait(0.05)
+        with tracer.span("phase.execute"):
+            pass
+
+    profile = tracer.last_profile
+    assert profile["request_id"] == "req-1"
+    assert [entry["span"] for entry in profile["timeline"]] == ["cycle", "phase.scan", "phase.execute"]
+    assert profile["samples"] > 0
+    assert any("busy_wait" in stack for stack in profile["stacks"])
+
+    with tracer.cycle():  # the request is consumed: the next cycle is not profiled
+        pass
+    assert tracer.last_profile is profile
+
+
+def test_sync_publishes_snapshot_and_picks_up_profile_requests(storage):
+    tracer = LatencyTracer(publish_interval_s=3600)
+    storage.update_sys_config({PROFILE_REQUEST_CONFIG_KEY: {"request_id": "stale", "sample_interval_ms": 2}})
+    with tracer.span("phase.scan"):
+        pass
+
+    assert tracer.sync(storage) is True
+    assert storage.get_sys_config(bypass_cache=True)[SNAPSHOT_CONFIG_KEY]["spans"]["phase.scan"]["count"] == 1
+    assert tracer._profile_request is None  # request from a previous run is not replayed
+    assert tracer.sync(storage) is False  # throttled
+
+    storage.update_sys_config({
+        PROFILE_REQUEST_CONFIG_KEY: {"request_id": "fresh", "sample_interval_ms": 2},
+        TRACING_ENABLED_CONFIG_KEY: False,
+    })
+    assert tracer.sync(storage, force=True) is True
+    assert tracer._profile_request["request_id"] == "fresh"
+    assert tracer.enabled is False
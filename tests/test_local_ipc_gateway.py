@@ -0,0 +1,247 @@
+"""
+Tests for the Unix-socket ProcessGateway and the scanner process supervisor.
+Trace_ID: ARCH-IPC-LOCAL-2026-001
+
+These tests exercise:
+  - Snapshot + incremental updates mirrored by LocalSocketGateway (no DB reads)
+  - Publishing through the gateway, fallback while the broker is down, reconnection
+  - Supervisor restarting a crashed scanner process that serves the broker
+  - Socket isolation: private 0700 directory, 0600 socket, orphan-only unlink
+  - Production wiring: scanner worker threads publishing into the supervised
+    broker process, state restored after a crash, API heatmap reading the mirror
+"""
+import asyncio
+import os
+import signal
+import socket
+import stat
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core_brain.infrastructure import (
+    LocalSocketGateway,
+    ScannerProcessSupervisor,
+    ScanStateBroker,
+    run_scanner_broker,
+    serve_scan_state,
+)
+from core_brain.infrastructure import local_ipc_gateway
+from core_brain.infrastructure.process_gateway import DatabaseGateway
+
+
+async def _publish_then_idle(broker: ScanStateBroker) -> None:
+    """Scan loop run inside the supervised child process."""
+    broker.publish("EURUSD", "M5", {"regime": "TREND", "metrics": {"adx": 31.0}})
+    await asyncio.Event().wait()
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return str(tmp_path / "scanner.sock")
+
+
+@pytest.fixture
+async def broker(socket_path):
+    broker = ScanStateBroker(socket_path)
+    await broker.start()
+    yield broker
+    await broker.stop()
+
+
+@pytest.fixture
+async def gateway(socket_path):
+    gateway = LocalSocketGateway(socket_path, reconnect_delay=0.02)
+    await gateway.start()
+    yield gateway
+    await gateway.close()
+
+
+async def _until(predicate, timeout: float = 5.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+class TestMirror:
+
+    async def test_snapshot_then_updates(self, broker, gateway):
+        broker.publish("EURUSD", "M5", {"regime": "TREND", "metrics": {"adx": 30.0}})
+        assert await gateway.wait_ready()
+        broker.publish("GBPUSD", "H1", {"regime": "RANGE", "scan_time": 12})
+        await _until(lambda: "GBPUSD|H1" in gateway.cells)
+
+        regime = await gateway.get_latest_regime("EURUSD", "M5")
+        assert regime["regime"] == "TREND" and regime["metrics"] == {"adx": 30.0}
+        state = await gateway.get_scanner_state()
+        assert state["assets"] == ["EURUSD", "GBPUSD"] and state["source"] == "local_ipc"
+        assert state["scan_times"]["GBPUSD|H1"] == 12
+        cells = await gateway.get_market_heatmap_state()
+        assert {(c["symbol"], c["regime"]) for c in cells} == {("EURUSD", "TREND"), ("GBPUSD", "RANGE")}
+        assert await gateway.health_check() is True
+
+    async def test_gateway_publish_reaches_broker_and_mirrors(self, broker, gateway):
+        assert await gateway.wait_ready()
+        await gateway.publish_scan_result("USDJPY", "M15", {"regime": "VOLATILE"})
+        await _until(lambda: "USDJPY|M15" in gateway.cells)
+        assert broker.cells["USDJPY|M15"]["regime"] == "VOLATILE"
+
+    async def test_slow_subscriber_is_resynced_with_snapshot(self, socket_path, gateway):
+        broker = ScanStateBroker(socket_path, queue_size=2)
+        await broker.start()
+        try:
+            assert await gateway.wait_ready()
+            for i in range(50):
+                broker.publish(f"SYM{i}", "M1", {"regime": "RANGE"})
+            await _until(lambda: len(gateway.cells) == 50)
+            assert broker.stats["resyncs"] > 0
+        finally:
+            await broker.stop()
+
+
+class TestAvailability:
+
+    async def test_fallback_while_broker_is_down(self, socket_path):
+        fallback = AsyncMock()
+        fallback.get_latest_regime.return_value = {"regime": "NORMAL", "source": "database"}
+        gateway = LocalSocketGateway(socket_path, fallback=fallback, reconnect_delay=0.02)
+        await gateway.start()
+        try:
+            assert (await gateway.get_latest_regime("EURUSD", "M5"))["source"] == "database"
+            await gateway.publish_scan_result("EURUSD", "M5", {"regime": "TREND"})
+            fallback.publish_scan_result.assert_awaited_once()
+            assert await gateway.health_check() is False
+        finally:
+            await gateway.close()
+
+    async def test_reconnects_after_broker_restart(self, socket_path, gateway):
+        first = ScanStateBroker(socket_path)
+        await first.start()
+        first.publish("EURUSD", "M5", {"regime": "TREND"})
+        assert await gateway.wait_ready()
+        await first.stop()
+        await _until(lambda: not gateway.connected)
+
+        second = ScanStateBroker(socket_path)
+        await second.start()
+        try:
+            second.publish("EURUSD", "M5", {"regime": "RANGE"})
+            assert await gateway.wait_ready()
+            assert (await gateway.get_latest_regime("EURUSD", "M5"))["regime"] == "RANGE"
+            assert gateway.stats["connects"] == 2
+        finally:
+            await second.stop()
+
+
+async def test_supervisor_restarts_crashed_scanner_process(socket_path, gateway):
+    supervisor = ScannerProcessSupervisor(
+        run_scanner_broker, args=(socket_path, _publish_then_idle),
+        restart_delay=0.05, poll_interval=0.05,
+    )
+    supervisor.start()
+    watcher = asyncio.create_task(supervisor.supervise())
+    try:
+        assert await gateway.wait_ready(timeout=30)
+        assert gateway.cells["EURUSD|M5"]["regime"] == "TREND"
+        first_pid = supervisor.pid
+        os.kill(first_pid, signal.SIGKILL)
+        await _until(lambda: supervisor.stats["restarts"] == 1, timeout=30)
+        assert supervisor.pid != first_pid
+        assert supervisor.stats["last_exitcode"] == -signal.SIGKILL
+        await _until(lambda: gateway.stats["connects"] >= 2, timeout=30)
+    finally:
+        supervisor.stop()
+        watcher.cancel()
+    assert not supervisor.is_alive
+
+
+async def test_scanner_state_survives_broker_process_restart(socket_path, gateway):
+    supervisor = ScannerProcessSupervisor(
+        run_scanner_broker, args=(socket_path, serve_scan_state),
+        restart_delay=0.05, poll_interval=0.05,
+    )
+    supervisor.start()
+    watcher = asyncio.create_task(supervisor.supervise())
+    publisher = LocalSocketGateway(socket_path, reconnect_delay=0.02)
+    await publisher.start()
+    try:
+        # ScannerEngine publishes from its ThreadPoolExecutor workers
+        worker = threading.Thread(
+            target=publisher.publish_threadsafe, args=("EURUSD", "M5", {"regime": "TREND", "scan_time": 1.0})
+        )
+        worker.start()
+        worker.join()
+        await _until(lambda: "EURUSD|M5" in gateway.cells, timeout=30)
+
+        os.kill(supervisor.pid, signal.SIGKILL)
+        await _until(lambda: supervisor.stats["restarts"] == 1, timeout=30)
+        await _until(lambda: publisher.stats["connects"] >= 2 and gateway.stats["connects"] >= 2, timeout=30)
+        await _until(lambda: gateway.cells.get("EURUSD|M5", {}).get("regime") == "TREND", timeout=30)
+    finally:
+        await publisher.close()
+        supervisor.stop()
+        watcher.cancel()
+
+
+async def test_heatmap_reads_local_mirror_only_while_connected(broker, gateway):
+    from core_brain.api.routers import market
+
+    with patch.object(market.TenantDBFactory, "get_storage", return_value=MagicMock()), \
+         patch.object(market, "_get_scanner", return_value=None):
+        assert await gateway.wait_ready()
+        assert market._get_heatmap_service("t1", gateway).gateway is gateway
+        await broker.stop()
+        await _until(lambda: not gateway.connected)
+        assert isinstance(market._get_heatmap_service("t1", gateway).gateway, DatabaseGateway)
+        assert isinstance(market._get_heatmap_service("t1", None).gateway, DatabaseGateway)
+
+
+class TestSocketIsolation:
+    def test_default_socket_lives_in_a_per_user_runtime_dir(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert local_ipc_gateway._default_runtime_dir() == str(tmp_path / "aethelgard")
+        monkeypatch.delenv("XDG_RUNTIME_DIR")
+        assert local_ipc_gateway._default_runtime_dir().endswith(f"aethelgard-{os.getuid()}")
+
+    async def test_socket_is_private_after_bind(self, tmp_path):
+        path = tmp_path / "run" / "scanner.sock"
+        broker = ScanStateBroker(str(path))
+        await broker.start()
+        try:
+            assert stat.S_IMODE(os.stat(path.parent).st_mode) == 0o700
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+        finally:
+            await broker.stop()
+        assert not path.exists()
+
+    async def test_refuses_a_shared_directory(self, tmp_path):
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        shared.chmod(0o1777)
+        with pytest.raises(PermissionError):
+            await ScanStateBroker(str(shared / "scanner.sock")).start()
+
+    async def test_never_unlinks_a_regular_file(self, socket_path):
+        with open(socket_path, "w") as handle:
+            handle.write("not a socket")
+        with pytest.raises(FileExistsError):
+            await ScanStateBroker(socket_path).start()
+        assert os.path.isfile(socket_path)
+
+    async def test_keeps_a_live_brokers_socket(self, broker, socket_path):
+        with pytest.raises(OSError):
+            await ScanStateBroker(socket_path).start()
+        assert stat.S_ISSOCK(os.lstat(socket_path).st_mode)
+
+    async def test_replaces_an_orphaned_socket(self, socket_path):
+        orphan = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        orphan.bind(socket_path)
+        orphan.close()
+        broker = ScanStateBroker(socket_path)
+        await broker.start()
+        try:
+            assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+        finally:
+            await broker.stop()
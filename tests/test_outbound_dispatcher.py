@@ -0,0 +1,237 @@
+"""
+Tests for the asynchronous outbound pipeline (PERF-OUTBOUND-DISPATCH-2026-001).
+
+These tests exercise:
+  - submit() never blocking the caller; full queue rejects instead of waiting
+  - Retries with backoff, then dead-letter after max_attempts
+  - Stats counters exact under concurrent producers
+  - Email alerts batched into a digest over one persistent SMTP connection (local sink)
+  - Telegram alerts delivered to a fake HTTP endpoint
+  - An AlertingService-owned dispatcher stopped by close() or at interpreter exit
+  - NotificationService persisting through the dispatcher
+"""
+import email
+import json
+import smtplib
+import socketserver
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+from core_brain.notification_service import NotificationCategory, NotificationService
+from utils import alerting
+from utils.alerting import Alert, AlertChannel, AlertingService, AlertSeverity, EmailConfig, TelegramConfig
+from utils.outbound_dispatcher import OutboundDispatcher
+
+
+class _SmtpSink(socketserver.ThreadingTCPServer):
+    """Minimal SMTP server: records connections and received messages."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _SmtpHandler)
+        self.connections = 0
+        self.messages = []
+
+
+class _SmtpHandler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        self.server.connections += 1
+        self._reply("220 sink ready")
+        while True:
+            line = self.rfile.readline().decode().strip()
+            if not line:
+                return
+            verb = line.split(" ", 1)[0].upper()
+            if verb == "DATA":
+                self._reply("354 end with .")
+                data = []
+                while (chunk := self.rfile.readline().decode()) not in (".\r\n", ""):
+                    data.append(chunk)
+                self.server.messages.append("".join(data))
+                self._reply("250 queued")
+            elif verb == "QUIT":
+                self._reply("221 bye")
+                return
+            elif verb == "EHLO":
+                self._reply("250 sink")
+            else:
+                self._reply("250 ok")
+
+    def _reply(self, text: str) -> None:
+        self.wfile.write(f"{text}\r\n".encode())
+
+
+@pytest.fixture
+def smtp_sink(monkeypatch):
+    monkeypatch.setattr(smtplib.SMTP, "starttls", lambda self, *a, **k: (220, b""))  # plain sink
+    server = _SmtpSink()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def telegram_endpoint():
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            received.append((self.path, json.loads(self.rfile.read(int(self.headers["Content-Length"])))))
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b'{"ok": true}')
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", received
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def short_batch_window(monkeypatch):
+    monkeypatch.setattr(alerting, "ALERT_BATCH_WINDOW_SECONDS", 0.2)
+
+
+def _alert(key, severity=AlertSeverity.CRITICAL):
+    return Alert(severity=severity, key=key, title=f"Title {key}", message=f"Body {key}")
+
+
+def test_submit_does_not_block_and_rejects_when_full():
+    gate = threading.Event()
+    dispatcher = OutboundDispatcher(maxsize=2)
+    dispatcher.register_channel("slow", lambda batch: gate.wait(5), batch_window_s=0.0, max_batch=1)
+
+    started = time.perf_counter()
+    accepted = [dispatcher.submit("slow", i) for i in range(10)]
+    assert time.perf_counter() - started < 0.5
+    assert accepted.count(False) >= 1 and dispatcher.stats["rejected"] == accepted.count(False)
+    assert dispatcher.submit("unknown", 1) is False
+
+    gate.set()
+    assert dispatcher.flush(5)
+    dispatcher.stop()
+
+
+def test_retries_with_backoff_then_dead_letters():
+    calls = []
+    dead = []
+
+    def flaky(batch):
+        calls.append(list(batch))
+        raise ConnectionError("down")
+
+    dispatcher = OutboundDispatcher(max_attempts=3, backoff_base_s=0.01,
+                                    dead_letter=lambda *args: dead.append(args))
+    dispatcher.register_channel("flaky", flaky, batch_window_s=0.0)
+    dispatcher.submit("flaky", {"id": 1})
+
+    deadline = time.monotonic() + 5
+    while not dead and time.monotonic() < deadline:
+        time.sleep(0.01)
+    dispatcher.stop()
+
+    assert len(calls) == 3
+    assert dead == [("flaky", {"id": 1}, "down", 3)]
+    assert dispatcher.stats["retries"] == 2 and dispatcher.stats["dead_lettered"] == 1
+
+
+def test_stats_stay_exact_under_concurrent_producers():
+    dispatcher = OutboundDispatcher(maxsize=10_000)
+    dispatcher.register_channel("sink", lambda batch: None, batch_window_s=0.0, max_batch=50)
+
+    def produce():
+        for i in range(500):
+            dispatcher.submit("sink", i)
+
+    producers = [threading.Thread(target=produce) for _ in range(8)]
+    for thread in producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    assert dispatcher.flush(10)
+    dispatcher.stop()
+
+    assert dispatcher.stats["submitted"] == dispatcher.stats["delivered"] == 4000
+
+
+def test_email_burst_is_one_digest_over_a_reused_connection(smtp_sink):
+    cfg = EmailConfig(smtp_host="127.0.0.1", smtp_port=smtp_sink.server_address[1],
+                      sender="bot@test.local", recipients=["ops@test.local"])
+    svc = AlertingService(channels=[AlertChannel.LOG_ONLY, AlertChannel.EMAIL], email_config=cfg)
+
+    results = [svc.send_alert(_alert(f"k{i}")) for i in range(3)]
+    assert all(r == {"log_only": True, "email": True} for r in results)
+    assert svc.send_alert(_alert("k0"))["email"] is False  # rate limit still applies
+    assert svc.flush(10)
+
+    assert svc.send_alert(_alert("k9", AlertSeverity.WARNING))["email"] is True
+    assert svc.flush(10)
+    svc.close()
+
+    assert smtp_sink.connections == 1
+    digest, single = [email.message_from_string(m) for m in smtp_sink.messages]
+    assert digest["Subject"] == "[Aethelgard CRITICAL] 3 alertas"
+    assert "Body k2" in digest.get_payload(decode=True).decode()
+    assert single["Subject"] == "[Aethelgard WARNING] Title k9"
+
+
+def test_telegram_alert_reaches_the_endpoint(telegram_endpoint):
+    base, received = telegram_endpoint
+    svc = AlertingService(channels=[AlertChannel.TELEGRAM],
+                          telegram_config=TelegramConfig(bot_token="T0K", chat_id="42", api_base=base))
+
+    assert svc.send_alert(_alert("tg")) == {"telegram": True}
+    assert svc.flush(10)
+    svc.close()
+
+    assert len(received) == 1
+    path, body = received[0]
+    assert path == "/botT0K/sendMessage" and body["chat_id"] == "42" and "Title tg" in body["text"]
+
+
+def test_owned_dispatcher_is_stopped_at_exit_unless_closed(telegram_endpoint, monkeypatch):
+    base, received = telegram_endpoint
+    hooks = []
+    monkeypatch.setattr(alerting.atexit, "register", hooks.append)
+    monkeypatch.setattr(alerting.atexit, "unregister", hooks.remove)
+    svc = AlertingService(channels=[AlertChannel.TELEGRAM],
+                          telegram_config=TelegramConfig(bot_token="T0K", chat_id="42", api_base=base))
+
+    assert svc.send_alert(_alert("exit")) == {"telegram": True}
+    assert hooks == [svc.close]
+    hooks[0]()  # what the interpreter runs at exit: pending alerts are delivered
+    assert len(received) == 1 and not svc._dispatcher._running and hooks == []
+
+    shared = AlertingService(channels=[AlertChannel.TELEGRAM], dispatcher=OutboundDispatcher(),
+                             telegram_config=TelegramConfig(bot_token="T0K", chat_id="42", api_base=base))
+    assert shared.send_alert(_alert("shared")) == {"telegram": True}
+    assert hooks == []  # a shared dispatcher belongs to whoever created it
+    shared.flush(10)
+    shared._dispatcher.stop()
+
+
+def test_notification_service_persists_through_the_dispatcher():
+    storage = MagicMock()
+    storage.get_usr_preferences.return_value = {"notify_regime_changes": True}
+    storage.save_notification.return_value = True
+    dispatcher = OutboundDispatcher()
+    service = NotificationService(storage, dispatcher=dispatcher)
+
+    notification = service.create_notification(
+        NotificationCategory.REGIME, {"symbol": "EURUSD", "old_regime": "RANGE", "new_regime": "TREND"}
+    )
+    assert notification is not None
+    assert dispatcher.flush(5)
+    dispatcher.stop()
+    storage.save_notification.assert_called_once_with(notification)
@@ -0,0 +1,111 @@
+"""
+Tests for the vectorized candle-pattern suite (PERF-PATTERN-ARRAYS-2026-001).
+
+These tests exercise:
+  - Per-bar masks identical to the scalar detectors (rejection, hammer, pin bar,
+    engulfing, elephant) on a window with dojis, flat bars and exact ties
+  - FVG detection through ImbalanceDetector matching the 3-candle loop
+  - Per-bar flags and whole-window z-scores
+"""
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core_brain.sensors.candlestick_pattern_detector import CandlestickPatternDetector
+from core_brain.sensors.elephant_candle_detector import ElephantCandleDetector
+from core_brain.sensors.imbalance_detector import ImbalanceDetector
+from core_brain.sensors.liquidity_sweep_detector import LiquiditySweepDetector
+from core_brain.sensors.pattern_sensor_suite import (
+    CandlePatternSuite,
+    OHLCArrays,
+    engulfing_masks,
+    pin_bar_masks,
+)
+
+
+def _storage():
+    storage = MagicMock()
+    storage.get_dynamic_params.return_value = {}
+    return storage
+
+
+@pytest.fixture
+def window():
+    """Prices on a coarse grid so equal-ratio ties, dojis and flat bars all occur."""
+    rng = np.random.default_rng(3)
+    n = 600
+    close = 100 + np.round(np.cumsum(rng.normal(0, 2, n)), 0)
+    open_ = close + rng.integers(-4, 5, n)
+    high = np.maximum(open_, close) + rng.integers(0, 5, n)
+    low = np.minimum(open_, close) - rng.integers(0, 5, n)
+    return pd.DataFrame({
+        "open": open_, "high": high, "low": low, "close": close,
+        "volume": rng.integers(100, 1000, n).astype(float),
+    })
+
+
+def test_masks_match_scalar_detectors(window):
+    candles = window.to_dict("records")
+    candle_detector = CandlestickPatternDetector(storage=_storage())
+    elephant_detector = ElephantCandleDetector(storage=_storage(), moving_average_sensor=None)
+    elephant_detector.min_body_pips = 20_000  # 2.0 price units on this grid
+    sweep_detector = LiquiditySweepDetector(storage=_storage())
+
+    scan = CandlePatternSuite(elephant_min_body_pips=elephant_detector.min_body_pips).scan(window)
+    pin = [sweep_detector.detect_pin_bar(c) for c in candles]
+    engulf = [(False, None, 0)] + [
+        sweep_detector.detect_engulfing(p, c) for p, c in zip(candles, candles[1:])
+    ]
+
+    expected = {
+        "rejection": [candle_detector.detect_rejection_tail(c) for c in candles],
+        "hammer": [candle_detector.detect_hammer(c) for c in candles],
+        "elephant": [elephant_detector.is_elephant_candle(c) for c in candles],
+        "pin_bar_bullish": [p[1] == "BULLISH" for p in pin],
+        "pin_bar_bearish": [p[1] == "BEARISH" for p in pin],
+        "engulfing_bullish": [e[1] == "BULLISH" for e in engulf],
+        "engulfing_bearish": [e[1] == "BEARISH" for e in engulf],
+    }
+    for name, flags in expected.items():
+        assert scan.masks[name].tolist() == flags, name
+        assert any(flags), f"{name} never fired: fixture does not exercise it"
+
+    assert candle_detector.scan_for_rejections(window) == scan.indices("rejection")
+    assert pin_bar_masks(scan.ohlc, scan.features)["strength"].tolist() == pytest.approx([p[2] for p in pin])
+    assert engulfing_masks(scan.ohlc, scan.features)["strength"].tolist() == pytest.approx([e[2] for e in engulf])
+
+
+def test_detect_fvg_matches_three_candle_loop(window):
+    candles = window.to_dict("records")
+    detector = ImbalanceDetector(storage=_storage())
+    min_size = 5.0 * 0.5
+
+    expected = []
+    for i in range(len(candles) - 2):
+        high1, low1 = candles[i]["high"], candles[i]["low"]
+        high3, low3 = candles[i + 2]["high"], candles[i + 2]["low"]
+        if low3 - high1 >= min_size:
+            expected.append(("bullish_fvg", low3, high1, i + 1))
+        elif low1 - high3 >= min_size:
+            expected.append(("bearish_fvg", low1, high3, i + 1))
+
+    fvgs = detector.detect_fvg(candles, pip_size=0.5, timeframe="M5")
+    assert expected and [(f["type"], f["top"], f["bottom"], f["index"]) for f in fvgs] == expected
+    assert all(f["size_pips"] == (f["top"] - f["bottom"]) / 0.5 for f in fvgs)
+
+
+def test_flags_and_zscores_per_bar():
+    candles = [
+        {"open": 1.1000, "high": 1.1010, "low": 1.0990, "close": 1.1005},
+        {"open": 1.1005, "high": 1.1008, "low": 1.0950, "close": 1.1006},  # bullish pin bar / hammer shape
+        {"open": 1.1006, "high": 1.1100, "low": 1.1005, "close": 1.1095},  # elephant
+    ]
+    ohlc = OHLCArrays.from_candles(candles)
+    scan = CandlePatternSuite(min_tail_pips=0).scan(ohlc)
+
+    assert scan.flags_at(1)["pin_bar_bullish"] and scan.flags_at(1)["hammer"]
+    assert scan.flags_at(-1)["elephant"] and not scan.flags_at(0)["elephant"]
+    assert scan.features.body_zscore.argmax() == 2
+    assert ohlc.candle(-1) == {"open": 1.1006, "high": 1.11, "low": 1.1005, "close": 1.1095, "volume": 0.0}
@@ -0,0 +1,181 @@
+"""
+Tests for the per-cycle position monitoring snapshot.
+TRACE_ID: POSITION-MONITOR-CONTEXT-2026-001
+
+These tests exercise:
+  - Bulk metadata read/write parity with the per-ticket storage methods
+  - One metadata query, one market-data fetch per symbol, one batched write per cycle
+  - SL/TP modification audits written ahead of the broker call, even mid-cycle
+  - Read-only views with read-your-writes inside the cycle
+"""
+from datetime import datetime, timezone
+
+import pytest
+
+from core_brain.position_manager import PositionManager
+from core_brain.position_monitor_context import PositionMonitorContext
+from models.signal import MarketRegime
+
+
+class _Connector:
+    def __init__(self, positions):
+        self.positions = positions
+        self.calls = {"get_symbol_info": [], "get_current_price": [], "modify_position": []}
+
+    def get_open_positions(self):
+        return self.positions
+
+    def get_symbol_info(self, symbol):
+        self.calls["get_symbol_info"].append(symbol)
+        return {"trade_stops_level": 10, "point": 0.00001, "digits": 5, "ask": 1.1}
+
+    def get_current_price(self, symbol):
+        self.calls["get_current_price"].append(symbol)
+        return 1.1
+
+    def modify_position(self, ticket, sl, tp, reason=""):
+        self.calls["modify_position"].append(ticket)
+        return {"success": True}
+
+
+class _Classifier:
+    def __init__(self):
+        self.classified, self.atr_reads = [], []
+
+    def classify_regime(self, symbol):
+        self.classified.append(symbol)
+        return MarketRegime.RANGE
+
+    def get_regime_data(self, symbol):
+        self.atr_reads.append(symbol)
+        return {"atr": 0.0010}
+
+
+def _seed(storage, ticket: int, symbol: str) -> None:
+    storage.update_position_metadata(ticket, {
+        "symbol": symbol, "entry_price": 1.1, "direction": "BUY", "sl": 1.098, "tp": 1.104,
+        "volume": 0.1, "initial_risk_usd": 100.0, "entry_regime": "TREND", "timeframe": "M5",
+        "strategy": "TEST", "entry_time": datetime.now(timezone.utc).isoformat(),
+    })
+
+
+@pytest.fixture
+def book(storage):
+    positions = []
+    for i, symbol in enumerate(["EURUSD", "GBPUSD"] * 3):
+        ticket = 1000 + i
+        _seed(storage, ticket, symbol)
+        positions.append({"ticket": ticket, "symbol": symbol, "type": 0, "profit": 0.0,
+                          "price_open": 1.1, "price_current": 1.1, "sl": 1.098, "tp": 1.104})
+    return positions
+
+
+@pytest.fixture
+def manager(storage):
+    config = {"regime_adjustments": {"RANGE": {"sl_atr_multiplier": 1.0, "tp_atr_multiplier": 1.5}}}
+    return PositionManager(storage, None, _Classifier(), config)
+
+
+class TestStorageBulk:
+
+    def test_bulk_read_matches_single_reads(self, storage, book):
+        tickets = [p["ticket"] for p in book] + [999999]
+        bulk = storage.get_position_metadata_bulk(tickets)
+        assert 999999 not in bulk
+        for ticket in tickets[:-1]:
+            assert bulk[ticket] == storage.get_position_metadata(ticket)
+
+    def test_bulk_write_merges_like_single_write(self, storage, book):
+        _seed(storage, 2000, "EURUSD")
+        storage.update_position_metadata(2000, {"stale_exit": True, "sl": 1.0})
+        written = storage.update_position_metadata_bulk({1000: {"stale_exit": True, "sl": 1.0}})
+        assert written == 1
+        single, bulk = storage.get_position_metadata(2000), storage.get_position_metadata(1000)
+        for key in ("symbol", "sl", "tp", "entry_regime", "data"):
+            assert single[key] == bulk[key], key
+
+
+class TestContext:
+
+    def test_views_are_read_only_and_see_staged_updates(self):
+        ctx = PositionMonitorContext({1: {"sl": 1.0}})
+        view = ctx.metadata(1)
+        with pytest.raises(TypeError):
+            view["sl"] = 2.0
+        ctx.stage(1, {"sl": 2.0})
+        ctx.stage(2, {"strategy": "ORPHAN_SYNC"})
+        assert ctx.metadata(1)["sl"] == 2.0
+        assert ctx.metadata(2)["strategy"] == "ORPHAN_SYNC"
+        assert ctx.metadata(3) is None
+
+    def test_memo_resolves_once_per_symbol(self):
+        ctx, calls = PositionMonitorContext({}), []
+        for _ in range(3):
+            ctx.memo("EURUSD", "atr", lambda: calls.append(1) or 0.001)
+        assert calls == [1] and ctx.stats["memo_hits"] == 2
+
+
+class TestMonitorCycle:
+
+    def test_cost_scales_with_symbols_not_positions(self, storage, manager, book, monkeypatch):
+        reads, writes, events, in_audit = [], [], [], []
+        bulk_read, bulk_write = storage.get_position_metadata_bulk, storage.update_position_metadata_bulk
+        single_read, single_write = storage.get_position_metadata, storage.update_position_metadata
+
+        def audit(ticket, metadata):
+            events.append(("audit", ticket))
+            in_audit.append(ticket)
+            try:
+                return single_write(ticket, metadata)
+            finally:
+                in_audit.pop()
+
+        monkeypatch.setattr(storage, "get_position_metadata_bulk",
+                            lambda tickets: reads.append(list(tickets)) or bulk_read(tickets))
+        monkeypatch.setattr(storage, "update_position_metadata_bulk",
+                            lambda updates: writes.append(sorted(updates)) or bulk_write(updates))
+        monkeypatch.setattr(storage, "get_position_metadata",
+                            lambda ticket: single_read(ticket) if in_audit else pytest.fail("per-ticket metadata read"))
+        monkeypatch.setattr(storage, "update_position_metadata", audit)
+        connector = _Connector(book)
+        modify = connector.modify_position
+        connector.modify_position = lambda ticket, *a, **k: events.append(("modify", ticket)) or modify(ticket, *a, **k)
+
+        summary = manager.monitor_usr_positions(connector)
+
+        assert [a["action"] for a in summary["actions"]] == ["REGIME_ADJUSTMENT"] * 6
+        assert reads == [[p["ticket"] for p in book]]
+        # Only the write-ahead modification audits are per ticket, each before its broker call
+        assert events == [e for p in book for e in (("audit", p["ticket"]), ("modify", p["ticket"]))]
+        assert writes == []
+        assert sorted(connector.calls["get_current_price"]) == ["EURUSD", "GBPUSD"]
+        assert sorted(connector.calls["get_symbol_info"]) == ["EURUSD", "GBPUSD"]
+        assert sorted(manager.regime_classifier.classified) == ["EURUSD", "GBPUSD"]
+        assert sorted(manager.regime_classifier.atr_reads) == ["EURUSD", "GBPUSD"]
+        assert manager._cycle_ctx is None
+
+    def test_modification_audit_survives_a_broker_exception(self, storage, manager, book):
+        connector, seen_by_broker = _Connector(book[:1]), []
+
+        def crash(*args, **kwargs):
+            seen_by_broker.append(storage.get_position_metadata(book[0]["ticket"])["data"].get("modification_reason"))
+            raise ConnectionError("broker gone")
+
+        connector.modify_position = crash
+        manager.monitor_usr_positions(connector)
+        assert seen_by_broker == ["RGM_RAN"]  # already on disk when the broker was called
+        stored = storage.get_position_metadata(book[0]["ticket"])
+        assert stored["data"]["modification_reason"] == "RGM_RAN"
+        assert stored["data"]["new_sl"] == pytest.approx(1.099)
+
+    def test_market_data_comes_from_the_connector_passed_in(self, storage, manager, book):
+        cycle, other = _Connector(book), _Connector([])
+        manager._cycle_ctx = PositionMonitorContext({}, cycle)
+        try:
+            manager._get_symbol_info("EURUSD", cycle)
+            manager._get_symbol_info("EURUSD", other)
+            manager._get_current_price("EURUSD", other)
+        finally:
+            manager._cycle_ctx = None
+        assert cycle.calls["get_symbol_info"] == ["EURUSD"]
+        assert other.calls["get_symbol_info"] == other.calls["get_current_price"] == ["EURUSD"]
@@ -0,0 +1,93 @@
+"""
+Tests for the deterministic market replay provider (SIM-REPLAY-2026-001).
+
+These tests exercise:
+  - Virtual clock: only closed bars are visible; step and accelerated modes
+  - Lazy resampling to higher timeframes
+  - Determinism of the seeded synthetic series
+  - Feeding replayed bars into the SimulatedExchange behind PaperConnector
+  - Use through DataProviderManager as a registered provider instance
+"""
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from connectors.replay_data_provider import ReplayDataProvider, VirtualClock, synthetic_ohlc
+from connectors.sim_exchange import SimulatedExchange
+from core_brain.data_provider_manager import DataProviderManager
+
+START = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+
+def test_fetch_only_returns_bars_closed_at_virtual_time():
+    provider = ReplayDataProvider.synthetic(["EURUSD"], bars=300, warmup_bars=100)
+    now = provider.clock.now()
+
+    bars = provider.fetch_ohlc("EURUSD", "M5", 500)
+    assert list(bars.columns) == ["time", "open", "high", "low", "close", "volume", "tick_volume"]
+    assert len(bars) == 100
+    assert bars["time"].iloc[-1] + timedelta(minutes=5) == now
+
+    provider.advance(3)
+    assert len(provider.fetch_ohlc("EURUSD", "M5", 500)) == 103
+    assert len(provider.fetch_ohlc("EURUSD", "M5", 10)) == 10
+    assert provider.remaining_bars() == 197
+
+
+def test_higher_timeframes_are_resampled_from_base_bars():
+    provider = ReplayDataProvider.synthetic(["EURUSD"], bars=288, warmup_bars=288)
+    base = provider.fetch_ohlc("EURUSD", "M5", 288)
+    hourly = provider.fetch_ohlc("EURUSD", "H1", 100)
+
+    assert len(hourly) == 24
+    first_hour = base.iloc[:12]
+    assert hourly.iloc[0][["open", "high", "low", "close"]].tolist() == [
+        first_hour["open"].iloc[0], first_hour["high"].max(), first_hour["low"].min(), first_hour["close"].iloc[-1],
+    ]
+    assert provider.fetch_ohlc("EURUSD", "M1", 10) is None
+    assert provider.fetch_ohlc("GBPUSD", "M5", 10) is None
+    assert not provider.is_symbol_supported("GBPUSD")
+
+
+def test_synthetic_series_is_deterministic_per_seed_and_symbol():
+    a = synthetic_ohlc("EURUSD", 500, START, seed=7)
+    pd.testing.assert_frame_equal(a, synthetic_ohlc("EURUSD", 500, START, seed=7))
+    assert not a["close"].equals(synthetic_ohlc("EURUSD", 500, START, seed=8)["close"])
+    assert not a["close"].equals(synthetic_ohlc("GBPUSD", 500, START, seed=7)["close"])
+    assert (a["high"] >= a[["open", "close"]].max(axis=1)).all()
+    assert (a["low"] <= a[["open", "close"]].min(axis=1)).all()
+
+
+def test_accelerated_clock_runs_at_speed_times_wall_time():
+    wall = [100.0]
+    clock = VirtualClock(START, speed=60.0, wall=lambda: wall[0])
+    wall[0] += 10.0
+    assert clock.now() == START + timedelta(minutes=10)
+    clock.advance(timedelta(minutes=5))
+    assert clock.now() == START + timedelta(minutes=15)
+    with pytest.raises(ValueError):
+        clock.advance(timedelta(seconds=-1))
+
+
+def test_replayed_bars_drive_the_simulated_exchange():
+    exchange = SimulatedExchange()
+    provider = ReplayDataProvider.synthetic(["EURUSD"], bars=200, warmup_bars=50, exchange=exchange)
+    assert provider.stats["bars_fed"] == 1  # last warm-up bar seeds the book
+
+    provider.advance(5)
+    assert provider.stats["bars_fed"] == 6
+    tick = provider.get_last_tick("EURUSD")
+    last_close = provider.fetch_ohlc("EURUSD", "M5", 1)["close"].iloc[-1]
+    assert tick == exchange.get_last_tick("EURUSD")
+    assert (tick["bid"] + tick["ask"]) / 2 == pytest.approx(last_close)
+
+
+def test_registered_in_data_provider_manager(storage):
+    provider = ReplayDataProvider.synthetic(["EURUSD"], bars=200, warmup_bars=120)
+    manager = DataProviderManager(storage=storage)
+    manager.register_provider_instance("replay", provider)
+
+    bars = manager.fetch_ohlc("EURUSD", "M5", 50, provider_name="replay")
+    pd.testing.assert_frame_equal(bars, provider.fetch_ohlc("EURUSD", "M5", 50))
+    assert manager.fetch_ohlc("GBPUSD", "M5", 50, provider_name="replay") is None
@@ -0,0 +1,192 @@
+"""
+Tests for the streaming per-instance SHADOW metric accumulators.
+
+These tests exercise:
+  - Equivalence of the running state with a full re-scan of sys_trades
+  - Incremental update inside save_sys_trade() (no rebuild on the read path)
+  - Invalidation + lazy rebuild on out-of-order closes and direct writes
+  - One bulk read for many instances
+  - Rebuild and incremental fold each run in one BEGIN IMMEDIATE transaction
+  - ShadowManager evaluating from the bulk read
+"""
+import random
+import statistics
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core_brain.shadow_manager import ShadowManager
+from data_vault.shadow_db import ShadowStorageManager
+from data_vault.storage import StorageManager
+from models.shadow import ShadowInstance, ShadowMetricState
+
+
+def _trade(instance_id: str, profit, close_time, mode: str = "SHADOW") -> dict:
+    return {
+        "instance_id": instance_id, "symbol": "EURUSD", "execution_mode": mode,
+        "profit": profit, "close_time": close_time,
+    }
+
+
+def _reference_metrics(profits):
+    """Independent re-computation with the statistics module (the former scan)."""
+    cumulative, running = [], 0.0
+    for p in profits:
+        running += p
+        cumulative.append(running)
+    losses = [abs(p) for p in profits if p < 0]
+    wins = [p for p in profits if p > 0]
+    mean = statistics.mean(cumulative)
+    streak = max_streak = 0
+    for p in profits:
+        streak = streak + 1 if p < 0 else 0
+        max_streak = max(max_streak, streak)
+    return {
+        "total_trades_executed": len(profits),
+        "win_rate": len(wins) / len(profits),
+        "profit_factor": sum(wins) / sum(losses) if losses else (1.5 if wins else 0.0),
+        "equity_curve_cv": statistics.stdev(cumulative) / abs(mean) if mean else 0.0,
+        "consecutive_losses_max": max_streak,
+    }
+
+
+def _state_row(storage: StorageManager, instance_id: str):
+    return storage._get_conn().execute(
+        "SELECT * FROM sys_shadow_metric_state WHERE instance_id = ?", (instance_id,)
+    ).fetchone()
+
+
+@pytest.fixture
+def shadow(storage):
+    return ShadowStorageManager(storage._get_conn())
+
+
+def test_incremental_state_matches_full_scan(storage, shadow):
+    rng = random.Random(11)
+    profits = [round(rng.uniform(-40.0, 60.0), 2) for _ in range(60)]
+    storage.save_sys_trade(_trade("INST_A", profits[0], "2026-03-01 00:00:00"))
+    shadow.get_metric_states(["INST_A"])  # seed state; later closes fold incrementally
+
+    with patch.object(shadow, "rebuild_metric_state") as rebuild:
+        for i, profit in enumerate(profits[1:], start=1):
+            storage.save_sys_trade(_trade("INST_A", profit, f"2026-03-01 {i // 60:02d}:{i % 60:02d}:00"))
+        storage.save_sys_trade(_trade("INST_A", None, "2026-03-02 00:00:00"))  # skipped like the scan
+        storage.save_sys_trade(_trade("INST_A", 99.0, "2026-03-03 00:00:00", mode="BACKTEST"))
+        metrics = shadow.calculate_instance_metrics_from_sys_trades("INST_A")
+    rebuild.assert_not_called()
+
+    expected = _reference_metrics(profits)
+    for field, value in expected.items():
+        assert getattr(metrics, field) == pytest.approx(value, rel=1e-9), field
+    assert metrics.max_drawdown_pct == 0.0
+
+    rebuilt = shadow.rebuild_metric_state("INST_A").to_metrics()
+    assert rebuilt.to_dict() == pytest.approx(metrics.to_dict(), rel=1e-9)
+
+
+def test_out_of_order_close_invalidates_and_rebuilds_in_close_order(storage, shadow):
+    for profit, close in [(10.0, "2026-03-01 10:00"), (-5.0, "2026-03-01 12:00")]:
+        storage.save_sys_trade(_trade("INST_B", profit, close))
+    shadow.get_metric_states(["INST_B"])
+
+    storage.save_sys_trade(_trade("INST_B", -7.0, "2026-03-01 11:00"))
+    assert _state_row(storage, "INST_B") is None
+
+    state = shadow.get_metric_states(["INST_B"])["INST_B"]
+    assert (state.trade_count, state.max_loss_streak, state.last_close_time) == (3, 2, "2026-03-01 12:00")
+    assert state.peak_equity == 10.0 and state.max_drawdown == pytest.approx(12.0)
+    assert _state_row(storage, "INST_B")["trade_count"] == 3
+
+
+def test_direct_write_to_sys_trades_invalidates_state(storage, shadow):
+    storage.save_sys_trade(_trade("INST_C", 25.0, "2026-03-01 10:00"))
+    assert shadow.calculate_instance_metrics_from_sys_trades("INST_C").total_trades_executed == 1
+
+    conn = storage._get_conn()
+    conn.execute("UPDATE sys_trades SET profit = -25.0 WHERE instance_id = 'INST_C'")
+    conn.commit()
+
+    metrics = shadow.calculate_instance_metrics_from_sys_trades("INST_C")
+    assert (metrics.win_rate, metrics.consecutive_losses_max) == (0.0, 1)
+
+
+def test_bulk_read_rebuilds_only_missing_instances(storage, shadow):
+    ids = [f"INST_{i:03d}" for i in range(12)]
+    for i, instance_id in enumerate(ids):
+        storage.save_sys_trade(_trade(instance_id, float(i - 5), "2026-03-01 10:00"))
+    shadow.get_metric_states(ids[:8])
+
+    with patch.object(shadow, "rebuild_metric_state", wraps=shadow.rebuild_metric_state) as rebuild:
+        states = shadow.get_metric_states(ids + ["INST_EMPTY"])
+
+    assert sorted(call.args[0] for call in rebuild.call_args_list) == ids[8:] + ["INST_EMPTY"]
+    assert states["INST_EMPTY"] == ShadowMetricState(instance_id="INST_EMPTY")
+    assert states["INST_007"].gross_profit == 2.0
+    assert states["INST_002"].to_metrics().profit_factor == 0.0
+
+
+def _traced(conn, action):
+    statements = []
+    conn.set_trace_callback(lambda sql: statements.append(" ".join(sql.split()).upper()))
+    try:
+        action()
+    finally:
+        conn.set_trace_callback(None)
+    return statements
+
+
+def _position(statements, prefix):
+    return next(i for i, sql in enumerate(statements) if sql.startswith(prefix))
+
+
+@pytest.mark.parametrize("provider", ["connection", "storage_manager"])
+def test_rebuild_reads_and_upserts_in_one_immediate_transaction(storage, provider):
+    storage.save_sys_trade(_trade("INST_D", 5.0, "2026-03-01 10:00"))
+    shadow = ShadowStorageManager(storage._get_conn() if provider == "connection" else storage)
+
+    statements = _traced(storage._get_conn(), lambda: shadow.rebuild_metric_state("INST_D"))
+
+    begin = _position(statements, "BEGIN IMMEDIATE")
+    read = _position(statements, "SELECT PROFIT, CLOSE_TIME FROM SYS_TRADES")
+    upsert = _position(statements, "INSERT OR REPLACE INTO SYS_SHADOW_METRIC_STATE")
+    commit = _position(statements, "COMMIT")
+    assert begin < read < upsert < commit
+    assert _state_row(storage, "INST_D")["trade_count"] == 1
+
+
+def test_save_sys_trade_folds_state_in_one_immediate_transaction(storage, shadow):
+    storage.save_sys_trade(_trade("INST_E", 5.0, "2026-03-01 10:00"))
+    shadow.get_metric_states(["INST_E"])
+
+    statements = _traced(
+        storage._get_conn(),
+        lambda: storage.save_sys_trade(_trade("INST_E", -2.0, "2026-03-01 11:00")),
+    )
+
+    begin = _position(statements, "BEGIN IMMEDIATE")
+    load = _position(statements, "SELECT * FROM SYS_SHADOW_METRIC_STATE")
+    upsert = _position(statements, "INSERT OR REPLACE INTO SYS_SHADOW_METRIC_STATE")
+    assert begin < load < _position(statements, "INSERT INTO SYS_TRADES") < upsert
+    assert "COMMIT" not in statements[begin + 1:upsert]
+    assert _state_row(storage, "INST_E")["trade_count"] == 2
+
+
+def test_shadow_manager_evaluates_from_one_bulk_read(storage, shadow):
+    ids = ["INST_F", "INST_G"]
+    for instance_id in ids:
+        storage.save_sys_trade(_trade(instance_id, 5.0, "2026-03-01 10:00"))
+    instances = [
+        ShadowInstance(instance_id=i, strategy_id="STRAT_F", account_id="DEMO-1", account_type="DEMO")
+        for i in ids
+    ]
+    manager = ShadowManager(storage=MagicMock())
+    manager.storage = MagicMock(wraps=shadow)
+    manager.storage.list_active_instances.return_value = instances
+
+    manager.evaluate_all_instances()
+    assert manager.recalculate_all_shadow_scores()["recalculated"] == 2
+
+    assert manager.storage.get_metric_states.call_count == 2
+    manager.storage.get_metric_states.assert_called_with(ids)
+    manager.storage.calculate_instance_metrics_from_sys_trades.assert_not_called()
+    assert all(instance.metrics.total_trades_executed == 1 for instance in instances)
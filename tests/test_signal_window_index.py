@@ -0,0 +1,187 @@
+"""
+Tests for the in-memory recent-signal window (dedup / consensus hot path).
+
+These tests exercise:
+  - O(matches) queries by (symbol, direction) with timeframe / strategy / id filters
+  - Bucket eviction as time advances and out-of-order inserts
+  - Warm-up from sys_signals and feeding from Signal models
+  - ConsensusEngine and SignalSelector answering from the index instead of a scan
+  - SignalSelector categories identical from the index and from sys_signals rows
+"""
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core_brain.intelligence.consensus_engine import ConsensusEngine
+from core_brain.intelligence.signal_window_index import SignalWindowIndex
+from core_brain.signal_selector import DuplicateCategory, SignalSelector
+from models.signal import ConnectorType, Signal, SignalType
+
+
+def _ago(minutes: float) -> datetime:
+    return datetime.now(timezone.utc) - timedelta(minutes=minutes)
+
+
+@pytest.fixture
+def index():
+    index = SignalWindowIndex(horizon_minutes=60, bucket_seconds=60)
+    index.ready = True
+    return index
+
+
+class TestQueries:
+
+    def test_filters_by_pair_timeframe_strategy_and_ids(self, index):
+        index.record("a", "EURUSD", "BUY", "M5", "oliver", 0.8, created_at=_ago(1))
+        index.record("b", "EURUSD", "BUY", "H1", "trifecta", 0.5, created_at=_ago(2))
+        index.record("c", "EURUSD", "SELL", "M5", "oliver", 0.9, created_at=_ago(1))
+        index.record("d", "GBPUSD", "BUY", "M5", "oliver", 0.9, created_at=_ago(1))
+        index.record("e", "EURUSD", "BUY", "M5", "oliver", 0.9, created_at=_ago(20))
+
+        ids = lambda entries: sorted(e.signal_id for e in entries)
+        assert ids(index.query("EURUSD", "BUY", 5)) == ["a", "b"]
+        assert ids(index.query("EURUSD", "BUY", 30)) == ["a", "b", "e"]
+        assert ids(index.query("EURUSD", "BUY", 5, timeframe="M5")) == ["a"]
+        assert ids(index.query("EURUSD", "BUY", 5, exclude_timeframe="M5")) == ["b"]
+        assert ids(index.query("EURUSD", "BUY", 5, exclude_strategy="oliver")) == ["b"]
+        assert ids(index.query("EURUSD", "BUY", 5, min_confidence=0.55)) == ["a"]
+        assert ids(index.query("EURUSD", "BUY", 30, exclude_ids=("e",))) == ["a", "b"]
+        assert ids(index.query("EURUSD", SignalType.BUY, 5)) == ["a", "b"]
+
+    def test_duplicates_and_expired_signals_are_not_indexed(self, index):
+        assert index.record("a", "EURUSD", "BUY", "M5", "s1", created_at=_ago(1)) is not None
+        assert index.record("a", "EURUSD", "BUY", "M5", "s1", created_at=_ago(1)) is None
+        assert index.record("old", "EURUSD", "BUY", "M5", "s1", created_at=_ago(90)) is None
+        assert len(index) == 1 and index.stats["duplicates"] == 1
+
+    def test_buckets_are_evicted_as_time_advances(self, index):
+        index.record("late", "EURUSD", "BUY", "M5", "s1", created_at=_ago(10))
+        index.record("early", "EURUSD", "BUY", "M5", "s1", created_at=_ago(40))  # out of order
+        series = index._pairs[("EURUSD", "BUY")][("M5", "s1")]
+        assert [e.signal_id for e in series] == ["early", "late"]
+
+        index.query("EURUSD", "BUY", 60, now_ts=time.time() + 30 * 60)
+        assert [e.signal_id for e in series] == ["late"]
+        assert index.stats["evicted"] == 1 and len(index) == 1
+
+        assert index.query("EURUSD", "BUY", 60, now_ts=time.time() + 55 * 60) == []
+        assert index._pairs == {} and index._buckets == {} and len(index) == 0
+
+
+def test_warm_from_storage_and_feed_from_signal_model(storage):
+    signal = Signal(
+        symbol="EURUSD", signal_type=SignalType.BUY, entry_price=1.1, confidence=0.8,
+        connector_type=ConnectorType.METATRADER5, timeframe="M5",
+        metadata={"strategy_id": "oliver"},
+    )
+    stored_id = storage.save_signal(signal)
+
+    index = SignalWindowIndex()
+    assert index.warm_from_storage(storage) == 1 and index.ready
+    [entry] = index.query("EURUSD", "BUY", 5)
+    assert (entry.signal_id, entry.strategy, entry.timeframe) == (stored_id, "oliver", "M5")
+
+    signal.metadata["strategy_id"] = "trifecta"
+    assert index.record_signal(signal, signal_id="fresh").strategy == "trifecta"
+    assert len(index.query("EURUSD", "BUY", 5, timeframe="M5")) == 2
+
+
+class TestConsumers:
+
+    async def test_consensus_bonus_from_index_without_recent_signals(self, index):
+        engine = ConsensusEngine(AsyncMock(), signal_index=index)
+        index.record("mine", "EURUSD", "BUY", "M5", "oliver", 0.9, created_at=_ago(0))
+        index.record("r1", "EURUSD", "BUY", "M5", "trifecta", 0.85, created_at=_ago(1))
+        index.record("r2", "EURUSD", "BUY", "M5", "momentum", 0.80, created_at=_ago(2))
+        index.record("h1", "EURUSD", "BUY", "H1", "breakout", 0.95, created_at=_ago(1))
+        index.record("weak", "EURUSD", "BUY", "M5", "scalper", 0.40, created_at=_ago(1))
+        current = {"signal_id": "trace", "symbol": "EURUSD", "signal_type": "BUY", "timeframe": "M5",
+                   "confidence": 0.80, "metadata": {"strategy_id": "oliver", "signal_id": "mine"}}
+
+        agreeing = engine._find_agreeing_indexed("EURUSD", "BUY", current)
+        assert sorted(s["metadata"]["strategy_id"] for s in agreeing) == ["momentum", "trifecta"]
+        assert await engine.compute_bonus(current, recent_signals=None) == ConsensusEngine.BONUS_STRONG_CONSENSUS
+
+        # Same answer as the sys_signals path (fetched by symbol + timeframe)
+        rows = [e.as_dict() for e in index.query("EURUSD", "BUY", 5, timeframe="M5")]
+        for row in rows:
+            row["created_at"] = row["created_at"].isoformat()
+        fallback = engine._find_agreeing_signals("EURUSD", "BUY", rows, current)
+        assert sorted(s["metadata"]["strategy_id"] for s in fallback) == ["momentum", "trifecta"]
+
+    async def test_selector_categories_from_index(self, index):
+        storage = AsyncMock()
+        storage.get_dedup_rule = AsyncMock(return_value=None)
+        selector = SignalSelector(storage, signal_index=index)
+        context = {"volatility_zscore": 1.0, "regime": "RANGE"}
+        signal = {"signal_id": "trace", "symbol": "EURUSD", "signal_type": "BUY",
+                  "timeframe": "M15", "strategy": "oliver", "metadata": {"signal_id": "mine"}}
+        index.record("mine", "EURUSD", "BUY", "M15", "oliver", created_at=_ago(0))
+        index.record("h1", "EURUSD", "BUY", "H1", "trifecta", created_at=_ago(2))
+
+        # The current signal is skipped; another timeframe is a multi-TF match (category D)
+        category, details = await selector._detect_duplicate_category(signal, [], context)
+        assert category == DuplicateCategory.D_MULTI_TIMEFRAME
+        assert [m["signal_id"] for m in details["cross_tf_matching"]] == ["h1"]
+
+        index.record("rep", "EURUSD", "BUY", "M15", "oliver", 0.7, created_at=_ago(3))
+        category, details = await selector._detect_duplicate_category(signal, [], context)
+        assert category == DuplicateCategory.A_REPETITION
+        assert [m["signal_id"] for m in details["matching_signals"]] == ["rep"]
+        storage.get_recent_sys_signals.assert_not_called()
+
+    async def test_selector_fallback_skips_the_persisted_current_signal(self):
+        storage = AsyncMock()
+        storage.get_dedup_rule = AsyncMock(return_value=None)
+        selector = SignalSelector(storage)
+        signal = {"signal_id": "trace", "symbol": "EURUSD", "signal_type": "BUY",
+                  "timeframe": "M15", "strategy": "oliver", "metadata": {"signal_id": "mine"}}
+        rows = [{"id": "mine", "symbol": "EURUSD", "signal_type": "BUY", "timeframe": "M15",
+                 "confidence": 0.8, "created_at": _ago(0).isoformat()}]
+
+        matching, cross_tf = selector._scan_recent_signals(signal, rows, 30)
+        assert matching == [] and cross_tf == []
+
+    @pytest.mark.parametrize("stored, expected", [
+        ([], DuplicateCategory.DIFFERENT),
+        ([("M15", "oliver")], DuplicateCategory.A_REPETITION),
+        ([("M15", "trifecta")], DuplicateCategory.B_CONSENSUS),
+        ([("H1", "trifecta"), ("M5", "oliver")], DuplicateCategory.D_MULTI_TIMEFRAME),
+        ([("M15", "trifecta"), ("H1", "oliver"), ("M15", "oliver")], DuplicateCategory.A_REPETITION),
+    ])
+    async def test_selector_index_and_sys_signals_paths_agree(self, storage, stored, expected):
+        def persist(timeframe, strategy):
+            return storage.save_signal(Signal(
+                symbol="EURUSD", signal_type=SignalType.BUY, entry_price=1.1, confidence=0.8,
+                connector_type=ConnectorType.METATRADER5, timeframe=timeframe,
+                metadata={"strategy_id": strategy},
+            ))
+
+        for timeframe, strategy in stored:
+            persist(timeframe, strategy)
+        current_id = persist("M15", "oliver")  # the signal being assessed is already persisted
+        signal = {"signal_id": "trace", "symbol": "EURUSD", "signal_type": SignalType.BUY,
+                  "timeframe": "M15", "strategy": "oliver", "metadata": {"signal_id": current_id}}
+        context = {"volatility_zscore": 1.0, "regime": "RANGE"}
+
+        index = SignalWindowIndex()
+        index.warm_from_storage(storage)
+        indexed = SignalSelector(storage, signal_index=index)
+        fallback = SignalSelector(storage)
+        rows = storage.get_recent_sys_signals(symbol="EURUSD", minutes=120)
+
+        by_index = await indexed._detect_duplicate_category(signal, [], context)
+        by_rows = await fallback._detect_duplicate_category(signal, rows, context)
+
+        def summary(result):
+            category, details = result
+            return (
+                category,
+                sorted((m["signal_id"], m["strategy"]) for m in details.get("matching_signals", [])),
+                sorted(r.get("signal_id") or r.get("id") for r in details.get("cross_tf_matching", [])),
+            )
+
+        assert summary(by_index) == summary(by_rows)
+        assert by_index[0] == expected
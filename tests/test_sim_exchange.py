@@ -0,0 +1,213 @@
+"""
+Tests for the deterministic simulated exchange behind PaperConnector.
+TRACE_ID: SIM-EXCHANGE-2026-001
+
+These tests exercise:
+  - Market fills with spread + sampled slippage, partial fills on finite depth
+  - Price-time priority of resting LIMIT orders
+  - STOP triggering and SL/TP evaluation along the intrabar path
+  - Connector-compatible position / pending order / deal history views
+  - Cost model calibration from usr_execution_logs
+  - Determinism under a seed and non-blocking throughput
+"""
+import time
+
+import pytest
+
+from connectors.paper_connector import PaperConnector
+from connectors.sim_exchange import SimulatedExchange
+from connectors.sim_execution_model import ExecutionCostModel, MIN_CALIBRATION_SAMPLES
+from connectors.sim_order_book import SymbolSpec
+
+
+def _zero_cost_model() -> ExecutionCostModel:
+    model = ExecutionCostModel(seed=1)
+    model.set_profile("EURUSD", slippage_pips=[0.0], latency_ms=[10.0])
+    return model
+
+
+@pytest.fixture
+def exchange() -> SimulatedExchange:
+    ex = SimulatedExchange(cost_model=_zero_cost_model())
+    ex.register_symbol("EURUSD", SymbolSpec(pip_size=0.0001, spread_pips=1.0,
+                                            depth_levels=3, level_volume=1.0, level_step_pips=1.0))
+    ex.update_quote("EURUSD", 1.1000, 1.1001, ts=1_000.0)
+    return ex
+
+
+class TestMarketOrders:
+
+    def test_buy_fills_at_ask_sell_at_bid(self, exchange):
+        buy = exchange.submit_order("EURUSD", "BUY", 0.5)
+        sell = exchange.submit_order("EURUSD", "SELL", 0.5)
+        assert buy["status"] == "FILLED" and buy["price"] == pytest.approx(1.1001)
+        assert sell["price"] == pytest.approx(1.1000)
+        assert buy["latency_ms"] == 10.0
+
+    def test_large_order_walks_depth_and_partially_fills(self, exchange):
+        result = exchange.submit_order("EURUSD", "BUY", 5.0)
+        # 3 levels × 1 lot at 1.1001 / 1.1002 / 1.1003
+        assert result["status"] == "PARTIAL"
+        assert result["volume"] == pytest.approx(3.0)
+        assert result["price"] == pytest.approx(1.1002)
+        assert exchange.stats["partial_fills"] == 1
+
+    def test_slippage_is_adverse(self):
+        model = ExecutionCostModel(seed=1)
+        model.set_profile("EURUSD", slippage_pips=[2.0], latency_ms=[5.0])
+        ex = SimulatedExchange(cost_model=model)
+        ex.update_quote("EURUSD", 1.1000, 1.1001)
+        assert ex.submit_order("EURUSD", "BUY", 0.1)["price"] == pytest.approx(1.1003)
+        assert ex.submit_order("EURUSD", "SELL", 0.1)["price"] == pytest.approx(1.0998)
+
+    def test_market_order_without_quote_rejected(self):
+        result = SimulatedExchange().submit_order("GBPUSD", "BUY", 0.1)
+        assert result["success"] is False
+
+
+class TestPendingOrders:
+
+    def test_limit_price_time_priority(self, exchange):
+        first = exchange.submit_order("EURUSD", "BUY", 2.0, kind="LIMIT", price=1.0990)
+        better = exchange.submit_order("EURUSD", "BUY", 1.0, kind="LIMIT", price=1.0995)
+        second = exchange.submit_order("EURUSD", "BUY", 2.0, kind="LIMIT", price=1.0990)
+        assert first["status"] == "PENDING"
+        # Ask touches 1.0990: 3 lots of liquidity → better price first, then FIFO.
+        exchange.update_quote("EURUSD", 1.0989, 1.0990)
+        pending = {o["ticket"]: o for o in exchange.get_pending_orders("EURUSD")}
+        assert better["ticket"] not in pending
+        assert first["ticket"] not in pending
+        assert pending[second["ticket"]]["volume"] == pytest.approx(2.0)
+        exchange.update_quote("EURUSD", 1.0988, 1.0989)
+        assert exchange.get_pending_orders("EURUSD") == []
+
+    def test_marketable_limit_fills_immediately(self, exchange):
+        result = exchange.submit_order("EURUSD", "BUY", 0.5, kind="LIMIT", price=1.1005)
+        assert result["status"] == "FILLED"
+        assert result["price"] == pytest.approx(1.1001)
+
+    def test_stop_triggers_on_bar_path(self, exchange):
+        stop = exchange.submit_order("EURUSD", "BUY", 0.5, kind="STOP", price=1.1020)
+        assert stop["status"] == "PENDING"
+        exchange.on_bar("EURUSD", 1.1000, 1.1030, 1.0995, 1.1025, ts=1_060.0)
+        positions = exchange.get_open_positions()
+        assert len(positions) == 1 and positions[0]["type"] == 0
+
+    def test_cancel_order(self, exchange):
+        order = exchange.submit_order("EURUSD", "SELL", 1.0, kind="LIMIT", price=1.1050)
+        assert exchange.cancel_order(order["ticket"])["success"] is True
+        exchange.update_quote("EURUSD", 1.1060, 1.1061)
+        assert exchange.get_open_positions() == []
+        assert exchange.cancel_order(order["ticket"])["success"] is False
+
+
+class TestExits:
+
+    def test_bearish_bar_hits_take_profit_first(self, exchange):
+        exchange.submit_order("EURUSD", "BUY", 1.0, sl=1.0980, tp=1.1020)
+        # Bearish bar: path O→H→L→C; high reaches TP first.
+        exchange.on_bar("EURUSD", 1.1000, 1.1025, 1.0975, 1.0990, ts=1_060.0)
+        closed = exchange.get_closed_usr_positions(hours=1)
+        assert len(closed) == 1
+        assert closed[0]["exit_reason"] == "TAKE_PROFIT"
+        assert closed[0]["exit_price"] == pytest.approx(1.1020)
+        assert closed[0]["profit"] == pytest.approx((1.1020 - 1.1001) * 100_000, abs=0.01)
+
+    def test_bullish_bar_hits_stop_loss_first(self, exchange):
+        exchange.submit_order("EURUSD", "BUY", 1.0, sl=1.0980, tp=1.1020)
+        # Bullish bar: path O→L→H→C; low reaches SL first.
+        exchange.on_bar("EURUSD", 1.1000, 1.1025, 1.0975, 1.1010, ts=1_060.0)
+        closed = exchange.get_closed_usr_positions(hours=1)
+        assert closed[0]["exit_reason"] == "STOP_LOSS"
+        assert closed[0]["exit_price"] == pytest.approx(1.0980)
+
+    def test_modify_and_close_position(self, exchange):
+        ticket = exchange.submit_order("EURUSD", "SELL", 1.0)["ticket"]
+        assert exchange.modify_position(ticket, 1.1050, 1.0950)["success"] is True
+        assert exchange.get_open_positions()[0]["sl"] == 1.1050
+        result = exchange.close_position(ticket, reason="manual")
+        assert result["success"] is True
+        assert exchange.get_open_positions() == []
+        deals = exchange.get_deals()
+        assert [d.entry for d in deals] == ["IN", "OUT"]
+
+
+class TestCostModel:
+
+    def test_calibrates_from_execution_logs(self, storage):
+        for i in range(MIN_CALIBRATION_SAMPLES + 5):
+            storage.log_execution_shadow(
+                signal_id=f"sig-{i}", symbol="EURUSD", theoretical_price=1.1, real_price=1.1,
+                slippage_pips=1.5, latency_ms=80.0, status="SUCCESS",
+                user_id="u1", trace_id=f"t-{i}",
+            )
+        model = ExecutionCostModel(seed=3)
+        assert model.calibrate_from_storage(storage, ["EURUSD", "GBPUSD"]) == 1
+        assert model.is_calibrated("EURUSD") and not model.is_calibrated("GBPUSD")
+        assert model.sample_slippage_pips("EURUSD") == 1.5
+        assert model.sample_latency_ms("EURUSD") == 80.0
+
+    def test_same_seed_same_fills(self):
+        def _run() -> list:
+            ex = SimulatedExchange(cost_model=ExecutionCostModel(seed=7))
+            ex.update_quote("EURUSD", 1.1000, 1.1001)
+            return [ex.submit_order("EURUSD", "BUY", 0.1)["price"] for _ in range(50)]
+
+        assert _run() == _run()
+
+
+class TestPaperConnectorIntegration:
+
+    def _signal(self, **kwargs):
+        from models.signal import Signal, SignalType, ConnectorType
+        fields = dict(symbol="EURUSD", signal_type=SignalType.BUY, confidence=80.0,
+                      connector_type=ConnectorType.PAPER, entry_price=1.1000,
+                      stop_loss=1.0950, take_profit=1.1100, volume=0.1)
+        fields.update(kwargs)
+        return Signal(**fields)
+
+    def test_execute_signal_is_non_blocking_and_tracked(self):
+        connector = PaperConnector()
+        started = time.perf_counter()
+        result = connector.execute_signal(self._signal(trace_id="abc123"))
+        assert time.perf_counter() - started < 0.1
+        assert result["success"] is True and result["status"] == "success"
+        positions = connector.get_open_positions()
+        assert len(positions) == 1
+        assert positions[0]["comment"] == "Aethelgard_abc123"
+
+    def test_thousands_of_orders_per_second(self):
+        connector = PaperConnector()
+        signal = self._signal()
+        started = time.perf_counter()
+        for _ in range(2000):
+            assert connector.execute_order(signal)["success"]
+        elapsed = time.perf_counter() - started
+        assert 2000 / elapsed > 1000
+
+    def test_market_feed_closes_positions_between_signals(self):
+        import pandas as pd
+        connector = PaperConnector(exchange=SimulatedExchange(cost_model=_zero_cost_model()))
+        bars = pd.DataFrame({
+            "time": pd.date_range("2026-01-05", periods=3, freq="5min", tz="UTC"),
+            "open": [1.1000, 1.1000, 1.1020], "high": [1.1005, 1.1030, 1.1025],
+            "low": [1.0995, 1.0990, 1.1015], "close": [1.1000, 1.1020, 1.1020],
+        })
+        connector.on_market_data("EURUSD", bars.iloc[:2])
+        assert connector.execute_signal(self._signal(entry_price=1.0500, take_profit=1.1025))["success"]
+        assert connector.get_open_positions()[0]["price_open"] == pytest.approx(1.10205)  # scanner quote wins
+
+        connector.on_market_data("EURUSD", bars)  # bar 1 closes: its high crosses the TP
+        assert connector.get_open_positions() == []
+        assert len(connector.get_closed_usr_positions()) == 1
+
+    def test_unfed_symbols_requote_at_each_entry_price(self):
+        connector = PaperConnector(exchange=SimulatedExchange(cost_model=_zero_cost_model()))
+        connector.execute_signal(self._signal(entry_price=1.1000))
+        connector.execute_signal(self._signal(entry_price=1.2000, stop_loss=1.1950, take_profit=1.2100))
+        assert connector.exchange.get_last_tick("EURUSD")["bid"] == pytest.approx(1.19995)
+
+    def test_calibrate_delegates_to_cost_model(self, storage):
+        connector = PaperConnector()
+        assert connector.calibrate(storage, ["EURUSD"]) == 0
+        assert not connector.exchange.cost_model.is_calibrated("EURUSD")
@@ -0,0 +1,129 @@
+"""
+Tests for the staged startup graph (PERF-STARTUP-GRAPH-2026-001).
+
+These tests exercise:
+  - Independent services built concurrently, dependents only after their deps
+  - Critical failures abort startup; deferred failures only skip dependents
+  - Declaration validation (undeclared deps, cycles, critical → deferred)
+  - start.py: lazy imports, and a critical path free of deferred services
+  - MainOrchestrator first-scan hook feeding the startup timeline
+"""
+import subprocess
+import sys
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core_brain.startup_graph import StartupError, StartupGraph, StartupStage
+
+
+def _slow(value, delay=0.2):
+    def factory(**_deps):
+        time.sleep(delay)
+        return value
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_independent_services_build_concurrently():
+    graph = StartupGraph()
+    graph.add("storage", lambda: "db")
+    graph.add("connectors", _slow("mt5"), deps=["storage"])
+    graph.add("scanner", _slow("scan"), deps=["storage"])
+    graph.add("executor", lambda storage, connectors: (storage, connectors), deps=["storage", "connectors"])
+    graph.add("tuner", lambda storage: "tuner", deps=["storage"], stage=StartupStage.DEFERRED)
+
+    started = time.perf_counter()
+    resolved = await graph.start()
+    assert time.perf_counter() - started < 0.35  # the two 0.2s nodes overlapped
+
+    assert resolved["executor"] == ("db", "mt5") and "tuner" not in resolved
+    by_name = {e.name: e for e in graph.timeline()}
+    assert by_name["executor"].started_s >= by_name["connectors"].finished_s
+    assert by_name["scanner"].started_s < by_name["connectors"].finished_s
+
+    await graph.start_deferred()
+    assert graph["tuner"] == "tuner"
+    assert "[deferred] tuner" in graph.format_timeline()
+
+
+@pytest.mark.asyncio
+async def test_critical_failure_aborts_and_deferred_failure_is_contained():
+    def boom(**_deps):
+        raise ConnectionError("broker down")
+
+    graph = StartupGraph()
+    graph.add("storage", lambda: "db")
+    graph.add("oem", boom, deps=["storage"], stage=StartupStage.DEFERRED)
+    graph.add("oem_alerts", lambda oem: oem, deps=["oem"], stage=StartupStage.DEFERRED)
+    graph.add("backups", lambda storage: "ok", deps=["storage"], stage=StartupStage.DEFERRED)
+    await graph.start()
+
+    await graph.start(StartupStage.DEFERRED)
+    assert graph["backups"] == "ok"
+    assert graph.failed == {"oem": "ConnectionError: broker down", "oem_alerts": "dependency failed"}
+
+    critical = StartupGraph()
+    critical.add("storage", boom)
+    critical.add("scanner", lambda storage: storage, deps=["storage"])
+    with pytest.raises(StartupError, match="storage: broker down"):
+        await critical.start()
+    assert critical.get("scanner") is None
+
+
+@pytest.mark.asyncio
+async def test_declaration_is_validated():
+    graph = StartupGraph()
+    graph.add("a", lambda b: b, deps=["b"])
+    graph.add("b", lambda a: a, deps=["a"])
+    with pytest.raises(ValueError, match="cycle"):
+        await graph.start()
+
+    graph = StartupGraph()
+    graph.add("tuner", lambda: 1, stage=StartupStage.DEFERRED)
+    graph.add("executor", lambda tuner: tuner, deps=["tuner"])
+    with pytest.raises(ValueError, match="cannot depend on deferred"):
+        await graph.start()
+
+    with pytest.raises(ValueError, match="declared twice"):
+        graph.add("tuner", lambda: 2)
+
+
+def test_launcher_imports_lazily_and_defers_non_critical_services():
+    probe = (
+        "import sys, start\n"
+        "from core_brain.startup_graph import StartupGraph, StartupStage\n"
+        "heavy = ['core_brain.main_orchestrator', 'core_brain.scanner', 'core_brain.server', 'core_brain.edge_tuner']\n"
+        "print([m for m in heavy if m in sys.modules])\n"
+        "graph = StartupGraph()\n"
+        "start._declare_startup_services(graph)\n"
+        "specs = graph._specs\n"
+        "graph._validate({n: s for n, s in specs.items() if s.stage == StartupStage.CRITICAL}, StartupStage.CRITICAL)\n"
+        "print(sorted(n for n, s in specs.items() if s.stage == StartupStage.DEFERRED))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, timeout=120)
+    assert out.returncode == 0, out.stderr
+    imported, deferred = out.stdout.strip().splitlines()[-2:]
+    assert imported == "[]"
+    for name in ("backtest_orchestrator", "edge_tuner_loop", "shadow_pool", "oem"):
+        assert f"'{name}'" in deferred
+    # Resolved before orchestrator.run(): the veto gates execution, expiry precedes the first cycle
+    for name in ("economic_integration", "shadow_expiry"):
+        assert f"'{name}'" not in deferred
+
+
+@pytest.mark.asyncio
+async def test_first_scan_hook_fires_once(monkeypatch):
+    from core_brain import main_orchestrator as mo
+
+    monkeypatch.setattr(mo.cycle_scan, "run_pre_phase", AsyncMock(return_value=True))
+    monkeypatch.setattr(mo.cycle_scan, "run_scan_phase", AsyncMock(return_value=None))
+    graph = StartupGraph()
+    orch = mo.MainOrchestrator.__new__(mo.MainOrchestrator)
+    orch._on_first_scan = lambda: graph.mark("first_scan")
+
+    await orch.run_single_cycle()
+    first = graph.milestones["first_scan"]
+    await orch.run_single_cycle()
+    assert graph.milestones == {"first_scan": first}
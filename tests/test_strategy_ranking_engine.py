@@ -0,0 +1,135 @@
+"""
+Tests for the vectorized StrategyRanker batch engine.
+TRACE_ID: RANKER-BATCH-VECTOR-2026-001
+
+These tests exercise:
+  - Identical decisions / payloads vs. the per-strategy evaluate_and_rank path
+  - One ranking read and one transaction per cycle (no per-strategy queries)
+  - All-or-nothing persistence of transitions and per-strategy fallback rows
+"""
+import random
+from unittest.mock import patch
+
+import pytest
+
+from core_brain.strategy_ranker import StrategyRanker
+from data_vault.storage import StorageManager
+
+
+def _seed(storage: StorageManager, count: int = 120, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    boundaries = [
+        {"profit_factor": 1.5, "win_rate": 0.5, "completed_last_50": 50},
+        {"drawdown_max": 3.0, "consecutive_losses": 4},
+        {"drawdown_max": 2.99, "consecutive_losses": 5},
+    ]
+    for i in range(count):
+        ranking = {
+            "execution_mode": ("SHADOW", "LIVE", "QUARANTINE")[i % 3],
+            "profit_factor": round(rng.uniform(0.5, 3.5), 2),
+            "win_rate": round(rng.uniform(0.3, 0.8), 3),
+            "drawdown_max": round(rng.uniform(0.0, 6.0), 2),
+            "sharpe_ratio": round(rng.uniform(-1.0, 6.0), 2),
+            "consecutive_losses": rng.randint(0, 8),
+            "completed_last_50": rng.choice([10, 49, 50, 80]),
+            "total_usr_trades": rng.randint(50, 500),
+        }
+        if i < len(boundaries) * 3:
+            ranking.update(boundaries[i // 3])
+        storage.save_signal_ranking(f"STRAT_{i:04d}", ranking)
+
+
+def _per_strategy(ranker: StrategyRanker, strategy_ids):
+    """Reference: the original one-strategy-at-a-time batch loop."""
+    results = {}
+    for strategy_id in strategy_ids:
+        try:
+            results[strategy_id] = ranker.evaluate_and_rank(strategy_id)
+        except Exception as e:
+            results[strategy_id] = {"action": "error", "error": str(e)}
+    return results
+
+
+def _comparable(result):
+    result = dict(result)
+    result.pop("trace_id", None)
+    return result, result.pop("weighted_score", None)
+
+
+@pytest.fixture
+def twin_storages(tmp_path):
+    reference = StorageManager(db_path=str(tmp_path / "reference.db"))
+    batched = StorageManager(db_path=str(tmp_path / "batched.db"))
+    for storage in (reference, batched):
+        _seed(storage)
+    return reference, batched
+
+
+def test_batch_matches_per_strategy_decisions(twin_storages):
+    reference, batched = twin_storages
+    ids = [r["strategy_id"] for r in reference.get_all_signal_rankings()] + ["MISSING_0001"]
+
+    expected = _per_strategy(StrategyRanker(storage=reference), ids)
+    actual = StrategyRanker(storage=batched).batch_evaluate(ids)
+
+    assert list(actual) == ids
+    actions = {r["action"] for r in actual.values()}
+    assert {"promoted", "rehabilitated", "recovered", "no_change", "not_found"} <= actions
+    for sid in ids:
+        exp, exp_score = _comparable(expected[sid])
+        got, got_score = _comparable(actual[sid])
+        assert got == exp, sid
+        assert got_score == pytest.approx(exp_score, abs=1e-12)
+        if "trace_id" in expected[sid]:
+            assert actual[sid]["trace_id"].startswith("RANK-")
+
+    modes = lambda s: {r["strategy_id"]: r["execution_mode"] for r in s.get_all_signal_rankings()}
+    assert modes(batched) == modes(reference)
+
+
+def test_evaluate_all_uses_one_read_and_one_transaction(storage):
+    _seed(storage, count=30)
+    ranker = StrategyRanker(storage=storage)
+    with patch.object(storage, "get_signal_ranking") as per_strategy_read, \
+         patch.object(storage, "update_strategy_execution_mode") as per_strategy_write, \
+         patch.object(storage, "apply_strategy_transitions", wraps=storage.apply_strategy_transitions) as bulk:
+        results = ranker.evaluate_all_usr_strategies()
+
+    assert len(results) == 30
+    per_strategy_read.assert_not_called()
+    per_strategy_write.assert_not_called()
+    bulk.assert_called_once()
+    transitions = bulk.call_args.args[0]
+    assert {t["strategy_id"] for t in transitions} == {
+        sid for sid, r in results.items() if r["action"] in ("promoted", "rehabilitated", "recovered")
+    }
+    assert len(storage.get_signal_ranking_history(transitions[0]["strategy_id"])) == 1
+
+
+def test_failed_transaction_reports_errors_and_changes_nothing(storage):
+    storage.save_signal_ranking("PROMO_0001", {
+        "execution_mode": "SHADOW", "profit_factor": 2.0, "win_rate": 0.6, "completed_last_50": 60,
+    })
+    storage.save_signal_ranking("STEADY_0001", {"execution_mode": "LIVE", "drawdown_max": 1.0})
+    ranker = StrategyRanker(storage=storage)
+    with patch.object(storage, "apply_strategy_transitions", side_effect=RuntimeError("db locked")):
+        results = ranker.batch_evaluate(["PROMO_0001", "STEADY_0001"])
+
+    assert results["PROMO_0001"] == {"action": "error", "error": "db locked"}
+    assert results["STEADY_0001"]["action"] == "no_change"
+    assert storage.get_signal_ranking("PROMO_0001")["execution_mode"] == "SHADOW"
+
+
+def test_rows_with_null_metrics_fall_back_to_per_strategy_path(storage):
+    storage.save_signal_ranking("NULLPF_0001", {"execution_mode": "SHADOW", "completed_last_50": 60})
+    conn = storage._get_conn()
+    try:
+        conn.execute("UPDATE sys_signal_ranking SET profit_factor = NULL WHERE strategy_id = 'NULLPF_0001'")
+        conn.commit()
+    finally:
+        storage._close_conn(conn)
+    ranker = StrategyRanker(storage=storage)
+
+    expected = _per_strategy(ranker, ["NULLPF_0001"])
+    assert ranker.batch_evaluate(["NULLPF_0001"]) == expected
+    assert expected["NULLPF_0001"]["action"] == "error"
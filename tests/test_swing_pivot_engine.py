@@ -0,0 +1,121 @@
+"""
+Tests for the vectorized swing pivot engine behind MarketStructureAnalyzer.
+TRACE_ID: SENSOR-SWING-PIVOT-2026-001
+
+These tests exercise:
+  - Parity of vectorized HH/HL/LH/LL masks with the original loop detectors
+  - Incremental (one appended bar) updates vs full recomputation
+  - Cache keyed by (symbol, timeframe, last bar) and breaker block parity
+"""
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core_brain.sensors.market_structure_analyzer import MarketStructureAnalyzer
+from core_brain.sensors.swing_pivot_engine import SwingPivotEngine
+
+
+def _loop_detector(values: np.ndarray, rising: bool) -> List[int]:
+    """Reference: the analyzer's original per-row loop."""
+    if len(values) < 3:
+        return []
+    out = []
+    for i in range(1, len(values)):
+        up = values[i] > values[i - 1] if rising else values[i] < values[i - 1]
+        if up:
+            if i >= 2:
+                prev = values[i - 1] > values[i - 2] if rising else values[i - 1] < values[i - 2]
+                if prev:
+                    out.append(i)
+            else:
+                out.append(i)
+    return out
+
+
+class _Storage:
+    def get_dynamic_params(self):
+        return {}
+
+
+def _candles(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.10 + np.cumsum(rng.normal(0, 0.0008, n))
+    high = close + rng.uniform(0.0001, 0.0010, n)
+    low = close - rng.uniform(0.0001, 0.0010, n)
+    return pd.DataFrame({
+        "time": pd.date_range("2026-03-01", periods=n, freq="5min"),
+        "open": close, "high": high, "low": low, "close": close,
+        "volume": np.full(n, 1000),
+    })
+
+
+@pytest.fixture
+def analyzer() -> MarketStructureAnalyzer:
+    return MarketStructureAnalyzer(storage=_Storage())
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_detectors_match_loop_reference(analyzer, seed):
+    df = _candles(60, seed)
+    df.loc[7, "high"] = np.nan  # NaN comparisons must behave like the loop
+    assert analyzer.detect_higher_highs(df) == _loop_detector(df["high"].to_numpy(), True)
+    assert analyzer.detect_higher_lows(df) == _loop_detector(df["low"].to_numpy(), True)
+    assert analyzer.detect_lower_highs(df) == _loop_detector(df["high"].to_numpy(), False)
+    assert analyzer.detect_lower_lows(df) == _loop_detector(df["low"].to_numpy(), False)
+
+
+def test_incremental_append_matches_full_recompute():
+    df = _candles(120, seed=3)
+    incremental, full = SwingPivotEngine(), SwingPivotEngine()
+    lookback = 20
+    for end in range(2, len(df) + 1):
+        window = df.iloc[max(0, end - lookback):end]
+        highs, lows = window["high"].to_numpy(), window["low"].to_numpy()
+        prev = tuple(df.iloc[end - 2][["time", "high", "low"]]) if end >= 2 else None
+        last = tuple(df.iloc[end - 1][["time", "high", "low"]])
+        got = incremental.update("EURUSD", highs, lows, prev, last)
+        want = full.update(None, highs, lows)
+        assert got == want, end
+    assert incremental.stats["incremental"] == len(df) - 2
+    assert incremental.stats["full"] == 1
+
+
+def test_structure_cache_keyed_by_symbol_timeframe_and_last_bar(analyzer):
+    df = _candles(40, seed=1)
+    first = analyzer.detect_market_structure("EURUSD", df, timeframe="M5")
+    assert analyzer.detect_market_structure("EURUSD", df, timeframe="M5") is first
+    # Same last bar on another symbol/timeframe is not a cache hit.
+    assert analyzer.detect_market_structure("GBPUSD", df, timeframe="M5") is not first
+    assert analyzer.detect_market_structure("EURUSD", df, timeframe="H1") is not first
+    # A forming bar that extends its high invalidates the entry.
+    moved = df.copy()
+    moved.loc[moved.index[-1], "high"] += 0.01
+    assert analyzer.detect_market_structure("EURUSD", moved, timeframe="M5") is not first
+
+
+def test_appended_bar_uses_incremental_path_and_matches_fresh_analyzer(analyzer):
+    df = _candles(80, seed=2)
+    analyzer.detect_market_structure("EURUSD", df.iloc[:79], timeframe="M5")
+    result = analyzer.detect_market_structure("EURUSD", df, timeframe="M5")
+    assert analyzer._pivot_engine.stats["incremental"] == 1
+    fresh = MarketStructureAnalyzer(storage=_Storage()).detect_market_structure("EURUSD", df)
+    for key in ("type", "validation_level", "confidence",
+                "hh_indices", "hl_indices", "lh_indices", "ll_indices"):
+        assert result[key] == fresh[key]
+
+
+def test_breaker_block_matches_pandas_slicing(analyzer):
+    df = _candles(50, seed=4)
+    recent = df.iloc[-20:].reset_index(drop=True)
+    for structure_type in ("UPTREND", "DOWNTREND"):
+        structure = {"is_valid": True, "type": structure_type,
+                     "last_hl_idx": 6, "last_lh_idx": 6}
+        block = analyzer.calculate_breaker_block(structure, df)
+        if structure_type == "UPTREND":
+            high, low = recent.iloc[6:7]["high"].max(), recent.iloc[4:7]["low"].min()
+        else:
+            low, high = recent.iloc[6:7]["low"].min(), recent.iloc[4:7]["high"].max()
+        assert block["midpoint"] == pytest.approx((high + low) / 2)
+        assert block["range_pips"] == pytest.approx((high - low) * 10000)
@@ -0,0 +1,98 @@
+"""
+Tests for the interned symbol registry (PERF-SYMBOL-REGISTRY-2026-001).
+
+These tests exercise:
+  - Alias → canonical → id interning, broker suffixes included
+  - InstrumentManager's bounded negative cache, cleared on registry refresh
+  - Precomputed, immutable metadata records (taxonomy, currencies, config, volume)
+  - Refresh on broker spec changes; test doubles are never recorded
+  - Hot paths served from the registry without repeated spec lookups
+"""
+import dataclasses
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from core_brain.instrument_manager import InstrumentManager
+from core_brain.risk_policy_enforcer import RiskPolicyEnforcer
+from core_brain.symbol_registry import SymbolRegistry, canonical_symbol
+from data_vault.default_instruments import DEFAULT_INSTRUMENTS_CONFIG
+
+
+def _spec(digits=5, point=0.00001, contract=100000):
+    return SimpleNamespace(digits=digits, point=point, trade_contract_size=contract,
+                           volume_min=0.01, volume_max=100.0, volume_step=0.01)
+
+
+@pytest.fixture
+def registry():
+    return SymbolRegistry(instrument_manager=InstrumentManager(config=dict(DEFAULT_INSTRUMENTS_CONFIG)))
+
+
+def test_aliases_intern_to_one_id(registry):
+    ids = {registry.intern(alias) for alias in ("EURUSD", "EURUSD=X", "eur/usd", "eurusd")}
+    assert len(ids) == 1 and registry.symbol(ids.pop()) == "EURUSD"
+    assert registry.register_alias("EURUSD.a", "EURUSD") == registry.intern("EURUSD")
+    assert registry.intern("GBPUSD") != registry.intern("EURUSD") and len(registry) == 2
+    assert canonical_symbol("usdjpy=X") == "USDJPY"
+
+
+def test_broker_suffixes_resolve_without_register_alias(registry):
+    for alias in ("EURUSD.a", "eurusd.pro", "EURUSD-ECN", "EURUSD_i"):
+        assert canonical_symbol(alias) == "EURUSD"
+        assert registry.intern(alias) == registry.intern("EURUSD")
+    assert canonical_symbol("BRK.B") == "BRK.B"
+    assert registry.record("EURUSD.a").currencies == ("EUR", "USD")
+
+
+def test_unclassified_symbols_are_bounded_and_retried_after_refresh(registry, monkeypatch):
+    im = registry._instrument_manager
+    monkeypatch.setattr(InstrumentManager, "MAX_UNCLASSIFIED", 3)
+    for name in ("ZZZ1", "ZZZ2", "ZZZ3", "ZZZ4"):
+        assert im.get_config(name) is None
+    assert im._unclassified == {"ZZZ4"}
+
+    registry.refresh()
+    assert im._unclassified == set()
+
+
+def test_records_carry_precomputed_metadata(registry):
+    fx = registry.record("EURUSD=X")
+    index = registry.record("US30")
+
+    assert (fx.symbol, fx.asset_type, fx.asset_class) == ("EURUSD", "forex", "forex")
+    assert (fx.base_currency, fx.quote_currency) == ("EUR", "USD")
+    assert fx.category == "FOREX" and fx.min_score is not None and fx.has_volume
+    assert index.asset_type == "indices" and not index.has_volume and index.currencies == ()
+    assert registry.record(fx.id) is fx  # built once, shared
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        fx.pip_size = 1.0
+
+
+def test_spec_changes_rebuild_the_record(registry):
+    first = registry.observe_spec("USDJPY", _spec(digits=3, point=0.001))
+    assert first.pip_size == pytest.approx(0.01) and first.spec_version == 1
+    assert registry.observe_spec("USDJPY", _spec(digits=3, point=0.001)) is first
+
+    changed = registry.observe_spec("USDJPY", _spec(digits=2, point=0.01, contract=1000))
+    assert changed.spec_version == 2 and changed.contract_size == 1000
+    assert changed.pip_size == pytest.approx(0.01)
+    assert registry.observe_spec("USDJPY", Mock()) is changed  # doubles are not specs
+    assert registry.stats["spec_refreshes"] == 2
+
+    registry.refresh("USDJPY")
+    assert registry.record("USDJPY").contract_size == 1000  # config refresh keeps the spec
+
+
+def test_risk_enforcer_reuses_the_observed_spec(monkeypatch, registry):
+    from core_brain import risk_policy_enforcer
+    monkeypatch.setattr(risk_policy_enforcer, "get_symbol_registry", lambda: registry)
+    enforcer = RiskPolicyEnforcer.__new__(RiskPolicyEnforcer)
+    enforcer.instrument_manager = None
+    connector = Mock()
+    connector.get_symbol_info.return_value = _spec()
+
+    pips = [enforcer._get_pip_size("GBPUSD", connector) for _ in range(10)]
+    assert pips == [pytest.approx(0.0001)] * 10
+    assert connector.get_symbol_info.call_count == 1
@@ -0,0 +1,186 @@
+"""
+Tests for the shared per-tenant /ws/v3/synapse publisher.
+TRACE_ID: UI-SYNAPSE-SHARED-PUBLISHER-2026-001
+
+These tests exercise:
+  - One payload build and one serialization per tick, shared by all subscribers
+  - Publisher lifecycle bound to the subscriber count (RULE T1: per tenant)
+  - Non-blocking delivery to slow subscribers and fragment reuse for unchanged sections
+  - Storage-backed sections re-queried only when their change tokens move
+"""
+import asyncio
+import json
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core_brain.api.dependencies.auth import get_ws_user
+from core_brain.api.routers import telemetry as telemetry_module
+from core_brain.api.services.synapse_publisher import (
+    SUBSCRIBER_QUEUE_SIZE,
+    SectionCache,
+    SynapsePublisherRegistry,
+    TenantTelemetryPublisher,
+)
+from models.auth import TokenPayload
+
+
+def _counting_factory(calls):
+    def factory(tenant_id):
+        async def produce():
+            calls.append(tenant_id)
+            return {"tenant_id": tenant_id, "tick": len(calls),
+                    "risk_buffer": {"risk_mode": "NORMAL", "timestamp": str(len(calls))}}
+        return produce
+    return factory
+
+
+class TestSharedProduction:
+
+    async def test_one_build_per_tick_for_all_subscribers(self):
+        calls = []
+        registry = SynapsePublisherRegistry(_counting_factory(calls), interval=3600)
+        _, first = registry.subscribe("tenant-a")
+        _, second = registry.subscribe("tenant-a")
+        frame_a, frame_b = await first.queue.get(), await second.queue.get()
+        assert calls == ["tenant-a"]
+        assert frame_a is frame_b  # serialized once, same str object
+        assert json.loads(frame_a)["tenant_id"] == "tenant-a"
+        registry.unsubscribe("tenant-a", first)
+        registry.unsubscribe("tenant-a", second)
+
+    async def test_publisher_stops_with_last_subscriber(self):
+        calls = []
+        registry = SynapsePublisherRegistry(_counting_factory(calls), interval=0.01)
+        publisher, sub_a = registry.subscribe("tenant-a")
+        _, sub_b = registry.subscribe("tenant-b")
+        await asyncio.sleep(0.05)
+        assert {"tenant-a", "tenant-b"} <= set(calls)
+        registry.unsubscribe("tenant-a", sub_a)
+        assert "tenant-a" not in registry.publishers and not publisher.is_running
+        await asyncio.sleep(0)
+        produced = calls.count("tenant-a")
+        await asyncio.sleep(0.05)
+        assert calls.count("tenant-a") == produced
+        assert sub_a.queue.qsize() <= SUBSCRIBER_QUEUE_SIZE
+        registry.unsubscribe("tenant-b", sub_b)
+        assert registry.publishers == {}
+
+
+class TestDelivery:
+
+    async def test_slow_subscriber_drops_oldest_frames(self):
+        calls = []
+        publisher = TenantTelemetryPublisher("t", _counting_factory(calls)("t"), interval=3600)
+        slow = publisher.subscribe()
+        for _ in range(SUBSCRIBER_QUEUE_SIZE + 3):
+            await publisher.tick()
+        assert slow.queue.qsize() == SUBSCRIBER_QUEUE_SIZE
+        assert slow.dropped >= 3
+        frames = [json.loads(slow.queue.get_nowait()) for _ in range(SUBSCRIBER_QUEUE_SIZE)]
+        assert frames[-1]["tick"] == len(calls)
+        publisher.unsubscribe(slow)
+
+    async def test_producer_error_becomes_error_frame(self):
+        async def broken():
+            raise RuntimeError("DB error")
+        publisher = TenantTelemetryPublisher("t", broken, interval=3600)
+        subscriber = publisher.subscribe()
+        frame = json.loads(await subscriber.queue.get())
+        assert frame["type"] == "error" and "DB error" in frame["message"]
+        publisher.unsubscribe(subscriber)
+
+
+def test_unchanged_sections_reuse_serialized_fragment():
+    publisher = TenantTelemetryPublisher("t", None)
+    first = {"strategy_array": [{"strategy_id": "S1"}],
+             "risk_buffer": {"risk_mode": "NORMAL", "timestamp": "t1"},
+             "system_heartbeat": {"cpu_percent": 1.0, "timestamp": "t1"}}
+    publisher.encode(first)
+    second = {"strategy_array": [{"strategy_id": "S1"}],
+              "risk_buffer": {"risk_mode": "NORMAL", "timestamp": "t2"},
+              "system_heartbeat": {"cpu_percent": 2.0, "timestamp": "t2"}}
+    decoded = json.loads(publisher.encode(second))
+    assert publisher.stats["sections_reused"] == 2
+    assert decoded["risk_buffer"]["timestamp"] == "t1"  # fragment kept as-is
+    assert decoded["system_heartbeat"] == second["system_heartbeat"]
+    assert decoded["strategy_array"] == second["strategy_array"]
+
+
+def test_websocket_clients_share_one_producer(monkeypatch):
+    calls = []
+    registry = SynapsePublisherRegistry(_counting_factory(calls), interval=3600)
+    monkeypatch.setattr(telemetry_module, "synapse_publishers", registry)
+    app = FastAPI()
+    app.include_router(telemetry_module.router)
+    app.dependency_overrides[get_ws_user] = lambda: TokenPayload(
+        sub="tenant-ws", exp=9999999999, role="trader", tid="tenant-ws")
+    client = TestClient(app)
+    with client.websocket_connect("/ws/v3/synapse") as ws_a:
+        assert ws_a.receive_json()["tenant_id"] == "tenant-ws"
+        with client.websocket_connect("/ws/v3/synapse") as ws_b:
+            assert ws_b.receive_json()["tenant_id"] == "tenant-ws"
+            ws_b.send_text("ping")
+            assert ws_b.receive_json()["type"] == "pong"
+        assert calls == ["tenant-ws"]
+
+
+class TestChangeDetection:
+
+    def _storage(self, tokens):
+        storage = MagicMock()
+        storage.get_change_tokens.side_effect = lambda: dict(tokens)
+        storage.get_sys_config.return_value = {"config_trading": {"risk_mode": "NORMAL"}}
+        storage.get_signal_pipeline_history.return_value = [
+            {"timestamp": datetime.now(timezone.utc).isoformat(), "decision": "APPROVED"}]
+        storage.get_all_sys_strategies.return_value = [{"strategy_id": "S1"}]
+        storage.get_signal_ranking.return_value = {"strategy_id": "S1", "execution_mode": "LIVE"}
+        return storage
+
+    async def test_unchanged_tables_skip_section_queries(self):
+        tokens = {"sys_config": 1, "sys_strategies": 1, "sys_signal_ranking": 1, "usr_signal_pipeline": 7}
+        storage = self._storage(tokens)
+        sections = SectionCache()
+
+        first = await telemetry_module._consolidate_telemetry("t", storage, MagicMock(), sections)
+        queries = {name: getattr(storage, name).call_count for name in (
+            "get_sys_config", "get_signal_pipeline_history", "get_all_sys_strategies")}
+        assert all(queries.values())
+        second = await telemetry_module._consolidate_telemetry("t", storage, MagicMock(), sections)
+        assert {name: getattr(storage, name).call_count for name in queries} == queries
+        assert storage.get_change_tokens.call_count == 2  # the only query of the second tick
+        assert second["strategy_array"] == first["strategy_array"]
+        assert second["anomalies"]["count_last_5m"] == 1
+
+        tokens["sys_config"] += 1
+        tokens["usr_signal_pipeline"] += 1
+        await telemetry_module._consolidate_telemetry("t", storage, MagicMock(), sections)
+        assert storage.get_sys_config.call_count == 2 * queries["get_sys_config"]
+        assert storage.get_signal_pipeline_history.call_count == 2
+        assert storage.get_all_sys_strategies.call_count == queries["get_all_sys_strategies"]
+
+    async def test_missing_tokens_and_error_sections_always_reload(self):
+        storage = self._storage({})
+        storage.get_change_tokens.side_effect = RuntimeError("no table")
+        sections = SectionCache()
+        for _ in range(2):
+            await telemetry_module._consolidate_telemetry("t", storage, MagicMock(), sections)
+        assert storage.get_signal_pipeline_history.call_count == 2
+
+        cache = SectionCache()
+        for _ in range(2):
+            await cache.get("risk_buffer", (1,), lambda: {"error": "DB error"})
+        assert cache.stats["loads"] == 2
+
+    def test_change_tokens_follow_table_writes(self, storage):
+        before = storage.get_change_tokens()
+        storage.update_sys_config({"synapse_probe": 1})
+        storage.log_signal_pipeline_event("SIG-1", "SCANNER", "APPROVED")
+        after = storage.get_change_tokens()
+        assert after["sys_config"] > before["sys_config"]
+        assert after["usr_signal_pipeline"] > before["usr_signal_pipeline"]
+        assert after["sys_strategies"] == before["sys_strategies"]
+        assert after["sys_signal_ranking"] == before["sys_signal_ranking"]
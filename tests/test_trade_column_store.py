@@ -0,0 +1,97 @@
+"""
+Tests for the columnar trade cache behind TradesMixin (PERF-TRADE-COLUMNS-2026-001).
+
+These tests exercise:
+  - Window statistics: win rate, profit factor, Sharpe, drawdown, per-symbol PnL
+  - Parity of the cached aggregates with the SQL they replace
+  - Write-through append on save_trade_result / save_sys_trade
+  - Consistency with rows written or deleted behind the cache's back
+"""
+import numpy as np
+import pytest
+
+from data_vault.trade_column_store import window_metrics
+
+
+def _live(storage, trade_id, symbol, profit):
+    storage.save_trade_result({
+        "id": trade_id, "symbol": symbol, "profit": profit,
+        "entry_price": 1.0, "exit_price": 1.1, "execution_mode": "LIVE",
+    })
+
+
+def _shadow(storage, trade_id, profit, strategy_id="S1", instance_id="I-1", close_time="2026-01-05 10:00:00"):
+    storage.save_sys_trade({
+        "id": trade_id, "symbol": "EURUSD", "profit": profit, "execution_mode": "SHADOW",
+        "strategy_id": strategy_id, "instance_id": instance_id, "close_time": close_time,
+    })
+
+
+def test_window_metrics_on_a_known_series():
+    stats = window_metrics(np.array([10.0, -5.0, np.nan, -5.0, 20.0, 0.0]))
+
+    assert stats["trades"] == 5 and stats["wins"] == 2 and stats["losses"] == 2
+    assert stats["win_rate"] == 0.5
+    assert stats["total_profit"] == 20.0
+    assert stats["profit_factor"] == pytest.approx(3.0)
+    assert stats["max_drawdown"] == pytest.approx(10.0)
+    pnl = np.array([10.0, -5.0, -5.0, 20.0, 0.0])
+    assert stats["sharpe"] == pytest.approx(pnl.mean() / pnl.std(ddof=1))
+    assert window_metrics(np.array([]))["win_rate"] == 0.0
+
+
+def test_cached_aggregates_match_sql(storage):
+    for i, (symbol, profit) in enumerate([("EURUSD", 30.0), ("EURUSD", -10.0), ("GBPUSD", 5.0), ("USDJPY", -1.0)]):
+        _live(storage, f"T{i}", symbol, profit)
+    conn = storage._get_conn()
+    sql_wins, sql_losses, sql_sum = conn.execute(
+        "SELECT COUNT(CASE WHEN profit > 0 THEN 1 END), COUNT(CASE WHEN profit < 0 THEN 1 END), SUM(profit) "
+        "FROM usr_trades WHERE execution_mode = 'LIVE'"
+    ).fetchone()
+
+    assert storage.get_total_profit() == pytest.approx(sql_sum)
+    assert storage.get_win_rate() == pytest.approx(sql_wins / (sql_wins + sql_losses))
+    assert storage.get_profit_by_symbol() == {"EURUSD": 20.0, "GBPUSD": 5.0, "USDJPY": -1.0}
+    assert [t["id"] for t in storage.get_recent_usr_trades(limit=2)] == ["T0", "T1"]  # same-second ties: rowid order
+    assert storage.get_recent_usr_trades(limit=1)[0]["created_at"]
+    assert storage.get_win_rate(execution_mode="SHADOW") == 0.0
+
+
+def test_saves_are_appended_without_reloading(storage):
+    _shadow(storage, "A", 10.0)
+    assert storage.get_trade_performance("SHADOW", strategy_id="S1")["trades"] == 1
+    full_loads = storage.trade_columns.stats["full_loads"]
+
+    _shadow(storage, "B", -4.0)
+    _shadow(storage, "C", 2.0, strategy_id="S2", instance_id="I-2")
+    _live(storage, "L1", "EURUSD", 7.0)
+
+    s1 = storage.get_trade_performance("SHADOW", strategy_id="S1")
+    assert (s1["trades"], s1["total_profit"], s1["max_drawdown"]) == (2, 6.0, 4.0)
+    assert storage.get_trade_performance("SHADOW")["trades"] == 3
+    assert storage.get_trade_performance("SHADOW", instance_id="I-2")["total_profit"] == 2.0
+    newest = storage._get_conn().execute(
+        "SELECT profit FROM sys_trades WHERE execution_mode = 'SHADOW' ORDER BY created_at DESC LIMIT 1"
+    ).fetchone()[0]
+    assert storage.get_trade_performance("SHADOW", last_n=1)["total_profit"] == newest
+    assert storage.get_win_rate(execution_mode="SHADOW") == pytest.approx(2 / 3)
+    assert storage.get_total_profit() == 7.0
+    assert storage.trade_columns.stats["full_loads"] == full_loads + 1  # only usr_trades' first load
+    assert storage.trade_columns.count(
+        storage._get_conn(), "sys_trades", "SHADOW", instance_id="I-1", since="2026-01-05 00:00:00"
+    ) == 2
+
+
+def test_rows_changed_behind_the_cache_are_picked_up(storage):
+    _live(storage, "T1", "EURUSD", 10.0)
+    assert storage.get_total_profit() == 10.0
+    conn = storage._get_conn()
+
+    conn.execute("INSERT INTO usr_trades (id, symbol, profit, execution_mode) VALUES ('RAW', 'EURUSD', 5.0, 'LIVE')")
+    conn.commit()
+    assert storage.get_total_profit() == 15.0
+
+    conn.execute("DELETE FROM usr_trades WHERE id = 'T1'")
+    conn.commit()
+    storage.trade_columns.reconcile_interval_s = 0.0  # same-connection deletes surface on reconciliation
+    assert storage.get_total_profit() == 5.0
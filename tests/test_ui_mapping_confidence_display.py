@@ -159,7 +159,7 @@ async def test_orchestrator_to_service_confidence_consistency_runtime(caplog: py
         storage=storage,
         _persist_scan_telemetry=MagicMock(),
         market_structure_analyzer=SimpleNamespace(
-            detect_market_structure=lambda _symbol, _df: {
+            detect_market_structure=lambda _symbol, _df, timeframe=None: {
                 "hh_indices": [1, 2],
                 "hl_indices": [1],
                 "lh_indices": [],
@@ -9,6 +9,13 @@ Despacha alertas de eventos críticos a múltiples canales:
 
 Rate-limiting: máximo 1 alerta por (canal, clave) cada RATE_LIMIT_SECONDS.
 
+Entrega asíncrona (PERF-OUTBOUND-DISPATCH-2026-001): EMAIL y TELEGRAM se
+encolan en un OutboundDispatcher — ``send_alert`` no espera red. El worker
+agrupa las alertas de una ráfaga en un digest, reutiliza una sola conexión
+SMTP y reintenta con backoff; lo agotado va al dead-letter sink. Un
+dispatcher propio (sin ``dispatcher=`` compartido) se detiene con ``close()``
+o, si nadie lo llama, en un hook ``atexit`` que entrega lo pendiente.
+
 Uso mínimo:
     from utils.alerting import AlertingService, Alert, AlertSeverity
 
@@ -23,20 +30,31 @@ Uso mínimo:
 
 from __future__ import annotations
 
+import atexit
 import logging
 import smtplib
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from email.mime.text import MIMEText
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.outbound_dispatcher import DeadLetterSink, OutboundDispatcher
 
 logger = logging.getLogger(__name__)
 
 # Tiempo mínimo entre alertas del mismo tipo por canal (segundos).
 RATE_LIMIT_SECONDS: int = 300  # 5 minutos
 
+# Ventana de agrupación por canal externo y tamaño máximo de digest.
+ALERT_BATCH_WINDOW_SECONDS: float = 2.0
+ALERT_MAX_BATCH: int = 20
+
+# Una conexión SMTP ociosa más de esto se verifica con NOOP antes de reutilizarla.
+SMTP_IDLE_CHECK_SECONDS: float = 30.0
+
 
 class AlertSeverity(str, Enum):
     WARNING = "WARNING"
@@ -95,6 +113,69 @@ class TelegramConfig:
 
     bot_token: str
     chat_id: str
+    api_base: str = "https://api.telegram.org"
+
+
+class _SmtpSession:
+    """Conexión SMTP persistente: se abre una vez y se reabre solo si se cae."""
+
+    def __init__(self, cfg: EmailConfig) -> None:
+        self._cfg = cfg
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+        self.connections_opened = 0
+
+    def _connect(self) -> smtplib.SMTP:
+        cfg = self._cfg
+        smtp_cls = smtplib.SMTP_SSL if not cfg.use_tls else smtplib.SMTP
+        server = smtp_cls(cfg.smtp_host, cfg.smtp_port, timeout=10)  # type: ignore[operator]
+        if cfg.use_tls:
+            server.starttls()
+        if cfg.username:
+            server.login(cfg.username, cfg.password)
+        self.connections_opened += 1
+        return server
+
+    def _alive(self) -> bool:
+        if self._server is None:
+            return False
+        if time.monotonic() - self._last_used < SMTP_IDLE_CHECK_SECONDS:
+            return True
+        try:
+            return self._server.noop()[0] == 250
+        except Exception:
+            return False
+
+    def send(self, msg: MIMEText) -> None:
+        """Envía ``msg``; lanza excepción si falla (la conexión se descarta)."""
+        with self._lock:
+            if not self._alive():
+                self._close_quietly()
+                self._server = self._connect()
+            try:
+                self._server.sendmail(self._cfg.sender, self._cfg.recipients, msg.as_string())
+            except Exception:
+                self._close_quietly()
+                raise
+            self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._server is not None:
+                try:
+                    self._server.quit()
+                except Exception:
+                    pass
+            self._server = None
+
+    def _close_quietly(self) -> None:
+        if self._server is not None:
+            try:
+                self._server.close()
+            except Exception:
+                pass
+        self._server = None
 
 
 class AlertingService:
@@ -103,6 +184,12 @@ class AlertingService:
 
     Instanciar vía AlertingService.from_env() para cargar config desde
     variables de entorno, o vía constructor directo con config dict.
+
+    Args:
+        dispatcher: OutboundDispatcher compartido; si es None se crea uno propio
+            al primer envío externo, detenido por ``close()`` o al salir del proceso.
+        dead_letter_sink: Destino de alertas agotadas (solo para el dispatcher propio).
+        asynchronous: False restaura el envío síncrono (scripts, diagnósticos).
     """
 
     def __init__(
@@ -110,15 +197,27 @@ class AlertingService:
         channels: Optional[List[AlertChannel]] = None,
         email_config: Optional[EmailConfig] = None,
         telegram_config: Optional[TelegramConfig] = None,
+        dispatcher: Optional[OutboundDispatcher] = None,
+        dead_letter_sink: Optional[DeadLetterSink] = None,
+        asynchronous: bool = True,
     ) -> None:
         self._channels: List[AlertChannel] = channels or [AlertChannel.LOG_ONLY]
         self._email_config = email_config
         self._telegram_config = telegram_config
         # key: f"{channel.value}:{alert.key}" → last_sent_ts
         self._rate_limit_cache: Dict[str, float] = {}
+        self._dispatcher = dispatcher
+        self._owns_dispatcher = dispatcher is None
+        self._dead_letter_sink = dead_letter_sink
+        self._asynchronous = asynchronous
+        self._smtp: Optional[_SmtpSession] = None
 
     @classmethod
-    def from_env(cls) -> "AlertingService":
+    def from_env(
+        cls,
+        dispatcher: Optional[OutboundDispatcher] = None,
+        dead_letter_sink: Optional[DeadLetterSink] = None,
+    ) -> "AlertingService":
         """
         Construye el servicio leyendo variables de entorno.
 
@@ -178,6 +277,8 @@ class AlertingService:
             channels=channels,
             email_config=email_config,
             telegram_config=telegram_config,
+            dispatcher=dispatcher,
+            dead_letter_sink=dead_letter_sink,
         )
 
     def send_alert(self, alert: Alert) -> Dict[str, bool]:
@@ -188,7 +289,8 @@ class AlertingService:
         Siempre loguea (fallback) aunque los canales externos fallen.
 
         Returns:
-            Dict canal → bool indicando si fue enviada (True) o saltada/fallida (False).
+            Dict canal → bool indicando si fue enviada — o, en modo asíncrono,
+            aceptada en la cola (True) — o saltada/fallida (False).
         """
         results: Dict[str, bool] = {}
         for channel in self._channels:
@@ -208,9 +310,11 @@ class AlertingService:
         return results
 
     def _dispatch_to_channel(self, channel: AlertChannel, alert: Alert) -> bool:
-        """Despacha al canal indicado. Retorna True si fue enviada."""
+        """Despacha al canal indicado. Retorna True si fue enviada (o encolada)."""
         if channel == AlertChannel.LOG_ONLY:
             return self._send_log(alert)
+        if self._asynchronous and channel in (AlertChannel.EMAIL, AlertChannel.TELEGRAM):
+            return self._enqueue(channel, alert)
         if channel == AlertChannel.EMAIL:
             return self._send_email(alert)
         if channel == AlertChannel.TELEGRAM:
@@ -230,76 +334,143 @@ class AlertingService:
         )
         return True
 
-    def _send_email(self, alert: Alert) -> bool:
-        """Envía la alerta por correo SMTP. Retorna True si tuvo éxito."""
+    # ── Entrega asíncrona ─────────────────────────────────────────────────────
+
+    def _transport(self, channel: AlertChannel) -> Optional[Callable[[List[Alert]], None]]:
+        if channel == AlertChannel.EMAIL and self._email_config is not None:
+            return self._deliver_email
+        if channel == AlertChannel.TELEGRAM and self._telegram_config is not None:
+            return self._deliver_telegram
+        return None
+
+    def _enqueue(self, channel: AlertChannel, alert: Alert) -> bool:
+        """Encola la alerta para el worker; False si falta config o la cola está llena."""
+        transport = self._transport(channel)
+        if transport is None:
+            logger.error("[AlertingService] Canal %s sin configuración", channel.value)
+            return False
+        if self._dispatcher is None:
+            self._dispatcher = OutboundDispatcher(dead_letter=self._dead_letter_sink)
+            atexit.register(self.close)
+        name = f"alert_{channel.value}"
+        if not self._dispatcher.has_channel(name):
+            self._dispatcher.register_channel(
+                name, transport,
+                batch_window_s=ALERT_BATCH_WINDOW_SECONDS, max_batch=ALERT_MAX_BATCH,
+            )
+        return self._dispatcher.submit(name, alert)
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Espera a que las alertas encoladas se hayan entregado (o reprogramado)."""
+        return self._dispatcher.flush(timeout) if self._dispatcher is not None else True
+
+    def close(self) -> None:
+        """Detiene el dispatcher propio y cierra la sesión SMTP."""
+        if self._dispatcher is not None and self._owns_dispatcher:
+            atexit.unregister(self.close)
+            self._dispatcher.stop()
+        if self._smtp is not None:
+            self._smtp.close()
+
+    # ── Transportes ───────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _digest_severity(alerts: List[Alert]) -> AlertSeverity:
+        if any(a.severity == AlertSeverity.CRITICAL for a in alerts):
+            return AlertSeverity.CRITICAL
+        return AlertSeverity.WARNING
+
+    def _deliver_email(self, alerts: List[Alert]) -> None:
+        """Envía una o varias alertas (digest) por SMTP. Lanza excepción si falla."""
         cfg = self._email_config
         if cfg is None:
-            logger.error("[AlertingService] _send_email llamado sin EmailConfig")
-            return False
-
-        subject = f"[Aethelgard {alert.severity.value}] {alert.title}"
-        body = (
-            f"Severity : {alert.severity.value}\n"
-            f"Key      : {alert.key}\n"
-            f"DB Path  : {alert.db_path}\n"
-            f"Component: {alert.component}\n"
-            f"Timestamp: {alert.timestamp}\n\n"
-            f"{alert.message}\n"
-        )
-        if alert.extra:
-            body += f"\nExtra: {alert.extra}"
+            raise RuntimeError("EmailConfig no configurado")
+
+        bodies = []
+        for alert in alerts:
+            body = (
+                f"Severity : {alert.severity.value}\n"
+                f"Key      : {alert.key}\n"
+                f"DB Path  : {alert.db_path}\n"
+                f"Component: {alert.component}\n"
+                f"Timestamp: {alert.timestamp}\n\n"
+                f"{alert.message}\n"
+            )
+            if alert.extra:
+                body += f"\nExtra: {alert.extra}"
+            bodies.append(body)
+
+        if len(alerts) == 1:
+            subject = f"[Aethelgard {alerts[0].severity.value}] {alerts[0].title}"
+            body = bodies[0]
+        else:
+            subject = f"[Aethelgard {self._digest_severity(alerts).value}] {len(alerts)} alertas"
+            body = "\n".join(
+                f"── {alert.title} ──\n{text}" for alert, text in zip(alerts, bodies)
+            )
 
         msg = MIMEText(body, "plain", "utf-8")
         msg["Subject"] = subject
         msg["From"] = cfg.sender
         msg["To"] = ", ".join(cfg.recipients)
 
+        if self._smtp is None:
+            self._smtp = _SmtpSession(cfg)
+        self._smtp.send(msg)
+        logger.info("[AlertingService] Email enviado: %s → %s", subject, cfg.recipients)
+
+    def _deliver_telegram(self, alerts: List[Alert]) -> None:
+        """Envía una o varias alertas (digest) al chat de Telegram. Lanza excepción si falla."""
+        cfg = self._telegram_config
+        if cfg is None:
+            raise RuntimeError("TelegramConfig no configurado")
+
+        blocks = []
+        for alert in alerts:
+            emoji = "🚨" if alert.severity == AlertSeverity.CRITICAL else "⚠️"
+            blocks.append(
+                f"{emoji} *{alert.title}*\n"
+                f"`{alert.key}`\n\n"
+                f"{alert.message}\n\n"
+                f"DB: `{alert.db_path}`\n"
+                f"Timestamp: `{alert.timestamp}`"
+            )
+        text = blocks[0] if len(blocks) == 1 else f"*{len(blocks)} alertas*\n\n" + "\n\n".join(blocks)
+
+        import urllib.request, json as _json  # noqa: E401
+
+        payload = _json.dumps({
+            "chat_id": cfg.chat_id,
+            "text": text,
+            "parse_mode": "Markdown",
+        }).encode("utf-8")
+        url = f"{cfg.api_base.rstrip('/')}/bot{cfg.bot_token}/sendMessage"
+        req = urllib.request.Request(url, data=payload, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            if resp.status != 200:
+                raise RuntimeError(f"Telegram resp status: {resp.status}")
+        logger.info("[AlertingService] Telegram enviado: %d alerta(s)", len(alerts))
+
+    def _send_email(self, alert: Alert) -> bool:
+        """Envía la alerta por correo SMTP (síncrono). Retorna True si tuvo éxito."""
+        if self._email_config is None:
+            logger.error("[AlertingService] _send_email llamado sin EmailConfig")
+            return False
         try:
-            smtp_cls = smtplib.SMTP_SSL if not cfg.use_tls else smtplib.SMTP
-            with smtp_cls(cfg.smtp_host, cfg.smtp_port, timeout=10) as server:  # type: ignore[operator]
-                if cfg.use_tls:
-                    server.starttls()
-                if cfg.username:
-                    server.login(cfg.username, cfg.password)
-                server.sendmail(cfg.sender, cfg.recipients, msg.as_string())
-            logger.info("[AlertingService] Email enviado: %s → %s", subject, cfg.recipients)
+            self._deliver_email([alert])
             return True
         except Exception as exc:
             logger.error("[AlertingService] Error enviando email: %s", exc)
             return False
 
     def _send_telegram(self, alert: Alert) -> bool:
-        """Envía la alerta al chat de Telegram. Retorna True si tuvo éxito."""
-        cfg = self._telegram_config
-        if cfg is None:
+        """Envía la alerta al chat de Telegram (síncrono). Retorna True si tuvo éxito."""
+        if self._telegram_config is None:
             logger.error("[AlertingService] _send_telegram llamado sin TelegramConfig")
             return False
-
-        emoji = "🚨" if alert.severity == AlertSeverity.CRITICAL else "⚠️"
-        text = (
-            f"{emoji} *{alert.title}*\n"
-            f"`{alert.key}`\n\n"
-            f"{alert.message}\n\n"
-            f"DB: `{alert.db_path}`\n"
-            f"Timestamp: `{alert.timestamp}`"
-        )
-
         try:
-            import urllib.request, urllib.parse, json as _json  # noqa: E401
-
-            payload = _json.dumps({
-                "chat_id": cfg.chat_id,
-                "text": text,
-                "parse_mode": "Markdown",
-            }).encode("utf-8")
-            url = f"https://api.telegram.org/bot{cfg.bot_token}/sendMessage"
-            req = urllib.request.Request(url, data=payload, headers={"Content-Type": "application/json"})
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                if resp.status == 200:
-                    logger.info("[AlertingService] Telegram enviado: %s", alert.title)
-                    return True
-                logger.warning("[AlertingService] Telegram resp status: %s", resp.status)
-                return False
+            self._deliver_telegram([alert])
+            return True
         except Exception as exc:
             logger.error("[AlertingService] Error enviando Telegram: %s", exc)
             return False
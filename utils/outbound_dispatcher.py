@@ -0,0 +1,281 @@
+"""
+utils/outbound_dispatcher.py — Cola de salida asíncrona para alertas y notificaciones
+=====================================================================================
+TRACE_ID: PERF-OUTBOUND-DISPATCH-2026-001
+
+Responsabilidad:
+  - Cola acotada en memoria: ``submit()`` solo hace ``put_nowait`` (microsegundos),
+    el hilo de trading nunca espera I/O de red ni de disco.
+  - Worker en segundo plano que agrupa por canal: los envíos que llegan dentro de
+    ``batch_window_s`` salen juntos (hasta ``max_batch``), así una ráfaga se
+    entrega como un digest.
+  - Reintentos con backoff exponencial; tras ``max_attempts`` el mensaje pasa a
+    dead-letter (callback, p. ej. ``StorageManager.save_notification_dead_letter``).
+
+Arquitectura:
+  - Un dispatcher compartido (start.py) al que cada productor registra sus
+    canales: AlertingService (email, telegram) y NotificationService (persistencia).
+  - Un canal es un ``send_batch(payloads)`` que lanza excepción si falla; el
+    dispatcher no conoce el transporte.
+
+Regla: la cola llena rechaza (``submit() -> False``) en lugar de bloquear.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_QUEUE_SIZE: int = 1000
+DEFAULT_MAX_ATTEMPTS: int = 4
+DEFAULT_BACKOFF_BASE_SECONDS: float = 2.0
+DEFAULT_BACKOFF_MAX_SECONDS: float = 300.0
+
+# (channel, payload, error, attempts)
+DeadLetterSink = Callable[[str, Any, str, int], Any]
+
+
+@dataclass
+class OutboundItem:
+    """Un envío pendiente de un canal."""
+
+    channel: str
+    payload: Any
+    enqueued_at: float
+    attempts: int = 0
+    last_error: str = ""
+
+
+@dataclass
+class ChannelSpec:
+    """Transporte de un canal y su política de agrupación."""
+
+    send_batch: Callable[[List[Any]], Any]
+    batch_window_s: float = 2.0
+    max_batch: int = 20
+    pending: List[OutboundItem] = field(default_factory=list)
+    first_pending_at: float = 0.0
+
+
+class OutboundDispatcher:
+    """
+    Cola acotada + worker que entrega por lotes con reintentos y dead-letter.
+
+    Args:
+        maxsize: Capacidad de la cola de entrada.
+        max_attempts: Intentos por mensaje antes de dead-letter.
+        backoff_base_s / backoff_max_s: Backoff exponencial entre intentos.
+        dead_letter: Callback para mensajes agotados (se ejecuta en el worker).
+        clock: Reloj monotónico (inyectable en tests).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        backoff_base_s: float = DEFAULT_BACKOFF_BASE_SECONDS,
+        backoff_max_s: float = DEFAULT_BACKOFF_MAX_SECONDS,
+        dead_letter: Optional[DeadLetterSink] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_attempts = max_attempts
+        self.backoff_base_s = backoff_base_s
+        self.backoff_max_s = backoff_max_s
+        self._dead_letter = dead_letter
+        self._clock = clock
+        self._queue: "queue.Queue[Optional[OutboundItem]]" = queue.Queue(maxsize=maxsize)
+        self._channels: Dict[str, ChannelSpec] = {}
+        self._retry_heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._outstanding = 0
+        self._idle = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._start_lock = threading.Lock()
+        self.stats: Dict[str, int] = {
+            "submitted": 0, "rejected": 0, "delivered": 0, "batches": 0,
+            "retries": 0, "dead_lettered": 0,
+        }
+
+    # ── Configuración ────────────────────────────────────────────────────────
+
+    def register_channel(
+        self,
+        name: str,
+        send_batch: Callable[[List[Any]], Any],
+        batch_window_s: float = 2.0,
+        max_batch: int = 20,
+    ) -> None:
+        """Registra (o reemplaza) el transporte de ``name``."""
+        self._channels[name] = ChannelSpec(send_batch, batch_window_s, max(1, max_batch))
+
+    def has_channel(self, name: str) -> bool:
+        return name in self._channels
+
+    # ── Productores ──────────────────────────────────────────────────────────
+
+    def submit(self, channel: str, payload: Any) -> bool:
+        """Encola ``payload`` para ``channel``; False si el canal no existe o la cola está llena."""
+        if channel not in self._channels:
+            logger.error("[OutboundDispatcher] Canal no registrado: %s", channel)
+            return False
+        if not self._running:
+            self.start()
+        with self._idle:
+            self._outstanding += 1
+        try:
+            self._queue.put_nowait(OutboundItem(channel, payload, self._clock()))
+        except queue.Full:
+            with self._idle:
+                self._outstanding -= 1
+                self.stats["rejected"] += 1
+                self._idle.notify_all()
+            logger.warning("[OutboundDispatcher] Cola llena — descartado envío por %s", channel)
+            return False
+        self._count("submitted")
+        return True
+
+    def flush(self, timeout: float = 10.0) -> bool:
+        """Espera a que todo lo encolado se haya entregado, reprogramado o pasado a dead-letter."""
+        deadline = time.monotonic() + timeout
+        with self._idle:
+            while self._outstanding > 0:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+        return True
+
+    @property
+    def pending_retries(self) -> int:
+        return len(self._retry_heap)
+
+    # ── Ciclo de vida ────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        with self._start_lock:
+            if self._running:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="OutboundDispatcher", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Entrega lo pendiente (sin ventana) y detiene el worker; reintentos vivos van a dead-letter."""
+        if not self._running:
+            return
+        self._running = False
+        try:
+            self._queue.put_nowait(None)  # despierta al worker
+        except queue.Full:
+            pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+        while self._retry_heap:
+            _, _, item = heapq.heappop(self._retry_heap)
+            self._to_dead_letter(item, item.last_error or "shutdown")
+
+    # ── Worker ───────────────────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=self._next_wakeup())
+                self._add_pending(item)
+                while True:  # drena lo que haya llegado en la ráfaga
+                    self._add_pending(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            running = self._running
+            self._promote_due_retries()
+            self._deliver_ready(force=not running)
+            if not running and self._queue.empty():
+                break
+
+    def _next_wakeup(self) -> float:
+        now = self._clock()
+        wake = 0.5
+        for spec in self._channels.values():
+            if spec.pending:
+                wake = min(wake, spec.first_pending_at + spec.batch_window_s - now)
+        if self._retry_heap:
+            wake = min(wake, self._retry_heap[0][0] - now)
+        return max(0.01, wake)
+
+    def _add_pending(self, item: Optional[OutboundItem]) -> None:
+        if item is None:
+            return
+        spec = self._channels[item.channel]
+        if not spec.pending:
+            spec.first_pending_at = self._clock()
+        spec.pending.append(item)
+
+    def _promote_due_retries(self) -> None:
+        now = self._clock()
+        while self._retry_heap and self._retry_heap[0][0] <= now:
+            _, _, item = heapq.heappop(self._retry_heap)
+            with self._idle:
+                self._outstanding += 1
+            self._add_pending(item)
+
+    def _deliver_ready(self, force: bool) -> None:
+        now = self._clock()
+        for spec in self._channels.values():
+            while spec.pending and (
+                force
+                or len(spec.pending) >= spec.max_batch
+                or now - spec.first_pending_at >= spec.batch_window_s
+            ):
+                batch, spec.pending = spec.pending[:spec.max_batch], spec.pending[spec.max_batch:]
+                spec.first_pending_at = now
+                self._send(spec, batch)
+
+    def _send(self, spec: ChannelSpec, batch: List[OutboundItem]) -> None:
+        try:
+            spec.send_batch([item.payload for item in batch])
+            self._count("delivered", len(batch))
+            self._count("batches")
+        except Exception as exc:
+            for item in batch:
+                item.attempts += 1
+                item.last_error = str(exc)
+                if item.attempts >= self.max_attempts or not self._running:
+                    self._to_dead_letter(item, item.last_error)
+                else:
+                    delay = min(self.backoff_max_s, self.backoff_base_s * (2 ** (item.attempts - 1)))
+                    heapq.heappush(self._retry_heap, (self._clock() + delay, next(self._seq), item))
+                    self._count("retries")
+            logger.warning(
+                "[OutboundDispatcher] Fallo entregando %d envío(s) por %s: %s",
+                len(batch), batch[0].channel, exc,
+            )
+        finally:
+            with self._idle:
+                self._outstanding -= len(batch)
+                self._idle.notify_all()
+
+    def _count(self, name: str, n: int = 1) -> None:
+        # Productores y worker actualizan stats desde hilos distintos
+        with self._idle:
+            self.stats[name] += n
+
+    def _to_dead_letter(self, item: OutboundItem, error: str) -> None:
+        self._count("dead_lettered")
+        logger.error(
+            "[OutboundDispatcher] Dead-letter canal=%s intentos=%d error=%s",
+            item.channel, item.attempts, error,
+        )
+        if self._dead_letter is None:
+            return
+        try:
+            self._dead_letter(item.channel, item.payload, error, item.attempts)
+        except Exception as exc:
+            logger.error("[OutboundDispatcher] No se pudo registrar dead-letter: %s", exc)